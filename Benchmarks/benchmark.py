@@ -0,0 +1,332 @@
+"""
+Benchmarks of the simulation's hot paths.
+
+Every benchmark runs with fixed seeds, so the same work is timed on every run. Unless noted, a benchmark goes through
+BENCHMARK_DAYS days of traffic:
+    - plane_construction: building NUM_PLANES planes one at a time with `Plane(time_of_day)`, from a seeded sampler
+    - plane_from_traffic: building planes from pre-drawn traffic with `Plane.from_traffic`
+    - select_runway: `Airport.select_runway` for every plane of the traffic
+    - simulate_day_simpy / simulate_day_fast: full days of `Airport.simulate` on the SimPy and fast engines
+    - save_simulation_data: saving BENCHMARK_DAYS days of results with `Airport.save_simulation_data`
+    - data_extraction: extracting the sampling tables from the source CSVs with `DataExtractor`
+    - visualizations: summarizing the saved results and writing the statistics file and plots of a scenario
+Each benchmark reports its best time over `--repeat` runs, planes (or records) per second and the peak memory
+allocated by Python while it runs (measured with tracemalloc in one extra run, so tracing does not slow the timings).
+
+Run it from the repository root:
+    python -m Benchmarks.benchmark                  # compare against Benchmarks/baseline.json
+    python -m Benchmarks.benchmark --save           # replace the baseline with this run
+    python -m Benchmarks.benchmark select_runway    # only run some benchmarks
+A benchmark that is slower, or allocates more memory, than its baseline by more than `--tolerance` is flagged as a
+regression and the script exits with status 1. Baselines are only comparable on the machine they were saved on, so
+the baseline is not part of the repository: the first run on a machine saves it, and a baseline saved with another
+machine, Python or library versions is not compared against (save a new one with `--save`).
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import matplotlib
+import numpy as np
+import simpy
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from Data.data_cache import load_data
+from Data.data_extractor import DataExtractor
+from Simulation.airport import Airport
+from Simulation.arrivals import DAY_LENGTH
+from Simulation.plane import Plane
+from Simulation.replication import draw_replication, generate_day_seeds, simulate_day
+from Simulation.sampler import PlaneSampler
+from Visualizations.analytics import summarize_results
+from Visualizations.visulizations import (find_and_plot_hourly_average_wait_times, find_and_plot_mean_runway_counts,
+                                          find_and_write_simulation_statistics_to_file)
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+BENCHMARK_SEED = 2024
+BENCHMARK_DAYS = 7
+NUM_PLANES = 500
+
+# Growth in peak memory (MB) too small to count as a regression, however large relative to the baseline
+MEMORY_NOISE_MB = 1.0
+
+
+def draw_replications(airport, num_days=BENCHMARK_DAYS):
+    """Function to draw the wind and traffic of every benchmark day"""
+    return [draw_replication(airport, seed) for seed in generate_day_seeds(num_days, BENCHMARK_SEED)]
+
+
+def prepared_airport():
+    """Function to create an airport with the runways of the first benchmark day and the traffic of every day"""
+    airport = Airport(simpy.Environment(), "benchmark")
+    replications = draw_replications(airport)
+    airport.wind_direction = replications[0][0]
+    airport.reset_runways()
+    return airport, [traffic for _, traffic in replications]
+
+
+def setup_plane_construction():
+    """Function to draw the NUM_PLANES times of day planes are built at and make a seeded sampler to build them with"""
+    data = load_data()
+    times = np.random.default_rng(BENCHMARK_SEED).uniform(0, DAY_LENGTH, NUM_PLANES).tolist()
+    return times, PlaneSampler(data.tables, data.strings, seed=BENCHMARK_SEED)
+
+
+def run_plane_construction(state):
+    """Function to build a plane at every time of day"""
+    times, plane_sampler = state
+    for time_of_day in times:
+        Plane(time_of_day, plane_sampler)
+    return len(times)
+
+
+def setup_plane_from_traffic():
+    """Function to draw the benchmark days' traffic"""
+    return prepared_airport()[1]
+
+
+def run_plane_from_traffic(days):
+    """Function to build every plane of the days' traffic"""
+    for traffic in days:
+        for i in range(len(traffic)):
+            Plane.from_traffic(traffic, i)
+    return sum(len(traffic) for traffic in days)
+
+
+def setup_select_runway():
+    """Function to prepare an airport and build every plane of the benchmark days"""
+    airport, days = prepared_airport()
+    return airport, [Plane.from_traffic(traffic, i, airport.sampler) for traffic in days for i in range(len(traffic))]
+
+
+def run_select_runway(state):
+    """Function to select a runway for every plane"""
+    airport, planes = state
+    for plane in planes:
+        airport.select_runway(plane)
+    return len(planes)
+
+
+def setup_simulate_day():
+    """Function to create an airport and draw the benchmark days' wind and traffic"""
+    airport = Airport(simpy.Environment(), "benchmark")
+    return airport, draw_replications(airport)
+
+
+def run_simulate_day(state, engine):
+    """Function to simulate the benchmark days on an engine"""
+    airport, replications = state
+    for day, replication in enumerate(replications):
+        simulate_day(airport, day, None, engine=engine, replication=replication)
+    return sum(len(traffic) for _, traffic in replications)
+
+
+def simulated_airport():
+    """Function to create an airport with the benchmark days simulated on the fast engine"""
+    airport = Airport(simpy.Environment(), "benchmark")
+    run_simulate_day((airport, draw_replications(airport)), "fast")
+    return airport
+
+
+def setup_save_simulation_data():
+    """Function to simulate the benchmark days and make a temporary results folder"""
+    return simulated_airport(), tempfile.mkdtemp(prefix="benchmark_results_")
+
+
+def run_save_simulation_data(state):
+    """Function to save the simulated days' results"""
+    airport, results_dir = state
+    try:
+        airport.save_simulation_data(results_dir=results_dir)
+    finally:
+        shutil.rmtree(results_dir, ignore_errors=True)
+    return len(airport.wait_times) + len(airport.circle_times)
+
+
+def run_data_extraction(state):
+    """Function to extract the sampling tables of Logan Airport from the source CSVs"""
+    DataExtractor(quiet=True)
+    return None
+
+
+def setup_visualizations():
+    """Function to save the benchmark days' results and make a temporary folder for the plots"""
+    airport = simulated_airport()
+    results_dir = tempfile.mkdtemp(prefix="benchmark_results_")
+    airport.save_simulation_data(results_dir=results_dir)
+    return results_dir, tempfile.mkdtemp(prefix="benchmark_plots_")
+
+
+def run_visualizations(state):
+    """Function to summarize the saved results and write the statistics file and plots of the scenario"""
+    results_dir, plots_dir = state
+    try:
+        departure_summary, arrival_summary = summarize_results("benchmark", results_dir=results_dir)
+        find_and_write_simulation_statistics_to_file("Benchmark", departure_summary, arrival_summary, plots_dir)
+        find_and_plot_hourly_average_wait_times("Benchmark", departure_summary, arrival_summary, plots_dir)
+        find_and_plot_mean_runway_counts("Benchmark", departure_summary, arrival_summary, plots_dir)
+        plt.close("all")
+    finally:
+        shutil.rmtree(results_dir, ignore_errors=True)
+        shutil.rmtree(plots_dir, ignore_errors=True)
+    return departure_summary.count + arrival_summary.count
+
+
+# Benchmarks as (setup, run) pairs: setup builds the state a run needs and is not timed
+BENCHMARKS = {
+    "plane_construction": (setup_plane_construction, run_plane_construction),
+    "plane_from_traffic": (setup_plane_from_traffic, run_plane_from_traffic),
+    "select_runway": (setup_select_runway, run_select_runway),
+    "simulate_day_simpy": (setup_simulate_day, lambda state: run_simulate_day(state, "simpy")),
+    "simulate_day_fast": (setup_simulate_day, lambda state: run_simulate_day(state, "fast")),
+    "save_simulation_data": (setup_save_simulation_data, run_save_simulation_data),
+    "data_extraction": (lambda: None, run_data_extraction),
+    "visualizations": (setup_visualizations, run_visualizations),
+}
+
+
+def measure(setup, run, repeat=5):
+    """Function to time the best of `repeat` runs of a benchmark and measure its peak memory in one traced run"""
+    state = setup()
+    tracemalloc.start()
+    try:
+        run(state)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = []
+    planes = None
+    for _ in range(repeat):
+        state = setup()
+        start_time = time.perf_counter()
+        planes = run(state)
+        seconds.append(time.perf_counter() - start_time)
+
+    best = min(seconds)
+    return {"seconds": best, "median_seconds": float(np.median(seconds)), "planes": planes,
+            "planes_per_second": planes / best if planes else None, "peak_memory_mb": peak_memory / 2**20}
+
+
+def run_benchmarks(names=None, repeat=5):
+    """Function to run the benchmarks (all of them if `names` is None) and return their results"""
+    results = {}
+    for name in names or BENCHMARKS.keys():
+        print(f"Running {name}")
+        results[name] = measure(*BENCHMARKS[name], repeat=repeat)
+    return results
+
+
+def environment_info():
+    """Function to describe the machine and versions a run was made with"""
+    return {"python": platform.python_version(), "numpy": np.__version__, "simpy": simpy.__version__,
+            "platform": platform.platform(), "processor": platform.processor() or platform.machine(),
+            "seed": BENCHMARK_SEED, "days": BENCHMARK_DAYS, "num_planes": NUM_PLANES}
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Function to load the saved baseline, returning None when there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+def same_environment(baseline):
+    """Function to check if a baseline was saved on this machine, with the same versions and settings"""
+    return baseline.get("environment") == environment_info()
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """
+    Function to save a run as the baseline, keeping the baselines of benchmarks that were not run when they were saved
+    in the same environment
+    """
+    baseline = load_baseline(path)
+    if baseline is None or not same_environment(baseline):
+        baseline = {"benchmarks": {}}
+    baseline["environment"] = environment_info()
+    baseline["benchmarks"].update(results)
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """Function to compare a run to the baseline, returning {benchmark: [(measure, ratio), ...]} of regressions"""
+    regressions = {}
+    for name, result in results.items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        for key in ("seconds", "peak_memory_mb"):
+            ratio = result[key] / base[key] if base[key] else np.inf
+            if key == "peak_memory_mb" and result[key] - base[key] < MEMORY_NOISE_MB:
+                continue
+            if ratio > 1 + tolerance:
+                regressions.setdefault(name, []).append((key, ratio))
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """Function to print a table of the results and, when given, their change from the baseline"""
+    print(f"\n{'Benchmark':<22}{'Seconds':>10}{'Planes/s':>12}{'Peak MB':>10}{'vs Baseline':>14}")
+    for name, result in results.items():
+        planes_per_second = f"{result['planes_per_second']:,.0f}" if result["planes_per_second"] else "-"
+        change = "-"
+        if baseline is not None and name in baseline["benchmarks"]:
+            change = f"{result['seconds'] / baseline['benchmarks'][name]['seconds'] - 1:+.1%}"
+        print(f"{name:<22}{result['seconds']:>10.4f}{planes_per_second:>12}{result['peak_memory_mb']:>10.1f}"
+              f"{change:>14}")
+
+
+# Run benchmarks
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the simulation's hot paths")
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK",
+                        help=f"benchmarks to run (all by default): {', '.join(BENCHMARKS.keys())}")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs of each benchmark (the best is kept)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare against or save to")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="fraction a benchmark may be slower or use more memory than its baseline")
+    parser.add_argument("--save", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--output", default=None, help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+    for benchmark_name in args.benchmarks:
+        if benchmark_name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {benchmark_name}")
+
+    benchmark_results = run_benchmarks(args.benchmarks or None, args.repeat)
+    benchmark_baseline = load_baseline(args.baseline)
+    if benchmark_baseline is not None and not same_environment(benchmark_baseline):
+        print(f"\nBaseline {args.baseline} was saved in another environment, not comparing against it "
+              f"(run with --save to replace it)")
+        benchmark_baseline = None
+        comparable = False
+    else:
+        comparable = True
+    print_results(benchmark_results, benchmark_baseline)
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump({"environment": environment_info(), "benchmarks": benchmark_results}, output_file, indent=2)
+
+    if args.save or (benchmark_baseline is None and comparable):
+        # The first run on a machine becomes its baseline
+        save_baseline(benchmark_results, args.baseline)
+        print(f"\nSaved baseline to {args.baseline}")
+    elif benchmark_baseline is not None:
+        benchmark_regressions = find_regressions(benchmark_results, benchmark_baseline, args.tolerance)
+        for benchmark_name, changes in benchmark_regressions.items():
+            print(f"REGRESSION {benchmark_name}: " +
+                  ", ".join(f"{key} x{ratio:.2f} of baseline" for key, ratio in changes))
+        if benchmark_regressions:
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline")
@@ -0,0 +1,179 @@
+"""
+Binary cache of the data used by the simulation, indexed by airport.
+
+`DataExtractor.save_extracted_data` writes the cache to `Data/cache/`:
+    - one `<table>.npy` file per flat sampling table (see `Simulation/sampler.py`), holding the tables of every
+    extracted airport back to back
+    - `offsets.npy`, the (airports + 1) x (tables + 1) array of where each airport's slice of every table starts; the
+    last column is the byte offset of the airport's line in `strings.jsonl`
+    - `strings.jsonl`, one line per airport with its interned string tables, wind probabilities and runway table
+    - `index.json`, holding the cache version, a fingerprint of the source CSVs, the table names and airport codes
+
+Loading an airport memory-maps the tables and only touches that airport's slice of them and its line of
+`strings.jsonl`, so the cache can hold every airport in `routes.csv` without slowing down loading one of them.
+
+The cache is rebuilt automatically when it is missing, was written by another version of this module, does not hold
+the requested airport, or when `airports.csv`, `airlines.csv` or `routes.csv` change.
+"""
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+
+# Bump whenever the layout of the cache changes
+CACHE_VERSION = 2
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+SOURCE_FILES = ("airports.csv", "airlines.csv", "routes.csv")
+
+# Loaded airports, so every module of a process shares the same arrays
+_loaded = {}
+
+
+class SimulationData:
+    """Class to hold the data the simulation needs for one airport"""
+
+    def __init__(self, airport, tables, strings, wind, runways):
+        self.airport = airport
+        self.tables = tables
+        self.strings = strings
+        self.wind = wind
+        self.runways = runways
+
+
+def file_fingerprint(path):
+    """Function to fingerprint a source file by size, modification time and content hash"""
+    with open(path, "rb") as file:
+        digest = hashlib.sha1(file.read()).hexdigest()
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha1": digest}
+
+
+def source_is_unchanged(path, fingerprint):
+    """Function to check a source file against its fingerprint, only hashing it when its size/mtime changed"""
+    if not os.path.exists(path):
+        return False
+    stat = os.stat(path)
+    if stat.st_size != fingerprint["size"]:
+        return False
+    if stat.st_mtime_ns == fingerprint["mtime"]:
+        return True
+    return file_fingerprint(path)["sha1"] == fingerprint["sha1"]
+
+
+def write_cache(probabilities, airlines, airports, runways, data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+    """
+    Function to flatten extracted data into sampling tables and write them to the binary cache. `probabilities` and
+    `runways` are dictionaries keyed by airport code.
+    """
+    from Simulation.sampler import flatten_probabilities
+
+    os.makedirs(cache_dir, exist_ok=True)
+    codes = list(probabilities.keys())
+
+    # Flatten every airport and remember how long its slice of each table is
+    airport_tables = []
+    strings_lines = []
+    for code in codes:
+        tables, strings = flatten_probabilities(probabilities[code], airlines, airports)
+        airport_tables.append(tables)
+        strings_lines.append(json.dumps({"strings": strings, "wind": probabilities[code]["Wind"],
+                                         "runways": runways.get(code, {})}) + "\n")
+
+    table_names = sorted(airport_tables[0].keys())
+    sizes = np.array([[len(tables[name]) for name in table_names] + [len(line.encode("utf-8"))]
+                      for tables, line in zip(airport_tables, strings_lines)], dtype=np.int64)
+    offsets = np.zeros((len(codes) + 1, len(table_names) + 1), dtype=np.int64)
+    offsets[1:] = np.cumsum(sizes, axis=0)
+
+    # Write every file to a temporary path first, so a reader never sees half written data
+    for name in table_names:
+        temporary_path = os.path.join(cache_dir, f"{name}.tmp.npy")
+        np.save(temporary_path, np.concatenate([tables[name] for tables in airport_tables]))
+        os.replace(temporary_path, os.path.join(cache_dir, f"{name}.npy"))
+
+    temporary_path = os.path.join(cache_dir, "offsets.tmp.npy")
+    np.save(temporary_path, offsets)
+    os.replace(temporary_path, os.path.join(cache_dir, "offsets.npy"))
+
+    temporary_path = os.path.join(cache_dir, "strings.tmp.jsonl")
+    with open(temporary_path, "w", encoding="utf-8", newline="\n") as file:
+        file.writelines(strings_lines)
+    os.replace(temporary_path, os.path.join(cache_dir, "strings.jsonl"))
+
+    # The index goes last, as it is what marks the cache as valid
+    index = {
+        "version": CACHE_VERSION,
+        "sources": {name: file_fingerprint(os.path.join(data_dir, name)) for name in SOURCE_FILES},
+        "tables": table_names,
+        "airports": codes,
+    }
+    temporary_path = os.path.join(cache_dir, "index.tmp.json")
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(index, file)
+    os.replace(temporary_path, os.path.join(cache_dir, "index.json"))
+
+
+def read_index(cache_dir=CACHE_DIR):
+    """Function to read the index of the cache, returning None if it is missing"""
+    index_path = os.path.join(cache_dir, "index.json")
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def cache_is_valid(index, data_dir=DATA_DIR):
+    """Function to check if a cache was written by this version from the current source files"""
+    if index is None or index.get("version") != CACHE_VERSION:
+        return False
+    return all(source_is_unchanged(os.path.join(data_dir, name), index["sources"][name]) for name in SOURCE_FILES)
+
+
+def rebuild_cache(airport_codes, data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+    """Function to rebuild the cache for a list of airports (None for every airport) from the source CSVs"""
+    from Data.data_extractor import DataExtractor
+
+    logging.getLogger("Simulation").info("Rebuilding data cache for %s",
+                                         "all airports" if airport_codes is None else ", ".join(airport_codes))
+    data_extractor = DataExtractor(data_dir=data_dir, quiet=True, airport_codes=airport_codes)
+    data_extractor.save_extracted_data(cache_dir=cache_dir)
+
+
+def load_data(airport="BOS", data_dir=DATA_DIR, cache_dir=CACHE_DIR):
+    """Function to load the simulation data of an airport, rebuilding the cache first if it is out of date"""
+    key = (airport, cache_dir)
+    if key in _loaded:
+        return _loaded[key]
+
+    # Rebuild the cache for every airport it held plus the requested one, in a single pass over the CSVs
+    index = read_index(cache_dir)
+    if not cache_is_valid(index, data_dir) or airport not in index["airports"]:
+        airport_codes = [airport]
+        if index is not None:
+            airport_codes = list(dict.fromkeys(index["airports"] + airport_codes))
+        rebuild_cache(airport_codes, data_dir, cache_dir)
+        index = read_index(cache_dir)
+        if airport not in index["airports"]:
+            raise KeyError(f"No routes found for airport: {airport}")
+
+    position = index["airports"].index(airport)
+    offsets = np.load(os.path.join(cache_dir, "offsets.npy"), mmap_mode="r")
+    start, stop = offsets[position], offsets[position + 1]
+
+    # Memory-map the tables and slice out the airport (as plain read-only arrays over the mapped memory)
+    tables = {}
+    for column, name in enumerate(index["tables"]):
+        table = np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode="r")
+        tables[name] = np.asarray(table[start[column]:stop[column]])
+
+    # Only read the airport's own line of string tables
+    with open(os.path.join(cache_dir, "strings.jsonl"), "rb") as file:
+        file.seek(int(start[-1]))
+        line = json.loads(file.read(int(stop[-1] - start[-1])).decode("utf-8"))
+
+    data = SimulationData(airport, tables, line["strings"], line["wind"], line["runways"])
+    _loaded[key] = data
+    return data
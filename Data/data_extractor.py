@@ -1,213 +1,165 @@
 import os
-import time
+import argparse
 import pandas as pd
+from Data.data_cache import DATA_DIR, CACHE_DIR, write_cache
+
+# Probability of the wind blowing in each direction (measured at Logan Airport, used for every airport)
+WIND_PROBABILITIES = {
+    "Northeast": 0.18,
+    "Northwest": 0.37,
+    "Southeast": 0.17,
+    "Southwest": 0.28
+}
+
+
+def group_route_equipment(route_data, hub_column, airport_column):
+    """
+    Function to map each hub -> route -> airline -> list of aircraft flown (the last listing of a route wins), where
+    `hub_column` holds the airport being simulated and `airport_column` the airport at the other end of the route
+    """
+    equipment = route_data.groupby([hub_column, airport_column, "Airline"], sort=False)["Equipment"].last()
+
+    routes = {}
+    for (hub, airport, airline), aircrafts in equipment.items():
+        routes.setdefault(hub, {}).setdefault(airport, {})[airline] = aircrafts.split(" ")
+    return routes
+
+
+def build_probability_trees(route_data, hub_column, airport_column):
+    """
+    Function to build the airline -> route -> aircraft probability tree of every hub in a set of routes with columnar
+    group counts. Airlines and routes keep the order they first appear in, and the aircraft of a route are taken from
+    its first listing.
+    """
+    flight_counts = route_data.groupby(hub_column, sort=False).size().to_dict()
+    airline_counts = route_data.groupby([hub_column, "Airline"], sort=False).size()
+    route_groups = route_data.groupby([hub_column, "Airline", airport_column], sort=False)
+    route_counts = route_groups.size()
+    route_equipment = route_groups["Equipment"].first()
+    routes_per_airline = route_counts.groupby(level=[0, 1], sort=False).size().to_dict()
+
+    # Calculate airline probabilities
+    trees = {}
+    for (hub, airline), count in zip(airline_counts.index, airline_counts.tolist()):
+        trees.setdefault(hub, {})[airline] = {"Count": count, "Routes": {}, "Probability": count / flight_counts[hub]}
+
+    # Calculate route and aircraft probabilities (both series share the group order)
+    for (hub, airline, route), count, equipment in zip(route_counts.index, route_counts.tolist(),
+                                                       route_equipment.tolist()):
+        aircrafts = equipment.split(" ")
+        trees[hub][airline]["Routes"][route] = {
+            "Count": count,
+            "Aircrafts": {aircraft: {"Probability": 1/len(aircrafts)} for aircraft in aircrafts},
+            "Probability": count / routes_per_airline[(hub, airline)],
+        }
+
+    return trees
 
 
 class DataExtractor:
     """Class to extract airport, airline and flight data"""
 
-    def __init__(self):
+    def __init__(self, data_dir=DATA_DIR, quiet=False, airport_codes=("BOS",)):
+        """
+        Extracts the sampling tables of every airport in `airport_codes` (every airport with routes if None) from a
+        single read of the route data. `routes`, `probabilities` and `runways` are dictionaries keyed by airport code.
+        """
+        self.data_dir = data_dir
+        self.quiet = quiet
+
         # Load airport data
-        self.airport_data = pd.read_csv("airports.csv")
+        self.log("Loading airport data")
+        self.airport_data = pd.read_csv(os.path.join(data_dir, "airports.csv"))
         self.airport_data = self.airport_data.fillna("None")
 
         # Load and filter airline data
-        airline_data = pd.read_csv("airlines.csv")
+        self.log("Loading airline data")
+        airline_data = pd.read_csv(os.path.join(data_dir, "airlines.csv"))
         airline_data = airline_data.fillna("None")
         self.airline_data = airline_data[airline_data["Active"] == "Y"]
         self.airline_data.reset_index(inplace=True, drop=True)
 
         # Load and filter route data
-        route_data = pd.read_csv("routes.csv")
+        self.log("Loading route data")
+        route_data = pd.read_csv(os.path.join(data_dir, "routes.csv"))
         route_data = route_data.fillna("None")
 
-        # Filter data for only Boston flights
-        self.boston_data = self.airport_data[self.airport_data["City"] == "Boston"]
-        self.boston_departure_data = route_data[route_data["Source Airport"] == "BOS"]
-        self.boston_arrival_data = route_data[route_data["Destination Airport"] == "BOS"]
-        self.boston_departure_data.reset_index(inplace=True, drop=True)
-        self.boston_arrival_data.reset_index(inplace=True, drop=True)
+        # Filter data for only the requested airports
+        if airport_codes is None:
+            self.departure_data = route_data
+            self.arrival_data = route_data
+            airport_codes = pd.unique(pd.concat([route_data["Source Airport"], route_data["Destination Airport"]]))
+        else:
+            self.departure_data = route_data[route_data["Source Airport"].isin(airport_codes)]
+            self.arrival_data = route_data[route_data["Destination Airport"].isin(airport_codes)]
+            self.departure_data.reset_index(inplace=True, drop=True)
+            self.arrival_data.reset_index(inplace=True, drop=True)
+        self.airport_codes = list(airport_codes)
 
         # Extract Data
         self.airports = self.extract_airport_data()
         self.airlines = self.extract_airline_data()
         self.routes = self.extract_route_data()
         self.probabilities = self.calculate_probabilities()
-        self.runways = self.configure_runways()
+        self.runways = {"BOS": self.configure_runways()} if "BOS" in self.probabilities else {}
+
+    def log(self, message):
+        """Function to print a progress message unless running in quiet mode"""
+        if not self.quiet:
+            print(message)
 
     def extract_airport_data(self):
         """Function to save all airport data to a dictionary"""
-        airports = {}
-        num_airports = len(self.airport_data)
-        for i in range(num_airports):
-            print(f"Extracting airport data: Progress {i}/{num_airports}")
-            airport_id = self.airport_data["IATA"][i]
-            airports[airport_id] = {}
-            airports[airport_id]["Name"] = self.airport_data["Name"][i]
-            airports[airport_id]["City"] = self.airport_data["City"][i]
-            airports[airport_id]["Country"] = self.airport_data["Country"][i]
-
-        return airports
+        self.log(f"Extracting airport data: {len(self.airport_data)} airports")
+
+        # Later rows win, like overwriting the dictionary row by row would
+        airports = self.airport_data.groupby("IATA", sort=False)[["Name", "City", "Country"]].last()
+        return airports.to_dict("index")
 
     def extract_airline_data(self):
         """Function to save all airline data to a dictionary"""
-        airlines = {}
-        num_airlines = len(self.airline_data)
-        for i in range(num_airlines):
-            print(f"Extracting airline data; Progress: {i+1}/{num_airlines}")
-            airline_id = self.airline_data["IATA"][i]
-            airlines[airline_id] = {}
-            airlines[airline_id]["Name"] = self.airline_data["Name"][i]
-            airlines[airline_id]["ICAO"] = self.airline_data["ICAO"][i]
+        self.log(f"Extracting airline data: {len(self.airline_data)} airlines")
 
-        return airlines
+        airlines = self.airline_data.groupby("IATA", sort=False)[["Name", "ICAO"]].last()
+        return airlines.to_dict("index")
 
     def extract_route_data(self):
-        """Function to extract data on all routes to Boston"""
-        routes = {'Departures': {}, 'Arrivals': {}}
-
-        # Extract departure data
-        num_departures = len(self.boston_departure_data)
-        for i in range(num_departures):
-            print(f"Extracting departure routes; Progress: {i+1}/{num_departures}")
-            destination = self.boston_departure_data["Destination Airport"][i]
-            if destination not in routes['Departures'].keys():
-                routes['Departures'][destination] = {}
-
-            # Save planes used by airline by route
-            airline = self.boston_departure_data["Airline"][i]
-            routes['Departures'][destination][airline] = self.boston_departure_data["Equipment"][i].split(" ")
-
-        # Extract arrival data
-        num_arrivals = len(self.boston_arrival_data)
-        for i in range(num_arrivals):
-            print(f"Extracting arrival routes: Progress: {i}/{num_arrivals}")
-            source = self.boston_arrival_data["Source Airport"][i]
-            if source not in routes['Arrivals'].keys():
-                routes['Arrivals'][source] = {}
-
-            # Save planes used by airline by route
-            airline = self.boston_arrival_data["Airline"][i]
-            routes['Arrivals'][source][airline] = self.boston_arrival_data["Equipment"][i].split(" ")
-
-        return routes
+        """Function to extract data on all routes to/from each airport"""
+        self.log(f"Extracting routes: {len(self.departure_data)} departures, {len(self.arrival_data)} arrivals")
+        departures = group_route_equipment(self.departure_data, "Source Airport", "Destination Airport")
+        arrivals = group_route_equipment(self.arrival_data, "Destination Airport", "Source Airport")
+
+        return {code: {'Departures': departures.get(code, {}), 'Arrivals': arrivals.get(code, {})}
+                for code in self.airport_codes if code in departures or code in arrivals}
 
     def calculate_probabilities(self):
-        """Function to calculate flight probabilities"""
-        num_departures = len(self.boston_departure_data)
-        num_arrivals = len(self.boston_arrival_data)
-        probabilities = {
-            "Departures": {},
-            "Arrivals": {},
-            "Num Departures": num_departures,
-            "Departure Rate": round(num_departures/24, 0),
-            "Num Arrivals": num_arrivals,
-            "Arrival Rate": round(num_arrivals/24, 0),
-            "Wind": {
-                "Northeast": 0.18,
-                "Northwest": 0.37,
-                "Southeast": 0.17,
-                "Southwest": 0.28
+        """Function to calculate flight probabilities of each airport"""
+        self.log(f"Calculating flight probabilities for {len(self.airport_codes)} airports")
+        departure_trees = build_probability_trees(self.departure_data, "Source Airport", "Destination Airport")
+        arrival_trees = build_probability_trees(self.arrival_data, "Destination Airport", "Source Airport")
+
+        probabilities = {}
+        for code in self.airport_codes:
+            if code not in departure_trees and code not in arrival_trees:
+                continue
+            departures = departure_trees.get(code, {})
+            arrivals = arrival_trees.get(code, {})
+            num_departures = sum(airline["Count"] for airline in departures.values())
+            num_arrivals = sum(airline["Count"] for airline in arrivals.values())
+            probabilities[code] = {
+                "Departures": departures,
+                "Arrivals": arrivals,
+                "Num Departures": num_departures,
+                "Departure Rate": round(num_departures/24, 0),
+                "Num Arrivals": num_arrivals,
+                "Arrival Rate": round(num_arrivals/24, 0),
+                "Wind": dict(WIND_PROBABILITIES)
             }
-        }
-
-        # Collect departure data
-        for i in range(len(self.boston_departure_data)):
-            print(f"Collecting Departure Probability Data; Progress: {i}/{len(self.boston_departure_data)}")
-            aircrafts = self.boston_departure_data["Equipment"][i].split(" ")
-            airline = self.boston_departure_data["Airline"][i]
-            destination = self.boston_departure_data["Destination Airport"][i]
-
-            # Track airlines
-            if airline not in probabilities['Departures'].keys():
-                probabilities['Departures'][airline] = {}
-
-            # Track departures
-            if 'Count' not in probabilities['Departures'][airline].keys():
-                probabilities['Departures'][airline]['Count'] = 0
-            probabilities['Departures'][airline]['Count'] += 1
-
-            # Track destinations
-            if 'Routes' not in probabilities['Departures'][airline].keys():
-                probabilities['Departures'][airline]['Routes'] = {}
-
-            if destination not in probabilities['Departures'][airline]['Routes']:
-                probabilities['Departures'][airline]['Routes'][destination] = {'Count': 0}
-            probabilities['Departures'][airline]['Routes'][destination]['Count'] += 1
-
-            # Track aircrafts
-            if 'Aircrafts' not in probabilities['Departures'][airline]['Routes'][destination]:
-                probabilities['Departures'][airline]['Routes'][destination]['Aircrafts'] = {}
-                for aircraft in aircrafts:
-                    probabilities['Departures'][airline]['Routes'][destination]['Aircrafts'][aircraft] = {}
-                    probabilities['Departures'][airline]['Routes'][destination]['Aircrafts'][aircraft]['Probability'] = 1/len(aircrafts)
-
-        # Calculate departure probabilities
-        counter = 1
-        for airline in probabilities['Departures'].keys():
-            print(f"Collecting Departure Probabilities; Progress: {counter}/{len(probabilities['Departures'].keys())}")
-            # Calculate airline probabilities
-            airline_probability = probabilities['Departures'][airline]['Count'] / num_departures
-            probabilities['Departures'][airline]['Probability'] = airline_probability
-
-            # Calculate route probabilities
-            for route in probabilities['Departures'][airline]['Routes']:
-                route_probability = probabilities['Departures'][airline]['Routes'][route]['Count'] / len(probabilities['Departures'][airline]['Routes'])
-                probabilities['Departures'][airline]['Routes'][route]['Probability'] = route_probability
-
-            counter += 1
-
-        # Collect arrival data
-        for i in range(len(self.boston_arrival_data)):
-            print(f"Collecting Arrival Probability Data; Progress: {i}/{len(self.boston_arrival_data)}")
-            aircrafts = self.boston_arrival_data["Equipment"][i].split(" ")
-            airline = self.boston_arrival_data["Airline"][i]
-            source = self.boston_arrival_data["Source Airport"][i]
-
-            # Track airlines
-            if airline not in probabilities['Arrivals'].keys():
-                probabilities['Arrivals'][airline] = {}
-
-            # Track arrivals
-            if 'Count' not in probabilities['Arrivals'][airline].keys():
-                probabilities['Arrivals'][airline]['Count'] = 0
-            probabilities['Arrivals'][airline]['Count'] += 1
-
-            # Track sources
-            if 'Routes' not in probabilities['Arrivals'][airline].keys():
-                probabilities['Arrivals'][airline]['Routes'] = {}
-
-            if source not in probabilities['Arrivals'][airline]['Routes']:
-                probabilities['Arrivals'][airline]['Routes'][source] = {'Count': 0}
-            probabilities['Arrivals'][airline]['Routes'][source]['Count'] += 1
-
-            # Track aircrafts
-            if 'Aircrafts' not in probabilities['Arrivals'][airline]['Routes'][source]:
-                probabilities['Arrivals'][airline]['Routes'][source]['Aircrafts'] = {}
-                for aircraft in aircrafts:
-                    probabilities['Arrivals'][airline]['Routes'][source]['Aircrafts'][aircraft] = {}
-                    probabilities['Arrivals'][airline]['Routes'][source]['Aircrafts'][aircraft]['Probability'] = 1 / len(aircrafts)
-
-        # Calculate arrival probabilities
-        counter = 1
-        for airline in probabilities['Arrivals'].keys():
-            print(f"Collecting Arrival Probabilities; Progress: {counter}/{len(probabilities['Arrivals'].keys())}")
-            # Calculate airline probabilities
-            airline_probability = probabilities['Arrivals'][airline]['Count'] / num_departures
-            probabilities['Arrivals'][airline]['Probability'] = airline_probability
-
-            # Calculate route probabilities
-            for route in probabilities['Arrivals'][airline]['Routes']:
-                route_probability = probabilities['Arrivals'][airline]['Routes'][route]['Count'] / len(
-                    probabilities['Arrivals'][airline]['Routes'])
-                probabilities['Arrivals'][airline]['Routes'][route]['Probability'] = route_probability
-
-            counter += 1
 
         return probabilities
 
     def configure_runways(self):
-        """Function to set runway data"""
+        """Function to set runway data (only known for Logan Airport)"""
         runways = {
             "Northeast": {
                 "Departures": {
@@ -261,14 +213,18 @@ class DataExtractor:
 
         return runways
 
-    def save_extracted_data(self):
-        """Function to save data to file"""
-        print("Writing data to file")
-        with open("final_data.py", "w", encoding='utf-8') as file:
-            file.write(f"airports = {self.airports}\n\nairlines = {self.airlines}\n\nroutes = {self.routes}\n\nprobabilities = {self.probabilities}\n\nrunways = {self.runways}")
-            file.close()
+    def save_extracted_data(self, cache_dir=CACHE_DIR):
+        """Function to save data to the binary data cache"""
+        self.log(f"Writing data to cache for {len(self.probabilities)} airports")
+        write_cache(self.probabilities, self.airlines, self.airports, self.runways, data_dir=self.data_dir,
+                    cache_dir=cache_dir)
 
 
 if __name__ == '__main__':
-    data_extractor = DataExtractor()
+    parser = argparse.ArgumentParser(description="Extract the sampling tables used by the simulation")
+    parser.add_argument("airports", nargs="*", default=["BOS"], help="IATA codes of the airports to extract")
+    parser.add_argument("--all", action="store_true", help="extract every airport in routes.csv")
+    args = parser.parse_args()
+
+    data_extractor = DataExtractor(airport_codes=None if args.all else args.airports)
     data_extractor.save_extracted_data()
@@ -1,9 +0,0 @@
-airports = {'GKA': {'Name': 'Goroka Airport', 'City': 'Goroka', 'Country': 'Papua New Guinea'}, 'MAG': {'Name': 'Madang Airport', 'City': 'Madang', 'Country': 'Papua New Guinea'}, 'HGU': {'Name': 'Mount Hagen Kagamuga Airport', 'City': 'Mount Hagen', 'Country': 'Papua New Guinea'}, 'LAE': {'Name': 'Nadzab Airport', 'City': 'Nadzab', 'Country': 'Papua New Guinea'}, 'POM': {'Name': 'Port Moresby Jacksons International Airport', 'City': 'Port Moresby', 'Country': 'Papua New Guinea'}, 'WWK': {'Name': 'Wewak International Airport', 'City': 'Wewak', 'Country': 'Papua New Guinea'}, 'UAK': {'Name': 'Narsarsuaq Airport', 'City': 'Narssarssuaq', 'Country': 'Greenland'}, 'GOH': {'Name': 'Godthaab / Nuuk Airport', 'City': 'Godthaab', 'Country': 'Greenland'}, 'SFJ': {'Name': 'Kangerlussuaq Airport', 'City': 'Sondrestrom', 'Country': 'Greenland'}, 'THU': {'Name': 'Thule Air Base', 'City': 'Thule', 'Country': 'Greenland'}, 'AEY': {'Name': 'Akureyri Airport', 'City': 'Akureyri', 'Country': 'Iceland'}, 'EGS': {'Name': 'Egilsstaðir Airport', 'City': 'Egilsstadir', 'Country': 'Iceland'}, 'HFN': {'Name': 'Hornafjörður Airport', 'City': 'Hofn', 'Country': 'Iceland'}, 'HZK': {'Name': 'Húsavík Airport', 'City': 'Husavik', 'Country': 'Iceland'}, 'IFJ': {'Name': 'Ísafjörður Airport', 'City': 'Isafjordur', 'Country': 'Iceland'}, 'KEF': {'Name': 'Keflavik International Airport', 'City': 'Keflavik', 'Country': 'Iceland'}, 'PFJ': {'Name': 'Patreksfjörður Airport', 'City': 'Patreksfjordur', 'Country': 'Iceland'}, 'RKV': {'Name': 'Reykjavik Airport', 'City': 'Reykjavik', 'Country': 'Iceland'}, 'SIJ': {'Name': 'Siglufjörður Airport', 'City': 'Siglufjordur', 'Country': 'Iceland'}, 'VEY': {'Name': 'Vestmannaeyjar Airport', 'City': 'Vestmannaeyjar', 'Country': 'Iceland'}, 'YAM': {'Name': 'Sault Ste Marie Airport', 'City': 'Sault Sainte Marie', 'Country': 'Canada'}, '\\N': {'Name': 'Melitopol Air Base', 'City': 'Melitopol', 'Country': 'Ukraine'}, 'YAY': {'Name': 'St. Anthony Airport', 'City': 'St. Anthony', 'Country': 'Canada'}, 'YAZ': {'Name': 'Tofino / Long Beach Airport', 'City': 'Tofino', 'Country': 'Canada'}, 'YBB': {'Name': 'Kugaaruk Airport', 'City': 'Pelly Bay', 'Country': 'Canada'}, 'YBC': {'Name': 'Baie Comeau Airport', 'City': 'Baie Comeau', 'Country': 'Canada'}, 'YBG': {'Name': 'CFB Bagotville', 'City': 'Bagotville', 'Country': 'Canada'}, 'YBK': {'Name': 'Baker Lake Airport', 'City': 'Baker Lake', 'Country': 'Canada'}, 'YBL': {'Name': 'Campbell River Airport', 'City': 'Campbell River', 'Country': 'Canada'}, 'YBR': {'Name': 'Brandon Municipal Airport', 'City': 'Brandon', 'Country': 'Canada'}, 'YCB': {'Name': 'Cambridge Bay Airport', 'City': 'Cambridge Bay', 'Country': 'Canada'}, 'YCD': {'Name': 'Nanaimo Airport', 'City': 'Nanaimo', 'Country': 'Canada'}, 'YCG': {'Name': 'Castlegar/West Kootenay Regional Airport', 'City': 'Castlegar', 'Country': 'Canada'}, 'YCH': {'Name': 'Miramichi Airport', 'City': 'Chatham', 'Country': 'Canada'}, 'YCL': {'Name': 'Charlo Airport', 'City': 'Charlo', 'Country': 'Canada'}, 'YCO': {'Name': 'Kugluktuk Airport', 'City': 'Coppermine', 'Country': 'Canada'}, 'YCT': {'Name': 'Coronation Airport', 'City': 'Coronation', 'Country': 'Canada'}, 'YCW': {'Name': 'Chilliwack Airport', 'City': 'Chilliwack', 'Country': 'Canada'}, 'YCY': {'Name': 'Clyde River Airport', 'City': 'Clyde River', 'Country': 'Canada'}, 'YZS': {'Name': 'Coral Harbour Airport', 'City': 'Coral Harbour', 'Country': 'Canada'}, 'YDA': {'Name': 'Dawson City Airport', 'City': 'Dawson', 'Country': 'Canada'}, 'YDB': {'Name': 'Burwash Airport', 'City': 'Burwash', 'Country': 'Canada'}, 'YDF': {'Name': 'Deer Lake Airport', 'City': 'Deer Lake', 'Country': 'Canada'}, 'YDL': {'Name': 'Dease Lake Airport', 'City': 'Dease Lake', 'Country': 'Canada'}, 'YDN': {'Name': 'Dauphin Barker Airport', 'City': 'Dauphin', 'Country': 'Canada'}, 'YDQ': {'Name': 'Dawson Creek Airport', 'City': 'Dawson Creek', 'Country': 'Canada'}, 'YEG': {'Name': 'Edmonton International Airport', 'City': 'Edmonton', 'Country': 'Canada'}, 'YEK': {'Name': 'Arviat Airport', 'City': 'Eskimo Point', 'Country': 'Canada'}, 'YEN': {'Name': 'Estevan Airport', 'City': 'Estevan', 'Country': 'Canada'}, 'YET': {'Name': 'Edson Airport', 'City': 'Edson', 'Country': 'Canada'}, 'YEU': {'Name': 'Eureka Airport', 'City': 'Eureka', 'Country': 'Canada'}, 'YEV': {'Name': 'Inuvik Mike Zubko Airport', 'City': 'Inuvik', 'Country': 'Canada'}, 'YFB': {'Name': 'Iqaluit Airport', 'City': 'Iqaluit', 'Country': 'Canada'}, 'YFC': {'Name': 'Fredericton Airport', 'City': 'Fredericton', 'Country': 'Canada'}, 'YFE': {'Name': 'Forestville Airport', 'City': 'Forestville', 'Country': 'Canada'}, 'YFO': {'Name': 'Flin Flon Airport', 'City': 'Flin Flon', 'Country': 'Canada'}, 'YFR': {'Name': 'Fort Resolution Airport', 'City': 'Fort Resolution', 'Country': 'Canada'}, 'YFS': {'Name': 'Fort Simpson Airport', 'City': 'Fort Simpson', 'Country': 'Canada'}, 'YGK': {'Name': 'Kingston Norman Rogers Airport', 'City': 'Kingston', 'Country': 'Canada'}, 'YGL': {'Name': 'La Grande Rivière Airport', 'City': 'La Grande Riviere', 'Country': 'Canada'}, 'YGP': {'Name': 'Gaspé (Michel-Pouliot) Airport', 'City': 'Gaspe', 'Country': 'Canada'}, 'YGQ': {'Name': 'Geraldton Greenstone Regional Airport', 'City': 'Geraldton', 'Country': 'Canada'}, 'YGR': {'Name': 'Îles-de-la-Madeleine Airport', 'City': 'Iles De La Madeleine', 'Country': 'Canada'}, 'YHB': {'Name': 'Hudson Bay Airport', 'City': 'Hudson Bay', 'Country': 'Canada'}, 'YHD': {'Name': 'Dryden Regional Airport', 'City': 'Dryden', 'Country': 'Canada'}, 'YHI': {'Name': 'Ulukhaktok Holman Airport', 'City': 'Holman Island', 'Country': 'Canada'}, 'YHK': {'Name': 'Gjoa Haven Airport', 'City': 'Gjoa Haven', 'Country': 'Canada'}, 'YHM': {'Name': 'John C. Munro Hamilton International Airport', 'City': 'Hamilton', 'Country': 'Canada'}, 'YHU': {'Name': 'Montréal / Saint-Hubert Airport', 'City': 'Montreal', 'Country': 'Canada'}, 'YHY': {'Name': 'Hay River / Merlyn Carter Airport', 'City': 'Hay River', 'Country': 'Canada'}, 'YHZ': {'Name': 'Halifax / Stanfield International Airport', 'City': 'Halifax', 'Country': 'Canada'}, 'YIB': {'Name': 'Atikokan Municipal Airport', 'City': 'Atikokan', 'Country': 'Canada'}, 'YIO': {'Name': 'Pond Inlet Airport', 'City': 'Pond Inlet', 'Country': 'Canada'}, 'YJN': {'Name': 'St Jean Airport', 'City': 'St. Jean', 'Country': 'Canada'}, 'YJT': {'Name': 'Stephenville Airport', 'City': 'Stephenville', 'Country': 'Canada'}, 'YKA': {'Name': 'Kamloops Airport', 'City': 'Kamloops', 'Country': 'Canada'}, 'YKF': {'Name': 'Waterloo Airport', 'City': 'Waterloo', 'Country': 'Canada'}, 'YKL': {'Name': 'Schefferville Airport', 'City': 'Schefferville', 'Country': 'Canada'}, 'YKY': {'Name': 'Kindersley Airport', 'City': 'Kindersley', 'Country': 'Canada'}, 'YKZ': {'Name': 'Buttonville Municipal Airport', 'City': 'Toronto', 'Country': 'Canada'}, 'YLD': {'Name': 'Chapleau Airport', 'City': 'Chapleau', 'Country': 'Canada'}, 'YLJ': {'Name': 'Meadow Lake Airport', 'City': 'Meadow Lake', 'Country': 'Canada'}, 'YLL': {'Name': 'Lloydminster Airport', 'City': 'Lloydminster', 'Country': 'Canada'}, 'YLT': {'Name': 'Alert Airport', 'City': 'Alert', 'Country': 'Canada'}, 'YLW': {'Name': 'Kelowna International Airport', 'City': 'Kelowna', 'Country': 'Canada'}, 'YMA': {'Name': 'Mayo Airport', 'City': 'Mayo', 'Country': 'Canada'}, 'YMJ': {'Name': 'Moose Jaw Air Vice Marshal C. M. McEwen Airport', 'City': 'Moose Jaw', 'Country': 'Canada'}, 'YMM': {'Name': 'Fort McMurray Airport', 'City': 'Fort Mcmurray', 'Country': 'Canada'}, 'YMO': {'Name': 'Moosonee Airport', 'City': 'Moosonee', 'Country': 'Canada'}, 'YMW': {'Name': 'Maniwaki Airport', 'City': 'Maniwaki', 'Country': 'Canada'}, 'YMX': {'Name': 'Montreal International (Mirabel) Airport', 'City': 'Montreal', 'Country': 'Canada'}, 'YNA': {'Name': 'Natashquan Airport', 'City': 'Natashquan', 'Country': 'Canada'}, 'YND': {'Name': 'Ottawa / Gatineau Airport', 'City': 'Gatineau', 'Country': 'Canada'}, 'YNM': {'Name': 'Matagami Airport', 'City': 'Matagami', 'Country': 'Canada'}, 'YOC': {'Name': 'Old Crow Airport', 'City': 'Old Crow', 'Country': 'Canada'}, 'YOD': {'Name': 'CFB Cold Lake', 'City': 'Cold Lake', 'Country': 'Canada'}, 'YOJ': {'Name': 'High Level Airport', 'City': 'High Level', 'Country': 'Canada'}, 'YOW': {'Name': 'Ottawa Macdonald-Cartier International Airport', 'City': 'Ottawa', 'Country': 'Canada'}, 'YPA': {'Name': 'Prince Albert Glass Field', 'City': 'Prince Albert', 'Country': 'Canada'}, 'YPE': {'Name': 'Peace River Airport', 'City': 'Peace River', 'Country': 'Canada'}, 'YPG': {'Name': 'Southport Airport', 'City': 'Portage-la-prairie', 'Country': 'Canada'}, 'YPL': {'Name': 'Pickle Lake Airport', 'City': 'Pickle Lake', 'Country': 'Canada'}, 'YPN': {'Name': 'Port Menier Airport', 'City': 'Port Menier', 'Country': 'Canada'}, 'YPQ': {'Name': 'Peterborough Airport', 'City': 'Peterborough', 'Country': 'Canada'}, 'YPR': {'Name': 'Prince Rupert Airport', 'City': 'Prince Pupert', 'Country': 'Canada'}, 'YPY': {'Name': 'Fort Chipewyan Airport', 'City': 'Fort Chipewyan', 'Country': 'Canada'}, 'YQA': {'Name': 'Muskoka Airport', 'City': 'Muskoka', 'Country': 'Canada'}, 'YQB': {'Name': 'Quebec Jean Lesage International Airport', 'City': 'Quebec', 'Country': 'Canada'}, 'YQF': {'Name': 'Red Deer Regional Airport', 'City': 'Red Deer Industrial', 'Country': 'Canada'}, 'YQG': {'Name': 'Windsor Airport', 'City': 'Windsor', 'Country': 'Canada'}, 'YQH': {'Name': 'Watson Lake Airport', 'City': 'Watson Lake', 'Country': 'Canada'}, 'YQK': {'Name': 'Kenora Airport', 'City': 'Kenora', 'Country': 'Canada'}, 'YQL': {'Name': 'Lethbridge County Airport', 'City': 'Lethbridge', 'Country': 'Canada'}, 'YQM': {'Name': 'Greater Moncton International Airport', 'City': 'Moncton', 'Country': 'Canada'}, 'YQQ': {'Name': 'Comox Airport', 'City': 'Comox', 'Country': 'Canada'}, 'YQR': {'Name': 'Regina International Airport', 'City': 'Regina', 'Country': 'Canada'}, 'YQT': {'Name': 'Thunder Bay Airport', 'City': 'Thunder Bay', 'Country': 'Canada'}, 'YQU': {'Name': 'Grande Prairie Airport', 'City': 'Grande Prairie', 'Country': 'Canada'}, 'YQV': {'Name': 'Yorkton Municipal Airport', 'City': 'Yorkton', 'Country': 'Canada'}, 'YQW': {'Name': 'North Battleford Airport', 'City': 'North Battleford', 'Country': 'Canada'}, 'YQX': {'Name': 'Gander International Airport', 'City': 'Gander', 'Country': 'Canada'}, 'YQY': {'Name': 'Sydney / J.A. Douglas McCurdy Airport', 'City': 'Sydney', 'Country': 'Canada'}, 'YQZ': {'Name': 'Quesnel Airport', 'City': 'Quesnel', 'Country': 'Canada'}, 'YRB': {'Name': 'Resolute Bay Airport', 'City': 'Resolute', 'Country': 'Canada'}, 'YRI': {'Name': 'Rivière-du-Loup Airport', 'City': 'Riviere Du Loup', 'Country': 'Canada'}, 'YRJ': {'Name': 'Roberval Airport', 'City': 'Roberval', 'Country': 'Canada'}, 'YRM': {'Name': 'Rocky Mountain House Airport', 'City': 'Rocky Mountain House', 'Country': 'Canada'}, 'YRT': {'Name': 'Rankin Inlet Airport', 'City': 'Rankin Inlet', 'Country': 'Canada'}, 'YSB': {'Name': 'Sudbury Airport', 'City': 'Sudbury', 'Country': 'Canada'}, 'YSC': {'Name': 'Sherbrooke Airport', 'City': 'Sherbrooke', 'Country': 'Canada'}, 'YSJ': {'Name': 'Saint John Airport', 'City': 'St. John', 'Country': 'Canada'}, 'YSM': {'Name': 'Fort Smith Airport', 'City': 'Fort Smith', 'Country': 'Canada'}, 'YSR': {'Name': 'Nanisivik Airport', 'City': 'Nanisivik', 'Country': 'Canada'}, 'YSU': {'Name': 'Summerside Airport', 'City': 'Summerside', 'Country': 'Canada'}, 'YSY': {'Name': 'Sachs Harbour (David Nasogaluak Jr. Saaryuaq) Airport', 'City': 'Sachs Harbour', 'Country': 'Canada'}, 'YTE': {'Name': 'Cape Dorset Airport', 'City': 'Cape Dorset', 'Country': 'Canada'}, 'YTH': {'Name': 'Thompson Airport', 'City': 'Thompson', 'Country': 'Canada'}, 'YTR': {'Name': 'CFB Trenton', 'City': 'Trenton', 'Country': 'Canada'}, 'YTS': {'Name': 'Timmins/Victor M. Power', 'City': 'Timmins', 'Country': 'Canada'}, 'YTZ': {'Name': 'Billy Bishop Toronto City Centre Airport', 'City': 'Toronto', 'Country': 'Canada'}, 'YUB': {'Name': 'Tuktoyaktuk Airport', 'City': 'Tuktoyaktuk', 'Country': 'Canada'}, 'YUL': {'Name': 'Montreal / Pierre Elliott Trudeau International Airport', 'City': 'Montreal', 'Country': 'Canada'}, 'YUT': {'Name': 'Repulse Bay Airport', 'City': 'Repulse Bay', 'Country': 'Canada'}, 'YUX': {'Name': 'Hall Beach Airport', 'City': 'Hall Beach', 'Country': 'Canada'}, 'YUY': {'Name': 'Rouyn Noranda Airport', 'City': 'Rouyn', 'Country': 'Canada'}, 'YVC': {'Name': 'La Ronge Airport', 'City': 'La Ronge', 'Country': 'Canada'}, 'YVG': {'Name': 'Vermilion Airport', 'City': 'Vermillion', 'Country': 'Canada'}, 'YVM': {'Name': 'Qikiqtarjuaq Airport', 'City': 'Broughton Island', 'Country': 'Canada'}, 'YVO': {'Name': "Val-d'Or Airport", 'City': "Val D'or", 'Country': 'Canada'}, 'YVP': {'Name': 'Kuujjuaq Airport', 'City': 'Quujjuaq', 'Country': 'Canada'}, 'YVQ': {'Name': 'Norman Wells Airport', 'City': 'Norman Wells', 'Country': 'Canada'}, 'YVR': {'Name': 'Vancouver International Airport', 'City': 'Vancouver', 'Country': 'Canada'}, 'YVT': {'Name': 'Buffalo Narrows Airport', 'City': 'Buffalo Narrows', 'Country': 'Canada'}, 'YVV': {'Name': 'Wiarton Airport', 'City': 'Wiarton', 'Country': 'Canada'}, 'YWA': {'Name': 'Petawawa Airport', 'City': 'Petawawa', 'Country': 'Canada'}, 'YWG': {'Name': 'Winnipeg / James Armstrong Richardson International Airport', 'City': 'Winnipeg', 'Country': 'Canada'}, 'YWK': {'Name': 'Wabush Airport', 'City': 'Wabush', 'Country': 'Canada'}, 'YWL': {'Name': 'Williams Lake Airport', 'City': 'Williams Lake', 'Country': 'Canada'}, 'YWY': {'Name': 'Wrigley Airport', 'City': 'Wrigley', 'Country': 'Canada'}, 'YXC': {'Name': 'Cranbrook/Canadian Rockies International Airport', 'City': 'Cranbrook', 'Country': 'Canada'}, 'YXD': {'Name': 'Edmonton City Centre (Blatchford Field) Airport', 'City': 'Edmonton', 'Country': 'Canada'}, 'YXE': {'Name': 'Saskatoon John G. Diefenbaker International Airport', 'City': 'Saskatoon', 'Country': 'Canada'}, 'YXH': {'Name': 'Medicine Hat Airport', 'City': 'Medicine Hat', 'Country': 'Canada'}, 'YXJ': {'Name': 'Fort St John Airport', 'City': 'Fort Saint John', 'Country': 'Canada'}, 'YXL': {'Name': 'Sioux Lookout Airport', 'City': 'Sioux Lookout', 'Country': 'Canada'}, 'YXP': {'Name': 'Pangnirtung Airport', 'City': 'Pangnirtung', 'Country': 'Canada'}, 'YXR': {'Name': 'Earlton (Timiskaming Regional) Airport', 'City': 'Earlton', 'Country': 'Canada'}, 'YXS': {'Name': 'Prince George Airport', 'City': 'Prince George', 'Country': 'Canada'}, 'YXT': {'Name': 'Northwest Regional Airport Terrace-Kitimat', 'City': 'Terrace', 'Country': 'Canada'}, 'YXU': {'Name': 'London Airport', 'City': 'London', 'Country': 'Canada'}, 'YXX': {'Name': 'Abbotsford Airport', 'City': 'Abbotsford', 'Country': 'Canada'}, 'YXY': {'Name': 'Whitehorse / Erik Nielsen International Airport', 'City': 'Whitehorse', 'Country': 'Canada'}, 'YYB': {'Name': 'North Bay Jack Garland Airport', 'City': 'North Bay', 'Country': 'Canada'}, 'YYC': {'Name': 'Calgary International Airport', 'City': 'Calgary', 'Country': 'Canada'}, 'YYD': {'Name': 'Smithers Airport', 'City': 'Smithers', 'Country': 'Canada'}, 'YYE': {'Name': 'Fort Nelson Airport', 'City': 'Fort Nelson', 'Country': 'Canada'}, 'YYF': {'Name': 'Penticton Airport', 'City': 'Penticton', 'Country': 'Canada'}, 'YYG': {'Name': 'Charlottetown Airport', 'City': 'Charlottetown', 'Country': 'Canada'}, 'YYH': {'Name': 'Taloyoak Airport', 'City': 'Spence Bay', 'Country': 'Canada'}, 'YYJ': {'Name': 'Victoria International Airport', 'City': 'Victoria', 'Country': 'Canada'}, 'YYL': {'Name': 'Lynn Lake Airport', 'City': 'Lynn Lake', 'Country': 'Canada'}, 'YYN': {'Name': 'Swift Current Airport', 'City': 'Swift Current', 'Country': 'Canada'}, 'YYQ': {'Name': 'Churchill Airport', 'City': 'Churchill', 'Country': 'Canada'}, 'YYR': {'Name': 'Goose Bay Airport', 'City': 'Goose Bay', 'Country': 'Canada'}, 'YYT': {'Name': "St. John's International Airport", 'City': "St. John's", 'Country': 'Canada'}, 'YYU': {'Name': 'Kapuskasing Airport', 'City': 'Kapuskasing', 'Country': 'Canada'}, 'YYW': {'Name': 'Armstrong Airport', 'City': 'Armstrong', 'Country': 'Canada'}, 'YYY': {'Name': 'Mont Joli Airport', 'City': 'Mont Joli', 'Country': 'Canada'}, 'YYZ': {'Name': 'Lester B. Pearson International Airport', 'City': 'Toronto', 'Country': 'Canada'}, 'YZD': {'Name': 'Downsview Airport', 'City': 'Toronto', 'Country': 'Canada'}, 'YZE': {'Name': 'Gore Bay Manitoulin Airport', 'City': 'Gore Bay', 'Country': 'Canada'}, 'YZF': {'Name': 'Yellowknife Airport', 'City': 'Yellowknife', 'Country': 'Canada'}, 'YZH': {'Name': 'Slave Lake Airport', 'City': 'Slave Lake', 'Country': 'Canada'}, 'YZP': {'Name': 'Sandspit Airport', 'City': 'Sandspit', 'Country': 'Canada'}, 'YZR': {'Name': 'Chris Hadfield Airport', 'City': 'Sarnia', 'Country': 'Canada'}, 'YZT': {'Name': 'Port Hardy Airport', 'City': 'Port Hardy', 'Country': 'Canada'}, 'YZU': {'Name': 'Whitecourt Airport', 'City': 'Whitecourt', 'Country': 'Canada'}, 'YZV': {'Name': 'Sept-Îles Airport', 'City': 'Sept-iles', 'Country': 'Canada'}, 'YZW': {'Name': 'Teslin Airport', 'City': 'Teslin', 'Country': 'Canada'}, 'YZX': {'Name': 'CFB Greenwood', 'City': 'Greenwood', 'Country': 'Canada'}, 'ZFA': {'Name': 'Faro Airport', 'City': 'Faro', 'Country': 'Canada'}, 'ZFM': {'Name': 'Fort Mcpherson Airport', 'City': 'Fort Mcpherson', 'Country': 'Canada'}, 'QLD': {'Name': 'Blida Airport', 'City': 'Blida', 'Country': 'Algeria'}, 'BUJ': {'Name': 'Bou Saada Airport', 'City': 'Bou Saada', 'Country': 'Algeria'}, 'BJA': {'Name': 'Soummam Airport', 'City': 'Bejaja', 'Country': 'Algeria'}, 'ALG': {'Name': 'Houari Boumediene Airport', 'City': 'Algier', 'Country': 'Algeria'}, 'DJG': {'Name': 'Djanet Inedbirene Airport', 'City': 'Djanet', 'Country': 'Algeria'}, 'VVZ': {'Name': 'Illizi Takhamalt Airport', 'City': 'Illizi', 'Country': 'Algeria'}, 'TMR': {'Name': 'Aguenar – Hadj Bey Akhamok Airport', 'City': 'Tamanrasset', 'Country': 'Algeria'}, 'GJL': {'Name': 'Jijel Ferhat Abbas Airport', 'City': 'Jijel', 'Country': 'Algeria'}, 'MZW': {'Name': 'Mecheria Airport', 'City': 'Mecheria', 'Country': 'Algeria'}, 'AAE': {'Name': 'Rabah Bitat Airport', 'City': 'Annaba', 'Country': 'Algeria'}, 'CZL': {'Name': 'Mohamed Boudiaf International Airport', 'City': 'Constantine', 'Country': 'Algeria'}, 'TEE': {'Name': 'Cheikh Larbi Tébessi Airport', 'City': 'Tebessa', 'Country': 'Algeria'}, 'HRM': {'Name': "Hassi R'Mel Airport", 'City': 'Tilrempt', 'Country': 'Algeria'}, 'TID': {'Name': 'Bou Chekif Airport', 'City': 'Tiaret', 'Country': 'Algeria'}, 'TIN': {'Name': 'Tindouf Airport', 'City': 'Tindouf', 'Country': 'Algeria'}, 'CFK': {'Name': 'Ech Cheliff Airport', 'City': 'Ech-cheliff', 'Country': 'Algeria'}, 'TAF': {'Name': 'Tafaraoui Airport', 'City': 'Oran', 'Country': 'Algeria'}, 'TLM': {'Name': 'Zenata – Messali El Hadj Airport', 'City': 'Tlemcen', 'Country': 'Algeria'}, 'ORN': {'Name': 'Es Senia Airport', 'City': 'Oran', 'Country': 'Algeria'}, 'BFW': {'Name': 'Sidi Bel Abbes Airport', 'City': 'Sidi Bel Abbes', 'Country': 'Algeria'}, 'MUW': {'Name': 'Ghriss Airport', 'City': 'Ghriss', 'Country': 'Algeria'}, 'AZR': {'Name': 'Touat Cheikh Sidi Mohamed Belkebir Airport', 'City': 'Adrar', 'Country': 'Algeria'}, 'BSK': {'Name': 'Biskra Airport', 'City': 'Biskra', 'Country': 'Algeria'}, 'ELG': {'Name': 'El Golea Airport', 'City': 'El Golea', 'Country': 'Algeria'}, 'GHA': {'Name': 'Noumérat - Moufdi Zakaria Airport', 'City': 'Ghardaia', 'Country': 'Algeria'}, 'HME': {'Name': 'Oued Irara Airport', 'City': 'Hassi Messaoud', 'Country': 'Algeria'}, 'INZ': {'Name': 'In Salah Airport', 'City': 'In Salah', 'Country': 'Algeria'}, 'TGR': {'Name': 'Touggourt Sidi Madhi Airport', 'City': 'Touggourt', 'Country': 'Algeria'}, 'LOO': {'Name': 'Laghouat Airport', 'City': 'Laghouat', 'Country': 'Algeria'}, 'TMX': {'Name': 'Timimoun Airport', 'City': 'Timimoun', 'Country': 'Algeria'}, 'OGX': {'Name': 'Ain el Beida Airport', 'City': 'Ouargla', 'Country': 'Algeria'}, 'IAM': {'Name': 'In Aménas Airport', 'City': 'Zarzaitine', 'Country': 'Algeria'}, 'COO': {'Name': 'Cadjehoun Airport', 'City': 'Cotonou', 'Country': 'Benin'}, 'OUA': {'Name': 'Ouagadougou Airport', 'City': 'Ouagadougou', 'Country': 'Burkina Faso'}, 'BOY': {'Name': 'Bobo Dioulasso Airport', 'City': 'Bobo-dioulasso', 'Country': 'Burkina Faso'}, 'ACC': {'Name': 'Kotoka International Airport', 'City': 'Accra', 'Country': 'Ghana'}, 'TML': {'Name': 'Tamale Airport', 'City': 'Tamale', 'Country': 'Ghana'}, 'NYI': {'Name': 'Sunyani Airport', 'City': 'Sunyani', 'Country': 'Ghana'}, 'TKD': {'Name': 'Takoradi Airport', 'City': 'Takoradi', 'Country': 'Ghana'}, 'ABJ': {'Name': 'Port Bouet Airport', 'City': 'Abidjan', 'Country': "Cote d'Ivoire"}, 'BYK': {'Name': 'Bouaké Airport', 'City': 'Bouake', 'Country': "Cote d'Ivoire"}, 'DJO': {'Name': 'Daloa Airport', 'City': 'Daloa', 'Country': "Cote d'Ivoire"}, 'HGO': {'Name': 'Korhogo Airport', 'City': 'Korhogo', 'Country': "Cote d'Ivoire"}, 'MJC': {'Name': 'Man Airport', 'City': 'Man', 'Country': "Cote d'Ivoire"}, 'SPY': {'Name': 'San Pedro Airport', 'City': 'San Pedro', 'Country': "Cote d'Ivoire"}, 'ASK': {'Name': 'Yamoussoukro Airport', 'City': 'Yamoussoukro', 'Country': "Cote d'Ivoire"}, 'ABV': {'Name': 'Nnamdi Azikiwe International Airport', 'City': 'Abuja', 'Country': 'Nigeria'}, 'AKR': {'Name': 'Akure Airport', 'City': 'Akure', 'Country': 'Nigeria'}, 'BNI': {'Name': 'Benin Airport', 'City': 'Benin', 'Country': 'Nigeria'}, 'CBQ': {'Name': 'Margaret Ekpo International Airport', 'City': 'Calabar', 'Country': 'Nigeria'}, 'ENU': {'Name': 'Akanu Ibiam International Airport', 'City': 'Enugu', 'Country': 'Nigeria'}, 'IBA': {'Name': 'Ibadan Airport', 'City': 'Ibadan', 'Country': 'Nigeria'}, 'ILR': {'Name': 'Ilorin International Airport', 'City': 'Ilorin', 'Country': 'Nigeria'}, 'JOS': {'Name': 'Yakubu Gowon Airport', 'City': 'Jos', 'Country': 'Nigeria'}, 'KAD': {'Name': 'Kaduna Airport', 'City': 'Kaduna', 'Country': 'Nigeria'}, 'KAN': {'Name': 'Mallam Aminu International Airport', 'City': 'Kano', 'Country': 'Nigeria'}, 'MIU': {'Name': 'Maiduguri International Airport', 'City': 'Maiduguri', 'Country': 'Nigeria'}, 'MDI': {'Name': 'Makurdi Airport', 'City': 'Makurdi', 'Country': 'Nigeria'}, 'LOS': {'Name': 'Murtala Muhammed International Airport', 'City': 'Lagos', 'Country': 'Nigeria'}, 'MXJ': {'Name': 'Minna Airport', 'City': 'Minna', 'Country': 'Nigeria'}, 'PHC': {'Name': 'Port Harcourt International Airport', 'City': 'Port Hartcourt', 'Country': 'Nigeria'}, 'SKO': {'Name': 'Sadiq Abubakar III International Airport', 'City': 'Sokoto', 'Country': 'Nigeria'}, 'YOL': {'Name': 'Yola Airport', 'City': 'Yola', 'Country': 'Nigeria'}, 'ZAR': {'Name': 'Zaria Airport', 'City': 'Zaria', 'Country': 'Nigeria'}, 'MFQ': {'Name': 'Maradi Airport', 'City': 'Maradi', 'Country': 'Niger'}, 'NIM': {'Name': 'Diori Hamani International Airport', 'City': 'Niamey', 'Country': 'Niger'}, 'THZ': {'Name': 'Tahoua Airport', 'City': 'Tahoua', 'Country': 'Niger'}, 'AJY': {'Name': 'Mano Dayak International Airport', 'City': 'Agadez', 'Country': 'Niger'}, 'ZND': {'Name': 'Zinder Airport', 'City': 'Zinder', 'Country': 'Niger'}, 'MIR': {'Name': 'Monastir Habib Bourguiba International Airport', 'City': 'Monastir', 'Country': 'Tunisia'}, 'TUN': {'Name': 'Tunis Carthage International Airport', 'City': 'Tunis', 'Country': 'Tunisia'}, 'GAF': {'Name': 'Gafsa Ksar International Airport', 'City': 'Gafsa', 'Country': 'Tunisia'}, 'GAE': {'Name': 'Gabès Matmata International Airport', 'City': 'Gabes', 'Country': 'Tunisia'}, 'DJE': {'Name': 'Djerba Zarzis International Airport', 'City': 'Djerba', 'Country': 'Tunisia'}, 'EBM': {'Name': 'El Borma Airport', 'City': 'El Borma', 'Country': 'Tunisia'}, 'SFA': {'Name': 'Sfax Thyna International Airport', 'City': 'Sfax', 'Country': 'Tunisia'}, 'TOE': {'Name': 'Tozeur Nefta International Airport', 'City': 'Tozeur', 'Country': 'Tunisia'}, 'LRL': {'Name': 'Niamtougou International Airport', 'City': 'Niatougou', 'Country': 'Togo'}, 'LFW': {'Name': 'Lomé-Tokoin Airport', 'City': 'Lome', 'Country': 'Togo'}, 'ANR': {'Name': 'Antwerp International Airport (Deurne)', 'City': 'Antwerp', 'Country': 'Belgium'}, 'BRU': {'Name': 'Brussels Airport', 'City': 'Brussels', 'Country': 'Belgium'}, 'CRL': {'Name': 'Brussels South Charleroi Airport', 'City': 'Charleroi', 'Country': 'Belgium'}, 'KJK': {'Name': 'Wevelgem Airport', 'City': 'Kortrijk-vevelgem', 'Country': 'Belgium'}, 'LGG': {'Name': 'Liège Airport', 'City': 'Liege', 'Country': 'Belgium'}, 'OST': {'Name': 'Ostend-Bruges International Airport', 'City': 'Ostend', 'Country': 'Belgium'}, 'OBL': {'Name': 'Zoersel (Oostmalle) Airfield', 'City': 'Zoersel', 'Country': 'Belgium'}, 'AOC': {'Name': 'Altenburg-Nobitz Airport', 'City': 'Altenburg', 'Country': 'Germany'}, 'IES': {'Name': 'Riesa-Göhlis Airport', 'City': 'Riesa', 'Country': 'Germany'}, 'REB': {'Name': 'Rechlin-Lärz Airport', 'City': 'Rechlin-laerz', 'Country': 'Germany'}, 'QXH': {'Name': 'Schönhagen Airport', 'City': 'Schoenhagen', 'Country': 'Germany'}, 'BBH': {'Name': 'Barth Airport', 'City': 'Barth', 'Country': 'Germany'}, 'ZMG': {'Name': 'Magdeburg "City" Airport', 'City': 'Magdeburg', 'Country': 'Germany'}, 'CBU': {'Name': 'Cottbus-Drewitz Airport', 'City': 'Cottbus', 'Country': 'Germany'}, 'SXF': {'Name': 'Berlin-Schönefeld Airport', 'City': 'Berlin', 'Country': 'Germany'}, 'DRS': {'Name': 'Dresden Airport', 'City': 'Dresden', 'Country': 'Germany'}, 'ERF': {'Name': 'Erfurt Airport', 'City': 'Erfurt', 'Country': 'Germany'}, 'FRA': {'Name': 'Frankfurt am Main Airport', 'City': 'Frankfurt', 'Country': 'Germany'}, 'FMO': {'Name': 'Münster Osnabrück Airport', 'City': 'Munster', 'Country': 'Germany'}, 'HAM': {'Name': 'Hamburg Airport', 'City': 'Hamburg', 'Country': 'Germany'}, 'THF': {'Name': 'Berlin-Tempelhof International Airport', 'City': 'Berlin', 'Country': 'Germany'}, 'CGN': {'Name': 'Cologne Bonn Airport', 'City': 'Cologne', 'Country': 'Germany'}, 'DUS': {'Name': 'Düsseldorf Airport', 'City': 'Duesseldorf', 'Country': 'Germany'}, 'MUC': {'Name': 'Munich Airport', 'City': 'Munich', 'Country': 'Germany'}, 'NUE': {'Name': 'Nuremberg Airport', 'City': 'Nuernberg', 'Country': 'Germany'}, 'LEJ': {'Name': 'Leipzig/Halle Airport', 'City': 'Leipzig', 'Country': 'Germany'}, 'SCN': {'Name': 'Saarbrücken Airport', 'City': 'Saarbruecken', 'Country': 'Germany'}, 'STR': {'Name': 'Stuttgart Airport', 'City': 'Stuttgart', 'Country': 'Germany'}, 'TXL': {'Name': 'Berlin-Tegel Airport', 'City': 'Berlin', 'Country': 'Germany'}, 'HAJ': {'Name': 'Hannover Airport', 'City': 'Hannover', 'Country': 'Germany'}, 'BRE': {'Name': 'Bremen Airport', 'City': 'Bremen', 'Country': 'Germany'}, 'QEF': {'Name': 'Frankfurt-Egelsbach Airport', 'City': 'Egelsbach', 'Country': 'Germany'}, 'HHN': {'Name': 'Frankfurt-Hahn Airport', 'City': 'Hahn', 'Country': 'Germany'}, 'MHG': {'Name': 'Mannheim-City Airport', 'City': 'Mannheim', 'Country': 'Germany'}, 'EIB': {'Name': 'Eisenach-Kindel Airport', 'City': 'Eisenach', 'Country': 'Germany'}, 'SGE': {'Name': 'Siegerland Airport', 'City': 'Siegerland', 'Country': 'Germany'}, 'XFW': {'Name': 'Hamburg-Finkenwerder Airport', 'City': 'Hamburg', 'Country': 'Germany'}, 'KEL': {'Name': 'Kiel-Holtenau Airport', 'City': 'Kiel', 'Country': 'Germany'}, 'LBC': {'Name': 'Lübeck Blankensee Airport', 'City': 'Luebeck', 'Country': 'Germany'}, 'ESS': {'Name': 'Essen Mulheim Airport', 'City': 'Essen', 'Country': 'Germany'}, 'BFE': {'Name': 'Bielefeld Airport', 'City': 'Bielefeld', 'Country': 'Germany'}, 'MGL': {'Name': 'Mönchengladbach Airport', 'City': 'Moenchengladbach', 'Country': 'Germany'}, 'PAD': {'Name': 'Paderborn Lippstadt Airport', 'City': 'Paderborn', 'Country': 'Germany'}, 'DTM': {'Name': 'Dortmund Airport', 'City': 'Dortmund', 'Country': 'Germany'}, 'AGB': {'Name': 'Augsburg Airport', 'City': 'Augsburg', 'Country': 'Germany'}, 'OBF': {'Name': 'Oberpfaffenhofen Airport', 'City': 'Oberpfaffenhofen', 'Country': 'Germany'}, 'RBM': {'Name': 'Straubing Airport', 'City': 'Straubing', 'Country': 'Germany'}, 'FDH': {'Name': 'Friedrichshafen Airport', 'City': 'Friedrichshafen', 'Country': 'Germany'}, 'SZW': {'Name': 'Schwerin Parchim Airport', 'City': 'Parchim', 'Country': 'Germany'}, 'BYU': {'Name': 'Bayreuth Airport', 'City': 'Bayreuth', 'Country': 'Germany'}, 'URD': {'Name': 'Burg Feuerstein Airport', 'City': 'Burg Feuerstein', 'Country': 'Germany'}, 'HOQ': {'Name': 'Hof-Plauen Airport', 'City': 'Hof', 'Country': 'Germany'}, 'ZQW': {'Name': 'Zweibrücken Airport', 'City': 'Zweibruecken', 'Country': 'Germany'}, 'ZQL': {'Name': 'Donaueschingen-Villingen Airport', 'City': 'Donaueschingen', 'Country': 'Germany'}, 'BWE': {'Name': 'Braunschweig-Wolfsburg Airport', 'City': 'Braunschweig', 'Country': 'Germany'}, 'KSF': {'Name': 'Kassel-Calden Airport', 'City': 'Kassel', 'Country': 'Germany'}, 'BRV': {'Name': 'Bremerhaven Airport', 'City': 'Bremerhaven', 'Country': 'Germany'}, 'EME': {'Name': 'Emden Airport', 'City': 'Emden', 'Country': 'Germany'}, 'WVN': {'Name': 'Wilhelmshaven-Mariensiel Airport', 'City': 'Wilhelmshaven', 'Country': 'Germany'}, 'BMK': {'Name': 'Borkum Airport', 'City': 'Borkum', 'Country': 'Germany'}, 'NRD': {'Name': 'Norderney Airport', 'City': 'Norderney', 'Country': 'Germany'}, 'FLF': {'Name': 'Flensburg-Schäferhaus Airport', 'City': 'Flensburg', 'Country': 'Germany'}, 'GWT': {'Name': 'Westerland Sylt Airport', 'City': 'Westerland', 'Country': 'Germany'}, 'KDL': {'Name': 'Kärdla Airport', 'City': 'Kardla', 'Country': 'Estonia'}, 'URE': {'Name': 'Kuressaare Airport', 'City': 'Kuressaare', 'Country': 'Estonia'}, 'EPU': {'Name': 'Pärnu Airport', 'City': 'Parnu', 'Country': 'Estonia'}, 'TLL': {'Name': 'Lennart Meri Tallinn Airport', 'City': 'Tallinn-ulemiste International', 'Country': 'Estonia'}, 'TAY': {'Name': 'Tartu Airport', 'City': 'Tartu', 'Country': 'Estonia'}, 'ENF': {'Name': 'Enontekio Airport', 'City': 'Enontekio', 'Country': 'Finland'}, 'KEV': {'Name': 'Halli Airport', 'City': 'Halli', 'Country': 'Finland'}, 'HEM': {'Name': 'Helsinki Malmi Airport', 'City': 'Helsinki', 'Country': 'Finland'}, 'HEL': {'Name': 'Helsinki Vantaa Airport', 'City': 'Helsinki', 'Country': 'Finland'}, 'HYV': {'Name': 'Hyvinkää Airfield', 'City': 'Hyvinkaa', 'Country': 'Finland'}, 'KTQ': {'Name': 'Kitee Airport', 'City': 'Kitee', 'Country': 'Finland'}, 'IVL': {'Name': 'Ivalo Airport', 'City': 'Ivalo', 'Country': 'Finland'}, 'JOE': {'Name': 'Joensuu Airport', 'City': 'Joensuu', 'Country': 'Finland'}, 'JYV': {'Name': 'Jyvaskyla Airport', 'City': 'Jyvaskyla', 'Country': 'Finland'}, 'KAU': {'Name': 'Kauhava Airport', 'City': 'Kauhava', 'Country': 'Finland'}, 'KEM': {'Name': 'Kemi-Tornio Airport', 'City': 'Kemi', 'Country': 'Finland'}, 'KAJ': {'Name': 'Kajaani Airport', 'City': 'Kajaani', 'Country': 'Finland'}, 'KHJ': {'Name': 'Kauhajoki Airport', 'City': 'Kauhajoki', 'Country': 'Finland'}, 'KOK': {'Name': 'Kokkola-Pietarsaari Airport', 'City': 'Kruunupyy', 'Country': 'Finland'}, 'KAO': {'Name': 'Kuusamo Airport', 'City': 'Kuusamo', 'Country': 'Finland'}, 'KTT': {'Name': 'Kittilä Airport', 'City': 'Kittila', 'Country': 'Finland'}, 'KUO': {'Name': 'Kuopio Airport', 'City': 'Kuopio', 'Country': 'Finland'}, 'QLF': {'Name': 'Lahti Vesivehmaa Airport', 'City': 'Vesivehmaa', 'Country': 'Finland'}, 'LPP': {'Name': 'Lappeenranta Airport', 'City': 'Lappeenranta', 'Country': 'Finland'}, 'MHQ': {'Name': 'Mariehamn Airport', 'City': 'Mariehamn', 'Country': 'Finland'}, 'MIK': {'Name': 'Mikkeli Airport', 'City': 'Mikkeli', 'Country': 'Finland'}, 'OUL': {'Name': 'Oulu Airport', 'City': 'Oulu', 'Country': 'Finland'}, 'POR': {'Name': 'Pori Airport', 'City': 'Pori', 'Country': 'Finland'}, 'RVN': {'Name': 'Rovaniemi Airport', 'City': 'Rovaniemi', 'Country': 'Finland'}, 'SVL': {'Name': 'Savonlinna Airport', 'City': 'Savonlinna', 'Country': 'Finland'}, 'SOT': {'Name': 'Sodankyla Airport', 'City': 'Sodankyla', 'Country': 'Finland'}, 'TMP': {'Name': 'Tampere-Pirkkala Airport', 'City': 'Tampere', 'Country': 'Finland'}, 'TKU': {'Name': 'Turku Airport', 'City': 'Turku', 'Country': 'Finland'}, 'UTI': {'Name': 'Utti Air Base', 'City': 'Utti', 'Country': 'Finland'}, 'VAA': {'Name': 'Vaasa Airport', 'City': 'Vaasa', 'Country': 'Finland'}, 'VRK': {'Name': 'Varkaus Airport', 'City': 'Varkaus', 'Country': 'Finland'}, 'YLI': {'Name': 'Ylivieska Airfield', 'City': 'Ylivieska-raudaskyla', 'Country': 'Finland'}, 'BFS': {'Name': 'Belfast International Airport', 'City': 'Belfast', 'Country': 'United Kingdom'}, 'ENK': {'Name': 'St Angelo Airport', 'City': 'Enniskillen', 'Country': 'United Kingdom'}, 'BHD': {'Name': 'George Best Belfast City Airport', 'City': 'Belfast', 'Country': 'United Kingdom'}, 'LDY': {'Name': 'City of Derry Airport', 'City': 'Londonderry', 'Country': 'United Kingdom'}, 'BHX': {'Name': 'Birmingham International Airport', 'City': 'Birmingham', 'Country': 'United Kingdom'}, 'CVT': {'Name': 'Coventry Airport', 'City': 'Coventry', 'Country': 'United Kingdom'}, 'GLO': {'Name': 'Gloucestershire Airport', 'City': 'Golouchestershire', 'Country': 'United Kingdom'}, 'GBA': {'Name': 'Cotswold Airport', 'City': 'Pailton', 'Country': 'United Kingdom'}, 'MAN': {'Name': 'Manchester Airport', 'City': 'Manchester', 'Country': 'United Kingdom'}, 'NQY': {'Name': 'Newquay Cornwall Airport', 'City': 'Newquai', 'Country': 'United Kingdom'}, 'LYE': {'Name': 'RAF Lyneham', 'City': 'Lyneham', 'Country': 'United Kingdom'}, 'YEO': {'Name': 'RNAS Yeovilton', 'City': 'Yeovilton', 'Country': 'United Kingdom'}, 'HAW': {'Name': 'Haverfordwest Airport', 'City': 'Haverfordwest', 'Country': 'United Kingdom'}, 'CWL': {'Name': 'Cardiff International Airport', 'City': 'Cardiff', 'Country': 'United Kingdom'}, 'SWS': {'Name': 'Swansea Airport', 'City': 'Swansea', 'Country': 'United Kingdom'}, 'BRS': {'Name': 'Bristol Airport', 'City': 'Bristol', 'Country': 'United Kingdom'}, 'LPL': {'Name': 'Liverpool John Lennon Airport', 'City': 'Liverpool', 'Country': 'United Kingdom'}, 'LTN': {'Name': 'London Luton Airport', 'City': 'London', 'Country': 'United Kingdom'}, 'PLH': {'Name': 'Plymouth City Airport', 'City': 'Plymouth', 'Country': 'United Kingdom'}, 'BOH': {'Name': 'Bournemouth Airport', 'City': 'Bournemouth', 'Country': 'United Kingdom'}, 'SOU': {'Name': 'Southampton Airport', 'City': 'Southampton', 'Country': 'United Kingdom'}, 'QLA': {'Name': 'Lasham Airport', 'City': 'Lasham', 'Country': 'United Kingdom'}, 'ACI': {'Name': 'Alderney Airport', 'City': 'Alderney', 'Country': 'Guernsey'}, 'GCI': {'Name': 'Guernsey Airport', 'City': 'Guernsey', 'Country': 'Guernsey'}, 'JER': {'Name': 'Jersey Airport', 'City': 'Jersey', 'Country': 'Jersey'}, 'ESH': {'Name': 'Shoreham Airport', 'City': 'Shoreham By Sea', 'Country': 'United Kingdom'}, 'BQH': {'Name': 'London Biggin Hill Airport', 'City': 'Biggin Hill', 'Country': 'United Kingdom'}, 'LGW': {'Name': 'London Gatwick Airport', 'City': 'London', 'Country': 'United Kingdom'}, 'LCY': {'Name': 'London City Airport', 'City': 'London', 'Country': 'United Kingdom'}, 'FAB': {'Name': 'Farnborough Airport', 'City': 'Farnborough', 'Country': 'United Kingdom'}, 'BBS': {'Name': 'Blackbushe Airport', 'City': 'Blackbushe', 'Country': 'United Kingdom'}, 'LHR': {'Name': 'London Heathrow Airport', 'City': 'London', 'Country': 'United Kingdom'}, 'SEN': {'Name': 'Southend Airport', 'City': 'Southend', 'Country': 'United Kingdom'}, 'LYX': {'Name': 'Lydd Airport', 'City': 'Lydd', 'Country': 'United Kingdom'}, 'MSE': {'Name': 'Kent International Airport', 'City': 'Manston', 'Country': 'United Kingdom'}, 'CAX': {'Name': 'Carlisle Airport', 'City': 'Carlisle', 'Country': 'United Kingdom'}, 'BLK': {'Name': 'Blackpool International Airport', 'City': 'Blackpool', 'Country': 'United Kingdom'}, 'HUY': {'Name': 'Humberside Airport', 'City': 'Humberside', 'Country': 'United Kingdom'}, 'BWF': {'Name': 'Barrow Walney Island Airport', 'City': 'Barrow Island', 'Country': 'United Kingdom'}, 'LBA': {'Name': 'Leeds Bradford Airport', 'City': 'Leeds', 'Country': 'United Kingdom'}, 'WRT': {'Name': 'Warton Airport', 'City': 'Warton', 'Country': 'United Kingdom'}, 'CEG': {'Name': 'Hawarden Airport', 'City': 'Hawarden', 'Country': 'United Kingdom'}, 'IOM': {'Name': 'Isle of Man Airport', 'City': 'Isle Of Man', 'Country': 'Isle of Man'}, 'NCL': {'Name': 'Newcastle Airport', 'City': 'Newcastle', 'Country': 'United Kingdom'}, 'MME': {'Name': 'Durham Tees Valley Airport', 'City': 'Teesside', 'Country': 'United Kingdom'}, 'EMA': {'Name': 'East Midlands Airport', 'City': 'East Midlands', 'Country': 'United Kingdom'}, 'KOI': {'Name': 'Kirkwall Airport', 'City': 'Kirkwall', 'Country': 'United Kingdom'}, 'LSI': {'Name': 'Sumburgh Airport', 'City': 'Sumburgh', 'Country': 'United Kingdom'}, 'WIC': {'Name': 'Wick Airport', 'City': 'Wick', 'Country': 'United Kingdom'}, 'ABZ': {'Name': 'Aberdeen Dyce Airport', 'City': 'Aberdeen', 'Country': 'United Kingdom'}, 'INV': {'Name': 'Inverness Airport', 'City': 'Inverness', 'Country': 'United Kingdom'}, 'GLA': {'Name': 'Glasgow International Airport', 'City': 'Glasgow', 'Country': 'United Kingdom'}, 'EDI': {'Name': 'Edinburgh Airport', 'City': 'Edinburgh', 'Country': 'United Kingdom'}, 'ILY': {'Name': 'Islay Airport', 'City': 'Islay', 'Country': 'United Kingdom'}, 'PIK': {'Name': 'Glasgow Prestwick Airport', 'City': 'Prestwick', 'Country': 'United Kingdom'}, 'BEB': {'Name': 'Benbecula Airport', 'City': 'Benbecula', 'Country': 'United Kingdom'}, 'SCS': {'Name': 'Scatsta Airport', 'City': 'Scatsta', 'Country': 'United Kingdom'}, 'DND': {'Name': 'Dundee Airport', 'City': 'Dundee', 'Country': 'United Kingdom'}, 'SYY': {'Name': 'Stornoway Airport', 'City': 'Stornoway', 'Country': 'United Kingdom'}, 'TRE': {'Name': 'Tiree Airport', 'City': 'Tiree', 'Country': 'United Kingdom'}, 'ADX': {'Name': 'RAF Leuchars', 'City': 'Leuchars', 'Country': 'United Kingdom'}, 'LMO': {'Name': 'RAF Lossiemouth', 'City': 'Lossiemouth', 'Country': 'United Kingdom'}, 'CBG': {'Name': 'Cambridge Airport', 'City': 'Cambridge', 'Country': 'United Kingdom'}, 'NWI': {'Name': 'Norwich International Airport', 'City': 'Norwich', 'Country': 'United Kingdom'}, 'STN': {'Name': 'London Stansted Airport', 'City': 'London', 'Country': 'United Kingdom'}, 'EXT': {'Name': 'Exeter International Airport', 'City': 'Exeter', 'Country': 'United Kingdom'}, 'FZO': {'Name': 'Bristol Filton Airport', 'City': 'Bristol', 'Country': 'United Kingdom'}, 'OXF': {'Name': 'Oxford (Kidlington) Airport', 'City': 'Oxford', 'Country': 'United Kingdom'}, 'BEX': {'Name': 'RAF Benson', 'City': 'Benson', 'Country': 'United Kingdom'}, 'LKZ': {'Name': 'RAF Lakenheath', 'City': 'Lakenheath', 'Country': 'United Kingdom'}, 'MHZ': {'Name': 'RAF Mildenhall', 'City': 'Mildenhall', 'Country': 'United Kingdom'}, 'QUY': {'Name': 'RAF Wyton', 'City': 'Wyton', 'Country': 'United Kingdom'}, 'FFD': {'Name': 'RAF Fairford', 'City': 'Fairford', 'Country': 'United Kingdom'}, 'BZZ': {'Name': 'RAF Brize Norton', 'City': 'Brize Norton', 'Country': 'United Kingdom'}, 'ODH': {'Name': 'RAF Odiham', 'City': 'Odiham', 'Country': 'United Kingdom'}, 'NHT': {'Name': 'RAF Northolt', 'City': 'Northolt', 'Country': 'United Kingdom'}, 'QCY': {'Name': 'RAF Coningsby', 'City': 'Coningsby', 'Country': 'United Kingdom'}, 'BEQ': {'Name': 'RAF Honington', 'City': 'Honington', 'Country': 'United Kingdom'}, 'SQZ': {'Name': 'RAF Scampton', 'City': 'Scampton', 'Country': 'United Kingdom'}, 'HRT': {'Name': 'RAF Linton-On-Ouse', 'City': 'Linton-on-ouse', 'Country': 'United Kingdom'}, 'WTN': {'Name': 'RAF Waddington', 'City': 'Waddington', 'Country': 'United Kingdom'}, 'KNF': {'Name': 'RAF Marham', 'City': 'Marham', 'Country': 'United Kingdom'}, 'MPN': {'Name': 'Mount Pleasant Airport', 'City': 'Mount Pleasant', 'Country': 'Falkland Islands'}, 'AMS': {'Name': 'Amsterdam Airport Schiphol', 'City': 'Amsterdam', 'Country': 'Netherlands'}, 'MST': {'Name': 'Maastricht Aachen Airport', 'City': 'Maastricht', 'Country': 'Netherlands'}, 'EIN': {'Name': 'Eindhoven Airport', 'City': 'Eindhoven', 'Country': 'Netherlands'}, 'GRQ': {'Name': 'Eelde Airport', 'City': 'Groningen', 'Country': 'Netherlands'}, 'GLZ': {'Name': 'Gilze Rijen Air Base', 'City': 'Gilze-rijen', 'Country': 'Netherlands'}, 'DHR': {'Name': 'De Kooy Airport', 'City': 'De Kooy', 'Country': 'Netherlands'}, 'LEY': {'Name': 'Lelystad Airport', 'City': 'Lelystad', 'Country': 'Netherlands'}, 'LWR': {'Name': 'Leeuwarden Air Base', 'City': 'Leeuwarden', 'Country': 'Netherlands'}, 'RTM': {'Name': 'Rotterdam The Hague Airport', 'City': 'Rotterdam', 'Country': 'Netherlands'}, 'UTC': {'Name': 'Soesterberg Air Base', 'City': 'Soesterberg', 'Country': 'Netherlands'}, 'ENS': {'Name': 'Twente Airport', 'City': 'Enschede', 'Country': 'Netherlands'}, 'LID': {'Name': 'Valkenburg Naval Air Base', 'City': 'Valkenburg', 'Country': 'Netherlands'}, 'WOE': {'Name': 'Woensdrecht Air Base', 'City': 'Woensdrecht', 'Country': 'Netherlands'}, 'ORK': {'Name': 'Cork Airport', 'City': 'Cork', 'Country': 'Ireland'}, 'GWY': {'Name': 'Galway Airport', 'City': 'Galway', 'Country': 'Ireland'}, 'DUB': {'Name': 'Dublin Airport', 'City': 'Dublin', 'Country': 'Ireland'}, 'NOC': {'Name': 'Ireland West Knock Airport', 'City': 'Connaught', 'Country': 'Ireland'}, 'KIR': {'Name': 'Kerry Airport', 'City': 'Kerry', 'Country': 'Ireland'}, 'SNN': {'Name': 'Shannon Airport', 'City': 'Shannon', 'Country': 'Ireland'}, 'SXL': {'Name': 'Sligo Airport', 'City': 'Sligo', 'Country': 'Ireland'}, 'WAT': {'Name': 'Waterford Airport', 'City': 'Waterford', 'Country': 'Ireland'}, 'AAR': {'Name': 'Aarhus Airport', 'City': 'Aarhus', 'Country': 'Denmark'}, 'BLL': {'Name': 'Billund Airport', 'City': 'Billund', 'Country': 'Denmark'}, 'CPH': {'Name': 'Copenhagen Kastrup Airport', 'City': 'Copenhagen', 'Country': 'Denmark'}, 'EBJ': {'Name': 'Esbjerg Airport', 'City': 'Esbjerg', 'Country': 'Denmark'}, 'KRP': {'Name': 'Karup Airport', 'City': 'Karup', 'Country': 'Denmark'}, 'BYR': {'Name': 'Læsø Airport', 'City': 'Laeso', 'Country': 'Denmark'}, 'MRW': {'Name': 'Lolland Falster Maribo Airport', 'City': 'Maribo', 'Country': 'Denmark'}, 'ODE': {'Name': 'Odense Airport', 'City': 'Odense', 'Country': 'Denmark'}, 'RKE': {'Name': 'Copenhagen Roskilde Airport', 'City': 'Copenhagen', 'Country': 'Denmark'}, 'RNN': {'Name': 'Bornholm Airport', 'City': 'Ronne', 'Country': 'Denmark'}, 'SGD': {'Name': 'Sønderborg Airport', 'City': 'Soenderborg', 'Country': 'Denmark'}, 'SKS': {'Name': 'Skrydstrup Air Base', 'City': 'Skrydstrup', 'Country': 'Denmark'}, 'SQW': {'Name': 'Skive Airport', 'City': 'Skive', 'Country': 'Denmark'}, 'TED': {'Name': 'Thisted Airport', 'City': 'Thisted', 'Country': 'Denmark'}, 'FAE': {'Name': 'Vagar Airport', 'City': 'Vagar', 'Country': 'Faroe Islands'}, 'STA': {'Name': 'Stauning Airport', 'City': 'Stauning', 'Country': 'Denmark'}, 'AAL': {'Name': 'Aalborg Airport', 'City': 'Aalborg', 'Country': 'Denmark'}, 'LUX': {'Name': 'Luxembourg-Findel International Airport', 'City': 'Luxemburg', 'Country': 'Luxembourg'}, 'AES': {'Name': 'Ålesund Airport', 'City': 'Alesund', 'Country': 'Norway'}, 'ANX': {'Name': 'Andøya Airport', 'City': 'Andoya', 'Country': 'Norway'}, 'ALF': {'Name': 'Alta Airport', 'City': 'Alta', 'Country': 'Norway'}, 'BNN': {'Name': 'Brønnøysund Airport', 'City': 'Bronnoysund', 'Country': 'Norway'}, 'BOO': {'Name': 'Bodø Airport', 'City': 'Bodo', 'Country': 'Norway'}, 'BGO': {'Name': 'Bergen Airport Flesland', 'City': 'Bergen', 'Country': 'Norway'}, 'BJF': {'Name': 'Båtsfjord Airport', 'City': 'Batsfjord', 'Country': 'Norway'}, 'KRS': {'Name': 'Kristiansand Airport', 'City': 'Kristiansand', 'Country': 'Norway'}, 'DLD': {'Name': 'Geilo Airport Dagali', 'City': 'Geilo', 'Country': 'Norway'}, 'BDU': {'Name': 'Bardufoss Airport', 'City': 'Bardufoss', 'Country': 'Norway'}, 'EVE': {'Name': 'Harstad/Narvik Airport, Evenes', 'City': 'Harstad/Narvik', 'Country': 'Norway'}, 'VDB': {'Name': 'Leirin Airport', 'City': 'Fagernes', 'Country': 'Norway'}, 'FRO': {'Name': 'Florø Airport', 'City': 'Floro', 'Country': 'Norway'}, 'OSL': {'Name': 'Oslo Lufthavn', 'City': 'Oslo', 'Country': 'Norway'}, 'HAU': {'Name': 'Haugesund Airport', 'City': 'Haugesund', 'Country': 'Norway'}, 'HAA': {'Name': 'Hasvik Airport', 'City': 'Hasvik', 'Country': 'Norway'}, 'KSU': {'Name': 'Kristiansund Airport (Kvernberget)', 'City': 'Kristiansund', 'Country': 'Norway'}, 'KKN': {'Name': 'Kirkenes Airport (Høybuktmoen)', 'City': 'Kirkenes', 'Country': 'Norway'}, 'FAN': {'Name': 'Lista Airport', 'City': 'Farsund', 'Country': 'Norway'}, 'MOL': {'Name': 'Molde Airport', 'City': 'Molde', 'Country': 'Norway'}, 'MJF': {'Name': 'Mosjøen Airport (Kjærstad)', 'City': 'Mosjoen', 'Country': 'Norway'}, 'LKL': {'Name': 'Banak Airport', 'City': 'Lakselv', 'Country': 'Norway'}, 'NTB': {'Name': 'Notodden Airport', 'City': 'Notodden', 'Country': 'Norway'}, 'OLA': {'Name': 'Ørland Airport', 'City': 'Orland', 'Country': 'Norway'}, 'RRS': {'Name': 'Røros Airport', 'City': 'Roros', 'Country': 'Norway'}, 'RYG': {'Name': 'Moss Airport, Rygge', 'City': 'Rygge', 'Country': 'Norway'}, 'LYR': {'Name': 'Svalbard Airport, Longyear', 'City': 'Svalbard', 'Country': 'Norway'}, 'SKE': {'Name': 'Skien Airport', 'City': 'Skien', 'Country': 'Norway'}, 'SRP': {'Name': 'Stord Airport', 'City': 'Stord', 'Country': 'Norway'}, 'SSJ': {'Name': 'Sandnessjøen Airport (Stokka)', 'City': 'Sandnessjoen', 'Country': 'Norway'}, 'TOS': {'Name': 'Tromsø Airport,', 'City': 'Tromso', 'Country': 'Norway'}, 'TRF': {'Name': 'Sandefjord Airport, Torp', 'City': 'Sandefjord', 'Country': 'Norway'}, 'TRD': {'Name': 'Trondheim Airport Værnes', 'City': 'Trondheim', 'Country': 'Norway'}, 'SVG': {'Name': 'Stavanger Airport Sola', 'City': 'Stavanger', 'Country': 'Norway'}, 'GDN': {'Name': 'Gdańsk Lech Wałęsa Airport', 'City': 'Gdansk', 'Country': 'Poland'}, 'KRK': {'Name': 'Kraków John Paul II International Airport', 'City': 'Krakow', 'Country': 'Poland'}, 'KTW': {'Name': 'Katowice International Airport', 'City': 'Katowice', 'Country': 'Poland'}, 'POZ': {'Name': 'Poznań-Ławica Airport', 'City': 'Poznan', 'Country': 'Poland'}, 'RZE': {'Name': 'Rzeszów-Jasionka Airport', 'City': 'Rzeszow', 'Country': 'Poland'}, 'SZZ': {'Name': 'Szczecin-Goleniów "Solidarność" Airport', 'City': 'Szczecin', 'Country': 'Poland'}, 'OSP': {'Name': 'Redzikowo Air Base', 'City': 'Slupsk', 'Country': 'Poland'}, 'WAW': {'Name': 'Warsaw Chopin Airport', 'City': 'Warsaw', 'Country': 'Poland'}, 'WRO': {'Name': 'Copernicus Wrocław Airport', 'City': 'Wroclaw', 'Country': 'Poland'}, 'IEG': {'Name': 'Zielona Góra-Babimost Airport', 'City': 'Zielona Gora', 'Country': 'Poland'}, 'RNB': {'Name': 'Ronneby Airport', 'City': 'Ronneby', 'Country': 'Sweden'}, 'GOT': {'Name': 'Gothenburg-Landvetter Airport', 'City': 'Gothenborg', 'Country': 'Sweden'}, 'JKG': {'Name': 'Jönköping Airport', 'City': 'Joenkoeping', 'Country': 'Sweden'}, 'LDK': {'Name': 'Lidköping-Hovby Airport', 'City': 'Lidkoping', 'Country': 'Sweden'}, 'GSE': {'Name': 'Gothenburg City Airport', 'City': 'Gothenborg', 'Country': 'Sweden'}, 'KVB': {'Name': 'Skövde Airport', 'City': 'Skovde', 'Country': 'Sweden'}, 'THN': {'Name': 'Trollhättan-Vänersborg Airport', 'City': 'Trollhattan', 'Country': 'Sweden'}, 'KSK': {'Name': 'Karlskoga Airport', 'City': 'Karlskoga', 'Country': 'Sweden'}, 'MXX': {'Name': 'Mora Airport', 'City': 'Mora', 'Country': 'Sweden'}, 'NYO': {'Name': 'Stockholm Skavsta Airport', 'City': 'Stockholm', 'Country': 'Sweden'}, 'KID': {'Name': 'Kristianstad Airport', 'City': 'Kristianstad', 'Country': 'Sweden'}, 'OSK': {'Name': 'Oskarshamn Airport', 'City': 'Oskarshamn', 'Country': 'Sweden'}, 'KLR': {'Name': 'Kalmar Airport', 'City': 'Kalkmar', 'Country': 'Sweden'}, 'MMX': {'Name': 'Malmö Sturup Airport', 'City': 'Malmoe', 'Country': 'Sweden'}, 'HAD': {'Name': 'Halmstad Airport', 'City': 'Halmstad', 'Country': 'Sweden'}, 'VXO': {'Name': 'Växjö Kronoberg Airport', 'City': 'Vaxjo', 'Country': 'Sweden'}, 'EVG': {'Name': 'Sveg Airport', 'City': 'Sveg', 'Country': 'Sweden'}, 'GEV': {'Name': 'Gällivare Airport', 'City': 'Gallivare', 'Country': 'Sweden'}, 'HUV': {'Name': 'Hudiksvall Airport', 'City': 'Hudiksvall', 'Country': 'Sweden'}, 'KRF': {'Name': 'Kramfors Sollefteå Airport', 'City': 'Kramfors', 'Country': 'Sweden'}, 'LYC': {'Name': 'Lycksele Airport', 'City': 'Lycksele', 'Country': 'Sweden'}, 'SDL': {'Name': 'Sundsvall-Härnösand Airport', 'City': 'Sundsvall', 'Country': 'Sweden'}, 'OER': {'Name': 'Örnsköldsvik Airport', 'City': 'Ornskoldsvik', 'Country': 'Sweden'}, 'KRN': {'Name': 'Kiruna Airport', 'City': 'Kiruna', 'Country': 'Sweden'}, 'SFT': {'Name': 'Skellefteå Airport', 'City': 'Skelleftea', 'Country': 'Sweden'}, 'UME': {'Name': 'Umeå Airport', 'City': 'Umea', 'Country': 'Sweden'}, 'VHM': {'Name': 'Vilhelmina Airport', 'City': 'Vilhelmina', 'Country': 'Sweden'}, 'AJR': {'Name': 'Arvidsjaur Airport', 'City': 'Arvidsjaur', 'Country': 'Sweden'}, 'ORB': {'Name': 'Örebro Airport', 'City': 'Orebro', 'Country': 'Sweden'}, 'VST': {'Name': 'Stockholm Västerås Airport', 'City': 'Vasteras', 'Country': 'Sweden'}, 'LLA': {'Name': 'Luleå Airport', 'City': 'Lulea', 'Country': 'Sweden'}, 'ARN': {'Name': 'Stockholm-Arlanda Airport', 'City': 'Stockholm', 'Country': 'Sweden'}, 'BMA': {'Name': 'Stockholm-Bromma Airport', 'City': 'Stockholm', 'Country': 'Sweden'}, 'BLE': {'Name': 'Borlange Airport', 'City': 'Borlange', 'Country': 'Sweden'}, 'HLF': {'Name': 'Hultsfred Airport', 'City': 'Hultsfred', 'Country': 'Sweden'}, 'GVX': {'Name': 'Gävle Sandviken Airport', 'City': 'Gavle', 'Country': 'Sweden'}, 'LPI': {'Name': 'Linköping City Airport', 'City': 'Linkoeping', 'Country': 'Sweden'}, 'NRK': {'Name': 'Norrköping Airport', 'City': 'Norrkoeping', 'Country': 'Sweden'}, 'EKT': {'Name': 'Eskilstuna Airport', 'City': 'Eskilstuna', 'Country': 'Sweden'}, 'VBY': {'Name': 'Visby Airport', 'City': 'Visby', 'Country': 'Sweden'}, 'SPM': {'Name': 'Spangdahlem Air Base', 'City': 'Spangdahlem', 'Country': 'Germany'}, 'RMS': {'Name': 'Ramstein Air Base', 'City': 'Ramstein', 'Country': 'Germany'}, 'GHF': {'Name': '[Duplicate] Giebelstadt Army Air Field', 'City': 'Giebelstadt', 'Country': 'Germany'}, 'ZCN': {'Name': 'Celle Airport', 'City': 'Celle', 'Country': 'Germany'}, 'FRZ': {'Name': 'Fritzlar Airport', 'City': 'Fritzlar', 'Country': 'Germany'}, 'ZNF': {'Name': 'Hanau Army Air Field', 'City': 'Hanau', 'Country': 'Germany'}, 'KZG': {'Name': 'Flugplatz Kitzingen', 'City': 'Kitzingen', 'Country': 'Germany'}, 'FCN': {'Name': 'Nordholz Naval Airbase', 'City': 'Nordholz', 'Country': 'Germany'}, 'GKE': {'Name': 'Geilenkirchen Air Base', 'City': 'Geilenkirchen', 'Country': 'Germany'}, 'RLG': {'Name': 'Rostock-Laage Airport', 'City': 'Laage', 'Country': 'Germany'}, 'WBG': {'Name': 'Schleswig Air Base', 'City': 'Schleswig', 'Country': 'Germany'}, 'WIE': {'Name': 'Wiesbaden Army Airfield', 'City': 'Wiesbaden', 'Country': 'Germany'}, 'FEL': {'Name': 'Fürstenfeldbruck Air Base', 'City': 'Fuerstenfeldbruck', 'Country': 'Germany'}, 'IGS': {'Name': 'Ingolstadt Manching Airport', 'City': 'Ingolstadt', 'Country': 'Germany'}, 'GUT': {'Name': 'Gütersloh Air Base', 'City': 'Guetersloh', 'Country': 'Germany'}, 'ALJ': {'Name': 'Alexander Bay Airport', 'City': 'Alexander Bay', 'Country': 'South Africa'}, 'AGZ': {'Name': 'Aggeneys Airport', 'City': 'Aggeneys', 'Country': 'South Africa'}, 'BIY': {'Name': 'Bisho Airport', 'City': 'Bisho', 'Country': 'South Africa'}, 'BFN': {'Name': 'Bram Fischer International Airport', 'City': 'Bloemfontein', 'Country': 'South Africa'}, 'CPT': {'Name': 'Cape Town International Airport', 'City': 'Cape Town', 'Country': 'South Africa'}, 'DUR': {'Name': 'King Shaka International Airport', 'City': 'Durban', 'Country': 'South Africa'}, 'ELS': {'Name': 'Ben Schoeman Airport', 'City': 'East London', 'Country': 'South Africa'}, 'FCB': {'Name': 'Ficksburg Sentraoes Airport', 'City': 'Ficksburg', 'Country': 'South Africa'}, 'GCJ': {'Name': 'Grand Central Airport', 'City': 'Johannesburg', 'Country': 'South Africa'}, 'GRJ': {'Name': 'George Airport', 'City': 'George', 'Country': 'South Africa'}, 'HRS': {'Name': 'Harrismith Airport', 'City': 'Harrismith', 'Country': 'South Africa'}, 'HDS': {'Name': 'Hoedspruit Air Force Base Airport', 'City': 'Hoedspruit', 'Country': 'South Africa'}, 'JNB': {'Name': 'OR Tambo International Airport', 'City': 'Johannesburg', 'Country': 'South Africa'}, 'KXE': {'Name': 'P C Pelser Airport', 'City': 'Klerksdorp', 'Country': 'South Africa'}, 'KIM': {'Name': 'Kimberley Airport', 'City': 'Kimberley', 'Country': 'South Africa'}, 'KMH': {'Name': 'Johan Pienaar Airport', 'City': 'Kuruman', 'Country': 'South Africa'}, 'KLZ': {'Name': 'Kleinsee Airport', 'City': 'Kleinsee', 'Country': 'South Africa'}, 'HLA': {'Name': 'Lanseria Airport', 'City': 'Johannesburg', 'Country': 'South Africa'}, 'SDB': {'Name': 'Langebaanweg Airport', 'City': 'Langebaanweg', 'Country': 'South Africa'}, 'LAY': {'Name': 'Ladysmith Airport', 'City': 'Ladysmith', 'Country': 'South Africa'}, 'MGH': {'Name': 'Margate Airport', 'City': 'Margate', 'Country': 'South Africa'}, 'LLE': {'Name': 'Riverside Airport', 'City': 'Malalane', 'Country': 'South Africa'}, 'MZQ': {'Name': 'Mkuze Airport', 'City': 'Mkuze', 'Country': 'South Africa'}, 'NCS': {'Name': 'Newcastle Airport', 'City': 'Newcastle', 'Country': 'South Africa'}, 'OVG': {'Name': 'Overberg Airport', 'City': 'Overberg', 'Country': 'South Africa'}, 'OUH': {'Name': 'Oudtshoorn Airport', 'City': 'Oudtshoorn', 'Country': 'South Africa'}, 'PLZ': {'Name': 'Port Elizabeth Airport', 'City': 'Port Elizabeth', 'Country': 'South Africa'}, 'PBZ': {'Name': 'Plettenberg Bay Airport', 'City': 'Plettenberg Bay', 'Country': 'South Africa'}, 'PHW': {'Name': 'Hendrik Van Eck Airport', 'City': 'Phalaborwa', 'Country': 'South Africa'}, 'JOH': {'Name': 'Port St Johns Airport', 'City': 'Port Saint Johns', 'Country': 'South Africa'}, 'PZB': {'Name': 'Pietermaritzburg Airport', 'City': 'Pietermaritzburg', 'Country': 'South Africa'}, 'NTY': {'Name': 'Pilanesberg International Airport', 'City': 'Pilanesberg', 'Country': 'South Africa'}, 'PTG': {'Name': 'Polokwane International Airport', 'City': 'Potgietersrus', 'Country': 'South Africa'}, 'PCF': {'Name': 'Potchefstroom Airport', 'City': 'Potchefstroom', 'Country': 'South Africa'}, 'UTW': {'Name': 'Queenstown Airport', 'City': 'Queenstown', 'Country': 'South Africa'}, 'RCB': {'Name': 'Richards Bay Airport', 'City': "Richard's Bay", 'Country': 'South Africa'}, 'ROD': {'Name': 'Robertson Airport', 'City': 'Robertson', 'Country': 'South Africa'}, 'SBU': {'Name': 'Springbok Airport', 'City': 'Springbok', 'Country': 'South Africa'}, 'ZEC': {'Name': 'Secunda Airport', 'City': 'Secunda', 'Country': 'South Africa'}, 'SIS': {'Name': 'Sishen Airport', 'City': 'Sishen', 'Country': 'South Africa'}, 'SZK': {'Name': 'Skukuza Airport', 'City': 'Skukuza', 'Country': 'South Africa'}, 'LTA': {'Name': 'Tzaneen Airport', 'City': 'Tzaneen', 'Country': 'South Africa'}, 'ULD': {'Name': 'Prince Mangosuthu Buthelezi Airport', 'City': 'Ulundi', 'Country': 'South Africa'}, 'UTN': {'Name': 'Pierre Van Ryneveld Airport', 'City': 'Upington', 'Country': 'South Africa'}, 'UTT': {'Name': 'K. D. Matanzima Airport', 'City': 'Umtata', 'Country': 'South Africa'}, 'VRU': {'Name': 'Vryburg Airport', 'City': 'Vryburg', 'Country': 'South Africa'}, 'VIR': {'Name': 'Virginia Airport', 'City': 'Durban', 'Country': 'South Africa'}, 'VRE': {'Name': 'Vredendal Airport', 'City': 'Vredendal', 'Country': 'South Africa'}, 'PRY': {'Name': 'Wonderboom Airport', 'City': 'Pretoria', 'Country': 'South Africa'}, 'WKF': {'Name': 'Waterkloof Air Force Base', 'City': 'Waterkloof', 'Country': 'South Africa'}, 'FRW': {'Name': 'Francistown Airport', 'City': 'Francistown', 'Country': 'Botswana'}, 'JWA': {'Name': 'Jwaneng Airport', 'City': 'Jwaneng', 'Country': 'Botswana'}, 'BBK': {'Name': 'Kasane Airport', 'City': 'Kasane', 'Country': 'Botswana'}, 'MUB': {'Name': 'Maun Airport', 'City': 'Maun', 'Country': 'Botswana'}, 'GBE': {'Name': 'Sir Seretse Khama International Airport', 'City': 'Gaberone', 'Country': 'Botswana'}, 'PKW': {'Name': 'Selebi Phikwe Airport', 'City': 'Selebi-phikwe', 'Country': 'Botswana'}, 'BZV': {'Name': 'Maya-Maya Airport', 'City': 'Brazzaville', 'Country': 'Congo (Brazzaville)'}, 'FTX': {'Name': 'Owando Airport', 'City': 'Owando', 'Country': 'Congo (Kinshasa)'}, 'OUE': {'Name': 'Ouesso Airport', 'City': 'Ouesso', 'Country': 'Congo (Kinshasa)'}, 'PNR': {'Name': 'Pointe Noire Airport', 'City': 'Pointe-noire', 'Country': 'Congo (Brazzaville)'}, 'MTS': {'Name': 'Matsapha Airport', 'City': 'Manzini', 'Country': 'Swaziland'}, 'BGF': {'Name': "Bangui M'Poko International Airport", 'City': 'Bangui', 'Country': 'Central African Republic'}, 'BBT': {'Name': 'Berbérati Airport', 'City': 'Berberati', 'Country': 'Central African Republic'}, 'BSG': {'Name': 'Bata Airport', 'City': 'Bata', 'Country': 'Equatorial Guinea'}, 'SSG': {'Name': 'Malabo Airport', 'City': 'Malabo', 'Country': 'Equatorial Guinea'}, 'ASI': {'Name': 'RAF Ascension Island', 'City': 'Wide Awake', 'Country': 'Saint Helena'}, 'MRU': {'Name': 'Sir Seewoosagur Ramgoolam International Airport', 'City': 'Plaisance', 'Country': 'Mauritius'}, 'RRG': {'Name': 'Sir Charles Gaetan Duval Airport', 'City': 'Rodriguez Island', 'Country': 'Mauritius'}, 'NKW': {'Name': 'Diego Garcia Naval Support Facility', 'City': 'Diego Garcia Island', 'Country': 'British Indian Ocean Territory'}, 'TKC': {'Name': 'Tiko Airport', 'City': 'Tiko', 'Country': 'Cameroon'}, 'DLA': {'Name': 'Douala International Airport', 'City': 'Douala', 'Country': 'Cameroon'}, 'MVR': {'Name': 'Salak Airport', 'City': 'Maroua', 'Country': 'Cameroon'}, 'FOM': {'Name': 'Foumban Nkounja Airport', 'City': 'Foumban', 'Country': 'Cameroon'}, 'NGE': {'Name': "N'Gaoundéré Airport", 'City': "N'gaoundere", 'Country': 'Cameroon'}, 'GOU': {'Name': 'Garoua International Airport', 'City': 'Garoua', 'Country': 'Cameroon'}, 'BFX': {'Name': 'Bafoussam Airport', 'City': 'Bafoussam', 'Country': 'Cameroon'}, 'BPC': {'Name': 'Bamenda Airport', 'City': 'Bamenda', 'Country': 'Cameroon'}, 'YAO': {'Name': 'Yaoundé Airport', 'City': 'Yaounde', 'Country': 'Cameroon'}, 'CGJ': {'Name': 'Kasompe Airport', 'City': 'Kasompe', 'Country': 'Zambia'}, 'LVI': {'Name': 'Livingstone Airport', 'City': 'Livingstone', 'Country': 'Zambia'}, 'LUN': {'Name': 'Kenneth Kaunda International Airport Lusaka', 'City': 'Lusaka', 'Country': 'Zambia'}, 'MFU': {'Name': 'Mfuwe Airport', 'City': 'Mfuwe', 'Country': 'Zambia'}, 'MNR': {'Name': 'Mongu Airport', 'City': 'Mongu', 'Country': 'Zambia'}, 'NLA': {'Name': 'Simon Mwansa Kapwepwe International Airport', 'City': 'Ndola', 'Country': 'Zambia'}, 'KIW': {'Name': 'Southdowns Airport', 'City': 'Southdowns', 'Country': 'Zambia'}, 'HAH': {'Name': 'Prince Said Ibrahim International Airport', 'City': 'Moroni', 'Country': 'Comoros'}, 'NWA': {'Name': 'Mohéli Bandar Es Eslam Airport', 'City': 'Moheli', 'Country': 'Comoros'}, 'AJN': {'Name': 'Ouani Airport', 'City': 'Anjouan', 'Country': 'Comoros'}, 'DZA': {'Name': 'Dzaoudzi Pamandzi International Airport', 'City': 'Dzaoudzi', 'Country': 'Mayotte'}, 'RUN': {'Name': 'Roland Garros Airport', 'City': 'St.-denis', 'Country': 'Reunion'}, 'ZSE': {'Name': 'Pierrefonds Airport', 'City': 'St.-pierre', 'Country': 'Reunion'}, 'TNR': {'Name': 'Ivato Airport', 'City': 'Antananarivo', 'Country': 'Madagascar'}, 'ZVA': {'Name': 'Miandrivazo Airport', 'City': 'Miandrivazo', 'Country': 'Madagascar'}, 'SMS': {'Name': 'Sainte Marie Airport', 'City': 'Sainte Marie', 'Country': 'Madagascar'}, 'TMM': {'Name': 'Toamasina Airport', 'City': 'Toamasina', 'Country': 'Madagascar'}, 'MOQ': {'Name': 'Morondava Airport', 'City': 'Morondava', 'Country': 'Madagascar'}, 'DIE': {'Name': 'Arrachart Airport', 'City': 'Antsiranana', 'Country': 'Madagascar'}, 'WMR': {'Name': 'Mananara Nord Airport', 'City': 'Mananara', 'Country': 'Madagascar'}, 'ZWA': {'Name': 'Andapa Airport', 'City': 'Andapa', 'Country': 'Madagascar'}, 'AMB': {'Name': 'Ambilobe Airport', 'City': 'Ambilobe', 'Country': 'Madagascar'}, 'ANM': {'Name': 'Antsirabato Airport', 'City': 'Antalaha', 'Country': 'Madagascar'}, 'HVA': {'Name': 'Analalava Airport', 'City': 'Analalava', 'Country': 'Madagascar'}, 'MJN': {'Name': 'Amborovy Airport', 'City': 'Mahajanga', 'Country': 'Madagascar'}, 'NOS': {'Name': 'Fascene Airport', 'City': 'Nosy-be', 'Country': 'Madagascar'}, 'BPY': {'Name': 'Besalampy Airport', 'City': 'Besalampy', 'Country': 'Madagascar'}, 'WMN': {'Name': 'Maroantsetra Airport', 'City': 'Maroantsetra', 'Country': 'Madagascar'}, 'SVB': {'Name': 'Sambava Airport', 'City': 'Sambava', 'Country': 'Madagascar'}, 'VOH': {'Name': 'Vohimarina Airport', 'City': 'Vohemar', 'Country': 'Madagascar'}, 'WAI': {'Name': 'Ambalabe Airport', 'City': 'Antsohihy', 'Country': 'Madagascar'}, 'IVA': {'Name': 'Ampampamena Airport', 'City': 'Ampampamena', 'Country': 'Madagascar'}, 'FTU': {'Name': 'Tôlanaro Airport', 'City': 'Tolagnaro', 'Country': 'Madagascar'}, 'WFI': {'Name': 'Fianarantsoa Airport', 'City': 'Fianarantsoa', 'Country': 'Madagascar'}, 'RVA': {'Name': 'Farafangana Airport', 'City': 'Farafangana', 'Country': 'Madagascar'}, 'WVK': {'Name': 'Manakara Airport', 'City': 'Manakara', 'Country': 'Madagascar'}, 'MNJ': {'Name': 'Mananjary Airport', 'City': 'Mananjary', 'Country': 'Madagascar'}, 'MXM': {'Name': 'Morombe Airport', 'City': 'Morombe', 'Country': 'Madagascar'}, 'TLE': {'Name': 'Toliara Airport', 'City': 'Toliara', 'Country': 'Madagascar'}, 'SSY': {'Name': 'Mbanza Congo Airport', 'City': "M'banza-congo", 'Country': 'Angola'}, 'BUG': {'Name': 'Benguela Airport', 'City': 'Benguela', 'Country': 'Angola'}, 'CAB': {'Name': 'Cabinda Airport', 'City': 'Cabinda', 'Country': 'Angola'}, 'NOV': {'Name': 'Nova Lisboa Airport', 'City': 'Huambo', 'Country': 'Angola'}, 'SVP': {'Name': 'Kuito Airport', 'City': 'Kuito', 'Country': 'Angola'}, 'LAD': {'Name': 'Quatro de Fevereiro Airport', 'City': 'Luanda', 'Country': 'Angola'}, 'MEG': {'Name': 'Malanje Airport', 'City': 'Malanje', 'Country': 'Angola'}, 'SPP': {'Name': 'Menongue Airport', 'City': 'Menongue', 'Country': 'Angola'}, 'GXG': {'Name': 'Negage Airport', 'City': 'Negage', 'Country': 'Angola'}, 'PBN': {'Name': 'Porto Amboim Airport', 'City': 'Porto Amboim', 'Country': 'Angola'}, 'VHC': {'Name': 'Saurimo Airport', 'City': 'Saurimo', 'Country': 'Angola'}, 'SZA': {'Name': 'Soyo Airport', 'City': 'Soyo', 'Country': 'Angola'}, 'SDD': {'Name': 'Lubango Airport', 'City': 'Lubango', 'Country': 'Angola'}, 'LUO': {'Name': 'Luena Airport', 'City': 'Luena', 'Country': 'Angola'}, 'UGO': {'Name': 'Uige Airport', 'City': 'Uige', 'Country': 'Angola'}, 'XGN': {'Name': 'Xangongo Airport', 'City': 'Xangongo', 'Country': 'Angola'}, 'OYE': {'Name': 'Oyem Airport', 'City': 'Oyem', 'Country': 'Gabon'}, 'OKN': {'Name': 'Okondja Airport', 'City': 'Okondja', 'Country': 'Gabon'}, 'LBQ': {'Name': 'Lambarene Airport', 'City': 'Lambarene', 'Country': 'Gabon'}, 'BMM': {'Name': 'Bitam Airport', 'City': 'Bitam', 'Country': 'Gabon'}, 'POG': {'Name': 'Port Gentil Airport', 'City': 'Port Gentil', 'Country': 'Gabon'}, 'OMB': {'Name': 'Omboue Hopital Airport', 'City': 'Omboue Hospial', 'Country': 'Gabon'}, 'MKU': {'Name': 'Makokou Airport', 'City': 'Makokou', 'Country': 'Gabon'}, 'LBV': {'Name': "Libreville Leon M'ba International Airport", 'City': 'Libreville', 'Country': 'Gabon'}, 'MVB': {'Name': "M'Vengue El Hadj Omar Bongo Ondimba International Airport", 'City': 'Franceville', 'Country': 'Gabon'}, 'PCP': {'Name': 'Principe Airport', 'City': 'Principe', 'Country': 'Sao Tome and Principe'}, 'TMS': {'Name': 'São Tomé International Airport', 'City': 'Sao Tome', 'Country': 'Sao Tome and Principe'}, 'BEW': {'Name': 'Beira Airport', 'City': 'Beira', 'Country': 'Mozambique'}, 'INH': {'Name': 'Inhambane Airport', 'City': 'Inhambane', 'Country': 'Mozambique'}, 'VXC': {'Name': 'Lichinga Airport', 'City': 'Lichinga', 'Country': 'Mozambique'}, 'LFB': {'Name': 'Lumbo Airport', 'City': 'Lumbo', 'Country': 'Mozambique'}, 'MPM': {'Name': 'Maputo Airport', 'City': 'Maputo', 'Country': 'Mozambique'}, 'MUD': {'Name': 'Mueda Airport', 'City': 'Mueda', 'Country': 'Mozambique'}, 'MZB': {'Name': 'Mocímboa da Praia Airport', 'City': 'Mocimboa Da Praia', 'Country': 'Mozambique'}, 'MNC': {'Name': 'Nacala Airport', 'City': 'Nacala', 'Country': 'Mozambique'}, 'APL': {'Name': 'Nampula Airport', 'City': 'Nampula', 'Country': 'Mozambique'}, 'POL': {'Name': 'Pemba Airport', 'City': 'Pemba', 'Country': 'Mozambique'}, 'UEL': {'Name': 'Quelimane Airport', 'City': 'Quelimane', 'Country': 'Mozambique'}, 'TET': {'Name': 'Chingozi Airport', 'City': 'Tete', 'Country': 'Mozambique'}, 'VNX': {'Name': 'Vilankulo Airport', 'City': 'Vilankulu', 'Country': 'Mozambique'}, 'DES': {'Name': 'Desroches Airport', 'City': 'Desroches', 'Country': 'Seychelles'}, 'SEZ': {'Name': 'Seychelles International Airport', 'City': 'Mahe', 'Country': 'Seychelles'}, 'PRI': {'Name': 'Praslin Airport', 'City': 'Praslin', 'Country': 'Seychelles'}, 'AEH': {'Name': 'Abeche Airport', 'City': 'Abeche', 'Country': 'Chad'}, 'MQQ': {'Name': 'Moundou Airport', 'City': 'Moundou', 'Country': 'Chad'}, 'NDJ': {'Name': "N'Djamena International Airport", 'City': "N'djamena", 'Country': 'Chad'}, 'FYT': {'Name': 'Faya Largeau Airport', 'City': 'Faya-largeau', 'Country': 'Chad'}, 'BUQ': {'Name': 'Joshua Mqabuko Nkomo International Airport', 'City': 'Bulawayo', 'Country': 'Zimbabwe'}, 'BFO': {'Name': 'Buffalo Range Airport', 'City': 'Chiredzi', 'Country': 'Zimbabwe'}, 'VFA': {'Name': 'Victoria Falls International Airport', 'City': 'Victoria Falls', 'Country': 'Zimbabwe'}, 'HRE': {'Name': 'Robert Gabriel Mugabe International Airport', 'City': 'Harare', 'Country': 'Zimbabwe'}, 'KAB': {'Name': 'Kariba International Airport', 'City': 'Kariba', 'Country': 'Zimbabwe'}, 'UTA': {'Name': 'Mutare Airport', 'City': 'Mutare', 'Country': 'Zimbabwe'}, 'MVZ': {'Name': 'Masvingo International Airport', 'City': 'Masvingo', 'Country': 'Zimbabwe'}, 'GWE': {'Name': 'Thornhill Air Base', 'City': 'Gwert', 'Country': 'Zimbabwe'}, 'HWN': {'Name': 'Hwange National Park Airport', 'City': 'Hwange National Park', 'Country': 'Zimbabwe'}, 'BLZ': {'Name': 'Chileka International Airport', 'City': 'Blantyre', 'Country': 'Malawi'}, 'KGJ': {'Name': 'Karonga Airport', 'City': 'Karonga', 'Country': 'Malawi'}, 'KBQ': {'Name': 'Kasungu Airport', 'City': 'Kasungu', 'Country': 'Malawi'}, 'LLW': {'Name': 'Lilongwe International Airport', 'City': 'Lilongwe', 'Country': 'Malawi'}, 'ZZU': {'Name': 'Mzuzu Airport', 'City': 'Mzuzu', 'Country': 'Malawi'}, 'MSU': {'Name': 'Moshoeshoe I International Airport', 'City': 'Maseru', 'Country': 'Lesotho'}, 'FIH': {'Name': 'Ndjili International Airport', 'City': 'Kinshasa', 'Country': 'Congo (Kinshasa)'}, 'NLO': {'Name': 'Ndolo Airport', 'City': 'Kinshasa', 'Country': 'Congo (Kinshasa)'}, 'MNB': {'Name': 'Muanda Airport', 'City': 'Muanda', 'Country': 'Congo (Kinshasa)'}, 'FDU': {'Name': 'Bandundu Airport', 'City': 'Bandoundu', 'Country': 'Congo (Kinshasa)'}, 'KKW': {'Name': 'Kikwit Airport', 'City': 'Kikwit', 'Country': 'Congo (Kinshasa)'}, 'MDK': {'Name': 'Mbandaka Airport', 'City': 'Mbandaka', 'Country': 'Congo (Kinshasa)'}, 'BDT': {'Name': 'Gbadolite Airport', 'City': 'Gbadolite', 'Country': 'Congo (Kinshasa)'}, 'GMA': {'Name': 'Gemena Airport', 'City': 'Gemena', 'Country': 'Congo (Kinshasa)'}, 'KLI': {'Name': 'Kotakoli Airport', 'City': 'Kotakoli', 'Country': 'Congo (Kinshasa)'}, 'LIQ': {'Name': 'Lisala Airport', 'City': 'Lisala', 'Country': 'Congo (Kinshasa)'}, 'FKI': {'Name': 'Bangoka International Airport', 'City': 'Kisangani', 'Country': 'Congo (Kinshasa)'}, 'IRP': {'Name': 'Matari Airport', 'City': 'Isiro', 'Country': 'Congo (Kinshasa)'}, 'BUX': {'Name': 'Bunia Airport', 'City': 'Bunia', 'Country': 'Congo (Kinshasa)'}, 'BZU': {'Name': 'Buta Zega Airport', 'City': 'Buta Zega', 'Country': 'Congo (Kinshasa)'}, 'BKY': {'Name': 'Bukavu Kavumu Airport', 'City': 'Bukavu/kavumu', 'Country': 'Congo (Kinshasa)'}, 'GOM': {'Name': 'Goma International Airport', 'City': 'Goma', 'Country': 'Congo (Kinshasa)'}, 'KND': {'Name': 'Kindu Airport', 'City': 'Kindu', 'Country': 'Congo (Kinshasa)'}, 'FBM': {'Name': 'Lubumbashi International Airport', 'City': 'Lubumashi', 'Country': 'Congo (Kinshasa)'}, 'KWZ': {'Name': 'Kolwezi Airport', 'City': 'Kolwezi', 'Country': 'Congo (Kinshasa)'}, 'FMI': {'Name': 'Kalemie Airport', 'City': 'Kalemie', 'Country': 'Congo (Kinshasa)'}, 'KMN': {'Name': 'Kamina Base Airport', 'City': 'Kamina Base', 'Country': 'Congo (Kinshasa)'}, 'KGA': {'Name': 'Kananga Airport', 'City': 'Kananga', 'Country': 'Congo (Kinshasa)'}, 'MJM': {'Name': 'Mbuji Mayi Airport', 'City': 'Mbuji-mayi', 'Country': 'Congo (Kinshasa)'}, 'BKO': {'Name': 'Modibo Keita International Airport', 'City': 'Bamako', 'Country': 'Mali'}, 'GAQ': {'Name': 'Gao Airport', 'City': 'Gao', 'Country': 'Mali'}, 'KYS': {'Name': 'Kayes Dag Dag Airport', 'City': 'Kayes', 'Country': 'Mali'}, 'MZI': {'Name': 'Mopti Airport', 'City': 'Mopti', 'Country': 'Mali'}, 'TOM': {'Name': 'Timbuktu Airport', 'City': 'Tombouctou', 'Country': 'Mali'}, 'BJL': {'Name': 'Banjul International Airport', 'City': 'Banjul', 'Country': 'Gambia'}, 'FUE': {'Name': 'Fuerteventura Airport', 'City': 'Fuerteventura', 'Country': 'Spain'}, 'VDE': {'Name': 'Hierro Airport', 'City': 'Hierro', 'Country': 'Spain'}, 'SPC': {'Name': 'La Palma Airport', 'City': 'Santa Cruz De La Palma', 'Country': 'Spain'}, 'LPA': {'Name': 'Gran Canaria Airport', 'City': 'Gran Canaria', 'Country': 'Spain'}, 'ACE': {'Name': 'Lanzarote Airport', 'City': 'Arrecife', 'Country': 'Spain'}, 'TFS': {'Name': 'Tenerife South Airport', 'City': 'Tenerife', 'Country': 'Spain'}, 'TFN': {'Name': 'Tenerife Norte Airport', 'City': 'Tenerife', 'Country': 'Spain'}, 'MLN': {'Name': 'Melilla Airport', 'City': 'Melilla', 'Country': 'Spain'}, 'FNA': {'Name': 'Lungi International Airport', 'City': 'Freetown', 'Country': 'Sierra Leone'}, 'MLW': {'Name': 'Spriggs Payne Airport', 'City': 'Monrovia', 'Country': 'Liberia'}, 'ROB': {'Name': 'Roberts International Airport', 'City': 'Monrovia', 'Country': 'Liberia'}, 'AGA': {'Name': 'Al Massira Airport', 'City': 'Agadir', 'Country': 'Morocco'}, 'TTA': {'Name': 'Tan Tan Airport', 'City': 'Tan Tan', 'Country': 'Morocco'}, 'FEZ': {'Name': 'Saïss Airport', 'City': 'Fes', 'Country': 'Morocco'}, 'ERH': {'Name': 'Moulay Ali Cherif Airport', 'City': 'Er-rachidia', 'Country': 'Morocco'}, 'MEK': {'Name': 'Bassatine Airport', 'City': 'Meknes', 'Country': 'Morocco'}, 'OUD': {'Name': 'Angads Airport', 'City': 'Oujda', 'Country': 'Morocco'}, 'GMD': {'Name': 'Ben Slimane Airport', 'City': 'Ben Slimane', 'Country': 'Morocco'}, 'RBA': {'Name': 'Rabat-Salé Airport', 'City': 'Rabat', 'Country': 'Morocco'}, 'CMN': {'Name': 'Mohammed V International Airport', 'City': 'Casablanca', 'Country': 'Morocco'}, 'RAK': {'Name': 'Menara Airport', 'City': 'Marrakech', 'Country': 'Morocco'}, 'NNA': {'Name': 'Kenitra Airport', 'City': 'Kentira', 'Country': 'Morocco'}, 'OZZ': {'Name': 'Ouarzazate Airport', 'City': 'Ouarzazate', 'Country': 'Morocco'}, 'AHU': {'Name': 'Cherif Al Idrissi Airport', 'City': 'Al Hociema', 'Country': 'Morocco'}, 'TTU': {'Name': "Saniat R'mel Airport", 'City': 'Tetouan', 'Country': 'Morocco'}, 'TNG': {'Name': 'Ibn Batouta Airport', 'City': 'Tanger', 'Country': 'Morocco'}, 'ZIG': {'Name': 'Ziguinchor Airport', 'City': 'Ziguinchor', 'Country': 'Senegal'}, 'CSK': {'Name': 'Cap Skirring Airport', 'City': 'Cap Skiring', 'Country': 'Senegal'}, 'KLC': {'Name': 'Kaolack Airport', 'City': 'Kaolack', 'Country': 'Senegal'}, 'DKR': {'Name': 'Léopold Sédar Senghor International Airport', 'City': 'Dakar', 'Country': 'Senegal'}, 'XLS': {'Name': 'Saint Louis Airport', 'City': 'St. Louis', 'Country': 'Senegal'}, 'BXE': {'Name': 'Bakel Airport', 'City': 'Bakel', 'Country': 'Senegal'}, 'KGG': {'Name': 'Kédougou Airport', 'City': 'Kedougou', 'Country': 'Senegal'}, 'TUD': {'Name': 'Tambacounda Airport', 'City': 'Tambacounda', 'Country': 'Senegal'}, 'AEO': {'Name': 'Aioun el Atrouss Airport', 'City': 'Aioun El Atrouss', 'Country': 'Mauritania'}, 'TIY': {'Name': 'Tidjikja Airport', 'City': 'Tidjikja', 'Country': 'Mauritania'}, 'KFA': {'Name': 'Kiffa Airport', 'City': 'Kiffa', 'Country': 'Mauritania'}, 'EMN': {'Name': 'Néma Airport', 'City': 'Nema', 'Country': 'Mauritania'}, 'KED': {'Name': 'Kaédi Airport', 'City': 'Kaedi', 'Country': 'Mauritania'}, 'NKC': {'Name': 'Nouakchott–Oumtounsy International Airport', 'City': 'Nouakschott', 'Country': 'Mauritania'}, 'SEY': {'Name': 'Sélibaby Airport', 'City': 'Selibabi', 'Country': 'Mauritania'}, 'ATR': {'Name': 'Atar International Airport', 'City': 'Atar', 'Country': 'Mauritania'}, 'NDB': {'Name': 'Nouadhibou International Airport', 'City': 'Nouadhibou', 'Country': 'Mauritania'}, 'FIG': {'Name': 'Fria Airport', 'City': 'Fira', 'Country': 'Guinea'}, 'FAA': {'Name': 'Faranah Airport', 'City': 'Faranah', 'Country': 'Guinea'}, 'LEK': {'Name': 'Tata Airport', 'City': 'Labe', 'Country': 'Guinea'}, 'SID': {'Name': 'Amílcar Cabral International Airport', 'City': 'Amilcar Cabral', 'Country': 'Cape Verde'}, 'BVC': {'Name': 'Rabil Airport', 'City': 'Boa Vista', 'Country': 'Cape Verde'}, 'MMO': {'Name': 'Maio Airport', 'City': 'Maio', 'Country': 'Cape Verde'}, 'SNE': {'Name': 'Preguiça Airport', 'City': 'Sao Nocolau Island', 'Country': 'Cape Verde'}, 'VXE': {'Name': 'São Pedro Airport', 'City': 'Sao Vicente Island', 'Country': 'Cape Verde'}, 'ADD': {'Name': 'Addis Ababa Bole International Airport', 'City': 'Addis Ababa', 'Country': 'Ethiopia'}, 'AMH': {'Name': 'Arba Minch Airport', 'City': 'Arba Minch', 'Country': 'Ethiopia'}, 'AXU': {'Name': 'Axum Airport', 'City': 'Axum', 'Country': 'Ethiopia'}, 'BJR': {'Name': 'Bahir Dar Airport', 'City': 'Bahar Dar', 'Country': 'Ethiopia'}, 'DIR': {'Name': 'Aba Tenna Dejazmach Yilma International Airport', 'City': 'Dire Dawa', 'Country': 'Ethiopia'}, 'GMB': {'Name': 'Gambella Airport', 'City': 'Gambella', 'Country': 'Ethiopia'}, 'GDQ': {'Name': 'Gonder Airport', 'City': 'Gondar', 'Country': 'Ethiopia'}, 'JIM': {'Name': 'Jimma Airport', 'City': 'Jimma', 'Country': 'Ethiopia'}, 'LLI': {'Name': 'Lalibella Airport', 'City': 'Lalibella', 'Country': 'Ethiopia'}, 'MQX': {'Name': 'Mekele Airport', 'City': 'Makale', 'Country': 'Ethiopia'}, 'ASO': {'Name': 'Asosa Airport', 'City': 'Asosa', 'Country': 'Ethiopia'}, 'BJM': {'Name': 'Bujumbura International Airport', 'City': 'Bujumbura', 'Country': 'Burundi'}, 'HGA': {'Name': 'Egal International Airport', 'City': 'Hargeisa', 'Country': 'Somalia'}, 'BBO': {'Name': 'Berbera Airport', 'City': 'Berbera', 'Country': 'Somalia'}, 'KMU': {'Name': 'Kisimayu Airport', 'City': 'Kismayu', 'Country': 'Somalia'}, 'ALY': {'Name': 'El Nouzha Airport', 'City': 'Alexandria', 'Country': 'Egypt'}, 'ABS': {'Name': 'Abu Simbel Airport', 'City': 'Abu Simbel', 'Country': 'Egypt'}, 'CAI': {'Name': 'Cairo International Airport', 'City': 'Cairo', 'Country': 'Egypt'}, 'CWE': {'Name': 'Cairo West Airport', 'City': 'Cairo', 'Country': 'Egypt'}, 'HRG': {'Name': 'Hurghada International Airport', 'City': 'Hurghada', 'Country': 'Egypt'}, 'EGH': {'Name': 'El Gora Airport', 'City': 'El Gorah', 'Country': 'Egypt'}, 'LXR': {'Name': 'Luxor International Airport', 'City': 'Luxor', 'Country': 'Egypt'}, 'MUH': {'Name': 'Mersa Matruh Airport', 'City': 'Mersa-matruh', 'Country': 'Egypt'}, 'PSD': {'Name': 'Port Said Airport', 'City': 'Port Said', 'Country': 'Egypt'}, 'SKV': {'Name': 'St Catherine International Airport', 'City': 'St. Catherine', 'Country': 'Egypt'}, 'ASW': {'Name': 'Aswan International Airport', 'City': 'Aswan', 'Country': 'Egypt'}, 'ELT': {'Name': 'El Tor Airport', 'City': 'El-tor', 'Country': 'Egypt'}, 'EDL': {'Name': 'Eldoret International Airport', 'City': 'Eldoret', 'Country': 'Kenya'}, 'GGM': {'Name': 'Kakamega Airport', 'City': 'Kakamega', 'Country': 'Kenya'}, 'KIS': {'Name': 'Kisumu Airport', 'City': 'Kisumu', 'Country': 'Kenya'}, 'KTL': {'Name': 'Kitale Airport', 'City': 'Kitale', 'Country': 'Kenya'}, 'LOK': {'Name': 'Lodwar Airport', 'City': 'Lodwar', 'Country': 'Kenya'}, 'LAU': {'Name': 'Manda Airstrip', 'City': 'Lamu', 'Country': 'Kenya'}, 'MBA': {'Name': 'Mombasa Moi International Airport', 'City': 'Mombasa', 'Country': 'Kenya'}, 'WIL': {'Name': 'Nairobi Wilson Airport', 'City': 'Nairobi', 'Country': 'Kenya'}, 'WJR': {'Name': 'Wajir Airport', 'City': 'Wajir', 'Country': 'Kenya'}, 'GHT': {'Name': 'Ghat Airport', 'City': 'Ghat', 'Country': 'Libya'}, 'AKF': {'Name': 'Kufra Airport', 'City': 'Kufra', 'Country': 'Libya'}, 'BEN': {'Name': 'Benina International Airport', 'City': 'Benghazi', 'Country': 'Libya'}, 'SEB': {'Name': 'Sabha Airport', 'City': 'Sebha', 'Country': 'Libya'}, 'TIP': {'Name': 'Tripoli International Airport', 'City': 'Tripoli', 'Country': 'Libya'}, 'LMQ': {'Name': 'Marsa Brega Airport', 'City': 'Marsa Brega', 'Country': 'Libya'}, 'HUQ': {'Name': 'Hon Airport', 'City': 'Hon', 'Country': 'Libya'}, 'LTD': {'Name': 'Ghadames East Airport', 'City': 'Ghadames', 'Country': 'Libya'}, 'GYI': {'Name': 'Gisenyi Airport', 'City': 'Gisenyi', 'Country': 'Rwanda'}, 'KGL': {'Name': 'Kigali International Airport', 'City': 'Kigali', 'Country': 'Rwanda'}, 'KME': {'Name': 'Kamembe Airport', 'City': 'Kamembe', 'Country': 'Rwanda'}, 'DOG': {'Name': 'Dongola Airport', 'City': 'Dongola', 'Country': 'Sudan'}, 'RSS': {'Name': 'Damazin Airport', 'City': 'Damazin', 'Country': 'Sudan'}, 'ELF': {'Name': 'El Fasher Airport', 'City': 'El Fasher', 'Country': 'Sudan'}, 'KSL': {'Name': 'Kassala Airport', 'City': 'Kassala', 'Country': 'Sudan'}, 'KDX': {'Name': 'Kadugli Airport', 'City': 'Kadugli', 'Country': 'Sudan'}, 'EBD': {'Name': 'El Obeid Airport', 'City': 'El Obeid', 'Country': 'Sudan'}, 'JUB': {'Name': 'Juba International Airport', 'City': 'Juba', 'Country': 'South Sudan'}, 'MAK': {'Name': 'Malakal Airport', 'City': 'Malakal', 'Country': 'Sudan'}, 'KRT': {'Name': 'Khartoum International Airport', 'City': 'Khartoum', 'Country': 'Sudan'}, 'ARK': {'Name': 'Arusha Airport', 'City': 'Arusha', 'Country': 'Tanzania'}, 'DAR': {'Name': 'Julius Nyerere International Airport', 'City': 'Dar Es Salaam', 'Country': 'Tanzania'}, 'DOD': {'Name': 'Dodoma Airport', 'City': 'Dodoma', 'Country': 'Tanzania'}, 'IRI': {'Name': 'Iringa Airport', 'City': 'Iringa', 'Country': 'Tanzania'}, 'JRO': {'Name': 'Kilimanjaro International Airport', 'City': 'Kilimanjaro', 'Country': 'Tanzania'}, 'LKY': {'Name': 'Lake Manyara Airport', 'City': 'Lake Manyara', 'Country': 'Tanzania'}, 'MYW': {'Name': 'Mtwara Airport', 'City': 'Mtwara', 'Country': 'Tanzania'}, 'MWZ': {'Name': 'Mwanza Airport', 'City': 'Mwanza', 'Country': 'Tanzania'}, 'PMA': {'Name': 'Pemba Airport', 'City': 'Pemba', 'Country': 'Tanzania'}, 'TGT': {'Name': 'Tanga Airport', 'City': 'Tanga', 'Country': 'Tanzania'}, 'ZNZ': {'Name': 'Abeid Amani Karume International Airport', 'City': 'Zanzibar', 'Country': 'Tanzania'}, 'EBB': {'Name': 'Entebbe International Airport', 'City': 'Entebbe', 'Country': 'Uganda'}, 'SRT': {'Name': 'Soroti Airport', 'City': 'Soroti', 'Country': 'Uganda'}, 'TIA': {'Name': 'Tirana International Airport Mother Teresa', 'City': 'Tirana', 'Country': 'Albania'}, 'BOJ': {'Name': 'Burgas Airport', 'City': 'Bourgas', 'Country': 'Bulgaria'}, 'GOZ': {'Name': 'Gorna Oryahovitsa Airport', 'City': 'Gorna Orechovica', 'Country': 'Bulgaria'}, 'PDV': {'Name': 'Plovdiv International Airport', 'City': 'Plovdiv', 'Country': 'Bulgaria'}, 'SOF': {'Name': 'Sofia Airport', 'City': 'Sofia', 'Country': 'Bulgaria'}, 'SZR': {'Name': 'Stara Zagora Airport', 'City': 'Stara Zagora', 'Country': 'Bulgaria'}, 'VAR': {'Name': 'Varna Airport', 'City': 'Varna', 'Country': 'Bulgaria'}, 'LCA': {'Name': 'Larnaca International Airport', 'City': 'Larnaca', 'Country': 'Cyprus'}, 'PFO': {'Name': 'Paphos International Airport', 'City': 'Paphos', 'Country': 'Cyprus'}, 'AKT': {'Name': 'RAF Akrotiri', 'City': 'Akrotiri', 'Country': 'Cyprus'}, 'DBV': {'Name': 'Dubrovnik Airport', 'City': 'Dubrovnik', 'Country': 'Croatia'}, 'OSI': {'Name': 'Osijek Airport', 'City': 'Osijek', 'Country': 'Croatia'}, 'PUY': {'Name': 'Pula Airport', 'City': 'Pula', 'Country': 'Croatia'}, 'RJK': {'Name': 'Rijeka Airport', 'City': 'Rijeka', 'Country': 'Croatia'}, 'SPU': {'Name': 'Split Airport', 'City': 'Split', 'Country': 'Croatia'}, 'ZAG': {'Name': 'Zagreb Airport', 'City': 'Zagreb', 'Country': 'Croatia'}, 'ZAD': {'Name': 'Zadar Airport', 'City': 'Zadar', 'Country': 'Croatia'}, 'ABC': {'Name': 'Albacete-Los Llanos Airport', 'City': 'Albacete', 'Country': 'Spain'}, 'ALC': {'Name': 'Alicante International Airport', 'City': 'Alicante', 'Country': 'Spain'}, 'LEI': {'Name': 'Almería International Airport', 'City': 'Almeria', 'Country': 'Spain'}, 'OVD': {'Name': 'Asturias Airport', 'City': 'Aviles', 'Country': 'Spain'}, 'ODB': {'Name': 'Córdoba Airport', 'City': 'Cordoba', 'Country': 'Spain'}, 'BIO': {'Name': 'Bilbao Airport', 'City': 'Bilbao', 'Country': 'Spain'}, 'BCN': {'Name': 'Barcelona International Airport', 'City': 'Barcelona', 'Country': 'Spain'}, 'BJZ': {'Name': 'Badajoz Airport', 'City': 'Badajoz', 'Country': 'Spain'}, 'LCG': {'Name': 'A Coruña Airport', 'City': 'La Coruna', 'Country': 'Spain'}, 'GRO': {'Name': 'Girona Airport', 'City': 'Gerona', 'Country': 'Spain'}, 'GRX': {'Name': 'Federico Garcia Lorca Airport', 'City': 'Granada', 'Country': 'Spain'}, 'IBZ': {'Name': 'Ibiza Airport', 'City': 'Ibiza', 'Country': 'Spain'}, 'XRY': {'Name': 'Jerez Airport', 'City': 'Jerez', 'Country': 'Spain'}, 'MJV': {'Name': 'San Javier Airport', 'City': 'Murcia', 'Country': 'Spain'}, 'MAD': {'Name': 'Adolfo Suárez Madrid–Barajas Airport', 'City': 'Madrid', 'Country': 'Spain'}, 'AGP': {'Name': 'Málaga Airport', 'City': 'Malaga', 'Country': 'Spain'}, 'MAH': {'Name': 'Menorca Airport', 'City': 'Menorca', 'Country': 'Spain'}, 'OZP': {'Name': 'Moron Air Base', 'City': 'Sevilla', 'Country': 'Spain'}, 'PNA': {'Name': 'Pamplona Airport', 'City': 'Pamplona', 'Country': 'Spain'}, 'REU': {'Name': 'Reus Air Base', 'City': 'Reus', 'Country': 'Spain'}, 'ROZ': {'Name': 'Rota Naval Station Airport', 'City': 'Rota', 'Country': 'Spain'}, 'SLM': {'Name': 'Salamanca Airport', 'City': 'Salamanca', 'Country': 'Spain'}, 'EAS': {'Name': 'San Sebastian Airport', 'City': 'San Sebastian', 'Country': 'Spain'}, 'SCQ': {'Name': 'Santiago de Compostela Airport', 'City': 'Santiago', 'Country': 'Spain'}, 'LEU': {'Name': "Pirineus - la Seu d'Urgel Airport", 'City': 'Seo De Urgel', 'Country': 'Spain'}, 'TOJ': {'Name': 'Torrejón Airport', 'City': 'Madrid', 'Country': 'Spain'}, 'VLC': {'Name': 'Valencia Airport', 'City': 'Valencia', 'Country': 'Spain'}, 'VLL': {'Name': 'Valladolid Airport', 'City': 'Valladolid', 'Country': 'Spain'}, 'VIT': {'Name': 'Vitoria/Foronda Airport', 'City': 'Vitoria', 'Country': 'Spain'}, 'VGO': {'Name': 'Vigo Airport', 'City': 'Vigo', 'Country': 'Spain'}, 'SDR': {'Name': 'Santander Airport', 'City': 'Santander', 'Country': 'Spain'}, 'ZAZ': {'Name': 'Zaragoza Air Base', 'City': 'Zaragoza', 'Country': 'Spain'}, 'SVQ': {'Name': 'Sevilla Airport', 'City': 'Sevilla', 'Country': 'Spain'}, 'CQF': {'Name': 'Calais-Dunkerque Airport', 'City': 'Calais', 'Country': 'France'}, 'BYF': {'Name': 'Albert-Bray Airport', 'City': 'Albert', 'Country': 'France'}, 'LTQ': {'Name': "Le Touquet-Côte d'Opale Airport", 'City': 'Le Tourquet', 'Country': 'France'}, 'XVS': {'Name': 'Valenciennes-Denain Airport', 'City': 'Valenciennes', 'Country': 'France'}, 'AGF': {'Name': 'Agen-La Garenne Airport', 'City': 'Agen', 'Country': 'France'}, 'BOD': {'Name': 'Bordeaux-Mérignac Airport', 'City': 'Bordeaux', 'Country': 'France'}, 'EGC': {'Name': 'Bergerac-Roumanière Airport', 'City': 'Bergerac', 'Country': 'France'}, 'CNG': {'Name': 'Cognac-Châteaubernard (BA 709) Air Base', 'City': 'Cognac', 'Country': 'France'}, 'PIS': {'Name': 'Poitiers-Biard Airport', 'City': 'Poitiers', 'Country': 'France'}, 'MCU': {'Name': 'Montluçon-Guéret Airport', 'City': 'Montlucon-gueret', 'Country': 'France'}, 'LIG': {'Name': 'Limoges Airport', 'City': 'Limoges', 'Country': 'France'}, 'NIT': {'Name': 'Niort-Souché Airport', 'City': 'Niort', 'Country': 'France'}, 'TLS': {'Name': 'Toulouse-Blagnac Airport', 'City': 'Toulouse', 'Country': 'France'}, 'PUF': {'Name': 'Pau Pyrénées Airport', 'City': 'Pau', 'Country': 'France'}, 'LDE': {'Name': 'Tarbes-Lourdes-Pyrénées Airport', 'City': 'Tarbes', 'Country': 'France'}, 'ANG': {'Name': 'Angoulême-Brie-Champniers Airport', 'City': 'Angouleme', 'Country': 'France'}, 'BVE': {'Name': 'Brive Souillac Airport', 'City': 'Brive', 'Country': 'France'}, 'PGX': {'Name': 'Périgueux-Bassillac Airport', 'City': 'Perigueux', 'Country': 'France'}, 'BIQ': {'Name': 'Biarritz-Anglet-Bayonne Airport', 'City': 'Biarritz-bayonne', 'Country': 'France'}, 'ZAO': {'Name': 'Cahors-Lalbenque Airport', 'City': 'Cahors', 'Country': 'France'}, 'LBI': {'Name': 'Albi-Le Séquestre Airport', 'City': 'Albi', 'Country': 'France'}, 'DCM': {'Name': 'Castres-Mazamet Airport', 'City': 'Castres', 'Country': 'France'}, 'RDZ': {'Name': 'Rodez-Marcillac Airport', 'City': 'Rodez', 'Country': 'France'}, 'RYN': {'Name': 'Royan-Médis Airport', 'City': 'Royan', 'Country': 'France'}, 'XMW': {'Name': 'Montauban Airport', 'City': 'Montauban', 'Country': 'France'}, 'RCO': {'Name': 'Rochefort-Saint-Agnant (BA 721) Airport', 'City': 'Rochefort', 'Country': 'France'}, 'CMR': {'Name': 'Colmar-Houssen Airport', 'City': 'Colmar', 'Country': 'France'}, 'DLE': {'Name': 'Dole-Tavaux Airport', 'City': 'Dole', 'Country': 'France'}, 'OBS': {'Name': 'Aubenas-Ardèche Méridional Airport', 'City': 'Aubenas-vals-lanas', 'Country': 'France'}, 'LPY': {'Name': 'Le Puy-Loudes Airport', 'City': 'Le Puy', 'Country': 'France'}, 'ETZ': {'Name': 'Metz-Nancy-Lorraine Airport', 'City': 'Metz', 'Country': 'France'}, 'BIA': {'Name': 'Bastia-Poretta Airport', 'City': 'Bastia', 'Country': 'France'}, 'CLY': {'Name': 'Calvi-Sainte-Catherine Airport', 'City': 'Calvi', 'Country': 'France'}, 'FSC': {'Name': 'Figari Sud-Corse Airport', 'City': 'Figari', 'Country': 'France'}, 'AJA': {'Name': 'Ajaccio-Napoléon Bonaparte Airport', 'City': 'Ajaccio', 'Country': 'France'}, 'PRP': {'Name': 'Propriano Airport', 'City': 'Propriano', 'Country': 'France'}, 'SOZ': {'Name': 'Solenzara (BA 126) Air Base', 'City': 'Solenzara', 'Country': 'France'}, 'AUF': {'Name': 'Auxerre-Branches Airport', 'City': 'Auxerre', 'Country': 'France'}, 'CMF': {'Name': 'Chambéry-Savoie Airport', 'City': 'Chambery', 'Country': 'France'}, 'CFE': {'Name': 'Clermont-Ferrand Auvergne Airport', 'City': 'Clermont-Ferrand', 'Country': 'France'}, 'BOU': {'Name': 'Bourges Airport', 'City': 'Bourges', 'Country': 'France'}, 'QNJ': {'Name': 'Annemasse Airport', 'City': 'Annemasse', 'Country': 'France'}, 'LYS': {'Name': 'Lyon Saint-Exupéry Airport', 'City': 'Lyon', 'Country': 'France'}, 'SYT': {'Name': 'Saint-Yan Airport', 'City': 'St.-yan', 'Country': 'France'}, 'RNE': {'Name': 'Roanne-Renaison Airport', 'City': 'Roanne', 'Country': 'France'}, 'NCY': {'Name': 'Annecy-Haute-Savoie-Mont Blanc Airport', 'City': 'Annecy', 'Country': 'France'}, 'GNB': {'Name': 'Grenoble-Isère Airport', 'City': 'Grenoble', 'Country': 'France'}, 'VAF': {'Name': 'Valence-Chabeuil Airport', 'City': 'Valence', 'Country': 'France'}, 'VHY': {'Name': 'Vichy-Charmeil Airport', 'City': 'Vichy', 'Country': 'France'}, 'AUR': {'Name': 'Aurillac Airport', 'City': 'Aurillac', 'Country': 'France'}, 'CHR': {'Name': 'Châteauroux-Déols "Marcel Dassault" Airport', 'City': 'Chateauroux', 'Country': 'France'}, 'LYN': {'Name': 'Lyon-Bron Airport', 'City': 'Lyon', 'Country': 'France'}, 'CEQ': {'Name': 'Cannes-Mandelieu Airport', 'City': 'Cannes', 'Country': 'France'}, 'EBU': {'Name': 'Saint-Étienne-Bouthéon Airport', 'City': 'St-Etienne', 'Country': 'France'}, 'CCF': {'Name': 'Carcassonne Airport', 'City': 'Carcassonne', 'Country': 'France'}, 'MRS': {'Name': 'Marseille Provence Airport', 'City': 'Marseille', 'Country': 'France'}, 'NCE': {'Name': "Nice-Côte d'Azur Airport", 'City': 'Nice', 'Country': 'France'}, 'XOG': {'Name': 'Orange-Caritat (BA 115) Air Base', 'City': 'Orange', 'Country': 'France'}, 'PGF': {'Name': 'Perpignan-Rivesaltes (Llabanère) Airport', 'City': 'Perpignan', 'Country': 'France'}, 'CTT': {'Name': 'Le Castellet Airport', 'City': 'Le Castellet', 'Country': 'France'}, 'MPL': {'Name': 'Montpellier-Méditerranée Airport', 'City': 'Montpellier', 'Country': 'France'}, 'BZR': {'Name': 'Béziers-Vias Airport', 'City': 'Beziers', 'Country': 'France'}, 'AVN': {'Name': 'Avignon-Caumont Airport', 'City': 'Avignon', 'Country': 'France'}, 'MEN': {'Name': 'Mende-Brenoux Airfield', 'City': 'Mende', 'Country': 'France'}, 'BVA': {'Name': 'Paris Beauvais Tillé Airport', 'City': 'Beauvais', 'Country': 'France'}, 'EVX': {'Name': 'Évreux-Fauville (BA 105) Air Base', 'City': 'Evreux', 'Country': 'France'}, 'LEH': {'Name': 'Le Havre Octeville Airport', 'City': 'Le Havre', 'Country': 'France'}, 'XAB': {'Name': 'Abbeville', 'City': 'Abbeville', 'Country': 'France'}, 'ORE': {'Name': 'Orléans-Bricy (BA 123) Air Base', 'City': 'Orleans', 'Country': 'France'}, 'XCR': {'Name': 'Châlons-Vatry Airport', 'City': 'Chalons', 'Country': 'France'}, 'URO': {'Name': 'Rouen Airport', 'City': 'Rouen', 'Country': 'France'}, 'TUF': {'Name': 'Tours-Val-de-Loire Airport', 'City': 'Tours', 'Country': 'France'}, 'CET': {'Name': 'Cholet Le Pontreau Airport', 'City': 'Cholet', 'Country': 'France'}, 'LVA': {'Name': 'Laval-Entrammes Airport', 'City': 'Laval', 'Country': 'France'}, 'LBG': {'Name': 'Paris-Le Bourget Airport', 'City': 'Paris', 'Country': 'France'}, 'CSF': {'Name': 'Creil Air Base', 'City': 'Creil', 'Country': 'France'}, 'CDG': {'Name': 'Charles de Gaulle International Airport', 'City': 'Paris', 'Country': 'France'}, 'TNF': {'Name': 'Toussus-le-Noble Airport', 'City': 'Toussous-le-noble', 'Country': 'France'}, 'ORY': {'Name': 'Paris-Orly Airport', 'City': 'Paris', 'Country': 'France'}, 'POX': {'Name': 'Pontoise - Cormeilles-en-Vexin Airport', 'City': 'Pontoise', 'Country': 'France'}, 'VIY': {'Name': 'Villacoublay-Vélizy (BA 107) Air Base', 'City': 'Villacoublay', 'Country': 'France'}, 'NVS': {'Name': 'Nevers-Fourchambault Airport', 'City': 'Nevers', 'Country': 'France'}, 'XME': {'Name': 'Maubeuge-Élesmes Airport', 'City': 'Maubeuge', 'Country': 'France'}, 'LIL': {'Name': 'Lille-Lesquin Airport', 'City': 'Lille', 'Country': 'France'}, 'HZB': {'Name': 'Merville-Calonne Airport', 'City': 'Merville', 'Country': 'France'}, 'XCZ': {'Name': 'Charleville-Mézières Airport', 'City': 'Charleville', 'Country': 'France'}, 'BES': {'Name': 'Brest Bretagne Airport', 'City': 'Brest', 'Country': 'France'}, 'CER': {'Name': 'Cherbourg-Maupertus Airport', 'City': 'Cherbourg', 'Country': 'France'}, 'DNR': {'Name': 'Dinard-Pleurtuit-Saint-Malo Airport', 'City': 'Dinard', 'Country': 'France'}, 'LBY': {'Name': 'La Baule-Escoublac Airport', 'City': 'La Baule', 'Country': 'France'}, 'GFR': {'Name': 'Granville Airport', 'City': 'Granville', 'Country': 'France'}, 'DOL': {'Name': 'Deauville-Saint-Gatien Airport', 'City': 'Deauville', 'Country': 'France'}, 'LRT': {'Name': 'Lorient South Brittany (Bretagne Sud) Airport', 'City': 'Lorient', 'Country': 'France'}, 'EDM': {'Name': 'La Roche-sur-Yon Airport', 'City': 'La Roche-sur-yon', 'Country': 'France'}, 'LDV': {'Name': 'Landivisiau Air Base', 'City': 'Landivisiau', 'Country': 'France'}, 'CFR': {'Name': 'Caen-Carpiquet Airport', 'City': 'Caen', 'Country': 'France'}, 'LME': {'Name': 'Le Mans-Arnage Airport', 'City': 'Le Mans', 'Country': 'France'}, 'RNS': {'Name': 'Rennes-Saint-Jacques Airport', 'City': 'Rennes', 'Country': 'France'}, 'LAI': {'Name': 'Lannion-Côte de Granit Airport', 'City': 'Lannion', 'Country': 'France'}, 'UIP': {'Name': 'Quimper-Cornouaille Airport', 'City': 'Quimper', 'Country': 'France'}, 'NTE': {'Name': 'Nantes Atlantique Airport', 'City': 'Nantes', 'Country': 'France'}, 'SBK': {'Name': 'Saint-Brieuc-Armor Airport', 'City': 'St.-brieuc Armor', 'Country': 'France'}, 'MXN': {'Name': 'Morlaix-Ploujean Airport', 'City': 'Morlaix', 'Country': 'France'}, 'VNE': {'Name': 'Vannes-Meucon Airport', 'City': 'Vannes', 'Country': 'France'}, 'SNR': {'Name': 'Saint-Nazaire-Montoir Airport', 'City': 'St.-nazaire', 'Country': 'France'}, 'BSL': {'Name': 'EuroAirport Basel-Mulhouse-Freiburg Airport', 'City': 'Mulhouse', 'Country': 'France'}, 'DIJ': {'Name': 'Dijon-Bourgogne Airport', 'City': 'Dijon', 'Country': 'France'}, 'MZM': {'Name': 'Metz-Frescaty (BA 128) Air Base', 'City': 'Metz', 'Country': 'France'}, 'EPL': {'Name': 'Épinal-Mirecourt Airport', 'City': 'Epinal', 'Country': 'France'}, 'ENC': {'Name': 'Nancy-Essey Airport', 'City': 'Nancy', 'Country': 'France'}, 'RHE': {'Name': 'Reims-Champagne (BA 112) Air Base', 'City': 'Reims', 'Country': 'France'}, 'SXB': {'Name': 'Strasbourg Airport', 'City': 'Strasbourg', 'Country': 'France'}, 'TLN': {'Name': 'Toulon-Hyères Airport', 'City': 'Hyeres', 'Country': 'France'}, 'FNI': {'Name': 'Nîmes-Arles-Camargue Airport', 'City': 'Nimes', 'Country': 'France'}, 'MQC': {'Name': 'Miquelon Airport', 'City': 'Miquelon', 'Country': 'Saint Pierre and Miquelon'}, 'FSP': {'Name': 'St Pierre Airport', 'City': 'St.-pierre', 'Country': 'Saint Pierre and Miquelon'}, 'PYR': {'Name': 'Andravida Air Base', 'City': 'Andravida', 'Country': 'Greece'}, 'AGQ': {'Name': 'Agrinion Air Base', 'City': 'Agrinion', 'Country': 'Greece'}, 'AXD': {'Name': 'Dimokritos Airport', 'City': 'Alexandroupolis', 'Country': 'Greece'}, 'VOL': {'Name': 'Nea Anchialos Airport', 'City': 'Nea Anghialos', 'Country': 'Greece'}, 'JKH': {'Name': 'Chios Island National Airport', 'City': 'Chios', 'Country': 'Greece'}, 'IOA': {'Name': 'Ioannina Airport', 'City': 'Ioannina', 'Country': 'Greece'}, 'HER': {'Name': 'Heraklion International Nikos Kazantzakis Airport', 'City': 'Heraklion', 'Country': 'Greece'}, 'KSO': {'Name': 'Kastoria National Airport', 'City': 'Kastoria', 'Country': 'Greece'}, 'KIT': {'Name': 'Kithira Airport', 'City': 'Kithira', 'Country': 'Greece'}, 'EFL': {'Name': 'Kefallinia Airport', 'City': 'Keffallinia', 'Country': 'Greece'}, 'KLX': {'Name': 'Kalamata Airport', 'City': 'Kalamata', 'Country': 'Greece'}, 'KGS': {'Name': 'Kos Airport', 'City': 'Kos', 'Country': 'Greece'}, 'AOK': {'Name': 'Karpathos Airport', 'City': 'Karpathos', 'Country': 'Greece'}, 'CFU': {'Name': 'Ioannis Kapodistrias International Airport', 'City': 'Kerkyra/corfu', 'Country': 'Greece'}, 'KSJ': {'Name': 'Kasos Airport', 'City': 'Kasos', 'Country': 'Greece'}, 'KVA': {'Name': 'Alexander the Great International Airport', 'City': 'Kavala', 'Country': 'Greece'}, 'KZI': {'Name': 'Filippos Airport', 'City': 'Kozani', 'Country': 'Greece'}, 'LRS': {'Name': 'Leros Airport', 'City': 'Leros', 'Country': 'Greece'}, 'LXS': {'Name': 'Limnos Airport', 'City': 'Limnos', 'Country': 'Greece'}, 'LRA': {'Name': 'Larisa Airport', 'City': 'Larissa', 'Country': 'Greece'}, 'JMK': {'Name': 'Mikonos Airport', 'City': 'Mykonos', 'Country': 'Greece'}, 'MJT': {'Name': 'Mytilene International Airport', 'City': 'Mytilini', 'Country': 'Greece'}, 'PVK': {'Name': 'Aktion National Airport', 'City': 'Preveza', 'Country': 'Greece'}, 'RHO': {'Name': 'Diagoras Airport', 'City': 'Rhodos', 'Country': 'Greece'}, 'GPA': {'Name': 'Araxos Airport', 'City': 'Patras', 'Country': 'Greece'}, 'CHQ': {'Name': 'Chania International Airport', 'City': 'Chania', 'Country': 'Greece'}, 'JSI': {'Name': 'Skiathos Island National Airport', 'City': 'Skiathos', 'Country': 'Greece'}, 'SMI': {'Name': 'Samos Airport', 'City': 'Samos', 'Country': 'Greece'}, 'SPJ': {'Name': 'Sparti Airport', 'City': 'Sparti', 'Country': 'Greece'}, 'JTR': {'Name': 'Santorini Airport', 'City': 'Thira', 'Country': 'Greece'}, 'JSH': {'Name': 'Sitia Airport', 'City': 'Sitia', 'Country': 'Greece'}, 'SKU': {'Name': 'Skiros Airport', 'City': 'Skiros', 'Country': 'Greece'}, 'SKG': {'Name': 'Thessaloniki Macedonia International Airport', 'City': 'Thessaloniki', 'Country': 'Greece'}, 'ZTH': {'Name': 'Zakynthos International Airport "Dionysios Solomos"', 'City': 'Zakynthos', 'Country': 'Greece'}, 'BUD': {'Name': 'Budapest Liszt Ferenc International Airport', 'City': 'Budapest', 'Country': 'Hungary'}, 'DEB': {'Name': 'Debrecen International Airport', 'City': 'Debrecen', 'Country': 'Hungary'}, 'CRV': {'Name': 'Crotone Airport', 'City': 'Crotone', 'Country': 'Italy'}, 'BRI': {'Name': 'Bari Karol Wojtyła Airport', 'City': 'Bari', 'Country': 'Italy'}, 'FOG': {'Name': 'Foggia "Gino Lisa" Airport', 'City': 'Foggia', 'Country': 'Italy'}, 'TAR': {'Name': 'Taranto-Grottaglie "Marcello Arlotta" Airport', 'City': 'Grottaglie', 'Country': 'Italy'}, 'LCC': {'Name': 'Lecce Galatina Air Base', 'City': 'Lecce', 'Country': 'Italy'}, 'PSR': {'Name': 'Pescara International Airport', 'City': 'Pescara', 'Country': 'Italy'}, 'BDS': {'Name': 'Brindisi – Salento Airport', 'City': 'Brindisi', 'Country': 'Italy'}, 'SUF': {'Name': 'Lamezia Terme Airport', 'City': 'Lamezia', 'Country': 'Italy'}, 'CTA': {'Name': 'Catania-Fontanarossa Airport', 'City': 'Catania', 'Country': 'Italy'}, 'LMP': {'Name': 'Lampedusa Airport', 'City': 'Lampedusa', 'Country': 'Italy'}, 'PNL': {'Name': 'Pantelleria Airport', 'City': 'Pantelleria', 'Country': 'Italy'}, 'PMO': {'Name': 'Falcone–Borsellino Airport', 'City': 'Palermo', 'Country': 'Italy'}, 'REG': {'Name': 'Reggio Calabria Airport', 'City': 'Reggio Calabria', 'Country': 'Italy'}, 'TPS': {'Name': 'Vincenzo Florio Airport Trapani-Birgi', 'City': 'Trapani', 'Country': 'Italy'}, 'NSY': {'Name': 'Sigonella Navy Air Base', 'City': 'Sigonella', 'Country': 'Italy'}, 'AHO': {'Name': 'Alghero-Fertilia Airport', 'City': 'Alghero', 'Country': 'Italy'}, 'DCI': {'Name': 'Decimomannu Air Base', 'City': 'Decimomannu', 'Country': 'Italy'}, 'CAG': {'Name': 'Cagliari Elmas Airport', 'City': 'Cagliari', 'Country': 'Italy'}, 'OLB': {'Name': 'Olbia Costa Smeralda Airport', 'City': 'Olbia', 'Country': 'Italy'}, 'TTB': {'Name': 'Tortolì Airport', 'City': 'Tortoli', 'Country': 'Italy'}, 'MXP': {'Name': 'Malpensa International Airport', 'City': 'Milano', 'Country': 'Italy'}, 'BGY': {'Name': 'Il Caravaggio International Airport', 'City': 'Bergamo', 'Country': 'Italy'}, 'TRN': {'Name': 'Turin Airport', 'City': 'Torino', 'Country': 'Italy'}, 'ALL': {'Name': "Villanova D'Albenga International Airport", 'City': 'Albenga', 'Country': 'Italy'}, 'GOA': {'Name': 'Genoa Cristoforo Colombo Airport', 'City': 'Genoa', 'Country': 'Italy'}, 'LIN': {'Name': 'Milano Linate Airport', 'City': 'Milan', 'Country': 'Italy'}, 'PMF': {'Name': 'Parma Airport', 'City': 'Parma', 'Country': 'Italy'}, 'CUF': {'Name': 'Cuneo International Airport', 'City': 'Cuneo', 'Country': 'Italy'}, 'AVB': {'Name': 'Aviano Air Base', 'City': 'Aviano', 'Country': 'Italy'}, 'BZO': {'Name': 'Bolzano Airport', 'City': 'Bolzano', 'Country': 'Italy'}, 'BLQ': {'Name': 'Bologna Guglielmo Marconi Airport', 'City': 'Bologna', 'Country': 'Italy'}, 'TSF': {'Name': "Treviso-Sant'Angelo Airport", 'City': 'Treviso', 'Country': 'Italy'}, 'FRL': {'Name': 'Forlì Airport', 'City': 'Forli', 'Country': 'Italy'}, 'VBS': {'Name': 'Brescia Airport', 'City': 'Brescia', 'Country': 'Italy'}, 'TRS': {'Name': 'Trieste–Friuli Venezia Giulia Airport', 'City': 'Ronchi De Legionari', 'Country': 'Italy'}, 'RMI': {'Name': 'Federico Fellini International Airport', 'City': 'Rimini', 'Country': 'Italy'}, 'VIC': {'Name': 'Vicenza Airport', 'City': 'Vicenza', 'Country': 'Italy'}, 'QPA': {'Name': 'Padova Airport', 'City': 'Padova', 'Country': 'Italy'}, 'VRN': {'Name': 'Verona Villafranca Airport', 'City': 'Villafranca', 'Country': 'Italy'}, 'VCE': {'Name': 'Venice Marco Polo Airport', 'City': 'Venice', 'Country': 'Italy'}, 'SAY': {'Name': 'Siena-Ampugnano Airport', 'City': 'Siena', 'Country': 'Italy'}, 'CIA': {'Name': 'Ciampino–G. B. Pastine International Airport', 'City': 'Rome', 'Country': 'Italy'}, 'FCO': {'Name': 'Leonardo da Vinci–Fiumicino Airport', 'City': 'Rome', 'Country': 'Italy'}, 'EBA': {'Name': 'Marina Di Campo Airport', 'City': 'Marina Di Campo', 'Country': 'Italy'}, 'QLT': {'Name': 'Latina Air Base', 'City': 'Latina', 'Country': 'Italy'}, 'NAP': {'Name': 'Naples International Airport', 'City': 'Naples', 'Country': 'Italy'}, 'PSA': {'Name': 'Pisa International Airport', 'City': 'Pisa', 'Country': 'Italy'}, 'FLR': {'Name': 'Peretola Airport', 'City': 'Florence', 'Country': 'Italy'}, 'GRS': {'Name': 'Grosseto Air Base', 'City': 'Grosseto', 'Country': 'Italy'}, 'PEG': {'Name': "Perugia San Francesco d'Assisi – Umbria International Airport", 'City': 'Perugia', 'Country': 'Italy'}, 'LJU': {'Name': 'Ljubljana Jože Pučnik Airport', 'City': 'Ljubljana', 'Country': 'Slovenia'}, 'MBX': {'Name': 'Maribor Airport', 'City': 'Maribor', 'Country': 'Slovenia'}, 'POW': {'Name': 'Portoroz Airport', 'City': 'Portoroz', 'Country': 'Slovenia'}, 'UHE': {'Name': 'Kunovice Airport', 'City': 'Kunovice', 'Country': 'Czech Republic'}, 'KLV': {'Name': 'Karlovy Vary International Airport', 'City': 'Karlovy Vary', 'Country': 'Czech Republic'}, 'OSR': {'Name': 'Ostrava Leos Janáček Airport', 'City': 'Ostrava', 'Country': 'Czech Republic'}, 'PED': {'Name': 'Pardubice Airport', 'City': 'Pardubice', 'Country': 'Czech Republic'}, 'PRV': {'Name': 'Přerov Air Base', 'City': 'Prerov', 'Country': 'Czech Republic'}, 'PRG': {'Name': 'Václav Havel Airport Prague', 'City': 'Prague', 'Country': 'Czech Republic'}, 'BRQ': {'Name': 'Brno-Tuřany Airport', 'City': 'Brno', 'Country': 'Czech Republic'}, 'VOD': {'Name': 'Vodochody Airport', 'City': 'Vodochody', 'Country': 'Czech Republic'}, 'TLV': {'Name': 'Ben Gurion International Airport', 'City': 'Tel-aviv', 'Country': 'Israel'}, 'BEV': {'Name': 'Beersheba (Teyman) Airport', 'City': 'Beer-sheba', 'Country': 'Israel'}, 'ETH': {'Name': 'Eilat Airport', 'City': 'Elat', 'Country': 'Israel'}, 'EIY': {'Name': 'Ein Yahav Airfield', 'City': 'Eyn-yahav', 'Country': 'Israel'}, 'HFA': {'Name': 'Haifa International Airport', 'City': 'Haifa', 'Country': 'Israel'}, 'RPN': {'Name': "Ben Ya'akov Airport", 'City': 'Rosh Pina', 'Country': 'Israel'}, 'MTZ': {'Name': 'Bar Yehuda Airfield', 'City': 'Metzada', 'Country': 'Israel'}, 'VTM': {'Name': 'Nevatim Air Base', 'City': 'Nevatim', 'Country': 'Israel'}, 'VDA': {'Name': 'Ovda International Airport', 'City': 'Ovda', 'Country': 'Israel'}, 'MIP': {'Name': 'Ramon Air Base', 'City': 'Ramon', 'Country': 'Israel'}, 'SDV': {'Name': 'Sde Dov Airport', 'City': 'Tel-aviv', 'Country': 'Israel'}, 'MLA': {'Name': 'Malta International Airport', 'City': 'Malta', 'Country': 'Malta'}, 'GRZ': {'Name': 'Graz Airport', 'City': 'Graz', 'Country': 'Austria'}, 'INN': {'Name': 'Innsbruck Airport', 'City': 'Innsbruck', 'Country': 'Austria'}, 'LNZ': {'Name': 'Linz Hörsching Airport', 'City': 'Linz', 'Country': 'Austria'}, 'SZG': {'Name': 'Salzburg Airport', 'City': 'Salzburg', 'Country': 'Austria'}, 'VIE': {'Name': 'Vienna International Airport', 'City': 'Vienna', 'Country': 'Austria'}, 'AVR': {'Name': 'Alverca Air Base', 'City': 'Alverca', 'Country': 'Portugal'}, 'SMA': {'Name': 'Santa Maria Airport', 'City': 'Santa Maria (island)', 'Country': 'Portugal'}, 'BGC': {'Name': 'Bragança Airport', 'City': 'Braganca', 'Country': 'Portugal'}, 'BYJ': {'Name': 'Beja Airport / Airbase', 'City': 'Beja (madeira)', 'Country': 'Portugal'}, 'BGZ': {'Name': 'Braga Municipal Aerodrome', 'City': 'Braga', 'Country': 'Portugal'}, 'CAT': {'Name': 'Cascais Airport', 'City': 'Cascais', 'Country': 'Portugal'}, 'FLW': {'Name': 'Flores Airport', 'City': 'Flores', 'Country': 'Portugal'}, 'FAO': {'Name': 'Faro Airport', 'City': 'Faro', 'Country': 'Portugal'}, 'GRW': {'Name': 'Graciosa Airport', 'City': 'Graciosa Island', 'Country': 'Portugal'}, 'HOR': {'Name': 'Horta Airport', 'City': 'Horta', 'Country': 'Portugal'}, 'TER': {'Name': 'Lajes Airport', 'City': 'Lajes (terceira Island)', 'Country': 'Portugal'}, 'QLR': {'Name': 'Monte Real Air Base', 'City': 'Monte Real', 'Country': 'Portugal'}, 'PDL': {'Name': 'João Paulo II Airport', 'City': 'Ponta Delgada', 'Country': 'Portugal'}, 'PIX': {'Name': 'Pico Airport', 'City': 'Pico', 'Country': 'Portugal'}, 'PRM': {'Name': 'Portimão Airport', 'City': 'Portimao', 'Country': 'Portugal'}, 'OPO': {'Name': 'Francisco de Sá Carneiro Airport', 'City': 'Porto', 'Country': 'Portugal'}, 'PXO': {'Name': 'Porto Santo Airport', 'City': 'Porto Santo', 'Country': 'Portugal'}, 'LIS': {'Name': 'Humberto Delgado Airport (Lisbon Portela Airport)', 'City': 'Lisbon', 'Country': 'Portugal'}, 'SJZ': {'Name': 'São Jorge Airport', 'City': 'Sao Jorge Island', 'Country': 'Portugal'}, 'VRL': {'Name': 'Vila Real Airport', 'City': 'Vila Real', 'Country': 'Portugal'}, 'VSE': {'Name': 'Aerodromo Goncalves Lobato (Viseu Airport)', 'City': 'Viseu', 'Country': 'Portugal'}, 'OMO': {'Name': 'Mostar International Airport', 'City': 'Mostar', 'Country': 'Bosnia and Herzegovina'}, 'SJJ': {'Name': 'Sarajevo International Airport', 'City': 'Sarajevo', 'Country': 'Bosnia and Herzegovina'}, 'ARW': {'Name': 'Arad International Airport', 'City': 'Arad', 'Country': 'Romania'}, 'BCM': {'Name': 'Bacău Airport', 'City': 'Bacau', 'Country': 'Romania'}, 'BAY': {'Name': 'Tautii Magheraus Airport', 'City': 'Baia Mare', 'Country': 'Romania'}, 'BBU': {'Name': 'Băneasa International Airport', 'City': 'Bucharest', 'Country': 'Romania'}, 'CND': {'Name': 'Mihail Kogălniceanu International Airport', 'City': 'Constanta', 'Country': 'Romania'}, 'CLJ': {'Name': 'Cluj-Napoca International Airport', 'City': 'Cluj-napoca', 'Country': 'Romania'}, 'CSB': {'Name': 'Caransebeş Airport', 'City': 'Caransebes', 'Country': 'Romania'}, 'CRA': {'Name': 'Craiova Airport', 'City': 'Craiova', 'Country': 'Romania'}, 'IAS': {'Name': 'Iaşi Airport', 'City': 'Iasi', 'Country': 'Romania'}, 'OMR': {'Name': 'Oradea International Airport', 'City': 'Oradea', 'Country': 'Romania'}, 'OTP': {'Name': 'Henri Coandă International Airport', 'City': 'Bucharest', 'Country': 'Romania'}, 'SBZ': {'Name': 'Sibiu International Airport', 'City': 'Sibiu', 'Country': 'Romania'}, 'SUJ': {'Name': 'Satu Mare Airport', 'City': 'Satu Mare', 'Country': 'Romania'}, 'SCV': {'Name': 'Suceava Stefan cel Mare Airport', 'City': 'Suceava', 'Country': 'Romania'}, 'TCE': {'Name': 'Tulcea Airport', 'City': 'Tulcea', 'Country': 'Romania'}, 'TGM': {'Name': 'Transilvania Târgu Mureş International Airport', 'City': 'Tirgu Mures', 'Country': 'Romania'}, 'TSR': {'Name': 'Timişoara Traian Vuia Airport', 'City': 'Timisoara', 'Country': 'Romania'}, 'GVA': {'Name': 'Geneva Cointrin International Airport', 'City': 'Geneva', 'Country': 'Switzerland'}, 'SIR': {'Name': 'Sion Airport', 'City': 'Sion', 'Country': 'Switzerland'}, 'EML': {'Name': 'Emmen Air Base', 'City': 'Emmen', 'Country': 'Switzerland'}, 'LUG': {'Name': 'Lugano Airport', 'City': 'Lugano', 'Country': 'Switzerland'}, 'BRN': {'Name': 'Bern Belp Airport', 'City': 'Bern', 'Country': 'Switzerland'}, 'ZHI': {'Name': 'Grenchen Airport', 'City': 'Grenchen', 'Country': 'Switzerland'}, 'ZRH': {'Name': 'Zürich Airport', 'City': 'Zurich', 'Country': 'Switzerland'}, 'ACH': {'Name': 'St Gallen Altenrhein Airport', 'City': 'Altenrhein', 'Country': 'Switzerland'}, 'SMV': {'Name': 'Samedan Airport', 'City': 'Samedan', 'Country': 'Switzerland'}, 'ESB': {'Name': 'Esenboğa International Airport', 'City': 'Ankara', 'Country': 'Turkey'}, 'ANK': {'Name': 'Etimesgut Air Base', 'City': 'Ankara', 'Country': 'Turkey'}, 'ADA': {'Name': 'Adana Airport', 'City': 'Adana', 'Country': 'Turkey'}, 'UAB': {'Name': 'İncirlik Air Base', 'City': 'Adana', 'Country': 'Turkey'}, 'AFY': {'Name': 'Afyon Airport', 'City': 'Afyon', 'Country': 'Turkey'}, 'AYT': {'Name': 'Antalya International Airport', 'City': 'Antalya', 'Country': 'Turkey'}, 'GZT': {'Name': 'Gaziantep International Airport', 'City': 'Gaziantep', 'Country': 'Turkey'}, 'KYA': {'Name': 'Konya Airport', 'City': 'Konya', 'Country': 'Turkey'}, 'MZH': {'Name': 'Amasya Merzifon Airport', 'City': 'Merzifon', 'Country': 'Turkey'}, 'VAS': {'Name': 'Sivas Nuri Demirağ Airport', 'City': 'Sivas', 'Country': 'Turkey'}, 'MLX': {'Name': 'Malatya Erhaç Airport', 'City': 'Malatya', 'Country': 'Turkey'}, 'ASR': {'Name': 'Kayseri Erkilet Airport', 'City': 'Kayseri', 'Country': 'Turkey'}, 'TJK': {'Name': 'Tokat Airport', 'City': 'Tokat', 'Country': 'Turkey'}, 'DNZ': {'Name': 'Çardak Airport', 'City': 'Denizli', 'Country': 'Turkey'}, 'ISL': {'Name': 'Atatürk International Airport', 'City': 'Istanbul', 'Country': 'Turkey'}, 'BZI': {'Name': 'Balıkesir Merkez Airport', 'City': 'Balikesir', 'Country': 'Turkey'}, 'BDM': {'Name': 'Bandırma Airport', 'City': 'Bandirma', 'Country': 'Turkey'}, 'ESK': {'Name': 'Eskişehir Air Base', 'City': 'Eskisehir', 'Country': 'Turkey'}, 'ADB': {'Name': 'Adnan Menderes International Airport', 'City': 'Izmir', 'Country': 'Turkey'}, 'IGL': {'Name': 'Çiğli Airport', 'City': 'Izmir', 'Country': 'Turkey'}, 'KCO': {'Name': 'Cengiz Topel Airport', 'City': 'Topel', 'Country': 'Turkey'}, 'DLM': {'Name': 'Dalaman International Airport', 'City': 'Dalaman', 'Country': 'Turkey'}, 'BXN': {'Name': 'Imsık Airport', 'City': 'Bodrum', 'Country': 'Turkey'}, 'EZS': {'Name': 'Elazığ Airport', 'City': 'Elazig', 'Country': 'Turkey'}, 'DIY': {'Name': 'Diyarbakir Airport', 'City': 'Diyabakir', 'Country': 'Turkey'}, 'ERC': {'Name': 'Erzincan Airport', 'City': 'Erzincan', 'Country': 'Turkey'}, 'ERZ': {'Name': 'Erzurum International Airport', 'City': 'Erzurum', 'Country': 'Turkey'}, 'TZX': {'Name': 'Trabzon International Airport', 'City': 'Trabzon', 'Country': 'Turkey'}, 'VAN': {'Name': 'Van Ferit Melen Airport', 'City': 'Van', 'Country': 'Turkey'}, 'BAL': {'Name': 'Batman Airport', 'City': 'Batman', 'Country': 'Turkey'}, 'SXZ': {'Name': 'Siirt Airport', 'City': 'Siirt', 'Country': 'Turkey'}, 'BZY': {'Name': 'Bălți International Airport', 'City': 'Saltsy', 'Country': 'Moldova'}, 'KIV': {'Name': 'Chişinău International Airport', 'City': 'Chisinau', 'Country': 'Moldova'}, 'OHD': {'Name': 'Ohrid St. Paul the Apostle Airport', 'City': 'Ohrid', 'Country': 'Macedonia'}, 'SKP': {'Name': 'Skopje Alexander the Great Airport', 'City': 'Skopje', 'Country': 'Macedonia'}, 'GIB': {'Name': 'Gibraltar Airport', 'City': 'Gibraltar', 'Country': 'Gibraltar'}, 'BEG': {'Name': 'Belgrade Nikola Tesla Airport', 'City': 'Belgrade', 'Country': 'Serbia'}, 'INI': {'Name': 'Nis Airport', 'City': 'Nis', 'Country': 'Serbia'}, 'TGD': {'Name': 'Podgorica Airport', 'City': 'Podgorica', 'Country': 'Montenegro'}, 'PRN': {'Name': 'Priština International Airport', 'City': 'Pristina', 'Country': 'Serbia'}, 'TIV': {'Name': 'Tivat Airport', 'City': 'Tivat', 'Country': 'Montenegro'}, 'BTS': {'Name': 'M. R. Štefánik Airport', 'City': 'Bratislava', 'Country': 'Slovakia'}, 'KSC': {'Name': 'Košice Airport', 'City': 'Kosice', 'Country': 'Slovakia'}, 'PZY': {'Name': 'Piešťany Airport', 'City': 'Piestany', 'Country': 'Slovakia'}, 'SLD': {'Name': 'Sliač Airport', 'City': 'Sliac', 'Country': 'Slovakia'}, 'TAT': {'Name': 'Poprad-Tatry Airport', 'City': 'Poprad', 'Country': 'Slovakia'}, 'NCA': {'Name': 'North Caicos Airport', 'City': 'North Caicos', 'Country': 'Turks and Caicos Islands'}, 'PLS': {'Name': 'Providenciales Airport', 'City': 'Providenciales', 'Country': 'Turks and Caicos Islands'}, 'XSC': {'Name': 'South Caicos Airport', 'City': 'South Caicos', 'Country': 'Turks and Caicos Islands'}, 'BRX': {'Name': 'Maria Montez International Airport', 'City': 'Barahona', 'Country': 'Dominican Republic'}, 'CBJ': {'Name': 'Cabo Rojo Airport', 'City': 'Cabo Rojo', 'Country': 'Dominican Republic'}, 'LRM': {'Name': 'Casa De Campo International Airport', 'City': 'La Romana', 'Country': 'Dominican Republic'}, 'PUJ': {'Name': 'Punta Cana International Airport', 'City': 'Punta Cana', 'Country': 'Dominican Republic'}, 'POP': {'Name': 'Gregorio Luperon International Airport', 'City': 'Puerto Plata', 'Country': 'Dominican Republic'}, 'SDQ': {'Name': 'Las Américas International Airport', 'City': 'Santo Domingo', 'Country': 'Dominican Republic'}, 'STI': {'Name': 'Cibao International Airport', 'City': 'Santiago', 'Country': 'Dominican Republic'}, 'CBV': {'Name': 'Coban Airport', 'City': 'Coban', 'Country': 'Guatemala'}, 'GUA': {'Name': 'La Aurora Airport', 'City': 'Guatemala City', 'Country': 'Guatemala'}, 'RER': {'Name': 'Retalhuleu Airport', 'City': 'Retalhuleu', 'Country': 'Guatemala'}, 'GSJ': {'Name': 'San José Airport', 'City': 'San Jose', 'Country': 'Guatemala'}, 'LCE': {'Name': 'Goloson International Airport', 'City': 'La Ceiba', 'Country': 'Honduras'}, 'SAP': {'Name': 'Ramón Villeda Morales International Airport', 'City': 'San Pedro Sula', 'Country': 'Honduras'}, 'GJA': {'Name': 'La Laguna Airport', 'City': 'Guanaja', 'Country': 'Honduras'}, 'RTB': {'Name': 'Juan Manuel Galvez International Airport', 'City': 'Roatan', 'Country': 'Honduras'}, 'TEA': {'Name': 'Tela Airport', 'City': 'Tela', 'Country': 'Honduras'}, 'TGU': {'Name': 'Toncontín International Airport', 'City': 'Tegucigalpa', 'Country': 'Honduras'}, 'TJI': {'Name': 'Trujillo Airport', 'City': 'Trujillo', 'Country': 'Honduras'}, 'OCJ': {'Name': 'Boscobel Aerodrome', 'City': 'Ocho Rios', 'Country': 'Jamaica'}, 'KIN': {'Name': 'Norman Manley International Airport', 'City': 'Kingston', 'Country': 'Jamaica'}, 'MBJ': {'Name': 'Sangster International Airport', 'City': 'Montego Bay', 'Country': 'Jamaica'}, 'POT': {'Name': 'Ken Jones Airport', 'City': 'Port Antonio', 'Country': 'Jamaica'}, 'KTP': {'Name': 'Tinson Pen Airport', 'City': 'Kingston', 'Country': 'Jamaica'}, 'ACA': {'Name': 'General Juan N Alvarez International Airport', 'City': 'Acapulco', 'Country': 'Mexico'}, 'NTR': {'Name': 'Del Norte International Airport', 'City': 'Monterrey', 'Country': 'Mexico'}, 'AGU': {'Name': 'Jesús Terán Paredo International Airport', 'City': 'Aguascalientes', 'Country': 'Mexico'}, 'HUX': {'Name': 'Bahías de Huatulco International Airport', 'City': 'Huatulco', 'Country': 'Mexico'}, 'CVJ': {'Name': 'General Mariano Matamoros Airport', 'City': 'Cuernavaca', 'Country': 'Mexico'}, 'ACN': {'Name': 'Ciudad Acuña New International Airport', 'City': 'Ciudad Acuna', 'Country': 'Mexico'}, 'CME': {'Name': 'Ciudad del Carmen International Airport', 'City': 'Ciudad Del Carmen', 'Country': 'Mexico'}, 'NCG': {'Name': 'Nuevo Casas Grandes Airport', 'City': 'Nuevo Casas Grandes', 'Country': 'Mexico'}, 'CUL': {'Name': 'Bachigualato Federal International Airport', 'City': 'Culiacan', 'Country': 'Mexico'}, 'CTM': {'Name': 'Chetumal International Airport', 'City': 'Chetumal', 'Country': 'Mexico'}, 'CEN': {'Name': 'Ciudad Obregón International Airport', 'City': 'Ciudad Obregon', 'Country': 'Mexico'}, 'CPE': {'Name': 'Ingeniero Alberto Acuña Ongay International Airport', 'City': 'Campeche', 'Country': 'Mexico'}, 'CJS': {'Name': 'Abraham González International Airport', 'City': 'Ciudad Juarez', 'Country': 'Mexico'}, 'CUU': {'Name': 'General Roberto Fierro Villalobos International Airport', 'City': 'Chihuahua', 'Country': 'Mexico'}, 'CVM': {'Name': 'General Pedro Jose Mendez International Airport', 'City': 'Ciudad Victoria', 'Country': 'Mexico'}, 'CZM': {'Name': 'Cozumel International Airport', 'City': 'Cozumel', 'Country': 'Mexico'}, 'DGO': {'Name': 'General Guadalupe Victoria International Airport', 'City': 'Durango', 'Country': 'Mexico'}, 'TPQ': {'Name': 'Amado Nervo National Airport', 'City': 'Tepic', 'Country': 'Mexico'}, 'ESE': {'Name': 'Ensenada International Airport', 'City': 'Ensenada', 'Country': 'Mexico'}, 'GDL': {'Name': 'Don Miguel Hidalgo Y Costilla International Airport', 'City': 'Guadalajara', 'Country': 'Mexico'}, 'GYM': {'Name': 'General José María Yáñez International Airport', 'City': 'Guaymas', 'Country': 'Mexico'}, 'TCN': {'Name': 'Tehuacan Airport', 'City': 'Tehuacan', 'Country': 'Mexico'}, 'HMO': {'Name': 'General Ignacio P. Garcia International Airport', 'City': 'Hermosillo', 'Country': 'Mexico'}, 'CLQ': {'Name': 'Licenciado Miguel de la Madrid Airport', 'City': 'Colima', 'Country': 'Mexico'}, 'ISJ': {'Name': 'Isla Mujeres Airport', 'City': 'Isla Mujeres', 'Country': 'Mexico'}, 'SLW': {'Name': 'Plan De Guadalupe International Airport', 'City': 'Saltillo', 'Country': 'Mexico'}, 'IZT': {'Name': 'Ixtepec Airport', 'City': 'Iztepec', 'Country': 'Mexico'}, 'LZC': {'Name': 'Lázaro Cárdenas Airport', 'City': 'Lazard Cardenas', 'Country': 'Mexico'}, 'LMM': {'Name': 'Valle del Fuerte International Airport', 'City': 'Los Mochis', 'Country': 'Mexico'}, 'BJX': {'Name': 'Del Bajío International Airport', 'City': 'Del Bajio', 'Country': 'Mexico'}, 'LAP': {'Name': 'Manuel Márquez de León International Airport', 'City': 'La Paz', 'Country': 'Mexico'}, 'LTO': {'Name': 'Loreto International Airport', 'City': 'Loreto', 'Country': 'Mexico'}, 'MAM': {'Name': 'General Servando Canales International Airport', 'City': 'Matamoros', 'Country': 'Mexico'}, 'MID': {'Name': 'Licenciado Manuel Crescencio Rejon Int Airport', 'City': 'Merida', 'Country': 'Mexico'}, 'MXL': {'Name': 'General Rodolfo Sánchez Taboada International Airport', 'City': 'Mexicali', 'Country': 'Mexico'}, 'MLM': {'Name': 'General Francisco J. Mujica International Airport', 'City': 'Morelia', 'Country': 'Mexico'}, 'MTT': {'Name': 'Minatitlán/Coatzacoalcos National Airport', 'City': 'Minatitlan', 'Country': 'Mexico'}, 'LOV': {'Name': 'Monclova International Airport', 'City': 'Monclova', 'Country': 'Mexico'}, 'MEX': {'Name': 'Licenciado Benito Juarez International Airport', 'City': 'Mexico City', 'Country': 'Mexico'}, 'MTY': {'Name': 'General Mariano Escobedo International Airport', 'City': 'Monterrey', 'Country': 'Mexico'}, 'MZT': {'Name': 'General Rafael Buelna International Airport', 'City': 'Mazatlan', 'Country': 'Mexico'}, 'NOG': {'Name': 'Nogales International Airport', 'City': 'Nogales', 'Country': 'Mexico'}, 'NLD': {'Name': 'Quetzalcóatl International Airport', 'City': 'Nuevo Laredo', 'Country': 'Mexico'}, 'OAX': {'Name': 'Xoxocotlán International Airport', 'City': 'Oaxaca', 'Country': 'Mexico'}, 'PAZ': {'Name': 'El Tajín National Airport', 'City': 'Poza Rico', 'Country': 'Mexico'}, 'PBC': {'Name': 'Hermanos Serdán International Airport', 'City': 'Puebla', 'Country': 'Mexico'}, 'PPE': {'Name': 'Mar de Cortés International Airport', 'City': 'Punta Penasco', 'Country': 'Mexico'}, 'PDS': {'Name': 'Piedras Negras International Airport', 'City': 'Piedras Negras', 'Country': 'Mexico'}, 'UPN': {'Name': 'Licenciado y General Ignacio Lopez Rayon Airport', 'City': 'Uruapan', 'Country': 'Mexico'}, 'PVR': {'Name': 'Licenciado Gustavo Díaz Ordaz International Airport', 'City': 'Puerto Vallarta', 'Country': 'Mexico'}, 'PXM': {'Name': 'Puerto Escondido International Airport', 'City': 'Puerto Escondido', 'Country': 'Mexico'}, 'QRO': {'Name': 'Querétaro Intercontinental Airport', 'City': 'Queretaro', 'Country': 'Mexico'}, 'REX': {'Name': 'General Lucio Blanco International Airport', 'City': 'Reynosa', 'Country': 'Mexico'}, 'SJD': {'Name': 'Los Cabos International Airport', 'City': 'San Jose Del Cabo', 'Country': 'Mexico'}, 'SFH': {'Name': 'San Felipe International Airport', 'City': 'San Filipe', 'Country': 'Mexico'}, 'SLP': {'Name': 'Ponciano Arriaga International Airport', 'City': 'San Luis Potosi', 'Country': 'Mexico'}, 'TRC': {'Name': 'Francisco Sarabia International Airport', 'City': 'Torreon', 'Country': 'Mexico'}, 'TGZ': {'Name': 'Angel Albino Corzo International Airport', 'City': 'Tuxtla Gutierrez', 'Country': 'Mexico'}, 'TIJ': {'Name': 'General Abelardo L. Rodríguez International Airport', 'City': 'Tijuana', 'Country': 'Mexico'}, 'TAM': {'Name': 'General Francisco Javier Mina International Airport', 'City': 'Tampico', 'Country': 'Mexico'}, 'TSL': {'Name': 'Tamuin Airport', 'City': 'Tamuin', 'Country': 'Mexico'}, 'TLC': {'Name': 'Licenciado Adolfo Lopez Mateos International Airport', 'City': 'Toluca', 'Country': 'Mexico'}, 'TAP': {'Name': 'Tapachula International Airport', 'City': 'Tapachula', 'Country': 'Mexico'}, 'CUN': {'Name': 'Cancún International Airport', 'City': 'Cancun', 'Country': 'Mexico'}, 'VSA': {'Name': 'Carlos Rovirosa Pérez International Airport', 'City': 'Villahermosa', 'Country': 'Mexico'}, 'VER': {'Name': 'General Heriberto Jara International Airport', 'City': 'Vera Cruz', 'Country': 'Mexico'}, 'ZCL': {'Name': 'General Leobardo C. Ruiz International Airport', 'City': 'Zacatecas', 'Country': 'Mexico'}, 'ZIH': {'Name': 'Ixtapa Zihuatanejo International Airport', 'City': 'Zihuatanejo', 'Country': 'Mexico'}, 'ZMM': {'Name': 'Zamora Airport', 'City': 'Zamora', 'Country': 'Mexico'}, 'ZLO': {'Name': 'Playa De Oro International Airport', 'City': 'Manzanillo', 'Country': 'Mexico'}, 'BEF': {'Name': 'Bluefields Airport', 'City': 'Bluefields', 'Country': 'Nicaragua'}, 'MGA': {'Name': 'Augusto C. Sandino (Managua) International Airport', 'City': 'Managua', 'Country': 'Nicaragua'}, 'PUZ': {'Name': 'Puerto Cabezas Airport', 'City': 'Puerto Cabezas', 'Country': 'Nicaragua'}, 'BOC': {'Name': 'Bocas Del Toro International Airport', 'City': 'Bocas Del Toro', 'Country': 'Panama'}, 'CHX': {'Name': 'Cap Manuel Niño International Airport', 'City': 'Changuinola', 'Country': 'Panama'}, 'DAV': {'Name': 'Enrique Malek International Airport', 'City': 'David', 'Country': 'Panama'}, 'BLB': {'Name': 'Panama Pacific International Airport', 'City': 'Howard', 'Country': 'Panama'}, 'PAC': {'Name': 'Marcos A. Gelabert International Airport', 'City': 'Panama', 'Country': 'Panama'}, 'SYP': {'Name': 'Ruben Cantu Airport', 'City': 'Santiago', 'Country': 'Panama'}, 'PTY': {'Name': 'Tocumen International Airport', 'City': 'Panama City', 'Country': 'Panama'}, 'BAI': {'Name': 'Buenos Aires Airport', 'City': 'Buenos Aires', 'Country': 'Costa Rica'}, 'OTR': {'Name': 'Coto 47 Airport', 'City': 'Coto 47', 'Country': 'Costa Rica'}, 'JAP': {'Name': 'Chacarita Airport', 'City': 'Chacarita', 'Country': 'Costa Rica'}, 'GLF': {'Name': 'Golfito Airport', 'City': 'Golfito', 'Country': 'Costa Rica'}, 'GPL': {'Name': 'Guapiles Airport', 'City': 'Guapiles', 'Country': 'Costa Rica'}, 'LIR': {'Name': 'Daniel Oduber Quiros International Airport', 'City': 'Liberia', 'Country': 'Costa Rica'}, 'LSL': {'Name': 'Los Chiles Airport', 'City': 'Los Chiles', 'Country': 'Costa Rica'}, 'LIO': {'Name': 'Limon International Airport', 'City': 'Limon', 'Country': 'Costa Rica'}, 'NOB': {'Name': 'Nosara Airport', 'City': 'Nosara Beach', 'Country': 'Costa Rica'}, 'SJO': {'Name': 'Juan Santamaria International Airport', 'City': 'San Jose', 'Country': 'Costa Rica'}, 'PMZ': {'Name': 'Palmar Sur Airport', 'City': 'Palmar Sur', 'Country': 'Costa Rica'}, 'XQP': {'Name': 'Quepos Managua Airport', 'City': 'Quepos', 'Country': 'Costa Rica'}, 'TOO': {'Name': 'San Vito De Java Airport', 'City': 'San Vito De Jaba', 'Country': 'Costa Rica'}, 'SAL': {'Name': 'Monseñor Óscar Arnulfo Romero International Airport', 'City': 'San Salvador', 'Country': 'El Salvador'}, 'CYA': {'Name': 'Les Cayes Airport', 'City': 'Cayes', 'Country': 'Haiti'}, 'CAP': {'Name': 'Cap Haitien International Airport', 'City': 'Cap Haitien', 'Country': 'Haiti'}, 'JAK': {'Name': 'Jacmel Airport', 'City': 'Jacmel', 'Country': 'Haiti'}, 'PAP': {'Name': 'Toussaint Louverture International Airport', 'City': 'Port-au-prince', 'Country': 'Haiti'}, 'BCA': {'Name': 'Gustavo Rizo Airport', 'City': 'Baracoa Playa', 'Country': 'Cuba'}, 'BYM': {'Name': 'Carlos Manuel de Cespedes Airport', 'City': 'Bayamo', 'Country': 'Cuba'}, 'AVI': {'Name': 'Maximo Gomez Airport', 'City': 'Ciego De Avila', 'Country': 'Cuba'}, 'CCC': {'Name': 'Jardines Del Rey Airport', 'City': 'Cunagua', 'Country': 'Cuba'}, 'CFG': {'Name': 'Jaime Gonzalez Airport', 'City': 'Cienfuegos', 'Country': 'Cuba'}, 'CYO': {'Name': 'Vilo Acuña International Airport', 'City': 'Cayo Largo del Sur', 'Country': 'Cuba'}, 'CMW': {'Name': 'Ignacio Agramonte International Airport', 'City': 'Camaguey', 'Country': 'Cuba'}, 'SCU': {'Name': 'Antonio Maceo International Airport', 'City': 'Santiago De Cuba', 'Country': 'Cuba'}, 'NBW': {'Name': 'Leeward Point Field', 'City': 'Guantanamo', 'Country': 'Cuba'}, 'GAO': {'Name': 'Mariana Grajales Airport', 'City': 'Guantanamo', 'Country': 'Cuba'}, 'HAV': {'Name': 'José Martí International Airport', 'City': 'Havana', 'Country': 'Cuba'}, 'HOG': {'Name': 'Frank Pais International Airport', 'City': 'Holguin', 'Country': 'Cuba'}, 'LCL': {'Name': 'La Coloma Airport', 'City': 'La Coloma', 'Country': 'Cuba'}, 'MOA': {'Name': 'Orestes Acosta Airport', 'City': 'Moa', 'Country': 'Cuba'}, 'MZO': {'Name': 'Sierra Maestra Airport', 'City': 'Manzanillo', 'Country': 'Cuba'}, 'GER': {'Name': 'Rafael Cabrera Airport', 'City': 'Nueva Gerona', 'Country': 'Cuba'}, 'UPB': {'Name': 'Playa Baracoa Airport', 'City': 'Baracoa Playa', 'Country': 'Cuba'}, 'QPD': {'Name': 'Pinar Del Rio Airport', 'City': 'Pinar Del Rio Norte', 'Country': 'Cuba'}, 'SNU': {'Name': 'Abel Santamaria Airport', 'City': 'Santa Clara', 'Country': 'Cuba'}, 'SZJ': {'Name': 'Siguanea Airport', 'City': 'Siguanea', 'Country': 'Cuba'}, 'USS': {'Name': 'Sancti Spiritus Airport', 'City': 'Sancti Spiritus', 'Country': 'Cuba'}, 'VRA': {'Name': 'Juan Gualberto Gomez International Airport', 'City': 'Varadero', 'Country': 'Cuba'}, 'VTU': {'Name': 'Hermanos Ameijeiras Airport', 'City': 'Las Tunas', 'Country': 'Cuba'}, 'CYB': {'Name': 'Gerrard Smith International Airport', 'City': 'Cayman Brac', 'Country': 'Cayman Islands'}, 'GCM': {'Name': 'Owen Roberts International Airport', 'City': 'Georgetown', 'Country': 'Cayman Islands'}, 'MAY': {'Name': 'Clarence A. Bain Airport', 'City': 'Clarence Bain', 'Country': 'Bahamas'}, 'ASD': {'Name': 'Andros Town Airport', 'City': 'Andros Town', 'Country': 'Bahamas'}, 'MHH': {'Name': 'Leonard M Thompson International Airport', 'City': 'Marsh Harbor', 'Country': 'Bahamas'}, 'SAQ': {'Name': 'San Andros Airport', 'City': 'San Andros', 'Country': 'Bahamas'}, 'AXP': {'Name': 'Spring Point Airport', 'City': 'Spring Point', 'Country': 'Bahamas'}, 'TCB': {'Name': 'Treasure Cay Airport', 'City': 'Treasure Cay', 'Country': 'Bahamas'}, 'CCZ': {'Name': 'Chub Cay Airport', 'City': 'Chub Cay', 'Country': 'Bahamas'}, 'GHC': {'Name': 'Great Harbour Cay Airport', 'City': 'Bullocks Harbour', 'Country': 'Bahamas'}, 'BIM': {'Name': 'South Bimini Airport', 'City': 'Alice Town', 'Country': 'Bahamas'}, 'GGT': {'Name': 'Exuma International Airport', 'City': 'Great Exuma', 'Country': 'Bahamas'}, 'ELH': {'Name': 'North Eleuthera Airport', 'City': 'North Eleuthera', 'Country': 'Bahamas'}, 'GHB': {'Name': "Governor's Harbour Airport", 'City': "Governor's Harbor", 'Country': 'Bahamas'}, 'NMC': {'Name': 'Normans Cay Airport', 'City': "Norman's Cay", 'Country': 'Bahamas'}, 'RSD': {'Name': 'Rock Sound Airport', 'City': 'Rock Sound', 'Country': 'Bahamas'}, 'TYM': {'Name': 'Staniel Cay Airport', 'City': 'Staniel Cay', 'Country': 'Bahamas'}, 'FPO': {'Name': 'Grand Bahama International Airport', 'City': 'Freeport', 'Country': 'Bahamas'}, 'IGA': {'Name': 'Inagua Airport', 'City': 'Matthew Town', 'Country': 'Bahamas'}, 'LGI': {'Name': "Deadman's Cay Airport", 'City': "Dead Man's Cay", 'Country': 'Bahamas'}, 'SML': {'Name': 'Stella Maris Airport', 'City': 'Stella Maris', 'Country': 'Bahamas'}, 'MYG': {'Name': 'Mayaguana Airport', 'City': 'Mayaguana', 'Country': 'Bahamas'}, 'NAS': {'Name': 'Lynden Pindling International Airport', 'City': 'Nassau', 'Country': 'Bahamas'}, 'DCT': {'Name': 'Duncan Town Airport', 'City': 'Duncan Town', 'Country': 'Bahamas'}, 'RCY': {'Name': 'Rum Cay Airport', 'City': 'Port Nelson', 'Country': 'Bahamas'}, 'ZSA': {'Name': 'San Salvador Airport', 'City': 'Cockburn Town', 'Country': 'Bahamas'}, 'BZE': {'Name': 'Philip S. W. Goldson International Airport', 'City': 'Belize City', 'Country': 'Belize'}, 'AIT': {'Name': 'Aitutaki Airport', 'City': 'Aitutaki', 'Country': 'Cook Islands'}, 'RAR': {'Name': 'Rarotonga International Airport', 'City': 'Avarua', 'Country': 'Cook Islands'}, 'NAN': {'Name': 'Nadi International Airport', 'City': 'Nandi', 'Country': 'Fiji'}, 'SUV': {'Name': 'Nausori International Airport', 'City': 'Nausori', 'Country': 'Fiji'}, 'TBU': {'Name': "Fua'amotu International Airport", 'City': 'Tongatapu', 'Country': 'Tonga'}, 'VAV': {'Name': "Vava'u International Airport", 'City': "Vava'u", 'Country': 'Tonga'}, 'TRW': {'Name': 'Bonriki International Airport', 'City': 'Tarawa', 'Country': 'Kiribati'}, 'TBF': {'Name': 'Tabiteuea North Airport', 'City': 'Tabiteuea North', 'Country': 'Kiribati'}, 'WLS': {'Name': 'Hihifo Airport', 'City': 'Wallis', 'Country': 'Wallis and Futuna'}, 'APW': {'Name': 'Faleolo International Airport', 'City': 'Faleolo', 'Country': 'Samoa'}, 'PPG': {'Name': 'Pago Pago International Airport', 'City': 'Pago Pago', 'Country': 'American Samoa'}, 'RUR': {'Name': 'Rurutu Airport', 'City': 'Rurutu', 'Country': 'French Polynesia'}, 'TUB': {'Name': 'Tubuai Airport', 'City': 'Tubuai', 'Country': 'French Polynesia'}, 'AAA': {'Name': 'Anaa Airport', 'City': 'Anaa', 'Country': 'French Polynesia'}, 'FGU': {'Name': 'Fangatau Airport', 'City': 'Fangatau', 'Country': 'French Polynesia'}, 'TIH': {'Name': 'Tikehau Airport', 'City': 'Tikehau', 'Country': 'French Polynesia'}, 'REA': {'Name': 'Reao Airport', 'City': 'Reao', 'Country': 'French Polynesia'}, 'FAV': {'Name': 'Fakarava Airport', 'City': 'Fakarava', 'Country': 'French Polynesia'}, 'XMH': {'Name': 'Manihi Airport', 'City': 'Manihi', 'Country': 'French Polynesia'}, 'GMR': {'Name': 'Totegegie Airport', 'City': 'Totegegie', 'Country': 'French Polynesia'}, 'KKR': {'Name': 'Kaukura Airport', 'City': 'Kaukura Atoll', 'Country': 'French Polynesia'}, 'MKP': {'Name': 'Makemo Airport', 'City': 'Makemo', 'Country': 'French Polynesia'}, 'PKP': {'Name': 'Puka Puka Airport', 'City': 'Puka Puka', 'Country': 'French Polynesia'}, 'TKP': {'Name': 'Takapoto Airport', 'City': 'Takapoto', 'Country': 'French Polynesia'}, 'AXR': {'Name': 'Arutua Airport', 'City': 'Arutua', 'Country': 'French Polynesia'}, 'MVT': {'Name': 'Mataiva Airport', 'City': 'Mataiva', 'Country': 'French Polynesia'}, 'TKX': {'Name': 'Takaroa Airport', 'City': 'Takaroa', 'Country': 'French Polynesia'}, 'NHV': {'Name': 'Nuku Hiva Airport', 'City': 'Nuku Hiva', 'Country': 'French Polynesia'}, 'BOB': {'Name': 'Bora Bora Airport', 'City': 'Bora Bora', 'Country': 'French Polynesia'}, 'RGI': {'Name': 'Rangiroa Airport', 'City': 'Rangiroa', 'Country': 'French Polynesia'}, 'HUH': {'Name': 'Huahine-Fare Airport', 'City': 'Huahine Island', 'Country': 'French Polynesia'}, 'MOZ': {'Name': 'Moorea Airport', 'City': 'Moorea', 'Country': 'French Polynesia'}, 'HOI': {'Name': 'Hao Airport', 'City': 'Hao Island', 'Country': 'French Polynesia'}, 'MAU': {'Name': 'Maupiti Airport', 'City': 'Maupiti', 'Country': 'French Polynesia'}, 'RFP': {'Name': 'Raiatea Airport', 'City': 'Raiatea Island', 'Country': 'French Polynesia'}, 'VLI': {'Name': 'Bauerfield International Airport', 'City': 'Port-vila', 'Country': 'Vanuatu'}, 'KNQ': {'Name': 'Koné Airport', 'City': 'Kone', 'Country': 'New Caledonia'}, 'KOC': {'Name': 'Koumac Airport', 'City': 'Koumac', 'Country': 'New Caledonia'}, 'LIF': {'Name': 'Lifou Airport', 'City': 'Lifou', 'Country': 'New Caledonia'}, 'GEA': {'Name': 'Nouméa Magenta Airport', 'City': 'Noumea', 'Country': 'New Caledonia'}, 'MEE': {'Name': 'Maré Airport', 'City': 'Mare', 'Country': 'New Caledonia'}, 'TOU': {'Name': 'Touho Airport', 'City': 'Touho', 'Country': 'New Caledonia'}, 'UVE': {'Name': 'Ouvéa Airport', 'City': 'Ouvea', 'Country': 'New Caledonia'}, 'NOU': {'Name': 'La Tontouta International Airport', 'City': 'Noumea', 'Country': 'New Caledonia'}, 'AKL': {'Name': 'Auckland International Airport', 'City': 'Auckland', 'Country': 'New Zealand'}, 'TUO': {'Name': 'Taupo Airport', 'City': 'Taupo', 'Country': 'New Zealand'}, 'AMZ': {'Name': 'Ardmore Airport', 'City': 'Ardmore', 'Country': 'New Zealand'}, 'CHC': {'Name': 'Christchurch International Airport', 'City': 'Christchurch', 'Country': 'New Zealand'}, 'CHT': {'Name': 'Chatham Islands-Tuuta Airport', 'City': 'Chatham Island', 'Country': 'New Zealand'}, 'DUD': {'Name': 'Dunedin Airport', 'City': 'Dunedin', 'Country': 'New Zealand'}, 'GIS': {'Name': 'Gisborne Airport', 'City': 'Gisborne', 'Country': 'New Zealand'}, 'GTN': {'Name': 'Glentanner Airport', 'City': 'Glentanner', 'Country': 'New Zealand'}, 'HKK': {'Name': 'Hokitika Airfield', 'City': 'Hokitika', 'Country': 'New Zealand'}, 'HLZ': {'Name': 'Hamilton International Airport', 'City': 'Hamilton', 'Country': 'New Zealand'}, 'KKE': {'Name': 'Kerikeri Airport', 'City': 'Kerikeri', 'Country': 'New Zealand'}, 'KAT': {'Name': 'Kaitaia Airport', 'City': 'Kaitaia', 'Country': 'New Zealand'}, 'ALR': {'Name': 'Alexandra Airport', 'City': 'Alexandra', 'Country': 'New Zealand'}, 'MON': {'Name': 'Mount Cook Airport', 'City': 'Mount Cook', 'Country': 'New Zealand'}, 'TEU': {'Name': 'Manapouri Airport', 'City': 'Manapouri', 'Country': 'New Zealand'}, 'MRO': {'Name': 'Hood Airport', 'City': 'Masterton', 'Country': 'New Zealand'}, 'NPL': {'Name': 'New Plymouth Airport', 'City': 'New Plymouth', 'Country': 'New Zealand'}, 'NSN': {'Name': 'Nelson Airport', 'City': 'Nelson', 'Country': 'New Zealand'}, 'IVC': {'Name': 'Invercargill Airport', 'City': 'Invercargill', 'Country': 'New Zealand'}, 'OHA': {'Name': 'RNZAF Base Ohakea', 'City': 'Ohakea', 'Country': 'New Zealand'}, 'OAM': {'Name': 'Oamaru Airport', 'City': 'Oamaru', 'Country': 'New Zealand'}, 'PMR': {'Name': 'Palmerston North Airport', 'City': 'Palmerston North', 'Country': 'New Zealand'}, 'PPQ': {'Name': 'Paraparaumu Airport', 'City': 'Paraparaumu', 'Country': 'New Zealand'}, 'ZQN': {'Name': 'Queenstown International Airport', 'City': 'Queenstown International', 'Country': 'New Zealand'}, 'ROT': {'Name': 'Rotorua Regional Airport', 'City': 'Rotorua', 'Country': 'New Zealand'}, 'TRG': {'Name': 'Tauranga Airport', 'City': 'Tauranga', 'Country': 'New Zealand'}, 'TIU': {'Name': 'Timaru Airport', 'City': 'Timaru', 'Country': 'New Zealand'}, 'TWZ': {'Name': 'Pukaki Airport', 'City': 'Pukaki', 'Country': 'New Zealand'}, 'BHE': {'Name': 'Woodbourne Airport', 'City': 'Woodbourne', 'Country': 'New Zealand'}, 'WKA': {'Name': 'Wanaka Airport', 'City': 'Wanaka', 'Country': 'New Zealand'}, 'WHK': {'Name': 'Whakatane Airport', 'City': 'Whakatane', 'Country': 'New Zealand'}, 'WLG': {'Name': 'Wellington International Airport', 'City': 'Wellington', 'Country': 'New Zealand'}, 'WIR': {'Name': 'Wairoa Airport', 'City': 'Wairoa', 'Country': 'New Zealand'}, 'WRE': {'Name': 'Whangarei Airport', 'City': 'Whangarei', 'Country': 'New Zealand'}, 'WSZ': {'Name': 'Westport Airport', 'City': 'Westport', 'Country': 'New Zealand'}, 'WAG': {'Name': 'Wanganui Airport', 'City': 'Wanganui', 'Country': 'New Zealand'}, 'HEA': {'Name': 'Herat Airport', 'City': 'Herat', 'Country': 'Afghanistan'}, 'JAA': {'Name': 'Jalalabad Airport', 'City': 'Jalalabad', 'Country': 'Afghanistan'}, 'KBL': {'Name': 'Hamid Karzai International Airport', 'City': 'Kabul', 'Country': 'Afghanistan'}, 'KDH': {'Name': 'Kandahar Airport', 'City': 'Kandahar', 'Country': 'Afghanistan'}, 'MMZ': {'Name': 'Maimana Airport', 'City': 'Maimama', 'Country': 'Afghanistan'}, 'MZR': {'Name': 'Mazar I Sharif Airport', 'City': 'Mazar-i-sharif', 'Country': 'Afghanistan'}, 'OAH': {'Name': 'Shindand Airport', 'City': 'Shindand', 'Country': 'Afghanistan'}, 'UND': {'Name': 'Konduz Airport', 'City': 'Kunduz', 'Country': 'Afghanistan'}, 'BAH': {'Name': 'Bahrain International Airport', 'City': 'Bahrain', 'Country': 'Bahrain'}, 'AHB': {'Name': 'Abha Regional Airport', 'City': 'Abha', 'Country': 'Saudi Arabia'}, 'HOF': {'Name': 'Al Ahsa Airport', 'City': 'Al-ahsa', 'Country': 'Saudi Arabia'}, 'ABT': {'Name': 'Al Baha Airport', 'City': 'El-baha', 'Country': 'Saudi Arabia'}, 'BHH': {'Name': 'Bisha Airport', 'City': 'Bisha', 'Country': 'Saudi Arabia'}, 'DMM': {'Name': 'King Fahd International Airport', 'City': 'Dammam', 'Country': 'Saudi Arabia'}, 'DHA': {'Name': 'King Abdulaziz Air Base', 'City': 'Dhahran', 'Country': 'Saudi Arabia'}, 'GIZ': {'Name': 'Jizan Regional Airport', 'City': 'Gizan', 'Country': 'Saudi Arabia'}, 'ELQ': {'Name': 'Gassim Airport', 'City': 'Gassim', 'Country': 'Saudi Arabia'}, 'URY': {'Name': 'Gurayat Domestic Airport', 'City': 'Guriat', 'Country': 'Saudi Arabia'}, 'HAS': {'Name': "Ha'il Airport", 'City': 'Hail', 'Country': 'Saudi Arabia'}, 'QJB': {'Name': 'Jubail Airport', 'City': 'Jubail', 'Country': 'Saudi Arabia'}, 'JED': {'Name': 'King Abdulaziz International Airport', 'City': 'Jeddah', 'Country': 'Saudi Arabia'}, 'KMC': {'Name': 'King Khaled Military City Airport', 'City': 'King Khalid Mil.city', 'Country': 'Saudi Arabia'}, 'MED': {'Name': 'Prince Mohammad Bin Abdulaziz Airport', 'City': 'Madinah', 'Country': 'Saudi Arabia'}, 'EAM': {'Name': 'Nejran Airport', 'City': 'Nejran', 'Country': 'Saudi Arabia'}, 'AQI': {'Name': 'Al Qaisumah/Hafr Al Batin Airport', 'City': 'Hafr Al-batin', 'Country': 'Saudi Arabia'}, 'RAH': {'Name': 'Rafha Domestic Airport', 'City': 'Rafha', 'Country': 'Saudi Arabia'}, 'RUH': {'Name': 'King Khaled International Airport', 'City': 'Riyadh', 'Country': 'Saudi Arabia'}, 'RAE': {'Name': 'Arar Domestic Airport', 'City': 'Arar', 'Country': 'Saudi Arabia'}, 'SHW': {'Name': 'Sharurah Airport', 'City': 'Sharurah', 'Country': 'Saudi Arabia'}, 'SLF': {'Name': 'Sulayel Airport', 'City': 'Sulayel', 'Country': 'Saudi Arabia'}, 'TUU': {'Name': 'Tabuk Airport', 'City': 'Tabuk', 'Country': 'Saudi Arabia'}, 'TIF': {'Name': 'Ta’if Regional Airport', 'City': 'Taif', 'Country': 'Saudi Arabia'}, 'TUI': {'Name': 'Turaif Domestic Airport', 'City': 'Turaif', 'Country': 'Saudi Arabia'}, 'EJH': {'Name': 'Al Wajh Domestic Airport', 'City': 'Wejh', 'Country': 'Saudi Arabia'}, 'YNB': {'Name': 'Prince Abdulmohsin Bin Abdulaziz Airport', 'City': 'Yenbo', 'Country': 'Saudi Arabia'}, 'ABD': {'Name': 'Abadan Airport', 'City': 'Abadan', 'Country': 'Iran'}, 'DEF': {'Name': 'Dezful Airport', 'City': 'Dezful', 'Country': 'Iran'}, 'AKW': {'Name': 'Aghajari Airport', 'City': 'Aghajari', 'Country': 'Iran'}, 'GCH': {'Name': 'Gachsaran Airport', 'City': 'Gachsaran', 'Country': 'Iran'}, 'OMI': {'Name': 'Omidiyeh Airport', 'City': 'Omidyeh', 'Country': 'Iran'}, 'MRX': {'Name': 'Mahshahr Airport', 'City': 'Bandar Mahshahr', 'Country': 'Iran'}, 'AWZ': {'Name': 'Ahwaz Airport', 'City': 'Ahwaz', 'Country': 'Iran'}, 'AEU': {'Name': 'Abu Musa Island Airport', 'City': 'Abumusa I.', 'Country': 'Iran'}, 'BUZ': {'Name': 'Bushehr Airport', 'City': 'Bushehr', 'Country': 'Iran'}, 'KIH': {'Name': 'Kish International Airport', 'City': 'Kish Island', 'Country': 'Iran'}, 'BDH': {'Name': 'Bandar Lengeh Airport', 'City': 'Bandar Lengeh', 'Country': 'Iran'}, 'KHK': {'Name': 'Khark Island Airport', 'City': 'Khark Island', 'Country': 'Iran'}, 'SXI': {'Name': 'Sirri Island Airport', 'City': 'Siri Island', 'Country': 'Iran'}, 'LVP': {'Name': 'Lavan Island Airport', 'City': 'Lavan Island', 'Country': 'Iran'}, 'KSH': {'Name': 'Shahid Ashrafi Esfahani Airport', 'City': 'Bakhtaran', 'Country': 'Iran'}, 'SDG': {'Name': 'Sanandaj Airport', 'City': 'Sanandaj', 'Country': 'Iran'}, 'IFH': {'Name': 'Hesa Airport', 'City': 'Daran', 'Country': 'Iran'}, 'KKS': {'Name': 'Kashan Airport', 'City': 'Kashan', 'Country': 'Iran'}, 'IFN': {'Name': 'Esfahan Shahid Beheshti International Airport', 'City': 'Esfahan', 'Country': 'Iran'}, 'RAS': {'Name': 'Sardar-e-Jangal Airport', 'City': 'Rasht', 'Country': 'Iran'}, 'AJK': {'Name': 'Arak Airport', 'City': 'Arak', 'Country': 'Iran'}, 'THR': {'Name': 'Mehrabad International Airport', 'City': 'Teheran', 'Country': 'Iran'}, 'GZW': {'Name': 'Qazvin Airport', 'City': 'Ghazvin', 'Country': 'Iran'}, 'BND': {'Name': 'Bandar Abbas International Airport', 'City': 'Bandar Abbas', 'Country': 'Iran'}, 'JYR': {'Name': 'Jiroft Airport', 'City': 'Jiroft', 'Country': 'Iran'}, 'KER': {'Name': 'Kerman Airport', 'City': 'Kerman', 'Country': 'Iran'}, 'HDR': {'Name': 'Havadarya Airport', 'City': 'Bandar Abbas', 'Country': 'Iran'}, 'SYJ': {'Name': 'Sirjan Airport', 'City': 'Sirjan', 'Country': 'Iran'}, 'XBJ': {'Name': 'Birjand Airport', 'City': 'Birjand', 'Country': 'Iran'}, 'CKT': {'Name': 'Sarakhs Airport', 'City': 'Sarakhs', 'Country': 'Iran'}, 'RUD': {'Name': 'Shahroud Airport', 'City': 'Emam Shahr', 'Country': 'Iran'}, 'TCX': {'Name': 'Tabas Airport', 'City': 'Tabas', 'Country': 'Iran'}, 'KLM': {'Name': 'Kalaleh Airport', 'City': 'Kalaleh', 'Country': 'Iran'}, 'RZR': {'Name': 'Ramsar Airport', 'City': 'Ramsar', 'Country': 'Iran'}, 'FAZ': {'Name': 'Fasa Airport', 'City': 'Fasa', 'Country': 'Iran'}, 'JAR': {'Name': 'Jahrom Airport', 'City': 'Jahrom', 'Country': 'Iran'}, 'LFM': {'Name': 'Lamerd Airport', 'City': 'Lamerd', 'Country': 'Iran'}, 'SYZ': {'Name': 'Shiraz Shahid Dastghaib International Airport', 'City': 'Shiraz', 'Country': 'Iran'}, 'KHY': {'Name': 'Khoy Airport', 'City': 'Khoy', 'Country': 'Iran'}, 'TBZ': {'Name': 'Tabriz International Airport', 'City': 'Tabriz', 'Country': 'Iran'}, 'JWN': {'Name': 'Zanjan Airport', 'City': 'Zanjan', 'Country': 'Iran'}, 'AZD': {'Name': 'Shahid Sadooghi Airport', 'City': 'Yazd', 'Country': 'Iran'}, 'ACZ': {'Name': 'Zabol Airport', 'City': 'Zabol', 'Country': 'Iran'}, 'ZBR': {'Name': 'Konarak Airport', 'City': 'Chah Bahar', 'Country': 'Iran'}, 'ZAH': {'Name': 'Zahedan International Airport', 'City': 'Zahedan', 'Country': 'Iran'}, 'IHR': {'Name': 'Iran Shahr Airport', 'City': 'Iran Shahr', 'Country': 'Iran'}, 'AMM': {'Name': 'Queen Alia International Airport', 'City': 'Amman', 'Country': 'Jordan'}, 'ADJ': {'Name': 'Amman-Marka International Airport', 'City': 'Amman', 'Country': 'Jordan'}, 'AQJ': {'Name': 'Aqaba King Hussein International Airport', 'City': 'Aqaba', 'Country': 'Jordan'}, 'OMF': {'Name': 'King Hussein Air College', 'City': 'Mafraq', 'Country': 'Jordan'}, 'KWI': {'Name': 'Kuwait International Airport', 'City': 'Kuwait', 'Country': 'Kuwait'}, 'BEY': {'Name': 'Beirut Rafic Hariri International Airport', 'City': 'Beirut', 'Country': 'Lebanon'}, 'KYE': {'Name': 'Rene Mouawad Air Base', 'City': 'Kleiat', 'Country': 'Lebanon'}, 'AUH': {'Name': 'Abu Dhabi International Airport', 'City': 'Abu Dhabi', 'Country': 'United Arab Emirates'}, 'AZI': {'Name': 'Bateen Airport', 'City': 'Abu Dhabi', 'Country': 'United Arab Emirates'}, 'DHF': {'Name': 'Al Dhafra Air Base', 'City': 'Abu Dhabi', 'Country': 'United Arab Emirates'}, 'DXB': {'Name': 'Dubai International Airport', 'City': 'Dubai', 'Country': 'United Arab Emirates'}, 'FJR': {'Name': 'Fujairah International Airport', 'City': 'Fujeirah', 'Country': 'United Arab Emirates'}, 'RKT': {'Name': 'Ras Al Khaimah International Airport', 'City': 'Ras Al Khaimah', 'Country': 'United Arab Emirates'}, 'SHJ': {'Name': 'Sharjah International Airport', 'City': 'Sharjah', 'Country': 'United Arab Emirates'}, 'KHS': {'Name': 'Khasab Air Base', 'City': 'Khasab', 'Country': 'Oman'}, 'MSH': {'Name': 'Masirah Air Base', 'City': 'Masirah', 'Country': 'Oman'}, 'MCT': {'Name': 'Muscat International Airport', 'City': 'Muscat', 'Country': 'Oman'}, 'SLL': {'Name': 'Salalah Airport', 'City': 'Salalah', 'Country': 'Oman'}, 'TTH': {'Name': 'Thumrait Air Base', 'City': 'Thumrait', 'Country': 'Oman'}, 'BHW': {'Name': 'Bhagatanwala Airport', 'City': 'Bhagtanwala', 'Country': 'Pakistan'}, 'LYP': {'Name': 'Faisalabad International Airport', 'City': 'Faisalabad', 'Country': 'Pakistan'}, 'GWD': {'Name': 'Gwadar International Airport', 'City': 'Gwadar', 'Country': 'Pakistan'}, 'GIL': {'Name': 'Gilgit Airport', 'City': 'Gilgit', 'Country': 'Pakistan'}, 'JAG': {'Name': 'Shahbaz Air Base', 'City': 'Jacobsbad', 'Country': 'Pakistan'}, 'KHI': {'Name': 'Jinnah International Airport', 'City': 'Karachi', 'Country': 'Pakistan'}, 'LHE': {'Name': 'Alama Iqbal International Airport', 'City': 'Lahore', 'Country': 'Pakistan'}, 'XJM': {'Name': 'Mangla Airport', 'City': 'Mangla', 'Country': 'Pakistan'}, 'MFG': {'Name': 'Muzaffarabad Airport', 'City': 'Muzaffarabad', 'Country': 'Pakistan'}, 'MWD': {'Name': 'Mianwali Air Base', 'City': 'Mianwali', 'Country': 'Pakistan'}, 'MJD': {'Name': 'Moenjodaro Airport', 'City': 'Moenjodaro', 'Country': 'Pakistan'}, 'MUX': {'Name': 'Multan International Airport', 'City': 'Multan', 'Country': 'Pakistan'}, 'WNS': {'Name': 'Shaheed Benazirabad Airport', 'City': 'Nawabshah', 'Country': 'Pakistan'}, 'PJG': {'Name': 'Panjgur Airport', 'City': 'Panjgur', 'Country': 'Pakistan'}, 'PSI': {'Name': 'Pasni Airport', 'City': 'Pasni', 'Country': 'Pakistan'}, 'PEW': {'Name': 'Peshawar International Airport', 'City': 'Peshawar', 'Country': 'Pakistan'}, 'UET': {'Name': 'Quetta International Airport', 'City': 'Quetta', 'Country': 'Pakistan'}, 'RYK': {'Name': 'Shaikh Zaid Airport', 'City': 'Rahim Yar Khan', 'Country': 'Pakistan'}, 'RAZ': {'Name': 'Rawalakot Airport', 'City': 'Rawala Kot', 'Country': 'Pakistan'}, 'SKZ': {'Name': 'Sukkur Airport', 'City': 'Sukkur', 'Country': 'Pakistan'}, 'SDT': {'Name': 'Saidu Sharif Airport', 'City': 'Saidu Sharif', 'Country': 'Pakistan'}, 'SUL': {'Name': 'Sui Airport', 'City': 'Sui', 'Country': 'Pakistan'}, 'BDN': {'Name': 'Talhar Airport', 'City': 'Talhar', 'Country': 'Pakistan'}, 'WAF': {'Name': 'Wana Airport', 'City': 'Wana', 'Country': 'Pakistan'}, 'PZH': {'Name': 'Zhob Airport', 'City': 'Zhob', 'Country': 'Pakistan'}, 'BSR': {'Name': 'Basrah International Airport', 'City': 'Basrah', 'Country': 'Iraq'}, 'ALP': {'Name': 'Aleppo International Airport', 'City': 'Aleppo', 'Country': 'Syria'}, 'DAM': {'Name': 'Damascus International Airport', 'City': 'Damascus', 'Country': 'Syria'}, 'DEZ': {'Name': 'Deir ez-Zor Air Base', 'City': 'Deire Zor', 'Country': 'Syria'}, 'LTK': {'Name': 'Bassel Al-Assad International Airport', 'City': 'Latakia', 'Country': 'Syria'}, 'PMS': {'Name': 'Palmyra Airport', 'City': 'Palmyra', 'Country': 'Syria'}, 'DIA': {'Name': 'Doha International Airport', 'City': 'Doha', 'Country': 'Qatar'}, 'CIS': {'Name': 'Canton Island Airport', 'City': 'Canton Island', 'Country': 'Kiribati'}, 'ROP': {'Name': 'Rota International Airport', 'City': 'Rota', 'Country': 'Northern Mariana Islands'}, 'SPN': {'Name': 'Saipan International Airport', 'City': 'Saipan', 'Country': 'Northern Mariana Islands'}, 'UAM': {'Name': 'Andersen Air Force Base', 'City': 'Andersen', 'Country': 'Guam'}, 'GUM': {'Name': 'Antonio B. Won Pat International Airport', 'City': 'Agana', 'Country': 'Guam'}, 'TIQ': {'Name': 'Tinian International Airport', 'City': 'West Tinian', 'Country': 'Northern Mariana Islands'}, 'MAJ': {'Name': 'Marshall Islands International Airport', 'City': 'Majuro', 'Country': 'Marshall Islands'}, 'KWA': {'Name': 'Bucholz Army Air Field', 'City': 'Kwajalein', 'Country': 'Marshall Islands'}, 'CXI': {'Name': 'Cassidy International Airport', 'City': 'Kiritimati', 'Country': 'Kiribati'}, 'MDY': {'Name': 'Henderson Field', 'City': 'Midway', 'Country': 'Midway Islands'}, 'TKK': {'Name': 'Chuuk International Airport', 'City': 'Chuuk', 'Country': 'Micronesia'}, 'PNI': {'Name': 'Pohnpei International Airport', 'City': 'Pohnpei', 'Country': 'Micronesia'}, 'ROR': {'Name': 'Babelthuap Airport', 'City': 'Babelthuap', 'Country': 'Palau'}, 'KSA': {'Name': 'Kosrae International Airport', 'City': 'Kosrae', 'Country': 'Micronesia'}, 'YAP': {'Name': 'Yap International Airport', 'City': 'Yap', 'Country': 'Micronesia'}, 'KNH': {'Name': 'Kinmen Airport', 'City': 'Kinmen', 'Country': 'Taiwan'}, 'TTT': {'Name': 'Taitung Airport', 'City': 'Fengnin', 'Country': 'Taiwan'}, 'GNI': {'Name': 'Lyudao Airport', 'City': 'Green Island', 'Country': 'Taiwan'}, 'KHH': {'Name': 'Kaohsiung International Airport', 'City': 'Kaohsiung', 'Country': 'Taiwan'}, 'CYI': {'Name': 'Chiayi Airport', 'City': 'Chiayi', 'Country': 'Taiwan'}, 'KYD': {'Name': 'Lanyu Airport', 'City': 'Lanyu', 'Country': 'Taiwan'}, 'RMQ': {'Name': 'Taichung Ching Chuang Kang Airport', 'City': 'Taichung', 'Country': 'Taiwan'}, 'TNN': {'Name': 'Tainan Airport', 'City': 'Tainan', 'Country': 'Taiwan'}, 'HSZ': {'Name': 'Hsinchu Air Base', 'City': 'Hsinchu', 'Country': 'Taiwan'}, 'MZG': {'Name': 'Makung Airport', 'City': 'Makung', 'Country': 'Taiwan'}, 'PIF': {'Name': 'Pingtung North Airport', 'City': 'Pingtung', 'Country': 'Taiwan'}, 'TSA': {'Name': 'Taipei Songshan Airport', 'City': 'Taipei', 'Country': 'Taiwan'}, 'TPE': {'Name': 'Taiwan Taoyuan International Airport', 'City': 'Taipei', 'Country': 'Taiwan'}, 'WOT': {'Name': 'Wang-an Airport', 'City': 'Wang An', 'Country': 'Taiwan'}, 'HUN': {'Name': 'Hualien Airport', 'City': 'Hualien', 'Country': 'Taiwan'}, 'NRT': {'Name': 'Narita International Airport', 'City': 'Tokyo', 'Country': 'Japan'}, 'MMJ': {'Name': 'Matsumoto Airport', 'City': 'Matsumoto', 'Country': 'Japan'}, 'IBR': {'Name': 'Hyakuri Airport', 'City': 'Ibaraki', 'Country': 'Japan'}, 'MUS': {'Name': 'Minami Torishima Airport', 'City': 'Minami Tori Shima', 'Country': 'Japan'}, 'IWO': {'Name': 'Iwo Jima Airport', 'City': 'Iwojima', 'Country': 'Japan'}, 'SHM': {'Name': 'Nanki Shirahama Airport', 'City': 'Nanki-shirahama', 'Country': 'Japan'}, 'OBO': {'Name': 'Tokachi-Obihiro Airport', 'City': 'Obihiro', 'Country': 'Japan'}, 'CTS': {'Name': 'New Chitose Airport', 'City': 'Sapporo', 'Country': 'Japan'}, 'HKD': {'Name': 'Hakodate Airport', 'City': 'Hakodate', 'Country': 'Japan'}, 'MMB': {'Name': 'Memanbetsu Airport', 'City': 'Memanbetsu', 'Country': 'Japan'}, 'SHB': {'Name': 'Nakashibetsu Airport', 'City': 'Nakashibetsu', 'Country': 'Japan'}, 'WKJ': {'Name': 'Wakkanai Airport', 'City': 'Wakkanai', 'Country': 'Japan'}, 'IKI': {'Name': 'Iki Airport', 'City': 'Iki', 'Country': 'Japan'}, 'UBJ': {'Name': 'Yamaguchi Ube Airport', 'City': 'Yamaguchi', 'Country': 'Japan'}, 'TSJ': {'Name': 'Tsushima Airport', 'City': 'Tsushima', 'Country': 'Japan'}, 'MBE': {'Name': 'Monbetsu Airport', 'City': 'Monbetsu', 'Country': 'Japan'}, 'AKJ': {'Name': 'Asahikawa Airport', 'City': 'Asahikawa', 'Country': 'Japan'}, 'OIR': {'Name': 'Okushiri Airport', 'City': 'Okushiri', 'Country': 'Japan'}, 'RIS': {'Name': 'Rishiri Airport', 'City': 'Rishiri Island', 'Country': 'Japan'}, 'KUM': {'Name': 'Yakushima Airport', 'City': 'Yakushima', 'Country': 'Japan'}, 'FUJ': {'Name': 'Fukue Airport', 'City': 'Fukue', 'Country': 'Japan'}, 'FUK': {'Name': 'Fukuoka Airport', 'City': 'Fukuoka', 'Country': 'Japan'}, 'TNE': {'Name': 'New Tanegashima Airport', 'City': 'Tanegashima', 'Country': 'Japan'}, 'KOJ': {'Name': 'Kagoshima Airport', 'City': 'Kagoshima', 'Country': 'Japan'}, 'KMI': {'Name': 'Miyazaki Airport', 'City': 'Miyazaki', 'Country': 'Japan'}, 'OIT': {'Name': 'Oita Airport', 'City': 'Oita', 'Country': 'Japan'}, 'KKJ': {'Name': 'Kitakyūshū Airport', 'City': 'Kitakyushu', 'Country': 'Japan'}, 'KMJ': {'Name': 'Kumamoto Airport', 'City': 'Kumamoto', 'Country': 'Japan'}, 'NGS': {'Name': 'Nagasaki Airport', 'City': 'Nagasaki', 'Country': 'Japan'}, 'ASJ': {'Name': 'Amami Airport', 'City': 'Amami', 'Country': 'Japan'}, 'OKE': {'Name': 'Okierabu Airport', 'City': 'Okierabu', 'Country': 'Japan'}, 'TKN': {'Name': 'Tokunoshima Airport', 'City': 'Tokunoshima', 'Country': 'Japan'}, 'FKJ': {'Name': 'Fukui Airport', 'City': 'Fukui', 'Country': 'Japan'}, 'QGU': {'Name': 'Gifu Airport', 'City': 'Gifu', 'Country': 'Japan'}, 'KMQ': {'Name': 'Komatsu Airport', 'City': 'Kanazawa', 'Country': 'Japan'}, 'OKI': {'Name': 'Oki Airport', 'City': 'Oki Island', 'Country': 'Japan'}, 'TOY': {'Name': 'Toyama Airport', 'City': 'Toyama', 'Country': 'Japan'}, 'HIJ': {'Name': 'Hiroshima Airport', 'City': 'Hiroshima', 'Country': 'Japan'}, 'OKJ': {'Name': 'Okayama Airport', 'City': 'Okayama', 'Country': 'Japan'}, 'IZO': {'Name': 'Izumo Airport', 'City': 'Izumo', 'Country': 'Japan'}, 'YGJ': {'Name': 'Miho Yonago Airport', 'City': 'Miho', 'Country': 'Japan'}, 'KCZ': {'Name': 'Kōchi Ryōma Airport', 'City': 'Kochi', 'Country': 'Japan'}, 'MYJ': {'Name': 'Matsuyama Airport', 'City': 'Matsuyama', 'Country': 'Japan'}, 'ITM': {'Name': 'Osaka International Airport', 'City': 'Osaka', 'Country': 'Japan'}, 'TTJ': {'Name': 'Tottori Airport', 'City': 'Tottori', 'Country': 'Japan'}, 'TKS': {'Name': 'Tokushima Airport/JMSDF Air Base', 'City': 'Tokushima', 'Country': 'Japan'}, 'TAK': {'Name': 'Takamatsu Airport', 'City': 'Takamatsu', 'Country': 'Japan'}, 'AOJ': {'Name': 'Aomori Airport', 'City': 'Aomori', 'Country': 'Japan'}, 'GAJ': {'Name': 'Yamagata Airport', 'City': 'Yamagata', 'Country': 'Japan'}, 'SDS': {'Name': 'Sado Airport', 'City': 'Sado', 'Country': 'Japan'}, 'HHE': {'Name': 'Hachinohe Airport', 'City': 'Hachinoe', 'Country': 'Japan'}, 'HNA': {'Name': 'Hanamaki Airport', 'City': 'Hanamaki', 'Country': 'Japan'}, 'AXT': {'Name': 'Akita Airport', 'City': 'Akita', 'Country': 'Japan'}, 'MSJ': {'Name': 'Misawa Air Base', 'City': 'Misawa', 'Country': 'Japan'}, 'SDJ': {'Name': 'Sendai Airport', 'City': 'Sendai', 'Country': 'Japan'}, 'NJA': {'Name': 'Atsugi Naval Air Facility', 'City': 'Atsugi', 'Country': 'Japan'}, 'HAC': {'Name': 'Hachijojima Airport', 'City': 'Hachijojima', 'Country': 'Japan'}, 'OIM': {'Name': 'Oshima Airport', 'City': 'Oshima', 'Country': 'Japan'}, 'HND': {'Name': 'Tokyo Haneda International Airport', 'City': 'Tokyo', 'Country': 'Japan'}, 'OKO': {'Name': 'Yokota Air Base', 'City': 'Yokota', 'Country': 'Japan'}, 'KWJ': {'Name': 'Gwangju Airport', 'City': 'Kwangju', 'Country': 'South Korea'}, 'CHN': {'Name': 'Jeon Ju Airport (G-703)', 'City': 'Jhunju', 'Country': 'South Korea'}, 'RSU': {'Name': 'Yeosu Airport', 'City': 'Yeosu', 'Country': 'South Korea'}, 'KAG': {'Name': 'Gangneung Airport (K-18)', 'City': 'Kangnung', 'Country': 'South Korea'}, 'CJU': {'Name': 'Jeju International Airport', 'City': 'Cheju', 'Country': 'South Korea'}, 'CHF': {'Name': 'Jinhae Airbase/Airport (G-813/K-10)', 'City': 'Chinhae', 'Country': 'South Korea'}, 'PUS': {'Name': 'Gimhae International Airport', 'City': 'Busan', 'Country': 'South Korea'}, 'USN': {'Name': 'Ulsan Airport', 'City': 'Ulsan', 'Country': 'South Korea'}, 'SSN': {'Name': 'Seoul Air Base (K-16)', 'City': 'Seoul East', 'Country': 'South Korea'}, 'OSN': {'Name': 'Osan Air Base', 'City': 'Osan', 'Country': 'South Korea'}, 'GMP': {'Name': 'Gimpo International Airport', 'City': 'Seoul', 'Country': 'South Korea'}, 'SWU': {'Name': 'Suwon Airport', 'City': 'Suwon', 'Country': 'South Korea'}, 'KPO': {'Name': 'Pohang Airport (G-815/K-3)', 'City': 'Pohang', 'Country': 'South Korea'}, 'TAE': {'Name': 'Daegu Airport', 'City': 'Taegu', 'Country': 'South Korea'}, 'YEC': {'Name': 'Yecheon Airbase', 'City': 'Yechon', 'Country': 'South Korea'}, 'OKA': {'Name': 'Naha Airport', 'City': 'Okinawa', 'Country': 'Japan'}, 'DNA': {'Name': 'Kadena Air Base', 'City': 'Kadena', 'Country': 'Japan'}, 'ISG': {'Name': 'New Ishigaki Airport', 'City': 'Ishigaki', 'Country': 'Japan'}, 'UEO': {'Name': 'Kumejima Airport', 'City': 'Kumejima', 'Country': 'Japan'}, 'MMD': {'Name': 'Minami-Daito Airport', 'City': 'Minami Daito', 'Country': 'Japan'}, 'MMY': {'Name': 'Miyako Airport', 'City': 'Miyako', 'Country': 'Japan'}, 'KTD': {'Name': 'Kitadaito Airport', 'City': 'Kitadaito', 'Country': 'Japan'}, 'SHI': {'Name': 'Shimojishima Airport', 'City': 'Shimojishima', 'Country': 'Japan'}, 'TRA': {'Name': 'Tarama Airport', 'City': 'Tarama', 'Country': 'Japan'}, 'RNJ': {'Name': 'Yoron Airport', 'City': 'Yoron', 'Country': 'Japan'}, 'OGN': {'Name': 'Yonaguni Airport', 'City': 'Yonaguni Jima', 'Country': 'Japan'}, 'MNL': {'Name': 'Ninoy Aquino International Airport', 'City': 'Manila', 'Country': 'Philippines'}, 'CBO': {'Name': 'Awang Airport', 'City': 'Cotabato', 'Country': 'Philippines'}, 'PAG': {'Name': 'Pagadian Airport', 'City': 'Pagadian', 'Country': 'Philippines'}, 'GES': {'Name': 'General Santos International Airport', 'City': 'Romblon', 'Country': 'Philippines'}, 'ZAM': {'Name': 'Zamboanga International Airport', 'City': 'Zamboanga', 'Country': 'Philippines'}, 'BAG': {'Name': 'Loakan Airport', 'City': 'Baguio', 'Country': 'Philippines'}, 'DTE': {'Name': 'Daet Airport', 'City': 'Daet', 'Country': 'Philippines'}, 'SJI': {'Name': 'San Jose Airport', 'City': 'San Jose', 'Country': 'Philippines'}, 'MBO': {'Name': 'Mamburao Airport', 'City': 'Mamburao', 'Country': 'Philippines'}, 'BQA': {'Name': 'Dr.Juan C. Angara Airport', 'City': 'Baler', 'Country': 'Philippines'}, 'TAC': {'Name': 'Daniel Z. Romualdez Airport', 'City': 'Tacloban', 'Country': 'Philippines'}, 'BCD': {'Name': 'Bacolod-Silay Airport', 'City': 'Bacolod', 'Country': 'Philippines'}, 'DGT': {'Name': 'Sibulan Airport', 'City': 'Dumaguete', 'Country': 'Philippines'}, 'MPH': {'Name': 'Godofredo P. Ramos Airport', 'City': 'Caticlan', 'Country': 'Philippines'}, 'ILO': {'Name': 'Iloilo International Airport', 'City': 'Iloilo', 'Country': 'Philippines'}, 'KLO': {'Name': 'Kalibo International Airport', 'City': 'Kalibo', 'Country': 'Philippines'}, 'PPS': {'Name': 'Puerto Princesa Airport', 'City': 'Puerto Princesa', 'Country': 'Philippines'}, 'EUQ': {'Name': 'Evelio Javier Airport', 'City': 'San Jose', 'Country': 'Philippines'}, 'COC': {'Name': 'Comodoro Pierrestegui Airport', 'City': 'Concordia', 'Country': 'Argentina'}, 'GHU': {'Name': 'Gualeguaychu Airport', 'City': 'Gualeguaychu', 'Country': 'Argentina'}, 'JNI': {'Name': 'Junin Airport', 'City': 'Junin', 'Country': 'Argentina'}, 'PRA': {'Name': 'General Urquiza Airport', 'City': 'Parana', 'Country': 'Argentina'}, 'ROS': {'Name': 'Islas Malvinas Airport', 'City': 'Rosario', 'Country': 'Argentina'}, 'SFN': {'Name': 'Sauce Viejo Airport', 'City': 'Santa Fe', 'Country': 'Argentina'}, 'AEP': {'Name': 'Jorge Newbery Airpark', 'City': 'Buenos Aires', 'Country': 'Argentina'}, 'COR': {'Name': 'Ingeniero Ambrosio Taravella Airport', 'City': 'Cordoba', 'Country': 'Argentina'}, 'FDO': {'Name': 'San Fernando Airport', 'City': 'San Fernando', 'Country': 'Argentina'}, 'LPG': {'Name': 'La Plata Airport', 'City': 'La Plata', 'Country': 'Argentina'}, 'EPA': {'Name': 'El Palomar Airport', 'City': 'El Palomar', 'Country': 'Argentina'}, 'HOS': {'Name': 'Chos Malal Airport', 'City': 'Chosmadal', 'Country': 'Argentina'}, 'GNR': {'Name': 'Dr. Arturo H. Illia Airport', 'City': 'Fuerte Gral Roca', 'Country': 'Argentina'}, 'MDZ': {'Name': 'El Plumerillo Airport', 'City': 'Mendoza', 'Country': 'Argentina'}, 'LGS': {'Name': 'Comodoro D.R. Salomón Airport', 'City': 'Malargue', 'Country': 'Argentina'}, 'AFA': {'Name': 'Suboficial Ay Santiago Germano Airport', 'City': 'San Rafael', 'Country': 'Argentina'}, 'CTC': {'Name': 'Catamarca Airport', 'City': 'Catamarca', 'Country': 'Argentina'}, 'SDE': {'Name': 'Vicecomodoro Angel D. La Paz Aragonés Airport', 'City': 'Santiago Del Estero', 'Country': 'Argentina'}, 'IRJ': {'Name': 'Capitan V A Almonacid Airport', 'City': 'La Rioja', 'Country': 'Argentina'}, 'TUC': {'Name': 'Teniente Benjamin Matienzo Airport', 'City': 'Tucuman', 'Country': 'Argentina'}, 'UAQ': {'Name': 'Domingo Faustino Sarmiento Airport', 'City': 'San Juan', 'Country': 'Argentina'}, 'RCU': {'Name': 'Area De Material Airport', 'City': 'Rio Cuarto', 'Country': 'Argentina'}, 'VDR': {'Name': 'Villa Dolores Airport', 'City': 'Villa Dolores', 'Country': 'Argentina'}, 'VME': {'Name': 'Villa Reynolds Airport', 'City': 'Villa Reynolds', 'Country': 'Argentina'}, 'LUQ': {'Name': 'Brigadier Mayor D Cesar Raul Ojeda Airport', 'City': 'San Luis', 'Country': 'Argentina'}, 'CNQ': {'Name': 'Corrientes Airport', 'City': 'Corrientes', 'Country': 'Argentina'}, 'RES': {'Name': 'Resistencia International Airport', 'City': 'Resistencia', 'Country': 'Argentina'}, 'FMA': {'Name': 'Formosa Airport', 'City': 'Formosa', 'Country': 'Argentina'}, 'IGR': {'Name': 'Cataratas Del Iguazú International Airport', 'City': 'Iguazu Falls', 'Country': 'Argentina'}, 'AOL': {'Name': 'Paso De Los Libres Airport', 'City': 'Paso De Los Libres', 'Country': 'Argentina'}, 'MCS': {'Name': 'Monte Caseros Airport', 'City': 'Monte Caseros', 'Country': 'Argentina'}, 'PSS': {'Name': 'Libertador Gral D Jose De San Martin Airport', 'City': 'Posadas', 'Country': 'Argentina'}, 'PRQ': {'Name': 'Termal Airport', 'City': 'Presidencia R.s.pena', 'Country': 'Argentina'}, 'SLA': {'Name': 'Martin Miguel De Guemes International Airport', 'City': 'Salta', 'Country': 'Argentina'}, 'JUJ': {'Name': 'Gobernador Horacio Guzman International Airport', 'City': 'Jujuy', 'Country': 'Argentina'}, 'ORA': {'Name': 'Orán Airport', 'City': 'Oran', 'Country': 'Argentina'}, 'ELO': {'Name': 'El Dorado Airport', 'City': 'El Dorado', 'Country': 'Argentina'}, 'OYA': {'Name': 'Goya Airport', 'City': 'Goya', 'Country': 'Argentina'}, 'RCQ': {'Name': 'Reconquista Airport', 'City': 'Reconquista', 'Country': 'Argentina'}, 'UZU': {'Name': 'Curuzu Cuatia Airport', 'City': 'Curuzu Cuatia', 'Country': 'Argentina'}, 'EHL': {'Name': 'El Bolson Airport', 'City': 'El Bolson', 'Country': 'Argentina'}, 'CRD': {'Name': 'General E. Mosconi Airport', 'City': 'Comodoro Rivadavia', 'Country': 'Argentina'}, 'EQS': {'Name': 'Brigadier Antonio Parodi Airport', 'City': 'Esquel', 'Country': 'Argentina'}, 'REL': {'Name': 'Almirante Marco Andres Zar Airport', 'City': 'Trelew', 'Country': 'Argentina'}, 'VDM': {'Name': 'Gobernador Castello Airport', 'City': 'Viedma', 'Country': 'Argentina'}, 'PMY': {'Name': 'El Tehuelche Airport', 'City': 'Puerto Madryn', 'Country': 'Argentina'}, 'PUD': {'Name': 'Puerto Deseado Airport', 'City': 'Puerto Deseado', 'Country': 'Argentina'}, 'RGA': {'Name': 'Hermes Quijada International Airport', 'City': 'Rio Grande', 'Country': 'Argentina'}, 'RGL': {'Name': 'Piloto Civil N. Fernández Airport', 'City': 'Rio Gallegos', 'Country': 'Argentina'}, 'USH': {'Name': 'Malvinas Argentinas Airport', 'City': 'Ushuaia', 'Country': 'Argentina'}, 'ULA': {'Name': 'Capitan D Daniel Vazquez Airport', 'City': 'San Julian', 'Country': 'Argentina'}, 'PMQ': {'Name': 'Perito Moreno Airport', 'City': 'Perito Moreno', 'Country': 'Argentina'}, 'RZA': {'Name': 'Santa Cruz Airport', 'City': 'Santa Cruz', 'Country': 'Argentina'}, 'BHI': {'Name': 'Comandante Espora Airport', 'City': 'Bahia Blanca', 'Country': 'Argentina'}, 'CSZ': {'Name': 'Brigadier D.H.E. Ruiz Airport', 'City': 'Colonel Suarez', 'Country': 'Argentina'}, 'OVR': {'Name': 'Olavarria Airport', 'City': 'Olavarria', 'Country': 'Argentina'}, 'GPO': {'Name': 'General Pico Airport', 'City': 'General Pico', 'Country': 'Argentina'}, 'OYO': {'Name': 'Tres Arroyos Airport', 'City': 'Tres Arroyos', 'Country': 'Argentina'}, 'MDQ': {'Name': 'Ástor Piazzola International Airport', 'City': 'Mar Del Plata', 'Country': 'Argentina'}, 'NQN': {'Name': 'Presidente Peron Airport', 'City': 'Neuquen', 'Country': 'Argentina'}, 'PEH': {'Name': 'Comodoro Pedro Zanni Airport', 'City': 'Pehuajo', 'Country': 'Argentina'}, 'RSA': {'Name': 'Santa Rosa Airport', 'City': 'Santa Rosa', 'Country': 'Argentina'}, 'BRC': {'Name': 'San Carlos De Bariloche Airport', 'City': 'San Carlos De Bariloche', 'Country': 'Argentina'}, 'TDL': {'Name': 'Héroes De Malvinas Airport', 'City': 'Tandil', 'Country': 'Argentina'}, 'VLG': {'Name': 'Villa Gesell Airport', 'City': 'Villa Gesell', 'Country': 'Argentina'}, 'CUT': {'Name': 'Cutral-Co Airport', 'City': 'Cutralco', 'Country': 'Argentina'}, 'CPC': {'Name': 'Aviador C. Campos Airport', 'City': 'San Martin Des Andes', 'Country': 'Argentina'}, 'CDJ': {'Name': 'Conceição do Araguaia Airport', 'City': 'Conceicao Do Araguaia', 'Country': 'Brazil'}, 'AQA': {'Name': 'Araraquara Airport', 'City': 'Araracuara', 'Country': 'Brazil'}, 'AJU': {'Name': 'Santa Maria Airport', 'City': 'Aracaju', 'Country': 'Brazil'}, 'AFL': {'Name': 'Piloto Osvaldo Marques Dias Airport', 'City': 'Alta Floresta', 'Country': 'Brazil'}, 'ARU': {'Name': 'Araçatuba Airport', 'City': 'Aracatuba', 'Country': 'Brazil'}, 'BEL': {'Name': 'Val de Cans/Júlio Cezar Ribeiro International Airport', 'City': 'Belem', 'Country': 'Brazil'}, 'BGX': {'Name': 'Comandante Gustavo Kraemer Airport', 'City': 'Bage', 'Country': 'Brazil'}, 'PLU': {'Name': 'Pampulha - Carlos Drummond de Andrade Airport', 'City': 'Belo Horizonte', 'Country': 'Brazil'}, 'BFH': {'Name': 'Bacacheri Airport', 'City': 'Curitiba', 'Country': 'Brazil'}, 'BSB': {'Name': 'Presidente Juscelino Kubistschek International Airport', 'City': 'Brasilia', 'Country': 'Brazil'}, 'BAU': {'Name': 'Bauru Airport', 'City': 'Bauru', 'Country': 'Brazil'}, 'BVB': {'Name': 'Atlas Brasil Cantanhede Airport', 'City': 'Boa Vista', 'Country': 'Brazil'}, 'BPG': {'Name': 'Barra do Garças Airport', 'City': 'Barra Do Garcas', 'Country': 'Brazil'}, 'CAC': {'Name': 'Cascavel Airport', 'City': 'Cascavel', 'Country': 'Brazil'}, 'CNF': {'Name': 'Tancredo Neves International Airport', 'City': 'Belo Horizonte', 'Country': 'Brazil'}, 'CGR': {'Name': 'Campo Grande Airport', 'City': 'Campo Grande', 'Country': 'Brazil'}, 'XAP': {'Name': 'Serafin Enoss Bertaso Airport', 'City': 'Chapeco', 'Country': 'Brazil'}, 'CLN': {'Name': 'Brig. Lysias Augusto Rodrigues Airport', 'City': 'Carolina', 'Country': 'Brazil'}, 'CCM': {'Name': 'Diomício Freitas Airport', 'City': 'Criciuma', 'Country': 'Brazil'}, 'CAW': {'Name': 'Bartolomeu Lisandro Airport', 'City': 'Campos', 'Country': 'Brazil'}, 'CMG': {'Name': 'Corumbá International Airport', 'City': 'Corumba', 'Country': 'Brazil'}, 'CWB': {'Name': 'Afonso Pena Airport', 'City': 'Curitiba', 'Country': 'Brazil'}, 'CRQ': {'Name': 'Caravelas Airport', 'City': 'Caravelas', 'Country': 'Brazil'}, 'CXJ': {'Name': 'Hugo Cantergiani Regional Airport', 'City': 'Caxias Do Sul', 'Country': 'Brazil'}, 'CGB': {'Name': 'Marechal Rondon Airport', 'City': 'Cuiaba', 'Country': 'Brazil'}, 'CZS': {'Name': 'Cruzeiro do Sul Airport', 'City': 'Cruzeiro do Sul', 'Country': 'Brazil'}, 'PPB': {'Name': 'Presidente Prudente Airport', 'City': 'President Prudente', 'Country': 'Brazil'}, 'MAO': {'Name': 'Eduardo Gomes International Airport', 'City': 'Manaus', 'Country': 'Brazil'}, 'JCR': {'Name': 'Jacareacanga Airport', 'City': 'Jacare-acanga', 'Country': 'Brazil'}, 'IGU': {'Name': 'Cataratas International Airport', 'City': 'Foz Do Iguacu', 'Country': 'Brazil'}, 'FLN': {'Name': 'Hercílio Luz International Airport', 'City': 'Florianopolis', 'Country': 'Brazil'}, 'FEN': {'Name': 'Fernando de Noronha Airport', 'City': 'Fernando Do Noronha', 'Country': 'Brazil'}, 'FOR': {'Name': 'Pinto Martins International Airport', 'City': 'Fortaleza', 'Country': 'Brazil'}, 'GIG': {'Name': 'Rio Galeão – Tom Jobim International Airport', 'City': 'Rio De Janeiro', 'Country': 'Brazil'}, 'GJM': {'Name': 'Guajará-Mirim Airport', 'City': 'Guajara-mirim', 'Country': 'Brazil'}, 'GYN': {'Name': 'Santa Genoveva Airport', 'City': 'Goiania', 'Country': 'Brazil'}, 'GRU': {'Name': 'Guarulhos - Governador André Franco Montoro International Airport', 'City': 'Sao Paulo', 'Country': 'Brazil'}, 'GUJ': {'Name': 'Guaratinguetá Airport', 'City': 'Guaratingueta', 'Country': 'Brazil'}, 'ATM': {'Name': 'Altamira Airport', 'City': 'Altamira', 'Country': 'Brazil'}, 'ITA': {'Name': 'Itacoatiara Airport', 'City': 'Itaituba', 'Country': 'Brazil'}, 'ITB': {'Name': 'Itaituba Airport', 'City': 'Itaituba', 'Country': 'Brazil'}, 'IOS': {'Name': 'Bahia - Jorge Amado Airport', 'City': 'Ilheus', 'Country': 'Brazil'}, 'IPN': {'Name': 'Usiminas Airport', 'City': 'Ipatinga', 'Country': 'Brazil'}, 'ITR': {'Name': 'Francisco Vilela do Amaral Airport', 'City': 'Itumbiara', 'Country': 'Brazil'}, 'IMP': {'Name': 'Prefeito Renato Moreira Airport', 'City': 'Imperatriz', 'Country': 'Brazil'}, 'JDF': {'Name': 'Francisco de Assis Airport', 'City': 'Juiz De Fora', 'Country': 'Brazil'}, 'JPA': {'Name': 'Presidente Castro Pinto International Airport', 'City': 'Joao Pessoa', 'Country': 'Brazil'}, 'JOI': {'Name': 'Lauro Carneiro de Loyola Airport', 'City': 'Joinville', 'Country': 'Brazil'}, 'CPV': {'Name': 'Presidente João Suassuna Airport', 'City': 'Campina Grande', 'Country': 'Brazil'}, 'VCP': {'Name': 'Viracopos International Airport', 'City': 'Campinas', 'Country': 'Brazil'}, 'LAJ': {'Name': 'Lages Airport', 'City': 'Lajes', 'Country': 'Brazil'}, 'LIP': {'Name': 'Lins Airport', 'City': 'Lins', 'Country': 'Brazil'}, 'LDB': {'Name': 'Governador José Richa Airport', 'City': 'Londrina', 'Country': 'Brazil'}, 'LAZ': {'Name': 'Bom Jesus da Lapa Airport', 'City': 'Bom Jesus Da Lapa', 'Country': 'Brazil'}, 'MAB': {'Name': 'João Correa da Rocha Airport', 'City': 'Maraba', 'Country': 'Brazil'}, 'MEU': {'Name': 'Monte Dourado Airport', 'City': 'Almeirim', 'Country': 'Brazil'}, 'MGF': {'Name': 'Regional de Maringá - Sílvio Nane Junior Airport', 'City': 'Maringa', 'Country': 'Brazil'}, 'MOC': {'Name': 'Mário Ribeiro Airport', 'City': 'Montes Claros', 'Country': 'Brazil'}, 'PLL': {'Name': 'Ponta Pelada Airport', 'City': 'Manaus', 'Country': 'Brazil'}, 'MCZ': {'Name': 'Zumbi dos Palmares Airport', 'City': 'Maceio', 'Country': 'Brazil'}, 'MCP': {'Name': 'Alberto Alcolumbre Airport', 'City': 'Macapa', 'Country': 'Brazil'}, 'MVF': {'Name': 'Dix-Sept Rosado Airport', 'City': 'Mocord', 'Country': 'Brazil'}, 'MNX': {'Name': 'Manicoré Airport', 'City': 'Manicore', 'Country': 'Brazil'}, 'NVT': {'Name': 'Ministro Victor Konder International Airport', 'City': 'Navegantes', 'Country': 'Brazil'}, 'GEL': {'Name': 'Santo Ângelo Airport', 'City': 'Santo Angelo', 'Country': 'Brazil'}, 'NAT': {'Name': 'Governador Aluízio Alves International Airport', 'City': 'Natal', 'Country': 'Brazil'}, 'OYK': {'Name': 'Oiapoque Airport', 'City': 'Oioiapoque', 'Country': 'Brazil'}, 'POA': {'Name': 'Salgado Filho Airport', 'City': 'Porto Alegre', 'Country': 'Brazil'}, 'PHB': {'Name': 'Prefeito Doutor João Silva Filho Airport', 'City': 'Parnaiba', 'Country': 'Brazil'}, 'POO': {'Name': 'Poços de Caldas - Embaixador Walther Moreira Salles Airport', 'City': 'Pocos De Caldas', 'Country': 'Brazil'}, 'PFB': {'Name': 'Lauro Kurtz Airport', 'City': 'Passo Fundo', 'Country': 'Brazil'}, 'PET': {'Name': 'João Simões Lopes Neto International Airport', 'City': 'Pelotas', 'Country': 'Brazil'}, 'PNZ': {'Name': 'Senador Nilo Coelho Airport', 'City': 'Petrolina', 'Country': 'Brazil'}, 'PNB': {'Name': 'Porto Nacional Airport', 'City': 'Porto Nacional', 'Country': 'Brazil'}, 'PMG': {'Name': 'Ponta Porã Airport', 'City': 'Ponta Pora', 'Country': 'Brazil'}, 'PVH': {'Name': 'Governador Jorge Teixeira de Oliveira Airport', 'City': 'Porto Velho', 'Country': 'Brazil'}, 'RBR': {'Name': 'Plácido de Castro Airport', 'City': 'Rio Branco', 'Country': 'Brazil'}, 'REC': {'Name': 'Guararapes - Gilberto Freyre International Airport', 'City': 'Recife', 'Country': 'Brazil'}, 'SDU': {'Name': 'Santos Dumont Airport', 'City': 'Rio De Janeiro', 'Country': 'Brazil'}, 'RAO': {'Name': 'Leite Lopes Airport', 'City': 'Ribeirao Preto', 'Country': 'Brazil'}, 'SNZ': {'Name': 'Santa Cruz Air Force Base', 'City': 'Rio De Janeiro', 'Country': 'Brazil'}, 'SJK': {'Name': 'Professor Urbano Ernesto Stumpf Airport', 'City': 'Sao Jose Dos Campos', 'Country': 'Brazil'}, 'SLZ': {'Name': 'Marechal Cunha Machado International Airport', 'City': 'Sao Luis', 'Country': 'Brazil'}, 'CGH': {'Name': 'Congonhas Airport', 'City': 'Sao Paulo', 'Country': 'Brazil'}, 'SJP': {'Name': 'Prof. Eribelto Manoel Reino State Airport', 'City': 'Sao Jose Do Rio Preto', 'Country': 'Brazil'}, 'SSZ': {'Name': 'Base Aérea de Santos Airport', 'City': 'Santos', 'Country': 'Brazil'}, 'SSA': {'Name': 'Deputado Luiz Eduardo Magalhães International Airport', 'City': 'Salvador', 'Country': 'Brazil'}, 'TMT': {'Name': 'Trombetas Airport', 'City': 'Oriximina', 'Country': 'Brazil'}, 'THE': {'Name': 'Senador Petrônio Portela Airport', 'City': 'Teresina', 'Country': 'Brazil'}, 'TFF': {'Name': 'Tefé Airport', 'City': 'Tefe', 'Country': 'Brazil'}, 'TRQ': {'Name': 'Tarauacá Airport', 'City': 'Tarauaca', 'Country': 'Brazil'}, 'TEC': {'Name': 'Telêmaco Borba Airport', 'City': 'Telemaco Borba', 'Country': 'Brazil'}, 'TBT': {'Name': 'Tabatinga Airport', 'City': 'Tabatinga', 'Country': 'Brazil'}, 'TUR': {'Name': 'Tucuruí Airport', 'City': 'Tucurui', 'Country': 'Brazil'}, 'SJL': {'Name': 'São Gabriel da Cachoeira Airport', 'City': 'Sao Gabriel', 'Country': 'Brazil'}, 'PAV': {'Name': 'Paulo Afonso Airport', 'City': 'Paulo Alfonso', 'Country': 'Brazil'}, 'URG': {'Name': 'Rubem Berta Airport', 'City': 'Uruguaiana', 'Country': 'Brazil'}, 'UDI': {'Name': 'Ten. Cel. Aviador César Bombonato Airport', 'City': 'Uberlandia', 'Country': 'Brazil'}, 'UBA': {'Name': 'Mário de Almeida Franco Airport', 'City': 'Uberaba', 'Country': 'Brazil'}, 'VAG': {'Name': 'Major Brigadeiro Trompowsky Airport', 'City': 'Varginha', 'Country': 'Brazil'}, 'BVH': {'Name': 'Brigadeiro Camarão Airport', 'City': 'Vilhena', 'Country': 'Brazil'}, 'VIX': {'Name': 'Eurico de Aguiar Salles Airport', 'City': 'Vitoria', 'Country': 'Brazil'}, 'QPS': {'Name': 'Campo Fontenelle Airport', 'City': 'Piracununga', 'Country': 'Brazil'}, 'ARI': {'Name': 'Chacalluta Airport', 'City': 'Arica', 'Country': 'Chile'}, 'BBA': {'Name': 'Balmaceda Airport', 'City': 'Balmaceda', 'Country': 'Chile'}, 'CCH': {'Name': 'Chile Chico Airport', 'City': 'Chile Chico', 'Country': 'Chile'}, 'CJC': {'Name': 'El Loa Airport', 'City': 'Calama', 'Country': 'Chile'}, 'YAI': {'Name': 'Gral. Bernardo O´Higgins Airport', 'City': 'Chillan', 'Country': 'Chile'}, 'PUQ': {'Name': 'Pdte. Carlos Ibañez del Campo Airport', 'City': 'Punta Arenas', 'Country': 'Chile'}, 'GXQ': {'Name': 'Teniente Vidal Airport', 'City': 'Coyhaique', 'Country': 'Chile'}, 'IQQ': {'Name': 'Diego Aracena Airport', 'City': 'Iquique', 'Country': 'Chile'}, 'SCL': {'Name': 'Comodoro Arturo Merino Benítez International Airport', 'City': 'Santiago', 'Country': 'Chile'}, 'ANF': {'Name': 'Andrés Sabella Gálvez International Airport', 'City': 'Antofagasta', 'Country': 'Chile'}, 'WPR': {'Name': 'Capitan Fuentes Martinez Airport Airport', 'City': 'Porvenir', 'Country': 'Chile'}, 'FFU': {'Name': 'Futaleufú Airport', 'City': 'Futaleufu', 'Country': 'Chile'}, 'LSQ': {'Name': 'María Dolores Airport', 'City': 'Los Angeles', 'Country': 'Chile'}, 'WPU': {'Name': 'Guardiamarina Zañartu Airport', 'City': 'Puerto Williams', 'Country': 'Chile'}, 'CCP': {'Name': 'Carriel Sur Airport', 'City': 'Concepcion', 'Country': 'Chile'}, 'IPC': {'Name': 'Mataveri Airport', 'City': 'Easter Island', 'Country': 'Chile'}, 'ZOS': {'Name': 'Cañal Bajo Carlos - Hott Siebert Airport', 'City': 'Osorno', 'Country': 'Chile'}, 'VLR': {'Name': 'Vallenar Airport', 'City': 'Vallenar', 'Country': 'Chile'}, 'QRC': {'Name': 'De La Independencia Airport', 'City': 'Rancagua', 'Country': 'Chile'}, 'TNM': {'Name': 'Teniente Rodolfo Marsh Martin Base', 'City': 'Isla Rey Jorge', 'Country': 'Antarctica'}, 'LSC': {'Name': 'La Florida Airport', 'City': 'La Serena', 'Country': 'Chile'}, 'PZS': {'Name': 'Maquehue Airport', 'City': 'Temuco', 'Country': 'Chile'}, 'PMC': {'Name': 'El Tepual Airport', 'City': 'Puerto Montt', 'Country': 'Chile'}, 'WCH': {'Name': 'Chaitén Airport', 'City': 'Chaiten', 'Country': 'Chile'}, 'ZAL': {'Name': 'Pichoy Airport', 'City': 'Valdivia', 'Country': 'Chile'}, 'ATF': {'Name': 'Chachoán Airport', 'City': 'Ambato', 'Country': 'Ecuador'}, 'OCC': {'Name': 'Francisco De Orellana Airport', 'City': 'Coca', 'Country': 'Ecuador'}, 'CUE': {'Name': 'Mariscal Lamar Airport', 'City': 'Cuenca', 'Country': 'Ecuador'}, 'GPS': {'Name': 'Seymour Airport', 'City': 'Galapagos', 'Country': 'Ecuador'}, 'GYE': {'Name': 'José Joaquín de Olmedo International Airport', 'City': 'Guayaquil', 'Country': 'Ecuador'}, 'LTX': {'Name': 'Cotopaxi International Airport', 'City': 'Latacunga', 'Country': 'Ecuador'}, 'MRR': {'Name': 'Jose Maria Velasco Ibarra Airport', 'City': 'Macara', 'Country': 'Ecuador'}, 'XMS': {'Name': 'Coronel E Carvajal Airport', 'City': 'Macas', 'Country': 'Ecuador'}, 'MCH': {'Name': 'General Manuel Serrano Airport', 'City': 'Machala', 'Country': 'Ecuador'}, 'MEC': {'Name': 'Eloy Alfaro International Airport', 'City': 'Manta', 'Country': 'Ecuador'}, 'PVO': {'Name': 'Reales Tamarindos Airport', 'City': 'Portoviejo', 'Country': 'Ecuador'}, 'UIO': {'Name': 'Mariscal Sucre International Airport', 'City': 'Quito', 'Country': 'Ecuador'}, 'ETR': {'Name': 'Santa Rosa International Airport', 'City': 'Santa Rosa', 'Country': 'Ecuador'}, 'SNC': {'Name': 'General Ulpiano Paez Airport', 'City': 'Salinas', 'Country': 'Ecuador'}, 'TPC': {'Name': 'Tarapoa Airport', 'City': 'Tarapoa', 'Country': 'Ecuador'}, 'TUA': {'Name': 'Teniente Coronel Luis a Mantilla Airport', 'City': 'Tulcan', 'Country': 'Ecuador'}, 'ASU': {'Name': 'Silvio Pettirossi International Airport', 'City': 'Asuncion', 'Country': 'Paraguay'}, 'AYO': {'Name': 'Juan De Ayolas Airport', 'City': 'Ayolas', 'Country': 'Paraguay'}, 'CIO': {'Name': 'Teniente Col Carmelo Peralta Airport', 'City': 'Conception', 'Country': 'Paraguay'}, 'ESG': {'Name': 'Dr. Luis Maria Argaña International Airport', 'City': 'Mariscal Estigarribia', 'Country': 'Paraguay'}, 'PIL': {'Name': 'Carlos Miguel Gimenez Airport', 'City': 'Pilar', 'Country': 'Paraguay'}, 'AXM': {'Name': 'El Eden Airport', 'City': 'Armenia', 'Country': 'Colombia'}, 'PUU': {'Name': 'Tres De Mayo Airport', 'City': 'Puerto Asis', 'Country': 'Colombia'}, 'ELB': {'Name': 'Las Flores Airport', 'City': 'El Banco', 'Country': 'Colombia'}, 'BGA': {'Name': 'Palonegro Airport', 'City': 'Bucaramanga', 'Country': 'Colombia'}, 'BOG': {'Name': 'El Dorado International Airport', 'City': 'Bogota', 'Country': 'Colombia'}, 'BAQ': {'Name': 'Ernesto Cortissoz International Airport', 'City': 'Barranquilla', 'Country': 'Colombia'}, 'BSC': {'Name': 'José Celestino Mutis Airport', 'City': 'Bahia Solano', 'Country': 'Colombia'}, 'BUN': {'Name': 'Gerardo Tobar López Airport', 'City': 'Buenaventura', 'Country': 'Colombia'}, 'CUC': {'Name': 'Camilo Daza International Airport', 'City': 'Cucuta', 'Country': 'Colombia'}, 'CTG': {'Name': 'Rafael Nuñez International Airport', 'City': 'Cartagena', 'Country': 'Colombia'}, 'CLO': {'Name': 'Alfonso Bonilla Aragon International Airport', 'City': 'Cali', 'Country': 'Colombia'}, 'TCO': {'Name': 'La Florida Airport', 'City': 'Tumaco', 'Country': 'Colombia'}, 'CZU': {'Name': 'Las Brujas Airport', 'City': 'Corozal', 'Country': 'Colombia'}, 'EJA': {'Name': 'Yariguíes Airport', 'City': 'Barrancabermeja', 'Country': 'Colombia'}, 'FLA': {'Name': 'Gustavo Artunduaga Paredes Airport', 'City': 'Florencia', 'Country': 'Colombia'}, 'GIR': {'Name': 'Santiago Vila Airport', 'City': 'Girardot', 'Country': 'Colombia'}, 'GPI': {'Name': 'Juan Casiano Airport', 'City': 'Guapi', 'Country': 'Colombia'}, 'IBE': {'Name': 'Perales Airport', 'City': 'Ibague', 'Country': 'Colombia'}, 'IPI': {'Name': 'San Luis Airport', 'City': 'Ipiales', 'Country': 'Colombia'}, 'APO': {'Name': 'Antonio Roldan Betancourt Airport', 'City': 'Carepa', 'Country': 'Colombia'}, 'MCJ': {'Name': 'Jorge Isaac Airport', 'City': 'La Mina', 'Country': 'Colombia'}, 'LET': {'Name': 'Alfredo Vásquez Cobo International Airport', 'City': 'Leticia', 'Country': 'Colombia'}, 'EOH': {'Name': 'Enrique Olaya Herrera Airport', 'City': 'Medellin', 'Country': 'Colombia'}, 'MGN': {'Name': 'Baracoa Airport', 'City': 'Magangue', 'Country': 'Colombia'}, 'MTR': {'Name': 'Los Garzones Airport', 'City': 'Monteria', 'Country': 'Colombia'}, 'MVP': {'Name': 'Fabio Alberto Leon Bentley Airport', 'City': 'Mitu', 'Country': 'Colombia'}, 'MZL': {'Name': 'La Nubia Airport', 'City': 'Manizales', 'Country': 'Colombia'}, 'NVA': {'Name': 'Benito Salas Airport', 'City': 'Neiva', 'Country': 'Colombia'}, 'OCV': {'Name': 'Aguas Claras Airport', 'City': 'Ocana', 'Country': 'Colombia'}, 'OTU': {'Name': 'Otu Airport', 'City': 'Otu', 'Country': 'Colombia'}, 'PCR': {'Name': 'German Olano Airport', 'City': 'Puerto Carreno', 'Country': 'Colombia'}, 'PEI': {'Name': 'Matecaña International Airport', 'City': 'Pereira', 'Country': 'Colombia'}, 'PTX': {'Name': 'Pitalito Airport', 'City': 'Pitalito', 'Country': 'Colombia'}, 'PPN': {'Name': 'Guillermo León Valencia Airport', 'City': 'Popayan', 'Country': 'Colombia'}, 'PSO': {'Name': 'Antonio Narino Airport', 'City': 'Pasto', 'Country': 'Colombia'}, 'PVA': {'Name': 'El Embrujo Airport', 'City': 'Providencia', 'Country': 'Colombia'}, 'MQU': {'Name': 'Mariquita Airport', 'City': 'Mariquita', 'Country': 'Colombia'}, 'MDE': {'Name': 'Jose Maria Córdova International Airport', 'City': 'Rio Negro', 'Country': 'Colombia'}, 'RCH': {'Name': 'Almirante Padilla Airport', 'City': 'Rio Hacha', 'Country': 'Colombia'}, 'SJE': {'Name': 'Jorge E. Gonzalez Torres Airport', 'City': 'San Jose Del Guaviare', 'Country': 'Colombia'}, 'SMR': {'Name': 'Simón Bolívar International Airport', 'City': 'Santa Marta', 'Country': 'Colombia'}, 'ADZ': {'Name': 'Gustavo Rojas Pinilla International Airport', 'City': 'San Andres Island', 'Country': 'Colombia'}, 'SVI': {'Name': 'Eduardo Falla Solano Airport', 'City': 'San Vincente De Caguan', 'Country': 'Colombia'}, 'TME': {'Name': 'Gustavo Vargas Airport', 'City': 'Tame', 'Country': 'Colombia'}, 'AUC': {'Name': 'Santiago Perez Airport', 'City': 'Arauca', 'Country': 'Colombia'}, 'UIB': {'Name': 'El Caraño Airport', 'City': 'Quibdo', 'Country': 'Colombia'}, 'ULQ': {'Name': 'Heriberto Gíl Martínez Airport', 'City': 'Tulua', 'Country': 'Colombia'}, 'VUP': {'Name': 'Alfonso López Pumarejo Airport', 'City': 'Valledupar', 'Country': 'Colombia'}, 'VVC': {'Name': 'Vanguardia Airport', 'City': 'Villavicencio', 'Country': 'Colombia'}, 'BJO': {'Name': 'Bermejo Airport', 'City': 'Bermejo', 'Country': 'Bolivia'}, 'CBB': {'Name': 'Jorge Wilsterman International Airport', 'City': 'Cochabamba', 'Country': 'Bolivia'}, 'CCA': {'Name': 'Chimore Airport', 'City': 'Chapacura', 'Country': 'Bolivia'}, 'CIJ': {'Name': 'Capitán Aníbal Arab Airport', 'City': 'Cobija', 'Country': 'Bolivia'}, 'LPB': {'Name': 'El Alto International Airport', 'City': 'La Paz', 'Country': 'Bolivia'}, 'ORU': {'Name': 'Juan Mendoza Airport', 'City': 'Oruro', 'Country': 'Bolivia'}, 'POI': {'Name': 'Capitan Nicolas Rojas Airport', 'City': 'Potosi', 'Country': 'Bolivia'}, 'PSZ': {'Name': 'Capitán Av. Salvador Ogaya G. airport', 'City': 'Puerto Suarez', 'Country': 'Bolivia'}, 'SBL': {'Name': 'Santa Ana Del Yacuma Airport', 'City': 'Santa Ana', 'Country': 'Bolivia'}, 'SRE': {'Name': 'Juana Azurduy De Padilla Airport', 'City': 'Sucre', 'Country': 'Bolivia'}, 'TJA': {'Name': 'Capitan Oriel Lea Plaza Airport', 'City': 'Tarija', 'Country': 'Bolivia'}, 'TDD': {'Name': 'Teniente Av. Jorge Henrich Arauz Airport', 'City': 'Trinidad', 'Country': 'Bolivia'}, 'VLM': {'Name': 'Teniente Coronel Rafael Pabón Airport', 'City': 'Villa Montes', 'Country': 'Bolivia'}, 'VVI': {'Name': 'Viru Viru International Airport', 'City': 'Santa Cruz', 'Country': 'Bolivia'}, 'BYC': {'Name': 'Yacuiba Airport', 'City': 'Yacuiba', 'Country': 'Bolivia'}, 'PBM': {'Name': 'Johan Adolf Pengel International Airport', 'City': 'Zandery', 'Country': 'Suriname'}, 'CAY': {'Name': 'Cayenne-Rochambeau Airport', 'City': 'Cayenne', 'Country': 'French Guiana'}, 'OYP': {'Name': "Saint-Georges-de-l'Oyapock Airport", 'City': 'St.-georges Oyapock', 'Country': 'French Guiana'}, 'AOP': {'Name': 'Alferez FAP Alfredo Vladimir Sara Bauer Airport', 'City': 'Andoas', 'Country': 'Peru'}, 'IBP': {'Name': 'Iberia Airport', 'City': 'Iberia', 'Country': 'Peru'}, 'PCL': {'Name': 'Cap FAP David Abenzur Rengifo International Airport', 'City': 'Pucallpa', 'Country': 'Peru'}, 'CHM': {'Name': 'Teniente FAP Jaime A De Montreuil Morales Airport', 'City': 'Chimbote', 'Country': 'Peru'}, 'CIX': {'Name': 'Capitan FAP Jose A Quinones Gonzales International Airport', 'City': 'Chiclayo', 'Country': 'Peru'}, 'AYP': {'Name': 'Coronel FAP Alfredo Mendivil Duarte Airport', 'City': 'Ayacucho', 'Country': 'Peru'}, 'ANS': {'Name': 'Andahuaylas Airport', 'City': 'Andahuaylas', 'Country': 'Peru'}, 'ATA': {'Name': 'Comandante FAP German Arias Graziani Airport', 'City': 'Anta', 'Country': 'Peru'}, 'LIM': {'Name': 'Jorge Chávez International Airport', 'City': 'Lima', 'Country': 'Peru'}, 'JJI': {'Name': 'Juanjui Airport', 'City': 'Juanjui', 'Country': 'Peru'}, 'JAU': {'Name': 'Francisco Carle Airport', 'City': 'Jauja', 'Country': 'Peru'}, 'JUL': {'Name': 'Inca Manco Capac International Airport', 'City': 'Juliaca', 'Country': 'Peru'}, 'ILQ': {'Name': 'Ilo Airport', 'City': 'Ilo', 'Country': 'Peru'}, 'TBP': {'Name': 'Capitan FAP Pedro Canga Rodriguez Airport', 'City': 'Tumbes', 'Country': 'Peru'}, 'YMS': {'Name': 'Moises Benzaquen Rengifo Airport', 'City': 'Yurimaguas', 'Country': 'Peru'}, 'CHH': {'Name': 'Chachapoyas Airport', 'City': 'Chachapoyas', 'Country': 'Peru'}, 'IQT': {'Name': 'Coronel FAP Francisco Secada Vignetta International Airport', 'City': 'Iquitos', 'Country': 'Peru'}, 'AQP': {'Name': 'Rodríguez Ballón International Airport', 'City': 'Arequipa', 'Country': 'Peru'}, 'TRU': {'Name': 'Capitan FAP Carlos Martinez De Pinillos International Airport', 'City': 'Trujillo', 'Country': 'Peru'}, 'PIO': {'Name': 'Capitán FAP Renán Elías Olivera International Airport', 'City': 'Pisco', 'Country': 'Peru'}, 'TPP': {'Name': 'Cadete FAP Guillermo Del Castillo Paredes Airport', 'City': 'Tarapoto', 'Country': 'Peru'}, 'TCQ': {'Name': 'Coronel FAP Carlos Ciriani Santa Rosa International Airport', 'City': 'Tacna', 'Country': 'Peru'}, 'PEM': {'Name': 'Padre Aldamiz International Airport', 'City': 'Puerto Maldonado', 'Country': 'Peru'}, 'PIU': {'Name': 'Capitán FAP Guillermo Concha Iberico International Airport', 'City': 'Piura', 'Country': 'Peru'}, 'TYL': {'Name': 'Capitan Montes Airport', 'City': 'Talara', 'Country': 'Peru'}, 'CUZ': {'Name': 'Alejandro Velasco Astete International Airport', 'City': 'Cuzco', 'Country': 'Peru'}, 'DZO': {'Name': 'Santa Bernardina International Airport', 'City': 'Durazno', 'Country': 'Uruguay'}, 'MVD': {'Name': 'Carrasco International /General C L Berisso Airport', 'City': 'Montevideo', 'Country': 'Uruguay'}, 'STY': {'Name': 'Nueva Hesperides International Airport', 'City': 'Salto', 'Country': 'Uruguay'}, 'AGV': {'Name': 'Oswaldo Guevara Mujica Airport', 'City': 'Acarigua', 'Country': 'Venezuela'}, 'AAO': {'Name': 'Anaco Airport', 'City': 'Anaco', 'Country': 'Venezuela'}, 'BLA': {'Name': 'General José Antonio Anzoategui International Airport', 'City': 'Barcelona', 'Country': 'Venezuela'}, 'BNS': {'Name': 'Barinas Airport', 'City': 'Barinas', 'Country': 'Venezuela'}, 'BRM': {'Name': 'Barquisimeto International Airport', 'City': 'Barquisimeto', 'Country': 'Venezuela'}, 'CBL': {'Name': 'Aeropuerto "General Tomas de Heres". Ciudad Bolivar', 'City': 'Ciudad Bolivar', 'Country': 'Venezuela'}, 'CXA': {'Name': 'Caicara del Orinoco Airport', 'City': 'Caicara De Orinoco', 'Country': 'Venezuela'}, 'CLZ': {'Name': 'Calabozo Airport', 'City': 'Calabozo', 'Country': 'Venezuela'}, 'CAJ': {'Name': 'Canaima Airport', 'City': 'Canaima', 'Country': 'Venezuela'}, 'VCR': {'Name': 'Carora Airport', 'City': 'Carora', 'Country': 'Venezuela'}, 'CUP': {'Name': 'General Francisco Bermúdez Airport', 'City': 'Carupano', 'Country': 'Venezuela'}, 'CZE': {'Name': 'José Leonardo Chirinos Airport', 'City': 'Coro', 'Country': 'Venezuela'}, 'CUM': {'Name': 'Cumaná (Antonio José de Sucre) Airport', 'City': 'Cumana', 'Country': 'Venezuela'}, 'EOR': {'Name': 'El Dorado Airport', 'City': 'El Dorado', 'Country': 'Venezuela'}, 'EOZ': {'Name': 'Elorza Airport', 'City': 'Elorza', 'Country': 'Venezuela'}, 'GDO': {'Name': 'Guasdalito Airport', 'City': 'Guasdualito', 'Country': 'Venezuela'}, 'GUI': {'Name': 'Guiria Airport', 'City': 'Guiria', 'Country': 'Venezuela'}, 'GUQ': {'Name': 'Guanare Airport', 'City': 'Guanare', 'Country': 'Venezuela'}, 'HGE': {'Name': 'Higuerote Airport', 'City': 'Higuerote', 'Country': 'Venezuela'}, 'ICC': {'Name': 'Andrés Miguel Salazar Marcano Airport', 'City': 'Isla De Coche', 'Country': 'Venezuela'}, 'LSP': {'Name': 'Josefa Camejo International Airport', 'City': 'Paraguana', 'Country': 'Venezuela'}, 'LFR': {'Name': 'La Fria Airport', 'City': 'La Fria', 'Country': 'Venezuela'}, 'MAR': {'Name': 'La Chinita International Airport', 'City': 'Maracaibo', 'Country': 'Venezuela'}, 'MRD': {'Name': 'Alberto Carnevalli Airport', 'City': 'Merida', 'Country': 'Venezuela'}, 'PMV': {'Name': 'Del Caribe Santiago Mariño International Airport', 'City': 'Porlamar', 'Country': 'Venezuela'}, 'CCS': {'Name': 'Simón Bolívar International Airport', 'City': 'Caracas', 'Country': 'Venezuela'}, 'MUN': {'Name': 'Maturín Airport', 'City': 'Maturin', 'Country': 'Venezuela'}, 'PYH': {'Name': 'Cacique Aramare Airport', 'City': 'Puerto Ayacucho', 'Country': 'Venezuela'}, 'PBL': {'Name': 'General Bartolome Salom International Airport', 'City': 'Puerto Cabello', 'Country': 'Venezuela'}, 'SCI': {'Name': 'Paramillo Airport', 'City': 'San Cristobal', 'Country': 'Venezuela'}, 'PZO': {'Name': 'General Manuel Carlos Piar International Airport', 'City': 'Guayana', 'Country': 'Venezuela'}, 'PTM': {'Name': 'Palmarito Airport', 'City': 'Palmarito', 'Country': 'Venezuela'}, 'SVZ': {'Name': 'San Antonio Del Tachira Airport', 'City': 'San Antonio', 'Country': 'Venezuela'}, 'SBB': {'Name': 'Santa Bárbara de Barinas Airport', 'City': 'Santa Barbara', 'Country': 'Venezuela'}, 'SNV': {'Name': 'Santa Elena de Uairen Airport', 'City': 'Santa Ana De Uairen', 'Country': 'Venezuela'}, 'STD': {'Name': 'Mayor Buenaventura Vivas International Airport', 'City': 'Santo Domingo', 'Country': 'Venezuela'}, 'SNF': {'Name': 'Sub Teniente Nestor Arias Airport', 'City': 'San Felipe', 'Country': 'Venezuela'}, 'SFD': {'Name': 'San Fernando De Apure Airport', 'City': 'San Fernando De Apure', 'Country': 'Venezuela'}, 'SOM': {'Name': 'San Tomé Airport', 'City': 'San Tome', 'Country': 'Venezuela'}, 'STB': {'Name': 'Santa Bárbara del Zulia Airport', 'City': 'Santa Barbara', 'Country': 'Venezuela'}, 'TUV': {'Name': 'Tucupita Airport', 'City': 'Tucupita', 'Country': 'Venezuela'}, 'TMO': {'Name': 'Tumeremo Airport', 'City': 'Tumeremo', 'Country': 'Venezuela'}, 'VLN': {'Name': 'Arturo Michelena International Airport', 'City': 'Valencia', 'Country': 'Venezuela'}, 'VLV': {'Name': 'Dr. Antonio Nicolás Briceño Airport', 'City': 'Valera', 'Country': 'Venezuela'}, 'VDP': {'Name': 'Valle de La Pascua Airport', 'City': 'Valle De La Pascua', 'Country': 'Venezuela'}, 'LTM': {'Name': 'Lethem Airport', 'City': 'Lethem', 'Country': 'Guyana'}, 'ANU': {'Name': 'V.C. Bird International Airport', 'City': 'Antigua', 'Country': 'Antigua and Barbuda'}, 'BGI': {'Name': 'Sir Grantley Adams International Airport', 'City': 'Bridgetown', 'Country': 'Barbados'}, 'DCF': {'Name': 'Canefield Airport', 'City': 'Canefield', 'Country': 'Dominica'}, 'DOM': {'Name': 'Douglas-Charles Airport', 'City': 'Dominica', 'Country': 'Dominica'}, 'FDF': {'Name': 'Martinique Aimé Césaire International Airport', 'City': 'Fort-de-france', 'Country': 'Martinique'}, 'SFG': {'Name': "L'Espérance Airport", 'City': 'St. Martin', 'Country': 'Guadeloupe'}, 'PTP': {'Name': 'Pointe-à-Pitre Le Raizet', 'City': 'Pointe-a-pitre', 'Country': 'Guadeloupe'}, 'GND': {'Name': 'Point Salines International Airport', 'City': 'Point Salines', 'Country': 'Grenada'}, 'STT': {'Name': 'Cyril E. King Airport', 'City': 'St. Thomas', 'Country': 'Virgin Islands'}, 'STX': {'Name': 'Henry E Rohlsen Airport', 'City': 'St. Croix Island', 'Country': 'Virgin Islands'}, 'BQN': {'Name': 'Rafael Hernandez Airport', 'City': 'Aguadilla', 'Country': 'Puerto Rico'}, 'FAJ': {'Name': 'Diego Jimenez Torres Airport', 'City': 'Fajardo', 'Country': 'Puerto Rico'}, 'SIG': {'Name': 'Fernando Luis Ribas Dominicci Airport', 'City': 'San Juan', 'Country': 'Puerto Rico'}, 'MAZ': {'Name': 'Eugenio Maria De Hostos Airport', 'City': 'Mayaguez', 'Country': 'Puerto Rico'}, 'PSE': {'Name': 'Mercedita Airport', 'City': 'Ponce', 'Country': 'Puerto Rico'}, 'SJU': {'Name': 'Luis Munoz Marin International Airport', 'City': 'San Juan', 'Country': 'Puerto Rico'}, 'SKB': {'Name': 'Robert L. Bradshaw International Airport', 'City': 'Basse Terre', 'Country': 'Saint Kitts and Nevis'}, 'SLU': {'Name': 'George F. L. Charles Airport', 'City': 'Castries', 'Country': 'Saint Lucia'}, 'UVF': {'Name': 'Hewanorra International Airport', 'City': 'Hewandorra', 'Country': 'Saint Lucia'}, 'AUA': {'Name': 'Queen Beatrix International Airport', 'City': 'Oranjestad', 'Country': 'Aruba'}, 'BON': {'Name': 'Flamingo International Airport', 'City': 'Kralendijk', 'Country': 'Netherlands Antilles'}, 'CUR': {'Name': 'Hato International Airport', 'City': 'Willemstad', 'Country': 'Netherlands Antilles'}, 'EUX': {'Name': 'F. D. Roosevelt Airport', 'City': 'Oranjestad', 'Country': 'Netherlands Antilles'}, 'SXM': {'Name': 'Princess Juliana International Airport', 'City': 'Philipsburg', 'Country': 'Netherlands Antilles'}, 'AXA': {'Name': 'Clayton J Lloyd International Airport', 'City': 'The Valley', 'Country': 'Anguilla'}, 'TAB': {'Name': 'Tobago-Crown Point Airport', 'City': 'Scarborough', 'Country': 'Trinidad and Tobago'}, 'POS': {'Name': 'Piarco International Airport', 'City': 'Port-of-spain', 'Country': 'Trinidad and Tobago'}, 'EIS': {'Name': 'Terrance B. Lettsome International Airport', 'City': 'Tortola', 'Country': 'British Virgin Islands'}, 'CIW': {'Name': 'Canouan Airport', 'City': 'Canouan Island', 'Country': 'Saint Vincent and the Grenadines'}, 'MQS': {'Name': 'Mustique Airport', 'City': 'Mustique', 'Country': 'Saint Vincent and the Grenadines'}, 'SVD': {'Name': 'Argyle International Airport', 'City': 'Kingstown', 'Country': 'Saint Vincent and the Grenadines'}, 'ALA': {'Name': 'Almaty Airport', 'City': 'Alma-ata', 'Country': 'Kazakhstan'}, 'BXH': {'Name': 'Balkhash Airport', 'City': 'Balkhash', 'Country': 'Kazakhstan'}, 'TSE': {'Name': 'Astana International Airport', 'City': 'Tselinograd', 'Country': 'Kazakhstan'}, 'DMB': {'Name': 'Taraz Airport', 'City': 'Dzhambul', 'Country': 'Kazakhstan'}, 'FRU': {'Name': 'Manas International Airport', 'City': 'Bishkek', 'Country': 'Kyrgyzstan'}, 'OSS': {'Name': 'Osh Airport', 'City': 'Osh', 'Country': 'Kyrgyzstan'}, 'CIT': {'Name': 'Shymkent Airport', 'City': 'Chimkent', 'Country': 'Kazakhstan'}, 'URA': {'Name': 'Uralsk Airport', 'City': 'Uralsk', 'Country': 'Kazakhstan'}, 'PWQ': {'Name': 'Pavlodar Airport', 'City': 'Pavlodar', 'Country': 'Kazakhstan'}, 'PLX': {'Name': 'Semipalatinsk Airport', 'City': 'Semiplatinsk', 'Country': 'Kazakhstan'}, 'AKX': {'Name': 'Aktobe Airport', 'City': 'Aktyubinsk', 'Country': 'Kazakhstan'}, 'GYD': {'Name': 'Heydar Aliyev International Airport', 'City': 'Baku', 'Country': 'Azerbaijan'}, 'YKS': {'Name': 'Yakutsk Airport', 'City': 'Yakutsk', 'Country': 'Russia'}, 'MJZ': {'Name': 'Mirny Airport', 'City': 'Mirnyj', 'Country': 'Russia'}, 'BQS': {'Name': 'Ignatyevo Airport', 'City': 'Blagoveschensk', 'Country': 'Russia'}, 'KHV': {'Name': 'Khabarovsk-Novy Airport', 'City': 'Khabarovsk', 'Country': 'Russia'}, 'PVS': {'Name': 'Provideniya Bay Airport', 'City': 'Provideniya Bay', 'Country': 'Russia'}, 'GDX': {'Name': 'Sokol Airport', 'City': 'Magadan', 'Country': 'Russia'}, 'PWE': {'Name': 'Pevek Airport', 'City': 'Pevek', 'Country': 'Russia'}, 'PKC': {'Name': 'Yelizovo Airport', 'City': 'Petropavlovsk', 'Country': 'Russia'}, 'UUS': {'Name': 'Yuzhno-Sakhalinsk Airport', 'City': 'Yuzhno-sakhalinsk', 'Country': 'Russia'}, 'VVO': {'Name': 'Vladivostok International Airport', 'City': 'Vladivostok', 'Country': 'Russia'}, 'HTA': {'Name': 'Chita-Kadala Airport', 'City': 'Chita', 'Country': 'Russia'}, 'BTK': {'Name': 'Bratsk Airport', 'City': 'Bratsk', 'Country': 'Russia'}, 'IKT': {'Name': 'Irkutsk Airport', 'City': 'Irkutsk', 'Country': 'Russia'}, 'UUD': {'Name': 'Ulan-Ude Airport (Mukhino)', 'City': 'Ulan-ude', 'Country': 'Russia'}, 'KBP': {'Name': 'Boryspil International Airport', 'City': 'Kiev', 'Country': 'Ukraine'}, 'DOK': {'Name': 'Donetsk International Airport', 'City': 'Donetsk', 'Country': 'Ukraine'}, 'DNK': {'Name': 'Dnipropetrovsk International Airport', 'City': 'Dnepropetrovsk', 'Country': 'Ukraine'}, 'SIP': {'Name': 'Simferopol International Airport', 'City': 'Simferopol', 'Country': 'Ukraine'}, 'IEV': {'Name': 'Kiev Zhuliany International Airport', 'City': 'Kiev', 'Country': 'Ukraine'}, 'LWO': {'Name': 'Lviv International Airport', 'City': 'Lvov', 'Country': 'Ukraine'}, 'ODS': {'Name': 'Odessa International Airport', 'City': 'Odessa', 'Country': 'Ukraine'}, 'LED': {'Name': 'Pulkovo Airport', 'City': 'St. Petersburg', 'Country': 'Russia'}, 'MMK': {'Name': 'Murmansk Airport', 'City': 'Murmansk', 'Country': 'Russia'}, 'GME': {'Name': 'Gomel Airport', 'City': 'Gomel', 'Country': 'Belarus'}, 'VTB': {'Name': 'Vitebsk Vostochny Airport', 'City': 'Vitebsk', 'Country': 'Belarus'}, 'KGD': {'Name': 'Khrabrovo Airport', 'City': 'Kaliningrad', 'Country': 'Russia'}, 'MHP': {'Name': 'Minsk 1 Airport', 'City': 'Minsk', 'Country': 'Belarus'}, 'MSQ': {'Name': 'Minsk National Airport', 'City': 'Minsk 2', 'Country': 'Belarus'}, 'ABA': {'Name': 'Abakan Airport', 'City': 'Abakan', 'Country': 'Russia'}, 'BAX': {'Name': 'Barnaul Airport', 'City': 'Barnaul', 'Country': 'Russia'}, 'KEJ': {'Name': 'Kemerovo Airport', 'City': 'Kemorovo', 'Country': 'Russia'}, 'OMS': {'Name': 'Omsk Central Airport', 'City': 'Omsk', 'Country': 'Russia'}, 'KRR': {'Name': 'Krasnodar Pashkovsky International Airport', 'City': 'Krasnodar', 'Country': 'Russia'}, 'MCX': {'Name': 'Uytash Airport', 'City': 'Makhachkala', 'Country': 'Russia'}, 'MRV': {'Name': 'Mineralnyye Vody Airport', 'City': 'Mineralnye Vody', 'Country': 'Russia'}, 'STW': {'Name': 'Stavropol Shpakovskoye Airport', 'City': 'Stavropol', 'Country': 'Russia'}, 'ROV': {'Name': 'Platov International Airport', 'City': 'Rostov', 'Country': 'Russia'}, 'AER': {'Name': 'Sochi International Airport', 'City': 'Sochi', 'Country': 'Russia'}, 'ASF': {'Name': 'Astrakhan Airport', 'City': 'Astrakhan', 'Country': 'Russia'}, 'VOG': {'Name': 'Volgograd International Airport', 'City': 'Volgograd', 'Country': 'Russia'}, 'CEK': {'Name': 'Chelyabinsk Balandino Airport', 'City': 'Chelyabinsk', 'Country': 'Russia'}, 'MQF': {'Name': 'Magnitogorsk International Airport', 'City': 'Magnetiogorsk', 'Country': 'Russia'}, 'NJC': {'Name': 'Nizhnevartovsk Airport', 'City': 'Nizhnevartovsk', 'Country': 'Russia'}, 'PEE': {'Name': 'Bolshoye Savino Airport', 'City': 'Perm', 'Country': 'Russia'}, 'SGC': {'Name': 'Surgut Airport', 'City': 'Surgut', 'Country': 'Russia'}, 'SVX': {'Name': 'Koltsovo Airport', 'City': 'Yekaterinburg', 'Country': 'Russia'}, 'ASB': {'Name': 'Ashgabat International Airport', 'City': 'Ashkhabad', 'Country': 'Turkmenistan'}, 'KRW': {'Name': 'Turkmenbashi Airport', 'City': 'Krasnovodsk', 'Country': 'Turkmenistan'}, 'CRZ': {'Name': 'Turkmenabat Airport', 'City': 'Chardzhou', 'Country': 'Turkmenistan'}, 'DYU': {'Name': 'Dushanbe Airport', 'City': 'Dushanbe', 'Country': 'Tajikistan'}, 'BHK': {'Name': 'Bukhara Airport', 'City': 'Bukhara', 'Country': 'Uzbekistan'}, 'SKD': {'Name': 'Samarkand Airport', 'City': 'Samarkand', 'Country': 'Uzbekistan'}, 'TAS': {'Name': 'Tashkent International Airport', 'City': 'Tashkent', 'Country': 'Uzbekistan'}, 'BZK': {'Name': 'Bryansk Airport', 'City': 'Bryansk', 'Country': 'Russia'}, 'SVO': {'Name': 'Sheremetyevo International Airport', 'City': 'Moscow', 'Country': 'Russia'}, 'KLD': {'Name': 'Migalovo Air Base', 'City': 'Tver', 'Country': 'Russia'}, 'VOZ': {'Name': 'Voronezh International Airport', 'City': 'Voronezh', 'Country': 'Russia'}, 'VKO': {'Name': 'Vnukovo International Airport', 'City': 'Moscow', 'Country': 'Russia'}, 'SCW': {'Name': 'Syktyvkar Airport', 'City': 'Syktyvkar', 'Country': 'Russia'}, 'KZN': {'Name': 'Kazan International Airport', 'City': 'Kazan', 'Country': 'Russia'}, 'REN': {'Name': 'Orenburg Central Airport', 'City': 'Orenburg', 'Country': 'Russia'}, 'UFA': {'Name': 'Ufa International Airport', 'City': 'Ufa', 'Country': 'Russia'}, 'KUF': {'Name': 'Kurumoch International Airport', 'City': 'Samara', 'Country': 'Russia'}, 'AMD': {'Name': 'Sardar Vallabhbhai Patel International Airport', 'City': 'Ahmedabad', 'Country': 'India'}, 'AKD': {'Name': 'Akola Airport', 'City': 'Akola', 'Country': 'India'}, 'IXU': {'Name': 'Aurangabad Airport', 'City': 'Aurangabad', 'Country': 'India'}, 'BOM': {'Name': 'Chhatrapati Shivaji International Airport', 'City': 'Mumbai', 'Country': 'India'}, 'PAB': {'Name': 'Bilaspur Airport', 'City': 'Bilaspur', 'Country': 'India'}, 'BHJ': {'Name': 'Bhuj Airport', 'City': 'Bhuj', 'Country': 'India'}, 'IXG': {'Name': 'Belgaum Airport', 'City': 'Belgaum', 'Country': 'India'}, 'BDQ': {'Name': 'Vadodara Airport', 'City': 'Baroda', 'Country': 'India'}, 'BHO': {'Name': 'Raja Bhoj International Airport', 'City': 'Bhopal', 'Country': 'India'}, 'BHU': {'Name': 'Bhavnagar Airport', 'City': 'Bhaunagar', 'Country': 'India'}, 'NMB': {'Name': 'Daman Airport', 'City': 'Daman', 'Country': 'India'}, 'GUX': {'Name': 'Guna Airport', 'City': 'Guna', 'Country': 'India'}, 'GOI': {'Name': 'Dabolim Airport', 'City': 'Goa', 'Country': 'India'}, 'IDR': {'Name': 'Devi Ahilyabai Holkar Airport', 'City': 'Indore', 'Country': 'India'}, 'JLR': {'Name': 'Jabalpur Airport', 'City': 'Jabalpur', 'Country': 'India'}, 'JGA': {'Name': 'Jamnagar Airport', 'City': 'Jamnagar', 'Country': 'India'}, 'IXY': {'Name': 'Kandla Airport', 'City': 'Kandla', 'Country': 'India'}, 'HJR': {'Name': 'Khajuraho Airport', 'City': 'Khajuraho', 'Country': 'India'}, 'KLH': {'Name': 'Kolhapur Airport', 'City': 'Kolhapur', 'Country': 'India'}, 'IXK': {'Name': 'Keshod Airport', 'City': 'Keshod', 'Country': 'India'}, 'NAG': {'Name': 'Dr. Babasaheb Ambedkar International Airport', 'City': 'Nagpur', 'Country': 'India'}, 'ISK': {'Name': 'Nashik Airport', 'City': 'Nasik Road', 'Country': 'India'}, 'PNQ': {'Name': 'Pune Airport', 'City': 'Pune', 'Country': 'India'}, 'PBD': {'Name': 'Porbandar Airport', 'City': 'Porbandar', 'Country': 'India'}, 'RAJ': {'Name': 'Rajkot Airport', 'City': 'Rajkot', 'Country': 'India'}, 'RPR': {'Name': 'Raipur Airport', 'City': 'Raipur', 'Country': 'India'}, 'SSE': {'Name': 'Solapur Airport', 'City': 'Sholapur', 'Country': 'India'}, 'STV': {'Name': 'Surat Airport', 'City': 'Surat', 'Country': 'India'}, 'UDR': {'Name': 'Maharana Pratap Airport', 'City': 'Udaipur', 'Country': 'India'}, 'CMB': {'Name': 'Bandaranaike International Colombo Airport', 'City': 'Colombo', 'Country': 'Sri Lanka'}, 'ACJ': {'Name': 'Anuradhapura Air Force Base', 'City': 'Anuradhapura', 'Country': 'Sri Lanka'}, 'BTC': {'Name': 'Batticaloa Airport', 'City': 'Batticaloa', 'Country': 'Sri Lanka'}, 'RML': {'Name': 'Colombo Ratmalana Airport', 'City': 'Colombo', 'Country': 'Sri Lanka'}, 'ADP': {'Name': 'Ampara Airport', 'City': 'Galoya', 'Country': 'Sri Lanka'}, 'JAF': {'Name': 'Kankesanturai Airport', 'City': 'Jaffna', 'Country': 'Sri Lanka'}, 'TRR': {'Name': 'China Bay Airport', 'City': 'Trinciomalee', 'Country': 'Sri Lanka'}, 'KZC': {'Name': 'Kampong Chhnang Airport', 'City': 'Kompong Chnang', 'Country': 'Cambodia'}, 'PNH': {'Name': 'Phnom Penh International Airport', 'City': 'Phnom-penh', 'Country': 'Cambodia'}, 'REP': {'Name': 'Siem Reap International Airport', 'City': 'Siem-reap', 'Country': 'Cambodia'}, 'TNX': {'Name': 'Stung Treng Airport', 'City': 'Stung Treng', 'Country': 'Cambodia'}, 'IXV': {'Name': 'Along Airport', 'City': 'Along', 'Country': 'India'}, 'IXA': {'Name': 'Agartala Airport', 'City': 'Agartala', 'Country': 'India'}, 'AJL': {'Name': 'Lengpui Airport', 'City': 'Aizwal', 'Country': 'India'}, 'IXB': {'Name': 'Bagdogra Airport', 'City': 'Baghdogra', 'Country': 'India'}, 'BBI': {'Name': 'Biju Patnaik Airport', 'City': 'Bhubaneswar', 'Country': 'India'}, 'CCU': {'Name': 'Netaji Subhash Chandra Bose International Airport', 'City': 'Kolkata', 'Country': 'India'}, 'COH': {'Name': 'Cooch Behar Airport', 'City': 'Cooch-behar', 'Country': 'India'}, 'DBD': {'Name': 'Dhanbad Airport', 'City': 'Dhanbad', 'Country': 'India'}, 'GAY': {'Name': 'Gaya Airport', 'City': 'Gaya', 'Country': 'India'}, 'IMF': {'Name': 'Imphal Airport', 'City': 'Imphal', 'Country': 'India'}, 'IXW': {'Name': 'Sonari Airport', 'City': 'Jamshedpur', 'Country': 'India'}, 'JRH': {'Name': 'Jorhat Airport', 'City': 'Jorhat', 'Country': 'India'}, 'IXH': {'Name': 'Kailashahar Airport', 'City': 'Kailashahar', 'Country': 'India'}, 'IXS': {'Name': 'Silchar Airport', 'City': 'Silchar', 'Country': 'India'}, 'IXI': {'Name': 'North Lakhimpur Airport', 'City': 'Lilabari', 'Country': 'India'}, 'DIB': {'Name': 'Dibrugarh Airport', 'City': 'Mohanbari', 'Country': 'India'}, 'MZU': {'Name': 'Muzaffarpur Airport', 'City': 'Mazuffarpur', 'Country': 'India'}, 'PAT': {'Name': 'Lok Nayak Jayaprakash Airport', 'City': 'Patina', 'Country': 'India'}, 'IXR': {'Name': 'Birsa Munda Airport', 'City': 'Ranchi', 'Country': 'India'}, 'RRK': {'Name': 'Rourkela Airport', 'City': 'Rourkela', 'Country': 'India'}, 'VTZ': {'Name': 'Vishakhapatnam Airport', 'City': 'Vishakhapatnam', 'Country': 'India'}, 'ZER': {'Name': 'Ziro Airport', 'City': 'Zero', 'Country': 'India'}, 'CXB': {'Name': "Cox's Bazar Airport", 'City': "Cox's Bazar", 'Country': 'Bangladesh'}, 'CGP': {'Name': 'Shah Amanat International Airport', 'City': 'Chittagong', 'Country': 'Bangladesh'}, 'IRD': {'Name': 'Ishurdi Airport', 'City': 'Ishurdi', 'Country': 'Bangladesh'}, 'JSR': {'Name': 'Jessore Airport', 'City': 'Jessore', 'Country': 'Bangladesh'}, 'RJH': {'Name': 'Shah Mokhdum Airport', 'City': 'Rajshahi', 'Country': 'Bangladesh'}, 'SPD': {'Name': 'Saidpur Airport', 'City': 'Saidpur', 'Country': 'Bangladesh'}, 'ZYL': {'Name': 'Osmany International Airport', 'City': 'Sylhet Osmani', 'Country': 'Bangladesh'}, 'DAC': {'Name': 'Hazrat Shahjalal International Airport', 'City': 'Dhaka', 'Country': 'Bangladesh'}, 'HKG': {'Name': 'Hong Kong International Airport', 'City': 'Hong Kong', 'Country': 'Hong Kong'}, 'AGR': {'Name': 'Agra Airport', 'City': 'Agra', 'Country': 'India'}, 'IXD': {'Name': 'Allahabad Airport', 'City': 'Allahabad', 'Country': 'India'}, 'ATQ': {'Name': 'Sri Guru Ram Dass Jee International Airport', 'City': 'Amritsar', 'Country': 'India'}, 'BKB': {'Name': 'Nal Airport', 'City': 'Bikaner', 'Country': 'India'}, 'VNS': {'Name': 'Lal Bahadur Shastri Airport', 'City': 'Varanasi', 'Country': 'India'}, 'KUU': {'Name': 'Kullu Manali Airport', 'City': 'Kulu', 'Country': 'India'}, 'BUP': {'Name': 'Bhatinda Air Force Station', 'City': 'Bhatinda', 'Country': 'India'}, 'BEK': {'Name': 'Bareilly Air Force Station', 'City': 'Bareilly', 'Country': 'India'}, 'IXC': {'Name': 'Chandigarh Airport', 'City': 'Chandigarh', 'Country': 'India'}, 'KNU': {'Name': 'Kanpur Airport', 'City': 'Kanpur', 'Country': 'India'}, 'DED': {'Name': 'Dehradun Airport', 'City': 'Dehra Dun', 'Country': 'India'}, 'DEL': {'Name': 'Indira Gandhi International Airport', 'City': 'Delhi', 'Country': 'India'}, 'GWL': {'Name': 'Gwalior Airport', 'City': 'Gwalior', 'Country': 'India'}, 'HSS': {'Name': 'Hissar Airport', 'City': 'Hissar', 'Country': 'India'}, 'JDH': {'Name': 'Jodhpur Airport', 'City': 'Jodhpur', 'Country': 'India'}, 'JAI': {'Name': 'Jaipur International Airport', 'City': 'Jaipur', 'Country': 'India'}, 'JSA': {'Name': 'Jaisalmer Airport', 'City': 'Jaisalmer', 'Country': 'India'}, 'IXJ': {'Name': 'Jammu Airport', 'City': 'Jammu', 'Country': 'India'}, 'KTU': {'Name': 'Kota Airport', 'City': 'Kota', 'Country': 'India'}, 'LUH': {'Name': 'Ludhiana Airport', 'City': 'Ludhiaha', 'Country': 'India'}, 'IXL': {'Name': 'Leh Kushok Bakula Rimpochee Airport', 'City': 'Leh', 'Country': 'India'}, 'LKO': {'Name': 'Chaudhary Charan Singh International Airport', 'City': 'Lucknow', 'Country': 'India'}, 'IXP': {'Name': 'Pathankot Airport', 'City': 'Pathankot', 'Country': 'India'}, 'PGH': {'Name': 'Pantnagar Airport', 'City': 'Nainital', 'Country': 'India'}, 'SXR': {'Name': 'Sheikh ul Alam Airport', 'City': 'Srinagar', 'Country': 'India'}, 'TNI': {'Name': 'Satna Airport', 'City': 'Satna', 'Country': 'India'}, 'LPQ': {'Name': 'Luang Phabang International Airport', 'City': 'Luang Prabang', 'Country': 'Laos'}, 'PKZ': {'Name': 'Pakse International Airport', 'City': 'Pakse', 'Country': 'Laos'}, 'ZVK': {'Name': 'Savannakhet Airport', 'City': 'Savannakhet', 'Country': 'Laos'}, 'NEU': {'Name': 'Sam Neua Airport', 'City': 'Sam Neua', 'Country': 'Laos'}, 'VTE': {'Name': 'Wattay International Airport', 'City': 'Vientiane', 'Country': 'Laos'}, 'MFM': {'Name': 'Macau International Airport', 'City': 'Macau', 'Country': 'Macau'}, 'BWA': {'Name': 'Gautam Buddha Airport', 'City': 'Bhairawa', 'Country': 'Nepal'}, 'JKR': {'Name': 'Janakpur Airport', 'City': 'Janakpur', 'Country': 'Nepal'}, 'KTM': {'Name': 'Tribhuvan International Airport', 'City': 'Kathmandu', 'Country': 'Nepal'}, 'PKR': {'Name': 'Pokhara Airport', 'City': 'Pokhara', 'Country': 'Nepal'}, 'SIF': {'Name': 'Simara Airport', 'City': 'Simara', 'Country': 'Nepal'}, 'BIR': {'Name': 'Biratnagar Airport', 'City': 'Biratnagar', 'Country': 'Nepal'}, 'AGX': {'Name': 'Agatti Airport', 'City': 'Agatti Island', 'Country': 'India'}, 'BLR': {'Name': 'Kempegowda International Airport', 'City': 'Bangalore', 'Country': 'India'}, 'BEP': {'Name': 'Bellary Airport', 'City': 'Bellary', 'Country': 'India'}, 'VGA': {'Name': 'Vijayawada Airport', 'City': 'Vijayawada', 'Country': 'India'}, 'CJB': {'Name': 'Coimbatore International Airport', 'City': 'Coimbatore', 'Country': 'India'}, 'COK': {'Name': 'Cochin International Airport', 'City': 'Kochi', 'Country': 'India'}, 'CCJ': {'Name': 'Calicut International Airport', 'City': 'Calicut', 'Country': 'India'}, 'CDP': {'Name': 'Kadapa Airport', 'City': 'Cuddapah', 'Country': 'India'}, 'CBD': {'Name': 'Car Nicobar Air Force Station', 'City': 'Carnicobar', 'Country': 'India'}, 'BPM': {'Name': 'Begumpet Airport', 'City': 'Hyderabad', 'Country': 'India'}, 'IXM': {'Name': 'Madurai Airport', 'City': 'Madurai', 'Country': 'India'}, 'IXE': {'Name': 'Mangalore International Airport', 'City': 'Mangalore', 'Country': 'India'}, 'MAA': {'Name': 'Chennai International Airport', 'City': 'Madras', 'Country': 'India'}, 'IXZ': {'Name': 'Vir Savarkar International Airport', 'City': 'Port Blair', 'Country': 'India'}, 'PNY': {'Name': 'Pondicherry Airport', 'City': 'Pendicherry', 'Country': 'India'}, 'RJA': {'Name': 'Rajahmundry Airport', 'City': 'Rajahmundry', 'Country': 'India'}, 'SXV': {'Name': 'Salem Airport', 'City': 'Salem', 'Country': 'India'}, 'TJV': {'Name': 'Tanjore Air Force Base', 'City': 'Tanjore', 'Country': 'India'}, 'TIR': {'Name': 'Tirupati Airport', 'City': 'Tirupeti', 'Country': 'India'}, 'TRZ': {'Name': 'Tiruchirapally Civil Airport Airport', 'City': 'Tiruchirappalli', 'Country': 'India'}, 'TRV': {'Name': 'Trivandrum International Airport', 'City': 'Trivandrum', 'Country': 'India'}, 'PBH': {'Name': 'Paro Airport', 'City': 'Thimphu', 'Country': 'Bhutan'}, 'MLE': {'Name': 'Malé International Airport', 'City': 'Male', 'Country': 'Maldives'}, 'DMK': {'Name': 'Don Mueang International Airport', 'City': 'Bangkok', 'Country': 'Thailand'}, 'KDT': {'Name': 'Kamphaeng Saen Airport', 'City': 'Nakhon Pathom', 'Country': 'Thailand'}, 'UTP': {'Name': 'U-Tapao International Airport', 'City': 'Pattaya', 'Country': 'Thailand'}, 'LPT': {'Name': 'Lampang Airport', 'City': 'Lampang', 'Country': 'Thailand'}, 'PRH': {'Name': 'Phrae Airport', 'City': 'Phrae', 'Country': 'Thailand'}, 'HHQ': {'Name': 'Hua Hin Airport', 'City': 'Prachuap Khiri Khan', 'Country': 'Thailand'}, 'TKH': {'Name': 'Takhli Airport', 'City': 'Nakhon Sawan', 'Country': 'Thailand'}, 'PHS': {'Name': 'Phitsanulok Airport', 'City': 'Phitsanulok', 'Country': 'Thailand'}, 'NAW': {'Name': 'Narathiwat Airport', 'City': 'Narathiwat', 'Country': 'Thailand'}, 'KBV': {'Name': 'Krabi Airport', 'City': 'Krabi', 'Country': 'Thailand'}, 'SGZ': {'Name': 'Songkhla Airport', 'City': 'Songkhla', 'Country': 'Thailand'}, 'PAN': {'Name': 'Pattani Airport', 'City': 'Pattani', 'Country': 'Thailand'}, 'USM': {'Name': 'Samui Airport', 'City': 'Ko Samui', 'Country': 'Thailand'}, 'HKT': {'Name': 'Phuket International Airport', 'City': 'Phuket', 'Country': 'Thailand'}, 'UNN': {'Name': 'Ranong Airport', 'City': 'Ranong', 'Country': 'Thailand'}, 'HDY': {'Name': 'Hat Yai International Airport', 'City': 'Hat Yai', 'Country': 'Thailand'}, 'TST': {'Name': 'Trang Airport', 'City': 'Trang', 'Country': 'Thailand'}, 'UTH': {'Name': 'Udon Thani Airport', 'City': 'Udon Thani', 'Country': 'Thailand'}, 'SNO': {'Name': 'Sakon Nakhon Airport', 'City': 'Sakon Nakhon', 'Country': 'Thailand'}, 'PXR': {'Name': 'Surin Airport', 'City': 'Surin', 'Country': 'Thailand'}, 'LOE': {'Name': 'Loei Airport', 'City': 'Loei', 'Country': 'Thailand'}, 'DAD': {'Name': 'Da Nang International Airport', 'City': 'Danang', 'Country': 'Vietnam'}, 'HAN': {'Name': 'Noi Bai International Airport', 'City': 'Hanoi', 'Country': 'Vietnam'}, 'NHA': {'Name': 'Nha Trang Air Base', 'City': 'Nhatrang', 'Country': 'Vietnam'}, 'HUI': {'Name': 'Phu Bai Airport', 'City': 'Hue', 'Country': 'Vietnam'}, 'PQC': {'Name': 'Phu Quoc International Airport', 'City': 'Phuquoc', 'Country': 'Vietnam'}, 'SGN': {'Name': 'Tan Son Nhat International Airport', 'City': 'Ho Chi Minh City', 'Country': 'Vietnam'}, 'VBA': {'Name': 'Ann Airport', 'City': 'Ann', 'Country': 'Burma'}, 'NYU': {'Name': 'Bagan Airport', 'City': 'Bagan', 'Country': 'Burma'}, 'HEH': {'Name': 'Heho Airport', 'City': 'Heho', 'Country': 'Burma'}, 'HOX': {'Name': 'Hommalinn Airport', 'City': 'Hommalin', 'Country': 'Burma'}, 'KET': {'Name': 'Kengtung Airport', 'City': 'Kengtung', 'Country': 'Burma'}, 'KYP': {'Name': 'Kyaukpyu Airport', 'City': 'Kyaukpyu', 'Country': 'Burma'}, 'LSH': {'Name': 'Lashio Airport', 'City': 'Lashio', 'Country': 'Burma'}, 'MDL': {'Name': 'Mandalay International Airport', 'City': 'Mandalay', 'Country': 'Burma'}, 'MGZ': {'Name': 'Myeik Airport', 'City': 'Myeik', 'Country': 'Burma'}, 'MYT': {'Name': 'Myitkyina Airport', 'City': 'Myitkyina', 'Country': 'Burma'}, 'MOE': {'Name': 'Momeik Airport', 'City': 'Momeik', 'Country': 'Burma'}, 'MOG': {'Name': 'Mong Hsat Airport', 'City': 'Mong Hsat', 'Country': 'Burma'}, 'NMS': {'Name': 'Namsang Airport', 'City': 'Namsang', 'Country': 'Burma'}, 'PAA': {'Name': 'Hpa-N Airport', 'City': 'Hpa-an', 'Country': 'Burma'}, 'PBU': {'Name': 'Putao Airport', 'City': 'Putao', 'Country': 'Burma'}, 'PRU': {'Name': 'Pyay Airport', 'City': 'Pyay', 'Country': 'Burma'}, 'AKY': {'Name': 'Sittwe Airport', 'City': 'Sittwe', 'Country': 'Burma'}, 'SNW': {'Name': 'Thandwe Airport', 'City': 'Thandwe', 'Country': 'Burma'}, 'THL': {'Name': 'Tachileik Airport', 'City': 'Tachilek', 'Country': 'Burma'}, 'RGN': {'Name': 'Yangon International Airport', 'City': 'Yangon', 'Country': 'Burma'}, 'UPG': {'Name': 'Hasanuddin International Airport', 'City': 'Ujung Pandang', 'Country': 'Indonesia'}, 'BIK': {'Name': 'Frans Kaisiepo Airport', 'City': 'Biak', 'Country': 'Indonesia'}, 'NBX': {'Name': 'Nabire Airport', 'City': 'Nabire', 'Country': 'Indonesia'}, 'TIM': {'Name': 'Moses Kilangin Airport', 'City': 'Timika', 'Country': 'Indonesia'}, 'DJJ': {'Name': 'Sentani International Airport', 'City': 'Jayapura', 'Country': 'Indonesia'}, 'WMX': {'Name': 'Wamena Airport', 'City': 'Wamena', 'Country': 'Indonesia'}, 'MKQ': {'Name': 'Mopah Airport', 'City': 'Merauke', 'Country': 'Indonesia'}, 'GTO': {'Name': 'Jalaluddin Airport', 'City': 'Gorontalo', 'Country': 'Indonesia'}, 'PLW': {'Name': 'Mutiara Airport', 'City': 'Palu', 'Country': 'Indonesia'}, 'MDC': {'Name': 'Sam Ratulangi Airport', 'City': 'Manado', 'Country': 'Indonesia'}, 'PSJ': {'Name': 'Kasiguncu Airport', 'City': 'Poso', 'Country': 'Indonesia'}, 'OTI': {'Name': 'Pitu Airport', 'City': 'Morotai Island', 'Country': 'Indonesia'}, 'TTE': {'Name': 'Sultan Khairun Babullah Airport', 'City': 'Ternate', 'Country': 'Indonesia'}, 'LUW': {'Name': 'Syukuran Aminuddin Amir Airport', 'City': 'Luwuk', 'Country': 'Indonesia'}, 'AMQ': {'Name': 'Pattimura Airport, Ambon', 'City': 'Ambon', 'Country': 'Indonesia'}, 'FKQ': {'Name': 'Fakfak Airport', 'City': 'Fak Fak', 'Country': 'Indonesia'}, 'KNG': {'Name': 'Kaimana Airport', 'City': 'Kaimana', 'Country': 'Indonesia'}, 'BXB': {'Name': 'Babo Airport', 'City': 'Babo', 'Country': 'Indonesia'}, 'MKW': {'Name': 'Rendani Airport', 'City': 'Manokwari', 'Country': 'Indonesia'}, 'SOQ': {'Name': 'Dominique Edward Osok Airport', 'City': 'Sorong', 'Country': 'Indonesia'}, 'BTU': {'Name': 'Bintulu Airport', 'City': 'Bintulu', 'Country': 'Malaysia'}, 'KCH': {'Name': 'Kuching International Airport', 'City': 'Kuching', 'Country': 'Malaysia'}, 'LMN': {'Name': 'Limbang Airport', 'City': 'Limbang', 'Country': 'Malaysia'}, 'MUR': {'Name': 'Marudi Airport', 'City': 'Marudi', 'Country': 'Malaysia'}, 'MYY': {'Name': 'Miri Airport', 'City': 'Miri', 'Country': 'Malaysia'}, 'SBW': {'Name': 'Sibu Airport', 'City': 'Sibu', 'Country': 'Malaysia'}, 'LDU': {'Name': 'Lahad Datu Airport', 'City': 'Lahad Datu', 'Country': 'Malaysia'}, 'BKI': {'Name': 'Kota Kinabalu International Airport', 'City': 'Kota Kinabalu', 'Country': 'Malaysia'}, 'LBU': {'Name': 'Labuan Airport', 'City': 'Labuan', 'Country': 'Malaysia'}, 'TWU': {'Name': 'Tawau Airport', 'City': 'Tawau', 'Country': 'Malaysia'}, 'BWN': {'Name': 'Brunei International Airport', 'City': 'Bandar Seri Begawan', 'Country': 'Brunei'}, 'PKU': {'Name': 'Sultan Syarif Kasim Ii (Simpang Tiga) Airport', 'City': 'Pekanbaru', 'Country': 'Indonesia'}, 'DUM': {'Name': 'Pinang Kampai Airport', 'City': 'Dumai', 'Country': 'Indonesia'}, 'CGK': {'Name': 'Soekarno-Hatta International Airport', 'City': 'Jakarta', 'Country': 'Indonesia'}, 'GNS': {'Name': 'Binaka Airport', 'City': 'Gunung Sitoli', 'Country': 'Indonesia'}, 'AEG': {'Name': 'Aek Godang Airport', 'City': 'Padang Sidempuan', 'Country': 'Indonesia'}, 'PDG': {'Name': 'Minangkabau International Airport', 'City': 'Padang', 'Country': 'Indonesia'}, 'MES': {'Name': 'Soewondo Air Force Base', 'City': 'Medan', 'Country': 'Indonesia'}, 'FLZ': {'Name': 'Dr Ferdinand Lumban Tobing Airport', 'City': 'Sibolga', 'Country': 'Indonesia'}, 'NPO': {'Name': 'Nanga Pinoh Airport', 'City': 'Nangapinoh', 'Country': 'Indonesia'}, 'KTG': {'Name': 'Ketapang(Rahadi Usman) Airport', 'City': 'Ketapang', 'Country': 'Indonesia'}, 'PNK': {'Name': 'Supadio Airport', 'City': 'Pontianak', 'Country': 'Indonesia'}, 'DJB': {'Name': 'Sultan Thaha Airport', 'City': 'Jambi', 'Country': 'Indonesia'}, 'BKS': {'Name': 'Fatmawati Soekarno Airport', 'City': 'Bengkulu', 'Country': 'Indonesia'}, 'PLM': {'Name': 'Sultan Mahmud Badaruddin II Airport', 'City': 'Palembang', 'Country': 'Indonesia'}, 'RGT': {'Name': 'Japura Airport', 'City': 'Rengat', 'Country': 'Indonesia'}, 'LSX': {'Name': 'Lhok Sukon Airport', 'City': 'Lhok Sukon', 'Country': 'Indonesia'}, 'BTJ': {'Name': 'Sultan Iskandar Muda International Airport', 'City': 'Banda Aceh', 'Country': 'Indonesia'}, 'AOR': {'Name': 'Sultan Abdul Halim Airport', 'City': 'Alor Setar', 'Country': 'Malaysia'}, 'BWH': {'Name': 'Butterworth Airport', 'City': 'Butterworth', 'Country': 'Malaysia'}, 'KBR': {'Name': 'Sultan Ismail Petra Airport', 'City': 'Kota Bahru', 'Country': 'Malaysia'}, 'KUA': {'Name': 'Kuantan Airport', 'City': 'Kuantan', 'Country': 'Malaysia'}, 'KTE': {'Name': 'Kerteh Airport', 'City': 'Kerteh', 'Country': 'Malaysia'}, 'IPH': {'Name': 'Sultan Azlan Shah Airport', 'City': 'Ipoh', 'Country': 'Malaysia'}, 'JHB': {'Name': 'Senai International Airport', 'City': 'Johor Bahru', 'Country': 'Malaysia'}, 'KUL': {'Name': 'Kuala Lumpur International Airport', 'City': 'Kuala Lumpur', 'Country': 'Malaysia'}, 'LGK': {'Name': 'Langkawi International Airport', 'City': 'Langkawi', 'Country': 'Malaysia'}, 'MKZ': {'Name': 'Malacca Airport', 'City': 'Malacca', 'Country': 'Malaysia'}, 'TGG': {'Name': 'Sultan Mahmud Airport', 'City': 'Kuala Terengganu', 'Country': 'Malaysia'}, 'PEN': {'Name': 'Penang International Airport', 'City': 'Penang', 'Country': 'Malaysia'}, 'UAI': {'Name': 'Suai Airport', 'City': 'Suai', 'Country': 'East Timor'}, 'DIL': {'Name': 'Presidente Nicolau Lobato International Airport', 'City': 'Dili', 'Country': 'East Timor'}, 'BCH': {'Name': 'Cakung Airport', 'City': 'Baucau', 'Country': 'East Timor'}, 'QPG': {'Name': 'Paya Lebar Air Base', 'City': 'Paya Lebar', 'Country': 'Singapore'}, 'TGA': {'Name': 'Tengah Air Base', 'City': 'Tengah', 'Country': 'Singapore'}, 'XSP': {'Name': 'Seletar Airport', 'City': 'Singapore', 'Country': 'Singapore'}, 'SIN': {'Name': 'Singapore Changi Airport', 'City': 'Singapore', 'Country': 'Singapore'}, 'ACF': {'Name': 'Brisbane Archerfield Airport', 'City': 'Brisbane', 'Country': 'Australia'}, 'ABM': {'Name': 'Northern Peninsula Airport', 'City': 'Amberley', 'Country': 'Australia'}, 'ASP': {'Name': 'Alice Springs Airport', 'City': 'Alice Springs', 'Country': 'Australia'}, 'BNE': {'Name': 'Brisbane International Airport', 'City': 'Brisbane', 'Country': 'Australia'}, 'OOL': {'Name': 'Gold Coast Airport', 'City': 'Coolangatta', 'Country': 'Australia'}, 'CNS': {'Name': 'Cairns International Airport', 'City': 'Cairns', 'Country': 'Australia'}, 'CTL': {'Name': 'Charleville Airport', 'City': 'Charlieville', 'Country': 'Australia'}, 'ISA': {'Name': 'Mount Isa Airport', 'City': 'Mount Isa', 'Country': 'Australia'}, 'MCY': {'Name': 'Sunshine Coast Airport', 'City': 'Maroochydore', 'Country': 'Australia'}, 'MKY': {'Name': 'Mackay Airport', 'City': 'Mackay', 'Country': 'Australia'}, 'PPP': {'Name': 'Proserpine Whitsunday Coast Airport', 'City': 'Prosserpine', 'Country': 'Australia'}, 'ROK': {'Name': 'Rockhampton Airport', 'City': 'Rockhampton', 'Country': 'Australia'}, 'TSV': {'Name': 'Townsville Airport', 'City': 'Townsville', 'Country': 'Australia'}, 'WEI': {'Name': 'Weipa Airport', 'City': 'Weipa', 'Country': 'Australia'}, 'AVV': {'Name': 'Avalon Airport', 'City': 'Avalon', 'Country': 'Australia'}, 'ABX': {'Name': 'Albury Airport', 'City': 'Albury', 'Country': 'Australia'}, 'MEB': {'Name': 'Melbourne Essendon Airport', 'City': 'Melbourne', 'Country': 'Australia'}, 'HBA': {'Name': 'Hobart International Airport', 'City': 'Hobart', 'Country': 'Australia'}, 'LST': {'Name': 'Launceston Airport', 'City': 'Launceston', 'Country': 'Australia'}, 'MBW': {'Name': 'Melbourne Moorabbin Airport', 'City': 'Melbourne', 'Country': 'Australia'}, 'MEL': {'Name': 'Melbourne International Airport', 'City': 'Melbourne', 'Country': 'Australia'}, 'ADL': {'Name': 'Adelaide International Airport', 'City': 'Adelaide', 'Country': 'Australia'}, 'JAD': {'Name': 'Perth Jandakot Airport', 'City': 'Perth', 'Country': 'Australia'}, 'KTA': {'Name': 'Karratha Airport', 'City': 'Karratha', 'Country': 'Australia'}, 'KGI': {'Name': 'Kalgoorlie Boulder Airport', 'City': 'Kalgoorlie', 'Country': 'Australia'}, 'KNX': {'Name': 'Kununurra Airport', 'City': 'Kununurra', 'Country': 'Australia'}, 'LEA': {'Name': 'Learmonth Airport', 'City': 'Learmonth', 'Country': 'Australia'}, 'PHE': {'Name': 'Port Hedland International Airport', 'City': 'Port Hedland', 'Country': 'Australia'}, 'PER': {'Name': 'Perth International Airport', 'City': 'Perth', 'Country': 'Australia'}, 'UMR': {'Name': 'Woomera Airfield', 'City': 'Woomera', 'Country': 'Australia'}, 'XCH': {'Name': 'Christmas Island Airport', 'City': 'Christmas Island', 'Country': 'Christmas Island'}, 'BWU': {'Name': 'Sydney Bankstown Airport', 'City': 'Sydney', 'Country': 'Australia'}, 'CBR': {'Name': 'Canberra International Airport', 'City': 'Canberra', 'Country': 'Australia'}, 'CFS': {'Name': 'Coffs Harbour Airport', 'City': "Coff's Harbour", 'Country': 'Australia'}, 'CDU': {'Name': 'Camden Airport', 'City': 'Camden', 'Country': 'Australia'}, 'DBO': {'Name': 'Dubbo City Regional Airport', 'City': 'Dubbo', 'Country': 'Australia'}, 'NLK': {'Name': 'Norfolk Island International Airport', 'City': 'Norfolk Island', 'Country': 'Norfolk Island'}, 'XRH': {'Name': 'RAAF Base Richmond', 'City': 'Richmond', 'Country': 'Australia'}, 'SYD': {'Name': 'Sydney Kingsford Smith International Airport', 'City': 'Sydney', 'Country': 'Australia'}, 'TMW': {'Name': 'Tamworth Airport', 'City': 'Tamworth', 'Country': 'Australia'}, 'WGA': {'Name': 'Wagga Wagga City Airport', 'City': 'Wagga Wagga', 'Country': 'Australia'}, 'PEK': {'Name': 'Beijing Capital International Airport', 'City': 'Beijing', 'Country': 'China'}, 'HLD': {'Name': 'Dongshan Airport', 'City': 'Hailar', 'Country': 'China'}, 'TSN': {'Name': 'Tianjin Binhai International Airport', 'City': 'Tianjin', 'Country': 'China'}, 'TYN': {'Name': 'Taiyuan Wusu Airport', 'City': 'Taiyuan', 'Country': 'China'}, 'CAN': {'Name': 'Guangzhou Baiyun International Airport', 'City': 'Guangzhou', 'Country': 'China'}, 'CSX': {'Name': 'Changsha Huanghua International Airport', 'City': 'Changcha', 'Country': 'China'}, 'KWL': {'Name': 'Guilin Liangjiang International Airport', 'City': 'Guilin', 'Country': 'China'}, 'NNG': {'Name': 'Nanning Wuxu Airport', 'City': 'Nanning', 'Country': 'China'}, 'SZX': {'Name': "Shenzhen Bao'an International Airport", 'City': 'Shenzhen', 'Country': 'China'}, 'CGO': {'Name': 'Zhengzhou Xinzheng International Airport', 'City': 'Zhengzhou', 'Country': 'China'}, 'WUH': {'Name': 'Wuhan Tianhe International Airport', 'City': 'Wuhan', 'Country': 'China'}, 'FNJ': {'Name': 'Pyongyang Sunan International Airport', 'City': 'Pyongyang', 'Country': 'North Korea'}, 'LHW': {'Name': 'Lanzhou Zhongchuan Airport', 'City': 'Lanzhou', 'Country': 'China'}, 'XIY': {'Name': "Xi'an Xianyang International Airport", 'City': "Xi'an", 'Country': 'China'}, 'ULN': {'Name': 'Chinggis Khaan International Airport', 'City': 'Ulan Bator', 'Country': 'Mongolia'}, 'JHG': {'Name': 'Xishuangbanna Gasa Airport', 'City': 'Jinghonggasa', 'Country': 'China'}, 'KMG': {'Name': 'Kunming Changshui International Airport', 'City': 'Kunming', 'Country': 'China'}, 'XMN': {'Name': 'Xiamen Gaoqi International Airport', 'City': 'Xiamen', 'Country': 'China'}, 'KHN': {'Name': 'Nanchang Changbei International Airport', 'City': 'Nanchang', 'Country': 'China'}, 'FOC': {'Name': 'Fuzhou Changle International Airport', 'City': 'Fuzhou', 'Country': 'China'}, 'HGH': {'Name': 'Hangzhou Xiaoshan International Airport', 'City': 'Hangzhou', 'Country': 'China'}, 'NGB': {'Name': 'Ningbo Lishe International Airport', 'City': 'Ninbo', 'Country': 'China'}, 'NKG': {'Name': 'Nanjing Lukou Airport', 'City': 'Nanjing', 'Country': 'China'}, 'HFE': {'Name': 'Hefei Luogang International Airport', 'City': 'Hefei', 'Country': 'China'}, 'TAO': {'Name': 'Liuting Airport', 'City': 'Qingdao', 'Country': 'China'}, 'SHA': {'Name': 'Shanghai Hongqiao International Airport', 'City': 'Shanghai', 'Country': 'China'}, 'YNT': {'Name': 'Yantai Laishan Airport', 'City': 'Yantai', 'Country': 'China'}, 'CKG': {'Name': 'Chongqing Jiangbei International Airport', 'City': 'Chongqing', 'Country': 'China'}, 'KWE': {'Name': 'Longdongbao Airport', 'City': 'Guiyang', 'Country': 'China'}, 'CTU': {'Name': 'Chengdu Shuangliu International Airport', 'City': 'Chengdu', 'Country': 'China'}, 'XIC': {'Name': 'Xichang Qingshan Airport', 'City': 'Xichang', 'Country': 'China'}, 'KHG': {'Name': 'Kashgar Airport', 'City': 'Kashi', 'Country': 'China'}, 'HTN': {'Name': 'Hotan Airport', 'City': 'Hotan', 'Country': 'China'}, 'URC': {'Name': 'Ürümqi Diwopu International Airport', 'City': 'Urumqi', 'Country': 'China'}, 'HRB': {'Name': 'Taiping Airport', 'City': 'Harbin', 'Country': 'China'}, 'MDG': {'Name': 'Mudanjiang Hailang International Airport', 'City': 'Mudanjiang', 'Country': 'China'}, 'DLC': {'Name': 'Zhoushuizi Airport', 'City': 'Dalian', 'Country': 'China'}, 'PVG': {'Name': 'Shanghai Pudong International Airport', 'City': 'Shanghai', 'Country': 'China'}, 'TOD': {'Name': 'Pulau Tioman Airport', 'City': 'Tioman', 'Country': 'Malaysia'}, 'SZB': {'Name': 'Sultan Abdul Aziz Shah International Airport', 'City': 'Kuala Lumpur', 'Country': 'Malaysia'}, 'NTQ': {'Name': 'Noto Airport', 'City': 'Wajima', 'Country': 'Japan'}, 'HBE': {'Name': 'Borg El Arab International Airport', 'City': 'Alexandria', 'Country': 'Egypt'}, 'BTI': {'Name': 'Barter Island LRRS Airport', 'City': 'Barter Island', 'Country': 'United States'}, 'LUR': {'Name': 'Cape Lisburne LRRS Airport', 'City': 'Cape Lisburne', 'Country': 'United States'}, 'PIZ': {'Name': 'Point Lay LRRS Airport', 'City': 'Point Lay', 'Country': 'United States'}, 'ITO': {'Name': 'Hilo International Airport', 'City': 'Hilo', 'Country': 'United States'}, 'ORL': {'Name': 'Orlando Executive Airport', 'City': 'Orlando', 'Country': 'United States'}, 'BTT': {'Name': 'Bettles Airport', 'City': 'Bettles', 'Country': 'United States'}, 'UTO': {'Name': 'Indian Mountain LRRS Airport', 'City': 'Indian Mountains', 'Country': 'United States'}, 'FYU': {'Name': 'Fort Yukon Airport', 'City': 'Fort Yukon', 'Country': 'United States'}, 'SVW': {'Name': 'Sparrevohn LRRS Airport', 'City': 'Sparrevohn', 'Country': 'United States'}, 'FRN': {'Name': 'Bryant Army Heliport', 'City': 'Fort Richardson', 'Country': 'United States'}, 'TLJ': {'Name': 'Tatalina LRRS Airport', 'City': 'Tatalina', 'Country': 'United States'}, 'CZF': {'Name': 'Cape Romanzof LRRS Airport', 'City': 'Cape Romanzof', 'Country': 'United States'}, 'BED': {'Name': 'Laurence G Hanscom Field', 'City': 'Bedford', 'Country': 'United States'}, 'SNP': {'Name': 'St Paul Island Airport', 'City': 'St. Paul Island', 'Country': 'United States'}, 'EHM': {'Name': 'Cape Newenham LRRS Airport', 'City': 'Cape Newenham', 'Country': 'United States'}, 'STG': {'Name': 'St George Airport', 'City': 'Point Barrow', 'Country': 'United States'}, 'ILI': {'Name': 'Iliamna Airport', 'City': 'Iliamna', 'Country': 'United States'}, 'PTU': {'Name': 'Platinum Airport', 'City': 'Port Moller', 'Country': 'United States'}, 'BMX': {'Name': 'Big Mountain Airport', 'City': 'Big Mountain', 'Country': 'United States'}, 'OSC': {'Name': 'Oscoda Wurtsmith Airport', 'City': 'Oscoda', 'Country': 'United States'}, 'OAR': {'Name': 'Marina Municipal Airport', 'City': 'Fort Ord', 'Country': 'United States'}, 'MHR': {'Name': 'Sacramento Mather Airport', 'City': 'Sacramento', 'Country': 'United States'}, 'BYS': {'Name': 'Bicycle Lake Army Air Field', 'City': 'Fort Irwin', 'Country': 'United States'}, 'FSM': {'Name': 'Fort Smith Regional Airport', 'City': 'Fort Smith', 'Country': 'United States'}, 'MRI': {'Name': 'Merrill Field', 'City': 'Anchorage', 'Country': 'United States'}, 'GNT': {'Name': 'Grants-Milan Municipal Airport', 'City': 'Grants', 'Country': 'United States'}, 'PNC': {'Name': 'Ponca City Regional Airport', 'City': 'Ponca City', 'Country': 'United States'}, 'SVN': {'Name': 'Hunter Army Air Field', 'City': 'Hunter Aaf', 'Country': 'United States'}, 'GFK': {'Name': 'Grand Forks International Airport', 'City': 'Grand Forks', 'Country': 'United States'}, 'PBF': {'Name': 'Pine Bluff Regional Airport, Grider Field', 'City': 'Pine Bluff', 'Country': 'United States'}, 'NSE': {'Name': 'Whiting Field Naval Air Station - North', 'City': 'Milton', 'Country': 'United States'}, 'HNM': {'Name': 'Hana Airport', 'City': 'Hana', 'Country': 'United States'}, 'PRC': {'Name': 'Ernest A. Love Field', 'City': 'Prescott', 'Country': 'United States'}, 'TTN': {'Name': 'Trenton Mercer Airport', 'City': 'Trenton', 'Country': 'United States'}, 'BOS': {'Name': 'General Edward Lawrence Logan International Airport', 'City': 'Boston', 'Country': 'United States'}, 'SUU': {'Name': 'Travis Air Force Base', 'City': 'Fairfield', 'Country': 'United States'}, 'RME': {'Name': 'Griffiss International Airport', 'City': 'Rome', 'Country': 'United States'}, 'ENV': {'Name': 'Wendover Airport', 'City': 'Wendover', 'Country': 'United States'}, 'BFM': {'Name': 'Mobile Downtown Airport', 'City': 'Mobile', 'Country': 'United States'}, 'OAK': {'Name': 'Metropolitan Oakland International Airport', 'City': 'Oakland', 'Country': 'United States'}, 'OMA': {'Name': 'Eppley Airfield', 'City': 'Omaha', 'Country': 'United States'}, 'OGG': {'Name': 'Kahului Airport', 'City': 'Kahului', 'Country': 'United States'}, 'ICT': {'Name': 'Wichita Eisenhower National Airport', 'City': 'Wichita', 'Country': 'United States'}, 'MCI': {'Name': 'Kansas City International Airport', 'City': 'Kansas City', 'Country': 'United States'}, 'MSN': {'Name': 'Dane County Regional Truax Field', 'City': 'Madison', 'Country': 'United States'}, 'DLG': {'Name': 'Dillingham Airport', 'City': 'Dillingham', 'Country': 'United States'}, 'HRO': {'Name': 'Boone County Airport', 'City': 'Harrison', 'Country': 'United States'}, 'PHX': {'Name': 'Phoenix Sky Harbor International Airport', 'City': 'Phoenix', 'Country': 'United States'}, 'BGR': {'Name': 'Bangor International Airport', 'City': 'Bangor', 'Country': 'United States'}, 'FXE': {'Name': 'Fort Lauderdale Executive Airport', 'City': 'Fort Lauderdale', 'Country': 'United States'}, 'GGG': {'Name': 'East Texas Regional Airport', 'City': 'Longview', 'Country': 'United States'}, 'AND': {'Name': 'Anderson Regional Airport', 'City': 'Andersen', 'Country': 'United States'}, 'GEG': {'Name': 'Spokane International Airport', 'City': 'Spokane', 'Country': 'United States'}, 'HWO': {'Name': 'North Perry Airport', 'City': 'Hollywood', 'Country': 'United States'}, 'SFO': {'Name': 'San Francisco International Airport', 'City': 'San Francisco', 'Country': 'United States'}, 'CTB': {'Name': 'Cut Bank International Airport', 'City': 'Cutbank', 'Country': 'United States'}, 'ARA': {'Name': 'Acadiana Regional Airport', 'City': 'Louisiana', 'Country': 'United States'}, 'GNV': {'Name': 'Gainesville Regional Airport', 'City': 'Gainesville', 'Country': 'United States'}, 'MEM': {'Name': 'Memphis International Airport', 'City': 'Memphis', 'Country': 'United States'}, 'DUG': {'Name': 'Bisbee Douglas International Airport', 'City': 'Douglas', 'Country': 'United States'}, 'BIG': {'Name': 'Allen Army Airfield', 'City': 'Delta Junction', 'Country': 'United States'}, 'CNW': {'Name': 'TSTC Waco Airport', 'City': 'Waco', 'Country': 'United States'}, 'ANN': {'Name': 'Annette Island Airport', 'City': 'Annette Island', 'Country': 'United States'}, 'CAR': {'Name': 'Caribou Municipal Airport', 'City': 'Caribou', 'Country': 'United States'}, 'LRF': {'Name': 'Little Rock Air Force Base', 'City': 'Jacksonville', 'Country': 'United States'}, 'HUA': {'Name': 'Redstone Army Air Field', 'City': 'Redstone', 'Country': 'United States'}, 'POB': {'Name': 'Pope Field', 'City': 'Fort Bragg', 'Country': 'United States'}, 'DHT': {'Name': 'Dalhart Municipal Airport', 'City': 'Dalhart', 'Country': 'United States'}, 'DLF': {'Name': 'DLF Airport', 'City': 'Del Rio', 'Country': 'United States'}, 'LAX': {'Name': 'Los Angeles International Airport', 'City': 'Los Angeles', 'Country': 'United States'}, 'ANB': {'Name': 'Anniston Regional Airport', 'City': 'Anniston', 'Country': 'United States'}, 'CLE': {'Name': 'Cleveland Hopkins International Airport', 'City': 'Cleveland', 'Country': 'United States'}, 'DOV': {'Name': 'Dover Air Force Base', 'City': 'Dover', 'Country': 'United States'}, 'CVG': {'Name': 'Cincinnati Northern Kentucky International Airport', 'City': 'Cincinnati', 'Country': 'United States'}, 'FME': {'Name': 'Tipton Airport', 'City': 'Fort Meade', 'Country': 'United States'}, 'HON': {'Name': 'Huron Regional Airport', 'City': 'Huron', 'Country': 'United States'}, 'JNU': {'Name': 'Juneau International Airport', 'City': 'Juneau', 'Country': 'United States'}, 'LFT': {'Name': 'Lafayette Regional Airport', 'City': 'Lafayette', 'Country': 'United States'}, 'EWR': {'Name': 'Newark Liberty International Airport', 'City': 'Newark', 'Country': 'United States'}, 'BOI': {'Name': 'Boise Air Terminal/Gowen Field', 'City': 'Boise', 'Country': 'United States'}, 'INS': {'Name': 'Creech Air Force Base', 'City': 'Indian Springs', 'Country': 'United States'}, 'GCK': {'Name': 'Garden City Regional Airport', 'City': 'Garden City', 'Country': 'United States'}, 'MOT': {'Name': 'Minot International Airport', 'City': 'Minot', 'Country': 'United States'}, 'HHI': {'Name': 'Wheeler Army Airfield', 'City': 'Wahiawa', 'Country': 'United States'}, 'MXF': {'Name': 'Maxwell Air Force Base', 'City': 'Montgomery', 'Country': 'United States'}, 'DAL': {'Name': 'Dallas Love Field', 'City': 'Dallas', 'Country': 'United States'}, 'FCS': {'Name': 'Butts AAF (Fort Carson) Air Field', 'City': 'Fort Carson', 'Country': 'United States'}, 'HLN': {'Name': 'Helena Regional Airport', 'City': 'Helena', 'Country': 'United States'}, 'NKX': {'Name': 'Miramar Marine Corps Air Station - Mitscher Field', 'City': 'Miramar', 'Country': 'United States'}, 'LUF': {'Name': 'Luke Air Force Base', 'City': 'Phoenix', 'Country': 'United States'}, 'HHR': {'Name': 'Jack Northrop Field Hawthorne Municipal Airport', 'City': 'Hawthorne', 'Country': 'United States'}, 'HUL': {'Name': 'Houlton International Airport', 'City': 'Houlton', 'Country': 'United States'}, 'END': {'Name': 'Vance Air Force Base', 'City': 'Enid', 'Country': 'United States'}, 'NTD': {'Name': 'Point Mugu Naval Air Station (Naval Base Ventura Co)', 'City': 'Point Mugu', 'Country': 'United States'}, 'EDW': {'Name': 'Edwards Air Force Base', 'City': 'Edwards Afb', 'Country': 'United States'}, 'LCH': {'Name': 'Lake Charles Regional Airport', 'City': 'Lake Charles', 'Country': 'United States'}, 'KOA': {'Name': 'Ellison Onizuka Kona International At Keahole Airport', 'City': 'Kona', 'Country': 'United States'}, 'MYR': {'Name': 'Myrtle Beach International Airport', 'City': 'Myrtle Beach', 'Country': 'United States'}, 'NLC': {'Name': 'Lemoore Naval Air Station (Reeves Field) Airport', 'City': 'Lemoore', 'Country': 'United States'}, 'ACK': {'Name': 'Nantucket Memorial Airport', 'City': 'Nantucket', 'Country': 'United States'}, 'FAF': {'Name': 'Felker Army Air Field', 'City': 'Fort Eustis', 'Country': 'United States'}, 'HOP': {'Name': 'Campbell AAF (Fort Campbell) Air Field', 'City': 'Hopkinsville', 'Country': 'United States'}, 'DCA': {'Name': 'Ronald Reagan Washington National Airport', 'City': 'Washington', 'Country': 'United States'}, 'NHK': {'Name': 'Patuxent River Naval Air Station (Trapnell Field)', 'City': 'Patuxent River', 'Country': 'United States'}, 'PSX': {'Name': 'Palacios Municipal Airport', 'City': 'Palacios', 'Country': 'United States'}, 'BYH': {'Name': 'Arkansas International Airport', 'City': 'Blytheville', 'Country': 'United States'}, 'ACY': {'Name': 'Atlantic City International Airport', 'City': 'Atlantic City', 'Country': 'United States'}, 'TIK': {'Name': 'Tinker Air Force Base', 'City': 'Oklahoma City', 'Country': 'United States'}, 'ECG': {'Name': 'Elizabeth City Regional Airport & Coast Guard Air Station', 'City': 'Elizabeth City', 'Country': 'United States'}, 'PUB': {'Name': 'Pueblo Memorial Airport', 'City': 'Pueblo', 'Country': 'United States'}, 'PQI': {'Name': 'Northern Maine Regional Airport at Presque Isle', 'City': 'Presque Isle', 'Country': 'United States'}, 'GRF': {'Name': 'Gray Army Air Field', 'City': 'Fort Lewis', 'Country': 'United States'}, 'ADQ': {'Name': 'Kodiak Airport', 'City': 'Kodiak', 'Country': 'United States'}, 'UPP': {'Name': 'Upolu Airport', 'City': 'Opolu', 'Country': 'United States'}, 'FLL': {'Name': 'Fort Lauderdale Hollywood International Airport', 'City': 'Fort Lauderdale', 'Country': 'United States'}, 'INL': {'Name': 'Falls International Airport', 'City': 'International Falls', 'Country': 'United States'}, 'SLC': {'Name': 'Salt Lake City International Airport', 'City': 'Salt Lake City', 'Country': 'United States'}, 'CDS': {'Name': 'Childress Municipal Airport', 'City': 'Childress', 'Country': 'United States'}, 'BIX': {'Name': 'Keesler Air Force Base', 'City': 'Biloxi', 'Country': 'United States'}, 'LSF': {'Name': 'Lawson Army Air Field (Fort Benning)', 'City': 'Fort Benning', 'Country': 'United States'}, 'NQI': {'Name': 'Kingsville Naval Air Station', 'City': 'Kingsville', 'Country': 'United States'}, 'FRI': {'Name': 'Marshall Army Air Field', 'City': 'Fort Riley', 'Country': 'United States'}, 'MDT': {'Name': 'Harrisburg International Airport', 'City': 'Harrisburg', 'Country': 'United States'}, 'LNK': {'Name': 'Lincoln Airport', 'City': 'Lincoln', 'Country': 'United States'}, 'LAN': {'Name': 'Capital City Airport', 'City': 'Lansing', 'Country': 'United States'}, 'MUE': {'Name': 'Waimea Kohala Airport', 'City': 'Kamuela', 'Country': 'United States'}, 'MSS': {'Name': 'Massena International Richards Field', 'City': 'Massena', 'Country': 'United States'}, 'HKY': {'Name': 'Hickory Regional Airport', 'City': 'Hickory', 'Country': 'United States'}, 'SPG': {'Name': 'Albert Whitted Airport', 'City': 'St. Petersburg', 'Country': 'United States'}, 'FMY': {'Name': 'Page Field', 'City': 'Fort Myers', 'Country': 'United States'}, 'IAH': {'Name': 'George Bush Intercontinental Houston Airport', 'City': 'Houston', 'Country': 'United States'}, 'ADW': {'Name': 'Joint Base Andrews', 'City': 'Camp Springs', 'Country': 'United States'}, 'INT': {'Name': 'Smith Reynolds Airport', 'City': 'Winston-salem', 'Country': 'United States'}, 'VCV': {'Name': 'Southern California Logistics Airport', 'City': 'Victorville', 'Country': 'United States'}, 'CEW': {'Name': 'Bob Sikes Airport', 'City': 'Crestview', 'Country': 'United States'}, 'PHN': {'Name': 'St Clair County International Airport', 'City': 'Port Huron', 'Country': 'United States'}, 'BFL': {'Name': 'Meadows Field', 'City': 'Bakersfield', 'Country': 'United States'}, 'ELP': {'Name': 'El Paso International Airport', 'City': 'El Paso', 'Country': 'United States'}, 'HRL': {'Name': 'Valley International Airport', 'City': 'Harlingen', 'Country': 'United States'}, 'CAE': {'Name': 'Columbia Metropolitan Airport', 'City': 'Columbia', 'Country': 'United States'}, 'DMA': {'Name': 'Davis Monthan Air Force Base', 'City': 'Tucson', 'Country': 'United States'}, 'NPA': {'Name': 'Pensacola Naval Air Station/Forrest Sherman Field', 'City': 'Pensacola', 'Country': 'United States'}, 'PNS': {'Name': 'Pensacola Regional Airport', 'City': 'Pensacola', 'Country': 'United States'}, 'RDR': {'Name': 'Grand Forks Air Force Base', 'City': 'Red River', 'Country': 'United States'}, 'HOU': {'Name': 'William P Hobby Airport', 'City': 'Houston', 'Country': 'United States'}, 'BFK': {'Name': 'Buckley Air Force Base', 'City': 'Buckley', 'Country': 'United States'}, 'ORT': {'Name': 'Northway Airport', 'City': 'Northway', 'Country': 'United States'}, 'PAQ': {'Name': 'Warren "Bud" Woods Palmer Municipal Airport', 'City': 'Palmer', 'Country': 'United States'}, 'PIT': {'Name': 'Pittsburgh International Airport', 'City': 'Pittsburgh', 'Country': 'United States'}, 'BRW': {'Name': 'Wiley Post Will Rogers Memorial Airport', 'City': 'Barrow', 'Country': 'United States'}, 'EFD': {'Name': 'Ellington Airport', 'City': 'Houston', 'Country': 'United States'}, 'NUW': {'Name': 'Whidbey Island Naval Air Station (Ault Field)', 'City': 'Whidbey Island', 'Country': 'United States'}, 'ALI': {'Name': 'Alice International Airport', 'City': 'Alice', 'Country': 'United States'}, 'VAD': {'Name': 'Moody Air Force Base', 'City': 'Valdosta', 'Country': 'United States'}, 'MIA': {'Name': 'Miami International Airport', 'City': 'Miami', 'Country': 'United States'}, 'SEA': {'Name': 'Seattle Tacoma International Airport', 'City': 'Seattle', 'Country': 'United States'}, 'CHA': {'Name': 'Lovell Field', 'City': 'Chattanooga', 'Country': 'United States'}, 'BDR': {'Name': 'Igor I Sikorsky Memorial Airport', 'City': 'Stratford', 'Country': 'United States'}, 'JAN': {'Name': 'Jackson-Medgar Wiley Evers International Airport', 'City': 'Jackson', 'Country': 'United States'}, 'GLS': {'Name': 'Scholes International At Galveston Airport', 'City': 'Galveston', 'Country': 'United States'}, 'LGB': {'Name': 'Long Beach /Daugherty Field/ Airport', 'City': 'Long Beach', 'Country': 'United States'}, 'HDH': {'Name': 'Dillingham Airfield', 'City': 'Dillingham', 'Country': 'United States'}, 'IPT': {'Name': 'Williamsport Regional Airport', 'City': 'Williamsport', 'Country': 'United States'}, 'IND': {'Name': 'Indianapolis International Airport', 'City': 'Indianapolis', 'Country': 'United States'}, 'SZL': {'Name': 'Whiteman Air Force Base', 'City': 'Knobnoster', 'Country': 'United States'}, 'AKC': {'Name': 'Akron Fulton International Airport', 'City': 'Akron', 'Country': 'United States'}, 'GWO': {'Name': 'Greenwood–Leflore Airport', 'City': 'Greenwood', 'Country': 'United States'}, 'HPN': {'Name': 'Westchester County Airport', 'City': 'White Plains', 'Country': 'United States'}, 'FOK': {'Name': 'Francis S Gabreski Airport', 'City': 'West Hampton Beach', 'Country': 'United States'}, 'JBR': {'Name': 'Jonesboro Municipal Airport', 'City': 'Jonesboro', 'Country': 'United States'}, 'XSD': {'Name': 'Tonopah Test Range Airport', 'City': 'Tonopah', 'Country': 'United States'}, 'LNA': {'Name': 'Palm Beach County Park Airport', 'City': 'West Palm Beach', 'Country': 'United States'}, 'NZY': {'Name': 'North Island Naval Air Station-Halsey Field', 'City': 'San Diego', 'Country': 'United States'}, 'BIF': {'Name': 'Biggs Army Air Field (Fort Bliss)', 'City': 'El Paso', 'Country': 'United States'}, 'YUM': {'Name': 'Yuma MCAS/Yuma International Airport', 'City': 'Yuma', 'Country': 'United States'}, 'CNM': {'Name': 'Cavern City Air Terminal', 'City': 'Carlsbad', 'Country': 'United States'}, 'DLH': {'Name': 'Duluth International Airport', 'City': 'Duluth', 'Country': 'United States'}, 'BET': {'Name': 'Bethel Airport', 'City': 'Bethel', 'Country': 'United States'}, 'LOU': {'Name': 'Bowman Field', 'City': 'Louisville', 'Country': 'United States'}, 'FHU': {'Name': 'Sierra Vista Municipal Libby Army Air Field', 'City': 'Fort Huachuca', 'Country': 'United States'}, 'LIH': {'Name': 'Lihue Airport', 'City': 'Lihue', 'Country': 'United States'}, 'HUF': {'Name': 'Terre Haute Regional Airport, Hulman Field', 'City': 'Terre Haute', 'Country': 'United States'}, 'HVR': {'Name': 'Havre City County Airport', 'City': 'Havre', 'Country': 'United States'}, 'MWH': {'Name': 'Grant County International Airport', 'City': 'Grant County Airport', 'Country': 'United States'}, 'MPV': {'Name': 'Edward F Knapp State Airport', 'City': 'Montpelier', 'Country': 'United States'}, 'RIC': {'Name': 'Richmond International Airport', 'City': 'Richmond', 'Country': 'United States'}, 'SHV': {'Name': 'Shreveport Regional Airport', 'City': 'Shreveport', 'Country': 'United States'}, 'CDV': {'Name': 'Merle K (Mudhole) Smith Airport', 'City': 'Cordova', 'Country': 'United States'}, 'ORF': {'Name': 'Norfolk International Airport', 'City': 'Norfolk', 'Country': 'United States'}, 'BPT': {'Name': 'Southeast Texas Regional Airport', 'City': 'Beaumont', 'Country': 'United States'}, 'SAV': {'Name': 'Savannah Hilton Head International Airport', 'City': 'Savannah', 'Country': 'United States'}, 'HIF': {'Name': 'Hill Air Force Base', 'City': 'Ogden', 'Country': 'United States'}, 'OME': {'Name': 'Nome Airport', 'City': 'Nome', 'Country': 'United States'}, 'PIE': {'Name': 'St Petersburg Clearwater International Airport', 'City': 'St. Petersburg', 'Country': 'United States'}, 'MNM': {'Name': 'Menominee Regional Airport', 'City': 'Macon', 'Country': 'United States'}, 'CXO': {'Name': 'Conroe-North Houston Regional Airport', 'City': 'Conroe', 'Country': 'United States'}, 'SCC': {'Name': 'Deadhorse Airport', 'City': 'Deadhorse', 'Country': 'United States'}, 'SAT': {'Name': 'San Antonio International Airport', 'City': 'San Antonio', 'Country': 'United States'}, 'ROC': {'Name': 'Greater Rochester International Airport', 'City': 'Rochester', 'Country': 'United States'}, 'COF': {'Name': 'Patrick Air Force Base', 'City': 'Coco Beach', 'Country': 'United States'}, 'TEB': {'Name': 'Teterboro Airport', 'City': 'Teterboro', 'Country': 'United States'}, 'RCA': {'Name': 'Ellsworth Air Force Base', 'City': 'Rapid City', 'Country': 'United States'}, 'RDU': {'Name': 'Raleigh Durham International Airport', 'City': 'Raleigh-durham', 'Country': 'United States'}, 'DAY': {'Name': 'James M Cox Dayton International Airport', 'City': 'Dayton', 'Country': 'United States'}, 'ENA': {'Name': 'Kenai Municipal Airport', 'City': 'Kenai', 'Country': 'United States'}, 'MLC': {'Name': 'Mc Alester Regional Airport', 'City': 'Mcalester', 'Country': 'United States'}, 'IAG': {'Name': 'Niagara Falls International Airport', 'City': 'Niagara Falls', 'Country': 'United States'}, 'CFD': {'Name': 'Coulter Field', 'City': 'Bryan', 'Country': 'United States'}, 'LIY': {'Name': 'Wright AAF (Fort Stewart)/Midcoast Regional Airport', 'City': 'Wright', 'Country': 'United States'}, 'PHF': {'Name': 'Newport News Williamsburg International Airport', 'City': 'Newport News', 'Country': 'United States'}, 'ESF': {'Name': 'Esler Regional Airport', 'City': 'Alexandria', 'Country': 'United States'}, 'LTS': {'Name': 'Altus Air Force Base', 'City': 'Altus', 'Country': 'United States'}, 'TUS': {'Name': 'Tucson International Airport', 'City': 'Tucson', 'Country': 'United States'}, 'MIB': {'Name': 'Minot Air Force Base', 'City': 'Minot', 'Country': 'United States'}, 'BAB': {'Name': 'Beale Air Force Base', 'City': 'Marysville', 'Country': 'United States'}, 'IKK': {'Name': 'Greater Kankakee Airport', 'City': 'Kankakee', 'Country': 'United States'}, 'GSB': {'Name': 'Seymour Johnson Air Force Base', 'City': 'Goldsboro', 'Country': 'United States'}, 'PVD': {'Name': 'Theodore Francis Green State Airport', 'City': 'Providence', 'Country': 'United States'}, 'SBY': {'Name': 'Salisbury Ocean City Wicomico Regional Airport', 'City': 'Salisbury', 'Country': 'United States'}, 'BUR': {'Name': 'Bob Hope Airport', 'City': 'Burbank', 'Country': 'United States'}, 'DTW': {'Name': 'Detroit Metropolitan Wayne County Airport', 'City': 'Detroit', 'Country': 'United States'}, 'TPA': {'Name': 'Tampa International Airport', 'City': 'Tampa', 'Country': 'United States'}, 'PMB': {'Name': 'Pembina Municipal Airport', 'City': 'Pembina', 'Country': 'United States'}, 'POE': {'Name': 'Polk Army Air Field', 'City': 'Fort Polk', 'Country': 'United States'}, 'EIL': {'Name': 'Eielson Air Force Base', 'City': 'Fairbanks', 'Country': 'United States'}, 'HIB': {'Name': 'Range Regional Airport', 'City': 'Hibbing', 'Country': 'United States'}, 'LFK': {'Name': 'Angelina County Airport', 'City': 'Lufkin', 'Country': 'United States'}, 'MAF': {'Name': 'Midland International Airport', 'City': 'Midland', 'Country': 'United States'}, 'GRB': {'Name': 'Austin Straubel International Airport', 'City': 'Green Bay', 'Country': 'United States'}, 'ADM': {'Name': 'Ardmore Municipal Airport', 'City': 'Ardmore', 'Country': 'United States'}, 'WRI': {'Name': 'Mc Guire Air Force Base', 'City': 'Wrightstown', 'Country': 'United States'}, 'AGS': {'Name': 'Augusta Regional At Bush Field', 'City': 'Bush Field', 'Country': 'United States'}, 'ISN': {'Name': 'Sloulin Field International Airport', 'City': 'Williston', 'Country': 'United States'}, 'LIT': {'Name': 'Bill & Hillary Clinton National Airport/Adams Field', 'City': 'Little Rock', 'Country': 'United States'}, 'SWF': {'Name': 'Stewart International Airport', 'City': 'Newburgh', 'Country': 'United States'}, 'BDE': {'Name': 'Baudette International Airport', 'City': 'Baudette', 'Country': 'United States'}, 'SAC': {'Name': 'Sacramento Executive Airport', 'City': 'Sacramento', 'Country': 'United States'}, 'HOM': {'Name': 'Homer Airport', 'City': 'Homer', 'Country': 'United States'}, 'TBN': {'Name': 'Waynesville-St. Robert Regional Forney field', 'City': 'Fort Leonardwood', 'Country': 'United States'}, 'MGE': {'Name': 'Dobbins Air Reserve Base', 'City': 'Marietta', 'Country': 'United States'}, 'SKA': {'Name': 'Fairchild Air Force Base', 'City': 'Spokane', 'Country': 'United States'}, 'HTL': {'Name': 'Roscommon County - Blodgett Memorial Airport', 'City': 'Houghton Lake', 'Country': 'United States'}, 'PAM': {'Name': 'Tyndall Air Force Base', 'City': 'Panama City', 'Country': 'United States'}, 'DFW': {'Name': 'Dallas Fort Worth International Airport', 'City': 'Dallas-Fort Worth', 'Country': 'United States'}, 'MLB': {'Name': 'Melbourne International Airport', 'City': 'Melbourne', 'Country': 'United States'}, 'TCM': {'Name': 'McChord Air Force Base', 'City': 'Tacoma', 'Country': 'United States'}, 'AUS': {'Name': 'Austin Bergstrom International Airport', 'City': 'Austin', 'Country': 'United States'}, 'LCK': {'Name': 'Rickenbacker International Airport', 'City': 'Columbus', 'Country': 'United States'}, 'MQT': {'Name': 'Sawyer International Airport', 'City': 'Gwinn', 'Country': 'United States'}, 'TYS': {'Name': 'McGhee Tyson Airport', 'City': 'Knoxville', 'Country': 'United States'}, 'HLR': {'Name': 'Hood Army Air Field', 'City': 'Fort Hood', 'Country': 'United States'}, 'STL': {'Name': 'St Louis Lambert International Airport', 'City': 'St. Louis', 'Country': 'United States'}, 'MIV': {'Name': 'Millville Municipal Airport', 'City': 'Millville', 'Country': 'United States'}, 'SPS': {'Name': 'Sheppard Air Force Base-Wichita Falls Municipal Airport', 'City': 'Wichita Falls', 'Country': 'United States'}, 'LUK': {'Name': 'Cincinnati Municipal Airport Lunken Field', 'City': 'Cincinnati', 'Country': 'United States'}, 'ATL': {'Name': 'Hartsfield Jackson Atlanta International Airport', 'City': 'Atlanta', 'Country': 'United States'}, 'MER': {'Name': 'Castle Airport', 'City': 'Merced', 'Country': 'United States'}, 'MCC': {'Name': 'Mc Clellan Airfield', 'City': 'Sacramento', 'Country': 'United States'}, 'GRR': {'Name': 'Gerald R. Ford International Airport', 'City': 'Grand Rapids', 'Country': 'United States'}, 'INK': {'Name': 'Winkler County Airport', 'City': 'Wink', 'Country': 'United States'}, 'FAT': {'Name': 'Fresno Yosemite International Airport', 'City': 'Fresno', 'Country': 'United States'}, 'VRB': {'Name': 'Vero Beach Regional Airport', 'City': 'Vero Beach', 'Country': 'United States'}, 'IPL': {'Name': 'Imperial County Airport', 'City': 'Imperial', 'Country': 'United States'}, 'BNA': {'Name': 'Nashville International Airport', 'City': 'Nashville', 'Country': 'United States'}, 'LRD': {'Name': 'Laredo International Airport', 'City': 'Laredo', 'Country': 'United States'}, 'EDF': {'Name': 'Elmendorf Air Force Base', 'City': 'Anchorage', 'Country': 'United States'}, 'OTZ': {'Name': 'Ralph Wien Memorial Airport', 'City': 'Kotzebue', 'Country': 'United States'}, 'AOO': {'Name': 'Altoona Blair County Airport', 'City': 'Altoona', 'Country': 'United States'}, 'DYS': {'Name': 'Dyess Air Force Base', 'City': 'Abilene', 'Country': 'United States'}, 'ELD': {'Name': 'South Arkansas Regional At Goodwin Field', 'City': 'El Dorado', 'Country': 'United States'}, 'LGA': {'Name': 'La Guardia Airport', 'City': 'New York', 'Country': 'United States'}, 'TLH': {'Name': 'Tallahassee Regional Airport', 'City': 'Tallahassee', 'Country': 'United States'}, 'DPA': {'Name': 'Dupage Airport', 'City': 'West Chicago', 'Country': 'United States'}, 'ACT': {'Name': 'Waco Regional Airport', 'City': 'Waco', 'Country': 'United States'}, 'AUG': {'Name': 'Augusta State Airport', 'City': 'Augusta', 'Country': 'United States'}, 'NIP': {'Name': 'Jacksonville Naval Air Station (Towers Field)', 'City': 'Jacksonville', 'Country': 'United States'}, 'MKL': {'Name': 'McKellar-Sipes Regional Airport', 'City': 'Jackson', 'Country': 'United States'}, 'MKK': {'Name': 'Molokai Airport', 'City': 'Molokai', 'Country': 'United States'}, 'FTK': {'Name': 'Godman Army Air Field', 'City': 'Fort Knox', 'Country': 'United States'}, 'SJT': {'Name': 'San Angelo Regional Mathis Field', 'City': 'San Angelo', 'Country': 'United States'}, 'CXL': {'Name': 'Calexico International Airport', 'City': 'Calexico', 'Country': 'United States'}, 'CIC': {'Name': 'Chico Municipal Airport', 'City': 'Chico', 'Country': 'United States'}, 'BTV': {'Name': 'Burlington International Airport', 'City': 'Burlington', 'Country': 'United States'}, 'JAX': {'Name': 'Jacksonville International Airport', 'City': 'Jacksonville', 'Country': 'United States'}, 'DRO': {'Name': 'Durango La Plata County Airport', 'City': 'Durango', 'Country': 'United States'}, 'IAD': {'Name': 'Washington Dulles International Airport', 'City': 'Washington', 'Country': 'United States'}, 'CLL': {'Name': 'Easterwood Field', 'City': 'College Station', 'Country': 'United States'}, 'SFF': {'Name': 'Felts Field', 'City': 'Spokane', 'Country': 'United States'}, 'MKE': {'Name': 'General Mitchell International Airport', 'City': 'Milwaukee', 'Country': 'United States'}, 'ABI': {'Name': 'Abilene Regional Airport', 'City': 'Abilene', 'Country': 'United States'}, 'COU': {'Name': 'Columbia Regional Airport', 'City': 'Columbia', 'Country': 'United States'}, 'PDX': {'Name': 'Portland International Airport', 'City': 'Portland', 'Country': 'United States'}, 'TNT': {'Name': 'Dade Collier Training and Transition Airport', 'City': 'Miami', 'Country': 'United States'}, 'PBI': {'Name': 'Palm Beach International Airport', 'City': 'West Palm Beach', 'Country': 'United States'}, 'FTW': {'Name': 'Fort Worth Meacham International Airport', 'City': 'Fort Worth', 'Country': 'United States'}, 'OGS': {'Name': 'Ogdensburg International Airport', 'City': 'Ogdensburg', 'Country': 'United States'}, 'FMH': {'Name': 'Cape Cod Coast Guard Air Station', 'City': 'Falmouth', 'Country': 'United States'}, 'BFI': {'Name': 'Boeing Field King County International Airport', 'City': 'Seattle', 'Country': 'United States'}, 'SKF': {'Name': 'Lackland Air Force Base', 'City': 'San Antonio', 'Country': 'United States'}, 'HNL': {'Name': 'Daniel K Inouye International Airport', 'City': 'Honolulu', 'Country': 'United States'}, 'DSM': {'Name': 'Des Moines International Airport', 'City': 'Des Moines', 'Country': 'United States'}, 'EWN': {'Name': 'Coastal Carolina Regional Airport', 'City': 'New Bern', 'Country': 'United States'}, 'SAN': {'Name': 'San Diego International Airport', 'City': 'San Diego', 'Country': 'United States'}, 'MLU': {'Name': 'Monroe Regional Airport', 'City': 'Monroe', 'Country': 'United States'}, 'SSC': {'Name': 'Shaw Air Force Base', 'City': 'Sumter', 'Country': 'United States'}, 'ONT': {'Name': 'Ontario International Airport', 'City': 'Ontario', 'Country': 'United States'}, 'GVT': {'Name': 'Majors Airport', 'City': 'Greenvile', 'Country': 'United States'}, 'ROW': {'Name': 'Roswell International Air Center Airport', 'City': 'Roswell', 'Country': 'United States'}, 'DET': {'Name': 'Coleman A. Young Municipal Airport', 'City': 'Detroit', 'Country': 'United States'}, 'BRO': {'Name': 'Brownsville South Padre Island International Airport', 'City': 'Brownsville', 'Country': 'United States'}, 'DHN': {'Name': 'Dothan Regional Airport', 'City': 'Dothan', 'Country': 'United States'}, 'WWD': {'Name': 'Cape May County Airport', 'City': 'Wildwood', 'Country': 'United States'}, 'NFL': {'Name': 'Fallon Naval Air Station', 'City': 'Fallon', 'Country': 'United States'}, 'MTC': {'Name': 'Selfridge Air National Guard Base Airport', 'City': 'Mount Clemens', 'Country': 'United States'}, 'FMN': {'Name': 'Four Corners Regional Airport', 'City': 'Farmington', 'Country': 'United States'}, 'CRP': {'Name': 'Corpus Christi International Airport', 'City': 'Corpus Christi', 'Country': 'United States'}, 'SYR': {'Name': 'Syracuse Hancock International Airport', 'City': 'Syracuse', 'Country': 'United States'}, 'NQX': {'Name': 'Naval Air Station Key West/Boca Chica Field', 'City': 'Key West', 'Country': 'United States'}, 'MDW': {'Name': 'Chicago Midway International Airport', 'City': 'Chicago', 'Country': 'United States'}, 'SJC': {'Name': 'Norman Y. Mineta San Jose International Airport', 'City': 'San Jose', 'Country': 'United States'}, 'HOB': {'Name': 'Lea County Regional Airport', 'City': 'Hobbs', 'Country': 'United States'}, 'PNE': {'Name': 'Northeast Philadelphia Airport', 'City': 'Philadelphia', 'Country': 'United States'}, 'DEN': {'Name': 'Denver International Airport', 'City': 'Denver', 'Country': 'United States'}, 'PHL': {'Name': 'Philadelphia International Airport', 'City': 'Philadelphia', 'Country': 'United States'}, 'SUX': {'Name': 'Sioux Gateway Col. Bud Day Field', 'City': 'Sioux City', 'Country': 'United States'}, 'MCN': {'Name': 'Middle Georgia Regional Airport', 'City': 'Macon', 'Country': 'United States'}, 'TCS': {'Name': 'Truth Or Consequences Municipal Airport', 'City': 'Truth Or Consequences', 'Country': 'United States'}, 'PMD': {'Name': 'Palmdale Regional/USAF Plant 42 Airport', 'City': 'Palmdale', 'Country': 'United States'}, 'RND': {'Name': 'Randolph Air Force Base', 'City': 'San Antonio', 'Country': 'United States'}, 'NJK': {'Name': 'El Centro NAF Airport (Vraciu Field)', 'City': 'El Centro', 'Country': 'United States'}, 'CMH': {'Name': 'John Glenn Columbus International Airport', 'City': 'Columbus', 'Country': 'United States'}, 'FYV': {'Name': 'Drake Field', 'City': 'Fayetteville', 'Country': 'United States'}, 'FSI': {'Name': 'Henry Post Army Air Field (Fort Sill)', 'City': 'Fort Sill', 'Country': 'United States'}, 'FFO': {'Name': 'Wright-Patterson Air Force Base', 'City': 'Dayton', 'Country': 'United States'}, 'GAL': {'Name': 'Edward G. Pitka Sr Airport', 'City': 'Galena', 'Country': 'United States'}, 'MWL': {'Name': 'Mineral Wells Airport', 'City': 'Mineral Wells', 'Country': 'United States'}, 'IAB': {'Name': 'Mc Connell Air Force Base', 'City': 'Wichita', 'Country': 'United States'}, 'NBG': {'Name': 'New Orleans NAS JRB/Alvin Callender Field', 'City': 'New Orleans', 'Country': 'United States'}, 'BFT': {'Name': 'Beaufort County Airport', 'City': 'Beaufort', 'Country': 'United States'}, 'TXK': {'Name': 'Texarkana Regional Webb Field', 'City': 'Texarkana', 'Country': 'United States'}, 'PBG': {'Name': 'Plattsburgh International Airport', 'City': 'Plattsburgh', 'Country': 'United States'}, 'APG': {'Name': 'Phillips Army Air Field', 'City': 'Aberdeen', 'Country': 'United States'}, 'TCC': {'Name': 'Tucumcari Municipal Airport', 'City': 'Tucumcari', 'Country': 'United States'}, 'ANC': {'Name': 'Ted Stevens Anchorage International Airport', 'City': 'Anchorage', 'Country': 'United States'}, 'GRK': {'Name': 'Robert Gray  Army Air Field Airport', 'City': 'Killeen', 'Country': 'United States'}, 'BLI': {'Name': 'Bellingham International Airport', 'City': 'Bellingham', 'Country': 'United States'}, 'NQA': {'Name': 'Millington-Memphis Airport', 'City': 'Millington', 'Country': 'United States'}, 'EKN': {'Name': 'Elkins-Randolph Co-Jennings Randolph Field', 'City': 'Elkins', 'Country': 'United States'}, 'HFD': {'Name': 'Hartford Brainard Airport', 'City': 'Hartford', 'Country': 'United States'}, 'SFZ': {'Name': 'North Central State Airport', 'City': 'Smithfield', 'Country': 'United States'}, 'MOB': {'Name': 'Mobile Regional Airport', 'City': 'Mobile', 'Country': 'United States'}, 'NUQ': {'Name': 'Moffett Federal Airfield', 'City': 'Mountain View', 'Country': 'United States'}, 'SAF': {'Name': 'Santa Fe Municipal Airport', 'City': 'Santa Fe', 'Country': 'United States'}, 'BKH': {'Name': 'Barking Sands Airport', 'City': 'Barking Sands', 'Country': 'United States'}, 'DRI': {'Name': 'Beauregard Regional Airport', 'City': 'Deridder', 'Country': 'United States'}, 'BSF': {'Name': 'Bradshaw Army Airfield', 'City': 'Bradshaw Field', 'Country': 'United States'}, 'OLS': {'Name': 'Nogales International Airport', 'City': 'Nogales', 'Country': 'United States'}, 'MCF': {'Name': 'Mac Dill Air Force Base', 'City': 'Tampa', 'Country': 'United States'}, 'BLV': {'Name': 'Scott AFB/Midamerica Airport', 'City': 'Belleville', 'Country': 'United States'}, 'OPF': {'Name': 'Opa-locka Executive Airport', 'City': 'Miami', 'Country': 'United States'}, 'DRT': {'Name': 'Del Rio International Airport', 'City': 'Del Rio', 'Country': 'United States'}, 'RSW': {'Name': 'Southwest Florida International Airport', 'City': 'Fort Myers', 'Country': 'United States'}, 'AKN': {'Name': 'King Salmon Airport', 'City': 'King Salmon', 'Country': 'United States'}, 'MUI': {'Name': 'Muir Army Air Field (Fort Indiantown Gap) Airport', 'City': 'Muir', 'Country': 'United States'}, 'JHM': {'Name': 'Kapalua Airport', 'City': 'Lahania-kapalua', 'Country': 'United States'}, 'JFK': {'Name': 'John F Kennedy International Airport', 'City': 'New York', 'Country': 'United States'}, 'HST': {'Name': 'Homestead ARB Airport', 'City': 'Homestead', 'Country': 'United States'}, 'RAL': {'Name': 'Riverside Municipal Airport', 'City': 'Riverside', 'Country': 'United States'}, 'FLV': {'Name': 'Sherman Army Air Field', 'City': 'Fort Leavenworth', 'Country': 'United States'}, 'WAL': {'Name': 'Wallops Flight Facility Airport', 'City': 'Wallops Island', 'Country': 'United States'}, 'HMN': {'Name': 'Holloman Air Force Base', 'City': 'Alamogordo', 'Country': 'United States'}, 'NXX': {'Name': 'Willow Grove Naval Air Station/Joint Reserve Base', 'City': 'Willow Grove', 'Country': 'United States'}, 'CYS': {'Name': 'Cheyenne Regional Jerry Olson Field', 'City': 'Cheyenne', 'Country': 'United States'}, 'SCK': {'Name': 'Stockton Metropolitan Airport', 'City': 'Stockton', 'Country': 'United States'}, 'CHS': {'Name': 'Charleston Air Force Base-International Airport', 'City': 'Charleston', 'Country': 'United States'}, 'RNO': {'Name': 'Reno Tahoe International Airport', 'City': 'Reno', 'Country': 'United States'}, 'KTN': {'Name': 'Ketchikan International Airport', 'City': 'Ketchikan', 'Country': 'United States'}, 'YIP': {'Name': 'Willow Run Airport', 'City': 'Detroit', 'Country': 'United States'}, 'VBG': {'Name': 'Vandenberg Air Force Base', 'City': 'Lompoc', 'Country': 'United States'}, 'BHM': {'Name': 'Birmingham-Shuttlesworth International Airport', 'City': 'Birmingham', 'Country': 'United States'}, 'NEL': {'Name': 'Lakehurst Maxfield Field Airport', 'City': 'Lakehurst', 'Country': 'United States'}, 'SYA': {'Name': 'Eareckson Air Station', 'City': 'Shemya', 'Country': 'United States'}, 'LSV': {'Name': 'Nellis Air Force Base', 'City': 'Las Vegas', 'Country': 'United States'}, 'RIV': {'Name': 'March ARB Airport', 'City': 'Riverside', 'Country': 'United States'}, 'MOD': {'Name': 'Modesto City Co-Harry Sham Field', 'City': 'Modesto', 'Country': 'United States'}, 'SMF': {'Name': 'Sacramento International Airport', 'City': 'Sacramento', 'Country': 'United States'}, 'UGN': {'Name': 'Waukegan National Airport', 'City': 'Chicago', 'Country': 'United States'}, 'COS': {'Name': 'City of Colorado Springs Municipal Airport', 'City': 'Colorado Springs', 'Country': 'United States'}, 'BUF': {'Name': 'Buffalo Niagara International Airport', 'City': 'Buffalo', 'Country': 'United States'}, 'SKY': {'Name': 'Griffing Sandusky Airport', 'City': 'Sandusky', 'Country': 'United States'}, 'PAE': {'Name': 'Snohomish County (Paine Field) Airport', 'City': 'Everett', 'Country': 'United States'}, 'MUO': {'Name': 'Mountain Home Air Force Base', 'City': 'Mountain Home', 'Country': 'United States'}, 'CDC': {'Name': 'Cedar City Regional Airport', 'City': 'Cedar City', 'Country': 'United States'}, 'BDL': {'Name': 'Bradley International Airport', 'City': 'Windsor Locks', 'Country': 'United States'}, 'MFE': {'Name': 'Mc Allen Miller International Airport', 'City': 'Mcallen', 'Country': 'United States'}, 'NGU': {'Name': 'Norfolk Naval Station (Chambers Field)', 'City': 'Norfolk', 'Country': 'United States'}, 'CEF': {'Name': 'Westover ARB/Metropolitan Airport', 'City': 'Chicopee Falls', 'Country': 'United States'}, 'LBB': {'Name': 'Lubbock Preston Smith International Airport', 'City': 'Lubbock', 'Country': 'United States'}, 'ORD': {'Name': "Chicago O'Hare International Airport", 'City': 'Chicago', 'Country': 'United States'}, 'BCT': {'Name': 'Boca Raton Airport', 'City': 'Boca Raton', 'Country': 'United States'}, 'FAI': {'Name': 'Fairbanks International Airport', 'City': 'Fairbanks', 'Country': 'United States'}, 'CVS': {'Name': 'Cannon Air Force Base', 'City': 'Clovis', 'Country': 'United States'}, 'NGF': {'Name': 'Kaneohe Bay MCAS (Marion E. Carl Field) Airport', 'City': 'Kaneohe Bay', 'Country': 'United States'}, 'OFF': {'Name': 'Offutt Air Force Base', 'City': 'Omaha', 'Country': 'United States'}, 'GKN': {'Name': 'Gulkana Airport', 'City': 'Gulkana', 'Country': 'United States'}, 'ART': {'Name': 'Watertown International Airport', 'City': 'Watertown', 'Country': 'United States'}, 'PSP': {'Name': 'Palm Springs International Airport', 'City': 'Palm Springs', 'Country': 'United States'}, 'AMA': {'Name': 'Rick Husband Amarillo International Airport', 'City': 'Amarillo', 'Country': 'United States'}, 'FOD': {'Name': 'Fort Dodge Regional Airport', 'City': 'Fort Dodge', 'Country': 'United States'}, 'BAD': {'Name': 'Barksdale Air Force Base', 'City': 'Shreveport', 'Country': 'United States'}, 'FOE': {'Name': 'Topeka Regional Airport - Forbes Field', 'City': 'Topeka', 'Country': 'United States'}, 'COT': {'Name': 'Cotulla-La Salle County Airport', 'City': 'Cotulla', 'Country': 'United States'}, 'ILM': {'Name': 'Wilmington International Airport', 'City': 'Wilmington', 'Country': 'United States'}, 'BTR': {'Name': 'Baton Rouge Metropolitan Airport', 'City': 'Baton Rouge', 'Country': 'United States'}, 'TYR': {'Name': 'Tyler Pounds Regional Airport', 'City': 'Tyler', 'Country': 'United States'}, 'BWI': {'Name': 'Baltimore/Washington International Thurgood Marshall Airport', 'City': 'Baltimore', 'Country': 'United States'}, 'HBR': {'Name': 'Hobart Regional Airport', 'City': 'Hobart', 'Country': 'United States'}, 'LNY': {'Name': 'Lanai Airport', 'City': 'Lanai', 'Country': 'United States'}, 'AEX': {'Name': 'Alexandria International Airport', 'City': 'Alexandria', 'Country': 'United States'}, 'WSD': {'Name': 'Condron Army Air Field', 'City': 'White Sands', 'Country': 'United States'}, 'CDB': {'Name': 'Cold Bay Airport', 'City': 'Cold Bay', 'Country': 'United States'}, 'TUL': {'Name': 'Tulsa International Airport', 'City': 'Tulsa', 'Country': 'United States'}, 'SIT': {'Name': 'Sitka Rocky Gutierrez Airport', 'City': 'Sitka', 'Country': 'United States'}, 'ISP': {'Name': 'Long Island Mac Arthur Airport', 'City': 'Islip', 'Country': 'United States'}, 'MSP': {'Name': 'Minneapolis-St Paul International/Wold-Chamberlain Airport', 'City': 'Minneapolis', 'Country': 'United States'}, 'ILG': {'Name': 'New Castle Airport', 'City': 'Wilmington', 'Country': 'United States'}, 'DUT': {'Name': 'Unalaska Airport', 'City': 'Unalaska', 'Country': 'United States'}, 'MSY': {'Name': 'Louis Armstrong New Orleans International Airport', 'City': 'New Orleans', 'Country': 'United States'}, 'PWM': {'Name': 'Portland International Jetport Airport', 'City': 'Portland', 'Country': 'United States'}, 'OKC': {'Name': 'Will Rogers World Airport', 'City': 'Oklahoma City', 'Country': 'United States'}, 'ALB': {'Name': 'Albany International Airport', 'City': 'Albany', 'Country': 'United States'}, 'VDZ': {'Name': 'Valdez Pioneer Field', 'City': 'Valdez', 'Country': 'United States'}, 'LFI': {'Name': 'Langley Air Force Base', 'City': 'Hampton', 'Country': 'United States'}, 'SNA': {'Name': 'John Wayne Airport-Orange County Airport', 'City': 'Santa Ana', 'Country': 'United States'}, 'CBM': {'Name': 'Columbus Air Force Base', 'City': 'Colombus', 'Country': 'United States'}, 'TMB': {'Name': 'Kendall-Tamiami Executive Airport', 'City': 'Kendall-tamiami', 'Country': 'United States'}, 'NTU': {'Name': 'Oceana Naval Air Station', 'City': 'Oceana', 'Country': 'United States'}, 'GUS': {'Name': 'Grissom Air Reserve Base', 'City': 'Peru', 'Country': 'United States'}, 'CPR': {'Name': 'Casper-Natrona County International Airport', 'City': 'Casper', 'Country': 'United States'}, 'VPS': {'Name': 'Destin-Ft Walton Beach Airport', 'City': 'Valparaiso', 'Country': 'United States'}, 'SEM': {'Name': 'Craig Field', 'City': 'Selma', 'Country': 'United States'}, 'EYW': {'Name': 'Key West International Airport', 'City': 'Key West', 'Country': 'United States'}, 'CLT': {'Name': 'Charlotte Douglas International Airport', 'City': 'Charlotte', 'Country': 'United States'}, 'LAS': {'Name': 'McCarran International Airport', 'City': 'Las Vegas', 'Country': 'United States'}, 'MCO': {'Name': 'Orlando International Airport', 'City': 'Orlando', 'Country': 'United States'}, 'FLO': {'Name': 'Florence Regional Airport', 'City': 'Florence', 'Country': 'United States'}, 'GTF': {'Name': 'Great Falls International Airport', 'City': 'Great Falls', 'Country': 'United States'}, 'YNG': {'Name': 'Youngstown Warren Regional Airport', 'City': 'Youngstown', 'Country': 'United States'}, 'FBK': {'Name': 'Ladd AAF Airfield', 'City': 'Fort Wainwright', 'Country': 'United States'}, 'WRB': {'Name': 'Robins Air Force Base', 'City': 'Macon', 'Country': 'United States'}, 'BKK': {'Name': 'Suvarnabhumi Airport', 'City': 'Bangkok', 'Country': 'Thailand'}, 'NAH': {'Name': 'Naha Airport', 'City': 'Naha', 'Country': 'Indonesia'}, 'MXB': {'Name': 'Andi Jemma Airport', 'City': 'Masamba', 'Country': 'Indonesia'}, 'SQR': {'Name': 'Soroako Airport', 'City': 'Soroako', 'Country': 'Indonesia'}, 'TTR': {'Name': 'Pongtiku Airport', 'City': 'Makale', 'Country': 'Indonesia'}, 'KDI': {'Name': 'Wolter Monginsidi Airport', 'City': 'Kendari', 'Country': 'Indonesia'}, 'SBG': {'Name': 'Maimun Saleh Airport', 'City': 'Sabang', 'Country': 'Indonesia'}, 'TSY': {'Name': 'Cibeureum Airport', 'City': 'Tasikmalaya', 'Country': 'Indonesia'}, 'MLG': {'Name': 'Abdul Rachman Saleh Airport', 'City': 'Malang', 'Country': 'Indonesia'}, 'BDO': {'Name': 'Husein Sastranegara International Airport', 'City': 'Bandung', 'Country': 'Indonesia'}, 'CBN': {'Name': 'Penggung Airport', 'City': 'Cirebon', 'Country': 'Indonesia'}, 'JOG': {'Name': 'Adi Sutjipto International Airport', 'City': 'Yogyakarta', 'Country': 'Indonesia'}, 'CXP': {'Name': 'Tunggul Wulung Airport', 'City': 'Cilacap', 'Country': 'Indonesia'}, 'PCB': {'Name': 'Pondok Cabe Air Base', 'City': 'Jakarta', 'Country': 'Indonesia'}, 'SRG': {'Name': 'Achmad Yani Airport', 'City': 'Semarang', 'Country': 'Indonesia'}, 'BTH': {'Name': 'Hang Nadim International Airport', 'City': 'Batam', 'Country': 'Indonesia'}, 'TJQ': {'Name': 'Buluh Tumbang (H A S Hanandjoeddin) Airport', 'City': 'Tanjung Pandan', 'Country': 'Indonesia'}, 'PGK': {'Name': 'Pangkal Pinang (Depati Amir) Airport', 'City': 'Pangkal Pinang', 'Country': 'Indonesia'}, 'TNJ': {'Name': 'Raja Haji Fisabilillah International Airport', 'City': 'Tanjung Pinang', 'Country': 'Indonesia'}, 'SIQ': {'Name': 'Dabo Airport', 'City': 'Singkep', 'Country': 'Indonesia'}, 'BDJ': {'Name': 'Syamsudin Noor Airport', 'City': 'Banjarmasin', 'Country': 'Indonesia'}, 'BTW': {'Name': 'Batu Licin Airport', 'City': 'Batu Licin', 'Country': 'Indonesia'}, 'PKN': {'Name': 'Iskandar Airport', 'City': 'Pangkalan Bun', 'Country': 'Indonesia'}, 'PKY': {'Name': 'Tjilik Riwut Airport', 'City': 'Palangkaraya', 'Country': 'Indonesia'}, 'MOF': {'Name': 'Maumere(Wai Oti) Airport', 'City': 'Maumere', 'Country': 'Indonesia'}, 'ENE': {'Name': 'Ende (H Hasan Aroeboesman) Airport', 'City': 'Ende', 'Country': 'Indonesia'}, 'RTG': {'Name': 'Frans Sales Lega Airport', 'City': 'Ruteng', 'Country': 'Indonesia'}, 'KOE': {'Name': 'El Tari Airport', 'City': 'Kupang', 'Country': 'Indonesia'}, 'LBJ': {'Name': 'Komodo Airport', 'City': 'Labuhan Bajo', 'Country': 'Indonesia'}, 'BPN': {'Name': 'Sultan Aji Muhamad Sulaiman Airport', 'City': 'Balikpapan', 'Country': 'Indonesia'}, 'TRK': {'Name': 'Juwata Airport', 'City': 'Taraken', 'Country': 'Indonesia'}, 'SRI': {'Name': 'Temindung Airport', 'City': 'Samarinda', 'Country': 'Indonesia'}, 'TSX': {'Name': 'Tanjung Santan Airport', 'City': 'Tanjung Santan', 'Country': 'Indonesia'}, 'AMI': {'Name': 'Selaparang Airport', 'City': 'Mataram', 'Country': 'Indonesia'}, 'BMU': {'Name': 'Muhammad Salahuddin Airport', 'City': 'Bima', 'Country': 'Indonesia'}, 'WGP': {'Name': 'Umbu Mehang Kunda Airport', 'City': 'Waingapu', 'Country': 'Indonesia'}, 'SUB': {'Name': 'Juanda International Airport', 'City': 'Surabaya', 'Country': 'Indonesia'}, 'SOC': {'Name': 'Adi Sumarmo Wiryokusumo Airport', 'City': 'Solo City', 'Country': 'Indonesia'}, 'ICN': {'Name': 'Incheon International Airport', 'City': 'Seoul', 'Country': 'South Korea'}, 'CNX': {'Name': 'Chiang Mai International Airport', 'City': 'Chiang Mai', 'Country': 'Thailand'}, 'CEI': {'Name': 'Chiang Rai International Airport', 'City': 'Chiang Rai', 'Country': 'Thailand'}, 'NST': {'Name': 'Nakhon Si Thammarat Airport', 'City': 'Nakhon Si Thammarat', 'Country': 'Thailand'}, 'NAK': {'Name': 'Nakhon Ratchasima Airport', 'City': 'Nakhon Ratchasima', 'Country': 'Thailand'}, 'KOP': {'Name': 'Nakhon Phanom Airport', 'City': 'Nakhon Phanom', 'Country': 'Thailand'}, 'UBP': {'Name': 'Ubon Ratchathani Airport', 'City': 'Ubon Ratchathani', 'Country': 'Thailand'}, 'KKC': {'Name': 'Khon Kaen Airport', 'City': 'Khon Kaen', 'Country': 'Thailand'}, 'THS': {'Name': 'Sukhothai Airport', 'City': 'Sukhothai', 'Country': 'Thailand'}, 'DPS': {'Name': 'Ngurah Rai (Bali) International Airport', 'City': 'Denpasar', 'Country': 'Indonesia'}, 'ATH': {'Name': 'Eleftherios Venizelos International Airport', 'City': 'Athens', 'Country': 'Greece'}, 'NGO': {'Name': 'Chubu Centrair International Airport', 'City': 'Nagoya', 'Country': 'Japan'}, 'UKB': {'Name': 'Kobe Airport', 'City': 'Kobe', 'Country': 'Japan'}, 'PUW': {'Name': 'Pullman Moscow Regional Airport', 'City': 'Pullman', 'Country': 'United States'}, 'LWS': {'Name': 'Lewiston Nez Perce County Airport', 'City': 'Lewiston', 'Country': 'United States'}, 'ELM': {'Name': 'Elmira Corning Regional Airport', 'City': 'Elmira', 'Country': 'United States'}, 'ITH': {'Name': 'Ithaca Tompkins Regional Airport', 'City': 'Ithaca', 'Country': 'United States'}, 'MRY': {'Name': 'Monterey Peninsula Airport', 'City': 'Monterey', 'Country': 'United States'}, 'SBA': {'Name': 'Santa Barbara Municipal Airport', 'City': 'Santa Barbara', 'Country': 'United States'}, 'DAB': {'Name': 'Daytona Beach International Airport', 'City': 'Daytona Beach', 'Country': 'United States'}, 'LPX': {'Name': 'Liepāja International Airport', 'City': 'Liepaja', 'Country': 'Latvia'}, 'RIX': {'Name': 'Riga International Airport', 'City': 'Riga', 'Country': 'Latvia'}, 'SQQ': {'Name': 'Šiauliai International Airport', 'City': 'Siauliai', 'Country': 'Lithuania'}, 'HLJ': {'Name': 'Barysiai Airport', 'City': 'Barysiai', 'Country': 'Lithuania'}, 'KUN': {'Name': 'Kaunas International Airport', 'City': 'Kaunas', 'Country': 'Lithuania'}, 'PLQ': {'Name': 'Palanga International Airport', 'City': 'Palanga', 'Country': 'Lithuania'}, 'VNO': {'Name': 'Vilnius International Airport', 'City': 'Vilnius', 'Country': 'Lithuania'}, 'PNV': {'Name': 'Panevėžys Air Base', 'City': 'Panevezys', 'Country': 'Lithuania'}, 'EVN': {'Name': 'Zvartnots International Airport', 'City': 'Yerevan', 'Country': 'Armenia'}, 'LWN': {'Name': 'Gyumri Shirak Airport', 'City': 'Gyumri', 'Country': 'Armenia'}, 'ASA': {'Name': 'Assab International Airport', 'City': 'Assab', 'Country': 'Eritrea'}, 'ASM': {'Name': 'Asmara International Airport', 'City': 'Asmara', 'Country': 'Eritrea'}, 'MSW': {'Name': 'Massawa International Airport', 'City': 'Massawa', 'Country': 'Eritrea'}, 'GZA': {'Name': 'Yasser Arafat International Airport', 'City': 'Gaza', 'Country': 'Palestine'}, 'BUS': {'Name': 'Batumi International Airport', 'City': 'Batumi', 'Country': 'Georgia'}, 'KUT': {'Name': 'Kopitnari Airport', 'City': 'Kutaisi', 'Country': 'Georgia'}, 'TBS': {'Name': 'Tbilisi International Airport', 'City': 'Tbilisi', 'Country': 'Georgia'}, 'RIY': {'Name': 'Mukalla International Airport', 'City': 'Mukalla', 'Country': 'Yemen'}, 'TAI': {'Name': "Ta'izz International Airport", 'City': 'Taiz', 'Country': 'Yemen'}, 'HOD': {'Name': 'Hodeidah International Airport', 'City': 'Hodeidah', 'Country': 'Yemen'}, 'ADE': {'Name': 'Aden International Airport', 'City': 'Aden', 'Country': 'Yemen'}, 'AXK': {'Name': 'Ataq Airport', 'City': 'Ataq', 'Country': 'Yemen'}, 'AAY': {'Name': 'Al Ghaidah International Airport', 'City': 'Al Ghaidah Intl', 'Country': 'Yemen'}, 'SAH': {'Name': "Sana'a International Airport", 'City': 'Sanaa', 'Country': 'Yemen'}, 'BHN': {'Name': 'Beihan Airport', 'City': 'Beihan', 'Country': 'Yemen'}, 'SCT': {'Name': 'Socotra International Airport', 'City': 'Socotra', 'Country': 'Yemen'}, 'FMM': {'Name': 'Memmingen Allgau Airport', 'City': 'Memmingen', 'Country': 'Germany'}, 'NAV': {'Name': 'Nevşehir Kapadokya Airport', 'City': 'Nevsehir', 'Country': 'Turkey'}, 'EZE': {'Name': 'Ministro Pistarini International Airport', 'City': 'Buenos Aires', 'Country': 'Argentina'}, 'EBL': {'Name': 'Erbil International Airport', 'City': 'Erbil', 'Country': 'Iraq'}, 'EMD': {'Name': 'Emerald Airport', 'City': 'Emerald', 'Country': 'Australia'}, 'HEW': {'Name': 'Athen Helenikon Airport', 'City': 'Athens', 'Country': 'Greece'}, 'KIX': {'Name': 'Kansai International Airport', 'City': 'Osaka', 'Country': 'Japan'}, 'JRB': {'Name': 'Downtown-Manhattan/Wall St Heliport', 'City': 'New York', 'Country': 'United States'}, 'TAG': {'Name': 'Tagbilaran Airport', 'City': 'Tagbilaran', 'Country': 'Philippines'}, 'JAV': {'Name': 'Ilulissat Airport', 'City': 'Ilulissat', 'Country': 'Greenland'}, 'JCH': {'Name': 'Qasigiannguit Heliport', 'City': 'Qasigiannguit', 'Country': 'Greenland'}, 'JEG': {'Name': 'Aasiaat Airport', 'City': 'Aasiaat', 'Country': 'Greenland'}, 'PMI': {'Name': 'Palma De Mallorca Airport', 'City': 'Palma de Mallorca', 'Country': 'Spain'}, 'DRW': {'Name': 'Darwin International Airport', 'City': 'Darwin', 'Country': 'Australia'}, 'URT': {'Name': 'Surat Thani Airport', 'City': 'Surat Thani', 'Country': 'Thailand'}, 'TKA': {'Name': 'Talkeetna Airport', 'City': 'Talkeetna', 'Country': 'United States'}, 'GZM': {'Name': 'Xewkija Heliport', 'City': 'Gozo', 'Country': 'Malta'}, 'HVN': {'Name': 'Tweed New Haven Airport', 'City': 'New Haven', 'Country': 'United States'}, 'AVL': {'Name': 'Asheville Regional Airport', 'City': 'Asheville', 'Country': 'United States'}, 'GSO': {'Name': 'Piedmont Triad International Airport', 'City': 'Greensboro', 'Country': 'United States'}, 'FSD': {'Name': 'Joe Foss Field Airport', 'City': 'Sioux Falls', 'Country': 'United States'}, 'AYQ': {'Name': 'Ayers Rock Connellan Airport', 'City': 'Uluru', 'Country': 'Australia'}, 'MHT': {'Name': 'Manchester-Boston Regional Airport', 'City': 'Manchester NH', 'Country': 'United States'}, 'APF': {'Name': 'Naples Municipal Airport', 'City': 'Naples', 'Country': 'United States'}, 'RDN': {'Name': 'LTS Pulau Redang Airport', 'City': 'Redang', 'Country': 'Malaysia'}, 'SDF': {'Name': 'Louisville International Standiford Field', 'City': 'Louisville', 'Country': 'United States'}, 'CHO': {'Name': 'Charlottesville Albemarle Airport', 'City': 'Charlottesville VA', 'Country': 'United States'}, 'ROA': {'Name': 'Roanoke–Blacksburg Regional Airport', 'City': 'Roanoke VA', 'Country': 'United States'}, 'LEX': {'Name': 'Blue Grass Airport', 'City': 'Lexington KY', 'Country': 'United States'}, 'EVV': {'Name': 'Evansville Regional Airport', 'City': 'Evansville', 'Country': 'United States'}, 'ABQ': {'Name': 'Albuquerque International Sunport', 'City': 'Albuquerque', 'Country': 'United States'}, 'BZN': {'Name': 'Gallatin Field', 'City': 'Bozeman', 'Country': 'United States'}, 'BIL': {'Name': 'Billings Logan International Airport', 'City': 'Billings', 'Country': 'United States'}, 'BTM': {'Name': 'Bert Mooney Airport', 'City': 'Butte', 'Country': 'United States'}, 'TVC': {'Name': 'Cherry Capital Airport', 'City': 'Traverse City', 'Country': 'United States'}, 'FRS': {'Name': 'Mundo Maya International Airport', 'City': 'Flores', 'Country': 'Guatemala'}, 'BHB': {'Name': 'Hancock County-Bar Harbor Airport', 'City': 'Bar Harbor', 'Country': 'United States'}, 'RKD': {'Name': 'Knox County Regional Airport', 'City': 'Rockland', 'Country': 'United States'}, 'JAC': {'Name': 'Jackson Hole Airport', 'City': 'Jacksn Hole', 'Country': 'United States'}, 'RFD': {'Name': 'Chicago Rockford International Airport', 'City': 'Rockford', 'Country': 'United States'}, 'DME': {'Name': 'Domodedovo International Airport', 'City': 'Moscow', 'Country': 'Russia'}, 'SYX': {'Name': 'Sanya Phoenix International Airport', 'City': 'Sanya', 'Country': 'China'}, 'MFN': {'Name': 'Milford Sound Airport', 'City': 'Milford Sound', 'Country': 'New Zealand'}, 'LJG': {'Name': 'Lijiang Airport', 'City': 'Lijiang', 'Country': 'China'}, 'GSP': {'Name': 'Greenville Spartanburg International Airport', 'City': 'Greenville', 'Country': 'United States'}, 'BMI': {'Name': 'Central Illinois Regional Airport at Bloomington-Normal', 'City': 'Bloomington', 'Country': 'United States'}, 'GPT': {'Name': 'Gulfport Biloxi International Airport', 'City': 'Gulfport', 'Country': 'United States'}, 'AZO': {'Name': 'Kalamazoo Battle Creek International Airport', 'City': 'Kalamazoo', 'Country': 'United States'}, 'TOL': {'Name': 'Toledo Express Airport', 'City': 'Toledo', 'Country': 'United States'}, 'FWA': {'Name': 'Fort Wayne International Airport', 'City': 'Fort Wayne', 'Country': 'United States'}, 'DEC': {'Name': 'Decatur Airport', 'City': 'Decatur', 'Country': 'United States'}, 'CID': {'Name': 'The Eastern Iowa Airport', 'City': 'Cedar Rapids', 'Country': 'United States'}, 'LSE': {'Name': 'La Crosse Municipal Airport', 'City': 'La Crosse', 'Country': 'United States'}, 'CWA': {'Name': 'Central Wisconsin Airport', 'City': 'Wassau', 'Country': 'United States'}, 'PIA': {'Name': 'General Wayne A. Downing Peoria International Airport', 'City': 'Peoria', 'Country': 'United States'}, 'ATW': {'Name': 'Appleton International Airport', 'City': 'Appleton', 'Country': 'United States'}, 'RST': {'Name': 'Rochester International Airport', 'City': 'Rochester', 'Country': 'United States'}, 'CMI': {'Name': 'University of Illinois Willard Airport', 'City': 'Champaign', 'Country': 'United States'}, 'MHK': {'Name': 'Manhattan Regional Airport', 'City': 'Manhattan', 'Country': 'United States'}, 'KGC': {'Name': 'Kingscote Airport', 'City': 'Kingscote', 'Country': 'Australia'}, 'HVB': {'Name': 'Hervey Bay Airport', 'City': 'Hervey Bay', 'Country': 'Australia'}, 'DLU': {'Name': 'Dali Airport', 'City': 'Dali', 'Country': 'China'}, 'MZV': {'Name': 'Mulu Airport', 'City': 'Mulu', 'Country': 'Malaysia'}, 'SSH': {'Name': 'Sharm El Sheikh International Airport', 'City': 'Sharm El Sheikh', 'Country': 'Egypt'}, 'FKL': {'Name': 'Venango Regional Airport', 'City': 'Franklin', 'Country': 'United States'}, 'NBO': {'Name': 'Jomo Kenyatta International Airport', 'City': 'Nairobi', 'Country': 'Kenya'}, 'SEU': {'Name': 'Seronera Airport', 'City': 'Seronera', 'Country': 'Tanzania'}, 'FTE': {'Name': 'El Calafate Airport', 'City': 'El Calafate', 'Country': 'Argentina'}, 'ARM': {'Name': 'Armidale Airport', 'City': 'Armidale', 'Country': 'Australia'}, 'GJT': {'Name': 'Grand Junction Regional Airport', 'City': 'Grand Junction', 'Country': 'United States'}, 'SGU': {'Name': 'St George Municipal Airport', 'City': 'Saint George', 'Country': 'United States'}, 'DWH': {'Name': 'David Wayne Hooks Memorial Airport', 'City': 'Houston', 'Country': 'United States'}, 'SRQ': {'Name': 'Sarasota Bradenton International Airport', 'City': 'Sarasota', 'Country': 'United States'}, 'BDA': {'Name': 'L.F. Wade International International Airport', 'City': 'Bermuda', 'Country': 'Bermuda'}, 'VNY': {'Name': 'Van Nuys Airport', 'City': 'Van Nuys', 'Country': 'United States'}, 'MLI': {'Name': 'Quad City International Airport', 'City': 'Moline', 'Country': 'United States'}, 'PFN': {'Name': 'Panama City-Bay Co International Airport', 'City': 'Panama City', 'Country': 'United States'}, 'HIR': {'Name': 'Honiara International Airport', 'City': 'Honiara', 'Country': 'Solomon Islands'}, 'PPT': {'Name': "Faa'a International Airport", 'City': 'Papeete', 'Country': 'French Polynesia'}, 'INU': {'Name': 'Nauru International Airport', 'City': 'Nauru', 'Country': 'Nauru'}, 'FUN': {'Name': 'Funafuti International Airport', 'City': 'Funafuti', 'Country': 'Tuvalu'}, 'OVB': {'Name': 'Tolmachevo Airport', 'City': 'Novosibirsk', 'Country': 'Russia'}, 'XKH': {'Name': 'Xieng Khouang Airport', 'City': 'Phon Savan', 'Country': 'Laos'}, 'BIS': {'Name': 'Bismarck Municipal Airport', 'City': 'Bismarck', 'Country': 'United States'}, 'TEX': {'Name': 'Telluride Regional Airport', 'City': 'Telluride', 'Country': 'United States'}, 'HGN': {'Name': 'Mae Hong Son Airport', 'City': 'Mae Hong Son', 'Country': 'Thailand'}, 'RAP': {'Name': 'Rapid City Regional Airport', 'City': 'Rapid City', 'Country': 'United States'}, 'CLD': {'Name': 'Mc Clellan-Palomar Airport', 'City': 'Carlsbad', 'Country': 'United States'}, 'FNT': {'Name': 'Bishop International Airport', 'City': 'Flint', 'Country': 'United States'}, 'DVO': {'Name': 'Francisco Bangoy International Airport', 'City': 'Davao', 'Country': 'Philippines'}, 'FNC': {'Name': 'Madeira Airport', 'City': 'Funchal', 'Country': 'Portugal'}, 'STM': {'Name': 'Maestro Wilson Fonseca Airport', 'City': 'Santarem', 'Country': 'Brazil'}, 'KOS': {'Name': 'Sihanoukville International Airport', 'City': 'Sihanoukville', 'Country': 'Cambodia'}, 'YOA': {'Name': 'Ekati Airport', 'City': 'Ekati', 'Country': 'Canada'}, 'NPE': {'Name': "Hawke's Bay Airport", 'City': 'NAPIER', 'Country': 'New Zealand'}, 'LEV': {'Name': 'Levuka Airfield', 'City': 'Levuka', 'Country': 'Fiji'}, 'LXA': {'Name': 'Lhasa Gonggar Airport', 'City': 'Lhasa', 'Country': 'China'}, 'RDD': {'Name': 'Redding Municipal Airport', 'City': 'Redding', 'Country': 'United States'}, 'EUG': {'Name': 'Mahlon Sweet Field', 'City': 'Eugene', 'Country': 'United States'}, 'IDA': {'Name': 'Idaho Falls Regional Airport', 'City': 'Idaho Falls', 'Country': 'United States'}, 'MFR': {'Name': 'Rogue Valley International Medford Airport', 'City': 'Medford', 'Country': 'United States'}, 'KBZ': {'Name': 'Kaikoura Airport', 'City': 'Kaikoura', 'Country': 'New Zealand'}, 'RDM': {'Name': 'Roberts Field', 'City': 'Redmond-Bend', 'Country': 'United States'}, 'PCN': {'Name': 'Picton Aerodrome', 'City': 'Picton', 'Country': 'New Zealand'}, 'WDH': {'Name': 'Hosea Kutako International Airport', 'City': 'Windhoek', 'Country': 'Namibia'}, 'YWH': {'Name': 'Victoria Harbour Seaplane Base', 'City': 'Victoria', 'Country': 'Canada'}, 'TNA': {'Name': 'Yaoqiang Airport', 'City': 'Jinan', 'Country': 'China'}, 'CZX': {'Name': 'Changzhou Benniu Airport', 'City': 'Changzhou', 'Country': 'China'}, 'YBP': {'Name': 'Yibin Caiba Airport', 'City': 'Yibin', 'Country': 'China'}, 'TJM': {'Name': 'Roshchino International Airport', 'City': 'Tyumen', 'Country': 'Russia'}, 'CAK': {'Name': 'Akron Canton Regional Airport', 'City': 'Akron', 'Country': 'United States'}, 'HSV': {'Name': 'Huntsville International Carl T Jones Field', 'City': 'Huntsville', 'Country': 'United States'}, 'PKB': {'Name': 'Mid Ohio Valley Regional Airport', 'City': 'PARKERSBURG', 'Country': 'United States'}, 'MGM': {'Name': 'Montgomery Regional (Dannelly Field) Airport', 'City': 'MONTGOMERY', 'Country': 'United States'}, 'TRI': {'Name': 'Tri-Cities Regional TN/VA Airport', 'City': 'BRISTOL', 'Country': 'United States'}, 'PAH': {'Name': 'Barkley Regional Airport', 'City': 'PADUCAH', 'Country': 'United States'}, 'JIB': {'Name': 'Djibouti-Ambouli Airport', 'City': 'Djibouti', 'Country': 'Djibouti'}, 'HAK': {'Name': 'Haikou Meilan International Airport', 'City': 'Haikou', 'Country': 'China'}, 'MFA': {'Name': 'Mafia Island Airport', 'City': 'Mafia Island', 'Country': 'Tanzania'}, 'PGA': {'Name': 'Page Municipal Airport', 'City': 'Page', 'Country': 'United States'}, 'UII': {'Name': 'Utila Airport', 'City': 'Utila', 'Country': 'Honduras'}, 'FCA': {'Name': 'Glacier Park International Airport', 'City': 'Kalispell', 'Country': 'United States'}, 'MBS': {'Name': 'MBS International Airport', 'City': 'Saginaw', 'Country': 'United States'}, 'BGM': {'Name': 'Greater Binghamton/Edwin A Link field', 'City': 'Binghamton', 'Country': 'United States'}, 'BGW': {'Name': 'Baghdad International Airport', 'City': 'Baghdad', 'Country': 'Iraq'}, 'NNT': {'Name': 'Nan Airport', 'City': 'Nan', 'Country': 'Thailand'}, 'ROI': {'Name': 'Roi Et Airport', 'City': 'Roi Et', 'Country': 'Thailand'}, 'BFV': {'Name': 'Buri Ram Airport', 'City': 'Buri Ram', 'Country': 'Thailand'}, 'TDX': {'Name': 'Trat Airport', 'City': 'Trat', 'Country': 'Thailand'}, 'BLH': {'Name': 'Blythe Airport', 'City': 'Blythe', 'Country': 'United States'}, 'IQA': {'Name': 'Al Asad Air Base', 'City': 'Al Asad', 'Country': 'Iraq'}, 'TQD': {'Name': 'Al Taqaddum Air Base', 'City': 'Al Taqaddum', 'Country': 'Iraq'}, 'XQC': {'Name': 'Joint Base Balad', 'City': 'Al Bakr', 'Country': 'Iraq'}, 'CRK': {'Name': 'Diosdado Macapagal International Airport', 'City': 'Angeles City', 'Country': 'Philippines'}, 'SDK': {'Name': 'Sandakan Airport', 'City': 'Sandakan', 'Country': 'Malaysia'}, 'LXG': {'Name': 'Luang Namtha Airport', 'City': 'Luang Namtha', 'Country': 'Laos'}, 'ODY': {'Name': 'Oudomsay Airport', 'City': 'Muang Xay', 'Country': 'Laos'}, 'SHE': {'Name': 'Taoxian Airport', 'City': 'Shenyang', 'Country': 'China'}, 'DOY': {'Name': 'Dongying Shengli Airport', 'City': 'Dongying', 'Country': 'China'}, 'MNI': {'Name': 'John A. Osborne Airport', 'City': 'Geralds', 'Country': 'Montserrat'}, 'PSG': {'Name': 'Petersburg James A Johnson Airport', 'City': 'Petersburg', 'Country': 'United States'}, 'LYA': {'Name': 'Luoyang Airport', 'City': 'Luoyang', 'Country': 'China'}, 'XUZ': {'Name': 'Xuzhou Guanyin Airport', 'City': 'Xuzhou', 'Country': 'China'}, 'MWQ': {'Name': 'Magway Airport', 'City': 'Magwe', 'Country': 'Burma'}, 'KHM': {'Name': 'Kanti Airport', 'City': 'Khamti', 'Country': 'Burma'}, 'DLI': {'Name': 'Lien Khuong Airport', 'City': 'Dalat', 'Country': 'Vietnam'}, 'VDH': {'Name': 'Dong Hoi Airport', 'City': 'Dong Hoi', 'Country': 'Vietnam'}, 'VKG': {'Name': 'Rach Gia Airport', 'City': 'Rach Gia', 'Country': 'Vietnam'}, 'CAH': {'Name': 'Cà Mau Airport', 'City': 'Ca Mau', 'Country': 'Vietnam'}, 'VCL': {'Name': 'Chu Lai International Airport', 'City': 'Chu Lai', 'Country': 'Vietnam'}, 'TBB': {'Name': 'Dong Tac Airport', 'City': 'Tuy Hoa', 'Country': 'Vietnam'}, 'PYY': {'Name': 'Mae Hong Son Airport', 'City': 'Pai', 'Country': 'Thailand'}, 'BWK': {'Name': 'Bol Airport', 'City': 'Brac', 'Country': 'Croatia'}, 'NSI': {'Name': 'Yaoundé Nsimalen International Airport', 'City': 'Yaounde', 'Country': 'Cameroon'}, 'CKY': {'Name': 'Conakry International Airport', 'City': 'Conakry', 'Country': 'Guinea'}, 'AAH': {'Name': 'Aachen-Merzbrück Airport', 'City': 'Aachen', 'Country': 'Germany'}, 'FKB': {'Name': 'Karlsruhe Baden-Baden Airport', 'City': 'Karlsruhe/Baden-Baden', 'Country': 'Germany'}, 'SFB': {'Name': 'Orlando Sanford International Airport', 'City': 'Sanford', 'Country': 'United States'}, 'JST': {'Name': 'John Murtha Johnstown Cambria County Airport', 'City': 'Johnstown', 'Country': 'United States'}, 'LUA': {'Name': 'Lukla Airport', 'City': 'Lukla', 'Country': 'Nepal'}, 'BHP': {'Name': 'Bhojpur Airport', 'City': 'Bhojpur', 'Country': 'Nepal'}, 'LDN': {'Name': 'Lamidanda Airport', 'City': 'Lamidanda', 'Country': 'Nepal'}, 'JMO': {'Name': 'Jomsom Airport', 'City': 'Jomsom', 'Country': 'Nepal'}, 'NGX': {'Name': 'Manang Airport', 'City': 'Manang', 'Country': 'Nepal'}, 'PPL': {'Name': 'Phaplu Airport', 'City': 'Phaplu', 'Country': 'Nepal'}, 'RUM': {'Name': 'Rumjatar Airport', 'City': 'Rumjatar', 'Country': 'Nepal'}, 'DNP': {'Name': 'Tulsipur Airport', 'City': 'Dang', 'Country': 'Nepal'}, 'RUK': {'Name': 'Rukum Chaurjahari Airport', 'City': 'Rukumkot', 'Country': 'Nepal'}, 'JUM': {'Name': 'Jumla Airport', 'City': 'Jumla', 'Country': 'Nepal'}, 'TPJ': {'Name': 'Taplejung Airport', 'City': 'Taplejung', 'Country': 'Nepal'}, 'TMI': {'Name': 'Tumling Tar Airport', 'City': 'Tumling Tar', 'Country': 'Nepal'}, 'SKH': {'Name': 'Surkhet Airport', 'City': 'Surkhet', 'Country': 'Nepal'}, 'IMK': {'Name': 'Simikot Airport', 'City': 'Simikot', 'Country': 'Nepal'}, 'DOP': {'Name': 'Dolpa Airport', 'City': 'Dolpa', 'Country': 'Nepal'}, 'BJH': {'Name': 'Bajhang Airport', 'City': 'Bajhang', 'Country': 'Nepal'}, 'DHI': {'Name': 'Dhangarhi Airport', 'City': 'Dhangarhi', 'Country': 'Nepal'}, 'MWX': {'Name': 'Muan International Airport', 'City': 'Muan', 'Country': 'South Korea'}, 'JTY': {'Name': 'Astypalaia Airport', 'City': 'Astypalaia', 'Country': 'Greece'}, 'JIK': {'Name': 'Ikaria Airport', 'City': 'Ikaria', 'Country': 'Greece'}, 'JKL': {'Name': 'Kalymnos Airport', 'City': 'Kalymnos', 'Country': 'Greece'}, 'MLO': {'Name': 'Milos Airport', 'City': 'Milos', 'Country': 'Greece'}, 'JNX': {'Name': 'Naxos Airport', 'City': 'Cyclades Islands', 'Country': 'Greece'}, 'PAS': {'Name': 'Paros National Airport', 'City': 'Paros', 'Country': 'Greece'}, 'KZS': {'Name': 'Kastelorizo Airport', 'City': 'Kastelorizo', 'Country': 'Greece'}, 'RMF': {'Name': 'Marsa Alam International Airport', 'City': 'Marsa Alam', 'Country': 'Egypt'}, 'NRN': {'Name': 'Weeze Airport', 'City': 'Weeze', 'Country': 'Germany'}, 'USU': {'Name': 'Francisco B. Reyes Airport', 'City': 'Busuanga', 'Country': 'Philippines'}, 'BXU': {'Name': 'Bancasi Airport', 'City': 'Butuan', 'Country': 'Philippines'}, 'DPL': {'Name': 'Dipolog Airport', 'City': 'Dipolog', 'Country': 'Philippines'}, 'LAO': {'Name': 'Laoag International Airport', 'City': 'Laoag', 'Country': 'Philippines'}, 'LGP': {'Name': 'Legazpi City International Airport', 'City': 'Legazpi', 'Country': 'Philippines'}, 'OZC': {'Name': 'Labo Airport', 'City': 'Ozamis', 'Country': 'Philippines'}, 'CEB': {'Name': 'Mactan Cebu International Airport', 'City': 'Cebu', 'Country': 'Philippines'}, 'NOD': {'Name': 'Norden-Norddeich Airport', 'City': 'Norden', 'Country': 'Germany'}, 'JUI': {'Name': 'Juist Airport', 'City': 'Juist', 'Country': 'Germany'}, 'BPS': {'Name': 'Porto Seguro Airport', 'City': 'Porto Seguro', 'Country': 'Brazil'}, 'QIG': {'Name': 'Iguatu Airport', 'City': 'Iguatu', 'Country': 'Brazil'}, 'PMW': {'Name': 'Brigadeiro Lysias Rodrigues Airport', 'City': 'Palmas', 'Country': 'Brazil'}, 'CLV': {'Name': 'Nelson Ribeiro Guimarães Airport', 'City': 'Caldas Novas', 'Country': 'Brazil'}, 'MSO': {'Name': 'Missoula International Airport', 'City': 'Missoula', 'Country': 'United States'}, 'BKQ': {'Name': 'Blackall Airport', 'City': 'Blackall', 'Country': 'Australia'}, 'BDB': {'Name': 'Bundaberg Airport', 'City': 'Bundaberg', 'Country': 'Australia'}, 'GCN': {'Name': 'Grand Canyon National Park Airport', 'City': 'Grand Canyon', 'Country': 'United States'}, 'SGR': {'Name': 'Sugar Land Regional Airport', 'City': 'Sugar Land', 'Country': 'United States'}, 'APA': {'Name': 'Centennial Airport', 'City': 'Denver', 'Country': 'United States'}, 'CVN': {'Name': 'Clovis Municipal Airport', 'City': 'Clovis', 'Country': 'United States'}, 'FST': {'Name': 'Fort Stockton Pecos County Airport', 'City': 'Fort Stockton', 'Country': 'United States'}, 'LVS': {'Name': 'Las Vegas Municipal Airport', 'City': 'Las Vegas', 'Country': 'United States'}, 'IWS': {'Name': 'West Houston Airport', 'City': 'Houston', 'Country': 'United States'}, 'LRU': {'Name': 'Las Cruces International Airport', 'City': 'Las Cruces', 'Country': 'United States'}, 'BKD': {'Name': 'Stephens County Airport', 'City': 'Breckenridge', 'Country': 'United States'}, 'TPL': {'Name': 'Draughon Miller Central Texas Regional Airport', 'City': 'Temple', 'Country': 'United States'}, 'OZA': {'Name': 'Ozona Municipal Airport', 'City': 'Ozona', 'Country': 'United States'}, 'KDM': {'Name': 'Kaadedhdhoo Airport', 'City': 'Kaadedhdhoo', 'Country': 'Maldives'}, 'LAK': {'Name': 'Aklavik/Freddie Carmichael Airport', 'City': 'Aklavik', 'Country': 'Canada'}, 'YWJ': {'Name': 'Déline Airport', 'City': 'Deline', 'Country': 'Canada'}, 'ZFN': {'Name': 'Tulita Airport', 'City': 'Tulita', 'Country': 'Canada'}, 'YGH': {'Name': 'Fort Good Hope Airport', 'City': 'Fort Good Hope', 'Country': 'Canada'}, 'TAH': {'Name': 'Tanna Airport', 'City': 'Tanna', 'Country': 'Vanuatu'}, 'YPC': {'Name': 'Paulatuk (Nora Aliqatchialuk Ruben) Airport', 'City': 'Paulatuk', 'Country': 'Canada'}, 'SRZ': {'Name': 'El Trompillo Airport', 'City': 'Santa Cruz', 'Country': 'Bolivia'}, 'SAB': {'Name': 'Juancho E. Yrausquin Airport', 'City': 'Saba', 'Country': 'Netherlands Antilles'}, 'EGE': {'Name': 'Eagle County Regional Airport', 'City': 'Vail', 'Country': 'United States'}, 'SKN': {'Name': 'Stokmarknes Skagen Airport', 'City': 'Stokmarknes', 'Country': 'Norway'}, 'CGF': {'Name': 'Cuyahoga County Airport', 'City': 'Richmond Heights', 'Country': 'United States'}, 'MFD': {'Name': 'Mansfield Lahm Regional Airport', 'City': 'Mansfield', 'Country': 'United States'}, 'CSG': {'Name': 'Columbus Metropolitan Airport', 'City': 'Columbus', 'Country': 'United States'}, 'LAW': {'Name': 'Lawton Fort Sill Regional Airport', 'City': 'Lawton', 'Country': 'United States'}, 'FNL': {'Name': 'Northern Colorado Regional Airport', 'City': 'Fort Collins', 'Country': 'United States'}, 'FLG': {'Name': 'Flagstaff Pulliam Airport', 'City': 'Flagstaff', 'Country': 'United States'}, 'TVL': {'Name': 'Lake Tahoe Airport', 'City': 'South Lake Tahoe', 'Country': 'United States'}, 'TWF': {'Name': 'Joslin Field Magic Valley Regional Airport', 'City': 'Twin Falls', 'Country': 'United States'}, 'MVY': {'Name': "Martha's Vineyard Airport", 'City': 'Vineyard Haven MA', 'Country': 'United States'}, 'CON': {'Name': 'Concord Municipal Airport', 'City': 'Concord NH', 'Country': 'United States'}, 'GON': {'Name': 'Groton New London Airport', 'City': 'Groton CT', 'Country': 'United States'}, 'STC': {'Name': 'St Cloud Regional Airport', 'City': 'Saint Cloud', 'Country': 'United States'}, 'BPE': {'Name': 'Qinhuangdao Beidaihe Airport', 'City': 'Bagan', 'Country': 'Burma'}, 'GTR': {'Name': 'Golden Triangle Regional Airport', 'City': 'Columbus Mississippi', 'Country': 'United States'}, 'GOJ': {'Name': 'Nizhny Novgorod Strigino International Airport', 'City': 'Nizhniy Novgorod', 'Country': 'Russia'}, 'HQM': {'Name': 'Bowerman Airport', 'City': 'Hoquiam', 'Country': 'United States'}, 'ERI': {'Name': 'Erie International Tom Ridge Field', 'City': 'Erie', 'Country': 'United States'}, 'HYA': {'Name': 'Barnstable Municipal Boardman Polando Field', 'City': 'Barnstable', 'Country': 'United States'}, 'SPR': {'Name': 'San Pedro Airport', 'City': 'San Pedro', 'Country': 'Belize'}, 'SDX': {'Name': 'Sedona Airport', 'City': 'Sedona', 'Country': 'United States'}, 'MGW': {'Name': 'Morgantown Municipal Walter L. Bill Hart Field', 'City': 'Morgantown', 'Country': 'United States'}, 'CRW': {'Name': 'Yeager Airport', 'City': 'Charleston', 'Country': 'United States'}, 'AVP': {'Name': 'Wilkes Barre Scranton International Airport', 'City': 'Scranton', 'Country': 'United States'}, 'BJI': {'Name': 'Bemidji Regional Airport', 'City': 'Bemidji', 'Country': 'United States'}, 'THG': {'Name': 'Thangool Airport', 'City': 'Biloela', 'Country': 'Australia'}, 'FGI': {'Name': "Fagali'i Airport", 'City': 'Apia', 'Country': 'Samoa'}, 'BNK': {'Name': 'Ballina Byron Gateway Airport', 'City': 'Ballina Byron Bay', 'Country': 'Australia'}, 'FAR': {'Name': 'Hector International Airport', 'City': 'Fargo', 'Country': 'United States'}, 'MKC': {'Name': 'Charles B. Wheeler Downtown Airport', 'City': 'Kansas City', 'Country': 'United States'}, 'RBE': {'Name': 'Ratanakiri Airport', 'City': 'Ratanakiri', 'Country': 'Cambodia'}, 'GCC': {'Name': 'Gillette Campbell County Airport', 'City': 'Gillette', 'Country': 'United States'}, 'TOF': {'Name': 'Bogashevo Airport', 'City': 'Tomsk', 'Country': 'Russia'}, 'NZJ': {'Name': 'El Toro Marine Corps Air Station', 'City': 'Santa Ana', 'Country': 'United States'}, 'PHY': {'Name': 'Phetchabun Airport', 'City': 'Phetchabun', 'Country': 'Thailand'}, 'CJM': {'Name': 'Chumphon Airport', 'City': 'Chumphon', 'Country': 'Thailand'}, 'JZH': {'Name': 'Jiuzhai Huanglong Airport', 'City': 'Jiuzhaigou', 'Country': 'China'}, 'SWA': {'Name': 'Jieyang Chaoshan International Airport', 'City': 'Shantou', 'Country': 'China'}, 'GEO': {'Name': 'Cheddi Jagan International Airport', 'City': 'Georgetown', 'Country': 'Guyana'}, 'AGT': {'Name': 'Guarani International Airport', 'City': 'Ciudad del Este', 'Country': 'Paraguay'}, 'OGL': {'Name': 'Eugene F. Correira International Airport', 'City': 'Georgetown', 'Country': 'Guyana'}, 'KAI': {'Name': 'Kaieteur International Airport', 'City': 'Kaieteur', 'Country': 'Guyana'}, 'DNH': {'Name': 'Dunhuang Airport', 'City': 'Dunhuang', 'Country': 'China'}, 'AOI': {'Name': 'Ancona Falconara Airport', 'City': 'Ancona', 'Country': 'Italy'}, 'TCP': {'Name': 'Taba International Airport', 'City': 'Taba', 'Country': 'Egypt'}, 'LYB': {'Name': 'Edward Bodden Airfield', 'City': 'Little Cayman', 'Country': 'Cayman Islands'}, 'BJV': {'Name': 'Milas Bodrum International Airport', 'City': 'Bodrum', 'Country': 'Turkey'}, 'TBJ': {'Name': 'Tabarka 7 Novembre Airport', 'City': 'Tabarka', 'Country': 'Tunisia'}, 'SAW': {'Name': 'Sabiha Gökçen International Airport', 'City': 'Istanbul', 'Country': 'Turkey'}, 'SCE': {'Name': 'University Park Airport', 'City': 'State College Pennsylvania', 'Country': 'United States'}, 'BME': {'Name': 'Broome International Airport', 'City': 'Broome', 'Country': 'Australia'}, 'NTL': {'Name': 'Newcastle Airport', 'City': 'Newcastle', 'Country': 'Australia'}, 'KLU': {'Name': 'Klagenfurt Airport', 'City': 'Klagenfurt', 'Country': 'Austria'}, 'HFT': {'Name': 'Hammerfest Airport', 'City': 'Hammerfest', 'Country': 'Norway'}, 'HVG': {'Name': 'Valan Airport', 'City': 'Honningsvag', 'Country': 'Norway'}, 'MEH': {'Name': 'Mehamn Airport', 'City': 'Mehamn', 'Country': 'Norway'}, 'VDS': {'Name': 'Vadsø Airport', 'City': 'Vadsø', 'Country': 'Norway'}, 'IKA': {'Name': 'Imam Khomeini International Airport', 'City': 'Tehran', 'Country': 'Iran'}, 'MHD': {'Name': 'Mashhad International Airport', 'City': 'Mashhad', 'Country': 'Iran'}, 'UIK': {'Name': 'Ust-Ilimsk Airport', 'City': 'Ust Ilimsk', 'Country': 'Russia'}, 'MEI': {'Name': 'Key Field', 'City': 'Meridian', 'Country': 'United States'}, 'SPI': {'Name': 'Abraham Lincoln Capital Airport', 'City': 'Springfield', 'Country': 'United States'}, 'CEZ': {'Name': 'Cortez Municipal Airport', 'City': 'Cortez', 'Country': 'United States'}, 'HDN': {'Name': 'Yampa Valley Airport', 'City': 'Hayden', 'Country': 'United States'}, 'GUP': {'Name': 'Gallup Municipal Airport', 'City': 'Gallup', 'Country': 'United States'}, 'LBL': {'Name': 'Liberal Mid-America Regional Airport', 'City': 'Liberal', 'Country': 'United States'}, 'LAA': {'Name': 'Lamar Municipal Airport', 'City': 'Lamar', 'Country': 'United States'}, 'GLD': {'Name': 'Renner Field-Goodland Municipal Airport', 'City': 'Goodland', 'Country': 'United States'}, 'COD': {'Name': 'Yellowstone Regional Airport', 'City': 'Cody', 'Country': 'United States'}, 'HOV': {'Name': 'Ørsta-Volda Airport, Hovden', 'City': 'Orsta-Volda', 'Country': 'Norway'}, 'ISC': {'Name': "St. Mary's Airport", 'City': "ST MARY\\'S", 'Country': 'United Kingdom'}, 'SGF': {'Name': 'Springfield Branson National Airport', 'City': 'Springfield', 'Country': 'United States'}, 'NVK': {'Name': 'Narvik Framnes Airport', 'City': 'Narvik', 'Country': 'Norway'}, 'BVG': {'Name': 'Berlevåg Airport', 'City': 'Berlevag', 'Country': 'Norway'}, 'FBU': {'Name': 'Oslo, Fornebu Airport', 'City': 'Oslo', 'Country': 'Norway'}, 'NSK': {'Name': 'Norilsk-Alykel Airport', 'City': 'Norilsk', 'Country': 'Russia'}, 'AAQ': {'Name': 'Anapa Vityazevo Airport', 'City': 'Anapa', 'Country': 'Russia'}, 'JLN': {'Name': 'Joplin Regional Airport', 'City': 'Joplin', 'Country': 'United States'}, 'ABE': {'Name': 'Lehigh Valley International Airport', 'City': 'Allentown', 'Country': 'United States'}, 'XNA': {'Name': 'Northwest Arkansas Regional Airport', 'City': 'Bentonville', 'Country': 'United States'}, 'GUW': {'Name': 'Atyrau Airport', 'City': 'Atyrau', 'Country': 'Kazakhstan'}, 'KZO': {'Name': 'Kzyl-Orda Southwest Airport', 'City': 'Kzyl-Orda', 'Country': 'Kazakhstan'}, 'SBN': {'Name': 'South Bend Regional Airport', 'City': 'South Bend', 'Country': 'United States'}, 'BKA': {'Name': 'Bykovo Airport', 'City': 'Moscow', 'Country': 'Russia'}, 'ARH': {'Name': 'Talagi Airport', 'City': 'Arkhangelsk', 'Country': 'Russia'}, 'RTW': {'Name': 'Saratov Central Airport', 'City': 'Saratov', 'Country': 'Russia'}, 'NUX': {'Name': 'Novy Urengoy Airport', 'City': 'Novy Urengoy', 'Country': 'Russia'}, 'NOJ': {'Name': 'Noyabrsk Airport', 'City': 'Noyabrsk', 'Country': 'Russia'}, 'SCO': {'Name': 'Aktau Airport', 'City': 'Aktau', 'Country': 'Kazakhstan'}, 'UCT': {'Name': 'Ukhta Airport', 'City': 'Ukhta', 'Country': 'Russia'}, 'USK': {'Name': 'Usinsk Airport', 'City': 'Usinsk', 'Country': 'Russia'}, 'PEX': {'Name': 'Pechora Airport', 'City': 'Pechora', 'Country': 'Russia'}, 'NNM': {'Name': 'Naryan Mar Airport', 'City': 'Naryan-Mar', 'Country': 'Russia'}, 'PKV': {'Name': 'Pskov Airport', 'City': 'Pskov', 'Country': 'Russia'}, 'KGP': {'Name': 'Kogalym International Airport', 'City': 'Kogalym', 'Country': 'Russia'}, 'KJA': {'Name': 'Yemelyanovo Airport', 'City': 'Krasnoyarsk', 'Country': 'Russia'}, 'KGF': {'Name': 'Sary-Arka Airport', 'City': 'Karaganda', 'Country': 'Kazakhstan'}, 'URJ': {'Name': 'Uray Airport', 'City': 'Uraj', 'Country': 'Russia'}, 'IWA': {'Name': 'Ivanovo South Airport', 'City': 'Ivanovo', 'Country': 'Russia'}, 'CGQ': {'Name': 'Longjia Airport', 'City': 'Changchun', 'Country': 'China'}, 'KIJ': {'Name': 'Niigata Airport', 'City': 'Niigata', 'Country': 'Japan'}, 'JON': {'Name': 'Johnston Atoll Airport', 'City': 'Johnston Island', 'Country': 'Johnston Atoll'}, 'SMD': {'Name': 'Smith Field', 'City': 'Fort Wayne IN', 'Country': 'United States'}, 'ACV': {'Name': 'California Redwood Coast-Humboldt County Airport', 'City': 'Arcata CA', 'Country': 'United States'}, 'OAJ': {'Name': 'Albert J Ellis Airport', 'City': 'Jacksonville NC', 'Country': 'United States'}, 'TCL': {'Name': 'Tuscaloosa Regional Airport', 'City': 'Tuscaloosa AL', 'Country': 'United States'}, 'DBQ': {'Name': 'Dubuque Regional Airport', 'City': 'Dubuque IA', 'Country': 'United States'}, 'HHP': {'Name': 'Shun Tak Heliport', 'City': 'Hong Kong', 'Country': 'Hong Kong'}, 'ATD': {'Name': 'Uru Harbour Airport', 'City': 'Atoifi', 'Country': 'Solomon Islands'}, 'AKS': {'Name': "Gwaunaru'u Airport", 'City': 'Auki', 'Country': 'Solomon Islands'}, 'BAS': {'Name': 'Ballalae Airport', 'City': 'Ballalae', 'Country': 'Solomon Islands'}, 'FRE': {'Name': 'Fera/Maringe Airport', 'City': 'Fera Island', 'Country': 'Solomon Islands'}, 'MBU': {'Name': 'Babanakira Airport', 'City': 'Mbambanakira', 'Country': 'Solomon Islands'}, 'IRA': {'Name': 'Ngorangora Airport', 'City': 'Kirakira', 'Country': 'Solomon Islands'}, 'SCZ': {'Name': 'Santa Cruz/Graciosa Bay/Luova Airport', 'City': 'Santa Cruz/Graciosa Bay/Luova', 'Country': 'Solomon Islands'}, 'MUA': {'Name': 'Munda Airport', 'City': 'Munda', 'Country': 'Solomon Islands'}, 'GZO': {'Name': 'Nusatupe Airport', 'City': 'Gizo', 'Country': 'Solomon Islands'}, 'MNY': {'Name': 'Mono Airport', 'City': 'Stirling Island', 'Country': 'Solomon Islands'}, 'RNL': {'Name': 'Rennell/Tingoa Airport', 'City': 'Rennell Island', 'Country': 'Solomon Islands'}, 'RUS': {'Name': 'Marau Airport', 'City': 'Marau', 'Country': 'Solomon Islands'}, 'VAO': {'Name': 'Suavanao Airport', 'City': 'Suavanao', 'Country': 'Solomon Islands'}, 'KGE': {'Name': 'Kaghau Airport', 'City': 'Kagau Island', 'Country': 'Solomon Islands'}, 'RBV': {'Name': 'Ramata Airport', 'City': 'Ramata', 'Country': 'Solomon Islands'}, 'BUA': {'Name': 'Buka Airport', 'City': 'Buka Island', 'Country': 'Papua New Guinea'}, 'CMU': {'Name': 'Chimbu Airport', 'City': 'Kundiawa', 'Country': 'Papua New Guinea'}, 'DAU': {'Name': 'Daru Airport', 'City': 'Daru', 'Country': 'Papua New Guinea'}, 'GUR': {'Name': 'Gurney Airport', 'City': 'Gurney', 'Country': 'Papua New Guinea'}, 'PNP': {'Name': 'Girua Airport', 'City': 'Girua', 'Country': 'Papua New Guinea'}, 'HKN': {'Name': 'Kimbe Airport', 'City': 'Hoskins', 'Country': 'Papua New Guinea'}, 'UNG': {'Name': 'Kiunga Airport', 'City': 'Kiunga', 'Country': 'Papua New Guinea'}, 'KRI': {'Name': 'Kikori Airport', 'City': 'Kikori', 'Country': 'Papua New Guinea'}, 'KMA': {'Name': 'Kerema Airport', 'City': 'Kerema', 'Country': 'Papua New Guinea'}, 'KVG': {'Name': 'Kavieng Airport', 'City': 'Kavieng', 'Country': 'Papua New Guinea'}, 'MDU': {'Name': 'Mendi Airport', 'City': 'Mendi', 'Country': 'Papua New Guinea'}, 'MAS': {'Name': 'Momote Airport', 'City': 'Momote', 'Country': 'Papua New Guinea'}, 'MXH': {'Name': 'Moro Airport', 'City': 'Moro', 'Country': 'Papua New Guinea'}, 'MIS': {'Name': 'Misima Island Airport', 'City': 'Misima Island', 'Country': 'Papua New Guinea'}, 'TIZ': {'Name': 'Tari Airport', 'City': 'Tari', 'Country': 'Papua New Guinea'}, 'TBG': {'Name': 'Tabubil Airport', 'City': 'Tabubil', 'Country': 'Papua New Guinea'}, 'RAB': {'Name': 'Tokua Airport', 'City': 'Tokua', 'Country': 'Papua New Guinea'}, 'VAI': {'Name': 'Vanimo Airport', 'City': 'Vanimo', 'Country': 'Papua New Guinea'}, 'WBM': {'Name': 'Wapenamanda Airport', 'City': 'Wapenamanda', 'Country': 'Papua New Guinea'}, 'LLU': {'Name': 'Alluitsup Paa Heliport', 'City': 'Alluitsup Paa', 'Country': 'Greenland'}, 'CNP': {'Name': 'Neerlerit Inaat Airport', 'City': 'Neerlerit Inaat', 'Country': 'Greenland'}, 'JFR': {'Name': 'Paamiut Heliport', 'City': 'Paamiut', 'Country': 'Greenland'}, 'JGO': {'Name': 'Qeqertarsuaq Heliport', 'City': 'Qeqertarsuaq Airport', 'Country': 'Greenland'}, 'JJU': {'Name': 'Qaqortoq Heliport', 'City': 'Qaqortoq', 'Country': 'Greenland'}, 'JSU': {'Name': 'Maniitsoq Airport', 'City': 'Maniitsoq', 'Country': 'Greenland'}, 'JNN': {'Name': 'Nanortalik Heliport', 'City': 'Nanortalik', 'Country': 'Greenland'}, 'JNS': {'Name': 'Narsaq Heliport', 'City': 'Narsaq', 'Country': 'Greenland'}, 'NAQ': {'Name': 'Qaanaaq Airport', 'City': 'Qaanaaq', 'Country': 'Greenland'}, 'JHS': {'Name': 'Sisimiut Airport', 'City': 'Sisimiut', 'Country': 'Greenland'}, 'JUV': {'Name': 'Upernavik Airport', 'City': 'Upernavik', 'Country': 'Greenland'}, 'JQA': {'Name': 'Qaarsut Airport', 'City': 'Uummannaq', 'Country': 'Greenland'}, 'GRY': {'Name': 'Grímsey Airport', 'City': 'Grímsey', 'Country': 'Iceland'}, 'THO': {'Name': 'Thorshofn Airport', 'City': 'Thorshofn', 'Country': 'Iceland'}, 'VPN': {'Name': 'Vopnafjörður Airport', 'City': 'Vopnafjörður', 'Country': 'Iceland'}, 'YWS': {'Name': 'Whistler/Green Lake Water Aerodrome', 'City': 'Whistler', 'Country': 'Canada'}, 'YAA': {'Name': 'Anahim Lake Airport', 'City': 'Anahim Lake', 'Country': 'Canada'}, 'YWM': {'Name': 'Williams Harbour Airport', 'City': 'Williams Harbour', 'Country': 'Canada'}, 'YFX': {'Name': 'St. Lewis (Fox Harbour) Airport', 'City': 'St. Lewis', 'Country': 'Canada'}, 'YHA': {'Name': 'Port Hope Simpson Airport', 'City': 'Port Hope Simpson', 'Country': 'Canada'}, 'YRG': {'Name': 'Rigolet Airport', 'City': 'Rigolet', 'Country': 'Canada'}, 'YCK': {'Name': 'Colville Lake Airport', 'City': 'Colville Lake', 'Country': 'Canada'}, 'YLE': {'Name': 'Whatì Airport', 'City': 'Whatì', 'Country': 'Canada'}, 'SUR': {'Name': 'Summer Beaver Airport', 'City': 'Summer Beaver', 'Country': 'Canada'}, 'YAX': {'Name': 'Wapekeka Airport', 'City': 'Angling Lake', 'Country': 'Canada'}, 'WNN': {'Name': 'Wunnumin Lake Airport', 'City': 'Wunnumin Lake', 'Country': 'Canada'}, 'YNO': {'Name': 'North Spirit Lake Airport', 'City': 'North Spirit Lake', 'Country': 'Canada'}, 'XBE': {'Name': 'Bearskin Lake Airport', 'City': 'Bearskin Lake', 'Country': 'Canada'}, 'KIF': {'Name': 'Kingfisher Lake Airport', 'City': 'Kingfisher Lake', 'Country': 'Canada'}, 'YOG': {'Name': 'Ogoki Post Airport', 'City': 'Ogoki Post', 'Country': 'Canada'}, 'YHP': {'Name': 'Poplar Hill Airport', 'City': 'Poplar Hill', 'Country': 'Canada'}, 'YKU': {'Name': 'Chisasibi Airport', 'City': 'Chisasibi', 'Country': 'Canada'}, 'ZTB': {'Name': 'Tête-à-la-Baleine Airport', 'City': 'Tête-à-la-Baleine', 'Country': 'Canada'}, 'ZLT': {'Name': 'La Tabatière Airport', 'City': 'La Tabatière', 'Country': 'Canada'}, 'YAC': {'Name': 'Cat Lake Airport', 'City': 'Cat Lake', 'Country': 'Canada'}, 'YAG': {'Name': 'Fort Frances Municipal Airport', 'City': 'Fort Frances', 'Country': 'Canada'}, 'XKS': {'Name': 'Kasabonika Airport', 'City': 'Kasabonika', 'Country': 'Canada'}, 'YKG': {'Name': 'Kangirsuk Airport', 'City': 'Kangirsuk', 'Country': 'Canada'}, 'YAT': {'Name': 'Attawapiskat Airport', 'City': 'Attawapiskat', 'Country': 'Canada'}, 'YBE': {'Name': 'Uranium City Airport', 'City': 'Uranium City', 'Country': 'Canada'}, 'YBX': {'Name': 'Lourdes de Blanc Sablon Airport', 'City': 'Lourdes-De-Blanc-Sablon', 'Country': 'Canada'}, 'YRF': {'Name': 'Cartwright Airport', 'City': 'Cartwright', 'Country': 'Canada'}, 'YCS': {'Name': 'Chesterfield Inlet Airport', 'City': 'Chesterfield Inlet', 'Country': 'Canada'}, 'YDP': {'Name': 'Nain Airport', 'City': 'Nain', 'Country': 'Canada'}, 'YER': {'Name': 'Fort Severn Airport', 'City': 'Fort Severn', 'Country': 'Canada'}, 'YFA': {'Name': 'Fort Albany Airport', 'City': 'Fort Albany', 'Country': 'Canada'}, 'YFH': {'Name': 'Fort Hope Airport', 'City': 'Fort Hope', 'Country': 'Canada'}, 'YMN': {'Name': 'Makkovik Airport', 'City': 'Makkovik', 'Country': 'Canada'}, 'YGB': {'Name': 'Texada Gillies Bay Airport', 'City': 'Texada', 'Country': 'Canada'}, 'YGO': {'Name': 'Gods Lake Narrows Airport', 'City': 'Gods Lake Narrows', 'Country': 'Canada'}, 'YGT': {'Name': 'Igloolik Airport', 'City': 'Igloolik', 'Country': 'Canada'}, 'YGW': {'Name': 'Kuujjuarapik Airport', 'City': 'Kuujjuarapik', 'Country': 'Canada'}, 'YGX': {'Name': 'Gillam Airport', 'City': 'Gillam', 'Country': 'Canada'}, 'YGZ': {'Name': 'Grise Fiord Airport', 'City': 'Grise Fiord', 'Country': 'Canada'}, 'YQC': {'Name': 'Quaqtaq Airport', 'City': 'Quaqtaq', 'Country': 'Canada'}, 'CXH': {'Name': 'Vancouver Harbour Water Aerodrome', 'City': 'Vancouver', 'Country': 'Canada'}, 'YNS': {'Name': 'Nemiscau Airport', 'City': 'Nemiscau', 'Country': 'Canada'}, 'YHO': {'Name': 'Hopedale Airport', 'City': 'Hopedale', 'Country': 'Canada'}, 'YHR': {'Name': 'Chevery Airport', 'City': 'Chevery', 'Country': 'Canada'}, 'YIK': {'Name': 'Ivujivik Airport', 'City': 'Ivujivik', 'Country': 'Canada'}, 'YIV': {'Name': 'Island Lake Airport', 'City': 'Island Lake', 'Country': 'Canada'}, 'AKV': {'Name': 'Akulivik Airport', 'City': 'Akulivik', 'Country': 'Canada'}, 'YKQ': {'Name': 'Waskaganish Airport', 'City': 'Waskaganish', 'Country': 'Canada'}, 'YPJ': {'Name': 'Aupaluk Airport', 'City': 'Aupaluk', 'Country': 'Canada'}, 'YLC': {'Name': 'Kimmirut Airport', 'City': 'Kimmirut', 'Country': 'Canada'}, 'YLH': {'Name': 'Lansdowne House Airport', 'City': 'Lansdowne House', 'Country': 'Canada'}, 'XGR': {'Name': 'Kangiqsualujjuaq (Georges River) Airport', 'City': 'Kangiqsualujjuaq', 'Country': 'Canada'}, 'YMH': {'Name': "Mary's Harbour Airport", 'City': "Mary's Harbour", 'Country': 'Canada'}, 'YMT': {'Name': 'Chapais Airport', 'City': 'Chibougamau', 'Country': 'Canada'}, 'YUD': {'Name': 'Umiujaq Airport', 'City': 'Umiujaq', 'Country': 'Canada'}, 'YNC': {'Name': 'Wemindji Airport', 'City': 'Wemindji', 'Country': 'Canada'}, 'YNE': {'Name': 'Norway House Airport', 'City': 'Norway House', 'Country': 'Canada'}, 'YNL': {'Name': 'Points North Landing Airport', 'City': 'Points North Landing', 'Country': 'Canada'}, 'YOH': {'Name': 'Oxford House Airport', 'City': 'Oxford House', 'Country': 'Canada'}, 'YPH': {'Name': 'Inukjuak Airport', 'City': 'Inukjuak', 'Country': 'Canada'}, 'YPM': {'Name': 'Pikangikum Airport', 'City': 'Pikangikum', 'Country': 'Canada'}, 'YPO': {'Name': 'Peawanuck Airport', 'City': 'Peawanuck', 'Country': 'Canada'}, 'YPW': {'Name': 'Powell River Airport', 'City': 'Powell River', 'Country': 'Canada'}, 'YQD': {'Name': 'The Pas Airport', 'City': 'The Pas', 'Country': 'Canada'}, 'YQN': {'Name': 'Nakina Airport', 'City': 'Nakina', 'Country': 'Canada'}, 'YRA': {'Name': 'Rae Lakes Airport', 'City': 'Gamètì', 'Country': 'Canada'}, 'YRL': {'Name': 'Red Lake Airport', 'City': 'Red Lake', 'Country': 'Canada'}, 'YSF': {'Name': 'Stony Rapids Airport', 'City': 'Stony Rapids', 'Country': 'Canada'}, 'YSK': {'Name': 'Sanikiluaq Airport', 'City': 'Sanikiluaq', 'Country': 'Canada'}, 'YST': {'Name': 'St. Theresa Point Airport', 'City': 'St. Theresa Point', 'Country': 'Canada'}, 'YTL': {'Name': 'Big Trout Lake Airport', 'City': 'Big Trout Lake', 'Country': 'Canada'}, 'YVZ': {'Name': 'Deer Lake Airport', 'City': 'Deer Lake', 'Country': 'Canada'}, 'YWP': {'Name': 'Webequie Airport', 'City': 'Webequie', 'Country': 'Canada'}, 'YXN': {'Name': 'Whale Cove Airport', 'City': 'Whale Cove', 'Country': 'Canada'}, 'YZG': {'Name': 'Salluit Airport', 'City': 'Salluit', 'Country': 'Canada'}, 'ZAC': {'Name': 'York Landing Airport', 'City': 'York Landing', 'Country': 'Canada'}, 'ILF': {'Name': 'Ilford Airport', 'City': 'Ilford', 'Country': 'Canada'}, 'ZBF': {'Name': 'Bathurst Airport', 'City': 'Bathurst', 'Country': 'Canada'}, 'ZEM': {'Name': 'Eastmain River Airport', 'City': 'Eastmain River', 'Country': 'Canada'}, 'ZFD': {'Name': 'Fond-Du-Lac Airport', 'City': 'Fond-Du-Lac', 'Country': 'Canada'}, 'ZGI': {'Name': 'Gods River Airport', 'City': 'Gods River', 'Country': 'Canada'}, 'ZJN': {'Name': 'Swan River Airport', 'City': 'Swan River', 'Country': 'Canada'}, 'ZKE': {'Name': 'Kashechewan Airport', 'City': 'Kashechewan', 'Country': 'Canada'}, 'MSA': {'Name': 'Muskrat Dam Airport', 'City': 'Muskrat Dam', 'Country': 'Canada'}, 'ZMT': {'Name': 'Masset Airport', 'City': 'Masset', 'Country': 'Canada'}, 'ZPB': {'Name': 'Sachigo Lake Airport', 'City': 'Sachigo Lake', 'Country': 'Canada'}, 'ZRJ': {'Name': 'Round Lake (Weagamow Lake) Airport', 'City': 'Round Lake', 'Country': 'Canada'}, 'ZSJ': {'Name': 'Sandy Lake Airport', 'City': 'Sandy Lake', 'Country': 'Canada'}, 'ZTM': {'Name': 'Shamattawa Airport', 'City': 'Shamattawa', 'Country': 'Canada'}, 'ZUM': {'Name': 'Churchill Falls Airport', 'City': 'Churchill Falls', 'Country': 'Canada'}, 'ZWL': {'Name': 'Wollaston Lake Airport', 'City': 'Wollaston Lake', 'Country': 'Canada'}, 'BLJ': {'Name': 'Batna Airport', 'City': 'Batna', 'Country': 'Algeria'}, 'CBH': {'Name': 'Béchar Boudghene Ben Ali Lotfi Airport', 'City': 'Béchar', 'Country': 'Algeria'}, 'BMW': {'Name': 'Bordj Badji Mokhtar Airport', 'City': 'Bordj Badji Mokhtar', 'Country': 'Algeria'}, 'ELU': {'Name': 'Guemar Airport', 'City': 'Guemar', 'Country': 'Algeria'}, 'KMS': {'Name': 'Kumasi Airport', 'City': 'Kumasi', 'Country': 'Ghana'}, 'HDF': {'Name': 'Heringsdorf Airport', 'City': 'Heringsdorf', 'Country': 'Germany'}, 'HEI': {'Name': 'Heide-Büsum Airport', 'City': 'Büsum', 'Country': 'Germany'}, 'HGL': {'Name': 'Helgoland-Düne Airport', 'City': 'Helgoland', 'Country': 'Germany'}, 'SJY': {'Name': 'Seinäjoki Airport', 'City': 'Seinäjoki / Ilmajoki', 'Country': 'Finland'}, 'NQT': {'Name': 'Nottingham Airport', 'City': 'Nottingham', 'Country': 'United Kingdom'}, 'DSA': {'Name': 'Robin Hood Doncaster Sheffield Airport', 'City': 'Doncaster, Sheffield', 'Country': 'United Kingdom'}, 'CAL': {'Name': 'Campbeltown Airport', 'City': 'Campbeltown', 'Country': 'United Kingdom'}, 'EOI': {'Name': 'Eday Airport', 'City': 'Eday', 'Country': 'United Kingdom'}, 'FIE': {'Name': 'Fair Isle Airport', 'City': 'Fair Isle', 'Country': 'United Kingdom'}, 'NRL': {'Name': 'North Ronaldsay Airport', 'City': 'North Ronaldsay', 'Country': 'United Kingdom'}, 'PPW': {'Name': 'Papa Westray Airport', 'City': 'Papa Westray', 'Country': 'United Kingdom'}, 'SOY': {'Name': 'Stronsay Airport', 'City': 'Stronsay', 'Country': 'United Kingdom'}, 'NDY': {'Name': 'Sanday Airport', 'City': 'Sanday', 'Country': 'United Kingdom'}, 'LWK': {'Name': 'Lerwick / Tingwall Airport', 'City': 'Lerwick', 'Country': 'United Kingdom'}, 'WRY': {'Name': 'Westray Airport', 'City': 'Westray', 'Country': 'United Kingdom'}, 'LEQ': {'Name': "Land's End Airport", 'City': "Land's End", 'Country': 'United Kingdom'}, 'PZE': {'Name': 'Penzance Heliport', 'City': 'Penzance', 'Country': 'United Kingdom'}, 'VLY': {'Name': 'Anglesey Airport', 'City': 'Angelsey', 'Country': 'United Kingdom'}, 'BRR': {'Name': 'Barra Airport', 'City': 'Barra', 'Country': 'United Kingdom'}, 'CFN': {'Name': 'Donegal Airport', 'City': 'Dongloe', 'Country': 'Ireland'}, 'CNL': {'Name': 'Sindal Airport', 'City': 'Sindal', 'Country': 'Denmark'}, 'LKN': {'Name': 'Leknes Airport', 'City': 'Leknes', 'Country': 'Norway'}, 'OSY': {'Name': 'Namsos Høknesøra Airport', 'City': 'Namsos', 'Country': 'Norway'}, 'MQN': {'Name': 'Mo i Rana Airport, Røssvoll', 'City': 'Mo i Rana', 'Country': 'Norway'}, 'RVK': {'Name': 'Rørvik Airport, Ryum', 'City': 'Rørvik', 'Country': 'Norway'}, 'RET': {'Name': 'Røst Airport', 'City': 'Røst', 'Country': 'Norway'}, 'SDN': {'Name': 'Sandane Airport (Anda)', 'City': 'Sandane', 'Country': 'Norway'}, 'SOG': {'Name': 'Sogndal Airport', 'City': 'Sogndal', 'Country': 'Norway'}, 'SVJ': {'Name': 'Svolvær Helle Airport', 'City': 'Svolvær', 'Country': 'Norway'}, 'SOJ': {'Name': 'Sørkjosen Airport', 'City': 'Sorkjosen', 'Country': 'Norway'}, 'VAW': {'Name': 'Vardø Airport, Svartnes', 'City': 'Vardø', 'Country': 'Norway'}, 'VRY': {'Name': 'Værøy Heliport', 'City': 'Værøy', 'Country': 'Norway'}, 'BZG': {'Name': 'Bydgoszcz Ignacy Jan Paderewski Airport', 'City': 'Bydgoszcz', 'Country': 'Poland'}, 'LCJ': {'Name': 'Łódź Władysław Reymont Airport', 'City': 'Lodz', 'Country': 'Poland'}, 'OSD': {'Name': 'Åre Östersund Airport', 'City': 'Östersund', 'Country': 'Sweden'}, 'HFS': {'Name': 'Hagfors Airport', 'City': 'Hagfors', 'Country': 'Sweden'}, 'KSD': {'Name': 'Karlstad Airport', 'City': 'Karlstad', 'Country': 'Sweden'}, 'TYF': {'Name': 'Torsby Airport', 'City': 'Torsby', 'Country': 'Sweden'}, 'AGH': {'Name': 'Ängelholm-Helsingborg Airport', 'City': 'Ängelholm', 'Country': 'Sweden'}, 'SQO': {'Name': 'Storuman Airport', 'City': 'Mohed', 'Country': 'Sweden'}, 'HMV': {'Name': 'Hemavan Airport', 'City': 'Hemavan', 'Country': 'Sweden'}, 'VNT': {'Name': 'Ventspils International Airport', 'City': 'Ventspils', 'Country': 'Latvia'}, 'QRA': {'Name': 'Rand Airport', 'City': 'Johannesburg', 'Country': 'South Africa'}, 'MQP': {'Name': 'Kruger Mpumalanga International Airport', 'City': 'Mpumalanga', 'Country': 'South Africa'}, 'AAM': {'Name': 'Malamala Airport', 'City': 'Malamala', 'Country': 'South Africa'}, 'MBD': {'Name': 'Mmabatho International Airport', 'City': 'Mafeking', 'Country': 'South Africa'}, 'GNZ': {'Name': 'Ghanzi Airport', 'City': 'Ghanzi', 'Country': 'Botswana'}, 'ORP': {'Name': 'Orapa Airport', 'City': 'Orapa', 'Country': 'Botswana'}, 'SWX': {'Name': 'Shakawe Airport', 'City': 'Shakawe', 'Country': 'Botswana'}, 'TLD': {'Name': 'Limpopo Valley Airport', 'City': 'Tuli Lodge', 'Country': 'Botswana'}, 'DIS': {'Name': 'Ngot Nzoungou Airport', 'City': 'Loubomo', 'Country': 'Congo (Brazzaville)'}, 'CIP': {'Name': 'Chipata Airport', 'City': 'Chipata', 'Country': 'Zambia'}, 'YVA': {'Name': 'Iconi Airport', 'City': 'Moroni', 'Country': 'Comoros'}, 'WAQ': {'Name': 'Antsalova Airport', 'City': 'Antsalova', 'Country': 'Madagascar'}, 'JVA': {'Name': 'Ankavandra Airport', 'City': 'Ankavandra', 'Country': 'Madagascar'}, 'BMD': {'Name': 'Belo sur Tsiribihina Airport', 'City': 'Belo sur Tsiribihina', 'Country': 'Madagascar'}, 'MXT': {'Name': 'Maintirano Airport', 'City': 'Maintirano', 'Country': 'Madagascar'}, 'TVA': {'Name': 'Morafenobe Airport', 'City': 'Morafenobe', 'Country': 'Madagascar'}, 'WTA': {'Name': 'Tambohorano Airport', 'City': 'Tambohorano', 'Country': 'Madagascar'}, 'WTS': {'Name': 'Tsiroanomandidy Airport', 'City': 'Tsiroanomandidy', 'Country': 'Madagascar'}, 'WAM': {'Name': 'Ambatondrazaka Airport', 'City': 'Ambatondrazaka', 'Country': 'Madagascar'}, 'WPB': {'Name': 'Port Bergé Airport', 'City': 'Port Bergé', 'Country': 'Madagascar'}, 'DWB': {'Name': 'Soalala Airport', 'City': 'Soalala', 'Country': 'Madagascar'}, 'WMP': {'Name': 'Mampikony Airport', 'City': 'Mampikony', 'Country': 'Madagascar'}, 'WMA': {'Name': 'Mandritsara Airport', 'City': 'Mandritsara', 'Country': 'Madagascar'}, 'MJA': {'Name': 'Manja Airport', 'City': 'Manja', 'Country': 'Madagascar'}, 'CBT': {'Name': 'Catumbela Airport', 'City': 'Catumbela', 'Country': 'Angola'}, 'DUE': {'Name': 'Dundo Airport', 'City': 'Dundo', 'Country': 'Angola'}, 'VPE': {'Name': 'Ngjiva Pereira Airport', 'City': 'Ondjiva', 'Country': 'Angola'}, 'MSZ': {'Name': 'Namibe Airport', 'City': 'Mocamedes', 'Country': 'Angola'}, 'KOU': {'Name': 'Koulamoutou Mabimbi Airport', 'City': 'Koulamoutou', 'Country': 'Gabon'}, 'MJL': {'Name': 'Mouilla Ville Airport', 'City': 'Mouila', 'Country': 'Gabon'}, 'TCH': {'Name': 'Tchibanga Airport', 'City': 'Tchibanga', 'Country': 'Gabon'}, 'VPY': {'Name': 'Chimoio Airport', 'City': 'Chimoio', 'Country': 'Mozambique'}, 'SRH': {'Name': 'Sarh Airport', 'City': 'Sarh', 'Country': 'Chad'}, 'CMK': {'Name': 'Club Makokola Airport', 'City': 'Club Makokola', 'Country': 'Malawi'}, 'LUD': {'Name': 'Luderitz Airport', 'City': 'Luderitz', 'Country': 'Namibia'}, 'OND': {'Name': 'Ondangwa Airport', 'City': 'Ondangwa', 'Country': 'Namibia'}, 'OMD': {'Name': 'Oranjemund Airport', 'City': 'Oranjemund', 'Country': 'Namibia'}, 'SWP': {'Name': 'Swakopmund Airport', 'City': 'Swakopmund', 'Country': 'Namibia'}, 'ERS': {'Name': 'Eros Airport', 'City': 'Windhoek', 'Country': 'Namibia'}, 'BOA': {'Name': 'Boma Airport', 'City': 'Boma', 'Country': 'Congo (Kinshasa)'}, 'MAT': {'Name': 'Tshimpi Airport', 'City': 'Matadi', 'Country': 'Congo (Kinshasa)'}, 'INO': {'Name': 'Inongo Airport', 'City': 'Inongo', 'Country': 'Congo (Kinshasa)'}, 'NIO': {'Name': 'Nioki Airport', 'City': 'Nioki', 'Country': 'Congo (Kinshasa)'}, 'KRZ': {'Name': 'Basango Mboliasa Airport', 'City': 'Kiri', 'Country': 'Congo (Kinshasa)'}, 'BSU': {'Name': 'Basankusu Airport', 'City': 'Basankusu', 'Country': 'Congo (Kinshasa)'}, 'TSH': {'Name': 'Tshikapa Airport', 'City': 'Tshikapa', 'Country': 'Congo (Kinshasa)'}, 'LJA': {'Name': 'Lodja Airport', 'City': 'Lodja', 'Country': 'Congo (Kinshasa)'}, 'PFR': {'Name': 'Ilebo Airport', 'City': 'Ilebo', 'Country': 'Congo (Kinshasa)'}, 'OUK': {'Name': 'Outer Skerries Airport', 'City': 'Outer Skerries', 'Country': 'United Kingdom'}, 'GMZ': {'Name': 'La Gomera Airport', 'City': 'La Gomera', 'Country': 'Spain'}, 'BTE': {'Name': 'Sherbro International Airport', 'City': 'Bonthe', 'Country': 'Sierra Leone'}, 'KBS': {'Name': 'Bo Airport', 'City': 'Bo', 'Country': 'Sierra Leone'}, 'KEN': {'Name': 'Kenema Airport', 'City': 'Kenema', 'Country': 'Sierra Leone'}, 'OXB': {'Name': 'Osvaldo Vieira International Airport', 'City': 'Bissau', 'Country': 'Guinea-Bissau'}, 'SMW': {'Name': 'Smara Airport', 'City': 'Smara', 'Country': 'Western Sahara'}, 'VIL': {'Name': 'Dakhla Airport', 'City': 'Dakhla', 'Country': 'Western Sahara'}, 'ESU': {'Name': 'Mogador Airport', 'City': 'Essadouira', 'Country': 'Morocco'}, 'EUN': {'Name': 'Hassan I Airport', 'City': 'El Aaiún', 'Country': 'Western Sahara'}, 'NDR': {'Name': 'Nador International Airport', 'City': 'El Aroui', 'Country': 'Morocco'}, 'RAI': {'Name': 'Praia International Airport', 'City': 'Praia, Santiago Island', 'Country': 'Cape Verde'}, 'SFL': {'Name': 'São Filipe Airport', 'City': 'Sao Filipe, Fogo Island', 'Country': 'Cape Verde'}, 'BCO': {'Name': 'Baco Airport', 'City': 'Baco', 'Country': 'Ethiopia'}, 'BEI': {'Name': 'Beica Airport', 'City': 'Beica', 'Country': 'Ethiopia'}, 'DSE': {'Name': 'Combolcha Airport', 'City': 'Dessie', 'Country': 'Ethiopia'}, 'DEM': {'Name': 'Dembidollo Airport', 'City': 'Dembidollo', 'Country': 'Ethiopia'}, 'GDE': {'Name': 'Gode Airport', 'City': 'Gode', 'Country': 'Ethiopia'}, 'GOR': {'Name': 'Gore Airport', 'City': 'Gore', 'Country': 'Ethiopia'}, 'ABK': {'Name': 'Kabri Dehar Airport', 'City': 'Kabri Dehar', 'Country': 'Ethiopia'}, 'MTF': {'Name': 'Mizan Teferi Airport', 'City': 'Mizan Teferi', 'Country': 'Ethiopia'}, 'TIE': {'Name': 'Tippi Airport', 'City': 'Tippi', 'Country': 'Ethiopia'}, 'ALU': {'Name': 'Alula Airport', 'City': 'Alula', 'Country': 'Somalia'}, 'BSA': {'Name': 'Bosaso Airport', 'City': 'Bosaso', 'Country': 'Somalia'}, 'MGQ': {'Name': 'Aden Adde International Airport', 'City': 'Mogadishu', 'Country': 'Somalia'}, 'GLK': {'Name': 'Galcaio Airport', 'City': 'Galcaio', 'Country': 'Somalia'}, 'BUO': {'Name': 'Burao Airport', 'City': 'Burao', 'Country': 'Somalia'}, 'AAC': {'Name': 'El Arish International Airport', 'City': 'El Arish', 'Country': 'Egypt'}, 'ATZ': {'Name': 'Assiut International Airport', 'City': 'Asyut', 'Country': 'Egypt'}, 'ASV': {'Name': 'Amboseli Airport', 'City': 'Amboseli National Park', 'Country': 'Kenya'}, 'LKG': {'Name': 'Lokichoggio Airport', 'City': 'Lokichoggio', 'Country': 'Kenya'}, 'MYD': {'Name': 'Malindi Airport', 'City': 'Malindi', 'Country': 'Kenya'}, 'NYK': {'Name': 'Nanyuki Airport', 'City': 'Nanyuki', 'Country': 'Kenya'}, 'SRX': {'Name': 'Gardabya Airport', 'City': 'Sirt', 'Country': 'Libya'}, 'TOB': {'Name': 'Gamal Abdel Nasser Airport', 'City': 'Tobruk', 'Country': 'Libya'}, 'MJI': {'Name': 'Mitiga Airport', 'City': 'Tripoli', 'Country': 'Libya'}, 'LAQ': {'Name': 'La Abraq Airport', 'City': "Al Bayda'", 'Country': 'Libya'}, 'ATB': {'Name': 'Atbara Airport', 'City': 'Atbara', 'Country': 'Sudan'}, 'UYL': {'Name': 'Nyala Airport', 'City': 'Nyala', 'Country': 'Sudan'}, 'PZU': {'Name': 'Port Sudan New International Airport', 'City': 'Port Sudan', 'Country': 'Sudan'}, 'BKZ': {'Name': 'Bukoba Airport', 'City': 'Bukoba', 'Country': 'Tanzania'}, 'TKQ': {'Name': 'Kigoma Airport', 'City': 'Kigoma', 'Country': 'Tanzania'}, 'LDI': {'Name': 'Lindi Airport', 'City': 'Lindi', 'Country': 'Tanzania'}, 'MUZ': {'Name': 'Musoma Airport', 'City': 'Musoma', 'Country': 'Tanzania'}, 'SHY': {'Name': 'Shinyanga Airport', 'City': 'Shinyanga', 'Country': 'Tanzania'}, 'TBO': {'Name': 'Tabora Airport', 'City': 'Tabora', 'Country': 'Tanzania'}, 'RUA': {'Name': 'Arua Airport', 'City': 'Arua', 'Country': 'Uganda'}, 'ULU': {'Name': 'Gulu Airport', 'City': 'Gulu', 'Country': 'Uganda'}, 'DIU': {'Name': 'Diu Airport', 'City': 'Diu', 'Country': 'India'}, 'ABR': {'Name': 'Aberdeen Regional Airport', 'City': 'Aberdeen', 'Country': 'United States'}, 'ABY': {'Name': 'Southwest Georgia Regional Airport', 'City': 'Albany', 'Country': 'United States'}, 'AHN': {'Name': 'Athens Ben Epps Airport', 'City': 'Athens', 'Country': 'United States'}, 'ALM': {'Name': 'Alamogordo White Sands Regional Airport', 'City': 'Alamogordo', 'Country': 'United States'}, 'ALO': {'Name': 'Waterloo Regional Airport', 'City': 'Waterloo', 'Country': 'United States'}, 'ALW': {'Name': 'Walla Walla Regional Airport', 'City': 'Walla Walla', 'Country': 'United States'}, 'APN': {'Name': 'Alpena County Regional Airport', 'City': 'Alpena', 'Country': 'United States'}, 'ATY': {'Name': 'Watertown Regional Airport', 'City': 'Watertown', 'Country': 'United States'}, 'BFD': {'Name': 'Bradford Regional Airport', 'City': 'Bradford', 'Country': 'United States'}, 'BFF': {'Name': 'Western Neb. Rgnl/William B. Heilig Airport', 'City': 'Scottsbluff', 'Country': 'United States'}, 'BKW': {'Name': 'Raleigh County Memorial Airport', 'City': 'Beckley', 'Country': 'United States'}, 'BQK': {'Name': 'Brunswick Golden Isles Airport', 'City': 'Brunswick', 'Country': 'United States'}, 'BRL': {'Name': 'Southeast Iowa Regional Airport', 'City': 'Burlington', 'Country': 'United States'}, 'CEC': {'Name': 'Jack Mc Namara Field Airport', 'City': 'Crescent City', 'Country': 'United States'}, 'CGI': {'Name': 'Cape Girardeau Regional Airport', 'City': 'Cape Girardeau', 'Country': 'United States'}, 'CIU': {'Name': 'Chippewa County International Airport', 'City': 'Sault Ste Marie', 'Country': 'United States'}, 'CKB': {'Name': 'North Central West Virginia Airport', 'City': 'Clarksburg', 'Country': 'United States'}, 'CLM': {'Name': 'William R Fairchild International Airport', 'City': 'Port Angeles', 'Country': 'United States'}, 'CMX': {'Name': 'Houghton County Memorial Airport', 'City': 'Hancock', 'Country': 'United States'}, 'DDC': {'Name': 'Dodge City Regional Airport', 'City': 'Dodge City', 'Country': 'United States'}, 'DUJ': {'Name': 'DuBois Regional Airport', 'City': 'Du Bois', 'Country': 'United States'}, 'EAU': {'Name': 'Chippewa Valley Regional Airport', 'City': 'Eau Claire', 'Country': 'United States'}, 'EKO': {'Name': 'Elko Regional Airport', 'City': 'Elko', 'Country': 'United States'}, 'EWB': {'Name': 'New Bedford Regional Airport', 'City': 'New Bedford', 'Country': 'United States'}, 'FAY': {'Name': 'Fayetteville Regional Grannis Field', 'City': 'Fayetteville', 'Country': 'United States'}, 'GGW': {'Name': 'Wokal Field Glasgow International Airport', 'City': 'Glasgow', 'Country': 'United States'}, 'GRI': {'Name': 'Central Nebraska Regional Airport', 'City': 'Grand Island', 'Country': 'United States'}, 'HOT': {'Name': 'Memorial Field', 'City': 'Hot Springs', 'Country': 'United States'}, 'HTS': {'Name': 'Tri-State/Milton J. Ferguson Field', 'City': 'Huntington', 'Country': 'United States'}, 'KIO': {'Name': 'Kili Airport', 'City': 'Kili Island', 'Country': 'Marshall Islands'}, 'IRK': {'Name': 'Kirksville Regional Airport', 'City': 'Kirksville', 'Country': 'United States'}, 'JMS': {'Name': 'Jamestown Regional Airport', 'City': 'Jamestown', 'Country': 'United States'}, 'LAR': {'Name': 'Laramie Regional Airport', 'City': 'Laramie', 'Country': 'United States'}, 'LBE': {'Name': 'Arnold Palmer Regional Airport', 'City': 'Latrobe', 'Country': 'United States'}, 'LBF': {'Name': 'North Platte Regional Airport Lee Bird Field', 'City': 'North Platte', 'Country': 'United States'}, 'LEB': {'Name': 'Lebanon Municipal Airport', 'City': 'Lebanon', 'Country': 'United States'}, 'LMT': {'Name': 'Crater Lake-Klamath Regional Airport', 'City': 'Klamath Falls', 'Country': 'United States'}, 'LNS': {'Name': 'Lancaster Airport', 'City': 'Lancaster', 'Country': 'United States'}, 'LWT': {'Name': 'Lewistown Municipal Airport', 'City': 'Lewistown', 'Country': 'United States'}, 'LYH': {'Name': 'Lynchburg Regional Preston Glenn Field', 'City': 'Lynchburg', 'Country': 'United States'}, 'MKG': {'Name': 'Muskegon County Airport', 'City': 'Muskegon', 'Country': 'United States'}, 'MLS': {'Name': 'Frank Wiley Field', 'City': 'Miles City', 'Country': 'United States'}, 'MSL': {'Name': 'Northwest Alabama Regional Airport', 'City': 'Muscle Shoals', 'Country': 'United States'}, 'OTH': {'Name': 'Southwest Oregon Regional Airport', 'City': 'North Bend', 'Country': 'United States'}, 'OWB': {'Name': 'Owensboro Daviess County Airport', 'City': 'Owensboro', 'Country': 'United States'}, 'PIB': {'Name': 'Hattiesburg Laurel Regional Airport', 'City': 'Hattiesburg/Laurel', 'Country': 'United States'}, 'PIH': {'Name': 'Pocatello Regional Airport', 'City': 'Pocatello', 'Country': 'United States'}, 'PIR': {'Name': 'Pierre Regional Airport', 'City': 'Pierre', 'Country': 'United States'}, 'PLN': {'Name': 'Pellston Regional Airport of Emmet County Airport', 'City': 'Pellston', 'Country': 'United States'}, 'PSM': {'Name': 'Portsmouth International at Pease Airport', 'City': 'Portsmouth', 'Country': 'United States'}, 'RDG': {'Name': 'Reading Regional Carl A Spaatz Field', 'City': 'Reading', 'Country': 'United States'}, 'RHI': {'Name': 'Rhinelander Oneida County Airport', 'City': 'Rhinelander', 'Country': 'United States'}, 'RKS': {'Name': 'Southwest Wyoming Regional Airport', 'City': 'Rock Springs', 'Country': 'United States'}, 'RUT': {'Name': 'Rutland - Southern Vermont Regional Airport', 'City': 'Rutland', 'Country': 'United States'}, 'SBP': {'Name': 'San Luis County Regional Airport', 'City': 'San Luis Obispo', 'Country': 'United States'}, 'SHR': {'Name': 'Sheridan County Airport', 'City': 'Sheridan', 'Country': 'United States'}, 'SLK': {'Name': 'Adirondack Regional Airport', 'City': 'Saranac Lake', 'Country': 'United States'}, 'SLN': {'Name': 'Salina Municipal Airport', 'City': 'Salina', 'Country': 'United States'}, 'SMX': {'Name': 'Santa Maria Pub/Capt G Allan Hancock Field', 'City': 'Santa Maria', 'Country': 'United States'}, 'TUP': {'Name': 'Tupelo Regional Airport', 'City': 'Tupelo', 'Country': 'United States'}, 'UIN': {'Name': 'Quincy Regional Baldwin Field', 'City': 'Quincy', 'Country': 'United States'}, 'VCT': {'Name': 'Victoria Regional Airport', 'City': 'Victoria', 'Country': 'United States'}, 'VLD': {'Name': 'Valdosta Regional Airport', 'City': 'Valdosta', 'Country': 'United States'}, 'WRL': {'Name': 'Worland Municipal Airport', 'City': 'Worland', 'Country': 'United States'}, 'YKM': {'Name': 'Yakima Air Terminal McAllister Field', 'City': 'Yakima', 'Country': 'United States'}, 'ECN': {'Name': 'Ercan International Airport', 'City': 'Nicosia', 'Country': 'Cyprus'}, 'RJL': {'Name': 'Logroño-Agoncillo Airport', 'City': 'Logroño-Agoncillo', 'Country': 'Spain'}, 'IDY': {'Name': "Île d'Yeu Airport", 'City': "Île d'Yeu", 'Country': 'France'}, 'ANE': {'Name': 'Angers-Loire Airport', 'City': 'Angers/Marcé', 'Country': 'France'}, 'LTT': {'Name': 'La Môle Airport', 'City': 'La Môle', 'Country': 'France'}, 'JSY': {'Name': 'Syros Airport', 'City': 'Syros Island', 'Country': 'Greece'}, 'PEV': {'Name': 'Pécs-Pogány Airport', 'City': 'Pécs-Pogány', 'Country': 'Hungary'}, 'SOB': {'Name': 'Sármellék International Airport', 'City': 'Sármellék', 'Country': 'Hungary'}, 'AOT': {'Name': 'Aosta Airport', 'City': 'Aosta', 'Country': 'Italy'}, 'QSR': {'Name': "Salerno Costa d'Amalfi Airport", 'City': 'Salerno', 'Country': 'Italy'}, 'CVU': {'Name': 'Corvo Airport', 'City': 'Corvo', 'Country': 'Portugal'}, 'BNX': {'Name': 'Banja Luka International Airport', 'City': 'Banja Luka', 'Country': 'Bosnia and Herzegovina'}, 'USQ': {'Name': 'Uşak Airport', 'City': 'Usak', 'Country': 'Turkey'}, 'KSY': {'Name': 'Kars Airport', 'City': 'Kars', 'Country': 'Turkey'}, 'SFQ': {'Name': 'Şanlıurfa Airport', 'City': 'Sanliurfa', 'Country': 'Turkey'}, 'KCM': {'Name': 'Kahramanmaraş Airport', 'City': 'Kahramanmaras', 'Country': 'Turkey'}, 'AJI': {'Name': 'Ağrı Airport', 'City': 'Agri', 'Country': 'Turkey'}, 'ADF': {'Name': 'Adıyaman Airport', 'City': 'Adiyaman', 'Country': 'Turkey'}, 'ISE': {'Name': 'Süleyman Demirel International Airport', 'City': 'Isparta', 'Country': 'Turkey'}, 'EDO': {'Name': 'Balıkesir Körfez Airport', 'City': 'Balikesir Korfez', 'Country': 'Turkey'}, 'SZF': {'Name': 'Samsun Çarşamba Airport', 'City': 'Samsun', 'Country': 'Turkey'}, 'ILZ': {'Name': 'Žilina Airport', 'City': 'Žilina', 'Country': 'Slovakia'}, 'GDT': {'Name': 'JAGS McCartney International Airport', 'City': 'Cockburn Town', 'Country': 'Turks and Caicos Islands'}, 'MDS': {'Name': 'Middle Caicos Airport', 'City': 'Middle Caicos', 'Country': 'Turks and Caicos Islands'}, 'SLX': {'Name': 'Salt Cay Airport', 'City': 'Salt Cay', 'Country': 'Turks and Caicos Islands'}, 'AZS': {'Name': 'Samaná El Catey International Airport', 'City': 'Samana', 'Country': 'Dominican Republic'}, 'JBQ': {'Name': 'La Isabela International Airport', 'City': 'La Isabela', 'Country': 'Dominican Republic'}, 'PBR': {'Name': 'Puerto Barrios Airport', 'City': 'Puerto Barrios', 'Country': 'Guatemala'}, 'AAZ': {'Name': 'Quezaltenango Airport', 'City': 'Quezaltenango', 'Country': 'Guatemala'}, 'UTK': {'Name': 'Utirik Airport', 'City': 'Utirik Island', 'Country': 'Marshall Islands'}, 'AHS': {'Name': 'Ahuas Airport', 'City': 'Ahuas', 'Country': 'Honduras'}, 'PEU': {'Name': 'Puerto Lempira Airport', 'City': 'Puerto Lempira', 'Country': 'Honduras'}, 'MIJ': {'Name': 'Mili Island Airport', 'City': 'Mili Island', 'Country': 'Marshall Islands'}, 'CYW': {'Name': 'Captain Rogelio Castillo National Airport', 'City': 'Celaya', 'Country': 'Mexico'}, 'CUA': {'Name': 'Ciudad Constitución Airport', 'City': 'Ciudad Constitución', 'Country': 'Mexico'}, 'GUB': {'Name': 'Guerrero Negro Airport', 'City': 'Guerrero Negro', 'Country': 'Mexico'}, 'JAL': {'Name': 'El Lencero Airport', 'City': 'Jalapa', 'Country': 'Mexico'}, 'CTD': {'Name': 'Alonso Valderrama Airport', 'City': 'Chitré', 'Country': 'Panama'}, 'ONX': {'Name': 'Enrique Adolfo Jimenez Airport', 'City': 'Colón', 'Country': 'Panama'}, 'JQE': {'Name': 'Jaqué Airport', 'City': 'Jaqué', 'Country': 'Panama'}, 'PLP': {'Name': 'Captain Ramon Xatruch Airport', 'City': 'La Palma', 'Country': 'Panama'}, 'TTQ': {'Name': 'Aerotortuguero Airport', 'City': 'Roxana', 'Country': 'Costa Rica'}, 'BCL': {'Name': 'Barra del Colorado Airport', 'City': 'Pococi', 'Country': 'Costa Rica'}, 'PBP': {'Name': 'Islita Airport', 'City': 'Nandayure', 'Country': 'Costa Rica'}, 'PJM': {'Name': 'Puerto Jimenez Airport', 'City': 'Puerto Jimenez', 'Country': 'Costa Rica'}, 'SYQ': {'Name': 'Tobias Bolanos International Airport', 'City': 'San Jose', 'Country': 'Costa Rica'}, 'JEE': {'Name': 'Jérémie Airport', 'City': 'Jeremie', 'Country': 'Haiti'}, 'PAX': {'Name': 'Port-de-Paix Airport', 'City': 'Port-de-Paix', 'Country': 'Haiti'}, 'TND': {'Name': 'Alberto Delgado Airport', 'City': 'Trinidad', 'Country': 'Cuba'}, 'COX': {'Name': 'Congo Town Airport', 'City': 'Andros', 'Country': 'Bahamas'}, 'ATC': {'Name': "Arthur's Town Airport", 'City': "Arthur's Town", 'Country': 'Bahamas'}, 'TBI': {'Name': 'New Bight Airport', 'City': 'Cat Island', 'Country': 'Bahamas'}, 'CRI': {'Name': 'Colonel Hill Airport', 'City': 'Colonel Hill', 'Country': 'Bahamas'}, 'PID': {'Name': 'Nassau Paradise Island Airport', 'City': 'Nassau', 'Country': 'Bahamas'}, 'AIU': {'Name': 'Enua Airport', 'City': 'Atiu Island', 'Country': 'Cook Islands'}, 'MGS': {'Name': 'Mangaia Island Airport', 'City': 'Mangaia Island', 'Country': 'Cook Islands'}, 'MHX': {'Name': 'Manihiki Island Airport', 'City': 'Manihiki Island', 'Country': 'Cook Islands'}, 'MUK': {'Name': 'Mauke Airport', 'City': 'Mauke Island', 'Country': 'Cook Islands'}, 'MOI': {'Name': 'Mitiaro Island Airport', 'City': 'Mitiaro Island', 'Country': 'Cook Islands'}, 'PYE': {'Name': 'Tongareva Airport', 'City': 'Penrhyn Island', 'Country': 'Cook Islands'}, 'ICI': {'Name': 'Cicia Airport', 'City': 'Cicia', 'Country': 'Fiji'}, 'PTF': {'Name': 'Malolo Lailai Island Airport', 'City': 'Malolo Lailai Island', 'Country': 'Fiji'}, 'KDV': {'Name': 'Vunisea Airport', 'City': 'Vunisea', 'Country': 'Fiji'}, 'MNF': {'Name': 'Mana Island Airport', 'City': 'Mana Island', 'Country': 'Fiji'}, 'MFJ': {'Name': 'Moala Airport', 'City': 'Moala', 'Country': 'Fiji'}, 'NGI': {'Name': 'Ngau Airport', 'City': 'Ngau', 'Country': 'Fiji'}, 'LKB': {'Name': 'Lakeba Island Airport', 'City': 'Lakeba Island', 'Country': 'Fiji'}, 'LBS': {'Name': 'Labasa Airport', 'City': 'Lambasa', 'Country': 'Fiji'}, 'TVU': {'Name': 'Matei Airport', 'City': 'Matei', 'Country': 'Fiji'}, 'KXF': {'Name': 'Koro Island Airport', 'City': 'Koro Island', 'Country': 'Fiji'}, 'RTA': {'Name': 'Rotuma Airport', 'City': 'Rotuma', 'Country': 'Fiji'}, 'SVU': {'Name': 'Savusavu Airport', 'City': 'Savusavu', 'Country': 'Fiji'}, 'EUA': {'Name': 'Kaufana Airport', 'City': 'Eua Island', 'Country': 'Tonga'}, 'HPA': {'Name': 'Lifuka Island Airport', 'City': 'Lifuka', 'Country': 'Tonga'}, 'NFO': {'Name': "Mata'aho Airport", 'City': "Angaha, Niuafo'ou Island", 'Country': 'Tonga'}, 'NTT': {'Name': 'Kuini Lavenia Airport', 'City': 'Niuatoputapu', 'Country': 'Tonga'}, 'VBV': {'Name': 'Vanua Balavu Airport', 'City': 'Vanua Balavu', 'Country': 'Fiji'}, 'IUE': {'Name': 'Niue International Airport', 'City': 'Alofi', 'Country': 'Niue'}, 'FUT': {'Name': 'Pointe Vele Airport', 'City': 'Futuna Island', 'Country': 'Wallis and Futuna'}, 'MXS': {'Name': 'Maota Airport', 'City': 'Savaii Island', 'Country': 'Samoa'}, 'APK': {'Name': 'Apataki Airport', 'City': 'Apataki', 'Country': 'French Polynesia'}, 'AHE': {'Name': 'Ahe Airport', 'City': 'Ahe', 'Country': 'French Polynesia'}, 'AUQ': {'Name': 'Hiva Oa-Atuona Airport', 'City': 'Hiva-oa', 'Country': 'French Polynesia'}, 'UAP': {'Name': 'Ua Pou Airport', 'City': 'Ua Pou', 'Country': 'French Polynesia'}, 'UAH': {'Name': 'Ua Huka Airport', 'City': 'Ua Huka', 'Country': 'French Polynesia'}, 'MTV': {'Name': 'Mota Lava Airport', 'City': 'Ablow', 'Country': 'Vanuatu'}, 'SLH': {'Name': 'Sola Airport', 'City': 'Sola', 'Country': 'Vanuatu'}, 'TOH': {'Name': 'Torres Airstrip', 'City': 'Loh/Linua', 'Country': 'Vanuatu'}, 'EAE': {'Name': 'Siwo Airport', 'City': 'Sangafa', 'Country': 'Vanuatu'}, 'CCV': {'Name': 'Craig Cove Airport', 'City': 'Craig Cove', 'Country': 'Vanuatu'}, 'LOD': {'Name': 'Longana Airport', 'City': 'Longana', 'Country': 'Vanuatu'}, 'SSR': {'Name': 'Sara Airport', 'City': 'Pentecost Island', 'Country': 'Vanuatu'}, 'PBJ': {'Name': 'Tavie Airport', 'City': 'Paama Island', 'Country': 'Vanuatu'}, 'LPM': {'Name': 'Lamap Airport', 'City': 'Lamap', 'Country': 'Vanuatu'}, 'LNB': {'Name': 'Lamen Bay Airport', 'City': 'Lamen Bay', 'Country': 'Vanuatu'}, 'MWF': {'Name': 'Maewo-Naone Airport', 'City': 'Maewo Island', 'Country': 'Vanuatu'}, 'LNE': {'Name': 'Lonorore Airport', 'City': 'Lonorore', 'Country': 'Vanuatu'}, 'NUS': {'Name': 'Norsup Airport', 'City': 'Norsup', 'Country': 'Vanuatu'}, 'ZGU': {'Name': 'Gaua Island Airport', 'City': 'Gaua Island', 'Country': 'Vanuatu'}, 'RCL': {'Name': 'Redcliffe Airport', 'City': 'Redcliffe', 'Country': 'Vanuatu'}, 'SON': {'Name': 'Santo Pekoa International Airport', 'City': 'Santo', 'Country': 'Vanuatu'}, 'TGH': {'Name': 'Tongoa Airport', 'City': 'Tongoa Island', 'Country': 'Vanuatu'}, 'ULB': {'Name': 'Uléi Airport', 'City': 'Ambryn Island', 'Country': 'Vanuatu'}, 'VLS': {'Name': 'Valesdir Airport', 'City': 'Valesdir', 'Country': 'Vanuatu'}, 'SWJ': {'Name': 'Southwest Bay Airport', 'City': 'Malekula Island', 'Country': 'Vanuatu'}, 'OLJ': {'Name': 'North West Santo Airport', 'City': 'Olpoi', 'Country': 'Vanuatu'}, 'AUY': {'Name': 'Aneityum Airport', 'City': 'Anelghowhat', 'Country': 'Vanuatu'}, 'AWD': {'Name': 'Aniwa Airport', 'City': 'Aniwa', 'Country': 'Vanuatu'}, 'DLY': {'Name': "Dillon's Bay Airport", 'City': "Dillon's Bay", 'Country': 'Vanuatu'}, 'FTA': {'Name': 'Futuna Airport', 'City': 'Futuna Island', 'Country': 'Vanuatu'}, 'IPA': {'Name': 'Ipota Airport', 'City': 'Ipota', 'Country': 'Vanuatu'}, 'TGJ': {'Name': 'Tiga Airport', 'City': 'Tiga', 'Country': 'New Caledonia'}, 'BMY': {'Name': 'Île Art - Waala Airport', 'City': 'Waala', 'Country': 'New Caledonia'}, 'ILP': {'Name': 'Île des Pins Airport', 'City': 'Île des Pins', 'Country': 'New Caledonia'}, 'FBD': {'Name': 'Fayzabad Airport', 'City': 'Faizabad', 'Country': 'Afghanistan'}, 'AJF': {'Name': 'Al-Jawf Domestic Airport', 'City': 'Al-Jawf', 'Country': 'Saudi Arabia'}, 'WAE': {'Name': 'Wadi Al Dawasir Airport', 'City': 'Wadi-al-dawasir', 'Country': 'Saudi Arabia'}, 'KHD': {'Name': 'Khoram Abad Airport', 'City': 'Khorram Abad', 'Country': 'Iran'}, 'BXR': {'Name': 'Bam Airport', 'City': 'Bam', 'Country': 'Iran'}, 'RJN': {'Name': 'Rafsanjan Airport', 'City': 'Rafsanjan', 'Country': 'Iran'}, 'BJB': {'Name': 'Bojnord Airport', 'City': 'Bojnourd', 'Country': 'Iran'}, 'AFZ': {'Name': 'Sabzevar National Airport', 'City': 'Sabzevar', 'Country': 'Iran'}, 'NSH': {'Name': 'Noshahr Airport', 'City': 'Noshahr', 'Country': 'Iran'}, 'SRY': {'Name': 'Dasht-e Naz Airport', 'City': 'Dasht-e-naz', 'Country': 'Iran'}, 'LRR': {'Name': 'Lar Airport', 'City': 'Lar', 'Country': 'Iran'}, 'ADU': {'Name': 'Ardabil Airport', 'City': 'Ardabil', 'Country': 'Iran'}, 'OMH': {'Name': 'Urmia Airport', 'City': 'Uromiyeh', 'Country': 'Iran'}, 'AAN': {'Name': 'Al Ain International Airport', 'City': 'Al Ain', 'Country': 'United Arab Emirates'}, 'BNP': {'Name': 'Bannu Airport', 'City': 'Bannu', 'Country': 'Pakistan'}, 'BHV': {'Name': 'Bahawalpur Airport', 'City': 'Bahawalpur', 'Country': 'Pakistan'}, 'CJL': {'Name': 'Chitral Airport', 'City': 'Chitral', 'Country': 'Pakistan'}, 'DBA': {'Name': 'Dalbandin Airport', 'City': 'Dalbandin', 'Country': 'Pakistan'}, 'DEA': {'Name': 'Dera Ghazi Khan Airport', 'City': 'Dera Ghazi Khan', 'Country': 'Pakistan'}, 'DSK': {'Name': 'Dera Ismael Khan Airport', 'City': 'Dera Ismael Khan', 'Country': 'Pakistan'}, 'JIW': {'Name': 'Jiwani Airport', 'City': 'Jiwani', 'Country': 'Pakistan'}, 'HDD': {'Name': 'Hyderabad Airport', 'City': 'Hyderabad', 'Country': 'Pakistan'}, 'KDD': {'Name': 'Khuzdar Airport', 'City': 'Khuzdar', 'Country': 'Pakistan'}, 'ORW': {'Name': 'Ormara Airport', 'City': 'Ormara Raik', 'Country': 'Pakistan'}, 'PAJ': {'Name': 'Parachinar Airport', 'City': 'Parachinar', 'Country': 'Pakistan'}, 'KDU': {'Name': 'Skardu Airport', 'City': 'Skardu', 'Country': 'Pakistan'}, 'SYW': {'Name': 'Sehwan Sharif Airport', 'City': 'Sehwan Sharif', 'Country': 'Pakistan'}, 'TUK': {'Name': 'Turbat International Airport', 'City': 'Turbat', 'Country': 'Pakistan'}, 'ISU': {'Name': 'Sulaymaniyah International Airport', 'City': 'Sulaymaniyah', 'Country': 'Iraq'}, 'KAC': {'Name': 'Kamishly Airport', 'City': 'Kamishly', 'Country': 'Syria'}, 'GXF': {'Name': 'Sayun International Airport', 'City': 'Sayun Intl', 'Country': 'Yemen'}, 'ADK': {'Name': 'Adak Airport', 'City': 'Adak Island', 'Country': 'United States'}, 'GST': {'Name': 'Gustavus Airport', 'City': 'Gustavus', 'Country': 'United States'}, 'SGY': {'Name': 'Skagway Airport', 'City': 'Skagway', 'Country': 'United States'}, 'HCR': {'Name': 'Holy Cross Airport', 'City': 'Holy Cross', 'Country': 'United States'}, 'HNS': {'Name': 'Haines Airport', 'City': 'Haines', 'Country': 'United States'}, 'KLG': {'Name': 'Kalskag Airport', 'City': 'Kalskag', 'Country': 'United States'}, 'MCG': {'Name': 'McGrath Airport', 'City': 'Mcgrath', 'Country': 'United States'}, 'MOU': {'Name': 'Mountain Village Airport', 'City': 'Mountain Village', 'Country': 'United States'}, 'ANI': {'Name': 'Aniak Airport', 'City': 'Aniak', 'Country': 'United States'}, 'VAK': {'Name': 'Chevak Airport', 'City': 'Chevak', 'Country': 'United States'}, 'WRG': {'Name': 'Wrangell Airport', 'City': 'Wrangell', 'Country': 'United States'}, 'OPU': {'Name': 'Balimo Airport', 'City': 'Balimo', 'Country': 'Papua New Guinea'}, 'VMU': {'Name': 'Baimuru Airport', 'City': 'Baimuru', 'Country': 'Papua New Guinea'}, 'LUP': {'Name': 'Kalaupapa Airport', 'City': 'Molokai', 'Country': 'United States'}, 'ENT': {'Name': 'Eniwetok Airport', 'City': 'Eniwetok Atoll', 'Country': 'Marshall Islands'}, 'LZN': {'Name': 'Matsu Nangan Airport', 'City': 'Matsu Islands', 'Country': 'Taiwan'}, 'HCN': {'Name': 'Hengchun Airport', 'City': 'Hengchun', 'Country': 'Taiwan'}, 'MFK': {'Name': 'Matsu Beigan Airport', 'City': 'Matsu Islands', 'Country': 'Taiwan'}, 'KUH': {'Name': 'Kushiro Airport', 'City': 'Kushiro', 'Country': 'Japan'}, 'OKD': {'Name': 'Okadama Airport', 'City': 'Sapporo', 'Country': 'Japan'}, 'HSG': {'Name': 'Saga Airport', 'City': 'Saga', 'Country': 'Japan'}, 'NKM': {'Name': 'Nagoya Airport', 'City': 'Nagoya', 'Country': 'Japan'}, 'IWJ': {'Name': 'Iwami Airport', 'City': 'Iwami', 'Country': 'Japan'}, 'FKS': {'Name': 'Fukushima Airport', 'City': 'Fukushima', 'Country': 'Japan'}, 'ONJ': {'Name': 'Odate Noshiro Airport', 'City': 'Odate Noshiro', 'Country': 'Japan'}, 'SYO': {'Name': 'Shonai Airport', 'City': 'Shonai', 'Country': 'Japan'}, 'MYE': {'Name': 'Miyakejima Airport', 'City': 'Miyakejima', 'Country': 'Japan'}, 'KUV': {'Name': 'Kunsan Air Base', 'City': 'Kunsan', 'Country': 'South Korea'}, 'MPK': {'Name': 'Mokpo Heliport', 'City': 'Mokpo', 'Country': 'South Korea'}, 'WJU': {'Name': 'Wonju/Hoengseong Air Base (K-38/K-46)', 'City': 'Wonju', 'Country': 'South Korea'}, 'YNY': {'Name': 'Yangyang International Airport', 'City': 'Sokcho / Gangneung', 'Country': 'South Korea'}, 'HIN': {'Name': 'Sacheon Air Base/Airport', 'City': 'Sacheon', 'Country': 'South Korea'}, 'CJJ': {'Name': 'Cheongju International Airport/Cheongju Air Base (K-59/G-513)', 'City': 'Chongju', 'Country': 'South Korea'}, 'SFS': {'Name': 'Subic Bay International Airport', 'City': 'Olongapo City', 'Country': 'Philippines'}, 'CYU': {'Name': 'Cuyo Airport', 'City': 'Cuyo', 'Country': 'Philippines'}, 'CGM': {'Name': 'Camiguin Airport', 'City': 'Camiguin', 'Country': 'Philippines'}, 'JOL': {'Name': 'Jolo Airport', 'City': 'Jolo', 'Country': 'Philippines'}, 'TWT': {'Name': 'Sanga Sanga Airport', 'City': 'Sanga Sanga', 'Country': 'Philippines'}, 'SUG': {'Name': 'Surigao Airport', 'City': 'Sangley Point', 'Country': 'Philippines'}, 'TDG': {'Name': 'Tandag Airport', 'City': 'Tandag', 'Country': 'Philippines'}, 'WNP': {'Name': 'Naga Airport', 'City': 'Naga', 'Country': 'Philippines'}, 'BSO': {'Name': 'Basco Airport', 'City': 'Basco', 'Country': 'Philippines'}, 'SFE': {'Name': 'San Fernando Airport', 'City': 'San Fernando', 'Country': 'Philippines'}, 'TUG': {'Name': 'Tuguegarao Airport', 'City': 'Tuguegarao', 'Country': 'Philippines'}, 'VRC': {'Name': 'Virac Airport', 'City': 'Virac', 'Country': 'Philippines'}, 'CYP': {'Name': 'Calbayog Airport', 'City': 'Calbayog City', 'Country': 'Philippines'}, 'CRM': {'Name': 'Catarman National Airport', 'City': 'Catarman', 'Country': 'Philippines'}, 'MBT': {'Name': 'Moises R. Espinosa Airport', 'City': 'Masbate', 'Country': 'Philippines'}, 'RXS': {'Name': 'Roxas Airport', 'City': 'Roxas City', 'Country': 'Philippines'}, 'TTG': {'Name': 'General Enrique Mosconi Airport', 'City': 'Tartagal', 'Country': 'Argentina'}, 'LHS': {'Name': 'Las Heras Airport', 'City': 'Las Heras', 'Country': 'Argentina'}, 'OES': {'Name': 'Antoine de Saint Exupéry Airport', 'City': 'San Antonio Oeste', 'Country': 'Argentina'}, 'ING': {'Name': 'Lago Argentino Airport', 'City': 'El Calafate', 'Country': 'Argentina'}, 'GGS': {'Name': 'Gobernador Gregores Airport', 'City': 'Gobernador Gregores', 'Country': 'Argentina'}, 'SST': {'Name': 'Santa Teresita Airport', 'City': 'Santa Teresita', 'Country': 'Argentina'}, 'NEC': {'Name': 'Necochea Airport', 'City': 'Necochea', 'Country': 'Argentina'}, 'JDO': {'Name': 'Orlando Bezerra de Menezes Airport', 'City': 'Juazeiro Do Norte', 'Country': 'Brazil'}, 'LEC': {'Name': 'Coronel Horácio de Mattos Airport', 'City': 'Lençóis', 'Country': 'Brazil'}, 'MEA': {'Name': 'Macaé Airport', 'City': 'Macaé', 'Country': 'Brazil'}, 'MII': {'Name': 'Frank Miloye Milenkowichi–Marília State Airport', 'City': 'Marília', 'Country': 'Brazil'}, 'VDC': {'Name': 'Vitória da Conquista Airport', 'City': 'Vitória Da Conquista', 'Country': 'Brazil'}, 'RIA': {'Name': 'Santa Maria Airport', 'City': 'Santa Maria', 'Country': 'Brazil'}, 'TOW': {'Name': 'Toledo Airport', 'City': 'Toledo', 'Country': 'Brazil'}, 'ESR': {'Name': 'Ricardo García Posada Airport', 'City': 'El Salvador', 'Country': 'Chile'}, 'ZPC': {'Name': 'Pucón Airport', 'City': 'Pucon', 'Country': 'Chile'}, 'SOD': {'Name': 'Sorocaba Airport', 'City': 'Sorocaba', 'Country': 'Brazil'}, 'SCY': {'Name': 'San Cristóbal Airport', 'City': 'San Cristóbal', 'Country': 'Ecuador'}, 'LOH': {'Name': 'Camilo Ponce Enriquez Airport', 'City': 'La Toma (Catamayo)', 'Country': 'Ecuador'}, 'ESM': {'Name': 'General Rivadeneira Airport', 'City': 'Esmeraldas', 'Country': 'Ecuador'}, 'PSY': {'Name': 'Port Stanley Airport', 'City': 'Stanley', 'Country': 'Falkland Islands'}, 'CRC': {'Name': 'Santa Ana Airport', 'City': 'Cartago', 'Country': 'Colombia'}, 'LQM': {'Name': 'Caucaya Airport', 'City': 'Puerto Leguízamo', 'Country': 'Colombia'}, 'LPD': {'Name': 'La Pedrera Airport', 'City': 'La Pedrera', 'Country': 'Colombia'}, 'NQU': {'Name': 'Reyes Murillo Airport', 'City': 'Nuquí', 'Country': 'Colombia'}, 'PDA': {'Name': 'Obando Airport', 'City': 'Puerto Inírida', 'Country': 'Colombia'}, 'EYP': {'Name': 'El Yopal Airport', 'City': 'Yopal', 'Country': 'Colombia'}, 'GYA': {'Name': 'Capitán de Av. Emilio Beltrán Airport', 'City': 'Guayaramerín', 'Country': 'Bolivia'}, 'PUR': {'Name': 'Puerto Rico Airport', 'City': 'Puerto Rico/Manuripi', 'Country': 'Bolivia'}, 'RIB': {'Name': 'Capitán Av. Selin Zeitun Lopez Airport', 'City': 'Riberalta', 'Country': 'Bolivia'}, 'REY': {'Name': 'Reyes Airport', 'City': 'Reyes', 'Country': 'Bolivia'}, 'SRJ': {'Name': 'Capitán Av. German Quiroga G. Airport', 'City': 'San Borja', 'Country': 'Bolivia'}, 'ORG': {'Name': 'Zorg en Hoop Airport', 'City': 'Paramaribo', 'Country': 'Suriname'}, 'MVS': {'Name': 'Mucuri Airport', 'City': 'Mucuri', 'Country': 'Brazil'}, 'CJA': {'Name': 'Mayor General FAP Armando Revoredo Iglesias Airport', 'City': 'Cajamarca', 'Country': 'Peru'}, 'HUU': {'Name': 'Alferez Fap David Figueroa Fernandini Airport', 'City': 'Huánuco', 'Country': 'Peru'}, 'NZC': {'Name': 'Maria Reiche Neuman Airport', 'City': 'Nazca', 'Country': 'Peru'}, 'SRA': {'Name': 'Santa Rosa Airport', 'City': 'Santa Rosa', 'Country': 'Brazil'}, 'MYC': {'Name': 'Escuela Mariscal Sucre Airport', 'City': 'Maracay', 'Country': 'Venezuela'}, 'VIG': {'Name': 'Juan Pablo Pérez Alfonso Airport', 'City': 'El Vigía', 'Country': 'Venezuela'}, 'JPR': {'Name': 'Ji-Paraná Airport', 'City': 'Ji-Paraná', 'Country': 'Brazil'}, 'BBQ': {'Name': 'Codrington Airport', 'City': 'Codrington', 'Country': 'Antigua and Barbuda'}, 'DSD': {'Name': 'La Désirade Airport', 'City': 'Grande Anse', 'Country': 'Guadeloupe'}, 'BBR': {'Name': 'Baillif Airport', 'City': 'Basse Terre', 'Country': 'Guadeloupe'}, 'SFC': {'Name': 'St-François Airport', 'City': 'St-François', 'Country': 'Guadeloupe'}, 'GBJ': {'Name': 'Les Bases Airport', 'City': 'Grand Bourg', 'Country': 'Guadeloupe'}, 'NEV': {'Name': 'Vance W. Amory International Airport', 'City': 'Charlestown', 'Country': 'Saint Kitts and Nevis'}, 'VIJ': {'Name': 'Virgin Gorda Airport', 'City': 'Spanish Town', 'Country': 'British Virgin Islands'}, 'BQU': {'Name': 'J F Mitchell Airport', 'City': 'Bequia', 'Country': 'Saint Vincent and the Grenadines'}, 'UNI': {'Name': 'Union Island International Airport', 'City': 'Union Island', 'Country': 'Saint Vincent and the Grenadines'}, 'KOV': {'Name': 'Kokshetau Airport', 'City': 'Kokshetau', 'Country': 'Kazakhstan'}, 'PPK': {'Name': 'Petropavlosk South Airport', 'City': 'Petropavlosk', 'Country': 'Kazakhstan'}, 'DZN': {'Name': 'Zhezkazgan Airport', 'City': 'Zhezkazgan', 'Country': 'Kazakhstan'}, 'UKK': {'Name': 'Ust-Kamennogorsk Airport', 'City': 'Ust Kamenogorsk', 'Country': 'Kazakhstan'}, 'KSN': {'Name': 'Kostanay West Airport', 'City': 'Kostanay', 'Country': 'Kazakhstan'}, 'KVD': {'Name': 'Ganja Airport', 'City': 'Ganja', 'Country': 'Azerbaijan'}, 'NAJ': {'Name': 'Nakhchivan Airport', 'City': 'Nakhchivan', 'Country': 'Azerbaijan'}, 'NER': {'Name': 'Chulman Airport', 'City': 'Neryungri', 'Country': 'Russia'}, 'PYJ': {'Name': 'Polyarny Airport', 'City': 'Yakutia', 'Country': 'Russia'}, 'CKH': {'Name': 'Chokurdakh Airport', 'City': 'Chokurdah', 'Country': 'Russia'}, 'CYX': {'Name': 'Cherskiy Airport', 'City': 'Cherskiy', 'Country': 'Russia'}, 'IKS': {'Name': 'Tiksi Airport', 'City': 'Tiksi', 'Country': 'Russia'}, 'KXK': {'Name': 'Komsomolsk-on-Amur Airport', 'City': 'Komsomolsk-on-Amur', 'Country': 'Russia'}, 'DYR': {'Name': 'Ugolny Airport', 'City': 'Anadyr', 'Country': 'Russia'}, 'OHO': {'Name': 'Okhotsk Airport', 'City': 'Okhotsk', 'Country': 'Russia'}, 'UJE': {'Name': 'Ujae Atoll Airport', 'City': 'Ujae Atoll', 'Country': 'Marshall Islands'}, 'MPW': {'Name': 'Mariupol International Airport', 'City': 'Mariupol International', 'Country': 'Ukraine'}, 'VSG': {'Name': 'Luhansk International Airport', 'City': 'Lugansk', 'Country': 'Ukraine'}, 'OZH': {'Name': 'Zaporizhzhia International Airport', 'City': 'Zaporozhye', 'Country': 'Ukraine'}, 'KWG': {'Name': 'Kryvyi Rih International Airport', 'City': 'Krivoy Rog', 'Country': 'Ukraine'}, 'HRK': {'Name': 'Kharkiv International Airport', 'City': 'Kharkov', 'Country': 'Ukraine'}, 'IFO': {'Name': 'Ivano-Frankivsk International Airport', 'City': 'Ivano-Frankivsk', 'Country': 'Ukraine'}, 'CWC': {'Name': 'Chernivtsi International Airport', 'City': 'Chernovtsk', 'Country': 'Ukraine'}, 'RWN': {'Name': 'Rivne International Airport', 'City': 'Rivne', 'Country': 'Ukraine'}, 'UDJ': {'Name': 'Uzhhorod International Airport', 'City': 'Uzhgorod', 'Country': 'Ukraine'}, 'CSH': {'Name': 'Solovki Airport', 'City': 'Solovetsky Islands', 'Country': 'Russia'}, 'CEE': {'Name': 'Cherepovets Airport', 'City': 'Cherepovets', 'Country': 'Russia'}, 'AMV': {'Name': 'Amderma Airport', 'City': 'Amderma', 'Country': 'Russia'}, 'KSZ': {'Name': 'Kotlas Airport', 'City': 'Kotlas', 'Country': 'Russia'}, 'PES': {'Name': 'Petrozavodsk Airport', 'City': 'Petrozavodsk', 'Country': 'Russia'}, 'GNA': {'Name': 'Hrodna Airport', 'City': 'Hrodna', 'Country': 'Belarus'}, 'MVQ': {'Name': 'Mogilev Airport', 'City': 'Mogilev', 'Country': 'Belarus'}, 'EIE': {'Name': 'Yeniseysk Airport', 'City': 'Yeniseysk', 'Country': 'Russia'}, 'KYZ': {'Name': 'Kyzyl Airport', 'City': 'Kyzyl', 'Country': 'Russia'}, 'NOZ': {'Name': 'Spichenkovo Airport', 'City': 'Novokuznetsk', 'Country': 'Russia'}, 'HTG': {'Name': 'Khatanga Airport', 'City': 'Khatanga', 'Country': 'Russia'}, 'IAA': {'Name': 'Igarka Airport', 'City': 'Igarka', 'Country': 'Russia'}, 'NAL': {'Name': 'Nalchik Airport', 'City': 'Nalchik', 'Country': 'Russia'}, 'OGZ': {'Name': 'Beslan Airport', 'City': 'Beslan', 'Country': 'Russia'}, 'ESL': {'Name': 'Elista Airport', 'City': 'Elista', 'Country': 'Russia'}, 'WKK': {'Name': 'Aleknagik / New Airport', 'City': 'Aleknagik', 'Country': 'United States'}, 'BLF': {'Name': 'Mercer County Airport', 'City': 'Bluefield', 'Country': 'United States'}, 'GLH': {'Name': 'Mid Delta Regional Airport', 'City': 'Greenville', 'Country': 'United States'}, 'PSC': {'Name': 'Tri Cities Airport', 'City': 'Pasco', 'Country': 'United States'}, 'KQA': {'Name': 'Akutan Seaplane Base', 'City': 'Akutan', 'Country': 'United States'}, 'LPS': {'Name': 'Lopez Island Airport', 'City': 'Lopez', 'Country': 'United States'}, 'SLY': {'Name': 'Salekhard Airport', 'City': 'Salekhard', 'Country': 'Russia'}, 'HMA': {'Name': 'Khanty Mansiysk Airport', 'City': 'Khanty-Mansiysk', 'Country': 'Russia'}, 'NYA': {'Name': 'Nyagan Airport', 'City': 'Nyagan', 'Country': 'Russia'}, 'OVS': {'Name': 'Sovetskiy Airport', 'City': 'Sovetskiy', 'Country': 'Russia'}, 'IJK': {'Name': 'Izhevsk Airport', 'City': 'Izhevsk', 'Country': 'Russia'}, 'KVX': {'Name': 'Pobedilovo Airport', 'City': 'Kirov', 'Country': 'Russia'}, 'NYM': {'Name': 'Nadym Airport', 'City': 'Nadym', 'Country': 'Russia'}, 'RAT': {'Name': 'Raduzhny Airport', 'City': 'Raduzhnyi', 'Country': 'Russia'}, 'NFG': {'Name': 'Nefteyugansk Airport', 'City': 'Nefteyugansk', 'Country': 'Russia'}, 'KRO': {'Name': 'Kurgan Airport', 'City': 'Kurgan', 'Country': 'Russia'}, 'LBD': {'Name': 'Khudzhand Airport', 'City': 'Khudzhand', 'Country': 'Tajikistan'}, 'AZN': {'Name': 'Andizhan Airport', 'City': 'Andizhan', 'Country': 'Uzbekistan'}, 'FEG': {'Name': 'Fergana International Airport', 'City': 'Fergana', 'Country': 'Uzbekistan'}, 'NMA': {'Name': 'Namangan Airport', 'City': 'Namangan', 'Country': 'Uzbekistan'}, 'NCU': {'Name': 'Nukus Airport', 'City': 'Nukus', 'Country': 'Uzbekistan'}, 'UGC': {'Name': 'Urgench Airport', 'City': 'Urgench', 'Country': 'Uzbekistan'}, 'KSQ': {'Name': 'Karshi Khanabad Airport', 'City': 'Khanabad', 'Country': 'Uzbekistan'}, 'TMJ': {'Name': 'Termez Airport', 'City': 'Termez', 'Country': 'Uzbekistan'}, 'RYB': {'Name': 'Staroselye Airport', 'City': 'Rybinsk', 'Country': 'Russia'}, 'EGO': {'Name': 'Belgorod International Airport', 'City': 'Belgorod', 'Country': 'Russia'}, 'URS': {'Name': 'Kursk East Airport', 'City': 'Kursk', 'Country': 'Russia'}, 'LPK': {'Name': 'Lipetsk Airport', 'City': 'Lipetsk', 'Country': 'Russia'}, 'VKT': {'Name': 'Vorkuta Airport', 'City': 'Vorkuta', 'Country': 'Russia'}, 'UUA': {'Name': 'Bugulma Airport', 'City': 'Bugulma', 'Country': 'Russia'}, 'JOK': {'Name': 'Yoshkar-Ola Airport', 'City': 'Yoshkar-Ola', 'Country': 'Russia'}, 'CSY': {'Name': 'Cheboksary Airport', 'City': 'Cheboksary', 'Country': 'Russia'}, 'ULY': {'Name': 'Ulyanovsk East Airport', 'City': 'Ulyanovsk', 'Country': 'Russia'}, 'OSW': {'Name': 'Orsk Airport', 'City': 'Orsk', 'Country': 'Russia'}, 'PEZ': {'Name': 'Penza Airport', 'City': 'Penza', 'Country': 'Russia'}, 'SKX': {'Name': 'Saransk Airport', 'City': 'Saransk', 'Country': 'Russia'}, 'BWO': {'Name': 'Balakovo Airport', 'City': 'Balakovo', 'Country': 'Russia'}, 'HBX': {'Name': 'Hubli Airport', 'City': 'Hubli', 'Country': 'India'}, 'KCT': {'Name': 'Koggala Airport', 'City': 'Koggala', 'Country': 'Sri Lanka'}, 'WRZ': {'Name': 'Weerawila Airport', 'City': 'Wirawila', 'Country': 'Sri Lanka'}, 'BBM': {'Name': 'Battambang Airport', 'City': 'Battambang', 'Country': 'Cambodia'}, 'SHL': {'Name': 'Shillong Airport', 'City': 'Shillong', 'Country': 'India'}, 'GAU': {'Name': 'Lokpriya Gopinath Bordoloi International Airport', 'City': 'Guwahati', 'Country': 'India'}, 'DMU': {'Name': 'Dimapur Airport', 'City': 'Dimapur', 'Country': 'India'}, 'TEZ': {'Name': 'Tezpur Airport', 'City': 'Tezpur', 'Country': 'India'}, 'BZL': {'Name': 'Barisal Airport', 'City': 'Barisal', 'Country': 'Bangladesh'}, 'HOE': {'Name': 'Ban Huoeisay Airport', 'City': 'Huay Xai', 'Country': 'Laos'}, 'BHR': {'Name': 'Bharatpur Airport', 'City': 'Bharatpur', 'Country': 'Nepal'}, 'BDP': {'Name': 'Bhadrapur Airport', 'City': 'Chandragarhi', 'Country': 'Nepal'}, 'MEY': {'Name': 'Meghauli Airport', 'City': 'Meghauli', 'Country': 'Nepal'}, 'KEP': {'Name': 'Nepalgunj Airport', 'City': 'Nepalgunj', 'Country': 'Nepal'}, 'GAN': {'Name': 'Gan International Airport', 'City': 'Gan Island', 'Country': 'Maldives'}, 'HAQ': {'Name': 'Hanimaadhoo Airport', 'City': 'Haa Dhaalu Atoll', 'Country': 'Maldives'}, 'KDO': {'Name': 'Kadhdhoo Airport', 'City': 'Laamu Atoll', 'Country': 'Maldives'}, 'MAQ': {'Name': 'Mae Sot Airport', 'City': 'Tak', 'Country': 'Thailand'}, 'BMV': {'Name': 'Buon Ma Thuot Airport', 'City': 'Buonmethuot', 'Country': 'Vietnam'}, 'HPH': {'Name': 'Cat Bi International Airport', 'City': 'Haiphong', 'Country': 'Vietnam'}, 'CXR': {'Name': 'Cam Ranh Airport', 'City': 'Nha Trang', 'Country': 'Vietnam'}, 'VCS': {'Name': 'Co Ong Airport', 'City': 'Conson', 'Country': 'Vietnam'}, 'VCA': {'Name': 'Can Tho International Airport', 'City': 'Can Tho', 'Country': 'Vietnam'}, 'DIN': {'Name': 'Dien Bien Phu Airport', 'City': 'Dienbienphu', 'Country': 'Vietnam'}, 'UIH': {'Name': 'Phu Cat Airport', 'City': 'Phucat', 'Country': 'Vietnam'}, 'PXU': {'Name': 'Pleiku Airport', 'City': 'Pleiku', 'Country': 'Vietnam'}, 'VII': {'Name': 'Vinh Airport', 'City': 'Vinh', 'Country': 'Vietnam'}, 'BMO': {'Name': 'Banmaw Airport', 'City': 'Banmaw', 'Country': 'Burma'}, 'TVY': {'Name': 'Dawei Airport', 'City': 'Dawei', 'Country': 'Burma'}, 'KAW': {'Name': 'Kawthoung Airport', 'City': 'Kawthoung', 'Country': 'Burma'}, 'LIW': {'Name': 'Loikaw Airport', 'City': 'Loikaw', 'Country': 'Burma'}, 'MNU': {'Name': 'Mawlamyine Airport', 'City': 'Mawlamyine', 'Country': 'Burma'}, 'BSX': {'Name': 'Pathein Airport', 'City': 'Pathein', 'Country': 'Burma'}, 'PKK': {'Name': 'Pakhokku Airport', 'City': 'Pakhokku', 'Country': 'Burma'}, 'SWQ': {'Name': 'Sumbawa Besar Airport', 'City': 'Sumbawa Island', 'Country': 'Indonesia'}, 'TMC': {'Name': 'Tambolaka Airport', 'City': 'Waikabubak-Sumba Island', 'Country': 'Indonesia'}, 'BUI': {'Name': 'Bokondini Airport', 'City': 'Bokondini-Papua Island', 'Country': 'Indonesia'}, 'SEH': {'Name': 'Senggeh Airport', 'City': 'Senggeh-Papua Island', 'Country': 'Indonesia'}, 'TJS': {'Name': 'Tanjung Harapan Airport', 'City': 'Tanjung Selor-Borneo Island', 'Country': 'Indonesia'}, 'DTD': {'Name': 'Datadawai Airport', 'City': 'Datadawai-Borneo Island', 'Country': 'Indonesia'}, 'BEJ': {'Name': 'Kalimarau Airport', 'City': 'Tanjung Redep-Borneo Island', 'Country': 'Indonesia'}, 'TJG': {'Name': 'Warukin Airport', 'City': 'Tanjung-Borneo Island', 'Country': 'Indonesia'}, 'SMQ': {'Name': 'Sampit(Hasan) Airport', 'City': 'Sampit-Borneo Island', 'Country': 'Indonesia'}, 'LUV': {'Name': 'Dumatumbun Airport', 'City': 'Langgur-Kei Islands', 'Country': 'Indonesia'}, 'ARD': {'Name': 'Mali Airport', 'City': 'Alor Island', 'Country': 'Indonesia'}, 'BLG': {'Name': 'Belaga Airport', 'City': 'Belaga', 'Country': 'Malaysia'}, 'LGL': {'Name': 'Long Lellang Airport', 'City': 'Long Datih', 'Country': 'Malaysia'}, 'ODN': {'Name': 'Long Seridan Airport', 'City': 'Long Seridan', 'Country': 'Malaysia'}, 'MKM': {'Name': 'Mukah Airport', 'City': 'Mukah', 'Country': 'Malaysia'}, 'BKM': {'Name': 'Bakalalan Airport', 'City': 'Bakalalan', 'Country': 'Malaysia'}, 'LWY': {'Name': 'Lawas Airport', 'City': 'Lawas', 'Country': 'Malaysia'}, 'BBN': {'Name': 'Bario Airport', 'City': 'Bario', 'Country': 'Malaysia'}, 'TMG': {'Name': 'Tomanggong Airport', 'City': 'Tomanggong', 'Country': 'Malaysia'}, 'KUD': {'Name': 'Kudat Airport', 'City': 'Kudat', 'Country': 'Malaysia'}, 'TKG': {'Name': 'Radin Inten II (Branti) Airport', 'City': 'Bandar Lampung-Sumatra Island', 'Country': 'Indonesia'}, 'HLP': {'Name': 'Halim Perdanakusuma International Airport', 'City': 'Jakarta', 'Country': 'Indonesia'}, 'NTX': {'Name': 'Ranai Airport', 'City': 'Ranai-Natuna Besar Island', 'Country': 'Indonesia'}, 'PSU': {'Name': 'Pangsuma Airport', 'City': 'Putussibau-Borneo Island', 'Country': 'Indonesia'}, 'SQG': {'Name': 'Sintang(Susilo) Airport', 'City': 'Sintang-Borneo Island', 'Country': 'Indonesia'}, 'PDO': {'Name': 'Pendopo Airport', 'City': 'Talang Gudang-Sumatra Island', 'Country': 'Indonesia'}, 'LSW': {'Name': 'Malikus Saleh Airport', 'City': 'Lhok Seumawe-Sumatra Island', 'Country': 'Indonesia'}, 'PKG': {'Name': 'Pulau Pangkor Airport', 'City': 'Pangkor Island', 'Country': 'Malaysia'}, 'LBW': {'Name': 'Long Bawan Airport', 'City': 'Long Bawan-Borneo Island', 'Country': 'Indonesia'}, 'NNX': {'Name': 'Nunukan Airport', 'City': 'Nunukan-Nunukan Island', 'Country': 'Indonesia'}, 'LPU': {'Name': 'Long Apung Airport', 'City': 'Long Apung-Borneo Island', 'Country': 'Indonesia'}, 'ALH': {'Name': 'Albany Airport', 'City': 'Albany', 'Country': 'Australia'}, 'GYL': {'Name': 'Argyle Airport', 'City': 'Argyle', 'Country': 'Australia'}, 'AUU': {'Name': 'Aurukun Airport', 'City': 'Aurukun', 'Country': 'Australia'}, 'BCI': {'Name': 'Barcaldine Airport', 'City': 'Barcaldine', 'Country': 'Australia'}, 'BDD': {'Name': 'Badu Island Airport', 'City': 'Badu Island', 'Country': 'Australia'}, 'BVI': {'Name': 'Birdsville Airport', 'City': 'Birdsville', 'Country': 'Australia'}, 'BHQ': {'Name': 'Broken Hill Airport', 'City': 'Broken Hill', 'Country': 'Australia'}, 'HTI': {'Name': 'Hamilton Island Airport', 'City': 'Hamilton Island', 'Country': 'Australia'}, 'BEU': {'Name': 'Bedourie Airport', 'City': 'Bedourie', 'Country': 'Australia'}, 'BRK': {'Name': 'Bourke Airport', 'City': 'Bourke', 'Country': 'Australia'}, 'BUC': {'Name': 'Burketown Airport', 'City': 'Burketown', 'Country': 'Australia'}, 'GIC': {'Name': 'Boigu Airport', 'City': 'Boigu', 'Country': 'Australia'}, 'OKY': {'Name': 'Oakey Airport', 'City': 'Oakey', 'Country': 'Australia'}, 'BQL': {'Name': 'Boulia Airport', 'City': 'Boulia', 'Country': 'Australia'}, 'BHS': {'Name': 'Bathurst Airport', 'City': 'Bathurst', 'Country': 'Australia'}, 'BLT': {'Name': 'Blackwater Airport', 'City': 'Blackwater', 'Country': 'Australia'}, 'CVQ': {'Name': 'Carnarvon Airport', 'City': 'Carnarvon', 'Country': 'Australia'}, 'CAZ': {'Name': 'Cobar Airport', 'City': 'Cobar', 'Country': 'Australia'}, 'CPD': {'Name': 'Coober Pedy Airport', 'City': 'Coober Pedy', 'Country': 'Australia'}, 'CNC': {'Name': 'Coconut Island Airport', 'City': 'Coconut Island', 'Country': 'Australia'}, 'CNJ': {'Name': 'Cloncurry Airport', 'City': 'Cloncurry', 'Country': 'Australia'}, 'CED': {'Name': 'Ceduna Airport', 'City': 'Ceduna', 'Country': 'Australia'}, 'CTN': {'Name': 'Cooktown Airport', 'City': 'Cooktown', 'Country': 'Australia'}, 'CMA': {'Name': 'Cunnamulla Airport', 'City': 'Cunnamulla', 'Country': 'Australia'}, 'CNB': {'Name': 'Coonamble Airport', 'City': 'Coonamble', 'Country': 'Australia'}, 'CUQ': {'Name': 'Coen Airport', 'City': 'Coen', 'Country': 'Australia'}, 'OOM': {'Name': 'Cooma Snowy Mountains Airport', 'City': 'Cooma', 'Country': 'Australia'}, 'DMD': {'Name': 'Doomadgee Airport', 'City': 'Doomadgee', 'Country': 'Australia'}, 'NLF': {'Name': 'Darnley Island Airport', 'City': 'Darnley Island', 'Country': 'Australia'}, 'DPO': {'Name': 'Devonport Airport', 'City': 'Devonport', 'Country': 'Australia'}, 'ELC': {'Name': 'Elcho Island Airport', 'City': 'Elcho Island', 'Country': 'Australia'}, 'EPR': {'Name': 'Esperance Airport', 'City': 'Esperance', 'Country': 'Australia'}, 'FLS': {'Name': 'Flinders Island Airport', 'City': 'Flinders Island', 'Country': 'Australia'}, 'GET': {'Name': 'Geraldton Airport', 'City': 'Geraldton', 'Country': 'Australia'}, 'GLT': {'Name': 'Gladstone Airport', 'City': 'Gladstone', 'Country': 'Australia'}, 'GTE': {'Name': 'Groote Eylandt Airport', 'City': 'Groote Eylandt', 'Country': 'Australia'}, 'GFF': {'Name': 'Griffith Airport', 'City': 'Griffith', 'Country': 'Australia'}, 'HID': {'Name': 'Horn Island Airport', 'City': 'Horn Island', 'Country': 'Australia'}, 'HOK': {'Name': 'Hooker Creek Airport', 'City': 'Hooker Creek', 'Country': 'Australia'}, 'MHU': {'Name': 'Mount Hotham Airport', 'City': 'Mount Hotham', 'Country': 'Australia'}, 'HGD': {'Name': 'Hughenden Airport', 'City': 'Hughenden', 'Country': 'Australia'}, 'JCK': {'Name': 'Julia Creek Airport', 'City': 'Julia Creek', 'Country': 'Australia'}, 'KAX': {'Name': 'Kalbarri Airport', 'City': 'Kalbarri', 'Country': 'Australia'}, 'KNS': {'Name': 'King Island Airport', 'City': 'King Island', 'Country': 'Australia'}, 'KFG': {'Name': 'Kalkgurung Airport', 'City': 'Kalkgurung', 'Country': 'Australia'}, 'KRB': {'Name': 'Karumba Airport', 'City': 'Karumba', 'Country': 'Australia'}, 'KWM': {'Name': 'Kowanyama Airport', 'City': 'Kowanyama', 'Country': 'Australia'}, 'KUG': {'Name': 'Kubin Airport', 'City': 'Kubin', 'Country': 'Australia'}, 'LNO': {'Name': 'Leonora Airport', 'City': 'Leonora', 'Country': 'Australia'}, 'LEL': {'Name': 'Lake Evella Airport', 'City': 'Lake Evella', 'Country': 'Australia'}, 'LDH': {'Name': 'Lord Howe Island Airport', 'City': 'Lord Howe Island', 'Country': 'Australia'}, 'IRG': {'Name': 'Lockhart River Airport', 'City': 'Lockhart River', 'Country': 'Australia'}, 'LSY': {'Name': 'Lismore Airport', 'City': 'Lismore', 'Country': 'Australia'}, 'LHG': {'Name': 'Lightning Ridge Airport', 'City': 'Lightning Ridge', 'Country': 'Australia'}, 'LRE': {'Name': 'Longreach Airport', 'City': 'Longreach', 'Country': 'Australia'}, 'LER': {'Name': 'Leinster Airport', 'City': 'Leinster', 'Country': 'Australia'}, 'LVO': {'Name': 'Laverton Airport', 'City': 'Laverton', 'Country': 'Australia'}, 'UBB': {'Name': 'Mabuiag Island Airport', 'City': 'Mabuiag Island', 'Country': 'Australia'}, 'MKR': {'Name': 'Meekatharra Airport', 'City': 'Meekatharra', 'Country': 'Australia'}, 'MIM': {'Name': 'Merimbula Airport', 'City': 'Merimbula', 'Country': 'Australia'}, 'MGT': {'Name': 'Milingimbi Airport', 'City': 'Milingimbi', 'Country': 'Australia'}, 'MNG': {'Name': 'Maningrida Airport', 'City': 'Maningrida', 'Country': 'Australia'}, 'MCV': {'Name': 'McArthur River Mine Airport', 'City': 'McArthur River Mine', 'Country': 'Australia'}, 'MQL': {'Name': 'Mildura Airport', 'City': 'Mildura', 'Country': 'Australia'}, 'MMG': {'Name': 'Mount Magnet Airport', 'City': 'Mount Magnet', 'Country': 'Australia'}, 'MRZ': {'Name': 'Moree Airport', 'City': 'Moree', 'Country': 'Australia'}, 'MOV': {'Name': 'Moranbah Airport', 'City': 'Moranbah', 'Country': 'Australia'}, 'MYA': {'Name': 'Moruya Airport', 'City': 'Moruya', 'Country': 'Australia'}, 'MGB': {'Name': 'Mount Gambier Airport', 'City': 'Mount Gambier', 'Country': 'Australia'}, 'ONG': {'Name': 'Mornington Island Airport', 'City': 'Mornington Island', 'Country': 'Australia'}, 'MYI': {'Name': 'Murray Island Airport', 'City': 'Murray Island', 'Country': 'Australia'}, 'MBH': {'Name': 'Maryborough Airport', 'City': 'Maryborough', 'Country': 'Australia'}, 'NRA': {'Name': 'Narrandera Airport', 'City': 'Narrandera', 'Country': 'Australia'}, 'NAA': {'Name': 'Narrabri Airport', 'City': 'Narrabri', 'Country': 'Australia'}, 'NTN': {'Name': 'Normanton Airport', 'City': 'Normanton', 'Country': 'Australia'}, 'ZNE': {'Name': 'Newman Airport', 'City': 'Newman', 'Country': 'Australia'}, 'OLP': {'Name': 'Olympic Dam Airport', 'City': 'Olympic Dam', 'Country': 'Australia'}, 'PUG': {'Name': 'Port Augusta Airport', 'City': 'Argyle', 'Country': 'Australia'}, 'PMK': {'Name': 'Palm Island Airport', 'City': 'Palm Island', 'Country': 'Australia'}, 'PBO': {'Name': 'Paraburdoo Airport', 'City': 'Paraburdoo', 'Country': 'Australia'}, 'CCK': {'Name': 'Cocos (Keeling) Islands Airport', 'City': 'Cocos Keeling Island', 'Country': 'Cocos (Keeling) Islands'}, 'GOV': {'Name': 'Gove Airport', 'City': 'Gove', 'Country': 'Australia'}, 'PKE': {'Name': 'Parkes Airport', 'City': 'Parkes', 'Country': 'Australia'}, 'PLO': {'Name': 'Port Lincoln Airport', 'City': 'Port Lincoln', 'Country': 'Australia'}, 'EDR': {'Name': 'Pormpuraaw Airport', 'City': 'Pormpuraaw', 'Country': 'Australia'}, 'PQQ': {'Name': 'Port Macquarie Airport', 'City': 'Port Macquarie', 'Country': 'Australia'}, 'PTJ': {'Name': 'Portland Airport', 'City': 'Portland', 'Country': 'Australia'}, 'ULP': {'Name': 'Quilpie Airport', 'City': 'Quilpie', 'Country': 'Australia'}, 'RAM': {'Name': 'Ramingining Airport', 'City': 'Ramingining', 'Country': 'Australia'}, 'RMA': {'Name': 'Roma Airport', 'City': 'Roma', 'Country': 'Australia'}, 'SGO': {'Name': 'St George Airport', 'City': 'St George', 'Country': 'Australia'}, 'MJK': {'Name': 'Shark Bay Airport', 'City': 'Shark Bay', 'Country': 'Australia'}, 'SBR': {'Name': 'Saibai Island Airport', 'City': 'Saibai Island', 'Country': 'Australia'}, 'SRN': {'Name': 'Strahan Airport', 'City': 'Strahan', 'Country': 'Australia'}, 'XTG': {'Name': 'Thargomindah Airport', 'City': 'Thargomindah', 'Country': 'Australia'}, 'TCA': {'Name': 'Tennant Creek Airport', 'City': 'Tennant Creek', 'Country': 'Australia'}, 'VCD': {'Name': 'Victoria River Downs Airport', 'City': 'Victoria River Downs', 'Country': 'Australia'}, 'SYU': {'Name': 'Warraber Island Airport', 'City': 'Sue Islet', 'Country': 'Australia'}, 'WNR': {'Name': 'Windorah Airport', 'City': 'Windorah', 'Country': 'Australia'}, 'WYA': {'Name': 'Whyalla Airport', 'City': 'Whyalla', 'Country': 'Australia'}, 'WUN': {'Name': 'Wiluna Airport', 'City': 'Wiluna', 'Country': 'Australia'}, 'WOL': {'Name': 'Wollongong Airport', 'City': 'Wollongong', 'Country': 'Australia'}, 'WIN': {'Name': 'Winton Airport', 'City': 'Winton', 'Country': 'Australia'}, 'BWT': {'Name': 'Wynyard Airport', 'City': 'Burnie', 'Country': 'Australia'}, 'OKR': {'Name': 'Yorke Island Airport', 'City': 'Yorke Island', 'Country': 'Australia'}, 'XMY': {'Name': 'Yam Island Airport', 'City': 'Yam Island', 'Country': 'Australia'}, 'NAY': {'Name': 'Beijing Nanyuan Airport', 'City': 'Beijing', 'Country': 'China'}, 'CIF': {'Name': 'Chifeng Airport', 'City': 'Chifeng', 'Country': 'China'}, 'CIH': {'Name': 'Changzhi Airport', 'City': 'Changzhi', 'Country': 'China'}, 'DAT': {'Name': 'Datong Airport', 'City': 'Datong', 'Country': 'China'}, 'HET': {'Name': 'Baita International Airport', 'City': 'Hohhot', 'Country': 'China'}, 'BAV': {'Name': 'Baotou Airport', 'City': 'Baotou', 'Country': 'China'}, 'SJW': {'Name': 'Shijiazhuang Daguocun International Airport', 'City': 'Shijiazhuang', 'Country': 'China'}, 'TGO': {'Name': 'Tongliao Airport', 'City': 'Tongliao', 'Country': 'China'}, 'HLH': {'Name': 'Ulanhot Airport', 'City': 'Ulanhot', 'Country': 'China'}, 'XIL': {'Name': 'Xilinhot Airport', 'City': 'Xilinhot', 'Country': 'China'}, 'BHY': {'Name': 'Beihai Airport', 'City': 'Beihai', 'Country': 'China'}, 'CGD': {'Name': 'Changde Airport', 'City': 'Changde', 'Country': 'China'}, 'DYG': {'Name': 'Dayong Airport', 'City': 'Dayong', 'Country': 'China'}, 'MXZ': {'Name': 'Meixian Airport', 'City': 'Meixian', 'Country': 'China'}, 'ZUH': {'Name': 'Zhuhai Jinwan Airport', 'City': 'Zhuhai', 'Country': 'China'}, 'LZH': {'Name': 'Liuzhou Bailian Airport', 'City': 'Liuzhou', 'Country': 'China'}, 'ZHA': {'Name': 'Zhanjiang Airport', 'City': 'Zhanjiang', 'Country': 'China'}, 'ENH': {'Name': 'Enshi Airport', 'City': 'Enshi', 'Country': 'China'}, 'NNY': {'Name': 'Nanyang Jiangying Airport', 'City': 'Nanyang', 'Country': 'China'}, 'XFN': {'Name': 'Xiangyang Liuji Airport', 'City': 'Xiangfan', 'Country': 'China'}, 'YIH': {'Name': 'Yichang Sanxia Airport', 'City': 'Yichang', 'Country': 'China'}, 'AKA': {'Name': 'Ankang Wulipu Airport', 'City': 'Ankang', 'Country': 'China'}, 'GOQ': {'Name': 'Golmud Airport', 'City': 'Golmud', 'Country': 'China'}, 'HZG': {'Name': 'Hanzhong Chenggu Airport', 'City': 'Hanzhong', 'Country': 'China'}, 'IQN': {'Name': 'Qingyang Airport', 'City': 'Qingyang', 'Country': 'China'}, 'XNN': {'Name': 'Xining Caojiabu Airport', 'City': 'Xining', 'Country': 'China'}, 'ENY': {'Name': "Yan'an Ershilipu Airport", 'City': "Yan'an", 'Country': 'China'}, 'UYN': {'Name': 'Yulin Yuyang Airport', 'City': 'Yulin', 'Country': 'China'}, 'AVK': {'Name': 'Arvaikheer Airport', 'City': 'Arvaikheer', 'Country': 'Mongolia'}, 'LTI': {'Name': 'Altai Airport', 'City': 'Altai', 'Country': 'Mongolia'}, 'BYN': {'Name': 'Bayankhongor Airport', 'City': 'Bayankhongor', 'Country': 'Mongolia'}, 'DLZ': {'Name': 'Dalanzadgad Airport', 'City': 'Dalanzadgad', 'Country': 'Mongolia'}, 'HVD': {'Name': 'Khovd Airport', 'City': 'Khovd', 'Country': 'Mongolia'}, 'MXV': {'Name': 'Mörön Airport', 'City': 'Muren', 'Country': 'Mongolia'}, 'DIG': {'Name': 'Diqing Airport', 'City': 'Shangri-La', 'Country': 'China'}, 'LUM': {'Name': 'Mangshi Airport', 'City': 'Luxi', 'Country': 'China'}, 'SYM': {'Name': "Pu'er Simao Airport", 'City': 'Simao', 'Country': 'China'}, 'ZAT': {'Name': 'Zhaotong Airport', 'City': 'Zhaotong', 'Country': 'China'}, 'KOW': {'Name': 'Ganzhou Airport', 'City': 'Ganzhou', 'Country': 'China'}, 'JDZ': {'Name': 'Jingdezhen Airport', 'City': 'Jingdezhen', 'Country': 'China'}, 'JIU': {'Name': 'Jiujiang Lushan Airport', 'City': 'Jiujiang', 'Country': 'China'}, 'JUZ': {'Name': 'Quzhou Airport', 'City': 'Quzhou', 'Country': 'China'}, 'LYG': {'Name': 'Lianyungang Airport', 'City': 'Lianyungang', 'Country': 'China'}, 'HYN': {'Name': 'Huangyan Luqiao Airport', 'City': 'Huangyan', 'Country': 'China'}, 'LYI': {'Name': 'Shubuling Airport', 'City': 'Linyi', 'Country': 'China'}, 'JJN': {'Name': 'Quanzhou Jinjiang International Airport', 'City': 'Quanzhou', 'Country': 'China'}, 'TXN': {'Name': 'Tunxi International Airport', 'City': 'Huangshan', 'Country': 'China'}, 'WEF': {'Name': 'Weifang Airport', 'City': 'Weifang', 'Country': 'China'}, 'WEH': {'Name': 'Weihai Airport', 'City': 'Weihai', 'Country': 'China'}, 'WUX': {'Name': 'Sunan Shuofang International Airport', 'City': 'Wuxi', 'Country': 'China'}, 'WUS': {'Name': 'Nanping Wuyishan Airport', 'City': 'Wuyishan', 'Country': 'China'}, 'WNZ': {'Name': 'Wenzhou Longwan International Airport', 'City': 'Wenzhou', 'Country': 'China'}, 'YNZ': {'Name': 'Yancheng Airport', 'City': 'Yancheng', 'Country': 'China'}, 'YIW': {'Name': 'Yiwu Airport', 'City': 'Yiwu', 'Country': 'China'}, 'HSN': {'Name': 'Zhoushan Airport', 'City': 'Zhoushan', 'Country': 'China'}, 'BPX': {'Name': 'Qamdo Bangda Airport', 'City': 'Bangda', 'Country': 'China'}, 'DAX': {'Name': 'Dachuan Airport', 'City': 'Dazhou', 'Country': 'China'}, 'GYS': {'Name': 'Guangyuan Airport', 'City': 'Guangyuan', 'Country': 'China'}, 'LZO': {'Name': 'Luzhou Airport', 'City': 'Luzhou', 'Country': 'China'}, 'MIG': {'Name': 'Mianyang Airport', 'City': 'Mianyang', 'Country': 'China'}, 'NAO': {'Name': 'Nanchong Airport', 'City': 'Nanchong', 'Country': 'China'}, 'LZY': {'Name': 'Nyingchi Airport', 'City': 'Nyingchi', 'Country': 'China'}, 'WXN': {'Name': 'Wanxian Airport', 'City': 'Wanxian', 'Country': 'China'}, 'AKU': {'Name': 'Aksu Airport', 'City': 'Aksu', 'Country': 'China'}, 'IQM': {'Name': 'Qiemo Yudu Airport', 'City': 'Qiemo', 'Country': 'China'}, 'KCA': {'Name': 'Kuqa Airport', 'City': 'Kuqa', 'Country': 'China'}, 'KRL': {'Name': 'Korla Airport', 'City': 'Korla', 'Country': 'China'}, 'KRY': {'Name': 'Karamay Airport', 'City': 'Karamay', 'Country': 'China'}, 'YIN': {'Name': 'Yining Airport', 'City': 'Yining', 'Country': 'China'}, 'HEK': {'Name': 'Heihe Airport', 'City': 'Heihe', 'Country': 'China'}, 'JMU': {'Name': 'Jiamusi Airport', 'City': 'Jiamusi', 'Country': 'China'}, 'JNZ': {'Name': 'Jinzhou Airport', 'City': 'Jinzhou', 'Country': 'China'}, 'NDG': {'Name': 'Qiqihar Sanjiazi Airport', 'City': 'Qiqihar', 'Country': 'China'}, 'YNJ': {'Name': 'Yanji Chaoyangchuan Airport', 'City': 'Yanji', 'Country': 'China'}, 'WKL': {'Name': 'Waikoloa Heliport', 'City': 'Waikoloa Village', 'Country': 'United States'}, 'WME': {'Name': 'Mount Keith Airport', 'City': 'Mount Keith', 'Country': 'Australia'}, 'LRV': {'Name': 'Los Roques Airport', 'City': 'Los Roques', 'Country': 'Venezuela'}, 'IOR': {'Name': 'Inishmore Aerodrome', 'City': 'Inis Mor', 'Country': 'Ireland'}, 'NNR': {'Name': 'Connemara Regional Airport', 'City': 'Indreabhan', 'Country': 'Ireland'}, 'GTI': {'Name': 'Rügen Airport', 'City': 'Ruegen', 'Country': 'Germany'}, 'EZV': {'Name': 'Berezovo Airport', 'City': 'Berezovo', 'Country': 'Russia'}, 'ORH': {'Name': 'Worcester Regional Airport', 'City': 'Worcester', 'Country': 'United States'}, 'AQG': {'Name': 'Anqing Tianzhushan Airport', 'City': 'Anqing', 'Country': 'China'}, 'SHP': {'Name': 'Shanhaiguan Airport', 'City': 'Qinhuangdao', 'Country': 'China'}, 'YCU': {'Name': 'Yuncheng Guangong Airport', 'City': 'Yuncheng', 'Country': 'China'}, 'JGN': {'Name': 'Jiayuguan Airport', 'City': 'Jiayuguan', 'Country': 'China'}, 'DDG': {'Name': 'Dandong Airport', 'City': 'Dandong', 'Country': 'China'}, 'DSN': {'Name': 'Ordos Ejin Horo Airport', 'City': 'Dongsheng', 'Country': 'China'}, 'PZI': {'Name': "Bao'anying Airport", 'City': 'Panzhihua', 'Country': 'China'}, 'PWT': {'Name': 'Bremerton National Airport', 'City': 'Bremerton', 'Country': 'United States'}, 'SPW': {'Name': 'Spencer Municipal Airport', 'City': 'Spencer', 'Country': 'United States'}, 'JEF': {'Name': 'Jefferson City Memorial Airport', 'City': 'Jefferson City', 'Country': 'United States'}, 'UNT': {'Name': 'Unst Airport', 'City': 'Unst', 'Country': 'United Kingdom'}, 'PVC': {'Name': 'Provincetown Municipal Airport', 'City': 'Provincetown', 'Country': 'United States'}, 'SBH': {'Name': 'Gustaf III Airport', 'City': 'Gustavia', 'Country': 'France'}, 'KMW': {'Name': 'Kostroma Sokerkino Airport', 'City': 'Kostroma', 'Country': 'Russia'}, 'SUI': {'Name': 'Sukhumi Dranda Airport', 'City': 'Sukhumi', 'Country': 'Georgia'}, 'TBW': {'Name': 'Donskoye Airport', 'City': 'Tambow', 'Country': 'Russia'}, 'OBN': {'Name': 'Oban Airport', 'City': 'North Connel', 'Country': 'United Kingdom'}, 'ERM': {'Name': 'Erechim Airport', 'City': 'Erechim', 'Country': 'Brazil'}, 'CVF': {'Name': 'Courchevel Airport', 'City': 'Courcheval', 'Country': 'France'}, 'FUL': {'Name': 'Fullerton Municipal Airport', 'City': 'Fullerton', 'Country': 'United States'}, 'USA': {'Name': 'Concord-Padgett Regional Airport', 'City': 'Concord', 'Country': 'United States'}, 'NVI': {'Name': 'Navoi Airport', 'City': 'Navoi', 'Country': 'Uzbekistan'}, 'QSF': {'Name': 'Ain Arnat Airport', 'City': 'Setif', 'Country': 'Algeria'}, 'LRH': {'Name': 'La Rochelle-Île de Ré Airport', 'City': 'La Rochelle', 'Country': 'France'}, 'SUN': {'Name': 'Friedman Memorial Airport', 'City': 'Hailey', 'Country': 'United States'}, 'MCW': {'Name': 'Mason City Municipal Airport', 'City': 'Mason City', 'Country': 'United States'}, 'AZA': {'Name': 'Phoenix-Mesa-Gateway Airport', 'City': 'Mesa', 'Country': 'United States'}, 'XAU': {'Name': 'Saúl Airport', 'City': 'Saul', 'Country': 'French Guiana'}, 'AKP': {'Name': 'Anaktuvuk Pass Airport', 'City': 'Anaktuvuk Pass', 'Country': 'United States'}, 'ANV': {'Name': 'Anvik Airport', 'City': 'Anvik', 'Country': 'United States'}, 'ATK': {'Name': 'Atqasuk Edward Burnell Sr Memorial Airport', 'City': 'Atqasuk', 'Country': 'United States'}, 'GAM': {'Name': 'Gambell Airport', 'City': 'Gambell', 'Country': 'United States'}, 'HPB': {'Name': 'Hooper Bay Airport', 'City': 'Hooper Bay', 'Country': 'United States'}, 'KAL': {'Name': 'Kaltag Airport', 'City': 'Kaltag', 'Country': 'United States'}, 'KSM': {'Name': "St Mary's Airport", 'City': "St Mary's", 'Country': 'United States'}, 'KVL': {'Name': 'Kivalina Airport', 'City': 'Kivalina', 'Country': 'United States'}, 'MYU': {'Name': 'Mekoryuk Airport', 'City': 'Mekoryuk', 'Country': 'United States'}, 'RBY': {'Name': 'Ruby Airport', 'City': 'Ruby', 'Country': 'United States'}, 'SHH': {'Name': 'Shishmaref Airport', 'City': 'Shishmaref', 'Country': 'United States'}, 'SVA': {'Name': 'Savoonga Airport', 'City': 'Savoonga', 'Country': 'United States'}, 'WTK': {'Name': 'Noatak Airport', 'City': 'Noatak', 'Country': 'United States'}, 'OMC': {'Name': 'Ormoc Airport', 'City': 'Ormoc City', 'Country': 'Philippines'}, 'YPX': {'Name': 'Puvirnituq Airport', 'City': 'Puvirnituq', 'Country': 'Canada'}, 'YTQ': {'Name': 'Tasiujaq Airport', 'City': 'Tasiujaq', 'Country': 'Canada'}, 'ARC': {'Name': 'Arctic Village Airport', 'City': 'Arctic Village', 'Country': 'United States'}, 'QOW': {'Name': 'Sam Mbakwe International Airport', 'City': 'Imo', 'Country': 'Nigeria'}, 'FON': {'Name': 'Arenal Airport', 'City': 'La Fortuna/San Carlos', 'Country': 'Costa Rica'}, 'TMU': {'Name': 'Tambor Airport', 'City': 'Nicoya', 'Country': 'Costa Rica'}, 'CYZ': {'Name': 'Cauayan Airport', 'City': 'Cauayan', 'Country': 'Philippines'}, 'KVK': {'Name': 'Kirovsk-Apatity Airport', 'City': 'Apatity', 'Country': 'Russia'}, 'GVR': {'Name': 'Coronel Altino Machado de Oliveira Airport', 'City': 'Governador Valadares', 'Country': 'Brazil'}, 'KPC': {'Name': 'Port Clarence Coast Guard Station', 'City': 'Port Clarence', 'Country': 'United States'}, 'PJA': {'Name': 'Pajala Airport', 'City': 'Pajala', 'Country': 'Sweden'}, 'QBC': {'Name': 'Bella Coola Airport', 'City': 'Bella Coola', 'Country': 'Canada'}, 'HGR': {'Name': 'Hagerstown Regional Richard A Henson Field', 'City': 'Hagerstown', 'Country': 'United States'}, 'ACR': {'Name': 'Araracuara Airport', 'City': 'Araracuara', 'Country': 'Colombia'}, 'GOP': {'Name': 'Gorakhpur Airport', 'City': 'Gorakhpur', 'Country': 'India'}, 'SDP': {'Name': 'Sand Point Airport', 'City': 'Sand Point', 'Country': 'United States'}, 'HMI': {'Name': 'Hami Airport', 'City': 'Hami', 'Country': 'China'}, 'WUZ': {'Name': 'Wuzhou Changzhoudao Airport', 'City': 'Wuzhou', 'Country': 'China'}, 'TBH': {'Name': 'Tugdan Airport', 'City': 'Romblon', 'Country': 'Philippines'}, 'ACP': {'Name': 'Sahand Airport', 'City': 'Maragheh', 'Country': 'Iran'}, 'GBT': {'Name': 'Gorgan Airport', 'City': 'Gorgan', 'Country': 'Iran'}, 'IIL': {'Name': 'Ilam Airport', 'City': 'Ilam', 'Country': 'Iran'}, 'PFQ': {'Name': 'Parsabade Moghan Airport', 'City': 'Parsabad', 'Country': 'Iran'}, 'TCG': {'Name': 'Tacheng Airport', 'City': 'Tacheng', 'Country': 'China'}, 'MQM': {'Name': 'Mardin Airport', 'City': 'Mardin', 'Country': 'Turkey'}, 'AFS': {'Name': 'Sugraly Airport', 'City': 'Zarafshan', 'Country': 'Uzbekistan'}, 'DRG': {'Name': 'Deering Airport', 'City': 'Deering', 'Country': 'United States'}, 'LEN': {'Name': 'Leon Airport', 'City': 'Leon', 'Country': 'Spain'}, 'RGS': {'Name': 'Burgos Airport', 'City': 'Burgos', 'Country': 'Spain'}, 'EGM': {'Name': 'Sege Airport', 'City': 'Sege', 'Country': 'Solomon Islands'}, 'CQD': {'Name': 'Shahrekord Airport', 'City': 'Shahre Kord', 'Country': 'Iran'}, 'DHM': {'Name': 'Kangra Airport', 'City': 'Kangra', 'Country': 'India'}, 'NDC': {'Name': 'Nanded Airport', 'City': 'Nanded', 'Country': 'India'}, 'SLV': {'Name': 'Shimla Airport', 'City': 'Shimla', 'Country': 'India'}, 'IGG': {'Name': 'Igiugig Airport', 'City': 'Igiugig', 'Country': 'United States'}, 'KNW': {'Name': 'New Stuyahok Airport', 'City': 'New Stuyahok', 'Country': 'United States'}, 'KVC': {'Name': 'King Cove Airport', 'City': 'King Cove', 'Country': 'United States'}, 'PTH': {'Name': 'Port Heiden Airport', 'City': 'Port Heiden', 'Country': 'United States'}, 'TOG': {'Name': 'Togiak Airport', 'City': 'Togiak Village', 'Country': 'United States'}, 'EGN': {'Name': 'Geneina Airport', 'City': 'Geneina', 'Country': 'Sudan'}, 'LKH': {'Name': 'Long Akah Airport', 'City': 'Long Akah', 'Country': 'Malaysia'}, 'WLH': {'Name': 'Walaha Airport', 'City': 'Walaha', 'Country': 'Vanuatu'}, 'CHG': {'Name': 'Chaoyang Airport', 'City': 'Chaoyang', 'Country': 'China'}, 'UAS': {'Name': 'Buffalo Spring', 'City': 'Samburu South', 'Country': 'Kenya'}, 'BHG': {'Name': 'Brus Laguna Airport', 'City': 'Brus Laguna', 'Country': 'Honduras'}, 'YVB': {'Name': 'Bonaventure Airport', 'City': 'Bonaventure', 'Country': 'Canada'}, 'SKT': {'Name': 'Sialkot Airport', 'City': 'Sialkot', 'Country': 'Pakistan'}, 'PDP': {'Name': 'Capitan Corbeta CA Curbelo International Airport', 'City': 'Punta del Este', 'Country': 'Uruguay'}, 'WVB': {'Name': 'Walvis Bay Airport', 'City': 'Walvis Bay', 'Country': 'Namibia'}, 'MPA': {'Name': 'Katima Mulilo Airport', 'City': 'Mpacha', 'Country': 'Namibia'}, 'AOE': {'Name': 'Anadolu Airport', 'City': 'Eskissehir', 'Country': 'Turkey'}, 'CKZ': {'Name': 'Çanakkale Airport', 'City': 'Canakkale', 'Country': 'Turkey'}, 'MSR': {'Name': 'Muş Airport', 'City': 'Mus', 'Country': 'Turkey'}, 'NOP': {'Name': 'Sinop Airport', 'City': 'Sinop', 'Country': 'Turkey'}, 'TEQ': {'Name': 'Tekirdağ Çorlu Airport', 'City': 'Çorlu', 'Country': 'Turkey'}, 'YEI': {'Name': 'Bursa Yenişehir Airport', 'City': 'Yenisehir', 'Country': 'Turkey'}, 'LSS': {'Name': 'Terre-de-Haut Airport', 'City': 'Les Saintes', 'Country': 'Guadeloupe'}, 'KMV': {'Name': 'Kalay Airport', 'City': 'Kalemyo', 'Country': 'Myanmar'}, 'VQS': {'Name': 'Vieques Airport', 'City': 'Vieques Island', 'Country': 'Puerto Rico'}, 'YIF': {'Name': 'St Augustin Airport', 'City': 'St-Augustin', 'Country': 'Canada'}, 'HDM': {'Name': 'Hamadan Airport', 'City': 'Hamadan', 'Country': 'Iran'}, 'MRQ': {'Name': 'Marinduque Airport', 'City': 'Gasan', 'Country': 'Philippines'}, 'GFN': {'Name': 'Grafton Airport', 'City': 'Grafton', 'Country': 'Australia'}, 'OAG': {'Name': 'Orange Airport', 'City': 'Orange', 'Country': 'Australia'}, 'TRO': {'Name': 'Taree Airport', 'City': 'Taree', 'Country': 'Australia'}, 'COQ': {'Name': 'Choibalsan Airport', 'City': 'Choibalsan', 'Country': 'Mongolia'}, 'HOH': {'Name': 'Hohenems-Dornbirn Airport', 'City': 'Hohenems', 'Country': 'Austria'}, 'ESC': {'Name': 'Delta County Airport', 'City': 'Escanaba', 'Country': 'United States'}, 'YAK': {'Name': 'Yakutat Airport', 'City': 'Yakutat', 'Country': 'United States'}, 'GUL': {'Name': 'Goulburn Airport', 'City': 'Goulburn', 'Country': 'Australia'}, 'CES': {'Name': 'Cessnock Airport', 'City': 'Cessnock', 'Country': 'Australia'}, 'NSO': {'Name': 'Scone Airport', 'City': 'Scone', 'Country': 'Australia'}, 'DGE': {'Name': 'Mudgee Airport', 'City': 'Mudgee', 'Country': 'Australia'}, 'MTL': {'Name': 'Maitland Airport', 'City': 'Maitland', 'Country': 'Australia'}, 'CPX': {'Name': 'Benjamin Rivera Noriega Airport', 'City': 'Culebra Island', 'Country': 'Puerto Rico'}, 'MWA': {'Name': 'Williamson County Regional Airport', 'City': 'Marion', 'Country': 'United States'}, 'OCN': {'Name': 'Oceanside Municipal Airport', 'City': 'Fraser Island', 'Country': 'Australia'}, 'KIK': {'Name': 'Kirkuk Air Base', 'City': 'Kirkuk', 'Country': 'Iraq'}, 'XJD': {'Name': 'Al Udeid Air Base', 'City': 'Doha', 'Country': 'Qatar'}, 'GBZ': {'Name': 'Great Barrier Aerodrome', 'City': 'Claris', 'Country': 'New Zealand'}, 'IMT': {'Name': 'Ford Airport', 'City': 'Iron Mountain', 'Country': 'United States'}, 'AET': {'Name': 'Allakaket Airport', 'City': 'Allakaket', 'Country': 'United States'}, 'MGC': {'Name': 'Michigan City Municipal Airport', 'City': 'Michigan City', 'Country': 'United States'}, 'SWD': {'Name': 'Seward Airport', 'City': 'Seward', 'Country': 'United States'}, 'GRM': {'Name': 'Grand Marais Cook County Airport', 'City': 'Grand Marais', 'Country': 'United States'}, 'AUW': {'Name': 'Wausau Downtown Airport', 'City': 'Wausau', 'Country': 'United States'}, 'MYP': {'Name': 'Mary Airport', 'City': 'Mary', 'Country': 'Turkmenistan'}, 'MVA': {'Name': 'Reykjahlíð Airport', 'City': 'Myvatn', 'Country': 'Iceland'}, 'QSA': {'Name': 'Sabadell Airport', 'City': 'Sabadell', 'Country': 'Spain'}, 'WSY': {'Name': 'Whitsunday Island Airport', 'City': 'Airlie Beach', 'Country': 'Australia'}, 'MIE': {'Name': 'Delaware County Johnson Field', 'City': 'Muncie', 'Country': 'United States'}, 'LAF': {'Name': 'Purdue University Airport', 'City': 'Lafayette', 'Country': 'United States'}, 'VGT': {'Name': 'North Las Vegas Airport', 'City': 'Las Vegas', 'Country': 'United States'}, 'ENW': {'Name': 'Kenosha Regional Airport', 'City': 'Kenosha', 'Country': 'United States'}, 'MTJ': {'Name': 'Montrose Regional Airport', 'City': 'Montrose CO', 'Country': 'United States'}, 'RIW': {'Name': 'Riverton Regional Airport', 'City': 'Riverton WY', 'Country': 'United States'}, 'PDT': {'Name': 'Eastern Oregon Regional At Pendleton Airport', 'City': 'Pendleton', 'Country': 'United States'}, 'LYM': {'Name': 'Lympne Airport', 'City': 'Lympne', 'Country': 'United Kingdom'}, 'PKH': {'Name': 'Porto Cheli Airport', 'City': 'Porto Heli', 'Country': 'Greece'}, 'KTR': {'Name': 'Tindal Airport', 'City': 'Katherine', 'Country': 'Australia'}, 'NOA': {'Name': 'Nowra Airport', 'City': 'Nowra', 'Country': 'Australia'}, 'UCK': {'Name': 'Lutsk Airport', 'City': 'Lutsk', 'Country': 'Ukraine'}, 'CEJ': {'Name': 'Chernihiv Shestovitsa Airport', 'City': 'Chernigov', 'Country': 'Ukraine'}, 'BQT': {'Name': 'Brest Airport', 'City': 'Brest', 'Country': 'Belarus'}, 'OSH': {'Name': 'Wittman Regional Airport', 'City': 'Oshkosh', 'Country': 'United States'}, 'AGE': {'Name': 'Wangerooge Airport', 'City': 'Wangerooge', 'Country': 'Germany'}, 'BXG': {'Name': 'Bendigo Airport', 'City': 'Bendigo', 'Country': 'Australia'}, 'EAT': {'Name': 'Pangborn Memorial Airport', 'City': 'Wenatchee', 'Country': 'United States'}, 'ARE': {'Name': 'Antonio Nery Juarbe Pol Airport', 'City': 'Arecibo', 'Country': 'Puerto Rico'}, 'RIN': {'Name': 'Ringi Cove Airport', 'City': 'Ringi Cove', 'Country': 'Solomon Islands'}, 'KCK': {'Name': 'Kirensk Airport', 'City': 'Kirensk', 'Country': 'Russia'}, 'UKX': {'Name': 'Ust-Kut Airport', 'City': 'Ust-Kut', 'Country': 'Russia'}, 'RMT': {'Name': 'Rimatara Airport', 'City': 'Rimatara', 'Country': 'French Polynesia'}, 'QLS': {'Name': 'Lausanne-Blécherette Airport', 'City': 'Lausanne', 'Country': 'Switzerland'}, 'ZJI': {'Name': 'Locarno Airport', 'City': 'Locarno', 'Country': 'Switzerland'}, 'QNC': {'Name': 'Neuchatel Airport', 'City': 'Neuchatel', 'Country': 'Switzerland'}, 'TGK': {'Name': 'Taganrog Yuzhny Airport', 'City': 'Taganrog', 'Country': 'Russia'}, 'GDZ': {'Name': 'Gelendzhik Airport', 'City': 'Gelendzhik', 'Country': 'Russia'}, 'ZIA': {'Name': 'Zhukovsky International Airport', 'City': 'Ramenskoe', 'Country': 'Russia'}, 'IAR': {'Name': 'Tunoshna Airport', 'City': 'Yaroslavl', 'Country': 'Russia'}, 'OHE': {'Name': 'Gu-Lian Airport', 'City': 'Mohe County', 'Country': 'China'}, 'JNG': {'Name': 'Jining Qufu Airport', 'City': 'Jining', 'Country': 'China'}, 'DRK': {'Name': 'Drake Bay Airport', 'City': 'Puntarenas', 'Country': 'Costa Rica'}, 'AAT': {'Name': 'Altay Air Base', 'City': 'Altay', 'Country': 'China'}, 'TZL': {'Name': 'Tuzla International Airport', 'City': 'Null', 'Country': 'Bosnia and Herzegovina'}, 'FWH': {'Name': 'NAS Fort Worth JRB/Carswell Field', 'City': 'Dallas', 'Country': 'United States'}, 'NYT': {'Name': 'Naypyidaw Airport', 'City': 'Naypyidaw', 'Country': 'Burma'}, 'VBP': {'Name': 'Bokpyinn Airport', 'City': 'Bokepyin', 'Country': 'Burma'}, 'NZH': {'Name': 'Manzhouli Xijiao Airport', 'City': 'Manzhouli', 'Country': 'China'}, 'WUA': {'Name': 'Wuhai Airport', 'City': 'Wuhai', 'Country': 'China'}, 'GYY': {'Name': 'Gary Chicago International Airport', 'City': 'Gary', 'Country': 'United States'}, 'BRD': {'Name': 'Brainerd Lakes Regional Airport', 'City': 'Brainerd', 'Country': 'United States'}, 'LWB': {'Name': 'Greenbrier Valley Airport', 'City': 'Lewisburg', 'Country': 'United States'}, 'PGV': {'Name': 'Pitt Greenville Airport', 'City': 'Greenville', 'Country': 'United States'}, 'CYF': {'Name': 'Chefornak Airport', 'City': 'Chefornak', 'Country': 'United States'}, 'OXR': {'Name': 'Oxnard Airport', 'City': 'Oxnard', 'Country': 'United States'}, 'BKG': {'Name': 'Branson Airport', 'City': 'Branson', 'Country': 'United States'}, 'TEN': {'Name': 'Tongren Fenghuang Airport', 'City': 'Tongren', 'Country': 'China'}, 'JGS': {'Name': 'Jinggangshan Airport', 'City': 'Jian', 'Country': 'China'}, 'NIU': {'Name': 'Naiu Airport', 'City': 'Niau', 'Country': 'French Polynesia'}, 'SCH': {'Name': 'Schenectady County Airport', 'City': 'Scotia NY', 'Country': 'United States'}, 'NBC': {'Name': 'Begishevo Airport', 'City': 'Nizhnekamsk', 'Country': 'Russia'}, 'QRW': {'Name': 'Warri Airport', 'City': 'Osubi', 'Country': 'Nigeria'}, 'IAO': {'Name': 'Siargao Airport', 'City': 'Siargao', 'Country': 'Philippines'}, 'LGO': {'Name': 'Langeoog Airport', 'City': 'Langeoog', 'Country': 'Germany'}, 'NLP': {'Name': 'Nelspruit Airport', 'City': 'Nelspruit', 'Country': 'South Africa'}, 'CKC': {'Name': 'Cherkasy International Airport', 'City': 'Cherkassy', 'Country': 'Ukraine'}, 'UST': {'Name': 'Northeast Florida Regional Airport', 'City': 'St. Augustine Airport', 'Country': 'United States'}, 'NLV': {'Name': 'Mykolaiv International Airport', 'City': 'Nikolayev', 'Country': 'Ukraine'}, 'RHP': {'Name': 'Ramechhap Airport', 'City': 'Ramechhap', 'Country': 'Nepal'}, 'STS': {'Name': 'Charles M. Schulz Sonoma County Airport', 'City': 'Santa Rosa', 'Country': 'United States'}, 'ISM': {'Name': 'Kissimmee Gateway Airport', 'City': 'Kissimmee', 'Country': 'United States'}, 'LCQ': {'Name': 'Lake City Gateway Airport', 'City': 'Lake City', 'Country': 'United States'}, 'LGU': {'Name': 'Logan-Cache Airport', 'City': 'Logan', 'Country': 'United States'}, 'BMC': {'Name': 'Brigham City Regional Airport', 'City': 'Brigham City', 'Country': 'United States'}, 'ASE': {'Name': 'Aspen-Pitkin Co/Sardy Field', 'City': 'Aspen', 'Country': 'United States'}, 'ULV': {'Name': 'Ulyanovsk Baratayevka Airport', 'City': 'Ulyanovsk', 'Country': 'Russia'}, 'ERV': {'Name': 'Kerrville Municipal Louis Schreiner Field', 'City': 'Kerrville', 'Country': 'United States'}, 'GED': {'Name': 'Sussex County Airport', 'City': 'Georgetown', 'Country': 'United States'}, 'ZSW': {'Name': 'Prince Rupert/Seal Cove Seaplane Base', 'City': 'Prince Rupert', 'Country': 'Canada'}, 'GBD': {'Name': 'Great Bend Municipal Airport', 'City': 'Great Bend', 'Country': 'United States'}, 'HYS': {'Name': 'Hays Regional Airport', 'City': 'Hays', 'Country': 'United States'}, 'SUS': {'Name': 'Spirit of St Louis Airport', 'City': 'Null', 'Country': 'United States'}, 'LYU': {'Name': 'Ely Municipal Airport', 'City': 'Ely', 'Country': 'United States'}, 'GPZ': {'Name': 'Grand Rapids Itasca Co-Gordon Newstrom field', 'City': 'Grand Rapids MN', 'Country': 'United States'}, 'TVF': {'Name': 'Thief River Falls Regional Airport', 'City': 'Thief River Falls', 'Country': 'United States'}, 'EGV': {'Name': 'Eagle River Union Airport', 'City': 'Eagle River', 'Country': 'United States'}, 'ARV': {'Name': 'Lakeland-Noble F. Lee Memorial field', 'City': 'Minocqua - Woodruff', 'Country': 'United States'}, 'YBV': {'Name': 'Berens River Airport', 'City': 'Berens River', 'Country': 'Canada'}, 'AVX': {'Name': 'Catalina Airport', 'City': 'Catalina Island', 'Country': 'United States'}, 'MHV': {'Name': 'Mojave Airport', 'City': 'Mojave', 'Country': 'United States'}, 'ZIN': {'Name': 'Interlaken Air Base', 'City': 'Interlaken', 'Country': 'Switzerland'}, 'INQ': {'Name': 'Inisheer Aerodrome', 'City': 'Inisheer', 'Country': 'Ireland'}, 'SWT': {'Name': 'Strezhevoy Airport', 'City': 'Strezhevoy', 'Country': 'Russia'}, 'HUT': {'Name': 'Hutchinson Municipal Airport', 'City': 'Hutchinson', 'Country': 'United States'}, 'OAI': {'Name': 'Bagram Air Base', 'City': 'Kabul', 'Country': 'Afghanistan'}, 'AKH': {'Name': 'Prince Sultan Air Base', 'City': 'Al Kharj', 'Country': 'Saudi Arabia'}, 'STJ': {'Name': 'Rosecrans Memorial Airport', 'City': 'Rosecrans', 'Country': 'United States'}, 'VOK': {'Name': 'Volk Field', 'City': 'Camp Douglas', 'Country': 'United States'}, 'GUC': {'Name': 'Gunnison Crested Butte Regional Airport', 'City': 'Gunnison', 'Country': 'United States'}, 'SIA': {'Name': "Xi'an Xiguan Airport", 'City': "Xi\\'AN", 'Country': 'China'}, 'TOA': {'Name': 'Zamperini Field', 'City': 'Torrance', 'Country': 'United States'}, 'MBL': {'Name': 'Manistee Co Blacker Airport', 'City': 'Manistee', 'Country': 'United States'}, 'PGD': {'Name': 'Charlotte County Airport', 'City': 'Punta Gorda', 'Country': 'United States'}, 'WFK': {'Name': 'Northern Aroostook Regional Airport', 'City': 'Frenchville', 'Country': 'United States'}, 'JHW': {'Name': 'Chautauqua County-Jamestown Airport', 'City': 'Jamestown', 'Country': 'United States'}, 'YTM': {'Name': 'La Macaza / Mont-Tremblant International Inc Airport', 'City': 'Mont-Tremblant', 'Country': 'Canada'}, 'SME': {'Name': 'Lake Cumberland Regional Airport', 'City': 'Somerset', 'Country': 'United States'}, 'SHD': {'Name': 'Shenandoah Valley Regional Airport', 'City': 'Weyers Cave', 'Country': 'United States'}, 'DVL': {'Name': 'Devils Lake Regional Airport', 'City': 'Devils Lake', 'Country': 'United States'}, 'DIK': {'Name': 'Dickinson Theodore Roosevelt Regional Airport', 'City': 'Dickinson', 'Country': 'United States'}, 'SDY': {'Name': 'Sidney - Richland Regional Airport', 'City': 'Sidney', 'Country': 'United States'}, 'CDR': {'Name': 'Chadron Municipal Airport', 'City': 'Chadron', 'Country': 'United States'}, 'AIA': {'Name': 'Alliance Municipal Airport', 'City': 'Alliance', 'Country': 'United States'}, 'MCK': {'Name': 'Mc Cook Ben Nelson Regional Airport', 'City': 'McCook', 'Country': 'United States'}, 'MTH': {'Name': 'The Florida Keys Marathon Airport', 'City': 'Marathon', 'Country': 'United States'}, 'GDV': {'Name': 'Dawson Community Airport', 'City': 'Glendive', 'Country': 'United States'}, 'OLF': {'Name': 'L M Clayton Airport', 'City': 'Wolf Point', 'Country': 'United States'}, 'WYS': {'Name': 'Yellowstone Airport', 'City': 'West Yellowstone', 'Country': 'United States'}, 'ALS': {'Name': 'San Luis Valley Regional Bergman Field', 'City': 'Alamosa', 'Country': 'United States'}, 'CNY': {'Name': 'Canyonlands Field', 'City': 'Moab', 'Country': 'United States'}, 'ELY': {'Name': 'Ely Airport Yelland Field', 'City': 'Ely', 'Country': 'United States'}, 'VEL': {'Name': 'Vernal Regional Airport', 'City': 'Vernal', 'Country': 'United States'}, 'RUI': {'Name': 'Sierra Blanca Regional Airport', 'City': 'Ruidoso', 'Country': 'United States'}, 'SOW': {'Name': 'Show Low Regional Airport', 'City': 'Show Low', 'Country': 'United States'}, 'MYL': {'Name': 'McCall Municipal Airport', 'City': 'McCall', 'Country': 'United States'}, 'SMN': {'Name': 'Lemhi County Airport', 'City': 'Salmon', 'Country': 'United States'}, 'MMH': {'Name': 'Mammoth Yosemite Airport', 'City': 'Mammoth Lakes', 'Country': 'United States'}, 'FRD': {'Name': 'Friday Harbor Airport', 'City': 'Friday Harbor', 'Country': 'United States'}, 'ESD': {'Name': 'Orcas Island Airport', 'City': 'Eastsound', 'Country': 'United States'}, 'AST': {'Name': 'Astoria Regional Airport', 'City': 'Astoria', 'Country': 'United States'}, 'ONP': {'Name': 'Newport Municipal Airport', 'City': 'Newport', 'Country': 'United States'}, 'EMK': {'Name': 'Emmonak Airport', 'City': 'Emmonak', 'Country': 'United States'}, 'UNK': {'Name': 'Unalakleet Airport', 'City': 'Unalakleet', 'Country': 'United States'}, 'UUK': {'Name': 'Ugnu-Kuparuk Airport', 'City': 'Kuparuk', 'Country': 'United States'}, 'SHX': {'Name': 'Shageluk Airport', 'City': 'Shageluk', 'Country': 'United States'}, 'CHU': {'Name': 'Chuathbaluk Airport', 'City': 'Chuathbaluk', 'Country': 'United States'}, 'NUI': {'Name': 'Nuiqsut Airport', 'City': 'Nuiqsut', 'Country': 'United States'}, 'EEK': {'Name': 'Eek Airport', 'City': 'Eek', 'Country': 'United States'}, 'KUK': {'Name': 'Kasigluk Airport', 'City': 'Kasigluk', 'Country': 'United States'}, 'KWT': {'Name': 'Kwethluk Airport', 'City': 'Kwethluk', 'Country': 'United States'}, 'KWK': {'Name': 'Kwigillingok Airport', 'City': 'Kwigillingok', 'Country': 'United States'}, 'MLL': {'Name': 'Marshall Don Hunter Sr Airport', 'City': 'Marshall', 'Country': 'United States'}, 'RSH': {'Name': 'Russian Mission Airport', 'City': 'Russian Mission', 'Country': 'United States'}, 'KGK': {'Name': 'Koliganek Airport', 'City': 'Koliganek', 'Country': 'United States'}, 'KMO': {'Name': 'Manokotak Airport', 'City': 'Manokotak', 'Country': 'United States'}, 'CIK': {'Name': 'Chalkyitsik Airport', 'City': 'Chalkyitsik', 'Country': 'United States'}, 'EAA': {'Name': 'Eagle Airport', 'City': 'Eagle', 'Country': 'United States'}, 'HUS': {'Name': 'Hughes Airport', 'City': 'Hughes', 'Country': 'United States'}, 'HSL': {'Name': 'Huslia Airport', 'City': 'Huslia', 'Country': 'United States'}, 'NUL': {'Name': 'Nulato Airport', 'City': 'Nulato', 'Country': 'United States'}, 'VEE': {'Name': 'Venetie Airport', 'City': 'Venetie', 'Country': 'United States'}, 'WBQ': {'Name': 'Beaver Airport', 'City': 'Beaver', 'Country': 'United States'}, 'CEM': {'Name': 'Central Airport', 'City': 'Central', 'Country': 'United States'}, 'SHG': {'Name': 'Shungnak Airport', 'City': 'Shungnak', 'Country': 'United States'}, 'IYK': {'Name': 'Inyokern Airport', 'City': 'Inyokern', 'Country': 'United States'}, 'VIS': {'Name': 'Visalia Municipal Airport', 'City': 'Visalia', 'Country': 'United States'}, 'MCE': {'Name': 'Merced Regional Macready Field', 'City': 'Merced', 'Country': 'United States'}, 'CYR': {'Name': 'Laguna de Los Patos International Airport', 'City': 'Colonia', 'Country': 'Uruguay'}, 'CPQ': {'Name': 'Amarais Airport', 'City': 'Campinas', 'Country': 'Brazil'}, 'GYR': {'Name': 'Phoenix Goodyear Airport', 'City': 'Goodyear', 'Country': 'United States'}, 'TWB': {'Name': 'Toowoomba Airport', 'City': 'Toowoomba', 'Country': 'Australia'}, 'BBL': {'Name': 'Ballera Airport', 'City': 'Ballera', 'Country': 'Australia'}, 'AYK': {'Name': 'Arkalyk North Airport', 'City': 'Arkalyk', 'Country': 'Kazakhstan'}, 'AGN': {'Name': 'Angoon Seaplane Base', 'City': 'Angoon', 'Country': 'United States'}, 'ELV': {'Name': 'Elfin Cove Seaplane Base', 'City': 'Elfin Cove', 'Country': 'United States'}, 'FNR': {'Name': 'Funter Bay Seaplane Base', 'City': 'Funter Bay', 'Country': 'United States'}, 'HNH': {'Name': 'Hoonah Airport', 'City': 'Hoonah', 'Country': 'United States'}, 'MTM': {'Name': 'Metlakatla Seaplane Base', 'City': 'Metakatla', 'Country': 'United States'}, 'HYG': {'Name': 'Hydaburg Seaplane Base', 'City': 'Hydaburg', 'Country': 'United States'}, 'EGX': {'Name': 'Egegik Airport', 'City': 'Egegik', 'Country': 'United States'}, 'KPV': {'Name': 'Perryville Airport', 'City': 'Perryville', 'Country': 'United States'}, 'PIP': {'Name': 'Pilot Point Airport', 'City': 'Pilot Point', 'Country': 'United States'}, 'WSN': {'Name': 'South Naknek Nr 2 Airport', 'City': 'South Naknek', 'Country': 'United States'}, 'AKK': {'Name': 'Akhiok Airport', 'City': 'Akhiok', 'Country': 'United States'}, 'KYK': {'Name': 'Karluk Airport', 'City': 'Karluk', 'Country': 'United States'}, 'KLN': {'Name': 'Larsen Bay Airport', 'City': 'Larsen Bay', 'Country': 'United States'}, 'ABL': {'Name': 'Ambler Airport', 'City': 'Ambler', 'Country': 'United States'}, 'BKC': {'Name': 'Buckland Airport', 'City': 'Buckland', 'Country': 'United States'}, 'IAN': {'Name': 'Bob Baker Memorial Airport', 'City': 'Kiana', 'Country': 'United States'}, 'OBU': {'Name': 'Kobuk Airport', 'City': 'Kobuk', 'Country': 'United States'}, 'ORV': {'Name': 'Robert (Bob) Curtis Memorial Airport', 'City': 'Noorvik', 'Country': 'United States'}, 'WLK': {'Name': 'Selawik Airport', 'City': 'Selawik', 'Country': 'United States'}, 'KTS': {'Name': 'Brevig Mission Airport', 'City': 'Brevig Mission', 'Country': 'United States'}, 'ELI': {'Name': 'Elim Airport', 'City': 'Elim', 'Country': 'United States'}, 'GLV': {'Name': 'Golovin Airport', 'City': 'Golovin', 'Country': 'United States'}, 'TLA': {'Name': 'Teller Airport', 'City': 'Teller', 'Country': 'United States'}, 'WAA': {'Name': 'Wales Airport', 'City': 'Wales', 'Country': 'United States'}, 'WMO': {'Name': 'White Mountain Airport', 'City': 'White Mountain', 'Country': 'United States'}, 'KKA': {'Name': 'Koyuk Alfred Adams Airport', 'City': 'Koyuk', 'Country': 'United States'}, 'SMK': {'Name': 'St Michael Airport', 'City': 'St. Michael', 'Country': 'United States'}, 'SKK': {'Name': 'Shaktoolik Airport', 'City': 'Shaktoolik', 'Country': 'United States'}, 'TNC': {'Name': 'Tin City Long Range Radar Station Airport', 'City': 'Tin City', 'Country': 'United States'}, 'AKB': {'Name': 'Atka Airport', 'City': 'Atka', 'Country': 'United States'}, 'IKO': {'Name': 'Nikolski Air Station', 'City': 'Nikolski', 'Country': 'United States'}, 'CYT': {'Name': 'Yakataga Airport', 'City': 'Yakataga', 'Country': 'United States'}, 'AUK': {'Name': 'Alakanuk Airport', 'City': 'Alakanuk', 'Country': 'United States'}, 'KPN': {'Name': 'Kipnuk Airport', 'City': 'Kipnuk', 'Country': 'United States'}, 'KFP': {'Name': 'False Pass Airport', 'City': 'False Pass', 'Country': 'United States'}, 'NLG': {'Name': 'Nelson Lagoon Airport', 'City': 'Nelson Lagoon', 'Country': 'United States'}, 'PML': {'Name': 'Port Moller Airport', 'City': 'Cold Bay', 'Country': 'United States'}, 'KLW': {'Name': 'Klawock Airport', 'City': 'Klawock', 'Country': 'United States'}, 'KWN': {'Name': 'Quinhagak Airport', 'City': 'Quinhagak', 'Country': 'United States'}, 'KOT': {'Name': 'Kotlik Airport', 'City': 'Kotlik', 'Country': 'United States'}, 'KYU': {'Name': 'Koyukuk Airport', 'City': 'Koyukuk', 'Country': 'United States'}, 'SCM': {'Name': 'Scammon Bay Airport', 'City': 'Scammon Bay', 'Country': 'United States'}, 'NNL': {'Name': 'Nondalton Airport', 'City': 'Nondalton', 'Country': 'United States'}, 'KKH': {'Name': 'Kongiganak Airport', 'City': 'Kongiganak', 'Country': 'United States'}, 'NIB': {'Name': 'Nikolai Airport', 'City': 'Nikolai', 'Country': 'United States'}, 'AKI': {'Name': 'Akiak Airport', 'City': 'Akiak', 'Country': 'United States'}, 'AIN': {'Name': 'Wainwright Airport', 'City': 'Wainwright', 'Country': 'United States'}, 'APZ': {'Name': 'Zapala Airport', 'City': 'ZAPALA', 'Country': 'Argentina'}, 'RDS': {'Name': 'Rincon De Los Sauces Airport', 'City': 'Rincon de los Sauces', 'Country': 'Argentina'}, 'PNT': {'Name': 'Tte. Julio Gallardo Airport', 'City': 'Puerto Natales', 'Country': 'Chile'}, 'SGV': {'Name': 'Sierra Grande Airport', 'City': 'Sierra Grande', 'Country': 'Argentina'}, 'IGB': {'Name': 'Cabo F.A.A. H. R. Bordón Airport', 'City': 'Ingeniero Jacobacci', 'Country': 'Argentina'}, 'NCN': {'Name': 'Chenega Bay Airport', 'City': 'Chenega', 'Country': 'United States'}, 'TKJ': {'Name': 'Tok Junction Airport', 'City': 'Tok', 'Country': 'United States'}, 'IRC': {'Name': 'Circle City /New/ Airport', 'City': 'Circle', 'Country': 'United States'}, 'SLQ': {'Name': 'Sleetmute Airport', 'City': 'Sleetmute', 'Country': 'United States'}, 'LMA': {'Name': 'Minchumina Airport', 'City': 'Lake Minchumina', 'Country': 'United States'}, 'MLY': {'Name': 'Manley Hot Springs Airport', 'City': 'Manley Hot Springs', 'Country': 'United States'}, 'YNP': {'Name': 'Natuashish Airport', 'City': 'Natuashish', 'Country': 'Canada'}, 'YSO': {'Name': 'Postville Airport', 'City': 'Postville', 'Country': 'Canada'}, 'YWB': {'Name': 'Kangiqsujuaq (Wakeham Bay) Airport', 'City': 'Kangiqsujuaq', 'Country': 'Canada'}, 'YTF': {'Name': 'Alma Airport', 'City': 'Alma', 'Country': 'Canada'}, 'YGV': {'Name': 'Havre St Pierre Airport', 'City': 'Havre-Saint-Pierre', 'Country': 'Canada'}, 'YXK': {'Name': 'Rimouski Airport', 'City': 'Rimouski', 'Country': 'Canada'}, 'XTL': {'Name': 'Tadoule Lake Airport', 'City': 'Tadoule Lake', 'Country': 'Canada'}, 'XLB': {'Name': 'Lac Brochet Airport', 'City': 'Lac Brochet', 'Country': 'Canada'}, 'XSI': {'Name': 'South Indian Lake Airport', 'City': 'South Indian Lake', 'Country': 'Canada'}, 'YBT': {'Name': 'Brochet Airport', 'City': 'Brochet', 'Country': 'Canada'}, 'ZGR': {'Name': 'Little Grand Rapids Airport', 'City': 'Little Grand Rapids', 'Country': 'Canada'}, 'YCR': {'Name': 'Cross Lake (Charlie Sinclair Memorial) Airport', 'City': 'Cross Lake', 'Country': 'Canada'}, 'YRS': {'Name': 'Red Sucker Lake Airport', 'City': 'Red Sucker Lake', 'Country': 'Canada'}, 'YOP': {'Name': 'Rainbow Lake Airport', 'City': 'Rainbow Lake', 'Country': 'Canada'}, 'YBY': {'Name': 'Bonnyville Airport', 'City': 'Bonnyville', 'Country': 'Canada'}, 'ZNA': {'Name': 'Nanaimo Harbour Water Airport', 'City': 'Nanaimo', 'Country': 'Canada'}, 'YGG': {'Name': 'Ganges Seaplane Base', 'City': 'Ganges', 'Country': 'Canada'}, 'YDT': {'Name': 'Boundary Bay Airport', 'City': 'Boundary Bay', 'Country': 'Canada'}, 'YLY': {'Name': 'Langley Airport', 'City': 'Langley Township', 'Country': 'Canada'}, 'YFJ': {'Name': 'Wekweètì Airport', 'City': 'Wekweeti', 'Country': 'Canada'}, 'RNI': {'Name': 'Corn Island', 'City': 'Corn Island', 'Country': 'Nicaragua'}, 'BZA': {'Name': 'San Pedro Airport', 'City': 'Bonanza', 'Country': 'Nicaragua'}, 'RFS': {'Name': 'Rosita Airport', 'City': 'Rosita', 'Country': 'Nicaragua'}, 'SIU': {'Name': 'Siuna', 'City': 'Siuna', 'Country': 'Nicaragua'}, 'WSP': {'Name': 'Waspam Airport', 'City': 'Waspam', 'Country': 'Nicaragua'}, 'NCR': {'Name': 'San Carlos', 'City': 'San Carlos', 'Country': 'Nicaragua'}, 'PLD': {'Name': 'Playa Samara/Carrillo Airport', 'City': 'Carrillo', 'Country': 'Costa Rica'}, 'COZ': {'Name': 'Constanza - Expedición 14 de Junio National Airport', 'City': 'Constanza', 'Country': 'Dominican Republic'}, 'NEG': {'Name': 'Negril Airport', 'City': 'Negril', 'Country': 'Jamaica'}, 'NRR': {'Name': 'José Aponte de la Torre Airport', 'City': 'Ceiba', 'Country': 'Puerto Rico'}, 'SPB': {'Name': 'Charlotte Amalie Harbor Seaplane Base', 'City': 'Charlotte Amalie', 'Country': 'Virgin Islands'}, 'ARR': {'Name': 'D. Casimiro Szlapelis Airport', 'City': 'Alto Rio Senguer', 'Country': 'Argentina'}, 'JSM': {'Name': 'Jose De San Martin Airport', 'City': 'Jose de San Martin', 'Country': 'Argentina'}, 'UYU': {'Name': 'Uyuni Airport', 'City': 'Uyuni', 'Country': 'Bolivia'}, 'RBQ': {'Name': 'Rurenabaque Airport', 'City': 'Rerrenabaque', 'Country': 'Bolivia'}, 'ABF': {'Name': 'Abaiang Airport', 'City': 'Abaiang Atoll', 'Country': 'Kiribati'}, 'ABN': {'Name': 'Albina Airport', 'City': 'Albina', 'Country': 'Suriname'}, 'DRJ': {'Name': 'Drietabbetje Airport', 'City': 'Drietabbetje', 'Country': 'Suriname'}, 'MOJ': {'Name': 'Moengo Airstrip', 'City': 'Moengo', 'Country': 'Suriname'}, 'ICK': {'Name': 'Nieuw Nickerie Airport', 'City': 'Nieuw Nickerie', 'Country': 'Suriname'}, 'OEM': {'Name': 'Vincent Fayks Airport', 'City': 'Paloemeu', 'Country': 'Suriname'}, 'SMZ': {'Name': 'Stoelmanseiland Airport', 'City': 'Stoelmans Eiland', 'Country': 'Suriname'}, 'TOT': {'Name': 'Totness Airport', 'City': 'Totness', 'Country': 'Suriname'}, 'AGI': {'Name': 'Wageningen Airstrip', 'City': 'Wageningen', 'Country': 'Suriname'}, 'ORJ': {'Name': 'Orinduik Airport', 'City': 'Orinduik', 'Country': 'Guyana'}, 'NAI': {'Name': 'Annai Airport', 'City': 'Annai', 'Country': 'Guyana'}, 'IMB': {'Name': 'Imbaimadai Airport', 'City': 'Imbaimadai', 'Country': 'Guyana'}, 'KAR': {'Name': 'Kamarang Airport', 'City': 'Kamarang', 'Country': 'Guyana'}, 'USI': {'Name': 'Mabaruma Airport', 'City': 'Mabaruma', 'Country': 'Guyana'}, 'MHA': {'Name': 'Mahdia Airport', 'City': 'Mahdia', 'Country': 'Guyana'}, 'PJC': {'Name': 'Dr Augusto Roberto Fuster International Airport', 'City': 'Pedro Juan Caballero', 'Country': 'Paraguay'}, 'ACD': {'Name': 'Alcides Fernández Airport', 'City': 'Acandi', 'Country': 'Colombia'}, 'RVE': {'Name': 'Los Colonizadores Airport', 'City': 'Saravena', 'Country': 'Colombia'}, 'BQJ': {'Name': 'Batagay Airport', 'City': 'Batagay', 'Country': 'Russia'}, 'VGZ': {'Name': 'Villa Garzón Airport', 'City': 'Villa Garzon', 'Country': 'Colombia'}, 'EBG': {'Name': 'El Bagre Airport', 'City': 'El Bagre', 'Country': 'Colombia'}, 'CAQ': {'Name': 'Juan H White Airport', 'City': 'Caucasia', 'Country': 'Colombia'}, 'COG': {'Name': 'Mandinga Airport', 'City': 'Condoto', 'Country': 'Colombia'}, 'TLU': {'Name': 'Golfo de Morrosquillo Airport', 'City': 'Tolu', 'Country': 'Colombia'}, 'CFB': {'Name': 'Cabo Frio Airport', 'City': 'Cabo Frio', 'Country': 'Brazil'}, 'OPS': {'Name': 'Presidente João Batista Figueiredo Airport', 'City': 'Sinop', 'Country': 'Brazil'}, 'GRP': {'Name': 'Gurupi Airport', 'City': 'Gurupi', 'Country': 'Brazil'}, 'CMP': {'Name': 'Santana do Araguaia Airport', 'City': 'Santana do Araguaia', 'Country': 'Brazil'}, 'BVS': {'Name': 'Breves Airport', 'City': 'Breves', 'Country': 'Brazil'}, 'SFK': {'Name': 'Soure Airport', 'City': 'Soure', 'Country': 'Brazil'}, 'PIN': {'Name': 'Parintins Airport', 'City': 'Parintins', 'Country': 'Brazil'}, 'BRA': {'Name': 'Barreiras Airport', 'City': 'Barreiras', 'Country': 'Brazil'}, 'STZ': {'Name': 'Santa Terezinha Airport', 'City': 'Santa Terezinha', 'Country': 'Brazil'}, 'MQH': {'Name': 'Minaçu Airport', 'City': 'Minacu', 'Country': 'Brazil'}, 'AUX': {'Name': 'Araguaína Airport', 'City': 'Araguaina', 'Country': 'Brazil'}, 'NVP': {'Name': 'Novo Aripuanã Airport', 'City': 'Novo Aripuana', 'Country': 'Brazil'}, 'FRC': {'Name': 'Tenente Lund Pressoto Airport', 'City': 'Franca', 'Country': 'Brazil'}, 'DOU': {'Name': 'Dourados Airport', 'City': 'Dourados', 'Country': 'Brazil'}, 'LBR': {'Name': 'Lábrea Airport', 'City': 'Labrea', 'Country': 'Brazil'}, 'ROO': {'Name': 'Maestro Marinho Franco Airport', 'City': 'Rondonopolis', 'Country': 'Brazil'}, 'GPB': {'Name': 'Tancredo Thomas de Faria Airport', 'City': 'Guarapuava', 'Country': 'Brazil'}, 'JCB': {'Name': 'Santa Terezinha Airport', 'City': 'Joacaba', 'Country': 'Brazil'}, 'RVD': {'Name': 'General Leite de Castro Airport', 'City': 'Rio Verde', 'Country': 'Brazil'}, 'AAX': {'Name': 'Romeu Zema Airport', 'City': 'Araxa', 'Country': 'Brazil'}, 'MBZ': {'Name': 'Maués Airport', 'City': 'Maues', 'Country': 'Brazil'}, 'RBB': {'Name': 'Borba Airport', 'City': 'Borba', 'Country': 'Brazil'}, 'CIZ': {'Name': 'Coari Airport', 'City': 'Coari', 'Country': 'Brazil'}, 'BAZ': {'Name': 'Barcelos Airport', 'City': 'Barcelos', 'Country': 'Brazil'}, 'DMT': {'Name': 'Diamantino Airport', 'City': 'Diamantino', 'Country': 'Brazil'}, 'GNM': {'Name': 'Guanambi Airport', 'City': 'Guanambi', 'Country': 'Brazil'}, 'QDJ': {'Name': 'Tsletsi Airport', 'City': 'Djelfa', 'Country': 'Algeria'}, 'NZA': {'Name': 'Nzagi Airport', 'City': 'Nzagi', 'Country': 'Angola'}, 'LBZ': {'Name': 'Lucapa Airport', 'City': 'Lucapa', 'Country': 'Angola'}, 'KNP': {'Name': 'Capanda Airport', 'City': 'Kapanda', 'Country': 'Angola'}, 'AMC': {'Name': 'Am Timan Airport', 'City': 'Am Timan', 'Country': 'Chad'}, 'GSQ': {'Name': 'Shark El Oweinat International Airport', 'City': 'Sharq Al-Owainat', 'Country': 'Egypt'}, 'MRB': {'Name': 'Eastern WV Regional Airport/Shepherd Field', 'City': 'Martinsburg', 'Country': 'United States'}, 'AWA': {'Name': 'Awassa Airport', 'City': 'Awasa', 'Country': 'Ethiopia'}, 'JIJ': {'Name': 'Wilwal International Airport', 'City': 'Jijiga', 'Country': 'Ethiopia'}, 'MKS': {'Name': 'Mekane Selam Airport', 'City': 'Mekane Selam', 'Country': 'Ethiopia'}, 'DBM': {'Name': 'Debra Marcos Airport', 'City': 'Debre Marqos', 'Country': 'Ethiopia'}, 'DBT': {'Name': 'Debre Tabor Airport', 'City': 'Debre Tabor', 'Country': 'Ethiopia'}, 'QHR': {'Name': 'Harar Meda Airport', 'City': 'Debre Zeyit', 'Country': 'Ethiopia'}, 'GOB': {'Name': 'Robe Airport', 'City': 'Goba', 'Country': 'Ethiopia'}, 'MYB': {'Name': 'Mayumba Airport', 'City': 'Mayumba', 'Country': 'Gabon'}, 'MRE': {'Name': 'Mara Serena Lodge Airstrip', 'City': 'Masai Mara', 'Country': 'Kenya'}, 'JJM': {'Name': 'Mulika Lodge Airport', 'City': 'Meru National Park', 'Country': 'Kenya'}, 'RBX': {'Name': 'Rumbek Airport', 'City': 'Rumbek', 'Country': 'Sudan'}, 'CPA': {'Name': 'Cape Palmas Airport', 'City': 'Greenville', 'Country': 'Liberia'}, 'IHC': {'Name': 'Inhaca Airport', 'City': 'Inhaca', 'Country': 'Mozambique'}, 'MAX': {'Name': 'Ouro Sogui Airport', 'City': 'Matam', 'Country': 'Senegal'}, 'BDI': {'Name': 'Bird Island Airport', 'City': 'Bird Island', 'Country': 'Seychelles'}, 'WHF': {'Name': 'Wadi Halfa Airport', 'City': 'Wadi Halfa', 'Country': 'Sudan'}, 'NBE': {'Name': 'Enfidha - Hammamet International Airport', 'City': 'Enfidha', 'Country': 'Tunisia'}, 'HTY': {'Name': 'Hatay Airport', 'City': 'Hatay', 'Country': 'Turkey'}, 'RVV': {'Name': 'Raivavae Airport', 'City': 'Raivavae', 'Country': 'French Polynesia'}, 'FUO': {'Name': 'Foshan Shadi Airport', 'City': 'Foshan', 'Country': 'China'}, 'HUZ': {'Name': 'Huizhou Airport', 'City': 'Huizhou', 'Country': 'China'}, 'ILD': {'Name': 'Lleida-Alguaire Airport', 'City': 'Lleida', 'Country': 'Spain'}, 'BIU': {'Name': 'Bildudalur Airport', 'City': 'Bildudalur', 'Country': 'Iceland'}, 'GJR': {'Name': 'Gjögur Airport', 'City': 'Gjogur', 'Country': 'Iceland'}, 'SAK': {'Name': 'Sauðárkrókur Airport', 'City': 'Saudarkrokur', 'Country': 'Iceland'}, 'IIA': {'Name': 'Inishmaan Aerodrome', 'City': 'Inishmaan', 'Country': 'Ireland'}, 'ULG': {'Name': 'Ulgii Mongolei Airport', 'City': 'Olgii', 'Country': 'Mongolia'}, 'KQT': {'Name': 'Qurghonteppa International Airport', 'City': 'Kurgan Tyube', 'Country': 'Tajikistan'}, 'VGD': {'Name': 'Vologda Airport', 'City': 'Vologda', 'Country': 'Russia'}, 'ONK': {'Name': 'Olenyok Airport', 'City': 'Olenyok', 'Country': 'Russia'}, 'SYS': {'Name': 'Saskylakh Airport', 'City': 'Saskylakh', 'Country': 'Russia'}, 'LDG': {'Name': 'Leshukonskoye Airport', 'City': 'Arkhangelsk', 'Country': 'Russia'}, 'HSK': {'Name': 'Huesca/Pirineos Airport', 'City': 'Huesca', 'Country': 'Spain'}, 'CQM': {'Name': 'Ciudad Real Central Airport', 'City': 'Ciudad Real', 'Country': 'Spain'}, 'NJF': {'Name': 'Al Najaf International Airport', 'City': 'Najaf', 'Country': 'Iraq'}, 'CSA': {'Name': 'Colonsay Airstrip', 'City': 'Colonsay', 'Country': 'United Kingdom'}, 'RKH': {'Name': 'Rock Hill - York County Airport', 'City': 'Rock Hill', 'Country': 'United States'}, 'AGC': {'Name': 'Allegheny County Airport', 'City': 'Pittsburgh', 'Country': 'United States'}, 'VQQ': {'Name': 'Cecil Airport', 'City': 'Jacksonville', 'Country': 'United States'}, 'FTY': {'Name': 'Fulton County Airport Brown Field', 'City': 'Atlanta', 'Country': 'United States'}, 'TII': {'Name': 'Tarin Kowt Airport', 'City': 'Tarin Kowt', 'Country': 'Afghanistan'}, 'ZAJ': {'Name': 'Zaranj Airport', 'City': 'Zaranj', 'Country': 'Afghanistan'}, 'CCN': {'Name': 'Chakcharan Airport', 'City': 'Chaghcharan', 'Country': 'Afghanistan'}, 'FUG': {'Name': 'Fuyang Xiguan Airport', 'City': 'Fuyang', 'Country': 'China'}, 'LCX': {'Name': 'Longyan Guanzhishan Airport', 'City': 'Longyan', 'Country': 'China'}, 'BSD': {'Name': 'Baoshan Yunduan Airport', 'City': 'Baoshan', 'Country': 'China'}, 'ACX': {'Name': 'Xingyi Airport', 'City': 'Xingyi', 'Country': 'China'}, 'HZH': {'Name': 'Liping Airport', 'City': 'Liping', 'Country': 'China'}, 'OSU': {'Name': 'The Ohio State University Airport - Don Scott Field', 'City': 'Columbus', 'Country': 'United States'}, 'ADS': {'Name': 'Addison Airport', 'City': 'Addison', 'Country': 'United States'}, 'DSI': {'Name': 'Destin Executive Airport', 'City': 'Destin', 'Country': 'United States'}, 'KHE': {'Name': 'Kherson International Airport', 'City': 'Kherson', 'Country': 'Ukraine'}, 'SZS': {'Name': "Ryan's Creek Aerodrome", 'City': 'Stewart Island', 'Country': 'New Zealand'}, 'HJJ': {'Name': 'Zhijiang Airport', 'City': 'Zhijiang', 'Country': 'China'}, 'YQI': {'Name': 'Yarmouth Airport', 'City': 'Yarmouth', 'Country': 'Canada'}, 'ISO': {'Name': 'Kinston Regional Jetport At Stallings Field', 'City': 'Kinston', 'Country': 'United States'}, 'FFA': {'Name': 'First Flight Airport', 'City': 'Kill Devil Hills', 'Country': 'United States'}, 'LNJ': {'Name': 'Lintsang Airfield', 'City': 'Lincang', 'Country': 'China'}, 'CKS': {'Name': 'Carajás Airport', 'City': 'Parauapebas', 'Country': 'Brazil'}, 'MWK': {'Name': 'Tarempa Airport', 'City': 'Anambas Islands', 'Country': 'Indonesia'}, 'PGU': {'Name': 'Persian Gulf International Airport', 'City': 'Khalije Fars', 'Country': 'Iran'}, 'YES': {'Name': 'Yasouj Airport', 'City': 'Yasuj', 'Country': 'Iran'}, 'OSM': {'Name': 'Mosul International Airport', 'City': 'Mosul', 'Country': 'Iraq'}, 'TJH': {'Name': 'Tajima Airport', 'City': 'Toyooka', 'Country': 'Japan'}, 'AXJ': {'Name': 'Amakusa Airport', 'City': 'Amakusa', 'Country': 'Japan'}, 'KKX': {'Name': 'Kikai Airport', 'City': 'Kikai', 'Country': 'Japan'}, 'AGJ': {'Name': 'Aguni Airport', 'City': 'Aguni', 'Country': 'Japan'}, 'ULZ': {'Name': 'Donoi Airport', 'City': 'Uliastai', 'Country': 'Mongolia'}, 'UGA': {'Name': 'Bulgan Airport', 'City': 'Bulgan', 'Country': 'Mongolia'}, 'ULO': {'Name': 'Ulaangom Airport', 'City': 'Ulaangom', 'Country': 'Mongolia'}, 'LBX': {'Name': 'Lubang Airport', 'City': 'Lubang', 'Country': 'Philippines'}, 'TJU': {'Name': 'Kulob Airport', 'City': 'Kulyab', 'Country': 'Tajikistan'}, 'CMJ': {'Name': 'Chi Mei Airport', 'City': 'Cimei', 'Country': 'Taiwan'}, 'TAZ': {'Name': 'Daşoguz Airport', 'City': 'Dasoguz', 'Country': 'Turkmenistan'}, 'BWB': {'Name': 'Barrow Island Airport', 'City': 'Barrow Island', 'Country': 'Australia'}, 'DRB': {'Name': 'Derby Airport', 'City': 'Derby', 'Country': 'Australia'}, 'WGE': {'Name': 'Walgett Airport', 'City': 'Walgett', 'Country': 'Australia'}, 'BRT': {'Name': 'Bathurst Island Airport', 'City': 'Bathurst Island', 'Country': 'Australia'}, 'DKI': {'Name': 'Dunk Island Airport', 'City': 'Dunk Island', 'Country': 'Australia'}, 'LZR': {'Name': 'Lizard Island Airport', 'City': 'Lizard Island', 'Country': 'Australia'}, 'HLT': {'Name': 'Hamilton Airport', 'City': 'Hamilton', 'Country': 'Australia'}, 'HCQ': {'Name': 'Halls Creek Airport', 'City': 'Halls Creek', 'Country': 'Australia'}, 'FIZ': {'Name': 'Fitzroy Crossing Airport', 'City': 'Fitzroy Crossing', 'Country': 'Australia'}, 'RVT': {'Name': 'Ravensthorpe Airport', 'City': 'Ravensthorpe', 'Country': 'Australia'}, 'PVU': {'Name': 'Provo Municipal Airport', 'City': 'Provo', 'Country': 'United States'}, 'SBS': {'Name': 'Steamboat Springs Bob Adams Field', 'City': 'Steamboat Springs', 'Country': 'United States'}, 'DTA': {'Name': 'Delta Municipal Airport', 'City': 'Delta', 'Country': 'United States'}, 'PUC': {'Name': 'Carbon County Regional/Buck Davis Field', 'City': 'Price', 'Country': 'United States'}, 'LAM': {'Name': 'Los Alamos Airport', 'City': 'Los Alamos', 'Country': 'United States'}, 'HII': {'Name': 'Lake Havasu City Airport', 'City': 'Lake Havasu City', 'Country': 'United States'}, 'INW': {'Name': 'Winslow Lindbergh Regional Airport', 'City': 'Winslow', 'Country': 'United States'}, 'DGL': {'Name': 'Douglas Municipal Airport', 'City': 'Douglas', 'Country': 'United States'}, 'MZK': {'Name': 'Marakei Airport', 'City': 'Marakei', 'Country': 'Kiribati'}, 'AEA': {'Name': 'Abemama Atoll Airport', 'City': 'Abemama', 'Country': 'Kiribati'}, 'AAK': {'Name': 'Buariki Airport', 'City': 'Buariki', 'Country': 'Kiribati'}, 'KUC': {'Name': 'Kuria Airport', 'City': 'Kuria', 'Country': 'Kiribati'}, 'AIS': {'Name': 'Arorae Island Airport', 'City': 'Arorae', 'Country': 'Kiribati'}, 'TMN': {'Name': 'Tamana Island Airport', 'City': 'Tamana', 'Country': 'Kiribati'}, 'BEZ': {'Name': 'Beru Airport', 'City': 'Beru Island', 'Country': 'Kiribati'}, 'NIG': {'Name': 'Nikunau Airport', 'City': 'Nikunau', 'Country': 'Kiribati'}, 'BBG': {'Name': 'Butaritari Atoll Airport', 'City': 'Butaritari', 'Country': 'Kiribati'}, 'MTK': {'Name': 'Makin Island Airport', 'City': 'Makin', 'Country': 'Kiribati'}, 'MNK': {'Name': 'Maiana Airport', 'City': 'Maiana', 'Country': 'Kiribati'}, 'NON': {'Name': 'Nonouti Airport', 'City': 'Nonouti', 'Country': 'Kiribati'}, 'TSU': {'Name': 'Tabiteuea South Airport', 'City': 'Tabiteuea', 'Country': 'Kiribati'}, 'WTZ': {'Name': 'Whitianga Airport', 'City': 'Whitianga', 'Country': 'New Zealand'}, 'KTF': {'Name': 'Takaka Airport', 'City': 'Takaka', 'Country': 'New Zealand'}, 'AFT': {'Name': 'Afutara Aerodrome', 'City': 'Afutara', 'Country': 'Solomon Islands'}, 'RNA': {'Name': 'Ulawa Airport', 'City': 'Ulawa', 'Country': 'Solomon Islands'}, 'CHY': {'Name': 'Choiseul Bay Airport', 'City': 'Choiseul Bay', 'Country': 'Solomon Islands'}, 'NNB': {'Name': 'Santa Ana Airport', 'City': 'Santa Ana', 'Country': 'Solomon Islands'}, 'XYA': {'Name': 'Yandina Airport', 'City': 'Yandina', 'Country': 'Solomon Islands'}, 'BPF': {'Name': 'Batuna Aerodrome', 'City': 'Batuna', 'Country': 'Solomon Islands'}, 'BOW': {'Name': 'Bartow Municipal Airport', 'City': 'Bartow', 'Country': 'United States'}, 'FTI': {'Name': 'Fitiuta Airport', 'City': "Fiti\\'uta", 'Country': 'American Samoa'}, 'LVK': {'Name': 'Livermore Municipal Airport', 'City': 'Livermore', 'Country': 'United States'}, 'RMY': {'Name': 'Mariposa Yosemite Airport', 'City': 'Mariposa', 'Country': 'United States'}, 'GFY': {'Name': 'Grootfontein Airport', 'City': 'Grootfontein', 'Country': 'Namibia'}, 'NDU': {'Name': 'Rundu Airport', 'City': 'Rundu', 'Country': 'Namibia'}, 'TRM': {'Name': 'Jacqueline Cochran Regional Airport', 'City': 'Palm Springs', 'Country': 'United States'}, 'SMO': {'Name': 'Santa Monica Municipal Airport', 'City': 'Santa Monica', 'Country': 'United States'}, 'UDD': {'Name': 'Bermuda Dunes Airport', 'City': 'Palm Springs', 'Country': 'United States'}, 'SCF': {'Name': 'Scottsdale Airport', 'City': 'Scottsdale', 'Country': 'United States'}, 'OLM': {'Name': 'Olympia Regional Airport', 'City': 'Olympia', 'Country': 'United States'}, 'RIL': {'Name': 'Garfield County Regional Airport', 'City': 'Rifle', 'Country': 'United States'}, 'SAA': {'Name': 'Shively Field', 'City': 'SARATOGA', 'Country': 'United States'}, 'PDK': {'Name': 'DeKalb Peachtree Airport', 'City': 'Atlanta', 'Country': 'United States'}, 'BMG': {'Name': 'Monroe County Airport', 'City': 'Bloomington', 'Country': 'United States'}, 'SUA': {'Name': 'Witham Field', 'City': 'Stuart', 'Country': 'United States'}, 'MMU': {'Name': 'Morristown Municipal Airport', 'City': 'Morristown', 'Country': 'United States'}, 'APC': {'Name': 'Napa County Airport', 'City': 'Napa', 'Country': 'United States'}, 'SDM': {'Name': 'Brown Field Municipal Airport', 'City': 'San Diego', 'Country': 'United States'}, 'VNC': {'Name': 'Venice Municipal Airport', 'City': 'Venice', 'Country': 'United States'}, 'PHK': {'Name': 'Palm Beach County Glades Airport', 'City': 'Pahokee', 'Country': 'United States'}, 'ECP': {'Name': 'Northwest Florida Beaches International Airport', 'City': 'Panama City', 'Country': 'United States'}, 'SBD': {'Name': 'San Bernardino International Airport', 'City': 'San Bernardino', 'Country': 'United States'}, 'VAL': {'Name': 'Valença Airport', 'City': 'Valenca', 'Country': 'Brazil'}, 'CAU': {'Name': 'Caruaru Airport', 'City': 'Caruaru', 'Country': 'Brazil'}, 'AWK': {'Name': 'Wake Island Airfield', 'City': 'Wake island', 'Country': 'Wake Island'}, 'QNV': {'Name': 'Aeroclube Airport', 'City': 'Nova Iguacu', 'Country': 'Brazil'}, 'SQL': {'Name': 'San Carlos Airport', 'City': 'San Carlos', 'Country': 'United States'}, 'RWI': {'Name': 'Rocky Mount Wilson Regional Airport', 'City': 'Rocky Mount', 'Country': 'United States'}, 'SXQ': {'Name': 'Soldotna Airport', 'City': 'Soldotna', 'Country': 'United States'}, 'SEE': {'Name': 'Gillespie Field', 'City': 'El Cajon', 'Country': 'United States'}, 'PHA': {'Name': 'Phan Rang Airport', 'City': 'Phan Rang', 'Country': 'Vietnam'}, 'SQH': {'Name': 'Na-San Airport', 'City': 'Son-La', 'Country': 'Vietnam'}, 'TKF': {'Name': 'Truckee Tahoe Airport', 'City': 'Truckee', 'Country': 'United States'}, 'FRJ': {'Name': 'Fréjus Airport', 'City': 'Frejus', 'Country': 'France'}, 'GEX': {'Name': 'Geelong Airport', 'City': 'Geelong', 'Country': 'Australia'}, 'LVM': {'Name': 'Mission Field', 'City': 'Livingston-Montana', 'Country': 'United States'}, 'GMV': {'Name': 'Monument Valley Airport', 'City': 'Monument Valley', 'Country': 'United States'}, 'JRA': {'Name': 'West 30th St. Heliport', 'City': 'New York', 'Country': 'United States'}, 'LAL': {'Name': 'Lakeland Linder International Airport', 'City': 'Lakeland', 'Country': 'United States'}, 'SYH': {'Name': 'Syangboche Airport', 'City': 'Syangboche', 'Country': 'Nepal'}, 'RBK': {'Name': 'French Valley Airport', 'City': 'Murrieta-Temecula', 'Country': 'United States'}, 'FNU': {'Name': 'Oristano-Fenosu Airport', 'City': 'Oristano', 'Country': 'Italy'}, 'MYQ': {'Name': 'Mysore Airport', 'City': 'Mysore', 'Country': 'India'}, 'MGY': {'Name': 'Dayton-Wright Brothers Airport', 'City': 'Dayton', 'Country': 'United States'}, 'FDY': {'Name': 'Findlay Airport', 'City': 'Findley', 'Country': 'United States'}, 'PEA': {'Name': 'Penneshaw Airport', 'City': 'Penneshaw', 'Country': 'Australia'}, 'EMP': {'Name': 'Emporia Municipal Airport', 'City': 'Kempten', 'Country': 'Germany'}, 'HYC': {'Name': 'Wycombe Air Park', 'City': 'Wycombe', 'Country': 'United Kingdom'}, 'BBP': {'Name': 'Bembridge Airport', 'City': 'Bembridge', 'Country': 'United Kingdom'}, 'SPF': {'Name': 'Black Hills Airport-Clyde Ice Field', 'City': 'Spearfish-South Dakota', 'Country': 'United States'}, 'QYD': {'Name': 'Oksywie Military Air Base', 'City': 'Gdynia', 'Country': 'Poland'}, 'OLV': {'Name': 'Olive Branch Airport', 'City': 'Olive Branch', 'Country': 'United States'}, 'KNA': {'Name': 'Viña del mar Airport', 'City': 'Vina del Mar', 'Country': 'Chile'}, 'ONQ': {'Name': 'Zonguldak Airport', 'City': 'Zonguldak', 'Country': 'Turkey'}, 'BJC': {'Name': 'Rocky Mountain Metropolitan Airport', 'City': 'Broomfield-CO', 'Country': 'United States'}, 'SLE': {'Name': 'Salem Municipal Airport/McNary Field', 'City': 'Salem', 'Country': 'United States'}, 'UTM': {'Name': 'Tunica Municipal Airport', 'City': 'Tunica', 'Country': 'United States'}, 'ZKB': {'Name': 'Kasaba Bay Airport', 'City': 'Kasaba Bay', 'Country': 'Zambia'}, 'LND': {'Name': 'Hunt Field', 'City': 'Lindau', 'Country': 'Germany'}, 'MWC': {'Name': 'Lawrence J Timmerman Airport', 'City': 'Milwaukee', 'Country': 'United States'}, 'JVL': {'Name': 'Southern Wisconsin Regional Airport', 'City': 'Janesville', 'Country': 'United States'}, 'LZU': {'Name': 'Gwinnett County Briscoe Field', 'City': 'Lawrenceville', 'Country': 'United States'}, 'BWG': {'Name': 'Bowling Green Warren County Regional Airport', 'City': 'Bowling Green', 'Country': 'United States'}, 'RVS': {'Name': 'Richard Lloyd Jones Jr Airport', 'City': 'Tulsa', 'Country': 'United States'}, 'NHD': {'Name': 'Al Minhad Air Base', 'City': 'Minhad AB', 'Country': 'United Arab Emirates'}, 'KGO': {'Name': 'Kirovograd Airport', 'City': 'Kirovograd', 'Country': 'Ukraine'}, 'DBB': {'Name': 'El Alamein International Airport', 'City': 'Dabaa City', 'Country': 'Egypt'}, 'BCE': {'Name': 'Bryce Canyon Airport', 'City': 'Bryce Canyon', 'Country': 'United States'}, 'CKL': {'Name': 'Chkalovskiy Air Base', 'City': 'Shchyolkovo', 'Country': 'Russia'}, 'TCZ': {'Name': 'Tengchong Tuofeng Airport', 'City': 'Tengchong', 'Country': 'China'}, 'UKS': {'Name': 'Belbek Airport', 'City': 'Sevastopol', 'Country': 'Ukraine'}, 'OAZ': {'Name': 'Camp Bastion Airport', 'City': 'Camp Bastion', 'Country': 'Afghanistan'}, 'JCI': {'Name': 'New Century Aircenter Airport', 'City': 'Olathe', 'Country': 'United States'}, 'ESN': {'Name': 'Easton Newnam Field', 'City': 'Easton', 'Country': 'United States'}, 'HMR': {'Name': 'Stafsberg Airport', 'City': 'Hamar', 'Country': 'Norway'}, 'MYV': {'Name': 'Yuba County Airport', 'City': 'Yuba City', 'Country': 'United States'}, 'DUC': {'Name': 'Halliburton Field', 'City': 'Duncan', 'Country': 'United States'}, 'UVA': {'Name': 'Garner Field', 'City': 'Uvalde', 'Country': 'United States'}, 'LOT': {'Name': 'Lewis University Airport', 'City': 'Lockport', 'Country': 'United States'}, 'CCR': {'Name': 'Buchanan Field', 'City': 'Concord', 'Country': 'United States'}, 'OCA': {'Name': 'Ocean Reef Club Airport', 'City': 'Ocean Reef Club Airport', 'Country': 'United States'}, 'YUS': {'Name': 'Yushu Batang Airport', 'City': 'Yushu', 'Country': 'China'}, 'HIA': {'Name': 'Lianshui Airport', 'City': 'Huai An', 'Country': 'China'}, 'YOO': {'Name': 'Toronto/Oshawa Executive Airport', 'City': 'Oshawa', 'Country': 'Canada'}, 'LHA': {'Name': 'Lahr Airport', 'City': 'Lahr', 'Country': 'Germany'}, 'NYW': {'Name': 'Monywar Airport', 'City': 'Monywa', 'Country': 'Burma'}, 'ATO': {'Name': 'Ohio University Snyder Field', 'City': 'Athens', 'Country': 'United States'}, 'SGH': {'Name': 'Springfield-Beckley Municipal Airport', 'City': 'Springfield', 'Country': 'United States'}, 'HEX': {'Name': 'Herrera Airport', 'City': 'Santo Domingo', 'Country': 'Dominican Republic'}, 'CDA': {'Name': 'Cooinda Airport', 'City': 'Cooinda', 'Country': 'Australia'}, 'JAB': {'Name': 'Jabiru Airport', 'City': 'Jabiru', 'Country': 'Australia'}, 'HGS': {'Name': 'Hastings Airport', 'City': 'Freetown', 'Country': 'Sierra Leone'}, 'TOP': {'Name': 'Philip Billard Municipal Airport', 'City': 'Topeka', 'Country': 'United States'}, 'MQY': {'Name': 'Smyrna Airport', 'City': 'Smyrna', 'Country': 'United States'}, 'UOS': {'Name': 'Franklin County Airport', 'City': 'Sewanee', 'Country': 'United States'}, 'NGQ': {'Name': 'Ngari Gunsa Airport', 'City': 'Shiquanhe', 'Country': 'China'}, 'CSO': {'Name': 'Cochstedt Airport', 'City': 'Cochstedt', 'Country': 'Germany'}, 'PWK': {'Name': 'Chicago Executive Airport', 'City': 'Chicago-Wheeling', 'Country': 'United States'}, 'KLS': {'Name': 'Southwest Washington Regional Airport', 'City': 'Kelso', 'Country': 'United States'}, 'ZTA': {'Name': 'Tureia Airport', 'City': 'Tureia', 'Country': 'French Polynesia'}, 'PUE': {'Name': 'Puerto Obaldia Airport', 'City': 'Puerto Obaldia', 'Country': 'Panama'}, 'KHC': {'Name': 'Kerch Airport', 'City': 'Kerch', 'Country': 'Ukraine'}, 'UKA': {'Name': 'Ukunda Airstrip', 'City': 'Ukunda', 'Country': 'Kenya'}, 'ILN': {'Name': 'Wilmington Airpark', 'City': 'Wilmington', 'Country': 'United States'}, 'AVW': {'Name': 'Marana Regional Airport', 'City': 'Tucson', 'Country': 'United States'}, 'CGZ': {'Name': 'Casa Grande Municipal Airport', 'City': 'Casa Grande', 'Country': 'United States'}, 'BXK': {'Name': 'Buckeye Municipal Airport', 'City': 'Buckeye', 'Country': 'United States'}, 'MMI': {'Name': 'McMinn County Airport', 'City': 'Athens', 'Country': 'United States'}, 'STK': {'Name': 'Sterling Municipal Airport', 'City': 'Sterling', 'Country': 'United States'}, 'RWL': {'Name': 'Rawlins Municipal Airport/Harvey Field', 'City': 'Rawlins', 'Country': 'United States'}, 'CDW': {'Name': 'Essex County Airport', 'City': 'Caldwell', 'Country': 'United States'}, 'AIZ': {'Name': 'Lee C Fine Memorial Airport', 'City': 'Kaiser Lake Ozark', 'Country': 'United States'}, 'TVI': {'Name': 'Thomasville Regional Airport', 'City': 'Thomasville', 'Country': 'United States'}, 'HSH': {'Name': 'Henderson Executive Airport', 'City': 'Henderson', 'Country': 'United States'}, 'GML': {'Name': 'Gostomel Airport', 'City': 'Kiev', 'Country': 'Ukraine'}, 'TMA': {'Name': 'Henry Tift Myers Airport', 'City': 'Tifton', 'Country': 'United States'}, 'RDO': {'Name': 'Radom Airport', 'City': 'RADOM', 'Country': 'Poland'}, 'DVT': {'Name': 'Phoenix Deer Valley Airport', 'City': 'Phoenix ', 'Country': 'United States'}, 'YRV': {'Name': 'Revelstoke Airport', 'City': 'Revelstoke', 'Country': 'Canada'}, 'FRG': {'Name': 'Republic Airport', 'City': 'Farmingdale', 'Country': 'United States'}, 'ZHY': {'Name': 'Zhongwei Shapotou Airport', 'City': 'Zhongwei', 'Country': 'China'}, 'MCL': {'Name': 'McKinley National Park Airport', 'City': 'McKinley Park', 'Country': 'United States'}, 'PPC': {'Name': 'Prospect Creek Airport', 'City': 'Prospect Creek', 'Country': 'United States'}, 'KHW': {'Name': 'Khwai River Lodge Airport', 'City': 'Khwai River', 'Country': 'Botswana'}, 'TXG': {'Name': 'Taichung Airport', 'City': 'Taichung', 'Country': 'Taiwan'}, 'HLG': {'Name': 'Wheeling Ohio County Airport', 'City': 'Wheeling', 'Country': 'United States'}, 'XYE': {'Name': 'Ye Airport', 'City': 'Ye', 'Country': 'Burma'}, 'DWC': {'Name': 'Al Maktoum International Airport', 'City': 'Dubai', 'Country': 'United Arab Emirates'}, 'RKP': {'Name': 'Aransas County Airport', 'City': 'Rockport', 'Country': 'United States'}, 'MVV': {'Name': 'Megève Airport', 'City': 'Verdun', 'Country': 'France'}, 'MFX': {'Name': 'Méribel Altiport', 'City': 'Ajaccio', 'Country': 'France'}, 'AEB': {'Name': 'Baise Youjiang Airport', 'City': 'Baise', 'Country': 'China'}, 'OKF': {'Name': 'Okaukuejo Airport', 'City': 'Okaukuejo', 'Country': 'Namibia'}, 'OKU': {'Name': 'Mokuti Lodge Airport', 'City': 'Mokuti Lodge', 'Country': 'Namibia'}, 'KOQ': {'Name': 'Köthen Airport', 'City': 'Koethen', 'Country': 'Germany'}, 'PSH': {'Name': 'St. Peter-Ording Airport', 'City': 'Sankt Peter-Ording', 'Country': 'Germany'}, 'TTD': {'Name': 'Portland Troutdale Airport', 'City': 'Troutdale', 'Country': 'United States'}, 'HIO': {'Name': 'Portland Hillsboro Airport', 'City': 'Hillsboro', 'Country': 'United States'}, 'KHT': {'Name': 'Khost Airport', 'City': 'Khost', 'Country': 'Afghanistan'}, 'NMT': {'Name': 'Namtu Airport', 'City': 'Naypyidaw', 'Country': 'Burma'}, 'BNO': {'Name': 'Burns Municipal Airport', 'City': 'Burns', 'Country': 'United States'}, 'PRZ': {'Name': 'Prineville Airport', 'City': 'Prineville', 'Country': 'United States'}, 'RBL': {'Name': 'Red Bluff Municipal Airport', 'City': 'Red Bluff', 'Country': 'United States'}, 'NOT': {'Name': 'Marin County Airport - Gnoss Field', 'City': 'Novato', 'Country': 'United States'}, 'LKV': {'Name': 'Lake County Airport', 'City': 'Lakeview', 'Country': 'United States'}, 'OTK': {'Name': 'Tillamook Airport', 'City': 'Tillamook', 'Country': 'United States'}, 'ONO': {'Name': 'Ontario Municipal Airport', 'City': 'Ontario', 'Country': 'United States'}, 'DLS': {'Name': 'Columbia Gorge Regional the Dalles Municipal Airport', 'City': 'The Dalles', 'Country': 'United States'}, 'GAI': {'Name': 'Montgomery County Airpark', 'City': 'Gaithersburg', 'Country': 'United States'}, 'OAS': {'Name': 'Sharana Airstrip', 'City': 'Sharona', 'Country': 'Afghanistan'}, 'YTA': {'Name': 'Pembroke Airport', 'City': 'Pembroke', 'Country': 'Canada'}, 'TSB': {'Name': 'Tsumeb Airport', 'City': 'Tsumeb', 'Country': 'Namibia'}, 'YSD': {'Name': 'Suffield Heliport', 'City': 'Suffield', 'Country': 'Canada'}, 'BNU': {'Name': 'Blumenau Airport', 'City': 'BLUMENAU', 'Country': 'Brazil'}, 'YCC': {'Name': 'Cornwall Regional Airport', 'City': 'Cornwall', 'Country': 'Canada'}, 'IZA': {'Name': 'Zona da Mata Regional Airport', 'City': 'Juiz de Fora', 'Country': 'Brazil'}, 'MVL': {'Name': 'Morrisville Stowe State Airport', 'City': 'Morrisville', 'Country': 'United States'}, 'RBD': {'Name': 'Dallas Executive Airport', 'City': 'Dallas', 'Country': 'United States'}, 'BXY': {'Name': 'Krainiy Airport', 'City': 'Baikonur', 'Country': 'Kazakhstan'}, 'WST': {'Name': 'Westerly State Airport', 'City': 'Washington County', 'Country': 'United States'}, 'BID': {'Name': 'Block Island State Airport', 'City': 'Block Island', 'Country': 'United States'}, 'NME': {'Name': 'Nightmute Airport', 'City': 'Nightmute', 'Country': 'United States'}, 'OOK': {'Name': 'Toksook Bay Airport', 'City': 'Toksook Bay', 'Country': 'United States'}, 'OBY': {'Name': 'Ittoqqortoormiit Heliport', 'City': 'Ittoqqortoormiit', 'Country': 'Greenland'}, 'VIN': {'Name': 'Vinnytsia/Gavyryshivka Airport', 'City': 'Vinnitsa', 'Country': 'Ukraine'}, 'BGE': {'Name': 'Decatur County Industrial Air Park', 'City': 'Bainbridge', 'Country': 'United States'}, 'ZGS': {'Name': 'La Romaine Airport', 'City': 'La Romaine', 'Country': 'Canada'}, 'ZKG': {'Name': 'Kegaska Airport', 'City': 'Kegaska', 'Country': 'Canada'}, 'YBI': {'Name': 'Black Tickle Airport', 'City': 'Black Tickle', 'Country': 'Canada'}, 'WHP': {'Name': 'Whiteman Airport', 'City': 'Los Angeles', 'Country': 'United States'}, 'MAE': {'Name': 'Madera Municipal Airport', 'City': 'Madera', 'Country': 'United States'}, 'YZZ': {'Name': 'Trail Airport', 'City': 'Trail', 'Country': 'Canada'}, 'YAB': {'Name': 'Old Arctic Bay Airport', 'City': 'Arctic Bay', 'Country': 'Canada'}, 'GSI': {'Name': 'Grand-Santi Airport', 'City': 'Grand-Santi', 'Country': 'French Guiana'}, 'MPY': {'Name': 'Maripasoula Airport', 'City': 'Maripasoula', 'Country': 'French Guiana'}, 'LDX': {'Name': 'Saint-Laurent-du-Maroni Airport', 'City': 'Saint-Laurent-du-Maroni', 'Country': 'French Guiana'}, 'KJI': {'Name': 'Kanas Airport', 'City': 'Burqin', 'Country': 'China'}, 'CPB': {'Name': 'Capurganá Airport', 'City': 'Capurgana', 'Country': 'Colombia'}, 'HMB': {'Name': 'Sohag International Airport', 'City': 'Sohag', 'Country': 'Egypt'}, 'RVY': {'Name': 'Presidente General Don Oscar D. Gestido International Airport', 'City': 'Rivera', 'Country': 'Uruguay'}, 'POJ': {'Name': 'Patos de Minas Airport', 'City': 'Patos de Minas', 'Country': 'Brazil'}, 'JTC': {'Name': 'Bauru - Arealva Airport', 'City': 'Bauru', 'Country': 'Brazil'}, 'OIA': {'Name': 'Ourilândia do Norte Airport', 'City': 'Ourilandia do Norte', 'Country': 'Brazil'}, 'RDC': {'Name': 'Redenção Airport', 'City': 'Redencao', 'Country': 'Brazil'}, 'SXX': {'Name': 'São Félix do Xingu Airport', 'City': 'Sao Felix do Xingu', 'Country': 'Brazil'}, 'BYO': {'Name': 'Bonito Airport', 'City': 'Bointo', 'Country': 'Brazil'}, 'SXO': {'Name': 'São Félix do Araguaia Airport', 'City': 'Sao Felix do Araguaia', 'Country': 'Brazil'}, 'CFC': {'Name': 'Caçador Airport', 'City': 'Cacador', 'Country': 'Brazil'}, 'CAF': {'Name': 'Carauari Airport', 'City': 'Carauari', 'Country': 'Brazil'}, 'ERN': {'Name': 'Eirunepé Airport', 'City': 'Eirunepe', 'Country': 'Brazil'}, 'CCI': {'Name': 'Concórdia Airport', 'City': 'Concordia', 'Country': 'Brazil'}, 'FBE': {'Name': 'Francisco Beltrão Airport', 'City': 'Francisco Beltrao', 'Country': 'Brazil'}, 'CFO': {'Name': 'Confresa Airport', 'City': 'Confresa', 'Country': 'Brazil'}, 'AAF': {'Name': 'Apalachicola Regional Airport', 'City': 'Apalachicola', 'Country': 'United States'}, 'UMU': {'Name': 'Umuarama Airport', 'City': 'Umuarama', 'Country': 'Brazil'}, 'DTI': {'Name': 'Diamantina Airport', 'City': 'Diamantina', 'Country': 'Brazil'}, 'FBA': {'Name': 'Fonte Boa Airport', 'City': 'Fonte Boa', 'Country': 'Brazil'}, 'OLC': {'Name': 'Senadora Eunice Micheles Airport', 'City': 'Sao Paulo de Olivenca', 'Country': 'Brazil'}, 'HUW': {'Name': 'Humaitá Airport', 'City': 'Humaita', 'Country': 'Brazil'}, 'IRZ': {'Name': 'Tapuruquara Airport', 'City': 'Santa Isabel do Rio Negro', 'Country': 'Brazil'}, 'ORX': {'Name': 'Oriximiná Airport', 'City': 'Oriximina', 'Country': 'Brazil'}, 'UNA': {'Name': 'Hotel Transamérica Airport', 'City': 'Una', 'Country': 'Brazil'}, 'TEF': {'Name': 'Telfer Airport', 'City': 'Telfer', 'Country': 'Australia'}, 'GZP': {'Name': 'Gazipaşa Airport', 'City': 'Alanya', 'Country': 'Turkey'}, 'OAA': {'Name': 'Shank Air Base', 'City': 'Shank', 'Country': 'Afghanistan'}, 'FPR': {'Name': 'St Lucie County International Airport', 'City': 'Fort Pierce', 'Country': 'United States'}, 'PYM': {'Name': 'Plymouth Municipal Airport', 'City': 'Plymouth', 'Country': 'United States'}, 'NCO': {'Name': 'Quonset State Airport', 'City': 'North Kingstown', 'Country': 'United States'}, 'OWD': {'Name': 'Norwood Memorial Airport', 'City': 'Norwood', 'Country': 'United States'}, 'BAF': {'Name': 'Westfield-Barnes Regional Airport', 'City': 'Westfield', 'Country': 'United States'}, 'MGJ': {'Name': 'Orange County Airport', 'City': 'Montgomery', 'Country': 'United States'}, 'HAR': {'Name': 'Capital City Airport', 'City': 'Harrisburg', 'Country': 'United States'}, 'DXR': {'Name': 'Danbury Municipal Airport', 'City': 'Danbury', 'Country': 'United States'}, 'ASH': {'Name': 'Boire Field', 'City': 'Nashua', 'Country': 'United States'}, 'LWM': {'Name': 'Lawrence Municipal Airport', 'City': 'Lawrence', 'Country': 'United States'}, 'OXC': {'Name': 'Waterbury Oxford Airport', 'City': 'Oxford', 'Country': 'United States'}, 'RMG': {'Name': 'Richard B Russell Airport', 'City': 'Rome', 'Country': 'United States'}, 'GAD': {'Name': 'Northeast Alabama Regional Airport', 'City': 'Gadsden', 'Country': 'United States'}, 'WDR': {'Name': 'Barrow County Airport', 'City': 'Winder', 'Country': 'United States'}, 'DNN': {'Name': 'Dalton Municipal Airport', 'City': 'Dalton', 'Country': 'United States'}, 'LGC': {'Name': 'LaGrange Callaway Airport', 'City': 'LaGrange', 'Country': 'United States'}, 'PIM': {'Name': 'Harris County Airport', 'City': 'Pine Mountain', 'Country': 'United States'}, 'GVL': {'Name': 'Lee Gilmer Memorial Airport', 'City': 'Gainesville', 'Country': 'United States'}, 'PHD': {'Name': 'Harry Clever Field', 'City': 'New Philadelpha', 'Country': 'United States'}, 'HHH': {'Name': 'Hilton Head Airport', 'City': 'Hilton Head Island', 'Country': 'United States'}, 'DNL': {'Name': 'Daniel Field', 'City': 'Augusta', 'Country': 'United States'}, 'MRN': {'Name': 'Foothills Regional Airport', 'City': 'Morganton', 'Country': 'United States'}, 'PVL': {'Name': 'Pike County-Hatcher Field', 'City': 'Pikeville', 'Country': 'United States'}, 'TOC': {'Name': 'Toccoa Airport - R.G. Letourneau Field', 'City': 'Toccoa', 'Country': 'United States'}, 'PLV': {'Name': 'Suprunovka Airport', 'City': 'Poltava', 'Country': 'Ukraine'}, 'WUU': {'Name': 'Wau Airport', 'City': 'Wau', 'Country': 'Sudan'}, 'HUE': {'Name': 'Humera Airport', 'City': 'Humera', 'Country': 'Ethiopia'}, 'OYL': {'Name': 'Moyale Airport', 'City': 'Moyale', 'Country': 'Kenya'}, 'OZG': {'Name': 'Zagora Airport', 'City': 'Zagora', 'Country': 'Morocco'}, 'WYE': {'Name': 'Yengema Airport', 'City': 'Yengema', 'Country': 'Sierra Leone'}, 'GBK': {'Name': 'Gbangbatok Airport', 'City': 'Gbangbatok', 'Country': 'Sierra Leone'}, 'THX': {'Name': 'Turukhansk Airport', 'City': 'Turukhansk', 'Country': 'Russia'}, 'TGP': {'Name': 'Podkamennaya Tunguska Airport', 'City': 'Bor', 'Country': 'Russia'}, 'AFW': {'Name': 'Fort Worth Alliance Airport', 'City': 'Fort Worth', 'Country': 'United States'}, 'RMK': {'Name': 'Renmark Airport', 'City': 'Renmark', 'Country': 'Australia'}, 'LGH': {'Name': 'Leigh Creek Airport', 'City': 'Leigh Creek', 'Country': 'Australia'}, 'RTS': {'Name': 'Rottnest Island Airport', 'City': 'Rottnest Island', 'Country': 'Australia'}, 'FOS': {'Name': 'Forrest Airport', 'City': 'Forrest', 'Country': 'Australia'}, 'KEW': {'Name': 'Keewaywin Airport', 'City': 'Keewaywin', 'Country': 'Canada'}, 'YSP': {'Name': 'Marathon Airport', 'City': 'Marathon', 'Country': 'Canada'}, 'YHF': {'Name': 'Hearst René Fontaine Municipal Airport', 'City': 'Hearst', 'Country': 'Canada'}, 'YHN': {'Name': 'Hornepayne Municipal Airport', 'City': 'Hornepayne', 'Country': 'Canada'}, 'YKX': {'Name': 'Kirkland Lake Airport', 'City': 'Kirkland Lake', 'Country': 'Canada'}, 'YMG': {'Name': 'Manitouwadge Airport', 'City': 'Manitouwadge', 'Country': 'Canada'}, 'YXZ': {'Name': 'Wawa Airport', 'City': 'Wawa', 'Country': 'Canada'}, 'YEM': {'Name': 'Manitoulin East Municipal Airport', 'City': 'Manitowaning', 'Country': 'Canada'}, 'LWC': {'Name': 'Lawrence Municipal Airport', 'City': 'Lawrence', 'Country': 'United States'}, 'PPM': {'Name': 'Pompano Beach Airpark', 'City': 'Pompano Beach', 'Country': 'United States'}, 'XMC': {'Name': 'Mallacoota Airport', 'City': 'Mallacoota', 'Country': 'Australia'}, 'ULH': {'Name': 'Majeed Bin Abdulaziz Airport', 'City': 'Al-Ula', 'Country': 'Saudi Arabia'}, 'YUE': {'Name': 'Yuendumu Airport', 'City': 'Yuendumu ', 'Country': 'Australia'}, 'LOP': {'Name': 'Lombok International Airport', 'City': 'Praya', 'Country': 'Indonesia'}, 'ZMH': {'Name': 'South Cariboo Region / 108 Mile Airport', 'City': '108 Mile Ranch', 'Country': 'Canada'}, 'HDG': {'Name': 'Handan Airport', 'City': 'Handan', 'Country': 'China'}, 'LOZ': {'Name': 'London-Corbin Airport/Magee Field', 'City': 'London', 'Country': 'United States'}, 'FBG': {'Name': 'Simmons Army Air Field', 'City': 'Fredericksburg', 'Country': 'United States'}, 'WMI': {'Name': 'Modlin Airport', 'City': 'Warsaw', 'Country': 'Poland'}, 'JXA': {'Name': 'Jixi Xingkaihu Airport', 'City': 'Jixi', 'Country': 'China'}, 'JDG': {'Name': 'Jeongseok Airport', 'City': 'Seogwipo', 'Country': 'South Korea'}, 'YGM': {'Name': 'Gimli Industrial Park Airport', 'City': 'Gimli', 'Country': 'Canada'}, 'EYK': {'Name': 'Beloyarskiy Airport', 'City': 'Beloyarsky', 'Country': 'Russia'}, 'RAC': {'Name': 'John H Batten Airport', 'City': 'Racine', 'Country': 'United States'}, 'RZP': {'Name': 'Cesar Lim Rodriguez Airport', 'City': 'Taytay', 'Country': 'Philippines'}, 'RKZ': {'Name': 'Shigatse Air Base', 'City': 'Shigatse', 'Country': 'China'}, 'TIW': {'Name': 'Tacoma Narrows Airport', 'City': 'Tacoma', 'Country': 'United States'}, 'GUF': {'Name': 'Jack Edwards Airport', 'City': 'Gulf Shores', 'Country': 'United States'}, 'IBB': {'Name': 'General Villamil Airport', 'City': 'Isabela', 'Country': 'Ecuador'}, 'HMJ': {'Name': 'Khmelnytskyi Airport', 'City': 'Khmeinitskiy', 'Country': 'Ukraine'}, 'HIW': {'Name': 'Hiroshimanishi Airport', 'City': 'Hiroshima', 'Country': 'Japan'}, 'KYI': {'Name': 'Yalata Mission Airport', 'City': 'Yalata', 'Country': 'Australia'}, 'HZL': {'Name': 'Hazleton Municipal Airport', 'City': 'Hazleton', 'Country': 'United States'}, 'CBE': {'Name': 'Greater Cumberland Regional Airport', 'City': 'Cumberland', 'Country': 'United States'}, 'WYN': {'Name': 'Wyndham Airport', 'City': 'Wyndham', 'Country': 'Australia'}, 'YBO': {'Name': 'Bob Quinn Lake Airport', 'City': 'Bob Quinn Lake', 'Country': 'Canada'}, 'KLF': {'Name': 'Grabtsevo Airport', 'City': 'Kaluga', 'Country': 'Russia'}, 'LNR': {'Name': 'Tri-County Regional Airport', 'City': 'Lone Rock', 'Country': 'United States'}, 'JOT': {'Name': 'Joliet Regional Airport', 'City': 'Joliet', 'Country': 'United States'}, 'VYS': {'Name': 'Illinois Valley Regional Airport-Walter A Duncan Field', 'City': 'Peru', 'Country': 'United States'}, 'JXN': {'Name': 'Jackson County Reynolds Field', 'City': 'Jackson', 'Country': 'United States'}, 'BBX': {'Name': 'Wings Field', 'City': 'Philadelphia', 'Country': 'United States'}, 'OBE': {'Name': 'Okeechobee County Airport', 'City': 'Okeechobee', 'Country': 'United States'}, 'SEF': {'Name': 'Sebring Regional Airport', 'City': 'Sebring', 'Country': 'United States'}, 'AVO': {'Name': 'Avon Park Executive Airport', 'City': 'Avon Park', 'Country': 'United States'}, 'GIF': {'Name': 'Winter Haven Regional Airport - Gilbert Field', 'City': 'Winter Haven', 'Country': 'United States'}, 'ZPH': {'Name': 'Zephyrhills Municipal Airport', 'City': 'Zephyrhills', 'Country': 'United States'}, 'OCF': {'Name': 'Ocala International Airport - Jim Taylor Field', 'City': 'Ocala', 'Country': 'United States'}, 'AIK': {'Name': 'Aiken Regional Airport', 'City': 'Aiken', 'Country': 'United States'}, 'CDN': {'Name': 'Woodward Field', 'City': 'Camden', 'Country': 'United States'}, 'LBT': {'Name': 'Lumberton Regional Airport', 'City': 'Lumberton', 'Country': 'United States'}, 'SOP': {'Name': 'Moore County Airport', 'City': 'Pinehurst-Southern Pines', 'Country': 'United States'}, 'SVH': {'Name': 'Statesville Regional Airport', 'City': 'Statesville', 'Country': 'United States'}, 'LHV': {'Name': 'William T. Piper Memorial Airport', 'City': 'Lock Haven', 'Country': 'United States'}, 'BKL': {'Name': 'Burke Lakefront Airport', 'City': 'Cleveland', 'Country': 'United States'}, 'DKK': {'Name': 'Chautauqua County-Dunkirk Airport', 'City': 'Dunkirk', 'Country': 'United States'}, 'LLY': {'Name': 'South Jersey Regional Airport', 'City': 'Mount Holly', 'Country': 'United States'}, 'LDJ': {'Name': 'Linden Airport', 'City': 'Linden', 'Country': 'United States'}, 'ANQ': {'Name': 'Tri State Steuben County Airport', 'City': 'Angola', 'Country': 'United States'}, 'CLW': {'Name': 'Clearwater Air Park', 'City': 'Clearwater', 'Country': 'United States'}, 'CGX': {'Name': 'Chicago Meigs Airport', 'City': 'Chicago', 'Country': 'United States'}, 'CRE': {'Name': 'Grand Strand Airport', 'City': 'North Myrtle Beach', 'Country': 'United States'}, 'BXO': {'Name': 'Buochs Airport', 'City': 'Buochs', 'Country': 'Switzerland'}, 'WBW': {'Name': 'Wilkes Barre Wyoming Valley Airport', 'City': 'Wilkes-Barre', 'Country': 'United States'}, 'LNN': {'Name': 'Willoughby Lost Nation Municipal Airport', 'City': 'Willoughby', 'Country': 'United States'}, 'UMD': {'Name': 'Uummannaq Heliport', 'City': 'Uummannaq', 'Country': 'Greenland'}, 'RLK': {'Name': 'Bayannur Tianjitai Airport', 'City': 'Bayannur', 'Country': 'China'}, 'FFT': {'Name': 'Capital City Airport', 'City': 'Frankfort', 'Country': 'United States'}, 'LEW': {'Name': 'Auburn Lewiston Municipal Airport', 'City': 'Lewiston', 'Country': 'United States'}, 'MRK': {'Name': 'Marco Island Executive Airport', 'City': 'Marco Island Airport', 'Country': 'United States'}, 'DRE': {'Name': 'Drummond Island Airport', 'City': 'Drummond Island', 'Country': 'United States'}, 'GDW': {'Name': 'Gladwin Zettel Memorial Airport', 'City': 'Gladwin', 'Country': 'United States'}, 'MFI': {'Name': 'Marshfield Municipal Airport', 'City': 'Marshfield', 'Country': 'United States'}, 'ISW': {'Name': 'Alexander Field South Wood County Airport', 'City': 'Wisconsin Rapids', 'Country': 'United States'}, 'CWI': {'Name': 'Clinton Municipal Airport', 'City': 'Clinton', 'Country': 'United States'}, 'BVY': {'Name': 'Beverly Municipal Airport', 'City': 'Beverly', 'Country': 'United States'}, 'OSF': {'Name': 'Ostafyevo International Airport', 'City': 'Moscow', 'Country': 'Russia'}, 'YRQ': {'Name': 'Trois-Rivières Airport', 'City': 'Trois Rivieres', 'Country': 'Canada'}, 'POF': {'Name': 'Poplar Bluff Municipal Airport', 'City': 'Poplar Bluff', 'Country': 'United States'}, 'EOK': {'Name': 'Keokuk Municipal Airport', 'City': 'Keokuk', 'Country': 'United States'}, 'PSL': {'Name': 'Perth/Scone Airport', 'City': 'Perth', 'Country': 'United Kingdom'}, 'STP': {'Name': 'St Paul Downtown Holman Field', 'City': 'St. Paul', 'Country': 'United States'}, 'SOO': {'Name': 'Söderhamn Airport', 'City': 'Soderhamn', 'Country': 'Sweden'}, 'VNA': {'Name': 'Saravane Airport', 'City': 'Saravane', 'Country': 'Laos'}, 'DKS': {'Name': 'Dikson Airport', 'City': 'Dikson', 'Country': 'Russia'}, 'BYT': {'Name': 'Bantry Aerodrome', 'City': 'Bantry', 'Country': 'Ireland'}, 'ADY': {'Name': 'Alldays Airport', 'City': 'Alldays', 'Country': 'South Africa'}, 'HAO': {'Name': 'Butler Co Regional Airport - Hogan Field', 'City': 'Hamilton', 'Country': 'United States'}, 'GAS': {'Name': 'Garissa Airport', 'City': 'Garissa', 'Country': 'Kenya'}, 'HOA': {'Name': 'Hola Airport', 'City': 'Hola', 'Country': 'Kenya'}, 'KEY': {'Name': 'Kericho Airport', 'City': 'Kericho', 'Country': 'Kenya'}, 'ILU': {'Name': 'Kilaguni Airport', 'City': 'Kilaguni', 'Country': 'Kenya'}, 'ATJ': {'Name': 'Antsirabe Airport', 'City': 'Antsirabe', 'Country': 'Madagascar'}, 'OVA': {'Name': 'Bekily Airport', 'City': 'Bekily', 'Country': 'Madagascar'}, 'UTS': {'Name': 'Ust-Tsylma Airport', 'City': 'Ust-Tsylma', 'Country': 'Russia'}, 'RGK': {'Name': 'Gorno-Altaysk Airport', 'City': 'Gorno-Altaysk', 'Country': 'Russia'}, 'FLD': {'Name': 'Fond du Lac County Airport', 'City': 'Fond du Lac', 'Country': 'United States'}, 'STE': {'Name': 'Stevens Point Municipal Airport', 'City': 'Stevens Point', 'Country': 'United States'}, 'MQJ': {'Name': 'Moma Airport', 'City': 'Honuu', 'Country': 'Russia'}, 'PEF': {'Name': 'Peenemünde Airport', 'City': 'Peenemunde', 'Country': 'Germany'}, 'CJN': {'Name': 'Nusawiru Airport', 'City': 'Nusawiru', 'Country': 'Indonesia'}, 'GQQ': {'Name': 'Galion Municipal Airport', 'City': 'Galion', 'Country': 'United States'}, 'TPN': {'Name': 'Tiputini Airport', 'City': 'Tiputini', 'Country': 'Ecuador'}, 'PTZ': {'Name': 'Rio Amazonas Airport', 'City': 'Pastaza', 'Country': 'Ecuador'}, 'CKV': {'Name': 'Clarksville–Montgomery County Regional Airport', 'City': 'Clarksville', 'Country': 'United States'}, 'LPC': {'Name': 'Lompoc Airport', 'City': 'Lompoc', 'Country': 'United States'}, 'CTH': {'Name': 'Chester County G O Carlson Airport', 'City': 'Coatesville', 'Country': 'United States'}, 'BST': {'Name': 'Bost Airport', 'City': 'Lashkar Gah', 'Country': 'Afghanistan'}, 'LLK': {'Name': 'Lankaran International Airport', 'City': 'Lankaran', 'Country': 'Azerbaijan'}, 'GBB': {'Name': 'Gabala International Airport', 'City': 'Qabala', 'Country': 'Azerbaijan'}, 'ZTU': {'Name': 'Zaqatala International Airport', 'City': 'Zaqatala', 'Country': 'Azerbaijan'}, 'LKP': {'Name': 'Lake Placid Airport', 'City': 'Lake Placid', 'Country': 'United States'}, 'KDY': {'Name': 'Typliy Klyuch Airport', 'City': 'Khandyga', 'Country': 'Russia'}, 'GYG': {'Name': 'Magan Airport', 'City': 'Yakutsk', 'Country': 'Russia'}, 'JIQ': {'Name': 'Qianjiang Wulingshan Airport', 'City': 'Qianjiang', 'Country': 'China'}, 'AOH': {'Name': 'Lima Allen County Airport', 'City': 'Lima', 'Country': 'United States'}, 'DSO': {'Name': 'Sondok Airport', 'City': 'Hamhung', 'Country': 'North Korea'}, 'SSI': {'Name': 'Malcolm McKinnon Airport', 'City': 'Brunswick', 'Country': 'United States'}, 'BFP': {'Name': 'Beaver County Airport', 'City': 'Beaver Falls', 'Country': 'United States'}, 'GGE': {'Name': 'Georgetown County Airport', 'City': 'Georgetown', 'Country': 'United States'}, 'HDI': {'Name': 'Hardwick Field', 'City': 'Cleveland', 'Country': 'United States'}, 'RNT': {'Name': 'Renton Municipal Airport', 'City': 'Renton', 'Country': 'United States'}, 'POC': {'Name': 'Brackett Field', 'City': 'La Verne', 'Country': 'United States'}, 'CTY': {'Name': 'Cross City Airport', 'City': 'Cross City', 'Country': 'United States'}, 'CEU': {'Name': 'Oconee County Regional Airport', 'City': 'Clemson', 'Country': 'United States'}, 'BEC': {'Name': 'Beech Factory Airport', 'City': 'Wichita', 'Country': 'United States'}, 'QFO': {'Name': 'Duxford Aerodrome', 'City': 'Duxford', 'Country': 'United Kingdom'}, 'SNY': {'Name': 'Sidney Municipal-Lloyd W Carr Field', 'City': 'Sidney', 'Country': 'United States'}, 'GKL': {'Name': 'Great Keppel Is Airport', 'City': 'Great Keppel Island', 'Country': 'Australia'}, 'RPB': {'Name': 'Roper Bar Airport', 'City': 'Roper Bar', 'Country': 'Australia'}, 'IFL': {'Name': 'Innisfail Airport', 'City': 'Innisfail', 'Country': 'Australia'}, 'JRF': {'Name': 'Kalaeloa Airport', 'City': 'Kapolei', 'Country': 'United States'}, 'BIN': {'Name': 'Bamiyan Airport', 'City': 'Bamyan', 'Country': 'Afghanistan'}, 'NBS': {'Name': 'Changbaishan Airport', 'City': 'Baishan', 'Country': 'China'}, 'RGO': {'Name': 'Orang Airport', 'City': 'Chongjin', 'Country': 'North Korea'}, 'MOO': {'Name': 'Moomba Airport', 'City': 'Moomba', 'Country': 'Australia'}, 'LUZ': {'Name': 'Lublin Airport', 'City': 'Lublin', 'Country': 'Poland'}, 'ECA': {'Name': 'Iosco County Airport', 'City': 'East Tawas', 'Country': 'United States'}, 'VAM': {'Name': 'Villa Airport', 'City': 'Maamigili', 'Country': 'Maldives'}, 'LLF': {'Name': 'Lingling Airport', 'City': 'Yongzhou', 'Country': 'China'}, 'LSZ': {'Name': 'Lošinj Island Airport', 'City': 'Mali Losinj', 'Country': 'Croatia'}, 'ONS': {'Name': 'Onslow Airport', 'City': 'Onslow', 'Country': 'Australia'}, 'TDR': {'Name': 'Theodore Airport', 'City': 'Theodore', 'Country': 'Australia'}, 'WBU': {'Name': 'Boulder Municipal Airport', 'City': 'Boulder', 'Country': 'United States'}, 'BBJ': {'Name': 'Bitburg Airport', 'City': 'Birburg', 'Country': 'Germany'}, 'PAO': {'Name': 'Palo Alto Airport of Santa Clara County', 'City': 'Palo Alto', 'Country': 'United States'}, 'USR': {'Name': 'Ust-Nera Airport', 'City': 'Ust-Nera', 'Country': 'Russia'}, 'MSC': {'Name': 'Falcon Field', 'City': 'Mesa', 'Country': 'United States'}, 'YTY': {'Name': 'Yangzhou Taizhou Airport', 'City': 'Yangzhou', 'Country': 'China'}, 'PTK': {'Name': 'Oakland County International Airport', 'City': 'Pontiac', 'Country': 'United States'}, 'KSI': {'Name': 'Kissidougou Airport', 'City': 'Kissidougou', 'Country': 'Guinea'}, 'EEN': {'Name': 'Dillant Hopkins Airport', 'City': 'Keene', 'Country': 'United States'}, 'THQ': {'Name': 'Tianshui Maijishan Airport', 'City': 'Tianshui', 'Country': 'China'}, 'VRO': {'Name': 'Kawama Airport', 'City': 'Kawama', 'Country': 'Cuba'}, 'GKK': {'Name': 'Kooddoo Airport', 'City': 'Kooddoo', 'Country': 'Maldives'}, 'RCS': {'Name': 'Rochester Airport', 'City': 'Rochester', 'Country': 'United Kingdom'}, 'RHD': {'Name': 'Termas de Río Hondo international Airport', 'City': 'Rio Hondo', 'Country': 'Argentina'}, 'KMP': {'Name': 'Keetmanshoop Airport', 'City': 'Keetmanshoop', 'Country': 'Namibia'}, 'KGT': {'Name': 'Kangding Airport', 'City': 'Kangding', 'Country': 'China'}, 'VUS': {'Name': 'Velikiy Ustyug Airport', 'City': 'Veliky Ustyug', 'Country': 'Russia'}, 'IOW': {'Name': 'Iowa City Municipal Airport', 'City': 'Iowa City', 'Country': 'United States'}, 'TLQ': {'Name': 'Turpan Jiaohe Airport', 'City': 'Turpan', 'Country': 'China'}, 'ANP': {'Name': 'Lee Airport', 'City': 'Annapolis', 'Country': 'United States'}, 'FXO': {'Name': 'Cuamba Airport', 'City': 'Cuamba', 'Country': 'Mozambique'}, 'ODO': {'Name': 'Bodaybo Airport', 'City': 'Bodaibo', 'Country': 'Russia'}, 'ZTR': {'Name': 'Zhytomyr Airport', 'City': 'Zhytomyr', 'Country': 'Ukraine'}, 'HRI': {'Name': 'Mattala Rajapaksa International Airport', 'City': 'Mattala', 'Country': 'Sri Lanka'}, 'PEQ': {'Name': 'Pecos Municipal Airport', 'City': 'Pecos', 'Country': 'United States'}, 'HBG': {'Name': 'Hattiesburg Bobby L Chain Municipal Airport', 'City': 'Hattiesburg', 'Country': 'United States'}, 'QCJ': {'Name': 'Botucatu - Tancredo de Almeida Neves Airport', 'City': 'Botucatu', 'Country': 'Brazil'}, 'QSC': {'Name': 'Mário Pereira Lopes–São Carlos Airport', 'City': 'Sao Carlos', 'Country': 'Brazil'}, 'YKN': {'Name': 'Chan Gurney Municipal Airport', 'City': 'Yankton', 'Country': 'United States'}, 'XSB': {'Name': 'Sir Bani Yas Airport', 'City': 'Sir Bani Yas Island', 'Country': 'United Arab Emirates'}, 'ZBM': {'Name': 'Bromont (Roland Desourdy) Airport', 'City': 'Bromont', 'Country': 'Canada'}, 'KTI': {'Name': 'Kratie Airport', 'City': 'Kratie', 'Country': 'Cambodia'}, 'GYU': {'Name': 'Guyuan Liupanshan Airport', 'City': 'Guyuan', 'Country': 'China'}, 'CNI': {'Name': 'Changhai Airport', 'City': 'Changhai', 'Country': 'China'}, 'KRH': {'Name': 'Redhill Aerodrome', 'City': 'Redhill', 'Country': 'United Kingdom'}, 'JGD': {'Name': 'Jiagedaqi Airport', 'City': 'Jiagedaqi District', 'Country': 'China'}, 'CCL': {'Name': 'Chinchilla Airport', 'City': 'Chinchilla', 'Country': 'Australia'}, 'HWD': {'Name': 'Hayward Executive Airport', 'City': 'Hayward', 'Country': 'United States'}, 'MZP': {'Name': 'Motueka Airport', 'City': 'Motueka', 'Country': 'New Zealand'}, 'JHQ': {'Name': 'Shute Harbour Airport', 'City': 'Shute Harbour', 'Country': 'Australia'}, 'ARB': {'Name': 'Ann Arbor Municipal Airport', 'City': 'Ann Arbor', 'Country': 'United States'}, 'SHT': {'Name': 'Shepparton Airport', 'City': 'Shepparton', 'Country': 'Australia'}, 'TEM': {'Name': 'Temora Airport', 'City': 'Temora', 'Country': 'Australia'}, 'GAH': {'Name': 'Gayndah Airport', 'City': 'Gayndah', 'Country': 'Australia'}, 'WIO': {'Name': 'Wilcannia Airport', 'City': 'Wilcannia', 'Country': 'Australia'}, 'BFJ': {'Name': 'Bijie Feixiong Airport', 'City': 'Bijie', 'Country': 'China'}, 'ULK': {'Name': 'Lensk Airport', 'City': 'Lensk', 'Country': 'Russia'}, 'KVR': {'Name': 'Kavalerovo Airport', 'City': 'Kavalerovo', 'Country': 'Russia'}, 'IGD': {'Name': 'Iğdır Airport', 'City': 'Igdir', 'Country': 'Turkey'}, 'GNY': {'Name': 'Şanlıurfa GAP Airport', 'City': 'Sanliurfa', 'Country': 'Turkey'}, 'KZR': {'Name': 'Zafer Airport', 'City': 'Kutahya', 'Country': 'Turkey'}, 'VLU': {'Name': 'Velikiye Luki Airport', 'City': 'Velikiye Luki', 'Country': 'Russia'}, 'BEO': {'Name': 'Lake Macquarie Airport', 'City': 'Lake Macquarie', 'Country': 'Australia'}, 'BMP': {'Name': 'Brampton Island Airport', 'City': 'Brampton Island', 'Country': 'Australia'}, 'NGZ': {'Name': 'Alameda Naval Air Station', 'City': 'Alameda', 'Country': 'United States'}, 'YCN': {'Name': 'Cochrane Airport', 'City': 'Cochrane', 'Country': 'Canada'}, 'BJP': {'Name': 'Estadual Arthur Siqueira Airport', 'City': 'Braganca Paulista', 'Country': 'Brazil'}, 'BQB': {'Name': 'Busselton Regional Airport', 'City': 'Brusselton', 'Country': 'Australia'}, 'SEK': {'Name': 'Srednekolymsk Airport', 'City': 'Srednekolymsk', 'Country': 'Russia'}, 'IVR': {'Name': 'Inverell Airport', 'City': 'Inverell', 'Country': 'Australia'}, 'GLI': {'Name': 'Glen Innes Airport', 'City': 'Glen Innes', 'Country': 'Australia'}, 'IMM': {'Name': 'Immokalee Regional Airport', 'City': 'Immokalee ', 'Country': 'United States'}, 'TQQ': {'Name': 'Maranggo Airport', 'City': 'Sulawesi Tenggara', 'Country': 'Indonesia'}, 'YIC': {'Name': 'Yichun Mingyueshan Airport', 'City': 'Yichun', 'Country': 'China'}, 'PTB': {'Name': 'Dinwiddie County Airport', 'City': 'Petersburg', 'Country': 'United States'}, 'SBM': {'Name': 'Sheboygan County Memorial Airport', 'City': 'Sheboygan', 'Country': 'United States'}, 'KFE': {'Name': 'Fortescue - Dave Forrest Aerodrome', 'City': 'Cloudbreak', 'Country': 'Australia'}, 'BJU': {'Name': 'Bajura Airport', 'City': 'Bajura', 'Country': 'Nepal'}, 'MZJ': {'Name': 'Pinal Airpark', 'City': 'Marana', 'Country': 'United States'}, 'SAD': {'Name': 'Safford Regional Airport', 'City': 'Safford', 'Country': 'United States'}, 'SLJ': {'Name': 'Solomon Airport', 'City': 'Solomon', 'Country': 'Australia'}, 'KJP': {'Name': 'Kerama Airport', 'City': 'Kerama', 'Country': 'Japan'}, 'EKB': {'Name': 'Ekibastuz Airport', 'City': 'Ekibastuz', 'Country': 'Kazakhstan'}, 'SIK': {'Name': 'Sikeston Memorial Municipal Airport', 'City': 'Sikeston', 'Country': 'United States'}, 'TTI': {'Name': 'Tetiaroa Airport', 'City': 'Tetiaroa', 'Country': 'French Polynesia'}, 'GFL': {'Name': 'Floyd Bennett Memorial Airport', 'City': 'Queensbury', 'Country': 'United States'}, 'MTN': {'Name': 'Martin State Airport', 'City': 'Baltimore', 'Country': 'United States'}, 'FRY': {'Name': 'Eastern Slopes Regional Airport', 'City': 'Fryeburg', 'Country': 'United States'}, 'NEW': {'Name': 'Lakefront Airport', 'City': 'New Orleans', 'Country': 'United States'}, 'COE': {'Name': "Coeur D'Alene - Pappy Boyington Field", 'City': "Coeur d'Alene", 'Country': 'United States'}, 'BMT': {'Name': 'Beaumont Municipal Airport', 'City': 'Beaumont', 'Country': 'United States'}, 'DNV': {'Name': 'Vermilion Regional Airport', 'City': 'Danville', 'Country': 'United States'}, 'COJ': {'Name': 'Coonabarabran Airport', 'City': 'Coonabarabran', 'Country': 'Australia'}, 'TIX': {'Name': 'Space Coast Regional Airport', 'City': 'Titusville', 'Country': 'United States'}, 'BZH': {'Name': 'Bumi Airport', 'City': 'Bumi Hills', 'Country': 'Zimbabwe'}, 'UAR': {'Name': 'Bouarfa Airport', 'City': 'Bouarfa', 'Country': 'Morocco'}, 'NYE': {'Name': 'Nyeri Airport', 'City': 'NYERI', 'Country': 'Kenya'}, 'AAP': {'Name': 'Andrau Airpark', 'City': 'Houston', 'Country': 'United States'}, 'FCM': {'Name': 'Flying Cloud Airport', 'City': 'Eden Prairie', 'Country': 'United States'}, 'LIX': {'Name': 'Likoma Island Airport', 'City': 'Likoma Island', 'Country': 'Malawi'}, 'OJC': {'Name': 'Johnson County Executive Airport', 'City': 'Olathe', 'Country': 'United States'}, 'GIU': {'Name': 'Sigiriya Air Force Base', 'City': 'Sigiriya', 'Country': 'Sri Lanka'}, 'EUM': {'Name': 'Neumünster Airport', 'City': 'Neumuenster', 'Country': 'Germany'}, 'TKT': {'Name': 'Tak Airport', 'City': 'Tak', 'Country': 'Thailand'}, 'YLK': {'Name': 'Barrie-Orillia (Lake Simcoe Regional Airport)', 'City': 'Barrie-Orillia', 'Country': 'Canada'}, 'YCM': {'Name': 'Niagara District Airport', 'City': 'Saint Catherines', 'Country': 'Canada'}, 'YPD': {'Name': 'Parry Sound Area Municipal Airport', 'City': 'Parry Sound', 'Country': 'Canada'}, 'MNZ': {'Name': 'Manassas Regional Airport/Harry P. Davis Field', 'City': 'Manassas', 'Country': 'United States'}, 'LJN': {'Name': 'Texas Gulf Coast Regional Airport', 'City': 'Angleton', 'Country': 'United States'}, 'BGG': {'Name': 'Bingöl Çeltiksuyu Airport', 'City': 'Bingol', 'Country': 'Turkey'}, 'KFS': {'Name': 'Kastamonu Airport', 'City': 'Kastamonu', 'Country': 'Turkey'}, 'LLV': {'Name': 'Lüliang Airport', 'City': 'Lvliang', 'Country': 'China'}, 'DCY': {'Name': 'Daocheng Yading Airport', 'City': 'Daocheng', 'Country': 'China'}, 'GXH': {'Name': 'Gannan Xiahe Airport', 'City': 'Xiahe city', 'Country': 'China'}, 'CIY': {'Name': 'Comiso Airport', 'City': 'Comiso', 'Country': 'Italy'}, 'KVM': {'Name': 'Markovo Airport', 'City': 'Markovo', 'Country': 'Russia'}, 'ZKP': {'Name': 'Zyryanka Airport', 'City': 'Zyryanka', 'Country': 'Russia'}, 'UMS': {'Name': 'Ust-Maya Airport', 'City': 'Ust-Maya', 'Country': 'Russia'}, 'ADH': {'Name': 'Aldan Airport', 'City': 'Aldan', 'Country': 'Russia'}, 'OLZ': {'Name': 'Olyokminsk Airport', 'City': 'Olekminsk', 'Country': 'Russia'}, 'NLT': {'Name': 'Xinyuan Nalati Airport', 'City': 'Xinyuan', 'Country': 'China'}, 'PTA': {'Name': 'Port Alsworth Airport', 'City': 'Port alsworth', 'Country': 'United States'}, 'BOR': {'Name': 'Fontaine Airport', 'City': 'Belfort', 'Country': 'France'}, 'OBC': {'Name': 'Obock Airport', 'City': 'Obock', 'Country': 'Djibouti'}, 'TDJ': {'Name': 'Tadjoura Airport', 'City': 'Tadjoura', 'Country': 'Djibouti'}, 'AQB': {'Name': 'Santa Cruz del Quiche Airport', 'City': 'Santa Cruz des Quiche', 'Country': 'Guatemala'}, 'NOR': {'Name': 'Norðfjörður Airport', 'City': 'Nordfjordur', 'Country': 'Iceland'}, 'BTZ': {'Name': 'Bursa Airport', 'City': 'Bursa', 'Country': 'Turkey'}, 'WAR': {'Name': 'Waris Airport', 'City': 'Waris-Papua Island', 'Country': 'Indonesia'}, 'EWK': {'Name': 'Newton City-County Airport', 'City': 'Newton', 'Country': 'United States'}, 'BSJ': {'Name': 'Bairnsdale Airport', 'City': 'Bairnsdale', 'Country': 'Australia'}, 'TZR': {'Name': 'Taszár Air Base', 'City': 'Columbus', 'Country': 'United States'}, 'FBR': {'Name': 'Fort Bridger Airport', 'City': 'Fort Bridger', 'Country': 'United States'}, 'CLS': {'Name': 'Chehalis Centralia Airport', 'City': 'Chehalis', 'Country': 'United States'}, 'EVW': {'Name': 'Evanston-Uinta County Airport-Burns Field', 'City': 'Evanston', 'Country': 'United States'}, 'EUF': {'Name': 'Weedon Field', 'City': 'Eufala', 'Country': 'United States'}, 'MEO': {'Name': 'Dare County Regional Airport', 'City': 'Manteo', 'Country': 'United States'}, 'AUO': {'Name': 'Auburn University Regional Airport', 'City': 'Auburn', 'Country': 'United States'}, 'DBN': {'Name': "W H 'Bud' Barron Airport", 'City': 'Dublin', 'Country': 'United States'}, 'PUK': {'Name': 'Pukarua Airport', 'City': 'Pukarua', 'Country': 'French Polynesia'}, 'CVO': {'Name': 'Corvallis Municipal Airport', 'City': 'Corvallis', 'Country': 'United States'}, 'PXH': {'Name': 'Prominent Hill Airport', 'City': 'Prominent Hill', 'Country': 'Australia'}, 'CWT': {'Name': 'Cowra Airport', 'City': 'Chatsworth', 'Country': 'Australia'}, 'OGD': {'Name': 'Ogden Hinckley Airport', 'City': 'Ogden', 'Country': 'United States'}, 'AKO': {'Name': 'Colorado Plains Regional Airport', 'City': 'Akron', 'Country': 'United States'}, 'SHN': {'Name': 'Sanderson Field', 'City': 'Shelton', 'Country': 'United States'}, 'WNA': {'Name': 'Napakiak Airport', 'City': 'Napakiak', 'Country': 'United States'}, 'PKA': {'Name': 'Napaskiak Airport', 'City': 'Napaskiak', 'Country': 'United States'}, 'YBW': {'Name': 'Bedwell Harbour Seaplane Base', 'City': 'Bedwell Harbour', 'Country': 'Canada'}, 'WSO': {'Name': 'Washabo Airport', 'City': 'Washabo', 'Country': 'Suriname'}, 'WKR': {'Name': 'Abaco I Walker C Airport', 'City': "Walker's Cay", 'Country': 'Bahamas'}, 'GFO': {'Name': 'Bartica A Airport', 'City': 'Bartica', 'Country': 'Guyana'}, 'DYL': {'Name': 'Doylestown Airport', 'City': 'Doylestown', 'Country': 'United States'}, 'TGI': {'Name': 'Tingo Maria Airport', 'City': 'Tingo Maria', 'Country': 'Peru'}, 'TJL': {'Name': 'Plínio Alarcom Airport', 'City': 'Tres Lagoas', 'Country': 'Brazil'}, 'YZY': {'Name': 'Zhangye Ganzhou Airport', 'City': 'Zhangye', 'Country': 'China'}, 'OAL': {'Name': 'Cacoal Airport', 'City': 'Cacoal', 'Country': 'Brazil'}, 'OCW': {'Name': 'Warren Field', 'City': 'Washington', 'Country': 'United States'}, 'MHC': {'Name': 'Mocopulli Airport', 'City': 'Castro', 'Country': 'Chile'}, 'SWO': {'Name': 'Stillwater Regional Airport', 'City': 'Stillwater', 'Country': 'United States'}, 'OKM': {'Name': 'Okmulgee Regional Airport', 'City': 'Okmulgee', 'Country': 'United States'}, 'CUH': {'Name': 'Cushing Municipal Airport', 'City': 'Cushing', 'Country': 'United States'}, 'CSM': {'Name': 'Clinton Sherman Airport', 'City': 'Clinton', 'Country': 'United States'}, 'WLD': {'Name': 'Strother Field', 'City': 'Winfield', 'Country': 'United States'}, 'PWA': {'Name': 'Wiley Post Airport', 'City': 'Oklahoma City', 'Country': 'United States'}, 'DTN': {'Name': 'Shreveport Downtown Airport', 'City': 'Shreveport', 'Country': 'United States'}, 'SEP': {'Name': 'Stephenville Clark Regional Airport', 'City': 'Stephenville', 'Country': 'United States'}, 'ADT': {'Name': 'Ada Regional Airport', 'City': 'Ada', 'Country': 'United States'}, 'IRB': {'Name': 'Iraan Municipal Airport', 'City': 'Iraan', 'Country': 'United States'}, 'YEL': {'Name': 'Elliot Lake Municipal Airport', 'City': 'ELLIOT LAKE', 'Country': 'Canada'}, 'IKB': {'Name': 'Wilkes County Airport', 'City': 'North Wilkesboro', 'Country': 'United States'}, 'DAN': {'Name': 'Danville Regional Airport', 'City': 'Danville', 'Country': 'United States'}, 'ERG': {'Name': 'Yerbogachen Airport', 'City': 'Yerbogachen', 'Country': 'Russia'}, 'HCW': {'Name': 'Cheraw Municipal Airport/Lynch Bellinger Field', 'City': 'Cheraw', 'Country': 'United States'}, 'BEM': {'Name': 'Beni Mellal Airport', 'City': 'Beni Mellal', 'Country': 'Morocco'}, 'NKT': {'Name': 'Şırnak Şerafettin Elçi Airport', 'City': 'Cizre', 'Country': 'Turkey'}, 'SUY': {'Name': 'Suntar Airport', 'City': 'Suntar', 'Country': 'Russia'}, 'OUZ': {'Name': 'Tazadit Airport', 'City': 'Zouerat', 'Country': 'Mauritania'}, 'ABB': {'Name': 'Asaba International Airport', 'City': 'Asaba', 'Country': 'Nigeria'}, 'QUO': {'Name': 'Akwa Ibom International Airport', 'City': 'Uyo', 'Country': 'Nigeria'}, 'KAA': {'Name': 'Kasama Airport', 'City': 'Kasama', 'Country': 'Zambia'}, 'SGX': {'Name': 'Songea Airport', 'City': 'Songea', 'Country': 'Tanzania'}, 'JUH': {'Name': 'Jiuhuashan Airport', 'City': 'Chizhou', 'Country': 'China'}, 'AOG': {'Name': 'Anshan Air Base', 'City': 'Anshan', 'Country': 'China'}, 'DQA': {'Name': 'Saertu Airport', 'City': 'Daqing', 'Country': 'China'}, 'ZYI': {'Name': 'Zunyi Xinzhou Airport', 'City': 'Zunyi', 'Country': 'China'}, 'LDS': {'Name': 'Lindu Airport', 'City': 'Yinchun', 'Country': 'China'}, 'AVA': {'Name': 'Anshun Huangguoshu Airport', 'City': 'Anshun', 'Country': 'China'}, 'KSS': {'Name': 'Sikasso Airport', 'City': 'Sikasso', 'Country': 'Mali'}, 'WTB': {'Name': 'Toowoomba Wellcamp Airport', 'City': 'Toowoomba', 'Country': 'Australia'}, 'TNH': {'Name': 'Tonghua Sanyuanpu Airport', 'City': 'Tonghua', 'Country': 'China'}, 'SZV': {'Name': 'Suzhou Guangfu Airport', 'City': 'Suzhou', 'Country': 'China'}, 'LII': {'Name': 'Mulia Airport', 'City': 'Mulia', 'Country': 'Indonesia'}, 'NTI': {'Name': 'Stenkol Airport', 'City': 'Bintuni', 'Country': 'Indonesia'}, 'WSR': {'Name': 'Wasior Airport', 'City': 'Wasior', 'Country': 'Indonesia'}, 'DTB': {'Name': 'Silangit Airport', 'City': 'Siborong-Borong', 'Country': 'Indonesia'}, 'MEQ': {'Name': 'Seunagan Airport', 'City': 'Nagan Raya', 'Country': 'Indonesia'}, 'BUW': {'Name': 'Betoambari Airport', 'City': 'Bau-Bau', 'Country': 'Indonesia'}, 'KAZ': {'Name': 'Kao Airport', 'City': 'Kao', 'Country': 'Indonesia'}, 'MNA': {'Name': 'Melangguane Airport', 'City': 'Melonguane', 'Country': 'Indonesia'}, 'SGQ': {'Name': 'Sanggata/Sangkimah Airport', 'City': 'Sanggata', 'Country': 'Indonesia'}, 'BUU': {'Name': 'Muara Bungo Airport', 'City': 'Muara Bungo', 'Country': 'Indonesia'}, 'ILA': {'Name': 'Illaga Airport', 'City': 'Illaga', 'Country': 'Indonesia'}, 'OKL': {'Name': 'Oksibil Airport', 'City': 'Oksibil', 'Country': 'Indonesia'}, 'KOX': {'Name': 'Kokonau Airport', 'City': 'Kokonau', 'Country': 'Indonesia'}, 'CMQ': {'Name': 'Clermont Airport', 'City': 'Clermont', 'Country': 'Australia'}, 'WMB': {'Name': 'Warrnambool Airport', 'City': 'Warrnambool', 'Country': 'Australia'}, 'RCM': {'Name': 'Richmond Airport', 'City': 'Richmond', 'Country': 'Australia'}, 'DCN': {'Name': 'RAAF Base Curtin', 'City': 'Derby', 'Country': 'Australia'}, 'KNO': {'Name': 'Kualanamu International Airport', 'City': 'Medan', 'Country': 'Indonesia'}, 'AMN': {'Name': 'Gratiot Community Airport', 'City': 'Kamloops', 'Country': 'Canada'}, 'HMY': {'Name': 'Seosan Air Base', 'City': 'Seosan', 'Country': 'South Korea'}, 'EMT': {'Name': 'San Gabriel Valley Airport', 'City': 'El Monte', 'Country': 'United States'}, 'FAH': {'Name': 'Farah Airport', 'City': 'Farah', 'Country': 'Afghanistan'}, 'IXT': {'Name': 'Pasighat Airport', 'City': 'Pasighat', 'Country': 'India'}, 'KRQ': {'Name': 'Kramatorsk Airport', 'City': 'Kramatorsk', 'Country': 'Ukraine'}, 'QKX': {'Name': 'Kautokeino Air Base', 'City': 'Kautokeino', 'Country': 'Norway'}, 'SSF': {'Name': 'Stinson Municipal Airport', 'City': 'Stinson', 'Country': 'United States'}, 'JAS': {'Name': 'Jasper County Airport-Bell Field', 'City': 'Jasper', 'Country': 'United States'}, 'MRF': {'Name': 'Marfa Municipal Airport', 'City': 'Marfa', 'Country': 'United States'}, 'ALE': {'Name': 'Alpine Casparis Municipal Airport', 'City': 'Alpine', 'Country': 'United States'}, 'BQE': {'Name': 'Bubaque Airport', 'City': 'Bubaque', 'Country': 'Guinea-Bissau'}, 'CZA': {'Name': 'Chichen Itza International Airport', 'City': 'Chichen Itza', 'Country': 'Mexico'}, 'BUY': {'Name': 'Bunbury Airport', 'City': 'Bunbury', 'Country': 'Australia'}, 'CCB': {'Name': 'Cable Airport', 'City': 'Upland', 'Country': 'United States'}, 'EKI': {'Name': 'Elkhart Municipal Airport', 'City': 'Elkhart', 'Country': 'United States'}, 'CUB': {'Name': 'Jim Hamilton L.B. Owens Airport', 'City': 'Columbia', 'Country': 'United States'}, 'GDC': {'Name': 'Donaldson Field Airport', 'City': 'Greenville', 'Country': 'United States'}, 'HVS': {'Name': 'Hartsville Regional Airport', 'City': 'Hartsville', 'Country': 'United States'}, 'SZT': {'Name': 'San Cristobal de las Casas Airport', 'City': 'San Cristobal de las Casas', 'Country': 'Mexico'}, 'DU9': {'Name': 'Dunnville Airport', 'City': 'Dunnville', 'Country': 'Canada'}, 'RIH': {'Name': 'Scarlett Martinez International Airport', 'City': 'Rio Hato', 'Country': 'Panama'}, 'LEE': {'Name': 'Leesburg International Airport', 'City': 'Leesburg', 'Country': 'United States'}, 'PPY': {'Name': 'Pouso Alegre Airport', 'City': 'Pouso Alegre', 'Country': 'Brazil'}, 'DIQ': {'Name': 'Brigadeiro Cabral Airport', 'City': 'Divinopolis', 'Country': 'Brazil'}, 'EIK': {'Name': 'Yeysk Airport', 'City': 'Eysk', 'Country': 'Russia'}, 'ERD': {'Name': 'Berdyansk Airport', 'City': 'Berdyansk', 'Country': 'Ukraine'}, 'BWX': {'Name': 'Blimbingsari Airport', 'City': 'Banyuwangi', 'Country': 'Indonesia'}, 'ERL': {'Name': 'Erenhot Saiwusu International Airport', 'City': 'Erenhot', 'Country': 'China'}, 'CNO': {'Name': 'Chino Airport', 'City': 'Chino', 'Country': 'United States'}, 'HTR': {'Name': 'Hateruma Airport', 'City': 'Taketomi', 'Country': 'Japan'}, 'BWW': {'Name': 'Las Brujas Airport', 'City': 'Cayo Santa Maria', 'Country': 'Cuba'}, 'PRB': {'Name': 'Paso Robles Municipal Airport', 'City': 'Paso Robles', 'Country': 'United States'}, 'PKX': {'Name': 'Beijing Daxing International Airport', 'City': 'Beijing', 'Country': 'China'}, 'HAF': {'Name': 'Half Moon Bay Airport', 'City': 'Half Moon Bay', 'Country': 'United States'}, 'HCJ': {'Name': 'Hechi Jinchengjiang Airport', 'City': 'Hechi', 'Country': 'China'}, 'WJF': {'Name': 'General WM J Fox Airfield', 'City': 'Lancaster', 'Country': 'United States'}, 'CJF': {'Name': 'Coondewanna Airport', 'City': 'Coondewanna', 'Country': 'Australia'}, 'GUZ': {'Name': 'Guarapari Airport', 'City': 'Guarapari', 'Country': 'Brazil'}, 'UBT': {'Name': 'Ubatuba Airport', 'City': 'Ubatuba', 'Country': 'Brazil'}, 'BOX': {'Name': 'Borroloola Airport', 'City': 'Borroloola', 'Country': 'Australia'}, 'QUG': {'Name': 'Chichester/Goodwood Airport', 'City': 'Goodwood', 'Country': 'United Kingdom'}, 'TNW': {'Name': 'Jumandy Airport', 'City': 'Tena', 'Country': 'Ecuador'}, 'FYJ': {'Name': 'Dongji Aiport', 'City': 'Fuyuan', 'Country': 'China'}, 'PZL': {'Name': 'Zulu Inyala Airport', 'City': 'Phinda', 'Country': 'South Africa'}, 'LPF': {'Name': 'Liupanshui Yuezhao Airport', 'City': 'Liupanshui', 'Country': 'China'}, 'KJH': {'Name': 'Kaili Airport', 'City': 'Kaili', 'Country': 'China'}, 'HPG': {'Name': 'Shennongjia Hongping Airport', 'City': 'Shennongjia', 'Country': 'China'}, 'ZQZ': {'Name': 'Zhangjiakou Ningyuan Airport', 'City': 'Zhangjiakou', 'Country': 'China'}, 'YIE': {'Name': "Arxan Yi'ershi Airport", 'City': 'Arxan', 'Country': 'China'}, 'HNY': {'Name': 'Hengyang Nanyue Airport', 'City': 'Hengyang', 'Country': 'China'}, 'AHJ': {'Name': 'Hongyuan Airport', 'City': 'Ngawa', 'Country': 'China'}, 'WOS': {'Name': 'Wonsan Kalma International Airport', 'City': 'Wonsan', 'Country': 'North Korea'}, 'IGT': {'Name': 'Magas Airport', 'City': 'Magas', 'Country': 'Russia'}, 'ASN': {'Name': 'Talladega Municipal Airport', 'City': 'Talladega', 'Country': 'United States'}, 'GMU': {'Name': 'Greenville Downtown Airport', 'City': 'Greenville', 'Country': 'United States'}, 'NGD': {'Name': 'Captain Auguste George Airport', 'City': 'Anegada', 'Country': 'British Virgin Islands'}, 'TOI': {'Name': 'Troy Municipal Airport at N Kenneth Campbell Field', 'City': 'Troy', 'Country': 'United States'}, 'ETS': {'Name': 'Enterprise Municipal Airport', 'City': 'Enterprise', 'Country': 'United States'}, 'EFG': {'Name': 'Efogi Airport', 'City': 'Efogi', 'Country': 'Papua New Guinea'}, 'KGW': {'Name': 'Kagi Airport', 'City': 'Kagi', 'Country': 'Papua New Guinea'}, 'NDN': {'Name': 'Nadunumu Airport', 'City': 'Nadunumu', 'Country': 'Papua New Guinea'}, 'BNM': {'Name': 'Bodinumu Airport', 'City': 'Bodinumu', 'Country': 'Papua New Guinea'}, 'ALX': {'Name': 'Thomas C Russell Field', 'City': 'Alexander City', 'Country': 'United States'}, 'PKT': {'Name': 'Port Keats Airport', 'City': 'Wadeye', 'Country': 'Australia'}, 'GPN': {'Name': 'Garden Point Airport', 'City': 'Pirlangimpi', 'Country': 'Australia'}, 'DOH': {'Name': 'Hamad International Airport', 'City': 'Doha', 'Country': 'Qatar'}, 'HZP': {'Name': 'Fort Mackay / Horizon Airport', 'City': 'Wood Buffalo', 'Country': 'Canada'}, 'HDE': {'Name': 'Brewster Field', 'City': 'Holdredge', 'Country': 'United States'}, 'PTT': {'Name': 'Pratt Regional Airport', 'City': 'Pratt', 'Country': 'United States'}, 'LXN': {'Name': 'Jim Kelly Field', 'City': 'Lexington', 'Country': 'United States'}, 'CBF': {'Name': 'Council Bluffs Municipal Airport', 'City': 'Council Bluffs', 'Country': 'United States'}, 'OKK': {'Name': 'Kokomo Municipal Airport', 'City': 'Kokomo', 'Country': 'United States'}, 'GBG': {'Name': 'Galesburg Municipal Airport', 'City': 'Galesburg', 'Country': 'United States'}, 'GUY': {'Name': 'Guymon Municipal Airport', 'City': 'Guymon', 'Country': 'United States'}, 'IDP': {'Name': 'Independence Municipal Airport', 'City': 'Independence', 'Country': 'United States'}, 'BBC': {'Name': 'Bay City Municipal Airport', 'City': 'Bay City', 'Country': 'United States'}, 'PRX': {'Name': 'Cox Field', 'City': 'Paris', 'Country': 'United States'}, 'CFV': {'Name': 'Coffeyville Municipal Airport', 'City': 'Coffeyville', 'Country': 'United States'}, 'GXY': {'Name': 'Greeley–Weld County Airport', 'City': 'Greeley', 'Country': 'United States'}, 'OEL': {'Name': 'Oryol Yuzhny Airport', 'City': 'Oakley', 'Country': 'United States'}, 'FET': {'Name': 'Fremont Municipal Airport', 'City': 'Fremont', 'Country': 'United States'}, 'LGD': {'Name': 'La Grande/Union County Airport', 'City': 'La Grande', 'Country': 'United States'}, 'SZY': {'Name': 'Olsztyn-Mazury Airport', 'City': 'Szczytno-Szymany', 'Country': 'Poland'}, 'MPO': {'Name': 'Pocono Mountains Municipal Airport', 'City': 'Mount Pocono', 'Country': 'United States'}, 'UKT': {'Name': 'Quakertown Airport', 'City': 'Quakertown', 'Country': 'United States'}, 'YBA': {'Name': 'Banff Airport', 'City': 'Banff', 'Country': 'Canada'}, 'BNG': {'Name': 'Banning Municipal Airport', 'City': 'Banning', 'Country': 'United States'}, 'OFK': {'Name': 'Karl Stefan Memorial Airport', 'City': 'Norfolk  Nebraska', 'Country': 'United States'}, 'TFL': {'Name': 'Juscelino Kubitscheck Airport', 'City': 'Teofilo Otoni', 'Country': 'Brazil'}, 'TPF': {'Name': 'Peter O Knight Airport', 'City': 'Tampa', 'Country': 'United States'}, 'BZC': {'Name': 'Umberto Modiano Airport', 'City': 'Buzios', 'Country': 'Brazil'}, 'ITP': {'Name': 'Itaperuna Airport', 'City': 'Itaperuna', 'Country': 'Brazil'}, 'REZ': {'Name': 'Resende Airport', 'City': 'Resende', 'Country': 'Brazil'}, 'KBN': {'Name': 'Tunta Airport', 'City': 'Kabinda', 'Country': 'Congo (Kinshasa)'}, 'IKL': {'Name': 'Ikela Airport', 'City': 'Ikela', 'Country': 'Congo (Kinshasa)'}, 'AIR': {'Name': 'Aripuanã Airport', 'City': 'Aripuana', 'Country': 'Brazil'}, 'JRN': {'Name': 'Juruena Airport', 'City': 'Juruena', 'Country': 'Brazil'}, 'JIA': {'Name': 'Juína Airport', 'City': 'Juina', 'Country': 'Brazil'}, 'VLP': {'Name': 'Vila Rica Airport', 'City': 'Vila Rica', 'Country': 'Brazil'}, 'JUA': {'Name': 'Inácio Luís do Nascimento Airport', 'City': 'Juara', 'Country': 'Brazil'}, 'CCX': {'Name': 'Cáceres Airport', 'City': 'Caceres', 'Country': 'Brazil'}, 'TGQ': {'Name': 'Tangará da Serra Airport', 'City': 'Tangara da Serra', 'Country': 'Brazil'}, 'CQA': {'Name': 'Canarana Airport', 'City': 'Canarana', 'Country': 'Brazil'}, 'MTG': {'Name': 'Vila Bela da Santíssima Trindade Airport', 'City': 'Vila Bela da Santissima Trindade ', 'Country': 'Brazil'}, 'BMB': {'Name': 'Bumbar Airport', 'City': 'Bumba', 'Country': 'Congo (Kinshasa)'}, 'APQ': {'Name': 'Arapiraca Airport', 'City': 'Arapiraca', 'Country': 'Brazil'}, 'FLB': {'Name': 'Cangapara Airport', 'City': 'Floriano', 'Country': 'Brazil'}, 'PCS': {'Name': 'Picos Airport', 'City': 'Picos', 'Country': 'Brazil'}, 'BNC': {'Name': 'Beni Airport', 'City': 'Beni', 'Country': 'Congo (Kinshasa)'}, 'BNB': {'Name': 'Boende Airport', 'City': 'Boende', 'Country': 'Congo (Kinshasa)'}, 'MTP': {'Name': 'Montauk Airport', 'City': 'Montauk', 'Country': 'United States'}, 'VPZ': {'Name': 'Porter County Municipal Airport', 'City': 'Valparaiso IN', 'Country': 'United States'}, 'DRV': {'Name': 'Dharavandhoo Airport', 'City': 'DHARAVANDHOO', 'Country': 'Maldives'}, 'SXK': {'Name': 'Saumlaki/Olilit Airport', 'City': 'Saumlaki', 'Country': 'Indonesia'}, 'MLZ': {'Name': 'Cerro Largo International Airport', 'City': 'Melo', 'Country': 'Uruguay'}, 'PDU': {'Name': 'Tydeo Larre Borges Airport', 'City': 'Paysandu', 'Country': 'Uruguay'}, 'ATI': {'Name': 'Artigas International Airport', 'City': 'Artigas ', 'Country': 'Uruguay'}, 'HSM': {'Name': 'Horsham Airport', 'City': 'Horsham', 'Country': 'Australia'}, 'SWH': {'Name': 'Swan Hill Airport', 'City': 'Swan Hill', 'Country': 'Australia'}, 'TTL': {'Name': 'Turtle Island Seaplane Base', 'City': 'Turtle Island', 'Country': 'Fiji'}, 'KWB': {'Name': 'Dewadaru - Kemujan Island', 'City': 'Karimunjawa', 'Country': 'Indonesia'}, 'KOO': {'Name': 'Kongolo Airport', 'City': 'Kongolo', 'Country': 'Congo (Kinshasa)'}, 'AOU': {'Name': 'Attopeu Airport', 'City': 'Attopeu', 'Country': 'Laos'}, 'SQX': {'Name': 'São Miguel do Oeste Airport', 'City': 'Sao Miguel do Oeste', 'Country': 'Brazil'}, 'LDM': {'Name': 'Mason County Airport', 'City': 'Ludington', 'Country': 'United States'}, 'RHV': {'Name': 'Reid-Hillview Airport of Santa Clara County', 'City': 'San Jose', 'Country': 'United States'}, 'OHS': {'Name': 'Sohar Airport', 'City': 'Sohar', 'Country': 'Oman'}, 'KCF': {'Name': 'Kadanwari Airport', 'City': 'Kadanwari', 'Country': 'Pakistan'}, 'RZS': {'Name': 'Sawan Airport', 'City': 'Sindh', 'Country': 'Pakistan'}, 'TMF': {'Name': 'Thimarafushi Airport', 'City': 'Thimarafushi', 'Country': 'Maldives'}, 'IFU': {'Name': 'Ifuru Airport', 'City': 'Ifuru', 'Country': 'Maldives'}, 'KZF': {'Name': 'Kaintiba Airport', 'City': 'Kieta', 'Country': 'Papua New Guinea'}, 'OGU': {'Name': 'Ordu Giresun Airport', 'City': 'Ordu-Giresun', 'Country': 'Turkey'}, 'YKO': {'Name': 'Hakkari Yüksekova Airport', 'City': 'Hakkari', 'Country': 'Turkey'}, 'BUT': {'Name': 'Bathpalathang Airport', 'City': 'Jakar', 'Country': 'Bhutan'}, 'TLI': {'Name': 'Sultan Bantilan Airport', 'City': 'Toli-Toli', 'Country': 'Indonesia'}, 'TQL': {'Name': 'Tarko-Sale Airport', 'City': 'Tarko-Sale', 'Country': 'Russia'}, 'JIC': {'Name': 'Jinchuan Airport', 'City': 'Jinchuan', 'Country': 'China'}, 'BPL': {'Name': 'Alashankou Bole (Bortala) airport', 'City': 'Bole', 'Country': 'China'}, 'FYN': {'Name': 'Fuyun Koktokay Airport', 'City': 'Fuyun', 'Country': 'China'}, 'ACS': {'Name': 'Achinsk Airport', 'City': 'Achinsk', 'Country': 'Russia'}, 'LFQ': {'Name': 'Linfen Qiaoli Airport', 'City': 'LINFEN', 'Country': 'China'}, 'YJP': {'Name': 'Hinton/Jasper-Hinton Airport', 'City': 'Hinton', 'Country': 'Canada'}, 'WVI': {'Name': 'Watsonville Municipal Airport', 'City': 'Watsonville', 'Country': 'United States'}, 'GLU': {'Name': 'Gelephu Airport', 'City': 'Gelephu', 'Country': 'Bhutan'}, 'HLI': {'Name': 'Hollister Municipal Airport', 'City': 'Hollister', 'Country': 'United States'}, 'DLK': {'Name': 'Dulkaninna Airport', 'City': 'Dulkaninna', 'Country': 'Australia'}, 'YBS': {'Name': 'Opapimiskan Lake Airport', 'City': 'Musselwhite Mine', 'Country': 'Canada'}, 'RIZ': {'Name': 'Rizhao Shanzihe Airport', 'City': 'Rizhao', 'Country': 'China'}, 'SQJ': {'Name': 'Shaxian Airport', 'City': 'Sanming', 'Country': 'China'}, 'XTO': {'Name': 'Taroom Airport', 'City': 'Taroom', 'Country': 'Australia'}, 'YSE': {'Name': 'Squamish Airport', 'City': 'Squamish', 'Country': 'Canada'}, 'YAH': {'Name': 'La Grande-4 Airport', 'City': 'La Grande-4', 'Country': 'Canada'}, 'YAL': {'Name': 'Alert Bay Airport', 'City': 'Alert Bay', 'Country': 'Canada'}, 'YCE': {'Name': 'Centralia / James T. Field Memorial Aerodrome', 'City': 'Centralia', 'Country': 'Canada'}, 'YCQ': {'Name': 'Chetwynd Airport', 'City': 'Chetwynd', 'Country': 'Canada'}, 'XRR': {'Name': 'Ross River Airport', 'City': 'Ross River', 'Country': 'Canada'}, 'YDO': {'Name': 'Dolbeau St Felicien Airport', 'City': 'Dolbeau-St-Félicien', 'Country': 'Canada'}, 'YEY': {'Name': 'Amos/Magny Airport', 'City': 'Amos', 'Country': 'Canada'}, 'YHE': {'Name': 'Hope Airport', 'City': 'Hope', 'Country': 'Canada'}, 'YHT': {'Name': 'Haines Junction Airport', 'City': 'Haines Junction', 'Country': 'Canada'}, 'YDG': {'Name': 'Digby / Annapolis Regional Airport', 'City': 'Digby', 'Country': 'Canada'}, 'YJF': {'Name': 'Fort Liard Airport', 'City': 'Fort Liard', 'Country': 'Canada'}, 'YKJ': {'Name': 'Key Lake Airport', 'City': 'Key Lake', 'Country': 'Canada'}, 'YLR': {'Name': 'Leaf Rapids Airport', 'City': 'Leaf Rapids', 'Country': 'Canada'}, 'YME': {'Name': 'Matane Airport', 'City': 'Matane', 'Country': 'Canada'}, 'YML': {'Name': 'Charlevoix Airport', 'City': 'Charlevoix', 'Country': 'Canada'}, 'YOS': {'Name': 'Owen Sound / Billy Bishop Regional Airport', 'City': 'Owen Sound', 'Country': 'Canada'}, 'YPS': {'Name': 'Port Hawkesbury Airport', 'City': 'Port Hawkesbury', 'Country': 'Canada'}, 'YQS': {'Name': 'St Thomas Municipal Airport', 'City': 'St Thomas', 'Country': 'Canada'}, 'YRO': {'Name': 'Ottawa / Rockcliffe Airport', 'City': 'Ottawa', 'Country': 'Canada'}, 'YSH': {'Name': 'Smiths Falls-Montague (Russ Beach) Airport', 'City': 'Smiths Falls', 'Country': 'Canada'}, 'YSL': {'Name': 'St Leonard Airport', 'City': 'St Leonard', 'Country': 'Canada'}, 'YVE': {'Name': 'Vernon Airport', 'City': 'Vernon', 'Country': 'Canada'}, 'YXQ': {'Name': 'Beaver Creek Airport', 'City': 'Beaver Creek', 'Country': 'Canada'}, 'YSN': {'Name': 'Shuswap Regional Airport', 'City': 'Salmon Arm', 'Country': 'Canada'}, 'KES': {'Name': 'Kelsey Airport', 'City': 'Kelsey', 'Country': 'Canada'}, 'XPK': {'Name': 'Pukatawagan Airport', 'City': 'Pukatawagan', 'Country': 'Canada'}, 'ZGF': {'Name': 'Grand Forks Airport', 'City': 'Grand Forks', 'Country': 'Canada'}, 'ZJG': {'Name': 'Jenpeg Airport', 'City': 'Jenpeg', 'Country': 'Canada'}, 'YTD': {'Name': 'Thicket Portage Airport', 'City': 'Thicket Portage', 'Country': 'Canada'}, 'PIW': {'Name': 'Pikwitonei Airport', 'City': 'Pikwitonei', 'Country': 'Canada'}, 'XPP': {'Name': 'Poplar River Airport', 'City': 'Poplar River', 'Country': 'Canada'}, 'WPC': {'Name': 'Pincher Creek Airport', 'City': 'Pincher Creek', 'Country': 'Canada'}, 'ZST': {'Name': 'Stewart Airport', 'City': 'Stewart', 'Country': 'Canada'}, 'ZUC': {'Name': 'Ignace Municipal Airport', 'City': 'Ignace', 'Country': 'Canada'}, 'FNB': {'Name': 'Neubrandenburg Airport', 'City': 'Neubrandenburg', 'Country': 'Germany'}, 'FSS': {'Name': 'RAF Kinloss', 'City': 'Kinloss', 'Country': 'United Kingdom'}, 'BXP': {'Name': 'Biała Podlaska Airfield', 'City': 'Biała Podlaska', 'Country': 'Poland'}, 'DGP': {'Name': 'Daugavpils Intrenational Airport', 'City': 'Daugavpils', 'Country': 'Latvia'}, 'LMR': {'Name': 'Lime Acres Finsch Mine Airport', 'City': 'Lime Acres', 'Country': 'South Africa'}, 'SXN': {'Name': 'Sua Pan Airport', 'City': 'Sowa', 'Country': 'Botswana'}, 'NDD': {'Name': 'Sumbe Airport', 'City': 'Sumbe', 'Country': 'Angola'}, 'MAI': {'Name': 'Mangochi Airport', 'City': 'Mangochi', 'Country': 'Malawi'}, 'ADI': {'Name': 'Arandis Airport', 'City': 'Arandis', 'Country': 'Namibia'}, 'MWE': {'Name': 'Merowe New Airport', 'City': 'Merowe', 'Country': 'Sudan'}, 'ALN': {'Name': 'St Louis Regional Airport', 'City': 'Alton/St Louis', 'Country': 'United States'}, 'AXN': {'Name': 'Chandler Field', 'City': 'Alexandria', 'Country': 'United States'}, 'CLU': {'Name': 'Columbus Municipal Airport', 'City': 'Columbus', 'Country': 'United States'}, 'BBD': {'Name': 'Curtis Field', 'City': 'Brady', 'Country': 'United States'}, 'BIH': {'Name': 'Eastern Sierra Regional Airport', 'City': 'Bishop', 'Country': 'United States'}, 'BKE': {'Name': 'Baker City Municipal Airport', 'City': 'Baker City', 'Country': 'United States'}, 'BPI': {'Name': 'Miley Memorial Field', 'City': 'Big Piney', 'Country': 'United States'}, 'WMH': {'Name': 'Ozark Regional Airport', 'City': 'Mountain Home', 'Country': 'United States'}, 'BTL': {'Name': 'W K Kellogg Airport', 'City': 'Battle Creek', 'Country': 'United States'}, 'BYI': {'Name': 'Burley Municipal Airport', 'City': 'Burley', 'Country': 'United States'}, 'CCY': {'Name': 'Northeast Iowa Regional Airport', 'City': 'Charles City', 'Country': 'United States'}, 'CNU': {'Name': 'Chanute Martin Johnson Airport', 'City': 'Chanute', 'Country': 'United States'}, 'CRG': {'Name': 'Jacksonville Executive at Craig Airport', 'City': 'Jacksonville', 'Country': 'United States'}, 'CSV': {'Name': 'Crossville Memorial Whitson Field', 'City': 'Crossville', 'Country': 'United States'}, 'DAA': {'Name': 'Davison Army Air Field', 'City': 'Fort Belvoir', 'Country': 'United States'}, 'DAG': {'Name': 'Barstow Daggett Airport', 'City': 'Daggett', 'Country': 'United States'}, 'DMN': {'Name': 'Deming Municipal Airport', 'City': 'Deming', 'Country': 'United States'}, 'DRA': {'Name': 'Desert Rock Airport', 'City': 'Mercury', 'Country': 'United States'}, 'EED': {'Name': 'Needles Airport', 'City': 'Needles', 'Country': 'United States'}, 'EGI': {'Name': 'Duke Field', 'City': 'Crestview', 'Country': 'United States'}, 'EKA': {'Name': 'Murray Field', 'City': 'Eureka', 'Country': 'United States'}, 'HYR': {'Name': 'Sawyer County Airport', 'City': 'Hayward', 'Country': 'United States'}, 'JCT': {'Name': 'Kimble County Airport', 'City': 'Junction', 'Country': 'United States'}, 'LOL': {'Name': 'Derby Field', 'City': 'Lovelock', 'Country': 'United States'}, 'MBG': {'Name': 'Mobridge Municipal Airport', 'City': 'Mobridge', 'Country': 'United States'}, 'MCB': {'Name': 'Mc Comb/Pike County Airport/John E Lewis Field', 'City': 'Mc Comb', 'Country': 'United States'}, 'MDH': {'Name': 'Southern Illinois Airport', 'City': 'Carbondale/Murphysboro', 'Country': 'United States'}, 'MMT': {'Name': 'Mc Entire Joint National Guard Base', 'City': 'Eastover', 'Country': 'United States'}, 'NHZ': {'Name': 'Brunswick Executive Airport', 'City': 'Brunswick', 'Country': 'United States'}, 'NRB': {'Name': 'Naval Station Mayport (Admiral David L. Mcdonald Field)', 'City': 'Mayport', 'Country': 'United States'}, 'OGB': {'Name': 'Orangeburg Municipal Airport', 'City': 'Orangeburg', 'Country': 'United States'}, 'OTM': {'Name': 'Ottumwa Regional Airport', 'City': 'Ottumwa', 'Country': 'United States'}, 'OZR': {'Name': 'Cairns AAF (Fort Rucker) Air Field', 'City': 'Fort Rucker/Ozark', 'Country': 'United States'}, 'PWY': {'Name': 'Ralph Wenz Field', 'City': 'Pinedale', 'Country': 'United States'}, 'POU': {'Name': 'Dutchess County Airport', 'City': 'Poughkeepsie', 'Country': 'United States'}, 'RSL': {'Name': 'Russell Municipal Airport', 'City': 'Russell', 'Country': 'United States'}, 'RWF': {'Name': 'Redwood Falls Municipal Airport', 'City': 'Redwood Falls', 'Country': 'United States'}, 'SNS': {'Name': 'Salinas Municipal Airport', 'City': 'Salinas', 'Country': 'United States'}, 'TPH': {'Name': 'Tonopah Airport', 'City': 'Tonopah', 'Country': 'United States'}, 'UKI': {'Name': 'Ukiah Municipal Airport', 'City': 'Ukiah', 'Country': 'United States'}, 'UOX': {'Name': 'University Oxford Airport', 'City': 'Oxford', 'Country': 'United States'}, 'HTV': {'Name': 'Huntsville Regional Airport', 'City': 'Huntsville', 'Country': 'United States'}, 'VTN': {'Name': 'Miller Field', 'City': 'Valentine', 'Country': 'United States'}, 'WMC': {'Name': 'Winnemucca Municipal Airport', 'City': 'Winnemucca', 'Country': 'United States'}, 'WWR': {'Name': 'West Woodward Airport', 'City': 'Woodward', 'Country': 'United States'}, 'ZZV': {'Name': 'Zanesville Municipal Airport', 'City': 'Zanesville', 'Country': 'United States'}, 'ECV': {'Name': 'Cuatro Vientos Airport', 'City': 'Madrid', 'Country': 'Spain'}, 'CDT': {'Name': 'Castellón-Costa Azahar Airport', 'City': 'Castellón de la Plana', 'Country': 'Spain'}, 'TEV': {'Name': 'Teruel Airport', 'City': 'Teruel', 'Country': 'Spain'}, 'QLP': {'Name': 'Sarzana-Luni Air Base', 'City': 'Sarzana (SP)', 'Country': 'Italy'}, 'BJY': {'Name': 'Batajnica Air Base', 'City': 'Batajnica', 'Country': 'Serbia'}, 'RUV': {'Name': 'Rubelsanto Airport', 'City': 'Rubelsanto', 'Country': 'Guatemala'}, 'XPL': {'Name': 'Coronel Enrique Soto Cano Air Base', 'City': 'Comayagua', 'Country': 'Honduras'}, 'UPL': {'Name': 'Upala Airport', 'City': 'Upala', 'Country': 'Costa Rica'}, 'QSN': {'Name': 'San Nicolas De Bari Airport', 'City': 'San Nicolás', 'Country': 'Cuba'}, 'SNJ': {'Name': 'San Julian Air Base', 'City': 'Pinar Del Rio', 'Country': 'Cuba'}, 'DWD': {'Name': 'King Salman Abdulaziz Airport', 'City': 'None', 'Country': 'Saudi Arabia'}, 'KMX': {'Name': 'King Khaled Air Base', 'City': 'None', 'Country': 'Saudi Arabia'}, 'XXN': {'Name': 'Riyadh Air Base', 'City': 'Riyadh', 'Country': 'Saudi Arabia'}, 'KNR': {'Name': 'Jam Airport', 'City': 'Kangan', 'Country': 'Iran'}, 'PYK': {'Name': 'Payam International Airport', 'City': 'Karaj', 'Country': 'Iran'}, 'XIJ': {'Name': 'Ahmed Al Jaber Air Base', 'City': 'Ahmed Al Jaber AB', 'Country': 'Kuwait'}, 'ATG': {'Name': 'Minhas Air Base', 'City': 'Kamra', 'Country': 'Pakistan'}, 'SGI': {'Name': 'Mushaf Air Base', 'City': 'Sargodha', 'Country': 'Pakistan'}, 'RQW': {'Name': 'Qayyarah West Airport', 'City': 'Qayyarah', 'Country': 'Iraq'}, 'ENN': {'Name': 'Nenana Municipal Airport', 'City': 'Nenana', 'Country': 'United States'}, 'WWA': {'Name': 'Wasilla Airport', 'City': 'Wasilla', 'Country': 'United States'}, 'IWK': {'Name': 'Iwakuni Marine Corps Air Station', 'City': 'Iwakuni', 'Country': 'Japan'}, 'IEJ': {'Name': 'Ie Jima Airport', 'City': 'Ie', 'Country': 'Japan'}, 'AAV': {'Name': 'Allah Valley Airport', 'City': 'Surallah', 'Country': 'Philippines'}, 'BPH': {'Name': 'Bislig Airport', 'City': 'None', 'Country': 'Philippines'}, 'MXI': {'Name': 'Mati National Airport', 'City': 'None', 'Country': 'Philippines'}, 'BAT': {'Name': 'Chafei Amsei Airport', 'City': 'Barretos', 'Country': 'Brazil'}, 'QHP': {'Name': 'Base de Aviação de Taubaté Airport', 'City': 'Taubaté', 'Country': 'Brazil'}, 'TOQ': {'Name': 'Barriles Airport', 'City': 'Tocopilla', 'Country': 'Chile'}, 'CNR': {'Name': 'Chañaral Airport', 'City': 'Chañaral', 'Country': 'Chile'}, 'TLX': {'Name': 'Panguilemo Airport', 'City': 'Talca', 'Country': 'Chile'}, 'ZIC': {'Name': 'Victoria Airport', 'City': 'Victoria', 'Country': 'Chile'}, 'TTC': {'Name': 'Las Breas Airport', 'City': 'Taltal', 'Country': 'Chile'}, 'API': {'Name': 'Gomez Nino Apiay Air Base', 'City': 'Apiay', 'Country': 'Colombia'}, 'CVE': {'Name': 'Coveñas Airport', 'City': 'Coveñas', 'Country': 'Colombia'}, 'PAL': {'Name': 'German Olano Air Base', 'City': 'La Dorada', 'Country': 'Colombia'}, 'PZA': {'Name': 'Paz De Ariporo Airport', 'City': 'Paz De Ariporo', 'Country': 'Colombia'}, 'TQS': {'Name': 'Tres Esquinas Air Base', 'City': 'Tres Esquinas', 'Country': 'Colombia'}, 'RIJ': {'Name': 'Juan Simons Vela Airport', 'City': 'Rioja', 'Country': 'Peru'}, 'JAE': {'Name': 'Shumba Airport', 'City': 'Jaén', 'Country': 'Peru'}, 'IKU': {'Name': 'Issyk-Kul International Airport', 'City': 'Tamchy', 'Country': 'Kyrgyzstan'}, 'VYI': {'Name': 'Vilyuisk Airport', 'City': 'Vilyuisk', 'Country': 'Russia'}, 'BGN': {'Name': 'Belaya Gora Airport', 'City': 'None', 'Country': 'Russia'}, 'GVN': {'Name': 'Maygatka Airport.', 'City': 'Sovetskaya Gavan', 'Country': 'Russia'}, 'NLI': {'Name': 'Nikolayevsk-na-Amure Airport', 'City': 'Nikolayevsk-na-Amure Airport', 'Country': 'Russia'}, 'VLK': {'Name': 'Volgodonsk Airport', 'City': 'None', 'Country': 'Russia'}, 'INA': {'Name': 'Inta Airport', 'City': 'Inta', 'Country': 'Russia'}, 'ZIX': {'Name': 'Zhigansk Airport', 'City': 'Zhigansk', 'Country': 'Russia'}, 'RTC': {'Name': 'Ratnagiri Airport', 'City': 'None', 'Country': 'India'}, 'HIM': {'Name': 'Hingurakgoda Air Force Base', 'City': 'Polonnaruwa Town', 'Country': 'Sri Lanka'}, 'RDP': {'Name': 'Kazi Nazrul Islam Airport', 'City': 'Durgapur', 'Country': 'India'}, 'PUT': {'Name': 'Sri Sathya Sai Airport', 'City': 'Puttaparthi', 'Country': 'India'}, 'LNX': {'Name': 'Smolensk North Airport', 'City': 'Smolensk', 'Country': 'Russia'}, 'ABH': {'Name': 'Alpha Airport', 'City': 'Alpha', 'Country': 'Australia'}, 'ARY': {'Name': 'Ararat Airport', 'City': 'None', 'Country': 'Australia'}, 'BLN': {'Name': 'Benalla Airport', 'City': 'None', 'Country': 'Australia'}, 'BZD': {'Name': 'Balranald Airport', 'City': 'None', 'Country': 'Australia'}, 'BWQ': {'Name': 'Brewarrina Airport', 'City': 'None', 'Country': 'Australia'}, 'CVC': {'Name': 'Cleve Airport', 'City': 'None', 'Country': 'Australia'}, 'CWW': {'Name': 'Corowa Airport', 'City': 'None', 'Country': 'Australia'}, 'CYG': {'Name': 'Corryong Airport', 'City': 'None', 'Country': 'Australia'}, 'CMD': {'Name': 'Cootamundra Airport', 'City': 'None', 'Country': 'Australia'}, 'DRN': {'Name': 'Dirranbandi Airport', 'City': 'None', 'Country': 'Australia'}, 'DNQ': {'Name': 'Deniliquin Airport', 'City': 'Deniliquin', 'Country': 'Australia'}, 'DYA': {'Name': 'Dysart Airport', 'City': 'None', 'Country': 'Australia'}, 'ECH': {'Name': 'Echuca Airport', 'City': 'None', 'Country': 'Australia'}, 'FRB': {'Name': 'Forbes Airport', 'City': 'Forbes', 'Country': 'Australia'}, 'GUH': {'Name': 'Gunnedah Airport', 'City': 'None', 'Country': 'Australia'}, 'HXX': {'Name': 'Hay Airport', 'City': 'None', 'Country': 'Australia'}, 'HTU': {'Name': 'Hopetoun Airport', 'City': 'None', 'Country': 'Australia'}, 'KRA': {'Name': 'Kerang Airport', 'City': 'None', 'Country': 'Australia'}, 'KPS': {'Name': 'Kempsey Airport', 'City': 'None', 'Country': 'Australia'}, 'KGY': {'Name': 'Kingaroy Airport', 'City': 'None', 'Country': 'Australia'}, 'TGN': {'Name': 'Latrobe Valley Airport', 'City': 'Morwell', 'Country': 'Australia'}, 'MRG': {'Name': 'Mareeba Airport', 'City': 'None', 'Country': 'Australia'}, 'RPM': {'Name': 'Ngukurr Airport', 'City': 'None', 'Country': 'Australia'}, 'QRM': {'Name': 'Narromine Airport', 'City': 'None', 'Country': 'Australia'}, 'PPI': {'Name': 'Port Pirie Airport', 'City': 'None', 'Country': 'Australia'}, 'SIO': {'Name': 'Smithton Airport', 'City': 'None', 'Country': 'Australia'}, 'SNB': {'Name': 'Snake Bay Airport', 'City': 'None', 'Country': 'Australia'}, 'SWC': {'Name': 'Stawell Airport', 'City': 'None', 'Country': 'Australia'}, 'TYB': {'Name': 'Tibooburra Airport', 'City': 'None', 'Country': 'Australia'}, 'TUM': {'Name': 'Tumut Airport', 'City': 'None', 'Country': 'Australia'}, 'WGT': {'Name': 'Wangaratta Airport', 'City': 'None', 'Country': 'Australia'}, 'WKB': {'Name': 'Warracknabeal Airport', 'City': 'None', 'Country': 'Australia'}, 'QRR': {'Name': 'Warren Airport', 'City': 'None', 'Country': 'Australia'}, 'SXE': {'Name': 'West Sale Airport', 'City': 'Sale', 'Country': 'Australia'}, 'WWY': {'Name': 'West Wyalong Airport', 'City': 'West Wyalong', 'Country': 'Australia'}, 'NGA': {'Name': 'Young Airport', 'City': 'None', 'Country': 'Australia'}, 'LHK': {'Name': 'Guangzhou MR Air Base', 'City': 'Guanghua', 'Country': 'China'}, 'WDS': {'Name': 'Shiyan Wudangshan Airport', 'City': 'Shiyan', 'Country': 'China'}, 'HTT': {'Name': 'Huatugou Airport', 'City': 'Mengnai', 'Country': 'China'}, 'UUN': {'Name': 'Baruun Urt Airport', 'City': 'None', 'Country': 'Mongolia'}, 'BFU': {'Name': 'Bengbu Airport', 'City': 'Bengbu', 'Country': 'China'}, 'RUG': {'Name': 'Rugao Air Base', 'City': 'Rugao', 'Country': 'China'}, 'WHU': {'Name': 'Wuhu Air Base', 'City': 'Wuhu', 'Country': 'China'}, 'SXJ': {'Name': 'Shanshan Airport', 'City': 'Shanshan', 'Country': 'China'}, 'YKH': {'Name': 'Yingkou Lanqi Airport', 'City': 'Yingkou', 'Country': 'China'}, 'BQG': {'Name': 'Bogorodskoye Airport', 'City': 'Bogorodskoe', 'Country': 'Russia'}, 'HYD': {'Name': 'Rajiv Gandhi International Airport', 'City': 'Hyderabad', 'Country': 'India'}, 'PKO': {'Name': 'Parakou Airport', 'City': 'Parakou', 'Country': 'Benin'}, 'KDC': {'Name': 'Kandi Airport', 'City': 'Kandi', 'Country': 'Benin'}, 'HMG': {'Name': 'Hermannsburg Airport', 'City': 'Hermannsburg', 'Country': 'Australia'}, 'BIB': {'Name': 'Baidoa Airport', 'City': 'Baidoa', 'Country': 'Somalia'}, 'KCS': {'Name': 'Kings Creek Airport', 'City': 'Petermann', 'Country': 'Australia'}, 'BMR': {'Name': 'Baltrum Airport', 'City': 'Baltrum', 'Country': 'Germany'}, 'MVW': {'Name': 'Skagit Regional Airport', 'City': 'Skagit', 'Country': 'United States'}, 'GOO': {'Name': 'Goondiwindi Airport', 'City': 'Goondiwindi', 'Country': 'Australia'}, 'APT': {'Name': 'Marion County Brown Field', 'City': 'Jasper', 'Country': 'United States'}, 'DCU': {'Name': 'Pryor Field Regional Airport', 'City': 'Decatur', 'Country': 'United States'}, 'GLW': {'Name': 'Glasgow Municipal Airport', 'City': 'Glasgow', 'Country': 'United States'}, 'DKV': {'Name': 'Docker River Airport', 'City': 'Docker River', 'Country': 'Australia'}, 'RNZ': {'Name': 'Jasper County Airport', 'City': 'Rensselaer', 'Country': 'United States'}, 'SBT': {'Name': 'Sabetta International Airport', 'City': 'Sabetta', 'Country': 'Russia'}, 'AXF': {'Name': 'Alxa Left Banner Bayanhot Airport', 'City': 'Alxa Left Banner', 'Country': 'China'}, 'NIS': {'Name': 'Simberi Airport', 'City': 'Simberi Island', 'Country': 'Papua New Guinea'}, 'BUL': {'Name': 'Bulolo Airport', 'City': 'Bulolo', 'Country': 'Papua New Guinea'}, 'TBR': {'Name': 'Statesboro Bulloch County Airport', 'City': 'Statesboro', 'Country': 'United States'}, 'AMT': {'Name': 'Amata Airport', 'City': 'Amata', 'Country': 'Australia'}, 'EDD': {'Name': 'Erldunda Airport', 'City': 'Erldunda', 'Country': 'Australia'}, 'FIK': {'Name': 'Finke Airport', 'City': 'Finke', 'Country': 'Australia'}, 'JJG': {'Name': 'Humberto Ghizzo Bortoluzzi Regional Airport', 'City': 'Jaguaruna', 'Country': 'Brazil'}, 'WKI': {'Name': 'Hwange (Town) Airport', 'City': 'Hwange', 'Country': 'Zimbabwe'}, 'KLJ': {'Name': 'Klaipėda Airport', 'City': 'Klaipeda', 'Country': 'Lithuania'}, 'ETB': {'Name': 'West Bend Municipal Airport', 'City': 'WEST BEND', 'Country': 'United States'}, 'GLR': {'Name': 'Gaylord Regional Airport', 'City': 'GAYLORD', 'Country': 'United States'}, 'AID': {'Name': 'Anderson Municipal Darlington Field', 'City': 'ANDERSON', 'Country': 'United States'}, 'QND': {'Name': 'Cenej Airport', 'City': 'Novi Sad', 'Country': 'Serbia'}, 'GUU': {'Name': 'Grundarfjörður Airport', 'City': 'Grundarfjordur', 'Country': 'Iceland'}, 'PCD': {'Name': 'Prairie Du Chien Municipal Airport', 'City': 'Prairie du Chien', 'Country': 'United States'}, 'OTJ': {'Name': 'Otjiwarongo Airport', 'City': 'Otjiwarongo', 'Country': 'Namibia'}, 'TSM': {'Name': 'Taos Regional Airport', 'City': 'Taos', 'Country': 'United States'}, 'RTN': {'Name': 'Raton Municipal-Crews Field', 'City': 'Raton', 'Country': 'United States'}, 'PPA': {'Name': 'Perry Lefors Field', 'City': 'Pampa', 'Country': 'United States'}, 'FLP': {'Name': 'Marion County Regional Airport', 'City': 'Flippin', 'Country': 'United States'}, 'BGD': {'Name': 'Hutchinson County Airport', 'City': 'Borger', 'Country': 'United States'}, 'HLE': {'Name': 'St. Helena Airport', 'City': 'Longwood', 'Country': 'United Kingdom'}, 'BNJ': {'Name': 'Bonn-Hangelar Airport', 'City': 'Sankt-Augustin', 'Country': 'Germany'}, 'NGK': {'Name': 'Nogliki Airport', 'City': 'Nogliki', 'Country': 'Russia'}, 'SQA': {'Name': 'Santa Ynez Airport', 'City': 'Santa Ynez', 'Country': 'United States'}, 'HXD': {'Name': 'Delingha Airport', 'City': 'Haixi', 'Country': 'China'}, 'BAR': {'Name': "Qionghai Bo'ao Airport", 'City': 'Qionghai', 'Country': 'China'}, 'ZBO': {'Name': 'Bowen Airport', 'City': 'Bowen', 'Country': 'Australia'}, 'UCB': {'Name': 'Ulanqab Jining Airport', 'City': 'Wulanchabu', 'Country': 'China'}, 'KEO': {'Name': 'Odienne Airport', 'City': 'Odienne', 'Country': "Cote d'Ivoire"}, 'GII': {'Name': 'Siguiri Airport', 'City': 'Siguiri', 'Country': 'Guinea'}, 'NZE': {'Name': 'Nzérékoré Airport', 'City': 'Nzerekore', 'Country': 'Guinea'}, 'OCM': {'Name': 'Boolgeeda', 'City': 'Brockman', 'Country': 'Australia'}, 'WGN': {'Name': 'Shaoyang Wugang Airport', 'City': 'Shaoyang', 'Country': 'China'}, 'TXF': {'Name': '9 de Maio - Teixeira de Freitas Airport', 'City': 'Teixeira de Freitas', 'Country': 'Brazil'}, 'SPA': {'Name': 'Spartanburg Downtown Memorial Airport', 'City': 'Spartangurg', 'Country': 'United States'}, 'BJW': {'Name': 'Bajawa Soa Airport', 'City': 'Bajawa', 'Country': 'Indonesia'}, 'NBN': {'Name': 'Annobón Airport', 'City': 'San Antonio de Pale', 'Country': 'Equatorial Guinea'}, 'OLL': {'Name': 'Oyo Ollombo Airport', 'City': 'Oyo', 'Country': 'Congo (Brazzaville)'}, 'PPF': {'Name': 'Tri-City Airport', 'City': 'Parsons', 'Country': 'United States'}, 'PCQ': {'Name': 'Boun Neau Airport', 'City': 'Phongsaly', 'Country': 'Laos'}, 'AYS': {'Name': 'Waycross Ware County Airport', 'City': 'Waycross', 'Country': 'United States'}, 'DSS': {'Name': 'Blaise Diagne International Airport', 'City': 'Diass', 'Country': 'Senegal'}, 'PMH': {'Name': 'Greater Portsmouth Regional Airport', 'City': 'Portsmouth', 'Country': 'United States'}, 'NAC': {'Name': 'Naracoorte Airport', 'City': 'Naracoorte', 'Country': 'Australia'}, 'PGZ': {'Name': 'Ponta Grossa Airport - Comandante Antonio Amilton Beraldo', 'City': 'Ponta Grossa', 'Country': 'Brazil'}, 'PQM': {'Name': 'Palenque International Airport', 'City': 'Palenque', 'Country': 'Mexico'}, 'CUD': {'Name': 'Caloundra Airport', 'City': 'Caloundra', 'Country': 'Australia'}, 'CLP': {'Name': 'Clarks Point Airport', 'City': 'Clarks Point', 'Country': 'United States'}, 'JOJ': {'Name': 'Doris Lake', 'City': 'Doris Lake', 'Country': 'Canada'}, 'ECI': {'Name': 'Costa Esmeralda Airport', 'City': 'Tola', 'Country': 'Nicaragua'}, 'QGQ': {'Name': 'Attu Heliport', 'City': 'Attu', 'Country': 'Greenland'}, 'QPW': {'Name': 'Kangaatsiaq Heliport', 'City': 'Kangaatsiaq', 'Country': 'Greenland'}, 'QJE': {'Name': 'Kitsissuarsuit Heliport', 'City': 'Kitsissuarsuit', 'Country': 'Greenland'}, 'XIQ': {'Name': 'Ilimanaq Heliport', 'City': 'Ilimanaq', 'Country': 'Greenland'}, 'QQT': {'Name': 'Qeqertaq Heliport', 'City': 'Qeqertaq', 'Country': 'Greenland'}, 'QJI': {'Name': 'Ikamiut Heliport', 'City': 'Ikamiut', 'Country': 'Greenland'}, 'QFG': {'Name': 'Eqalugaarsuit Heliport', 'City': 'Eqalugaarsuit', 'Country': 'Greenland'}, 'QRY': {'Name': 'Ikerassaarsuk Heliport', 'City': 'Ikerasaarsuk', 'Country': 'Greenland'}, 'NPR': {'Name': 'Novo Progresso Airport', 'City': 'Novo Progresso', 'Country': 'Brazil'}, 'SMT': {'Name': 'Adolino Bedin Regional Airport', 'City': 'Sorriso', 'Country': 'Brazil'}, 'ENO': {'Name': 'Encarnación Airport', 'City': 'Encarnacion', 'Country': 'Paraguay'}, 'UZR': {'Name': 'Urzhar Airport', 'City': 'Urzhar', 'Country': 'Kazakhstan'}, 'NYR': {'Name': 'Nyurba Airport', 'City': 'Nyurba', 'Country': 'Russia'}, 'SUK': {'Name': 'Sakkyryr Airport', 'City': 'Batagay-Alyta', 'Country': 'Russia'}, 'UKG': {'Name': 'Ust-Kuyga Airport', 'City': 'Ust-Kuyga', 'Country': 'Russia'}, 'VHV': {'Name': 'Verkhnevilyuisk Airport', 'City': 'Verkhnevilyuysk', 'Country': 'Russia'}, 'DEE': {'Name': 'Mendeleyevo Airport', 'City': 'Yuzhno-Kurilsk', 'Country': 'Russia'}, 'EKS': {'Name': 'Shakhtyorsk Airport', 'City': 'Shakhtyorsk', 'Country': 'Russia'}, 'TLK': {'Name': 'Talakan Airport', 'City': 'Talakan', 'Country': 'Russia'}, 'RDB': {'Name': 'Red Dog Airport', 'City': 'Red Dog', 'Country': 'United States'}, 'ION': {'Name': 'Impfondo Airport', 'City': 'Impfondo', 'Country': 'Congo (Brazzaville)'}, 'EBH': {'Name': 'El Bayadh Airport', 'City': 'El Bayadh', 'Country': 'Algeria'}, 'ZIS': {'Name': 'Alzintan Airport', 'City': 'Zintan', 'Country': 'Libya'}, 'MYZ': {'Name': 'Monkey Bay Airport', 'City': 'Monkey Bay', 'Country': 'Malawi'}, 'BCU': {'Name': 'Sir Abubakar Tafawa Balewa International Airport', 'City': 'Bauchi', 'Country': 'Nigeria'}, 'GMO': {'Name': 'Gombe Lawanti International Airport', 'City': 'Gombe', 'Country': 'Nigeria'}, 'KDA': {'Name': 'Kolda North Airport', 'City': 'Kolda', 'Country': 'Senegal'}, 'SHO': {'Name': 'King Mswati III International Airport', 'City': 'Manzini', 'Country': 'Swaziland'}, 'KIY': {'Name': 'Kilwa Masoko Airport', 'City': 'Kilwa Masoko', 'Country': 'Tanzania'}, 'QSI': {'Name': 'Moshi Airport', 'City': 'Moshi', 'Country': 'Tanzania'}, 'MNS': {'Name': 'Mansa Airport', 'City': 'Mansa', 'Country': 'Zambia'}, 'GZI': {'Name': 'Ghazni Airport', 'City': 'Ghazni', 'Country': 'Afghanistan'}, 'DBC': {'Name': "Baicheng Chang'an Airport", 'City': 'Baicheng', 'Country': 'China'}, 'LNL': {'Name': 'Longnan Chengzhou Airport', 'City': 'Longnan', 'Country': 'China'}, 'SQD': {'Name': 'Shangrao Sanqingshan Airport', 'City': 'Shangrao', 'Country': 'China'}, 'YSQ': {'Name': 'Songyuan Chaganhu Airport', 'City': 'Songyuan', 'Country': 'China'}, 'JSJ': {'Name': 'Jiansanjiang Airport', 'City': 'Jiansanjiang', 'Country': 'China'}, 'WMT': {'Name': 'Zunyi Maotai Airport', 'City': 'Zunyi', 'Country': 'China'}, 'LLB': {'Name': 'Libo Airport', 'City': 'Libo', 'Country': 'China'}, 'CDE': {'Name': 'Chengde Puning Airport', 'City': 'Chengde', 'Country': 'China'}, 'DTU': {'Name': 'Wudalianchi Dedu Airport', 'City': 'Wudalianchi', 'Country': 'China'}, 'EJN': {'Name': 'Ejin Banner-Taolai Airport', 'City': 'Ejin Banner', 'Country': 'China'}, 'RHT': {'Name': 'Alxa Right Banner Badanjilin Airport', 'City': 'Alxa Right Banner', 'Country': 'China'}, 'HUO': {'Name': 'Holingol Huolinhe Airport', 'City': 'Holingol', 'Country': 'China'}, 'GMQ': {'Name': 'Golog Maqin Airport', 'City': 'Golog', 'Country': 'China'}, 'QSZ': {'Name': 'Yeerqiang Airport', 'City': 'Yarkant', 'Country': 'China'}, 'TEI': {'Name': 'Tezu Airport', 'City': 'Tezu', 'Country': 'India'}, 'CWJ': {'Name': 'Cangyuan Washan Airport', 'City': 'Cangyuan', 'Country': 'China'}, 'JMJ': {'Name': 'Lancang Jingmai Airport', 'City': 'Lancang Lahu', 'Country': 'China'}, 'NLH': {'Name': 'Ninglang Luguhu Airport', 'City': 'Ninglang', 'Country': 'China'}, 'PBQ': {'Name': 'Pimenta Bueno Airport', 'City': 'Pimenta Bueno', 'Country': 'Brazil'}, 'WUT': {'Name': 'Xinzhou Wutaishan Airport', 'City': 'Xinzhou', 'Country': 'China'}, 'NZL': {'Name': 'Chengjisihan Airport', 'City': 'Zhalantun', 'Country': 'China'}, 'AIP': {'Name': 'Adampur Airport', 'City': 'Adampur', 'Country': 'India'}, 'VDY': {'Name': 'Vijayanagar Aerodrome (JSW)', 'City': 'Toranagallu', 'Country': 'India'}, 'SAG': {'Name': 'Shirdi Airport', 'City': 'Shirdi', 'Country': 'India'}, 'PYB': {'Name': 'Jeypore Airport', 'City': 'Jeypore', 'Country': 'India'}, 'SUP': {'Name': 'Trunojoyo Airport', 'City': 'Sumenep', 'Country': 'Indonesia'}, 'RKO': {'Name': 'Rokot Airport', 'City': 'Sipora', 'Country': 'Indonesia'}, 'PPR': {'Name': 'Pasir Pangaraan Airport', 'City': 'Pasir Pangaraian', 'Country': 'Indonesia'}, 'TJB': {'Name': 'Sei Bati Airport', 'City': 'Tanjung Balai Karimun', 'Country': 'Indonesia'}, 'KRC': {'Name': 'Departi Parbo Airport', 'City': 'Kerinci Regency', 'Country': 'Indonesia'}, 'NRE': {'Name': 'Namrole Airport', 'City': 'Buru Island', 'Country': 'Indonesia'}, 'NAM': {'Name': 'Namlea Airport', 'City': 'Namlea', 'Country': 'Indonesia'}, 'DOB': {'Name': 'Rar Gwamar Airport', 'City': 'Dobo', 'Country': 'Indonesia'}, 'SQN': {'Name': 'Emalamo Sanana Airport', 'City': 'Sanana', 'Country': 'Indonesia'}, 'AYW': {'Name': 'Ayawasi Airport', 'City': 'Ayawasi', 'Country': 'Indonesia'}, 'BYQ': {'Name': 'Bunyu Airport', 'City': 'Bunyu', 'Country': 'Indonesia'}, 'UOL': {'Name': 'Buol Airport', 'City': 'Buol', 'Country': 'Indonesia'}, 'RAQ': {'Name': 'Sugimanuru Airport', 'City': 'Raha', 'Country': 'Indonesia'}, 'JSK': {'Name': 'Jask Airport', 'City': 'Jask', 'Country': 'Iran'}, 'ZBY': {'Name': 'Sayaboury Airport', 'City': 'Sainyabuli', 'Country': 'Laos'}, 'BGL': {'Name': 'Baglung Airport', 'City': 'Baglung', 'Country': 'Nepal'}, 'RJB': {'Name': 'Rajbiraj Airport', 'City': 'Rajbiraj', 'Country': 'Nepal'}, 'DQM': {'Name': 'Duqm International Airport', 'City': 'Duqm', 'Country': 'Oman'}, 'CKI': {'Name': 'Croker Island Airport', 'City': 'Croker Island', 'Country': 'Australia'}, 'BYP': {'Name': 'Barimunya Airport', 'City': 'Barimunya', 'Country': 'Australia'}, 'LUC': {'Name': 'Laucala Island Airport', 'City': 'Laucala', 'Country': 'Fiji'}, 'YAS': {'Name': 'Yasawa Island Airport', 'City': 'Yasawa Island', 'Country': 'Fiji'}, 'WIK': {'Name': 'Waiheke Reeve Airport', 'City': 'Waiheke Island', 'Country': 'New Zealand'}, 'DEX': {'Name': 'Nop Goliat Airport', 'City': 'Dekai', 'Country': 'Indonesia'}, 'NAU': {'Name': 'Napuka Island Airport', 'City': 'Napuka', 'Country': 'French Polynesia'}, 'FAC': {'Name': 'Faaite Airport', 'City': 'Faaite', 'Country': 'French Polynesia'}, 'NUK': {'Name': 'Nukutavake Airport', 'City': 'Nukutavake', 'Country': 'French Polynesia'}, 'VHZ': {'Name': 'Vahitahi Airport', 'City': 'Vahitahi', 'Country': 'French Polynesia'}, 'HHZ': {'Name': 'Hikueru Atoll Airport', 'City': 'Hikueru', 'Country': 'French Polynesia'}, 'RRR': {'Name': 'Raroia Airport', 'City': 'Raroia', 'Country': 'French Polynesia'}, 'KHZ': {'Name': 'Kauehi Airport', 'City': 'Kauehi', 'Country': 'French Polynesia'}, 'TKV': {'Name': 'Tatakoto Airport', 'City': 'Tatakoto', 'Country': 'French Polynesia'}, 'TDS': {'Name': 'Sasereme Airport', 'City': 'Sasereme', 'Country': 'Papua New Guinea'}, 'TMH': {'Name': 'Tanah Merah Airport', 'City': 'Boven Digoel', 'Country': 'Indonesia'}, 'NKB': {'Name': 'Noonkanbah Airport', 'City': 'Noonkanbah', 'Country': 'Australia'}, 'AEI': {'Name': 'Algeciras Heliport', 'City': 'Algeciras', 'Country': 'Spain'}, 'KSE': {'Name': 'Kasese Airport', 'City': 'Kasese', 'Country': 'Uganda'}, 'NCJ': {'Name': 'Sunchales Aeroclub Airport', 'City': 'Sunchales', 'Country': 'Argentina'}, 'IST': {'Name': 'Istanbul Airport', 'City': 'Istanbul', 'Country': 'Turkey'}, 'SOV': {'Name': 'Seldovia Airport', 'City': 'Seldovia', 'Country': 'United States'}, 'YSG': {'Name': "Lutselk'e Airport", 'City': "Lutselk'e", 'Country': 'Canada'}, 'DWA': {'Name': 'Dwangwa Airport', 'City': 'Dwangwa', 'Country': 'Malawi'}, 'HGI': {'Name': 'Paloich Airport, Heliport', 'City': 'Higleig', 'Country': 'South Sudan'}, 'KQH': {'Name': 'Kishangarh Airport', 'City': 'Ajmer', 'Country': 'India'}, 'CNN': {'Name': 'Kannur International Airport', 'City': 'Kannur', 'Country': 'India'}, 'ZCO': {'Name': 'La Araucanía Airport', 'City': 'Temuco', 'Country': 'Chile'}, 'ASS': {'Name': 'Arathusa Safari Lodge Airport', 'City': 'Arathusa', 'Country': 'South Africa'}, 'VDI': {'Name': 'Vidalia Regional Airport', 'City': 'Vidalia', 'Country': 'United States'}, 'ISB': {'Name': 'New Islamabad International Airport', 'City': 'Islamabad', 'Country': 'Pakistan'}, 'MHE': {'Name': 'Mitchell Municipal Airport', 'City': 'Mitchell', 'Country': 'United States'}, 'GIT': {'Name': 'Mchauru Airport', 'City': 'Geita', 'Country': 'Tanzania'}, 'GID': {'Name': 'Gitega Airport', 'City': 'Gitega', 'Country': 'Burundi'}, 'RMU': {'Name': 'Región de Murcia International Airport', 'City': 'Murcia', 'Country': 'Spain'}, 'CQS': {'Name': 'Costa Marques Airport', 'City': 'COSTA MARQUES', 'Country': 'Brazil'}, 'ZXT': {'Name': 'Zabrat Airport', 'City': 'Baku', 'Country': 'Azerbaijan'}, 'JAM': {'Name': 'Bezmer Air Base', 'City': 'Yambol', 'Country': 'Bulgaria'}, 'YUA': {'Name': 'Yuanmou Air Base', 'City': 'Yuanmou', 'Country': 'China'}, 'XEN': {'Name': 'Xingcheng Air Base', 'City': 'None', 'Country': 'China'}, 'GEC': {'Name': 'Lefkoniko Airport', 'City': 'Geçitkale', 'Country': 'Cyprus'}, 'MBI': {'Name': 'Songwe Airport', 'City': 'Mbeya', 'Country': 'Tanzania'}, 'UGU': {'Name': 'Bilogai-Sugapa Airport', 'City': 'Sugapa-Papua Island', 'Country': 'Indonesia'}, 'ETM': {'Name': 'Ramon Airport', 'City': 'Eilat', 'Country': 'Israel'}, 'MNH': {'Name': 'Rustaq Airport', 'City': "Al Masna'ah", 'Country': 'Oman'}, 'CGY': {'Name': 'Laguindingan Airport', 'City': 'Cagayan de Oro City', 'Country': 'Philippines'}, 'CPO': {'Name': 'Desierto de Atacama Airport', 'City': 'Copiapo', 'Country': 'Chile'}}
-
-airlines = {'-': {'Name': 'Private flight', 'ICAO': 'None'}, '1T': {'Name': '1Time Airline', 'ICAO': 'RNX'}, 'Q5': {'Name': '40-Mile Air', 'ICAO': 'MLA'}, 'AN': {'Name': 'Ansett Australia', 'ICAO': 'AAA'}, '1B': {'Name': 'Abacus International', 'ICAO': 'None'}, 'ZI': {'Name': 'Aigle Azur', 'ICAO': 'AAF'}, 'AQ': {'Name': 'Aloha Airlines', 'ICAO': 'AAH'}, 'AA': {'Name': 'American Airlines', 'ICAO': 'AAL'}, 'OZ': {'Name': 'Asiana Airlines', 'ICAO': 'AAR'}, '4K': {'Name': 'Askari Aviation', 'ICAO': 'AAS'}, '8U': {'Name': 'Afriqiyah Airways', 'ICAO': 'AAW'}, 'G4': {'Name': 'Allegiant Air', 'ICAO': 'AAY'}, 'M3': {'Name': 'ABSA - Aerolinhas Brasileiras', 'ICAO': 'TUS'}, '8V': {'Name': 'Astral Aviation', 'ICAO': 'ACP'}, '8T': {'Name': 'Air Tindi', 'ICAO': 'None'}, 'ZY': {'Name': 'Ada Air', 'ICAO': 'ADE'}, 'JP': {'Name': 'Adria Airways', 'ICAO': 'ADR'}, 'UX': {'Name': 'Air Europa', 'ICAO': 'AEA'}, 'EM': {'Name': 'Aero Benin', 'ICAO': 'AEB'}, 'A3': {'Name': 'Aegean Airlines', 'ICAO': 'AEE'}, 'PE': {'Name': 'Air Europe', 'ICAO': 'AEL'}, 'KO': {'Name': 'Alaska Central Express', 'ICAO': 'AER'}, 'None': {'Name': 'GX Airlines', 'ICAO': 'CBG'}, '5W': {'Name': 'Astraeus', 'ICAO': 'AEU'}, 'VV': {'Name': 'Aerosvit Airlines', 'ICAO': 'AEW'}, 'I9': {'Name': 'Indigo', 'ICAO': 'IBU'}, 'QQ': {'Name': 'Alliance Airlines', 'ICAO': 'UTY'}, 'FG': {'Name': 'Ariana Afghan Airlines', 'ICAO': 'AFG'}, 'SU': {'Name': 'Aeroflot Russian Airlines', 'ICAO': 'AFL'}, 'JA': {'Name': 'Air Bosna', 'ICAO': 'BON'}, 'AF': {'Name': 'Air France', 'ICAO': 'AFR'}, 'SB': {'Name': 'Air Caledonie International', 'ICAO': 'ACI'}, '2O': {'Name': 'Air Salone', 'ICAO': 'None'}, '2Q': {'Name': 'Air Cargo Carriers', 'ICAO': 'SNC'}, 'SW': {'Name': 'Air Namibia', 'ICAO': 'NMB'}, '5D': {'Name': 'DonbassAero', 'ICAO': 'UDC'}, '7T': {'Name': 'Air Glaciers', 'ICAO': 'AGV'}, 'PL': {'Name': 'Aeroper', 'ICAO': 'PLI'}, '8A': {'Name': 'Atlas Blue', 'ICAO': 'BMM'}, 'J2': {'Name': 'Azerbaijan Airlines', 'ICAO': 'AHY'}, 'U3': {'Name': 'Avies', 'ICAO': 'AIA'}, 'ED': {'Name': 'Airblue', 'ICAO': 'ABQ'}, 'AB': {'Name': 'Air Berlin', 'ICAO': 'BER'}, 'AI': {'Name': 'Air India Limited', 'ICAO': 'AIC'}, 'ZB': {'Name': 'Monarch Airlines', 'ICAO': 'MON'}, 'CC': {'Name': 'Macair Airlines', 'ICAO': 'MCK'}, 'TN': {'Name': 'Air Tahiti Nui', 'ICAO': 'THT'}, 'IZ': {'Name': 'Arkia Israel Airlines', 'ICAO': 'AIZ'}, 'JM': {'Name': 'Air Jamaica', 'ICAO': 'AJM'}, 'AP': {'Name': 'Air One', 'ICAO': 'ADH'}, 'S2': {'Name': 'Air Sahara', 'ICAO': 'RSH'}, 'KM': {'Name': 'Air Malta', 'ICAO': 'AMC'}, 'NQ': {'Name': 'Air Japan', 'ICAO': 'AJX'}, '4A': {'Name': 'Air Kiribati', 'ICAO': 'AKL'}, 'HP': {'Name': 'America West Airlines', 'ICAO': 'AWE'}, 'ZW': {'Name': 'Air Wisconsin', 'ICAO': 'AWI'}, 'U9': {'Name': 'Tatarstan Airlines', 'ICAO': 'TAK'}, 'VD': {'Name': 'Air Libert', 'ICAO': 'None'}, 'QM': {'Name': 'Air Malawi', 'ICAO': 'AML'}, 'BM': {'Name': 'Air Sicilia', 'ICAO': 'None'}, 'NX': {'Name': 'Air Macau', 'ICAO': 'AMU'}, 'HM': {'Name': 'Air Seychelles', 'ICAO': 'SEY'}, 'AM': {'Name': 'AeroMéxico', 'ICAO': 'AMX'}, 'NH': {'Name': 'All Nippon Airways', 'ICAO': 'ANA'}, 'YW': {'Name': 'Air Nostrum', 'ICAO': 'ANE'}, 'PX': {'Name': 'Air Niugini', 'ICAO': 'ANG'}, 'G9': {'Name': 'Air Arabia', 'ICAO': 'ABY'}, 'AC': {'Name': 'Air Canada', 'ICAO': 'ACA'}, 'BT': {'Name': 'Air Baltic', 'ICAO': 'BTI'}, 'EL': {'Name': 'Air Nippon', 'ICAO': 'ANK'}, 'TL': {'Name': 'Trans Mediterranean Airlines', 'ICAO': 'TMA'}, '4N': {'Name': 'Air North Charter - Canada', 'ICAO': 'ANT'}, 'NZ': {'Name': 'Air New Zealand', 'ICAO': 'ANZ'}, 'XM': {'Name': 'Alitalia Express', 'ICAO': 'SMX'}, 'GV': {'Name': 'Aero Flight', 'ICAO': 'ARF'}, 'JW': {'Name': 'Arrow Air', 'ICAO': 'APW'}, '2B': {'Name': 'Aerocondor', 'ICAO': 'ARD'}, '4C': {'Name': 'Aires', 'ICAO': 'ARE'}, 'AR': {'Name': 'Aerolineas Argentinas', 'ICAO': 'ARG'}, 'AS': {'Name': 'Alaska Airlines', 'ICAO': 'ASA'}, '4D': {'Name': 'Air Sinai', 'ICAO': 'ASD'}, 'EV': {'Name': 'Atlantic Southeast Airlines', 'ICAO': 'ASQ'}, 'OB': {'Name': 'Astrakhan Airlines', 'ICAO': 'ASZ'}, 'TC': {'Name': 'Air Tanzania', 'ICAO': 'ATC'}, '2J': {'Name': 'Air Burkina', 'ICAO': 'VBW'}, 'FO': {'Name': 'Airlines Of Tasmania', 'ICAO': 'ATM'}, 'PJ': {'Name': 'Air Saint Pierre', 'ICAO': 'SPM'}, 'OS': {'Name': 'Austrian Airlines', 'ICAO': 'AUA'}, 'IQ': {'Name': 'Augsburg Airways', 'ICAO': 'AUB'}, 'MO': {'Name': 'Abu Dhabi Amiri Flight', 'ICAO': 'AUH'}, '5N': {'Name': 'Aeroflot-Nord', 'ICAO': 'AUL'}, 'GR': {'Name': 'Aurigny Air Services', 'ICAO': 'AUR'}, 'AU': {'Name': 'Austral Lineas Aereas', 'ICAO': 'AUT'}, 'AV': {'Name': 'Avianca - Aerovias Nacionales de Colombia', 'ICAO': 'AVA'}, 'NF': {'Name': 'Air Vanuatu', 'ICAO': 'AVN'}, 'B9': {'Name': 'Air Bangladesh', 'ICAO': 'BGD'}, 'DR': {'Name': 'Air Mediterranee', 'ICAO': 'BIE'}, '7E': {'Name': 'Aeroline GmbH', 'ICAO': 'AWU'}, '6G': {'Name': 'Air Wales', 'ICAO': 'AWW'}, 'TX': {'Name': 'Air Caraïbes', 'ICAO': 'FWI'}, 'IX': {'Name': 'Air India Express', 'ICAO': 'AXB'}, 'XT': {'Name': 'Air Exel', 'ICAO': 'AXL'}, 'AK': {'Name': 'AirAsia', 'ICAO': 'AXM'}, '3G': {'Name': 'Atlant-Soyuz Airlines', 'ICAO': 'AYZ'}, 'AZ': {'Name': 'Alitalia', 'ICAO': 'AZA'}, 'Z8': {'Name': 'Amaszonas', 'ICAO': 'AZN'}, 'UM': {'Name': 'Air Zimbabwe', 'ICAO': 'AZW'}, 'R7': {'Name': 'Aserca Airlines', 'ICAO': 'OCA'}, 'FV': {'Name': 'Rossiya-Russian Airlines', 'ICAO': 'SDM'}, 'MQ': {'Name': 'American Eagle Airlines', 'ICAO': 'EGF'}, 'VU': {'Name': 'Air Ivoire', 'ICAO': 'VUN'}, 'BP': {'Name': 'Air Botswana', 'ICAO': 'BOT'}, 'GS': {'Name': 'Air Foyle', 'ICAO': 'UPA'}, 'VT': {'Name': 'Air Tahiti', 'ICAO': 'VTA'}, 'VL': {'Name': 'Air VIA', 'ICAO': 'VIM'}, 'FK': {'Name': 'Africa West', 'ICAO': 'WTA'}, 'V8': {'Name': 'ATRAN Cargo Airlines', 'ICAO': 'VAS'}, 'CA': {'Name': 'Air China', 'ICAO': 'CCA'}, 'Q6': {'Name': 'Aero Condor Peru', 'ICAO': 'CDP'}, 'CV': {'Name': 'Air Chathams', 'ICAO': 'CVA'}, 'CW': {'Name': 'Air Marshall Islands', 'ICAO': 'CWM'}, 'ZA': {'Name': 'Interavia Airlines', 'ICAO': 'SUW'}, 'AH': {'Name': 'Air Algerie', 'ICAO': 'DAH'}, 'KI': {'Name': 'Adam Air', 'ICAO': 'DHI'}, 'EN': {'Name': 'Air Dolomiti', 'ICAO': 'DLA'}, 'D9': {'Name': 'Aeroflot-Don', 'ICAO': 'DNV'}, 'NM': {'Name': 'Air Madrid', 'ICAO': 'DRD'}, 'EI': {'Name': 'Aer Lingus', 'ICAO': 'EIN'}, 'OF': {'Name': 'Air Finland', 'ICAO': 'FIF'}, 'FJ': {'Name': 'Air Pacific', 'ICAO': 'FJI'}, 'RC': {'Name': 'Atlantic Airways', 'ICAO': 'FLI'}, 'QH': {'Name': 'Air Florida', 'ICAO': 'FLZ'}, 'NY': {'Name': 'Air Iceland', 'ICAO': 'FXI'}, '2P': {'Name': 'Air Philippines', 'ICAO': 'GAP'}, '2U': {'Name': 'Air Guinee Express', 'ICAO': 'GIP'}, 'GL': {'Name': 'Air Greenland', 'ICAO': 'GRL'}, '5Y': {'Name': 'Atlas Air', 'ICAO': 'GTI'}, 'GG': {'Name': 'Air Guyane', 'ICAO': 'GUY'}, 'W9': {'Name': 'Air Bagan', 'ICAO': 'JAB'}, 'QK': {'Name': 'Air Canada Jazz', 'ICAO': 'JZA'}, 'KK': {'Name': 'Atlasjet', 'ICAO': 'KKK'}, 'JS': {'Name': 'Air Koryo', 'ICAO': 'KOR'}, 'KC': {'Name': 'Air Astana', 'ICAO': 'KZR'}, 'LV': {'Name': 'Albanian Airlines', 'ICAO': 'LBC'}, 'XL': {'Name': 'Aerolane', 'ICAO': 'LNE'}, 'TD': {'Name': 'Atlantis European Airways', 'ICAO': 'LUR'}, 'LK': {'Name': 'Air Luxor', 'ICAO': 'LXR'}, 'MK': {'Name': 'Air Mauritius', 'ICAO': 'MAU'}, 'MD': {'Name': 'Air Madagascar', 'ICAO': 'MDG'}, '9U': {'Name': 'Air Moldova', 'ICAO': 'MLD'}, 'A7': {'Name': 'Air Plus Comet', 'ICAO': 'MPD'}, '8D': {'Name': 'Astair', 'ICAO': 'None'}, 'AJ': {'Name': 'Aero Contractors', 'ICAO': 'NIG'}, 'OT': {'Name': 'Aeropelican Air Services', 'ICAO': 'PEL'}, 'RE': {'Name': 'Aer Arann', 'ICAO': 'REA'}, 'UU': {'Name': 'Air Austral', 'ICAO': 'REU'}, '6K': {'Name': 'Asian Spirit', 'ICAO': 'RIT'}, 'RK': {'Name': 'Air Afrique', 'ICAO': 'RKA'}, 'A5': {'Name': 'Airlinair', 'ICAO': 'RLA'}, 'QL': {'Name': 'Aero Lanka', 'ICAO': 'RLN'}, '20': {'Name': 'Air Salone', 'ICAO': 'RNE'}, 'U8': {'Name': 'Armavia', 'ICAO': 'RNV'}, 'P5': {'Name': 'AeroRep', 'ICAO': 'RPB'}, 'BF': {'Name': 'Aero-Service', 'ICAO': 'RSR'}, '5L': {'Name': 'Aerosur', 'ICAO': 'RSU'}, 'Z3': {'Name': 'Avient Aviation', 'ICAO': 'SMJ'}, 'R3': {'Name': 'Aircompany Yakutia', 'ICAO': 'SYL'}, 'VW': {'Name': 'Aeromar', 'ICAO': 'TAO'}, 'OR': {'Name': 'Arkefly', 'ICAO': 'TFL'}, 'CG': {'Name': 'Airlines PNG', 'ICAO': 'TOK'}, 'FL': {'Name': 'AirTran Airways', 'ICAO': 'TRS'}, 'TS': {'Name': 'Air Transat', 'ICAO': 'TSC'}, 'EC': {'Name': 'Avialeasing Aviation Company', 'ICAO': 'TWN'}, 'VO': {'Name': 'Tyrolean Airways', 'ICAO': 'TYR'}, '2K': {'Name': 'Aerolineas Galapagos (Aerogal)', 'ICAO': 'GLG'}, '6R': {'Name': 'Alrosa Mirny Air Enterprise', 'ICAO': 'DRU'}, 'BA': {'Name': 'British Airways', 'ICAO': 'BAW'}, 'BG': {'Name': 'Biman Bangladesh Airlines', 'ICAO': 'BBC'}, '4T': {'Name': 'Belair Airlines', 'ICAO': 'BHP'}, 'UP': {'Name': 'Bahamasair', 'ICAO': 'BHS'}, 'LZ': {'Name': 'Balkan Bulgarian Airlines', 'ICAO': 'None'}, 'BS': {'Name': 'British International Helicopters', 'ICAO': 'BIH'}, 'PG': {'Name': 'Bangkok Airways', 'ICAO': 'BKP'}, 'KF': {'Name': 'Blue1', 'ICAO': 'BLF'}, 'JV': {'Name': 'Bearskin Lake Air Service', 'ICAO': 'BLS'}, 'B3': {'Name': 'Bellview Airlines', 'ICAO': 'BLV'}, 'BD': {'Name': 'bmi', 'ICAO': 'BMA'}, 'WW': {'Name': 'bmibaby', 'ICAO': 'BMI'}, 'CH': {'Name': 'Bemidji Airlines', 'ICAO': 'BMJ'}, 'BV': {'Name': 'Blue Panorama Airlines', 'ICAO': 'BPA'}, '8E': {'Name': 'Bering Air', 'ICAO': 'BRG'}, 'B2': {'Name': 'Belavia Belarusian Airlines', 'ICAO': 'BRU'}, '7P': {'Name': 'Metro Batavia', 'ICAO': 'BTV'}, 'J8': {'Name': 'Berjaya Air', 'ICAO': 'BVT'}, 'QW': {'Name': 'Blue Wings', 'ICAO': 'BWG'}, 'DB': {'Name': 'Brit Air', 'ICAO': 'BZH'}, 'SN': {'Name': 'Brussels Airlines', 'ICAO': 'DAT'}, 'NT': {'Name': 'Binter Canarias', 'ICAO': 'IBB'}, '0B': {'Name': 'Blue Air', 'ICAO': 'JOR'}, 'KJ': {'Name': 'British Mediterranean Airways', 'ICAO': 'LAJ'}, 'FB': {'Name': 'Bulgaria Air', 'ICAO': 'LZB'}, '8N': {'Name': 'Barents AirLink', 'ICAO': 'NKF'}, '5C': {'Name': 'CAL Cargo Air Lines', 'ICAO': 'ICL'}, 'XG': {'Name': 'Calima Aviacion', 'ICAO': 'CLI'}, 'CP': {'Name': 'Compass Airlines', 'ICAO': 'CPZ'}, '5T': {'Name': 'Canadian North', 'ICAO': 'MPE'}, '9K': {'Name': 'Cape Air', 'ICAO': 'KAP'}, 'BW': {'Name': 'Caribbean Airlines', 'ICAO': 'BWA'}, 'V3': {'Name': 'Carpatair', 'ICAO': 'KRP'}, 'RV': {'Name': 'Caspian Airlines', 'ICAO': 'CPN'}, 'CX': {'Name': 'Cathay Pacific', 'ICAO': 'CPA'}, 'KX': {'Name': 'Cayman Airways', 'ICAO': 'CAY'}, '5J': {'Name': 'Cebu Pacific', 'ICAO': 'CEB'}, 'C0': {'Name': 'Centralwings', 'ICAO': 'CLW'}, 'RP': {'Name': 'Chautauqua Airlines', 'ICAO': 'CHQ'}, 'CI': {'Name': 'China Airlines', 'ICAO': 'CAL'}, 'MU': {'Name': 'China Eastern Airlines', 'ICAO': 'CES'}, 'CZ': {'Name': 'China Southern Airlines', 'ICAO': 'CSN'}, 'HR': {'Name': 'China United Airlines', 'ICAO': 'CUA'}, '3Q': {'Name': 'Yunnan Airlines', 'ICAO': 'CYH'}, 'QI': {'Name': 'Cimber Air', 'ICAO': 'CIM'}, 'C9': {'Name': 'Cirrus Airlines', 'ICAO': 'RUS'}, 'CF': {'Name': 'City Airline', 'ICAO': 'SDR'}, 'G3': {'Name': 'Sky Express', 'ICAO': 'SEH'}, 'WX': {'Name': 'CityJet', 'ICAO': 'BCY'}, 'CJ': {'Name': 'BA CityFlyer', 'ICAO': 'CFE'}, 'DQ': {'Name': 'Coastal Air', 'ICAO': 'None'}, '9L': {'Name': 'Colgan Air', 'ICAO': 'CJC'}, 'OH': {'Name': 'Comair', 'ICAO': 'COM'}, 'MN': {'Name': 'Comair', 'ICAO': 'CAW'}, 'C5': {'Name': 'CommutAir', 'ICAO': 'UCA'}, 'KR': {'Name': 'Comores Airlines', 'ICAO': 'CWK'}, 'DE': {'Name': 'Condor Flugdienst', 'ICAO': 'CFG'}, '6A': {'Name': 'Consorcio Aviaxsa', 'ICAO': 'CHP'}, 'C3': {'Name': 'QatXpress', 'ICAO': 'QAX'}, 'CO': {'Name': 'Continental Express', 'ICAO': 'None'}, 'CS': {'Name': 'Continental Micronesia', 'ICAO': 'CMI'}, 'V0': {'Name': 'Conviasa', 'ICAO': 'VCV'}, 'CM': {'Name': 'Copa Airlines', 'ICAO': 'CMP'}, 'SS': {'Name': 'Corsairfly', 'ICAO': 'CRL'}, 'XK': {'Name': 'Corse-Mediterranee', 'ICAO': 'CCM'}, 'OU': {'Name': 'Croatia Airlines', 'ICAO': 'CTN'}, 'CU': {'Name': 'Cubana de Aviación', 'ICAO': 'CUB'}, 'CY': {'Name': 'Cyprus Airways', 'ICAO': 'CYP'}, 'YK': {'Name': 'Cyprus Turkish Airlines', 'ICAO': 'None'}, 'OK': {'Name': 'Czech Airlines', 'ICAO': 'CSA'}, 'DX': {'Name': 'DAT Danish Air Transport', 'ICAO': 'DTR'}, 'D3': {'Name': 'Daallo Airlines', 'ICAO': 'DAO'}, 'H8': {'Name': 'Dalavia', 'ICAO': 'KHB'}, '0D': {'Name': 'Darwin Airline', 'ICAO': 'DWT'}, 'DL': {'Name': 'Delta Air Lines', 'ICAO': 'DAL'}, '2A': {'Name': 'Deutsche Bahn', 'ICAO': 'None'}, 'D8': {'Name': 'Djibouti Airlines', 'ICAO': 'DJB'}, 'DO': {'Name': 'Dominicana de Aviaci', 'ICAO': 'DOA'}, 'E3': {'Name': 'Domodedovo Airlines', 'ICAO': 'DMO'}, 'KA': {'Name': 'Dragonair', 'ICAO': 'HDA'}, 'KB': {'Name': 'Druk Air', 'ICAO': 'DRK'}, 'DI': {'Name': 'dba', 'ICAO': 'BAG'}, 'BR': {'Name': 'EVA Air', 'ICAO': 'EVA'}, 'H7': {'Name': 'Eagle Air', 'ICAO': 'None'}, 'QU': {'Name': 'East African', 'ICAO': 'UGX'}, 'T3': {'Name': 'Eastern Airways', 'ICAO': 'EZE'}, 'DK': {'Name': 'Eastland Air', 'ICAO': 'ELA'}, 'WK': {'Name': 'Edelweiss Air', 'ICAO': 'EDW'}, 'MS': {'Name': 'Egyptair', 'ICAO': 'MSR'}, 'LY': {'Name': 'El Al Israel Airlines', 'ICAO': 'ELY'}, 'UZ': {'Name': 'El-Buraq Air Transport', 'ICAO': 'BRQ'}, 'EK': {'Name': 'Emirates', 'ICAO': 'UAE'}, 'EU': {'Name': 'Empresa Ecuatoriana De Aviacion', 'ICAO': 'EEA'}, 'B8': {'Name': 'Eritrean Airlines', 'ICAO': 'ERT'}, 'OV': {'Name': 'Estonian Air', 'ICAO': 'ELL'}, 'ET': {'Name': 'Ethiopian Airlines', 'ICAO': 'ETH'}, 'EY': {'Name': 'Etihad Airways', 'ICAO': 'ETD'}, 'RZ': {'Name': 'Euro Exec Express', 'ICAO': 'None'}, 'UI': {'Name': 'Eurocypria Airlines', 'ICAO': 'ECA'}, 'GJ': {'Name': 'Eurofly Service', 'ICAO': 'EEU'}, 'K2': {'Name': 'Eurolot', 'ICAO': 'ELO'}, 'EA': {'Name': 'European Air Express', 'ICAO': 'EAL'}, 'EW': {'Name': 'Eurowings', 'ICAO': 'EWG'}, 'EZ': {'Name': 'Evergreen International Airlines', 'ICAO': 'EIA'}, 'JN': {'Name': 'Excel Airways', 'ICAO': 'XLA'}, 'EO': {'Name': 'Express One International', 'ICAO': 'LHN'}, 'XE': {'Name': 'ExpressJet', 'ICAO': 'BTA'}, 'U2': {'Name': 'easyJet', 'ICAO': 'EZY'}, 'EF': {'Name': 'Far Eastern Air Transport', 'ICAO': 'EFA'}, 'AY': {'Name': 'Finnair', 'ICAO': 'FIN'}, 'FC': {'Name': 'Finncomm Airlines', 'ICAO': 'WBA'}, 'FY': {'Name': 'Firefly', 'ICAO': 'FFM'}, '7F': {'Name': 'First Air', 'ICAO': 'FAB'}, 'DP': {'Name': 'First Choice Airways', 'ICAO': 'FCA'}, 'B5': {'Name': 'Flightline', 'ICAO': 'FLT'}, 'RF': {'Name': 'Florida West International Airways', 'ICAO': 'FWL'}, 'D7': {'Name': 'AirAsia X', 'ICAO': 'XAX'}, 'TE': {'Name': 'FlyLal', 'ICAO': 'LIL'}, 'LF': {'Name': 'FlyNordic', 'ICAO': 'NDC'}, 'F7': {'Name': 'Flybaboo', 'ICAO': 'BBO'}, 'BE': {'Name': 'Flybe', 'ICAO': 'BEE'}, 'B4': {'Name': 'Flyglobespan', 'ICAO': 'GSM'}, 'VY': {'Name': 'Vueling Airlines', 'ICAO': 'VLG'}, 'FP': {'Name': 'Freedom Air', 'ICAO': 'FRE'}, 'F9': {'Name': 'Frontier Airlines', 'ICAO': 'FFT'}, '2F': {'Name': 'Frontier Flying Service', 'ICAO': 'FTA'}, 'GT': {'Name': 'GB Airways', 'ICAO': 'GBL'}, 'GA': {'Name': 'Garuda Indonesia', 'ICAO': 'GIA'}, '4G': {'Name': 'Gazpromavia', 'ICAO': 'GZP'}, 'A9': {'Name': 'Georgian Airways', 'ICAO': 'TGZ'}, 'QB': {'Name': 'Georgian National Airlines', 'ICAO': 'GFG'}, 'ST': {'Name': 'Germania', 'ICAO': 'GMI'}, '4U': {'Name': 'Germanwings', 'ICAO': 'GWI'}, 'G0': {'Name': 'Ghana International Airlines', 'ICAO': 'GHB'}, 'G8': {'Name': 'Go Air', 'ICAO': 'GOW'}, 'G7': {'Name': 'GoJet Airlines', 'ICAO': 'GJS'}, 'DC': {'Name': 'Golden Air', 'ICAO': 'GAO'}, 'ZK': {'Name': 'Great Lakes Airlines', 'ICAO': 'GLA'}, 'TA': {'Name': 'Grupo TACA', 'ICAO': 'TAT'}, 'GF': {'Name': 'Gulf Air Bahrain', 'ICAO': 'GBA'}, 'H6': {'Name': 'Hageland Aviation Services', 'ICAO': 'HAG'}, 'HU': {'Name': 'Hainan Airlines', 'ICAO': 'CHH'}, '2T': {'Name': 'Haiti Ambassador Airlines', 'ICAO': 'HAM'}, '4R': {'Name': 'Hamburg International', 'ICAO': 'HHI'}, 'X3': {'Name': 'TUIfly', 'ICAO': 'HLX'}, 'HF': {'Name': 'Hapagfly', 'ICAO': 'HLF'}, 'HA': {'Name': 'Hawaiian Airlines', 'ICAO': 'HAL'}, 'BH': {'Name': 'Hawkair', 'ICAO': 'None'}, '8H': {'Name': 'Heli France', 'ICAO': 'HFR'}, 'JB': {'Name': 'Helijet', 'ICAO': 'JBA'}, 'T4': {'Name': 'Hellas Jet', 'ICAO': 'HEJ'}, 'HW': {'Name': 'Hello', 'ICAO': 'FHE'}, '2L': {'Name': 'Helvetic Airways', 'ICAO': 'OAW'}, 'UD': {'Name': "Hex'Air", 'ICAO': 'HER'}, 'HD': {'Name': 'Hokkaido International Airlines', 'ICAO': 'ADO'}, 'HX': {'Name': 'Hong Kong Airlines', 'ICAO': 'CRK'}, 'UO': {'Name': 'Hong Kong Express Airways', 'ICAO': 'HKE'}, 'QX': {'Name': 'Horizon Air', 'ICAO': 'QXE'}, 'BN': {'Name': 'Horizon Airlines', 'ICAO': 'HZA'}, 'IB': {'Name': 'Iberia Airlines', 'ICAO': 'IBE'}, 'TY': {'Name': 'Iberworld', 'ICAO': 'IWD'}, 'FW': {'Name': 'Ibex Airlines', 'ICAO': 'IBX'}, 'FI': {'Name': 'Icelandair', 'ICAO': 'ICE'}, 'IK': {'Name': 'Imair Airlines', 'ICAO': 'ITX'}, '6E': {'Name': 'IndiGo Airlines', 'ICAO': 'IGO'}, 'IC': {'Name': 'Indian Airlines', 'ICAO': 'IAC'}, 'QZ': {'Name': 'Indonesia AirAsia', 'ICAO': 'AWQ'}, 'IO': {'Name': 'Indonesian Airlines', 'ICAO': 'IAA'}, 'D6': {'Name': 'Interair South Africa', 'ICAO': 'ILN'}, 'ID': {'Name': 'Interlink Airlines', 'ICAO': 'ITK'}, '3L': {'Name': 'Intersky', 'ICAO': 'ISK'}, 'IR': {'Name': 'Iran Air', 'ICAO': 'IRA'}, 'EP': {'Name': 'Iran Aseman Airlines', 'ICAO': 'IRC'}, 'IA': {'Name': 'Iraqi Airways', 'ICAO': 'IAW'}, 'IS': {'Name': 'Island Airlines', 'ICAO': 'None'}, '8L': {'Name': 'Cargo Plus Aviation', 'ICAO': 'CGP'}, 'IF': {'Name': 'Islas Airways', 'ICAO': 'ISW'}, 'WC': {'Name': 'Islena De Inversiones', 'ICAO': 'ISV'}, '6H': {'Name': 'Israir', 'ICAO': 'ISR'}, 'GI': {'Name': 'Itek Air', 'ICAO': 'IKA'}, 'JC': {'Name': 'JAL Express', 'ICAO': 'JEX'}, 'JO': {'Name': 'JALways', 'ICAO': 'JAZ'}, 'JL': {'Name': 'Japan Airlines Domestic', 'ICAO': 'JAL'}, 'EG': {'Name': 'Japan Asia Airways', 'ICAO': 'JAA'}, 'NU': {'Name': 'Japan Transocean Air', 'ICAO': 'JTA'}, 'J9': {'Name': 'Jazeera Airways', 'ICAO': 'JZR'}, '7C': {'Name': 'Jeju Air', 'ICAO': 'JJA'}, '9W': {'Name': 'Jet Airways', 'ICAO': 'JAI'}, 'QJ': {'Name': 'Jet Airways', 'ICAO': 'None'}, '3K': {'Name': 'Jetstar Asia Airways', 'ICAO': 'JSA'}, 'LS': {'Name': 'Jet2.com', 'ICAO': 'EXS'}, '8J': {'Name': 'Jet4You', 'ICAO': 'JFU'}, 'B6': {'Name': 'JetBlue Airways', 'ICAO': 'JBU'}, 'JF': {'Name': 'Jetairfly', 'ICAO': 'JAF'}, 'JQ': {'Name': 'Jetstar Airways', 'ICAO': 'JST'}, 'HO': {'Name': 'Juneyao Airlines', 'ICAO': 'DKH'}, 'KD': {'Name': 'KD Avia', 'ICAO': 'KNI'}, 'WA': {'Name': 'Western Airlines', 'ICAO': 'WAL'}, 'KL': {'Name': 'KLM Royal Dutch Airlines', 'ICAO': 'KLM'}, 'RQ': {'Name': 'Kam Air', 'ICAO': 'KMF'}, 'KV': {'Name': 'Kavminvodyavia', 'ICAO': 'MVD'}, 'M5': {'Name': 'Kenmore Air', 'ICAO': 'KEN'}, 'KQ': {'Name': 'Kenya Airways', 'ICAO': 'KQA'}, 'IT': {'Name': 'Kingfisher Airlines', 'ICAO': 'KFR'}, 'Y9': {'Name': 'Kish Air', 'ICAO': 'IRK'}, '7K': {'Name': 'Kogalymavia Air Company', 'ICAO': 'KGL'}, 'KE': {'Name': 'Korean Air', 'ICAO': 'KAL'}, '7B': {'Name': 'Krasnojarsky Airlines', 'ICAO': 'KJC'}, 'GW': {'Name': 'Kuban Airlines', 'ICAO': 'KIL'}, 'KU': {'Name': 'Kuwait Airways', 'ICAO': 'KAC'}, 'GO': {'Name': 'Kuzu Airlines Cargo', 'ICAO': 'KZU'}, 'LR': {'Name': 'LACSA', 'ICAO': 'LRC'}, 'LA': {'Name': 'LAN Airlines', 'ICAO': 'LAN'}, '4M': {'Name': 'LAN Argentina', 'ICAO': 'DSM'}, 'LU': {'Name': 'LAN Express', 'ICAO': 'LXP'}, 'LP': {'Name': 'LAN Peru', 'ICAO': 'LPE'}, 'LO': {'Name': 'LOT Polish Airlines', 'ICAO': 'LOT'}, 'XO': {'Name': 'LTE International Airways', 'ICAO': 'LTE'}, 'L3': {'Name': 'LTU Austria', 'ICAO': 'LTO'}, 'QV': {'Name': 'Lao Airlines', 'ICAO': 'LAO'}, 'NG': {'Name': 'Lauda Air', 'ICAO': 'LDA'}, 'LI': {'Name': 'Leeward Islands Air Transport', 'ICAO': 'LIA'}, 'LN': {'Name': 'Libyan Arab Airlines', 'ICAO': 'LAA'}, 'LM': {'Name': 'Linhas A', 'ICAO': 'LAM'}, 'JT': {'Name': 'Lion Mentari Airlines', 'ICAO': 'LNI'}, 'HE': {'Name': 'Luftfahrtgesellschaft Walter', 'ICAO': 'LGW'}, 'LH': {'Name': 'Lufthansa Cargo', 'ICAO': 'GEC'}, 'CL': {'Name': 'Lufthansa CityLine', 'ICAO': 'CLH'}, 'L5': {'Name': 'Lufttransport', 'ICAO': 'LTR'}, 'LG': {'Name': 'Luxair', 'ICAO': 'LGL'}, 'MJ': {'Name': 'L', 'ICAO': 'LPR'}, 'M7': {'Name': 'MasAir', 'ICAO': 'MAA'}, 'IN': {'Name': 'MAT Macedonian Airlines', 'ICAO': 'MAK'}, 'OM': {'Name': 'MIAT Mongolian Airlines', 'ICAO': 'MGL'}, 'MB': {'Name': 'MNG Airlines', 'ICAO': 'MNB'}, 'DM': {'Name': 'Maersk', 'ICAO': 'None'}, 'W5': {'Name': 'Mahan Air', 'ICAO': 'IRM'}, 'MH': {'Name': 'Malaysia Airlines', 'ICAO': 'MAS'}, 'TF': {'Name': 'Malmö Aviation', 'ICAO': 'SCW'}, 'R5': {'Name': 'Malta Air Charter', 'ICAO': 'MAC'}, 'MA': {'Name': 'Malév', 'ICAO': 'MAH'}, 'RI': {'Name': 'Mandala Airlines', 'ICAO': 'MDL'}, 'AE': {'Name': 'Mandarin Airlines', 'ICAO': 'MDA'}, 'JE': {'Name': 'Mango', 'ICAO': 'MNO'}, 'MP': {'Name': 'Martinair', 'ICAO': 'MPH'}, '8M': {'Name': 'Myanmar Airways International', 'ICAO': 'MMM'}, 'MW': {'Name': 'Maya Island Air', 'ICAO': 'MYD'}, 'IG': {'Name': 'Meridiana', 'ICAO': 'ISS'}, 'MZ': {'Name': 'Merpati Nusantara Airlines', 'ICAO': 'MNA'}, 'YV': {'Name': 'Mesa Airlines', 'ICAO': 'ASH'}, 'XJ': {'Name': 'Mesaba Airlines', 'ICAO': 'MES'}, 'MX': {'Name': 'Mexicana de Aviaci', 'ICAO': 'MXA'}, 'ME': {'Name': 'Middle East Airlines', 'ICAO': 'MEA'}, 'JI': {'Name': 'Midway Airlines', 'ICAO': 'MDW'}, 'YX': {'Name': 'Midwest Airlines', 'ICAO': 'MEP'}, 'MY': {'Name': 'Midwest Airlines (Egypt)', 'ICAO': 'MWA'}, '2M': {'Name': 'Moldavian Airlines', 'ICAO': 'MDV'}, '8I': {'Name': 'Myway Airlines', 'ICAO': 'None'}, 'YM': {'Name': 'Montenegro Airlines', 'ICAO': 'MGX'}, '3R': {'Name': 'Moskovia Airlines', 'ICAO': 'GAI'}, 'M9': {'Name': 'Motor Sich', 'ICAO': 'MSI'}, 'VZ': {'Name': 'MyTravel Airways', 'ICAO': 'MYT'}, 'UB': {'Name': 'Myanma Airways', 'ICAO': 'UBA'}, 'UE': {'Name': 'Nasair', 'ICAO': 'NAS'}, 'NC': {'Name': 'National Jet Systems', 'ICAO': 'NJS'}, 'CE': {'Name': 'Nationwide Airlines', 'ICAO': 'NTW'}, 'ON': {'Name': 'Nauru Air Corporation', 'ICAO': 'RON'}, 'RA': {'Name': 'Royal Nepal Airlines', 'ICAO': 'RNA'}, '1I': {'Name': 'Novair', 'ICAO': 'NVR'}, 'EJ': {'Name': 'New England Airlines', 'ICAO': 'NEA'}, '2N': {'Name': 'NextJet', 'ICAO': 'NTJ'}, 'HG': {'Name': 'Niki', 'ICAO': 'NLY'}, 'DD': {'Name': 'Nok Air', 'ICAO': 'NOK'}, 'U7': {'Name': 'Northern Dene Airways', 'ICAO': 'None'}, 'NW': {'Name': 'Northwest Airlines', 'ICAO': 'NWA'}, 'J3': {'Name': 'Northwestern Air', 'ICAO': 'PLR'}, 'DY': {'Name': 'Norwegian Air Shuttle', 'ICAO': 'NAX'}, 'BJ': {'Name': 'Nouvel Air Tunisie', 'ICAO': 'LBT'}, 'XY': {'Name': 'Nas Air', 'ICAO': 'KNE'}, 'O8': {'Name': 'Oasis Hong Kong Airlines', 'ICAO': 'OHK'}, 'O6': {'Name': 'Oceanair', 'ICAO': 'ONE'}, 'O2': {'Name': 'Oceanic Airlines', 'ICAO': 'None'}, 'OA': {'Name': 'Olympic Airlines', 'ICAO': 'OAL'}, 'WY': {'Name': 'Oman Air', 'ICAO': 'OMA'}, 'OY': {'Name': 'Omni Air International', 'ICAO': 'OAE'}, '8Q': {'Name': 'Maldivian Air Taxi', 'ICAO': '\\N'}, 'R2': {'Name': 'Orenburg Airlines', 'ICAO': 'ORB'}, 'OX': {'Name': 'Orient Thai Airlines', 'ICAO': 'OEA'}, 'QO': {'Name': 'Origin Pacific Airways', 'ICAO': 'OGN'}, 'OL': {'Name': 'Ostfriesische Lufttransport', 'ICAO': 'OLT'}, 'OJ': {'Name': 'Overland Airways', 'ICAO': 'OLA'}, 'O7': {'Name': 'Ozjet Airlines', 'ICAO': 'OZJ'}, 'PV': {'Name': 'PAN Air', 'ICAO': 'PNR'}, '9Q': {'Name': 'PB Air', 'ICAO': 'PBA'}, 'PU': {'Name': 'PLUNA', 'ICAO': 'PUA'}, 'U4': {'Name': 'PMTair', 'ICAO': 'PMT'}, 'BL': {'Name': 'Jetstar Pacific', 'ICAO': 'PIC'}, '8P': {'Name': 'Pacific Coastal Airline', 'ICAO': 'PCO'}, 'Q8': {'Name': 'Pacific East Asia Cargo Airlines', 'ICAO': 'PEC'}, 'LW': {'Name': 'Pacific Wings', 'ICAO': 'NMI'}, 'PK': {'Name': 'Pakistan International Airlines', 'ICAO': 'PIA'}, 'I7': {'Name': 'Paramount Airways', 'ICAO': 'PMW'}, 'PC': {'Name': 'Pegasus Airlines', 'ICAO': 'PGT'}, 'KS': {'Name': 'Peninsula Airways', 'ICAO': 'PEN'}, 'PR': {'Name': 'Philippine Airlines', 'ICAO': 'PAL'}, 'PI': {'Name': 'Piedmont Airlines (1948-1989)', 'ICAO': 'PDT'}, '9E': {'Name': 'Pinnacle Airlines', 'ICAO': 'FLG'}, 'PH': {'Name': 'Polynesian Airlines', 'ICAO': 'PAO'}, 'PD': {'Name': 'Porter Airlines', 'ICAO': 'POE'}, 'NI': {'Name': 'Portugalia', 'ICAO': 'PGA'}, 'BK': {'Name': 'Potomac Air', 'ICAO': 'PDC'}, 'PW': {'Name': 'Precision Air', 'ICAO': 'PRF'}, 'P0': {'Name': 'Proflight Commuter Services', 'ICAO': 'None'}, 'QF': {'Name': 'Qantas', 'ICAO': 'QFA'}, 'QR': {'Name': 'Qatar Airways', 'ICAO': 'QTR'}, 'R6': {'Name': 'RACSA', 'ICAO': 'None'}, 'FN': {'Name': 'Regional Airlines', 'ICAO': 'None'}, 'ZL': {'Name': 'Regional Express', 'ICAO': 'RXA'}, 'RW': {'Name': 'Republic Airlines', 'ICAO': 'RPA'}, 'RH': {'Name': 'Republic Express Airlines', 'ICAO': 'RPH'}, 'R4': {'Name': 'Rossiya', 'ICAO': 'None'}, 'GZ': {'Name': 'Air Rarotonga', 'ICAO': 'RAR'}, 'AT': {'Name': 'Royal Air Maroc', 'ICAO': 'RAM'}, 'BI': {'Name': 'Royal Brunei Airlines', 'ICAO': 'RBA'}, 'RJ': {'Name': 'Royal Jordanian', 'ICAO': 'RJA'}, 'WB': {'Name': 'Rwandair Express', 'ICAO': 'RWD'}, 'RD': {'Name': 'Ryan International Airlines', 'ICAO': 'RYN'}, 'FR': {'Name': 'Ryanair', 'ICAO': 'RYR'}, 'YS': {'Name': 'Régional', 'ICAO': 'RAE'}, 'S4': {'Name': 'SATA International', 'ICAO': 'RZO'}, 'SA': {'Name': 'South African Airways', 'ICAO': 'SAA'}, 'NL': {'Name': 'Shaheen Air International', 'ICAO': 'SAI'}, 'SK': {'Name': 'Scandinavian Airlines System', 'ICAO': 'SAS'}, 'S7': {'Name': 'S7 Airlines', 'ICAO': 'SBI'}, 'BB': {'Name': 'Seaborne Airlines', 'ICAO': 'SBS'}, 'UL': {'Name': 'SriLankan Airlines', 'ICAO': 'ALK'}, 'SY': {'Name': 'Sun Country Airlines', 'ICAO': 'SCX'}, 'SG': {'Name': 'Spicejet', 'ICAO': 'SEJ'}, '7G': {'Name': 'Star Flyer', 'ICAO': 'SFJ'}, 'N5': {'Name': 'Skagway Air Service', 'ICAO': 'SGY'}, 'SP': {'Name': 'SATA Air Acores', 'ICAO': 'SAT'}, 'SQ': {'Name': 'Singapore Airlines Cargo', 'ICAO': 'SQC'}, '5M': {'Name': 'Sibaviatrans', 'ICAO': 'SIB'}, 'SI': {'Name': 'Skynet Airlines', 'ICAO': 'SIH'}, 'SJ': {'Name': 'Sriwijaya Air', 'ICAO': 'SJY'}, 'ZS': {'Name': 'Sama Airlines', 'ICAO': 'SMY'}, 'FT': {'Name': 'Siem Reap Airways', 'ICAO': 'SRH'}, 'DG': {'Name': 'South East Asian Airlines', 'ICAO': 'SRQ'}, '5G': {'Name': 'Skyservice Airlines', 'ICAO': 'SSV'}, 'FS': {'Name': 'Servicios de Transportes A', 'ICAO': 'STU'}, 'SD': {'Name': 'Sudan Airways', 'ICAO': 'SUD'}, 'SV': {'Name': 'Saudi Arabian Airlines', 'ICAO': 'SVA'}, 'WN': {'Name': 'Southwest Airlines', 'ICAO': 'SWA'}, 'A4': {'Name': 'Southern Winds Airlines', 'ICAO': 'SWD'}, 'LX': {'Name': 'Swiss International Air Lines', 'ICAO': 'SWR'}, 'SR': {'Name': 'Swissair', 'ICAO': 'SWR'}, 'WV': {'Name': 'Swe Fly', 'ICAO': 'SWV'}, 'XQ': {'Name': 'SunExpress', 'ICAO': 'SXS'}, 'RB': {'Name': 'Syrian Arab Airlines', 'ICAO': 'SYR'}, 'AL': {'Name': 'Skywalk Airlines', 'ICAO': 'SYX'}, 'SC': {'Name': 'Shandong Airlines', 'ICAO': 'CDG'}, '9S': {'Name': 'Spring Airlines', 'ICAO': 'CQH'}, '3U': {'Name': 'Sichuan Airlines', 'ICAO': 'CSC'}, 'FM': {'Name': 'Shanghai Airlines', 'ICAO': 'CSH'}, 'ZH': {'Name': 'Shenzhen Airlines', 'ICAO': 'CSZ'}, '7L': {'Name': "Sun D'Or", 'ICAO': 'ERO'}, 'NE': {'Name': 'SkyEurope', 'ICAO': 'ESK'}, 'JK': {'Name': 'Spanair', 'ICAO': 'JKK'}, 'NK': {'Name': 'Spirit Airlines', 'ICAO': 'NKS'}, '9R': {'Name': 'SATENA', 'ICAO': 'NSE'}, 'S3': {'Name': 'Santa Barbara Airlines', 'ICAO': 'BBR'}, 'H2': {'Name': 'Sky Airline', 'ICAO': 'SKU'}, 'OO': {'Name': 'SkyWest', 'ICAO': 'SKW'}, 'JZ': {'Name': 'Skyways Express', 'ICAO': 'SKX'}, 'BC': {'Name': 'Skymark Airlines', 'ICAO': 'SKY'}, 'MI': {'Name': 'SilkAir', 'ICAO': 'SLK'}, 'PY': {'Name': 'Surinam Airways', 'ICAO': 'SLM'}, 'NB': {'Name': 'Sterling Airlines', 'ICAO': 'SNB'}, '6J': {'Name': 'Skynet Asia Airways', 'ICAO': 'SNJ'}, 'IE': {'Name': 'Solomon Airlines', 'ICAO': 'SOL'}, '6W': {'Name': 'Saratov Aviation Division', 'ICAO': 'SOV'}, 'HZ': {'Name': 'Sat Airlines', 'ICAO': 'SOZ'}, 'S5': {'Name': 'Shuttle America', 'ICAO': 'TCF'}, 'DV': {'Name': 'Scat Air', 'ICAO': 'VSV'}, 'EQ': {'Name': 'TAME', 'ICAO': 'TAE'}, 'JJ': {'Name': 'TAM Brazilian Airlines', 'ICAO': 'TAM'}, 'TP': {'Name': 'TAP Portugal', 'ICAO': 'TAP'}, 'TU': {'Name': 'Tunisair', 'ICAO': 'TAR'}, 'T2': {'Name': 'Thai Air Cargo', 'ICAO': 'TCG'}, 'FQ': {'Name': 'Thomas Cook Airlines', 'ICAO': 'TCW'}, 'MT': {'Name': 'Thomas Cook Airlines', 'ICAO': 'TCX'}, 'TR': {'Name': 'Tiger Airways', 'ICAO': 'TGW'}, 'TT': {'Name': 'Tiger Airways Australia', 'ICAO': 'TGW'}, 'TG': {'Name': 'Thai Airways International', 'ICAO': 'THA'}, 'FD': {'Name': 'Thai AirAsia', 'ICAO': 'AIQ'}, 'TK': {'Name': 'Turkish Airlines', 'ICAO': 'THY'}, 'T7': {'Name': 'Twin Jet', 'ICAO': 'TJT'}, '3P': {'Name': 'Tiara Air', 'ICAO': 'TNM'}, 'BY': {'Name': 'Thomsonfly', 'ICAO': 'TOM'}, 'PM': {'Name': 'Tropic Air', 'ICAO': 'TOS'}, 'QT': {'Name': 'TAMPA', 'ICAO': 'TPA'}, 'GE': {'Name': 'TransAsia Airways', 'ICAO': 'TNA'}, 'HV': {'Name': 'Transavia Holland', 'ICAO': 'TRA'}, 'VR': {'Name': 'TACV', 'ICAO': 'TCV'}, '9T': {'Name': 'Transwest Air', 'ICAO': 'ABS'}, 'UN': {'Name': 'Transaero Airlines', 'ICAO': 'TSO'}, 'T5': {'Name': 'Turkmenistan Airlines', 'ICAO': 'TUA'}, 'UG': {'Name': 'Tuninter', 'ICAO': 'TUI'}, 'QS': {'Name': 'Travel Service', 'ICAO': 'TVS'}, '6B': {'Name': 'TUIfly Nordic', 'ICAO': 'BLX'}, 'DT': {'Name': 'TAAG Angola Airlines', 'ICAO': 'DTA'}, 'PZ': {'Name': 'TAM Mercosur', 'ICAO': 'LAP'}, 'AX': {'Name': 'Trans States Airlines', 'ICAO': 'LOF'}, 'RO': {'Name': 'Tarom', 'ICAO': 'ROT'}, '3T': {'Name': 'Turan Air', 'ICAO': 'URN'}, '8R': {'Name': 'TRIP Linhas A', 'ICAO': 'TIB'}, 'U5': {'Name': 'USA3000 Airlines', 'ICAO': 'GWY'}, 'UA': {'Name': 'United Airlines', 'ICAO': 'UAL'}, 'U6': {'Name': 'Ural Airlines', 'ICAO': 'SVR'}, 'UF': {'Name': 'UM Airlines', 'ICAO': 'UKM'}, 'US': {'Name': 'US Airways', 'ICAO': 'USA'}, 'UT': {'Name': 'UTair Aviation', 'ICAO': 'UTA'}, 'HY': {'Name': 'Uzbekistan Airways', 'ICAO': 'UZB'}, 'PS': {'Name': 'Ukraine International Airlines', 'ICAO': 'AUI'}, 'UH': {'Name': 'US Helicopter Corporation', 'ICAO': 'None'}, 'VF': {'Name': 'Valuair', 'ICAO': 'VLU'}, 'VN': {'Name': 'Vietnam Airlines', 'ICAO': 'HVN'}, 'NN': {'Name': 'VIM Airlines', 'ICAO': 'MOV'}, 'Y4': {'Name': 'Volaris', 'ICAO': 'VOI'}, 'VI': {'Name': 'Volga-Dnepr Airlines', 'ICAO': 'VDA'}, 'VX': {'Name': 'Virgin America', 'ICAO': 'VRD'}, 'TV': {'Name': 'Virgin Express', 'ICAO': 'VEX'}, 'VK': {'Name': 'Virgin Nigeria Airways', 'ICAO': 'VGN'}, 'VS': {'Name': 'Virgin Atlantic Airways', 'ICAO': 'VIR'}, 'ZG': {'Name': 'Viva Macau', 'ICAO': 'VVM'}, 'VE': {'Name': 'Volare Airlines', 'ICAO': 'VLE'}, 'XF': {'Name': 'Vladivostok Air', 'ICAO': 'VLK'}, 'LC': {'Name': 'Varig Log', 'ICAO': 'VLO'}, 'VA': {'Name': 'Virgin Australia', 'ICAO': 'VOZ'}, 'RG': {'Name': 'VRG Linhas Aereas', 'ICAO': 'VRN'}, 'VP': {'Name': 'VASP', 'ICAO': 'VSP'}, 'VG': {'Name': 'VLM Airlines', 'ICAO': 'VLM'}, '7W': {'Name': 'Wayraper', 'ICAO': 'None'}, 'WJ': {'Name': 'WebJet Linhas A', 'ICAO': 'WEB'}, '2W': {'Name': 'Welcome Air', 'ICAO': 'WLC'}, '8O': {'Name': 'West Coast Air', 'ICAO': 'None'}, 'WS': {'Name': 'WestJet', 'ICAO': 'WJA'}, 'WF': {'Name': 'Widerøe', 'ICAO': 'WIF'}, 'IV': {'Name': 'Wind Jet', 'ICAO': 'JET'}, 'IW': {'Name': 'Wings Air', 'ICAO': 'WON'}, 'W6': {'Name': 'Wizz Air', 'ICAO': 'WZZ'}, '8Z': {'Name': 'Wizz Air Hungary', 'ICAO': 'WVL'}, 'WO': {'Name': 'World Airways', 'ICAO': 'WOA'}, 'SE': {'Name': 'XL Airways France', 'ICAO': 'SEU'}, 'MF': {'Name': 'Xiamen Airlines', 'ICAO': 'CXA'}, 'YL': {'Name': 'Yamal Airlines', 'ICAO': 'LLM'}, 'IY': {'Name': 'Yemenia', 'ICAO': 'IYE'}, 'Z4': {'Name': 'Zoom Airlines', 'ICAO': 'OOM'}, '\\N': {'Name': 'Tyrolean Airways', 'ICAO': 'TYR'}, 'XW': {'Name': 'Sky Express', 'ICAO': 'SXR'}, 'VJ': {'Name': 'Royal Air Cambodge', 'ICAO': 'RAC'}, '6T': {'Name': 'Air Mandalay', 'ICAO': '\\N'}, 'BX': {'Name': 'Air Busan', 'ICAO': 'ABL'}, 'GH': {'Name': 'Globus', 'ICAO': 'GLP'}, '9Y': {'Name': 'Air Kazakhstan', 'ICAO': 'KZK'}, 'JD': {'Name': 'Japan Air System', 'ICAO': 'JAS'}, 'DS': {'Name': 'EasyJet (DS)', 'ICAO': '\\N'}, '2I': {'Name': 'Star Peru (2I)', 'ICAO': '\\N'}, 'KW': {'Name': 'Carnival Air Lines', 'ICAO': '\\N'}, '4H': {'Name': 'United Airways', 'ICAO': 'UBD'}, '5H': {'Name': 'Fly540', 'ICAO': 'FFV'}, 'TO': {'Name': 'Transavia France', 'ICAO': 'TVF'}, 'WP': {'Name': 'Island Air (WP)', 'ICAO': 'MKU'}, 'B7': {'Name': 'Uni Air', 'ICAO': 'UIA'}, 'YD': {'Name': 'Gomelavia', 'ICAO': '\\N'}, 'WZ': {'Name': 'Red Wings', 'ICAO': 'RWZ'}, '11': {'Name': 'TUIfly (X3)', 'ICAO': '\\N'}, 'FU': {'Name': 'Felix Airways', 'ICAO': 'FXX'}, 'K1': {'Name': 'Kostromskie avialinii', 'ICAO': 'KOQ'}, 'XX': {'Name': 'Greenfly', 'ICAO': 'GFY'}, '7J': {'Name': 'Tajik Air', 'ICAO': '\\N'}, 'TM': {'Name': 'Air Mozambique', 'ICAO': '\\N'}, '--': {'Name': 'ELK Airways', 'ICAO': 'ELK'}, 'GY': {'Name': 'Gabon Airlines', 'ICAO': 'GBK'}, 'ML': {'Name': 'Maldivo Airlines', 'ICAO': 'MAV'}, 'VH': {'Name': 'Virgin Pacific', 'ICAO': 'VNP'}, 'Z2': {'Name': 'Zest Air', 'ICAO': '\\N'}, 'HK': {'Name': 'Yangon Airways', 'ICAO': '\\N'}, 'ZE': {'Name': 'Eastar Jet', 'ICAO': 'ESR'}, 'LJ': {'Name': 'Jin Air', 'ICAO': 'JNA'}, '3O': {'Name': 'Air Arabia Maroc', 'ICAO': '\\N'}, 'B1': {'Name': 'Baltic Air lines', 'ICAO': 'BA1'}, 'YC': {'Name': 'Ciel Canadien', 'ICAO': 'YCC'}, 'CN': {'Name': 'Canadian National Airways', 'ICAO': 'YCP'}, 'FA': {'Name': 'Epic Holiday', 'ICAO': '4AA'}, '3I': {'Name': 'Air Comet Chile', 'ICAO': '\\N'}, 'L8': {'Name': 'Line Blue', 'ICAO': 'LBL'}, 'SZ': {'Name': 'Salzburg arrows', 'ICAO': '\\N'}, 'TQ': {'Name': 'Texas Wings', 'ICAO': 'TXW'}, 'DH': {'Name': 'Dennis Sky', 'ICAO': 'DSY'}, 'ZZ': {'Name': 'Zz', 'ICAO': '\\N'}, 'A1': {'Name': 'Atifly', 'ICAO': 'A1F'}, '99': {'Name': 'Ciao Air', 'ICAO': '\\N'}, '5P': {'Name': 'Pal airlines', 'ICAO': '\\N'}, 'C1': {'Name': 'CanXpress', 'ICAO': 'CA1'}, 'V5': {'Name': 'Danube Wings (V5)', 'ICAO': '\\N'}, 'SH': {'Name': 'Sharp Airlines', 'ICAO': 'SHA'}, 'C2': {'Name': 'CanXplorer', 'ICAO': 'CAP'}, 'QA': {'Name': 'Click (Mexicana)', 'ICAO': '\\N'}, 'W1': {'Name': 'World Experience Airline', 'ICAO': 'WE1'}, 'J4': {'Name': 'ALAK', 'ICAO': '\\N'}, '3E': {'Name': 'Air Choice One', 'ICAO': '\\N'}, 'KN': {'Name': 'China United', 'ICAO': '\\N'}, 'ZQ': {'Name': 'Locair', 'ICAO': 'LOC'}, '4Q': {'Name': 'Safi Airlines', 'ICAO': '\\N'}, 'K5': {'Name': 'SeaPort Airlines', 'ICAO': 'SQH'}, 'S6': {'Name': 'Salmon Air', 'ICAO': '\\N'}, '1': {'Name': 'Bobb Air Freight', 'ICAO': '\\N'}, 'V9': {'Name': 'Star1 Airlines', 'ICAO': 'HCW'}, '6D': {'Name': 'Pelita', 'ICAO': '\\N'}, 'J5': {'Name': 'Alaska Seaplane Service', 'ICAO': '\\N'}, 'I6': {'Name': 'MexicanaLink', 'ICAO': 'MXI'}, 'IP': {'Name': 'Island Spirit', 'ICAO': 'ISX'}, 'T0': {'Name': 'TACA Peru', 'ICAO': '\\N'}, '7Q': {'Name': 'Pan Am World Airways Dominicana', 'ICAO': '\\N'}, 'PF': {'Name': 'Primera Air', 'ICAO': '\\N'}, '3S': {'Name': 'Air Antilles Express', 'ICAO': '\\N'}, 'P7': {'Name': 'Regional Paraguaya', 'ICAO': 'REP'}, 'V6': {'Name': 'VIP Ecuador', 'ICAO': '\\N'}, 'P9': {'Name': 'Peruvian Airlines', 'ICAO': '\\N'}, 'ЯП': {'Name': 'Polar Airlines', 'ICAO': '\\N'}, 'OC': {'Name': 'Catovair', 'ICAO': '\\N'}, '7Z': {'Name': 'Halcyonair', 'ICAO': '\\N'}, '4P': {'Name': 'Business Aviation', 'ICAO': '\\N'}, 'E9': {'Name': "Compagnie Africaine d\\\\'Aviation", 'ICAO': '\\N'}, 'K8': {'Name': 'Zambia Skyways', 'ICAO': '\\N'}, 'UJ': {'Name': 'AlMasria Universal Airlines', 'ICAO': 'LMU'}, '6Y': {'Name': 'SmartLynx Airlines', 'ICAO': '\\N'}, 'K7': {'Name': 'KoralBlue Airlines', 'ICAO': 'KBR'}, 'E4': {'Name': 'Elysian Airlines', 'ICAO': 'GIE'}, 'HT': {'Name': 'Hellenic Imperial Airways', 'ICAO': 'IMP'}, 'WD': {'Name': 'Amsterdam Airlines', 'ICAO': 'AAN'}, 'Q9': {'Name': 'Arik Niger', 'ICAO': 'NAK'}, 'DA': {'Name': 'Dana Air', 'ICAO': '\\N'}, '8F': {'Name': 'STP Airways', 'ICAO': 'STP'}, '7Y': {'Name': 'Med Airways', 'ICAO': '\\N'}, 'UQ': {'Name': 'Skyjet Airlines', 'ICAO': 'SJU'}, 'G6': {'Name': 'Air Volga', 'ICAO': '\\N'}, 'RL': {'Name': 'Royal Falcon', 'ICAO': 'RFJ'}, '4L': {'Name': 'Euroline', 'ICAO': 'MJX'}, 'ZF': {'Name': 'Athens Airways', 'ICAO': '\\N'}, 'VQ': {'Name': 'Viking Hellas', 'ICAO': 'VKH'}, 'DZ': {'Name': 'Starline.kz', 'ICAO': '\\N'}, 'L7': {'Name': 'Lugansk Airlines', 'ICAO': '\\N'}, '6P': {'Name': 'Gryphon Airlines', 'ICAO': '\\N'}, 'GP': {'Name': 'Gadair European Airlines', 'ICAO': 'GDR'}, 'SM': {'Name': 'Spirit of Manila Airlines', 'ICAO': 'MNP'}, 'OQ': {'Name': 'Chongqing Airlines', 'ICAO': 'CQN'}, 'PN': {'Name': 'West Air China', 'ICAO': 'CHB'}, '1C': {'Name': 'OneChina', 'ICAO': '1CH'}, 'Y7': {'Name': 'NordStar Airlines', 'ICAO': '\\N'}, 'JR': {'Name': 'Joy Air', 'ICAO': 'JOY'}, 'CD': {'Name': 'Air India Regional', 'ICAO': '\\N'}, '9H': {'Name': 'MDLR Airlines', 'ICAO': '\\N'}, 'Q2': {'Name': 'Maldivian', 'ICAO': '\\N'}, 'XN': {'Name': 'Xpressair', 'ICAO': '\\N'}, 'VC': {'Name': 'Strategic Airlines', 'ICAO': '\\N'}, 'JH': {'Name': 'Fuji Dream Airlines', 'ICAO': '\\N'}, '5E': {'Name': 'SGA Airlines', 'ICAO': '\\N'}, 'F8': {'Name': 'Air2there', 'ICAO': '\\N'}, 'AO': {'Name': 'Avianova (Russia)', 'ICAO': '\\N'}, 'PA': {'Name': 'Parmiss Airlines (IPV)', 'ICAO': 'IPV'}, 'ES': {'Name': 'EuropeSky', 'ICAO': 'EUV'}, 'GB': {'Name': 'BRAZIL AIR', 'ICAO': 'BZE'}, 'MR': {'Name': 'Homer Air', 'ICAO': 'OME'}, '-+': {'Name': 'U.S. Air', 'ICAO': '--+'}, "\\\\'": {'Name': 'Jayrow', 'ICAO': "\\\\'\\\\"}, ';;': {'Name': 'Wilderness Air', 'ICAO': '\\N'}, '^^': {'Name': 'Whitaker Air', 'ICAO': '\\N'}, 'WQ': {'Name': 'PanAm World Airways', 'ICAO': 'PQW'}, 'YY': {'Name': 'Virginwings', 'ICAO': 'VWA'}, 'KY': {'Name': 'KSY', 'ICAO': 'KSY'}, 'BQ': {'Name': 'Buquebus Líneas Aéreas', 'ICAO': 'BQB'}, 'CQ': {'Name': 'SOCHI AIR', 'ICAO': 'KOL'}, 'WU': {'Name': 'Wizz Air Ukraine', 'ICAO': 'WAU'}, '47': {'Name': '88', 'ICAO': 'VVN'}, 'LQ': {'Name': 'LCM AIRLINES', 'ICAO': 'LMM'}, 'K6': {'Name': 'Cambodia Angkor Air (K6)', 'ICAO': '\\N'}, '69': {'Name': 'Royal European Airlines', 'ICAO': '\\N'}, '&T': {'Name': "Tom\\\\'s & co airliners", 'ICAO': 'T&O'}, 'AD': {'Name': 'Azul', 'ICAO': 'AZU'}, 'PQ': {'Name': 'LSM Airlines', 'ICAO': 'LOO'}, 'C4': {'Name': 'LionXpress', 'ICAO': 'LIX'}, 'GK': {'Name': 'Genesis', 'ICAO': '\\N'}, 'XZ': {'Name': 'Congo Express', 'ICAO': '\\N'}, 'FZ': {'Name': 'Fly Dubai', 'ICAO': 'FDB'}, 'D1': {'Name': 'Domenican Airlines', 'ICAO': 'MDO'}, 'JY': {'Name': 'Aereonautica militare', 'ICAO': 'AXZ'}, 'YZ': {'Name': 'LSM AIRLINES ', 'ICAO': 'YZZ'}, 'UR': {'Name': 'UTair-Express', 'ICAO': '\\N'}, 'G5': {'Name': 'Huaxia', 'ICAO': '\\N'}, 'ZP': {'Name': 'Zabaykalskii Airlines', 'ICAO': 'ZZZ'}, 'M4': {'Name': 'Marysya Airlines', 'ICAO': '1QA'}, 'N1': {'Name': 'N1', 'ICAO': '\\N'}, '4Z': {'Name': 'Airlink (SAA)', 'ICAO': '\\N'}, '3B': {'Name': 'JobAir', 'ICAO': '\\N'}, 'BZ': {'Name': 'Black Stallion Airways', 'ICAO': 'BSA'}, 'GM': {'Name': 'German International Air Lines', 'ICAO': 'GER'}, 'TB': {'Name': 'TrasBrasil', 'ICAO': 'TBZ'}, 'TH': {'Name': 'TransBrasil Airlines', 'ICAO': 'THS'}, '9C': {'Name': 'China SSS', 'ICAO': '\\N'}, 'P8': {'Name': 'Air Mekong', 'ICAO': 'MKG'}, 'H3': {'Name': 'Harbour Air (Priv)', 'ICAO': '\\N'}, 'HH': {'Name': 'Air Hamburg (AHO)', 'ICAO': 'AHO'}, 'Z6': {'Name': 'ZABAIKAL AIRLINES', 'ICAO': 'ZTT'}, 'TI': {'Name': 'TransHolding', 'ICAO': 'THI'}, 'YT': {'Name': 'Yeti Airways', 'ICAO': '\\N'}, 'Y1': {'Name': 'Yellowstone Club Private Shuttle', 'ICAO': '\\N'}, 'NS': {'Name': 'Caucasus Airlines', 'ICAO': '\\N'}, 'S1': {'Name': 'Serbian Airlines', 'ICAO': 'SA1'}, 'WM': {'Name': 'Windward Islands Airways', 'ICAO': '\\N'}, 'YO': {'Name': 'TransHolding System', 'ICAO': 'TYS'}, 'CB': {'Name': 'CCML Airlines', 'ICAO': 'CCC'}, 'F1': {'Name': 'Fly Brasil', 'ICAO': 'FBL'}, '1F': {'Name': 'CB Airways UK ( Interliging Flights )', 'ICAO': 'CIF'}, '3F': {'Name': 'Fly Colombia ( Interliging Flights )', 'ICAO': '3FF'}, 'T6': {'Name': 'Trans Pas Air', 'ICAO': 'TP6'}, 'МИ': {'Name': 'KMV', 'ICAO': '\\N'}, 'HC': {'Name': 'Himalayan Airlines', 'ICAO': 'HYM'}, 'G1': {'Name': 'Indya Airline Group', 'ICAO': 'IG1'}, 'WG': {'Name': 'Sunwing', 'ICAO': '\\N'}, 'ZX': {'Name': 'Japan Regio', 'ICAO': 'ZXY'}, 'N0': {'Name': 'Norte Lineas Aereas', 'ICAO': '\\N'}, 'W7': {'Name': 'Austral Brasil', 'ICAO': '\\N'}, 'H9': {'Name': 'PEGASUS AIRLINES-', 'ICAO': '\\N'}, 'QC': {'Name': 'Camair-co', 'ICAO': '\\N'}, 'RS': {'Name': 'Sky Regional', 'ICAO': 'SKV'}, 'II': {'Name': 'LSM International ', 'ICAO': 'UWW'}, 'BU': {'Name': 'Baikotovitchestrian Airlines ', 'ICAO': 'BUU'}, 'L4': {'Name': 'Luchsh Airlines ', 'ICAO': 'LJJ'}, '6U': {'Name': 'Air Cargo Germany', 'ICAO': '\\N'}, '7M': {'Name': 'Mongolian International Air Lines ', 'ICAO': 'ZTF'}, 'TW': {'Name': 'Tway Airlines', 'ICAO': 'TWB'}, 'HI': {'Name': 'Papillon Grand Canyon Helicopters', 'ICAO': '\\N'}, 'JX': {'Name': 'Jusur airways', 'ICAO': 'JSR'}, 'XB': {'Name': 'NEXT Brasil', 'ICAO': 'NXB'}, 'W4': {'Name': 'AeroWorld ', 'ICAO': 'WER'}, 'GN': {'Name': 'GNB Linhas Aereas', 'ICAO': '\\N'}, 'E1': {'Name': 'Usa Sky Cargo', 'ICAO': 'ES2'}, 'HN': {'Name': 'Hankook Airline', 'ICAO': 'HNX'}, 'Z7': {'Name': 'REDjet', 'ICAO': '\\N'}, 'PT': {'Name': 'Red Jet Andes', 'ICAO': '\\N'}, 'QY': {'Name': 'Red Jet Canada', 'ICAO': '\\N'}, '4X': {'Name': 'Red Jet Mexico', 'ICAO': '\\N'}, 'Y8': {'Name': 'Marusya Airways', 'ICAO': 'MRS'}, '7H': {'Name': 'Era Alaska', 'ICAO': 'ERR'}, 'R8': {'Name': 'AirRussia', 'ICAO': 'RRJ'}, 'H1': {'Name': 'Hankook Air US', 'ICAO': 'HA1'}, 'H5': {'Name': 'I-Fly', 'ICAO': 'RSY'}, 'KT': {'Name': 'VickJet', 'ICAO': 'VKJ'}, 'XV': {'Name': 'BVI Airways', 'ICAO': '\\N'}, 'SO': {'Name': "Salsa d\\\\'Haiti", 'ICAO': 'SLC'}, 'ZJ': {'Name': 'Zambezi Airlines (ZMA)', 'ICAO': '\\N'}, 'YQ': {'Name': 'Polet Airlines (Priv)', 'ICAO': '\\N'}, '12': {'Name': '12 North', 'ICAO': 'N12'}, 'L6': {'Name': 'Mauritania Airlines International', 'ICAO': 'MAI'}, '6F': {'Name': 'MAT Airways', 'ICAO': 'MKD'}, 'AW': {'Name': 'Asian Wings Airways', 'ICAO': 'AWM'}, 'E5': {'Name': 'Air Arabia Egypt', 'ICAO': 'RBG'}, 'CT': {'Name': 'Alitalia Cityliner', 'ICAO': '\\N'}, 'OI': {'Name': 'Orchid Airlines', 'ICAO': 'ORC'}, 'Y5': {'Name': 'Asia Wings', 'ICAO': 'AWA'}, 'XR': {'Name': 'Skywest Australia', 'ICAO': '\\N'}, 'NP': {'Name': 'Nile Air', 'ICAO': 'NIA'}, 'DN': {'Name': 'Senegal Airlines', 'ICAO': 'SGG'}, '6I': {'Name': 'Fly 6ix', 'ICAO': '\\N'}, 'S9': {'Name': 'Starbow Airlines', 'ICAO': '\\N'}, '0X': {'Name': 'Copenhagen Express', 'ICAO': 'CX0'}, '8B': {'Name': 'BusinessAir', 'ICAO': 'BCC'}, 'YR': {'Name': 'SENIC AIRLINES', 'ICAO': '\\N'}, 'C7': {'Name': 'Sky Wing Pacific', 'ICAO': 'CR7'}, 'PP': {'Name': 'Air Indus', 'ICAO': 'AI0'}, 'MM': {'Name': 'Peach Aviation', 'ICAO': '\\N'}, 'U1': {'Name': 'Aviabus', 'ICAO': 'ABI'}, 'DF': {'Name': 'Michael Airlines', 'ICAO': 'MJG'}, 'ZC': {'Name': 'Korongo Airlines', 'ICAO': 'KGO'}, 'I5': {'Name': 'Indonesia Sky', 'ICAO': 'IDS'}, 'B0': {'Name': 'Aws express', 'ICAO': '666'}, '76': {'Name': 'Southjet', 'ICAO': 'SJS'}, '77': {'Name': 'Southjet connect', 'ICAO': 'ZCS'}, '78': {'Name': 'Southjet cargo', 'ICAO': 'XAN'}, 'I2': {'Name': 'Iberia Express', 'ICAO': 'IBS'}, '4O': {'Name': 'Interjet (ABC Aerolineas)', 'ICAO': '\\N'}, 'OG': {'Name': 'AirOnix', 'ICAO': '\\N'}, 'NJ': {'Name': 'Nordic Global Airlines', 'ICAO': 'NGB'}, 'TZ': {'Name': 'Scoot', 'ICAO': 'SCO'}, '5K': {'Name': 'Hi Fly (5K)', 'ICAO': '\\N'}, 'WH': {'Name': 'China Northwest Airlines (WH)', 'ICAO': '\\N'}, 'ZN': {'Name': 'Zenith International Airline', 'ICAO': 'ZNA'}, 'O1': {'Name': 'Orbit Airlines Azerbaijan', 'ICAO': 'OAB'}, 'A6': {'Name': 'Air Alps Aviation (A6)', 'ICAO': '\\N'}, 'P4': {'Name': 'Patriot Airways', 'ICAO': '\\N'}, 'V2': {'Name': 'Vision Airlines (V2)', 'ICAO': 'RBY'}, '5Q': {'Name': 'BQB Lineas Aereas', 'ICAO': '\\N'}, 'YE': {'Name': 'Yellowtail', 'ICAO': 'YEL'}, 'KG': {'Name': 'Royal Airways', 'ICAO': 'RAW'}, 'FH': {'Name': 'FlyHigh Airlines Ireland (FH)', 'ICAO': 'FHI'}, '2D': {'Name': 'Aero VIP (2D)', 'ICAO': '\\N'}, 'YH': {'Name': 'Yangon Airways Ltd.', 'ICAO': '\\N'}, 'TJ': {'Name': 'T.J. Air', 'ICAO': 'TJA'}, 'SX': {'Name': 'SkyWork Airlines ', 'ICAO': '\\N'}, 'W2': {'Name': 'Maastricht Airlines', 'ICAO': '\\N'}, '24': {'Name': 'Euro Jet', 'ICAO': '\\N'}, 'Q3': {'Name': 'SOCHI AIR CHATER', 'ICAO': 'QER'}, 'J7': {'Name': 'Denim Air ', 'ICAO': '\\N'}, 'OD': {'Name': 'Malindo Air', 'ICAO': 'MXD'}, 'Z9': {'Name': 'Flightlink Tanzania', 'ICAO': '\\N'}, 'I8': {'Name': 'IzAvia', 'ICAO': '\\N'}, 'M1': {'Name': 'Maryland Air', 'ICAO': 'M1F'}, '7I': {'Name': 'Insel Air (7I/INC) (Priv)', 'ICAO': '\\N'}, '5Z': {'Name': 'VivaColombia', 'ICAO': 'VVC'}, 'ZM': {'Name': 'Apache Air', 'ICAO': 'IWA'}, 'M2': {'Name': 'MHS Aviation GmbH', 'ICAO': '\\N'}, 'NR': {'Name': 'Jettor Airlines', 'ICAO': 'JTO'}, 'SL': {'Name': 'Thai Lion Air', 'ICAO': '\\N'}, 'N8': {'Name': 'National Air Cargo', 'ICAO': 'NCR'}, '13': {'Name': 'Eastern Atlantic Virtual Airlines', 'ICAO': 'EAV'}, 'QG': {'Name': 'Citilink Indonesia', 'ICAO': '\\N'}, 'S8': {'Name': 'Snowbird Airlines', 'ICAO': 'SBD'}, 'KH': {'Name': 'Kharkiv Airlines', 'ICAO': 'KHK'}, 'XA': {'Name': 'XAIR USA', 'ICAO': 'XAU'}, 'LB': {'Name': 'Air Costa', 'ICAO': '\\N'}, 'XP': {'Name': 'XPTO', 'ICAO': 'XPT'}, '3W': {'Name': 'Malawian Airlines', 'ICAO': '\\N'}, '..': {'Name': 'Avilu', 'ICAO': '...'}, 'JU': {'Name': 'Air Serbia', 'ICAO': 'ASL'}, 'LT': {'Name': 'Air Lituanica', 'ICAO': 'LTU'}, 'RN': {'Name': 'Rainbow Air (RAI)', 'ICAO': 'RAB'}, 'RY': {'Name': 'Rainbow Air Canada', 'ICAO': 'RAY'}, 'RX': {'Name': 'Rainbow Air Polynesia', 'ICAO': 'RPO'}, 'RU': {'Name': 'Rainbow Air Euro', 'ICAO': 'RUE'}, 'RM': {'Name': 'Rainbow Air US', 'ICAO': 'RNY'}, 'QD': {'Name': 'Dobrolet', 'ICAO': 'DOB'}, 'S0': {'Name': 'Spike Airlines', 'ICAO': 'SAL'}, 'L1': {'Name': 'All Argentina', 'ICAO': 'AL1'}, 'A2': {'Name': 'All America', 'ICAO': 'AL2'}, 'L9': {'Name': 'All Asia', 'ICAO': 'AL3'}, '9A': {'Name': 'All Africa', 'ICAO': '99F'}, 'N4': {'Name': 'Regionalia México', 'ICAO': 'J88'}, 'N9': {'Name': 'All Europe', 'ICAO': 'N99'}, 'N7': {'Name': 'All Spain', 'ICAO': 'N77'}, '9N': {'Name': 'Regional Air Iceland', 'ICAO': 'N78'}, '8K': {'Name': 'Voestar', 'ICAO': 'K88'}, '7O': {'Name': 'All Colombia', 'ICAO': '7KK'}, '2X': {'Name': 'Regionalia Uruguay', 'ICAO': '2K2'}, '9X': {'Name': 'Regionalia Venezuela', 'ICAO': '9XX'}, '9J': {'Name': 'Regionalia Chile', 'ICAO': 'CR1'}, '6C': {'Name': 'Vuela Cuba', 'ICAO': '6CC'}, '88': {'Name': 'All Australia', 'ICAO': '8K8'}, 'ER': {'Name': 'Fly Europa', 'ICAO': 'RWW'}, 'PO': {'Name': 'FlyPortugal', 'ICAO': 'FPT'}, 'IJ': {'Name': 'Spring Airlines Japan', 'ICAO': 'SJO'}, 'KP': {'Name': 'Dense Airways', 'ICAO': 'DWA'}, 'KZ': {'Name': 'Dense Connection', 'ICAO': 'DC2'}, '4S': {'Name': 'Vuola Italia', 'ICAO': 'VI4'}, '1X': {'Name': 'Island Express Air', 'ICAO': '\\N'}, 'Z0': {'Name': 'All Argentina Express', 'ICAO': 'Z9H'}, 'WE': {'Name': 'Thai Smile Airways', 'ICAO': '\\N'}, 'I4': {'Name': 'International AirLink', 'ICAO': '\\N'}, 'RT': {'Name': 'Real Tonga', 'ICAO': '\\N'}, '2R': {'Name': 'All America AR', 'ICAO': 'M7A'}, '1R': {'Name': 'All America CL', 'ICAO': 'R1R'}, 'Q4': {'Name': 'SOCHI AIR EXPRESS', 'ICAO': 'SAE'}, '1Y': {'Name': 'All America BR', 'ICAO': 'A9B'}, '9V': {'Name': 'Volotea Costa Rica', 'ICAO': 'VC9'}, 'X5': {'Name': 'Fly Romania', 'ICAO': 'OTJ'}, 'E2': {'Name': 'Eagle Atlantic Airlines', 'ICAO': '\\N'}, '0Y': {'Name': 'All America CO', 'ICAO': '7ZC'}, '0M': {'Name': 'All America MX', 'ICAO': '0MM'}, 'FX': {'Name': 'FOX Linhas Aereas', 'ICAO': 'FOX'}, 'QP': {'Name': 'Air Kenya (Priv)', 'ICAO': '\\N'}, '6V': {'Name': 'Via Conectia Airlines', 'ICAO': 'CZV'}, 'E8': {'Name': 'City Airways', 'ICAO': 'GTA'}, 'DU': {'Name': 'Norwegian Long Haul AS', 'ICAO': 'NLH'}, 'M8': {'Name': 'TransNusa Air', 'ICAO': 'TNU'}, 'ZT': {'Name': 'Tomp Airlines', 'ICAO': 'T9P'}, 'J1': {'Name': 'OneJet', 'ICAO': '\\N'}, '0G': {'Name': 'Global Airlines', 'ICAO': 'GA0'}, 'UK': {'Name': 'Air Vistara', 'ICAO': 'VTI'}, '1E': {'Name': 'TransRussiaAirlines', 'ICAO': 'RGG'}, 'D2': {'Name': 'Severstal Air Company', 'ICAO': '\\N'}, 'RR': {'Name': 'REXAIR VIRTUEL', 'ICAO': 'RXR'}, 'WR': {'Name': 'WestJet Encore', 'ICAO': 'WEN'}, 'OP': {'Name': 'Air Pegasus', 'ICAO': 'PPL'}, '9I': {'Name': 'International Europe', 'ICAO': 'INE'}, 'ZV': {'Name': 'V Air', 'ICAO': 'VAX'}, '4B': {'Name': 'Boutique Air (Priv)', 'ICAO': 'BTQ'}, 'V7': {'Name': 'VOLOTEA Airways', 'ICAO': 'VOE'}, 'Z5': {'Name': 'INAVIA Internacional', 'ICAO': 'IIR'}, 'LE': {'Name': 'Liberty Airways', 'ICAO': 'LTY'}, 'АЯ': {'Name': 'Аэросервис', 'ICAO': '\\N'}, '5B': {'Name': 'Bassaka airlines', 'ICAO': 'BSX'}, 'Q7': {'Name': 'SkyBahamas Airlines', 'ICAO': '\\N'}, 'UW': {'Name': 'UVT Aero', 'ICAO': '\\N'}, '3M': {'Name': 'Silver Airways (3M)', 'ICAO': '\\N'}, 'I3': {'Name': 'ATA Airlines (Iran)', 'ICAO': '\\N'}, 'V1': {'Name': 'VIA Líneas Aéreas', 'ICAO': 'VIA'}, 'GX': {'Name': 'GermanXL', 'ICAO': 'GXG'}, 'FF': {'Name': 'Fly France', 'ICAO': 'FRF'}, 'EX': {'Name': 'Europe Jet', 'ICAO': 'EU9'}, 'W3': {'Name': 'World Scale Airlines', 'ICAO': 'WSS'}, 'AG': {'Name': 'All America US', 'ICAO': 'SSA'}, '1K': {'Name': 'BudgetAir', 'ICAO': 'BG1'}, 'F5': {'Name': 'Fly One', 'ICAO': 'FI5'}, 'EE': {'Name': 'Nordica', 'ICAO': '\\N'}, '0P': {'Name': 'All America BOPY', 'ICAO': 'PYB'}, 'JG': {'Name': 'Jetgo Australia', 'ICAO': '\\N'}, '2S': {'Name': 'Air Carnival', 'ICAO': '\\N'}, '7R': {'Name': 'Svyaz Rossiya', 'ICAO': 'SJM'}}
-
-routes = {'Departures': {'ACK': {'9K': ['CNA']}, 'ALB': {'9K': ['CNA']}, 'AUG': {'9K': ['CNA']}, 'BHB': {'9K': ['CNA']}, 'HYA': {'9K': ['CNA']}, 'LEB': {'9K': ['CNA']}, 'MVY': {'9K': ['CNA']}, 'PVC': {'9K': ['CNA']}, 'RKD': {'9K': ['CNA']}, 'RUT': {'9K': ['CNA']}, 'SLK': {'9K': ['CNA']}, 'BUF': {'AA': ['CRJ'], 'B6': ['E90'], 'US': ['CRJ']}, 'CLT': {'AA': ['319', '321', '320', 'E90'], 'B6': ['E90'], 'US': ['319', '321', '320', 'E90']}, 'CUN': {'AA': ['319'], 'AM': ['757'], 'B6': ['320'], 'DL': ['757'], 'US': ['319']}, 'DCA': {'AA': ['319', 'E90'], 'B6': ['320', 'E90'], 'US': ['319', 'E90']}, 'DFW': {'AA': ['738', '757'], 'B6': ['E90'], 'NK': ['319'], 'US': ['738', '757']}, 'JFK': {'AA': ['738'], 'B6': ['320', 'E90'], 'DL': ['752', 'CR7', 'M88'], 'US': ['738']}, 'LAX': {'AA': ['738', '757'], 'AS': ['738', '757'], 'B6': ['320'], 'DL': ['73H'], 'UA': ['752'], 'US': ['738', '757'], 'VX': ['319', '320']}, 'LGA': {'AA': ['E90', '319'], 'DL': ['E75'], 'US': ['E90', '319']}, 'LHR': {'AA': ['777', '744'], 'AF': ['764'], 'AY': ['777', '744'], 'BA': ['777', '744'], 'DL': ['764'], 'IB': ['777', '744'], 'KL': ['767'], 'UN': ['333'], 'VS': ['764', '333']}, 'MAD': {'AA': ['330'], 'AY': ['333'], 'BA': ['333'], 'IB': ['333']}, 'MDT': {'AA': ['DH3'], 'US': ['DH8']}, 'MIA': {'AA': ['757', '738'], 'US': ['757', '738']}, 'NRT': {'AA': ['787'], 'JL': ['788']}, 'ORD': {'AA': ['738'], 'B6': ['320', 'E90'], 'NK': ['319'], 'UA': ['739', '752', '738', '73G', '319', '320', '753'], 'US': ['738']}, 'PDX': {'AA': ['737'], 'AS': ['73H'], 'B6': ['320']}, 'PHL': {'AA': ['E90', '319', '321', '320'], 'B6': ['E90'], 'US': ['E90', '319', '321', '320']}, 'PHX': {'AA': ['320', '319', '321'], 'B6': ['320'], 'US': ['320', '319', '321']}, 'PIT': {'AA': ['E70', 'CRJ'], 'B6': ['E90'], 'US': ['E70', 'CRJ']}, 'RIC': {'AA': ['CRJ'], 'B6': ['E90'], 'DL': ['CR9', 'CR7'], 'US': ['CRJ']}, 'ROC': {'AA': ['CRJ'], 'US': ['CRJ']}, 'SAN': {'AA': ['737'], 'AS': ['73H'], 'B6': ['320']}, 'SEA': {'AA': ['737'], 'AS': ['73J', '73H'], 'B6': ['320']}, 'SYR': {'AA': ['DH3'], 'US': ['DH8']}, 'YHZ': {'AC': ['CRJ'], 'UA': ['CRJ']}, 'YOW': {'AC': ['DH1'], 'UA': ['DH1']}, 'YUL': {'AC': ['CRJ', 'DH3'], 'UA': ['CRJ', 'DH3']}, 'YYZ': {'AC': ['E90', 'E75'], 'UA': ['E90', 'E75']}, 'ATL': {'AF': ['757', 'M90', 'M88'], 'AM': ['757', 'M90', 'M88', '320'], 'DL': ['M90', '757', 'M88', '320', '319'], 'FL': ['717'], 'KL': ['757', 'M90', 'M88'], 'VS': ['M90', '757', 'M88', '320', '319'], 'WN': ['73W']}, 'CDG': {'AF': ['744'], 'AZ': ['744'], 'DL': ['752']}, 'ISP': {'AS': ['SF3'], 'KS': ['SF3']}, 'PBG': {'AS': ['SF3'], 'KS': ['SF3']}, 'PQI': {'AS': ['SF3'], 'KS': ['SF3']}, 'FCO': {'AZ': ['330', '332'], 'DL': ['330', '332']}, 'AUA': {'B6': ['320']}, 'AUS': {'B6': ['E90']}, 'BWI': {'B6': ['E90'], 'FL': ['73W'], 'WN': ['73W', '73C', '733']}, 'CHS': {'B6': ['E90'], 'DL': ['CR9']}, 'DEN': {'B6': ['320'], 'UA': ['739', '320', '738'], 'WN': ['73W']}, 'DTW': {'B6': ['E90'], 'DL': ['319', '320', '73H', '738', '757', 'M88']}, 'DXB': {'B6': ['77L'], 'EK': ['77L']}, 'EWR': {'B6': ['E90'], 'UA': ['73G', '738', '319', '320', '739', '753', '752']}, 'FLL': {'B6': ['320', 'E90'], 'NK': ['319']}, 'HOU': {'B6': ['E90'], 'WN': ['73W']}, 'IAD': {'B6': ['E90'], 'UA': ['320', '319', '739', '738', '752', '73G']}, 'JAX': {'B6': ['E90'], 'DL': ['CR9']}, 'LAS': {'B6': ['320'], 'DL': ['73H']}, 'LGB': {'B6': ['320']}, 'MCO': {'B6': ['320', 'E90'], 'DL': ['320'], 'FL': ['717'], 'WN': ['73W']}, 'MSY': {'B6': ['E90'], 'JL': ['E90']}, 'NAS': {'B6': ['E90'], 'DL': ['E75']}, 'PBI': {'B6': ['320', 'E90']}, 'PLS': {'B6': ['320'], 'DL': ['320']}, 'PUJ': {'B6': ['320']}, 'RDU': {'B6': ['E90'], 'DL': ['CR7']}, 'RSW': {'B6': ['320']}, 'SAV': {'B6': ['E90']}, 'SDQ': {'B6': ['320']}, 'SFO': {'B6': ['320'], 'UA': ['752', '753', '739', '738', '73G'], 'VX': ['320']}, 'SJC': {'B6': ['320']}, 'SJU': {'B6': ['320']}, 'STI': {'B6': ['320']}, 'STT': {'B6': ['320']}, 'SXM': {'B6': ['320']}, 'TPA': {'B6': ['320']}, 'PTY': {'CM': ['73G'], 'UA': ['73G']}, 'AMS': {'DL': ['333'], 'KL': ['330']}, 'BDA': {'DL': ['738']}, 'CMH': {'DL': ['ERJ']}, 'CVG': {'DL': ['73H']}, 'IND': {'DL': ['E75']}, 'MSP': {'DL': ['738', '319', '757', 'M90', '320'], 'SY': ['738', '73G']}, 'MYR': {'DL': ['E75'], 'NK': ['320', '319']}, 'SLC': {'DL': ['73H', '738']}, 'DUB': {'EI': ['332', '330'], 'UA': ['332', '330']}, 'SNN': {'EI': ['757']}, 'KEF': {'FI': ['75W']}, 'CAK': {'FL': ['717'], 'WN': ['717']}, 'MDW': {'FL': ['73W'], 'WN': ['73W', '733']}, 'FRA': {'LH': ['744', '346'], 'UA': ['744', '346']}, 'MUC': {'LH': ['333'], 'UA': ['333']}, 'ZRH': {'LX': ['333'], 'UA': ['333']}, 'ACY': {'NK': ['319']}, 'YTZ': {'PD': ['DH4']}, 'LIS': {'S4': ['313'], 'TP': ['313']}, 'PDL': {'S4': ['313'], 'TP': ['313']}, 'CLE': {'UA': ['738']}, 'IAH': {'UA': ['739', '738', '320', '73G', '319']}, 'RAI': {'VR': ['752']}, 'BNA': {'WN': ['73W', '73C']}, 'MCI': {'WN': ['73W']}, 'MKE': {'WN': ['73W']}, 'STL': {'WN': ['73W']}}, 'Arrivals': {'ACK': {'9K': ['CNA']}, 'ALB': {'9K': ['CNA']}, 'AUG': {'9K': ['CNA']}, 'BHB': {'9K': ['CNA']}, 'HYA': {'9K': ['CNA']}, 'LEB': {'9K': ['CNA']}, 'MVY': {'9K': ['CNA']}, 'PVC': {'9K': ['CNA']}, 'RKD': {'9K': ['CNA']}, 'RUT': {'9K': ['CNA']}, 'SLK': {'9K': ['CNA']}, 'BUF': {'AA': ['CRJ'], 'B6': ['E90'], 'US': ['CRJ']}, 'CLT': {'AA': ['321', '319', '320'], 'B6': ['E90'], 'US': ['321', '319', '320']}, 'CUN': {'AA': ['319'], 'AM': ['757'], 'B6': ['320'], 'DL': ['757'], 'US': ['319']}, 'DCA': {'AA': ['319', 'E90'], 'B6': ['E90', '320'], 'US': ['319', 'E90']}, 'DFW': {'AA': ['738', '757'], 'B6': ['E90'], 'NK': ['319'], 'US': ['738', '757']}, 'JFK': {'AA': ['738'], 'B6': ['E90', '320'], 'DL': ['CR9', '752', 'CR7'], 'US': ['738']}, 'LAX': {'AA': ['757', '738'], 'AS': ['757', '738'], 'B6': ['320'], 'DL': ['73H'], 'UA': ['752', '753', '320', '739'], 'US': ['757', '738'], 'VX': ['320', '319']}, 'LGA': {'AA': ['319', 'E90'], 'DL': ['E75'], 'US': ['319', 'E90']}, 'LHR': {'AA': ['744', '777'], 'AF': ['764'], 'AY': ['744', '777'], 'BA': ['744', '777'], 'DL': ['764'], 'IB': ['744', '777'], 'KL': ['767'], 'UN': ['333'], 'VS': ['333', '764']}, 'MAD': {'AA': ['330'], 'AY': ['333'], 'BA': ['333'], 'IB': ['333']}, 'MDT': {'AA': ['DH3'], 'US': ['DH8']}, 'MIA': {'AA': ['757', '738'], 'US': ['757', '738']}, 'NRT': {'AA': ['787'], 'JL': ['788']}, 'ORD': {'AA': ['738'], 'B6': ['320', 'E90'], 'NK': ['319'], 'UA': ['320', '752', '739', '738', '73G', '319'], 'US': ['738']}, 'PDX': {'AA': ['737'], 'AS': ['73H'], 'B6': ['320']}, 'PHL': {'AA': ['E90', '319', '321', '320'], 'B6': ['E90'], 'US': ['E90', '319', '321', '320']}, 'PHX': {'AA': ['320', '319'], 'B6': ['320'], 'US': ['320', '319']}, 'PIT': {'AA': ['E70', 'CRJ'], 'B6': ['E90'], 'US': ['E70', 'CRJ']}, 'RIC': {'AA': ['CRJ'], 'B6': ['E90'], 'DL': ['CR9', 'CR7'], 'US': ['CRJ']}, 'ROC': {'AA': ['CRJ'], 'US': ['CRJ']}, 'SAN': {'AA': ['737'], 'AS': ['73H'], 'B6': ['320']}, 'SEA': {'AA': ['737'], 'AS': ['73H', '73J'], 'B6': ['320']}, 'SYR': {'AA': ['DH3'], 'US': ['DH8']}, 'YHZ': {'AC': ['CRJ'], 'UA': ['CRJ']}, 'YOW': {'AC': ['DH1'], 'UA': ['DH1']}, 'YUL': {'AC': ['CRJ', 'DH3'], 'UA': ['CRJ', 'DH3']}, 'YYZ': {'AC': ['E90', 'E75'], 'UA': ['E90', 'E75']}, 'ATL': {'AF': ['M90', '757', '320', '738', '319'], 'AM': ['M90', '757', '738', 'M88', '320', '319'], 'AZ': ['M90', '757', '319'], 'DL': ['M90', '757', '320', '738', 'M88', '', '319'], 'FL': ['717'], 'KL': ['757', '320', '319'], 'VS': ['M90', '757', '320', '738', 'M88', '319'], 'WN': ['73W']}, 'CDG': {'AF': ['744'], 'AZ': ['744'], 'DL': ['752']}, 'ISP': {'AS': ['SF3'], 'KS': ['SF3']}, 'PBG': {'AS': ['SF3'], 'KS': ['SF3']}, 'PQI': {'AS': ['SF3'], 'KS': ['SF3']}, 'FCO': {'AZ': ['330', '332'], 'DL': ['330', '332']}, 'AUA': {'B6': ['320']}, 'AUS': {'B6': ['E90']}, 'BWI': {'B6': ['E90'], 'FL': ['73W', '73C', '733'], 'WN': ['73W', '73C', '733']}, 'CHS': {'B6': ['E90'], 'DL': ['CR9']}, 'DEN': {'B6': ['320'], 'UA': ['739', '752', '738', '320'], 'WN': ['73W']}, 'DTW': {'B6': ['E90'], 'DL': ['73H', '738', '320', '757', 'M90', '319']}, 'DXB': {'B6': ['77L'], 'EK': ['77L']}, 'EWR': {'B6': ['E90'], 'UA': ['738', '73G', '320', '319', '739']}, 'FLL': {'B6': ['320', 'E90'], 'NK': ['319']}, 'HOU': {'B6': ['E90'], 'WN': ['73W']}, 'IAD': {'B6': ['E90'], 'UA': ['320', '752', '73G', '739', '738']}, 'JAX': {'B6': ['E90'], 'DL': ['CR9']}, 'LAS': {'B6': ['320'], 'DL': ['73H']}, 'LGB': {'B6': ['320']}, 'MCO': {'B6': ['320', 'E90'], 'DL': ['320', 'M88'], 'FL': ['717'], 'WN': ['73W']}, 'MSY': {'B6': ['E90']}, 'NAS': {'B6': ['E90'], 'DL': ['E75']}, 'PBI': {'B6': ['320', 'E90']}, 'PLS': {'B6': ['320'], 'DL': ['320']}, 'PUJ': {'B6': ['320']}, 'RDU': {'B6': ['E90'], 'DL': ['CR9', 'CR7']}, 'RSW': {'B6': ['320']}, 'SAV': {'B6': ['E90']}, 'SDQ': {'B6': ['320']}, 'SFO': {'B6': ['320'], 'UA': ['752', '753', '738', '739', '319', '320'], 'VX': ['320']}, 'SJC': {'B6': ['320']}, 'SJU': {'B6': ['320']}, 'STI': {'B6': ['320']}, 'SXM': {'B6': ['320']}, 'TPA': {'B6': ['320']}, 'PTY': {'CM': ['73G'], 'UA': ['73G']}, 'AMS': {'DL': ['333'], 'KL': ['330']}, 'BDA': {'DL': ['738']}, 'CMH': {'DL': ['ERJ']}, 'CVG': {'DL': ['320']}, 'IND': {'DL': ['E75']}, 'MSP': {'DL': ['757', '738', '73H', '320', '319', 'M88'], 'SY': ['738', '73G']}, 'MYR': {'DL': ['E75'], 'NK': ['320', '319']}, 'SLC': {'DL': ['73H', '738', '320']}, 'DUB': {'EI': ['332', '330'], 'UA': ['332', '330']}, 'SNN': {'EI': ['757']}, 'KEF': {'FI': ['75W']}, 'CAK': {'FL': ['717'], 'WN': ['717']}, 'MDW': {'FL': ['73W'], 'WN': ['73W']}, 'MKE': {'FL': ['73W'], 'WN': ['73W', '733']}, 'FRA': {'LH': ['744', '346'], 'UA': ['744', '346']}, 'MUC': {'LH': ['333'], 'UA': ['333']}, 'ZRH': {'LX': ['333'], 'UA': ['333']}, 'ACY': {'NK': ['319']}, 'YTZ': {'PD': ['DH4']}, 'LIS': {'S4': ['313'], 'TP': ['313']}, 'PDL': {'S4': ['313'], 'TP': ['313']}, 'CLE': {'UA': ['73G', '319']}, 'IAH': {'UA': ['739', '738', '320', '752', '73G', '319']}, 'RAI': {'VR': ['752']}, 'BNA': {'WN': ['73W', '73C', '733']}, 'MCI': {'WN': ['73W', '733']}, 'STL': {'WN': ['73C', '73W']}}}
-
-probabilities = {'Departures': {'9K': {'Count': 11, 'Routes': {'ACK': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'ALB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'AUG': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'BHB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'HYA': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'LEB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MVY': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'PVC': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'RKD': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'RUT': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'SLK': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}}, 'Probability': 0.05188679245283019}, 'AA': {'Count': 23, 'Routes': {'BUF': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'CLT': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}, 'E90': {'Probability': 0.25}}, 'Probability': 0.043478260869565216}, 'CUN': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'DCA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'DFW': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'JFK': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'LAX': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'LGA': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'LHR': {'Count': 1, 'Aircrafts': {'777': {'Probability': 0.5}, '744': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'MAD': {'Count': 1, 'Aircrafts': {'330': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'MDT': {'Count': 1, 'Aircrafts': {'DH3': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'MIA': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'NRT': {'Count': 1, 'Aircrafts': {'787': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'ORD': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'PDX': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.25}, '319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.043478260869565216}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}, '321': {'Probability': 0.3333333333333333}}, 'Probability': 0.043478260869565216}, 'PIT': {'Count': 1, 'Aircrafts': {'E70': {'Probability': 0.5}, 'CRJ': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'RIC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'ROC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SAN': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SEA': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SYR': {'Count': 1, 'Aircrafts': {'DH3': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}}, 'Probability': 0.10849056603773585}, 'AC': {'Count': 4, 'Routes': {'YHZ': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.25}, 'YOW': {'Count': 1, 'Aircrafts': {'DH1': {'Probability': 1.0}}, 'Probability': 0.25}, 'YUL': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 0.5}, 'DH3': {'Probability': 0.5}}, 'Probability': 0.25}, 'YYZ': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, 'E75': {'Probability': 0.5}}, 'Probability': 0.25}}, 'Probability': 0.018867924528301886}, 'AF': {'Count': 3, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.3333333333333333}, 'M90': {'Probability': 0.3333333333333333}, 'M88': {'Probability': 0.3333333333333333}}, 'Probability': 0.3333333333333333}, 'CDG': {'Count': 1, 'Aircrafts': {'744': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'LHR': {'Count': 1, 'Aircrafts': {'764': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'AM': {'Count': 2, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.25}, 'M90': {'Probability': 0.25}, 'M88': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.5}, 'CUN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'AS': {'Count': 7, 'Routes': {'ISP': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'LAX': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.14285714285714285}, 'PBG': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'PDX': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'PQI': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'SAN': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'SEA': {'Count': 1, 'Aircrafts': {'73J': {'Probability': 0.5}, '73H': {'Probability': 0.5}}, 'Probability': 0.14285714285714285}}, 'Probability': 0.0330188679245283}, 'AY': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'777': {'Probability': 0.5}, '744': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'AZ': {'Count': 2, 'Routes': {'CDG': {'Count': 1, 'Aircrafts': {'744': {'Probability': 1.0}}, 'Probability': 0.5}, 'FCO': {'Count': 1, 'Aircrafts': {'330': {'Probability': 0.5}, '332': {'Probability': 0.5}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'B6': {'Count': 46, 'Routes': {'AUA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'AUS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'BUF': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'BWI': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'CHS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'CLT': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'CUN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'DCA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'DEN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'DFW': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'DTW': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'DXB': {'Count': 1, 'Aircrafts': {'77L': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'EWR': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'FLL': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'HOU': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'IAD': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'JAX': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'JFK': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'LAS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'LAX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'LGB': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'MCO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'MSY': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'NAS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'ORD': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'PBI': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.021739130434782608}, 'PDX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'PIT': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'PLS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'PUJ': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'RDU': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'RIC': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'RSW': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SAN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SAV': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SDQ': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SEA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SFO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SJC': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SJU': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'STI': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'STT': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'SXM': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}, 'TPA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.021739130434782608}}, 'Probability': 0.2169811320754717}, 'BA': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'777': {'Probability': 0.5}, '744': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'CM': {'Count': 1, 'Routes': {'PTY': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'DL': {'Count': 25, 'Routes': {'AMS': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.04}, 'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.2}, '757': {'Probability': 0.2}, 'M88': {'Probability': 0.2}, '320': {'Probability': 0.2}, '319': {'Probability': 0.2}}, 'Probability': 0.04}, 'BDA': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.04}, 'CDG': {'Count': 1, 'Aircrafts': {'752': {'Probability': 1.0}}, 'Probability': 0.04}, 'CHS': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 1.0}}, 'Probability': 0.04}, 'CMH': {'Count': 1, 'Aircrafts': {'ERJ': {'Probability': 1.0}}, 'Probability': 0.04}, 'CUN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.04}, 'CVG': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.04}, 'DTW': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '73H': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '757': {'Probability': 0.16666666666666666}, 'M88': {'Probability': 0.16666666666666666}}, 'Probability': 0.04}, 'FCO': {'Count': 1, 'Aircrafts': {'330': {'Probability': 0.5}, '332': {'Probability': 0.5}}, 'Probability': 0.04}, 'IND': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'JAX': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 1.0}}, 'Probability': 0.04}, 'JFK': {'Count': 1, 'Aircrafts': {'752': {'Probability': 0.3333333333333333}, 'CR7': {'Probability': 0.3333333333333333}, 'M88': {'Probability': 0.3333333333333333}}, 'Probability': 0.04}, 'LAS': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.04}, 'LAX': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.04}, 'LGA': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'LHR': {'Count': 1, 'Aircrafts': {'764': {'Probability': 1.0}}, 'Probability': 0.04}, 'MCO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.04}, 'MSP': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.2}, '319': {'Probability': 0.2}, '757': {'Probability': 0.2}, 'M90': {'Probability': 0.2}, '320': {'Probability': 0.2}}, 'Probability': 0.04}, 'MYR': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'NAS': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'PLS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.04}, 'RDU': {'Count': 1, 'Aircrafts': {'CR7': {'Probability': 1.0}}, 'Probability': 0.04}, 'RIC': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 0.5}, 'CR7': {'Probability': 0.5}}, 'Probability': 0.04}, 'SLC': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.04}}, 'Probability': 0.1179245283018868}, 'EI': {'Count': 2, 'Routes': {'DUB': {'Count': 1, 'Aircrafts': {'332': {'Probability': 0.5}, '330': {'Probability': 0.5}}, 'Probability': 0.5}, 'SNN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'EK': {'Count': 1, 'Routes': {'DXB': {'Count': 1, 'Aircrafts': {'77L': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'FI': {'Count': 1, 'Routes': {'KEF': {'Count': 1, 'Aircrafts': {'75W': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'FL': {'Count': 5, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.2}, 'BWI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.2}, 'CAK': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.2}, 'MCO': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.2}, 'MDW': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.2}}, 'Probability': 0.02358490566037736}, 'IB': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'777': {'Probability': 0.5}, '744': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'JL': {'Count': 2, 'Routes': {'MSY': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.5}, 'NRT': {'Count': 1, 'Aircrafts': {'788': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'KL': {'Count': 3, 'Routes': {'AMS': {'Count': 1, 'Aircrafts': {'330': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'ATL': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.3333333333333333}, 'M90': {'Probability': 0.3333333333333333}, 'M88': {'Probability': 0.3333333333333333}}, 'Probability': 0.3333333333333333}, 'LHR': {'Count': 1, 'Aircrafts': {'767': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'KS': {'Count': 3, 'Routes': {'ISP': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'PBG': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'PQI': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'LH': {'Count': 2, 'Routes': {'FRA': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '346': {'Probability': 0.5}}, 'Probability': 0.5}, 'MUC': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'LX': {'Count': 1, 'Routes': {'ZRH': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'NK': {'Count': 5, 'Routes': {'ACY': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'DFW': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'FLL': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'MYR': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.2}, 'ORD': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}}, 'Probability': 0.02358490566037736}, 'PD': {'Count': 1, 'Routes': {'YTZ': {'Count': 1, 'Aircrafts': {'DH4': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'S4': {'Count': 2, 'Routes': {'LIS': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}, 'PDL': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'SY': {'Count': 1, 'Routes': {'MSP': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '73G': {'Probability': 0.5}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'TP': {'Count': 2, 'Routes': {'LIS': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}, 'PDL': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'UA': {'Count': 17, 'Routes': {'CLE': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'DEN': {'Count': 1, 'Aircrafts': {'739': {'Probability': 0.3333333333333333}, '320': {'Probability': 0.3333333333333333}, '738': {'Probability': 0.3333333333333333}}, 'Probability': 0.058823529411764705}, 'DUB': {'Count': 1, 'Aircrafts': {'332': {'Probability': 0.5}, '330': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'EWR': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 0.14285714285714285}, '738': {'Probability': 0.14285714285714285}, '319': {'Probability': 0.14285714285714285}, '320': {'Probability': 0.14285714285714285}, '739': {'Probability': 0.14285714285714285}, '753': {'Probability': 0.14285714285714285}, '752': {'Probability': 0.14285714285714285}}, 'Probability': 0.058823529411764705}, 'FRA': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '346': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'IAD': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}, '739': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '752': {'Probability': 0.16666666666666666}, '73G': {'Probability': 0.16666666666666666}}, 'Probability': 0.058823529411764705}, 'IAH': {'Count': 1, 'Aircrafts': {'739': {'Probability': 0.2}, '738': {'Probability': 0.2}, '320': {'Probability': 0.2}, '73G': {'Probability': 0.2}, '319': {'Probability': 0.2}}, 'Probability': 0.058823529411764705}, 'LAX': {'Count': 1, 'Aircrafts': {'752': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'MUC': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'ORD': {'Count': 1, 'Aircrafts': {'739': {'Probability': 0.14285714285714285}, '752': {'Probability': 0.14285714285714285}, '738': {'Probability': 0.14285714285714285}, '73G': {'Probability': 0.14285714285714285}, '319': {'Probability': 0.14285714285714285}, '320': {'Probability': 0.14285714285714285}, '753': {'Probability': 0.14285714285714285}}, 'Probability': 0.058823529411764705}, 'PTY': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'SFO': {'Count': 1, 'Aircrafts': {'752': {'Probability': 0.2}, '753': {'Probability': 0.2}, '739': {'Probability': 0.2}, '738': {'Probability': 0.2}, '73G': {'Probability': 0.2}}, 'Probability': 0.058823529411764705}, 'YHZ': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'YOW': {'Count': 1, 'Aircrafts': {'DH1': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'YUL': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 0.5}, 'DH3': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'YYZ': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, 'E75': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'ZRH': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}}, 'Probability': 0.08018867924528301}, 'UN': {'Count': 1, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'US': {'Count': 17, 'Routes': {'BUF': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'CLT': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}, 'E90': {'Probability': 0.25}}, 'Probability': 0.058823529411764705}, 'CUN': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'DCA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'DFW': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'JFK': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'LAX': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'LGA': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'MDT': {'Count': 1, 'Aircrafts': {'DH8': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'MIA': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'ORD': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.25}, '319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.058823529411764705}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}, '321': {'Probability': 0.3333333333333333}}, 'Probability': 0.058823529411764705}, 'PIT': {'Count': 1, 'Aircrafts': {'E70': {'Probability': 0.5}, 'CRJ': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'RIC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'ROC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'SYR': {'Count': 1, 'Aircrafts': {'DH8': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}}, 'Probability': 0.08018867924528301}, 'VR': {'Count': 1, 'Routes': {'RAI': {'Count': 1, 'Aircrafts': {'752': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'VS': {'Count': 2, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.2}, '757': {'Probability': 0.2}, 'M88': {'Probability': 0.2}, '320': {'Probability': 0.2}, '319': {'Probability': 0.2}}, 'Probability': 0.5}, 'LHR': {'Count': 1, 'Aircrafts': {'764': {'Probability': 0.5}, '333': {'Probability': 0.5}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'VX': {'Count': 2, 'Routes': {'LAX': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, '320': {'Probability': 0.5}}, 'Probability': 0.5}, 'SFO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'WN': {'Count': 11, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'BNA': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.5}, '73C': {'Probability': 0.5}}, 'Probability': 0.09090909090909091}, 'BWI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.3333333333333333}, '73C': {'Probability': 0.3333333333333333}, '733': {'Probability': 0.3333333333333333}}, 'Probability': 0.09090909090909091}, 'CAK': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'DEN': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'HOU': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MCI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MCO': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MDW': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.5}, '733': {'Probability': 0.5}}, 'Probability': 0.09090909090909091}, 'MKE': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'STL': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}}, 'Probability': 0.05188679245283019}}, 'Arrivals': {'9K': {'Count': 11, 'Routes': {'ACK': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'ALB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'AUG': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'BHB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'HYA': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'LEB': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MVY': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'PVC': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'RKD': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'RUT': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'SLK': {'Count': 1, 'Aircrafts': {'CNA': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}}, 'Probability': 0.05188679245283019}, 'AA': {'Count': 23, 'Routes': {'BUF': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'CLT': {'Count': 1, 'Aircrafts': {'321': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}, '320': {'Probability': 0.3333333333333333}}, 'Probability': 0.043478260869565216}, 'CUN': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'DCA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'DFW': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'JFK': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'LAX': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'LGA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'LHR': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '777': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'MAD': {'Count': 1, 'Aircrafts': {'330': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'MDT': {'Count': 1, 'Aircrafts': {'DH3': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'MIA': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'NRT': {'Count': 1, 'Aircrafts': {'787': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'ORD': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'PDX': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.25}, '319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.043478260869565216}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'PIT': {'Count': 1, 'Aircrafts': {'E70': {'Probability': 0.5}, 'CRJ': {'Probability': 0.5}}, 'Probability': 0.043478260869565216}, 'RIC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'ROC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SAN': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SEA': {'Count': 1, 'Aircrafts': {'737': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}, 'SYR': {'Count': 1, 'Aircrafts': {'DH3': {'Probability': 1.0}}, 'Probability': 0.043478260869565216}}, 'Probability': 0.10849056603773585}, 'AC': {'Count': 4, 'Routes': {'YHZ': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.25}, 'YOW': {'Count': 1, 'Aircrafts': {'DH1': {'Probability': 1.0}}, 'Probability': 0.25}, 'YUL': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 0.5}, 'DH3': {'Probability': 0.5}}, 'Probability': 0.25}, 'YYZ': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, 'E75': {'Probability': 0.5}}, 'Probability': 0.25}}, 'Probability': 0.018867924528301886}, 'AF': {'Count': 3, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.2}, '757': {'Probability': 0.2}, '320': {'Probability': 0.2}, '738': {'Probability': 0.2}, '319': {'Probability': 0.2}}, 'Probability': 0.3333333333333333}, 'CDG': {'Count': 1, 'Aircrafts': {'744': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'LHR': {'Count': 1, 'Aircrafts': {'764': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'AM': {'Count': 2, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.16666666666666666}, '757': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, 'M88': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}}, 'Probability': 0.5}, 'CUN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'AS': {'Count': 7, 'Routes': {'ISP': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'LAX': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.14285714285714285}, 'PBG': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'PDX': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'PQI': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'SAN': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.14285714285714285}, 'SEA': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 0.5}, '73J': {'Probability': 0.5}}, 'Probability': 0.14285714285714285}}, 'Probability': 0.0330188679245283}, 'AY': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '777': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'AZ': {'Count': 3, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.3333333333333333}, '757': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}}, 'Probability': 0.3333333333333333}, 'CDG': {'Count': 1, 'Aircrafts': {'744': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'FCO': {'Count': 1, 'Aircrafts': {'330': {'Probability': 0.5}, '332': {'Probability': 0.5}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'B6': {'Count': 45, 'Routes': {'AUA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'AUS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'BUF': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'BWI': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'CHS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'CLT': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'CUN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'DCA': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, '320': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'DEN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'DFW': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'DTW': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'DXB': {'Count': 1, 'Aircrafts': {'77L': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'EWR': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'FLL': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'HOU': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'IAD': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'JAX': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'JFK': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, '320': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'LAS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'LAX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'LGB': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'MCO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'MSY': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'NAS': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'ORD': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'PBI': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.022222222222222223}, 'PDX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'PIT': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'PLS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'PUJ': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'RDU': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'RIC': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'RSW': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SAN': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SAV': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SDQ': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SEA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SFO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SJC': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SJU': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'STI': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'SXM': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}, 'TPA': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.022222222222222223}}, 'Probability': 0.21226415094339623}, 'BA': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '777': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'CM': {'Count': 1, 'Routes': {'PTY': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'DL': {'Count': 25, 'Routes': {'AMS': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.04}, 'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.14285714285714285}, '757': {'Probability': 0.14285714285714285}, '320': {'Probability': 0.14285714285714285}, '738': {'Probability': 0.14285714285714285}, 'M88': {'Probability': 0.14285714285714285}, '': {'Probability': 0.14285714285714285}, '319': {'Probability': 0.14285714285714285}}, 'Probability': 0.04}, 'BDA': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.04}, 'CDG': {'Count': 1, 'Aircrafts': {'752': {'Probability': 1.0}}, 'Probability': 0.04}, 'CHS': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 1.0}}, 'Probability': 0.04}, 'CMH': {'Count': 1, 'Aircrafts': {'ERJ': {'Probability': 1.0}}, 'Probability': 0.04}, 'CUN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.04}, 'CVG': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.04}, 'DTW': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '757': {'Probability': 0.16666666666666666}, 'M90': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}}, 'Probability': 0.04}, 'FCO': {'Count': 1, 'Aircrafts': {'330': {'Probability': 0.5}, '332': {'Probability': 0.5}}, 'Probability': 0.04}, 'IND': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'JAX': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 1.0}}, 'Probability': 0.04}, 'JFK': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 0.3333333333333333}, '752': {'Probability': 0.3333333333333333}, 'CR7': {'Probability': 0.3333333333333333}}, 'Probability': 0.04}, 'LAS': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.04}, 'LAX': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 1.0}}, 'Probability': 0.04}, 'LGA': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'LHR': {'Count': 1, 'Aircrafts': {'764': {'Probability': 1.0}}, 'Probability': 0.04}, 'MCO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, 'M88': {'Probability': 0.5}}, 'Probability': 0.04}, 'MSP': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '73H': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}, 'M88': {'Probability': 0.16666666666666666}}, 'Probability': 0.04}, 'MYR': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'NAS': {'Count': 1, 'Aircrafts': {'E75': {'Probability': 1.0}}, 'Probability': 0.04}, 'PLS': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.04}, 'RDU': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 0.5}, 'CR7': {'Probability': 0.5}}, 'Probability': 0.04}, 'RIC': {'Count': 1, 'Aircrafts': {'CR9': {'Probability': 0.5}, 'CR7': {'Probability': 0.5}}, 'Probability': 0.04}, 'SLC': {'Count': 1, 'Aircrafts': {'73H': {'Probability': 0.3333333333333333}, '738': {'Probability': 0.3333333333333333}, '320': {'Probability': 0.3333333333333333}}, 'Probability': 0.04}}, 'Probability': 0.1179245283018868}, 'EI': {'Count': 2, 'Routes': {'DUB': {'Count': 1, 'Aircrafts': {'332': {'Probability': 0.5}, '330': {'Probability': 0.5}}, 'Probability': 0.5}, 'SNN': {'Count': 1, 'Aircrafts': {'757': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'EK': {'Count': 1, 'Routes': {'DXB': {'Count': 1, 'Aircrafts': {'77L': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'FI': {'Count': 1, 'Routes': {'KEF': {'Count': 1, 'Aircrafts': {'75W': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'FL': {'Count': 6, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.16666666666666666}, 'BWI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.3333333333333333}, '73C': {'Probability': 0.3333333333333333}, '733': {'Probability': 0.3333333333333333}}, 'Probability': 0.16666666666666666}, 'CAK': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.16666666666666666}, 'MCO': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.16666666666666666}, 'MDW': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.16666666666666666}, 'MKE': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.16666666666666666}}, 'Probability': 0.02830188679245283}, 'IB': {'Count': 2, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '777': {'Probability': 0.5}}, 'Probability': 0.5}, 'MAD': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'JL': {'Count': 1, 'Routes': {'NRT': {'Count': 1, 'Aircrafts': {'788': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'KL': {'Count': 3, 'Routes': {'AMS': {'Count': 1, 'Aircrafts': {'330': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'ATL': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.3333333333333333}, '320': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}}, 'Probability': 0.3333333333333333}, 'LHR': {'Count': 1, 'Aircrafts': {'767': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'KS': {'Count': 3, 'Routes': {'ISP': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'PBG': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}, 'PQI': {'Count': 1, 'Aircrafts': {'SF3': {'Probability': 1.0}}, 'Probability': 0.3333333333333333}}, 'Probability': 0.014150943396226415}, 'LH': {'Count': 2, 'Routes': {'FRA': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '346': {'Probability': 0.5}}, 'Probability': 0.5}, 'MUC': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'LX': {'Count': 1, 'Routes': {'ZRH': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'NK': {'Count': 5, 'Routes': {'ACY': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'DFW': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'FLL': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}, 'MYR': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.2}, 'ORD': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.2}}, 'Probability': 0.02358490566037736}, 'PD': {'Count': 1, 'Routes': {'YTZ': {'Count': 1, 'Aircrafts': {'DH4': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'S4': {'Count': 2, 'Routes': {'LIS': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}, 'PDL': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'SY': {'Count': 1, 'Routes': {'MSP': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '73G': {'Probability': 0.5}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'TP': {'Count': 2, 'Routes': {'LIS': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}, 'PDL': {'Count': 1, 'Aircrafts': {'313': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'UA': {'Count': 17, 'Routes': {'CLE': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'DEN': {'Count': 1, 'Aircrafts': {'739': {'Probability': 0.25}, '752': {'Probability': 0.25}, '738': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.058823529411764705}, 'DUB': {'Count': 1, 'Aircrafts': {'332': {'Probability': 0.5}, '330': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'EWR': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.2}, '73G': {'Probability': 0.2}, '320': {'Probability': 0.2}, '319': {'Probability': 0.2}, '739': {'Probability': 0.2}}, 'Probability': 0.058823529411764705}, 'FRA': {'Count': 1, 'Aircrafts': {'744': {'Probability': 0.5}, '346': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'IAD': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.2}, '752': {'Probability': 0.2}, '73G': {'Probability': 0.2}, '739': {'Probability': 0.2}, '738': {'Probability': 0.2}}, 'Probability': 0.058823529411764705}, 'IAH': {'Count': 1, 'Aircrafts': {'739': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '752': {'Probability': 0.16666666666666666}, '73G': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}}, 'Probability': 0.058823529411764705}, 'LAX': {'Count': 1, 'Aircrafts': {'752': {'Probability': 0.25}, '753': {'Probability': 0.25}, '320': {'Probability': 0.25}, '739': {'Probability': 0.25}}, 'Probability': 0.058823529411764705}, 'MUC': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'ORD': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.16666666666666666}, '752': {'Probability': 0.16666666666666666}, '739': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '73G': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}}, 'Probability': 0.058823529411764705}, 'PTY': {'Count': 1, 'Aircrafts': {'73G': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'SFO': {'Count': 1, 'Aircrafts': {'752': {'Probability': 0.16666666666666666}, '753': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, '739': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}}, 'Probability': 0.058823529411764705}, 'YHZ': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'YOW': {'Count': 1, 'Aircrafts': {'DH1': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'YUL': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 0.5}, 'DH3': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'YYZ': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.5}, 'E75': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'ZRH': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}}, 'Probability': 0.08018867924528301}, 'UN': {'Count': 1, 'Routes': {'LHR': {'Count': 1, 'Aircrafts': {'333': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'US': {'Count': 17, 'Routes': {'BUF': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'CLT': {'Count': 1, 'Aircrafts': {'321': {'Probability': 0.3333333333333333}, '319': {'Probability': 0.3333333333333333}, '320': {'Probability': 0.3333333333333333}}, 'Probability': 0.058823529411764705}, 'CUN': {'Count': 1, 'Aircrafts': {'319': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'DCA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'DFW': {'Count': 1, 'Aircrafts': {'738': {'Probability': 0.5}, '757': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'JFK': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'LAX': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'LGA': {'Count': 1, 'Aircrafts': {'319': {'Probability': 0.5}, 'E90': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'MDT': {'Count': 1, 'Aircrafts': {'DH8': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'MIA': {'Count': 1, 'Aircrafts': {'757': {'Probability': 0.5}, '738': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'ORD': {'Count': 1, 'Aircrafts': {'738': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'PHL': {'Count': 1, 'Aircrafts': {'E90': {'Probability': 0.25}, '319': {'Probability': 0.25}, '321': {'Probability': 0.25}, '320': {'Probability': 0.25}}, 'Probability': 0.058823529411764705}, 'PHX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'PIT': {'Count': 1, 'Aircrafts': {'E70': {'Probability': 0.5}, 'CRJ': {'Probability': 0.5}}, 'Probability': 0.058823529411764705}, 'RIC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'ROC': {'Count': 1, 'Aircrafts': {'CRJ': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}, 'SYR': {'Count': 1, 'Aircrafts': {'DH8': {'Probability': 1.0}}, 'Probability': 0.058823529411764705}}, 'Probability': 0.08018867924528301}, 'VR': {'Count': 1, 'Routes': {'RAI': {'Count': 1, 'Aircrafts': {'752': {'Probability': 1.0}}, 'Probability': 1.0}}, 'Probability': 0.0047169811320754715}, 'VS': {'Count': 2, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'M90': {'Probability': 0.16666666666666666}, '757': {'Probability': 0.16666666666666666}, '320': {'Probability': 0.16666666666666666}, '738': {'Probability': 0.16666666666666666}, 'M88': {'Probability': 0.16666666666666666}, '319': {'Probability': 0.16666666666666666}}, 'Probability': 0.5}, 'LHR': {'Count': 1, 'Aircrafts': {'333': {'Probability': 0.5}, '764': {'Probability': 0.5}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'VX': {'Count': 2, 'Routes': {'LAX': {'Count': 1, 'Aircrafts': {'320': {'Probability': 0.5}, '319': {'Probability': 0.5}}, 'Probability': 0.5}, 'SFO': {'Count': 1, 'Aircrafts': {'320': {'Probability': 1.0}}, 'Probability': 0.5}}, 'Probability': 0.009433962264150943}, 'WN': {'Count': 11, 'Routes': {'ATL': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'BNA': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.3333333333333333}, '73C': {'Probability': 0.3333333333333333}, '733': {'Probability': 0.3333333333333333}}, 'Probability': 0.09090909090909091}, 'BWI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.3333333333333333}, '73C': {'Probability': 0.3333333333333333}, '733': {'Probability': 0.3333333333333333}}, 'Probability': 0.09090909090909091}, 'CAK': {'Count': 1, 'Aircrafts': {'717': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'DEN': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'HOU': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MCI': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.5}, '733': {'Probability': 0.5}}, 'Probability': 0.09090909090909091}, 'MCO': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MDW': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 1.0}}, 'Probability': 0.09090909090909091}, 'MKE': {'Count': 1, 'Aircrafts': {'73W': {'Probability': 0.5}, '733': {'Probability': 0.5}}, 'Probability': 0.09090909090909091}, 'STL': {'Count': 1, 'Aircrafts': {'73C': {'Probability': 0.5}, '73W': {'Probability': 0.5}}, 'Probability': 0.09090909090909091}}, 'Probability': 0.05188679245283019}}, 'Num Departures': 212, 'Departure Rate': 9.0, 'Num Arrivals': 212, 'Arrival Rate': 9.0, 'Wind': {'Northeast': 0.18, 'Northwest': 0.37, 'Southeast': 0.17, 'Southwest': 0.28}}
-
-runways = {'Northeast': {'Departures': {'9': {'Non Jet': False}, '4L': {'Non Jet': True}, '4R': {'Non Jet': False}}, 'Arrivals': {'4L': {'Non Jet': False}, '4R': {'Non Jet': False}}}, 'Northwest': {'Departures': {'33L': {'Non Jet': False}, '27': {'Non Jet': False}, '99': {'Non Jet': True}}, 'Arrivals': {'33L': {'Non Jet': False}, '27': {'Non Jet': False}, '32': {'Non Jet': False}, '99': {'Non Jet': True}}}, 'Southeast': {'Departures': {'15R': {'Non Jet': False}, '15L': {'Non Jet': False}}, 'Arrivals': {'15R': {'Non Jet': False}, '14': {'Non Jet': False}, '9': {'Non Jet': False}}}, 'Southwest': {'Departures': {'22L': {'Non Jet': False}, '22R': {'Non Jet': False}}, 'Arrivals': {'22L': {'Non Jet': False}, '27': {'Non Jet': False}, '22R': {'Non Jet': True}, '99': {'Non Jet': True}}}}
\ No newline at end of file
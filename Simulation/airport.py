@@ -1,5 +1,5 @@
 """
-Class to simulate a week's worth of flights at Logan airport.
+Class to simulate the flights of a run of days (NUM_REPLICATIONS in the .env file) at Logan airport.
 
 Goals:
     - The goal of this project is to gain a better understanding of how plane traffic builds up around the runways at
@@ -9,7 +9,8 @@ Goals:
 
 Assumptions:
     - Weather is constant and ideal
-    - Winds are constant for 24 hours, then can randomly change direction every the next day (could stay the same)
+    - Winds are constant for 24 hours, then can randomly change direction every the next day (could stay the same),
+    unless a disruption model shifts them during the day (see `disruptions.py`)
     - Taxi and Gate issues are not being considered. The focus of this project is on getting planes on and off of
     the ground efficiently.
     - All non-jet aircraft will take off and land only on non-jet specific runways if presented the opportunity
@@ -28,214 +29,295 @@ Process:
     - Departures exit system, arrivals taxi to gate
 
 """
-import pandas as pd
 import simpy
-import random
-import statistics
-import json
-import os
 import numpy as np
-from dotenv import load_dotenv
-from Data.final_data import probabilities, runways
+from Data.data_cache import load_data
+from Simulation.config import load_config
+from Simulation.disruptions import load_disruptions
+from Simulation.metrics import MetricsRecorder, resolve_interval
 from Simulation.plane import Plane
+from Simulation.recorder import ResultRecorder, create_string_tables
+from Simulation.results import RESULTS_DIR, save_results
+from Simulation.sampler import PlaneSampler
+from Simulation.routing import RoutingTable
 from Simulation.runway import Runway
-from dotenv import load_dotenv
+from Simulation.runway_index import RunwaySelector
+from Simulation.trace import logger
+from Simulation.traffic import generate_daily_traffic
 
 
-def find_wind_direction():
+def find_wind_direction(rng=None, wind_probabilities=None):
     """Function to define which way the wind is blowing"""
-    directions = list(probabilities["Wind"].keys())
-    direction_probabilities = [probabilities["Wind"][i] for i in probabilities["Wind"].keys()]
-    wind = np.random.choice(directions, p=direction_probabilities)
+    if rng is None:
+        rng = np.random.default_rng()
+    if wind_probabilities is None:
+        wind_probabilities = load_data().wind
 
-    print(f"Setting wind direction to: {wind}")
+    directions = list(wind_probabilities.keys())
+    direction_probabilities = [wind_probabilities[i] for i in wind_probabilities.keys()]
+    wind = str(rng.choice(directions, p=direction_probabilities))
+
+    logger.info("Setting wind direction to: %s", wind)
     return wind
 
 
 class Airport(object):
 
-    def __init__(self, env, simulation_type):
-        load_dotenv()
+    def __init__(self, env, simulation_type, ignore_runways=None, seed=None, runway_table=None, settings=None,
+                 airport_code="BOS", trace=None, spill_dir=None, metrics_interval=None, config=None, disruptions=None):
+        if config is None:
+            config = load_config()
 
         self.env = env
         self.simulation_type = simulation_type
-        self.ignore_runways = set(json.loads(os.environ['EXCLUDE_RUNWAYS']))
-        self.wait_times = []
-        self.circle_times = []
-        self.wind_direction = find_wind_direction()
-        self.runways = self.prepare_runways()
-        self.non_jet_departure_runways, self.all_departure_runways = self.find_non_jet_runways(departure=True)
-        self.non_jet_arrival_runways, self.all_arrival_runways = self.find_non_jet_runways(departure=False)
-
-    def prepare_runways(self):
-        """Function to setup which runways are being used"""
-        print("Preparing runways")
+        self.airport_code = airport_code
+        self.trace = trace
+        self.data = load_data(airport_code)
+        self.sampler = PlaneSampler(self.data.tables, self.data.strings)
+        if ignore_runways is None:
+            ignore_runways = config.exclude_runways
+        if runway_table is None:
+            runway_table = self.data.runways
+        if settings is None:
+            settings = config.settings
+        self.ignore_runways = set(ignore_runways)
+        self.runway_table = runway_table
+        self.settings = settings
+        if spill_dir is None:
+            spill_dir = config.spill_dir
+        if disruptions is None and config.disruptions:
+            disruptions = load_disruptions(config.disruptions)
+        self.disruptions = disruptions
+        self.rng = np.random.default_rng(seed)
+        self.day = 0
+
+        # Departure/arrival records share one set of string tables, following the sampler's codes
+        self.string_tables = create_string_tables(self.sampler)
+        self.wait_times = ResultRecorder(self.string_tables, spill_dir=spill_dir, sampler=self.sampler)
+        self.circle_times = ResultRecorder(self.string_tables, spill_dir=spill_dir, sampler=self.sampler)
+
+        # Runway queue/utilization time series (only when METRICS_INTERVAL is set)
+        metrics_interval = resolve_interval(metrics_interval if metrics_interval is not None else
+                                            config.metrics_interval)
+        self.metrics = MetricsRecorder(metrics_interval) if metrics_interval is not None else None
+        self.wind_direction = find_wind_direction(self.rng, self.data.wind)
+        # Routing of every wind direction, and the runways built so far (reused across days)
+        self.routing_table = RoutingTable(self.runway_table, self.ignore_runways)
+        self.runway_pool = {}
+
+        # Runways closed (False) or reopened (True) by disruptions, on top of the ones ignored
+        self.runway_status = {}
+        self.closing_runways = {}
+
+        # Runway changes scheduled but not applied yet, whether later days change the wind with planes still in line
+        # (continuous runs), and the planes holding for a runway
+        self.upcoming_events = []
+        self.continuous = False
+        self.holding = 0
+        self.reset_runways()
+
+    def prepare_runways(self, open_runways=None):
+        """
+        Function to setup which runways are being used, from the routing of the wind direction. Runways in
+        `open_runways` (the runways in use before the wind changed or runways closed mid-run) that stay in use are kept
+        with their lines; every other runway is reused from earlier days with an empty line.
+        """
+        logger.info("Preparing runways")
+        self.routing = self.routing_table.routing(self.wind_direction, self.closed_runways())
 
         runways_in_use = {}
-
-        departure_runways = runways[self.wind_direction]["Departures"]
-        arrival_runways = runways[self.wind_direction]["Arrivals"]
-
-        # Initialize departure runways
-        for runway in departure_runways.keys():
-            if runway not in self.ignore_runways:
-                if departure_runways[runway]["Non Jet"]:
-                    runways_in_use[runway] = Runway(self.env, runway, self.wait_times, self.circle_times,
-                                                    departure=True, arrival=False, non_jet_departure=True)
-                else:
-                    runways_in_use[runway] = Runway(self.env, runway, self.wait_times, self.circle_times,
-                                                    departure=True, arrival=False)
-
-        # Initialize arrival runways
-        for runway in arrival_runways.keys():
-            if runway not in self.ignore_runways:
-                # Non jet runways
-                if arrival_runways[runway]["Non Jet"]:
-                    # If runway has already been initialized
-                    if runway in runways_in_use.keys():
-                        runways_in_use[runway].arrival = True
-                        runways_in_use[runway].non_jet_arrival = True
-                    else:
-                        runways_in_use[runway] = Runway(self.env, runway, self.wait_times, self.circle_times,
-                                                        departure=False, arrival=True, non_jet_arrival=True)
-                # All aircraft runways
-                else:
-                    # If runway has already been initialized
-                    if runway in runways_in_use.keys():
-                        runways_in_use[runway].arrival = True
-                    else:
-                        runways_in_use[runway] = Runway(self.env, runway, self.wait_times, self.circle_times,
-                                                        departure=False, arrival=True)
+        for name in self.routing.runways:
+            runway = open_runways.get(name) if open_runways is not None else None
+            if runway is None:
+                runway = self.runway_pool.get(name)
+                if runway is None:
+                    runway = self.runway_pool[name] = Runway(self.env, name, self.wait_times, self.circle_times,
+                                                             self.rng, self.settings, trace=self.trace)
+                runway.reset(self.env)
+            runway.rng = self.rng
+            runway.set_roles(self.routing.roles[name])
+            runways_in_use[name] = runway
+
+        # Give every runway a fresh series of metrics for the day (runways kept open carry on with theirs)
+        if self.metrics is not None:
+            if open_runways is None:
+                self.metrics.start_day()
+            for runway in runways_in_use.keys():
+                runways_in_use[runway].metrics = self.metrics.runway_series(runway)
 
         return runways_in_use
 
+    def runway_closed(self, runway):
+        """Function to check if a runway is out of use (ignored, or closed by a disruption and not reopened since)"""
+        return not self.runway_status.get(runway, runway not in self.ignore_runways)
+
+    def closed_runways(self):
+        """Function to return the runways out of use, or None when they are just the ignored ones"""
+        if not self.runway_status:
+            return None
+        return frozenset(runway for runway in self.ignore_runways | set(self.runway_status)
+                         if self.runway_closed(runway))
+
+    def runway_may_open(self, departing, jet):
+        """
+        Function to check if the runway changes still to come (scheduled or drawn disruptions, and the wind changes at
+        midnight of continuous runs) could open a runway to a class of plane
+        """
+        events = list(self.upcoming_events)
+        winds = {self.wind_direction}
+        if self.continuous:
+            winds |= set(self.runway_table)
+            if self.disruptions is not None:
+                events += self.disruptions.events
+        winds |= {event.wind for event in events if event.wind is not None}
+        reopening = {runway for event in events for runway in event.reopen}
+        closed = (self.closed_runways() or self.ignore_runways) - reopening
+        return any(self.routing_table.routing(wind, closed).classes[(departing, jet)] for wind in winds)
+
+    def closable_runways(self):
+        """Function to list the runways of any wind direction that are not ignored, which disruptions can close"""
+        return sorted({runway for directions in self.runway_table.values() for runways in directions.values()
+                       for runway in runways if runway not in self.ignore_runways})
+
+    def seed(self, seed):
+        """Function to restart the airport's random stream (wind, traffic and runway service times)"""
+        self.rng = np.random.default_rng(seed)
+
+    def set_day(self, day):
+        """Function to set the day that records and trace events are tagged with"""
+        self.day = day
+        self.wait_times.day = day
+        self.circle_times.day = day
+        if self.trace is not None:
+            self.trace.day = day
+
     def reset_wind(self):
         """Function to reset wind direction"""
-        self.wind_direction = find_wind_direction()
-
-    def reset_runways(self):
-        """Function to reset runways"""
-        self.runways = self.prepare_runways()
-        self.non_jet_departure_runways, self.all_departure_runways = self.find_non_jet_runways(departure=True)
-        self.non_jet_arrival_runways, self.all_arrival_runways = self.find_non_jet_runways(departure=False)
-
-    def find_non_jet_runways(self, departure):
-        """Function to find the non-jet runways"""
-        non_jet_runways = []
-        regular_runways = []
-        # Find departure runways
-        if departure:
-            for runway in self.runways.keys():
-                if self.runways[runway].departure:
-                    if self.runways[runway].non_jet_departure:
-                        non_jet_runways.append(runway)
-                    else:
-                        regular_runways.append(runway)
-
-        # Find arrival runways
-        else:
-            for runway in self.runways.keys():
-                if self.runways[runway].arrival:
-                    if self.runways[runway].non_jet_arrival:
-                        non_jet_runways.append(runway)
-                    else:
-                        regular_runways.append(runway)
-
-        return non_jet_runways, regular_runways
-
-    def find_shortest_runway_line(self, runway_list):
-        """Function to find the runway with the shortest line"""
-        shortest_line_length = None
-        shortest_line = None
-
-        for runway in runway_list:
-            runway_line_length = self.runways[runway].get_runway_line_length()
-            if shortest_line_length is None:
-                shortest_line_length = runway_line_length
-                shortest_line = runway
-                continue
-
-            if runway_line_length <= shortest_line_length:
-                shortest_line_length = runway_line_length
-                shortest_line = runway
-
-        return shortest_line
+        self.wind_direction = find_wind_direction(self.rng, self.data.wind)
+
+    def reset_runways(self, open_runways=None):
+        """Function to reset runways (keeping the `open_runways` that stay in use)"""
+        self.runways = self.prepare_runways(open_runways)
+        self.runway_selector = RunwaySelector(self.runways, self.runway_classes())
+        self.runways_changed = self.env.event()
+
+    def reconfigure(self, wind_direction=None, close=(), reopen=()):
+        """
+        Function to change the runways in use without stopping the simulation: switch to a new wind direction and/or
+        close or reopen runways. Runways that stay in use keep their lines and planes on a runway finish there. Planes
+        waiting for a runway that went out of use (or for any runway, when the wind changes) pick a runway again from
+        the new set, in the order they started waiting. Returns the number of planes moved.
+        """
+        open_runways = self.runways
+        wind_changed = wind_direction is not None and wind_direction != self.wind_direction
+        if wind_direction is not None:
+            self.wind_direction = wind_direction
+        for runway in close:
+            self.runway_status[runway] = False
+        for runway in reopen:
+            self.runway_status[runway] = True
+        if self.trace is not None:
+            for runway in close:
+                self.trace.record(self.env.now, "", runway, "closed")
+            for runway in reopen:
+                self.trace.record(self.env.now, "", runway, "reopened")
+
+        runways_changed = self.runways_changed
+        self.reset_runways({**self.closing_runways, **open_runways})
+
+        # Runways going out of use stay open until their last plane is done
+        self.closing_runways = {name: runway for name, runway in {**self.closing_runways, **open_runways}.items()
+                                if name not in self.runways and runway.resource.count > 0}
+        if self.metrics is not None:
+            for name, runway in self.closing_runways.items():
+                runway.metrics = self.metrics.runway_series(name)
+            for runway in list(self.runways.values()) + list(self.closing_runways.values()):
+                runway.metrics.record(self.env.now, len(runway.resource.queue), runway.resource.count)
+
+        # Move the planes waiting in lines that changed
+        moving = [runway for name, runway in open_runways.items()
+                  if wind_changed or self.runways.get(name) is not runway]
+        waiting = sorted((request for runway in moving for request in runway.resource.queue),
+                         key=lambda request: request.start_time)
+        for request in waiting:
+            request.proc.interrupt("runway change")
+
+        # Let planes without a runway try again
+        runways_changed.succeed()
+        return len(waiting)
+
+    def runway_classes(self):
+        """Function to list the runways each class of plane picks from, keyed by (departing, jet)"""
+        return self.routing.classes
 
     def select_runway(self, plane):
-        """Function to select a runway to takeoff from/land on"""
-        # Departure runways
-        if plane.departing:
-            # Non-jet departures
-            if not plane.jet:
-                if len(self.non_jet_departure_runways) > 0:
-                    return self.find_shortest_runway_line(self.non_jet_departure_runways)
-                else:
-                    return self.find_shortest_runway_line(self.all_departure_runways)
-            # All other departures
-            else:
-                return self.find_shortest_runway_line(self.all_departure_runways)
-
-        # Arrival runways
-        else:
-            # Non-jet arrivals
-            if not plane.jet:
-                if len(self.non_jet_arrival_runways) > 0:
-                    return self.find_shortest_runway_line(self.non_jet_arrival_runways)
-                else:
-                    return self.find_shortest_runway_line(self.all_arrival_runways)
-            # All other departures
-            else:
-                return self.find_shortest_runway_line(self.all_arrival_runways)
-
-    def takeoff_from_airport(self, plane):
-        """Function to simulate a departing plane"""
-        runway = self.runways[self.select_runway(plane)]
-        self.env.process(runway.take_off(plane, self.wind_direction))
-
-    def land_at_airport(self, plane):
-        """Function to simulate a landing plane"""
-        runway = self.runways[self.select_runway(plane)]
-        self.env.process(runway.land(plane, self.wind_direction))
-
-    def simulate(self):
-        """Function to simulate landing and departing at the airport"""
-
-        # Loop which executes until no planes are left in line
+        """
+        Function to select a runway to takeoff from/land on: the runway with the shortest line among the ones the
+        plane's class can use (the last of them on ties), found through the runway selector's index
+        """
+        return self.runway_selector.select(plane.departing, plane.jet)
+
+    def fly(self, plane, day=None, day_start=0.0):
+        """
+        Function to simulate a departing or landing plane that may be moved to another runway while it waits (see
+        `reconfigure`). It is recorded on `day`, with its time taken from `day_start`. A plane no runway is open to
+        holds until one opens, and raises a KeyError (as the fast engine does) when no change to come can open one.
+        """
+        start_time = self.env.now
         while True:
+            # Hold until a runway the plane can use opens, when one can still open
+            runway_name = self.select_runway(plane)
+            if runway_name is None:
+                if not self.runway_may_open(plane.departing, plane.jet):
+                    raise KeyError(f"No runway available for {'departing' if plane.departing else 'arriving'} plane")
+                self.holding += 1
+                yield self.runways_changed
+                self.holding -= 1
+                continue
 
-            time_of_day = self.env.now
-
-            # Change random arrival rate based on time of day
-            if time_of_day < 6*60:
-                yield self.env.timeout(float(os.getenv("LAMBDA_NIGHT")))
-            elif time_of_day < 12*60:
-                yield self.env.timeout(float(os.getenv("LAMBDA_MORNING")))
-            elif time_of_day < 18*60:
-                yield self.env.timeout(float(os.getenv("LAMBDA_AFTERNOON")))
-            else:
-                yield self.env.timeout(float(os.getenv("LAMBDA_EVENING")))
-
-            # Generate plane
-            plane = Plane(self.env.now)
-
-            # Make plane takeoff or land
-            if plane.departing:
-                self.takeoff_from_airport(plane)
-            else:
-                self.land_at_airport(plane)
-
-    def save_simulation_data(self):
-        """Function to save data when simulation is finished"""
+            runway = self.runways[runway_name]
+            try:
+                if plane.departing:
+                    yield from runway.take_off(plane, self.wind_direction, start_time, day, day_start)
+                else:
+                    yield from runway.land(plane, self.wind_direction, start_time, day, day_start)
+                return
+            except simpy.Interrupt:
+                runway.leave_line()
 
-        # Save departure data
-        print("Saving departure data to file")
-        departing_df = pd.DataFrame(data=self.wait_times, columns=["Time", "Airline", "Destination", "Flight Number",
-                                                                   "Aircraft Type", "Wind", "Runway", "Wait Time"])
-        departing_df.to_csv(f"../Data/departure_results_{self.simulation_type}.csv", index=False)
+    def simulate(self, traffic=None):
+        """Function to simulate landing and departing at the airport"""
+        # Draw the whole day's traffic up front
+        if traffic is None:
+            traffic = generate_daily_traffic(self.sampler, settings=self.settings, rng=self.rng)
 
-        # Save arrival data
-        print("Saving arrival data to file")
-        arrival_df = pd.DataFrame(data=self.circle_times, columns=["Time", "Airline", "Destination", "Flight Number",
-                                                                   "Aircraft Type", "Wind", "Runway", "Circle Time"])
-        arrival_df.to_csv(f"../Data/arrival_results_{self.simulation_type}.csv", index=False)
+        # Step through the planes in order of arrival
+        for i in range(len(traffic)):
+            yield self.env.timeout(float(traffic.delays[i]))
 
+            # Generate plane
+            plane = Plane.from_traffic(traffic, i, self.sampler)
+
+            # Make plane takeoff or land, on a runway that can change while it waits
+            self.env.process(self.fly(plane))
+
+    def airport_kwargs(self):
+        """Function to return the arguments needed to rebuild this airport (e.g. in a worker process)"""
+        return {"ignore_runways": sorted(self.ignore_runways), "runway_table": self.runway_table,
+                "settings": self.settings, "airport_code": self.airport_code, "disruptions": self.disruptions}
+
+    def save_simulation_data(self, results_format=None, results_dir=RESULTS_DIR, replace=True):
+        """
+        Function to save data when simulation is finished (or, without `replace`, to add the recorded days to the
+        results already saved)
+        """
+        save_results(self.simulation_type, self.wait_times, self.circle_times, results_format, results_dir, replace)
+        if self.metrics is not None:
+            self.metrics.save(self.simulation_type, results_dir, replace)
+
+    def clear_records(self):
+        """Function to drop the recorded departures/arrivals and runway metrics (e.g. once they are saved)"""
+        self.wait_times.clear()
+        self.circle_times.clear()
+        if self.metrics is not None:
+            self.metrics.clear()
@@ -0,0 +1,172 @@
+"""
+Arrival processes: when planes show up at the airport over a day.
+
+Two processes are available, set with ARRIVAL_PROCESS in the .env file:
+    - "fixed" (the default, and the original model): a new plane shows up exactly LAMBDA_<block> minutes after the
+    previous one, with the block (night/morning/afternoon/evening) chosen by the time the previous plane showed up
+    - "poisson": a non-homogeneous Poisson process whose rate follows a `RateProfile` over the day
+The rate profile is the four LAMBDA_<block> blocks (1 / LAMBDA planes per minute) unless ARRIVAL_RATES lists 24 hourly
+rates in planes per hour. ARRIVAL_RATE_INTERPOLATION picks how the rate moves between hours: "step" keeps it constant
+over each hour, "linear" interpolates it between the middle of each hour for a smooth profile.
+
+Poisson arrival times are drawn for the whole day in a few vectorized calls, either by inversion (a Poisson number of
+uniform draws of the cumulative rate, mapped back through it, exact for step profiles) or by thinning (candidates
+drawn at the profile's peak rate, each kept with probability rate(t) / peak rate, for any profile). The traffic of a
+day, and so both the SimPy and fast engines, takes its arrival times from here.
+"""
+import numpy as np
+
+# Length of a simulated day in minutes
+DAY_LENGTH = 24*60
+
+# End time (minutes) and .env suffix of each block of the day
+TIME_BLOCKS = (
+    (6*60, "NIGHT"),
+    (12*60, "MORNING"),
+    (18*60, "AFTERNOON"),
+    (24*60, "EVENING"),
+)
+
+# Arrival processes and the ways a rate profile can move between its points
+ARRIVAL_PROCESSES = ("fixed", "poisson")
+INTERPOLATIONS = ("step", "linear")
+
+
+class RateProfile:
+    """
+    Class to represent an arrival rate (planes per minute) over a day. With "step" interpolation `rates[k]` holds from
+    `times[k]` until the next time; with "linear" interpolation the rate moves linearly between the (time, rate)
+    points and stays flat before the first and after the last.
+    """
+
+    def __init__(self, times, rates, interpolation="step", day_length=DAY_LENGTH):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown rate interpolation: {interpolation}")
+        self.times = np.asarray(times, dtype=np.float64)
+        self.rates = np.asarray(rates, dtype=np.float64)
+        if len(self.times) != len(self.rates) or len(self.rates) == 0:
+            raise ValueError("A rate profile needs one rate per time")
+        if np.any(self.rates < 0):
+            raise ValueError("Arrival rates cannot be negative")
+        self.interpolation = interpolation
+        self.day_length = day_length
+
+    @classmethod
+    def from_blocks(cls, settings):
+        """Function to build the step profile of the LAMBDA_<block> settings"""
+        block_starts = [0.0] + [block_end for block_end, _ in TIME_BLOCKS[:-1]]
+        return cls(block_starts, [1 / settings[f"LAMBDA_{block}"] for _, block in TIME_BLOCKS], "step")
+
+    @classmethod
+    def hourly(cls, rates_per_hour, interpolation="step"):
+        """Function to build a profile from 24 hourly rates in planes per hour"""
+        if len(rates_per_hour) != 24:
+            raise ValueError(f"Expected 24 hourly arrival rates, got {len(rates_per_hour)}")
+        offset = 0 if interpolation == "step" else 30
+        return cls(np.arange(24) * 60.0 + offset, np.asarray(rates_per_hour, dtype=np.float64) / 60, interpolation)
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Function to build the profile set by ARRIVAL_RATES, or by the LAMBDA_<block> settings without it"""
+        if settings.arrival_rates:
+            return cls.hourly(settings.arrival_rates, settings.arrival_rate_interpolation)
+        return cls.from_blocks(settings)
+
+    def rate(self, times):
+        """Function to return the arrival rate at each of an array of times"""
+        times = np.asarray(times, dtype=np.float64)
+        if self.interpolation == "linear":
+            return np.interp(times, self.times, self.rates)
+        return self.rates[np.maximum(np.searchsorted(self.times, times, side="right") - 1, 0)]
+
+    @property
+    def peak_rate(self):
+        """Function to return the highest rate of the day"""
+        return float(self.rates.max())
+
+    def breakpoints(self):
+        """Function to return the start and end of the day and every time in between that the profile changes at"""
+        inside = self.times[(self.times > 0) & (self.times < self.day_length)]
+        return np.concatenate(([0.0], inside, [self.day_length]))
+
+    def cumulative_rate(self):
+        """Function to return the (time, expected arrivals so far) points of a step profile's cumulative rate"""
+        points = self.breakpoints()
+        return points, np.concatenate(([0.0], np.cumsum(self.rate(points[:-1]) * np.diff(points))))
+
+    def expected_arrivals(self):
+        """Function to return the expected number of planes over the day (the integral of the rate)"""
+        points = self.breakpoints()
+        if self.interpolation == "step":
+            return float(self.cumulative_rate()[1][-1])
+        rates = self.rate(points)
+        return float(np.sum((rates[1:] + rates[:-1]) / 2 * np.diff(points)))
+
+
+def poisson_arrival_times(profile, rng, method=None):
+    """
+    Function to draw the sorted arrival times of a day of a non-homogeneous Poisson process, by inversion for step
+    profiles and by thinning otherwise (or as `method` says)
+    """
+    if method is None:
+        method = "inversion" if profile.interpolation == "step" else "thinning"
+
+    if method == "inversion":
+        if profile.interpolation != "step":
+            raise ValueError("Inversion is only exact for step rate profiles")
+        edges, cumulative = profile.cumulative_rate()
+        num_planes = rng.poisson(cumulative[-1])
+        return np.interp(np.sort(rng.uniform(0, cumulative[-1], num_planes)), cumulative, edges)
+
+    if method == "thinning":
+        peak_rate = profile.peak_rate
+        candidates = np.sort(rng.uniform(0, profile.day_length, rng.poisson(peak_rate * profile.day_length)))
+        return candidates[rng.random(len(candidates)) * peak_rate < profile.rate(candidates)]
+
+    raise ValueError(f"Unknown sampling method: {method}")
+
+
+def fixed_arrival_times(settings, day_length=DAY_LENGTH):
+    """
+    Function to generate the (delay, arrival time) arrays of a day of the fixed process. A new plane shows up
+    LAMBDA_<block> minutes after the previous one, with the block chosen by the time the previous plane showed up.
+    Times are accumulated one delay at a time so they match the clock of a SimPy environment to the last bit.
+    """
+    delays = []
+    block_start = 0.0
+    for block_end, block in TIME_BLOCKS:
+        if block_start >= block_end:
+            continue
+        delay = settings[f"LAMBDA_{block}"]
+        num_steps = int(np.ceil((block_end - block_start) / delay)) + 1
+        block_times = np.cumsum(np.concatenate(([block_start], np.full(num_steps, delay))))
+
+        # Only keep the steps which were started inside the block
+        num_steps = int(np.searchsorted(block_times[:-1], block_end, side="left"))
+        delays.append(np.full(num_steps, delay))
+        block_start = block_times[num_steps]
+
+    delays = np.concatenate(delays)
+    times = np.cumsum(np.concatenate(([0.0], delays)))[1:]
+
+    # Planes scheduled for midnight or later are never generated
+    num_planes = int(np.searchsorted(times, day_length, side="left"))
+    return delays[:num_planes], times[:num_planes]
+
+
+def generate_arrival_times(settings, rng=None, day_length=DAY_LENGTH):
+    """
+    Function to generate the (delay, arrival time) arrays of a day with the arrival process of the settings. Poisson
+    times are turned into delays and accumulated again one delay at a time, so they too match a SimPy clock.
+    """
+    if settings.arrival_process not in ARRIVAL_PROCESSES:
+        raise ValueError(f"Unknown arrival process: {settings.arrival_process}")
+    if settings.arrival_process == "fixed":
+        return fixed_arrival_times(settings, day_length)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    times = poisson_arrival_times(RateProfile.from_settings(settings), rng)
+    times = times[times < day_length]
+    delays = np.diff(times, prepend=0.0)
+    return delays, np.cumsum(delays)
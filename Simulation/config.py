@@ -0,0 +1,178 @@
+"""
+Configuration of a simulation run, read once from the .env file.
+
+`load_config` parses the .env file (and any variables already set in the environment, which take precedence) into an
+immutable `SimulationConfig` the first time it is called and returns the same object from then on, so nothing reads or
+parses environment variables per plane, runway or day. The traffic rates live in its `settings`, a `TrafficSettings`
+that is passed explicitly to every Airport, Runway and Plane (and, with the airport's other arguments, to worker
+processes). Worker processes also receive the whole config through `use_config`, so options given on the command line
+reach them however the processes are started.
+
+Changed copies are made with `dataclasses.replace`, e.g. `replace(config, engine="fast")`, or
+`config.settings.with_overrides({"MU_TAKEOFF": 1.6})` for a scenario's rates.
+"""
+import json
+import os
+from dataclasses import dataclass, fields, replace
+from dotenv import load_dotenv
+
+# .env names of the traffic rates, keyed by TrafficSettings field
+SETTING_NAMES = {
+    "lambda_night": "LAMBDA_NIGHT",
+    "lambda_morning": "LAMBDA_MORNING",
+    "lambda_afternoon": "LAMBDA_AFTERNOON",
+    "lambda_evening": "LAMBDA_EVENING",
+    "departure_prob_night": "DEPARTURE_PROB_NIGHT",
+    "departure_prob_morning": "DEPARTURE_PROB_MORNING",
+    "departure_prob_afternoon": "DEPARTURE_PROB_AFTERNOON",
+    "departure_prob_evening": "DEPARTURE_PROB_EVENING",
+    "mu_takeoff": "MU_TAKEOFF",
+    "mu_landing": "MU_LANDING",
+}
+
+# Arrival process settings that are not rates, with how they are parsed from the .env file
+ARRIVAL_SETTING_PARSERS = {
+    "arrival_process": str,
+    "arrival_rates": lambda value: tuple(float(rate) for rate in value.split(",")) if value else (),
+    "arrival_rate_interpolation": str,
+}
+
+# Process-wide config, loaded on first use
+_config = None
+
+
+@dataclass(frozen=True)
+class TrafficSettings:
+    """
+    Class to hold the arrival rates (mean minutes between planes), departure probabilities and runway service rates,
+    and the arrival process the planes are generated with (see `arrivals.py`). Values can also be read by their .env
+    name, e.g. `settings["MU_TAKEOFF"]`.
+    """
+    lambda_night: float
+    lambda_morning: float
+    lambda_afternoon: float
+    lambda_evening: float
+    departure_prob_night: float
+    departure_prob_morning: float
+    departure_prob_afternoon: float
+    departure_prob_evening: float
+    mu_takeoff: float
+    mu_landing: float
+    arrival_process: str = "fixed"
+    arrival_rates: tuple = ()
+    arrival_rate_interpolation: str = "step"
+
+    @classmethod
+    def from_env(cls):
+        """Function to read the settings from the environment"""
+        settings = {name: float(os.environ[env_name]) for name, env_name in SETTING_NAMES.items()}
+        for name, parse in ARRIVAL_SETTING_PARSERS.items():
+            if os.getenv(name.upper()):
+                settings[name] = parse(os.getenv(name.upper()))
+        return cls(**settings)
+
+    def __getitem__(self, env_name):
+        return getattr(self, env_name.lower())
+
+    def with_overrides(self, overrides=None):
+        """Function to return a copy with the values in `overrides` (keyed by .env name) replaced"""
+        if not overrides:
+            return self
+        changes = {}
+        for env_name, value in overrides.items():
+            name = env_name.lower()
+            if name in SETTING_NAMES:
+                changes[name] = float(value)
+            elif name in ARRIVAL_SETTING_PARSERS:
+                # Rates can also be given as a list (e.g. in a scenario file)
+                if not isinstance(value, str):
+                    value = ",".join(str(item) for item in value)
+                changes[name] = ARRIVAL_SETTING_PARSERS[name](value)
+            else:
+                raise KeyError(f"Unknown setting: {env_name}")
+        return replace(self, **changes)
+
+    def to_dict(self):
+        """Function to return the settings keyed by .env name"""
+        return {option.name.upper(): getattr(self, option.name) for option in fields(self)}
+
+
+def env_flag(value):
+    """Function to read a 1/0 (true/false, yes/no) option"""
+    return value.lower() not in ("0", "false", "no", "")
+
+
+# How options that are not strings are parsed from the .env file
+OPTION_PARSERS = {
+    "num_replications": int,
+    "num_workers": int,
+    "random_seed": int,
+    "metrics_interval": float,
+    "exclude_runways": lambda value: tuple(json.loads(value)),
+    "common_random_numbers": env_flag,
+    "mc_half_width": float,
+    "mc_confidence": float,
+    "mc_batch_size": int,
+    "mc_min_replications": int,
+    "mc_max_replications": int,
+    "checkpoint_interval": int,
+    "continuous": env_flag,
+    "warmup_days": int,
+}
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Class to hold every option of a simulation run (see the .env file for what each one does)"""
+    settings: TrafficSettings
+    num_replications: int = 31
+    exclude_runways: tuple = ()
+    num_workers: int = 1
+    random_seed: int = None
+    engine: str = "simpy"
+    results_format: str = "parquet"
+    spill_dir: str = None
+    metrics_interval: float = None
+    log_level: str = "INFO"
+    trace_file: str = None
+    trace_format: str = None
+    common_random_numbers: bool = True
+    mc_half_width: float = 0.05
+    mc_confidence: float = 0.95
+    mc_batch_size: int = 8
+    mc_min_replications: int = 10
+    mc_max_replications: int = 1000
+    mc_target: str = "mean"
+    checkpoint_interval: int = 30
+    checkpoint_dir: str = None
+    continuous: bool = False
+    warmup_days: int = 0
+    disruptions: str = None
+
+    @classmethod
+    def from_env(cls):
+        """Function to load the .env file and read the config from the environment"""
+        load_dotenv()
+        options = {"settings": TrafficSettings.from_env()}
+
+        # Options left unset or empty keep their defaults
+        for option in fields(cls):
+            value = os.getenv(option.name.upper())
+            if option.name != "settings" and value:
+                options[option.name] = OPTION_PARSERS.get(option.name, str)(value)
+        return cls(**options)
+
+
+def load_config():
+    """Function to return the process's config, reading it from the .env file the first time"""
+    global _config
+    if _config is None:
+        _config = SimulationConfig.from_env()
+    return _config
+
+
+def use_config(config):
+    """Function to make a config (e.g. one sent to a worker process) the process's config"""
+    global _config
+    _config = config
+    return config
@@ -0,0 +1,90 @@
+"""
+Continuous multi-day runs of one scenario on a single SimPy environment.
+
+A regular run simulates every day on its own environment until midnight, so planes still waiting for a runway at
+midnight are never recorded and every day starts with empty runways. A continuous run instead keeps one environment
+(and the airport's runways) for the whole run:
+    - each day's wind and traffic are still drawn from the day's own random stream, so the days see the same draws as
+    in a regular run with the same seed
+    - at midnight the wind changes in place (`Airport.reconfigure`): runways that stay in use keep their lines, planes
+    on a runway finish there, and planes still waiting move to the new runways in the order they started waiting
+    - planes are recorded on the day (and time of day) they arrived, however late they finish, and after the last
+    day the remaining planes are served until every line is empty
+The first WARMUP_DAYS days are simulated but not recorded, so the recorded days start from a loaded airport rather than
+from empty runways, which gives steady-state statistics. Recorded days are numbered from WARMUP_DAYS on.
+
+Runway changes of a disruption model (see `disruptions.py`) are applied from the start of their day; a change later
+than midnight takes place the next day. Continuous runs always use the SimPy engine.
+"""
+import simpy
+from Simulation.arrivals import DAY_LENGTH
+from Simulation.config import load_config
+from Simulation.disruptions import draw_disruptions, schedule_events
+from Simulation.plane import Plane
+from Simulation.replication import draw_replication, generate_day_seeds
+from Simulation.trace import logger
+
+
+def feed_days(airport, days, day_seeds, first_day=0):
+    """
+    Function (a SimPy process) to send the traffic of consecutive days to the airport, changing the wind at every
+    midnight. Runway metrics are kept for the days from `first_day` on.
+    """
+    env = airport.env
+    for day, day_seed in zip(days, day_seeds):
+        logger.info("Beginning Day: %s", day)
+        day_start = env.now
+        wind_direction, traffic = draw_replication(airport, day_seed)
+        if day == days[0]:
+            airport.wind_direction = wind_direction
+            airport.reset_runways()
+        else:
+            moved = airport.reconfigure(wind_direction)
+            logger.info("Moved %s waiting planes to the runways in use for wind %s", moved, wind_direction)
+        airport.set_day(day)
+
+        # Runways closed by the day's disruptions stay closed over midnight until they reopen
+        events = draw_disruptions(airport, day_seed)
+        if events:
+            schedule_events(airport, events, day_start)
+
+        # Step through the day's planes in order of arrival
+        for i in range(len(traffic)):
+            yield env.timeout(float(traffic.delays[i]))
+            plane = Plane.from_traffic(traffic, i, airport.sampler)
+            env.process(airport.fly(plane, day, day_start))
+
+        # Wait for midnight
+        yield env.timeout(max(day_start + DAY_LENGTH - env.now, 0.0))
+        if airport.metrics is not None:
+            if day >= first_day:
+                airport.metrics.finish_day(day, day_start)
+            else:
+                airport.metrics.start_day()
+        logger.info("Finished Day: %s", day)
+
+
+def simulate_continuous(airport, num_days, master_seed=None, warmup_days=None):
+    """
+    Function to simulate `num_days` recorded days of an airport on one environment, after `warmup_days` unrecorded
+    days (WARMUP_DAYS in the .env file by default). Every day's random stream is derived from the master seed.
+    """
+    if warmup_days is None:
+        warmup_days = load_config().warmup_days
+    if warmup_days < 0:
+        raise ValueError(f"Warm-up cannot be negative, got {warmup_days} days")
+
+    days = list(range(warmup_days + num_days))
+    day_seeds = generate_day_seeds(len(days), master_seed)
+    airport.wait_times.first_day = warmup_days
+    airport.continuous = True
+    airport.circle_times.first_day = warmup_days
+    if airport.env is None:
+        airport.env = simpy.Environment()
+
+    # Serve the planes still in line after the last day too
+    airport.env.process(feed_days(airport, days, day_seeds, warmup_days))
+    airport.env.run()
+    if airport.holding > 0:
+        logger.warning("%s planes were still holding for a runway when the run ended and are not recorded",
+                       airport.holding)
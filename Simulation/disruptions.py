@@ -0,0 +1,165 @@
+"""
+Runway configuration changes inside a running day: wind shifts and runway closures/reopenings.
+
+A scenario's "disruptions" object (or the JSON file set with DISRUPTIONS in the .env file, for single-scenario runs)
+sets which changes a day goes through:
+    {
+        "events": [
+            {"time": 540, "wind": "Southwest"},
+            {"time": 600, "close": ["22R"]},
+            {"time": 690, "reopen": ["22R"]}
+        ],
+        "wind_shifts_per_day": 1.5,
+        "closures_per_day": 2,
+        "mean_closure_minutes": 45
+    }
+"events" are applied every day at the given minute of the day. On top of them, each day draws a Poisson number of
+wind shifts (to a wind drawn from the airport's wind probabilities) and of closures (of a runway the scenario does not
+exclude, reopening after an exponential number of minutes) at uniform times of the day. The stochastic changes come
+from a stream derived from the day's seed that is independent of the wind/traffic draws, so scenarios sharing a
+disruption model see the same disruptions on the same traffic, and every schedule is reproducible from the master seed.
+
+While the day runs, `run_events` applies the changes through `Airport.reconfigure` at their times: runways are
+reopened and closed in place, without rebuilding the environment, planes on a runway finish there, and planes waiting
+for a runway that went out of use (every waiting plane, when the wind changes) pick a runway again. Planes with no
+runway open to them wait until one reopens, as long as a change still to come could open one to them; otherwise (e.g.
+when the excluded runways leave a class of plane without any runway) the day fails with the same error as on the fast
+engine. Days without any change run exactly as they would without disruptions
+(and on the fast engine when it is selected); days with changes need the SimPy engine.
+"""
+import json
+import numpy as np
+from dataclasses import dataclass
+from Simulation.arrivals import DAY_LENGTH
+from Simulation.trace import logger
+
+# Tag mixed into the master seed's entropy to root the disruption streams apart from every day/scenario stream
+DISRUPTION_TAG = 0x44495352
+
+
+@dataclass(frozen=True)
+class RunwayEvent:
+    """Class to hold one change to the runways: a new wind direction and/or runways closing or reopening"""
+    time: float
+    wind: str = None
+    close: tuple = ()
+    reopen: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Function to create an event from its JSON representation"""
+        return cls(float(data["time"]), data.get("wind"), tuple(data.get("close", ())), tuple(data.get("reopen", ())))
+
+    def to_dict(self):
+        """Function to return the JSON representation of the event"""
+        return {"time": self.time, "wind": self.wind, "close": list(self.close), "reopen": list(self.reopen)}
+
+
+class DisruptionModel:
+    """Class to represent the scheduled and random runway changes every simulated day goes through"""
+
+    def __init__(self, events=(), wind_shifts_per_day=0.0, closures_per_day=0.0, mean_closure_minutes=60.0):
+        self.events = sorted(events, key=lambda event: event.time)
+        self.wind_shifts_per_day = wind_shifts_per_day
+        self.closures_per_day = closures_per_day
+        self.mean_closure_minutes = mean_closure_minutes
+
+    @classmethod
+    def from_dict(cls, data):
+        """Function to create a disruption model from its JSON representation"""
+        return cls([RunwayEvent.from_dict(event) for event in data.get("events", ())],
+                   wind_shifts_per_day=float(data.get("wind_shifts_per_day", 0.0)),
+                   closures_per_day=float(data.get("closures_per_day", 0.0)),
+                   mean_closure_minutes=float(data.get("mean_closure_minutes", 60.0)))
+
+    def to_dict(self):
+        """Function to return the JSON representation of the disruption model"""
+        return {"events": [event.to_dict() for event in self.events], "wind_shifts_per_day": self.wind_shifts_per_day,
+                "closures_per_day": self.closures_per_day, "mean_closure_minutes": self.mean_closure_minutes}
+
+    def is_random(self):
+        """Function to check if the model draws any random changes"""
+        return self.wind_shifts_per_day > 0 or self.closures_per_day > 0
+
+    def draw_schedule(self, rng, wind_probabilities, runway_names, day_length=DAY_LENGTH):
+        """Function to draw a day's changes, returning them (with the scheduled ones) in order of time"""
+        events = list(self.events)
+
+        # Wind shifts
+        num_shifts = rng.poisson(self.wind_shifts_per_day)
+        if num_shifts > 0:
+            directions = list(wind_probabilities.keys())
+            winds = rng.choice(directions, size=num_shifts, p=[wind_probabilities[wind] for wind in directions])
+            times = rng.uniform(0, day_length, num_shifts)
+            events.extend(RunwayEvent(float(time), wind=str(wind)) for time, wind in zip(times.tolist(), winds))
+
+        # Closures, each reopening after an exponential time
+        num_closures = rng.poisson(self.closures_per_day) if runway_names else 0
+        if num_closures > 0:
+            closed = rng.choice(runway_names, size=num_closures)
+            starts = rng.uniform(0, day_length, num_closures)
+            ends = starts + rng.exponential(self.mean_closure_minutes, num_closures)
+            for runway, start, end in zip(closed.tolist(), starts.tolist(), ends.tolist()):
+                events.append(RunwayEvent(start, close=(runway,)))
+                events.append(RunwayEvent(end, reopen=(runway,)))
+
+        return sorted(events, key=lambda event: event.time)
+
+
+def load_disruptions(path):
+    """Function to load a disruption model from a JSON file"""
+    with open(path, "r") as file:
+        return DisruptionModel.from_dict(json.load(file))
+
+
+def disruption_root(entropy):
+    """
+    Function to return the root sequence of the disruption streams of a master seed's entropy. It mixes a tag into the
+    entropy, so no sequence spawned from it can share its state with the day, scenario or replication sequences
+    spawned from the master seed itself.
+    """
+    words = list(entropy) if isinstance(entropy, (list, tuple)) else [entropy]
+    return np.random.SeedSequence([DISRUPTION_TAG] + words)
+
+
+def disruption_rng(day_seed):
+    """
+    Function to return a day's disruption stream: the sequence at the day seed's place in the spawn tree of the
+    disruption root, so it is independent of the day's wind/traffic stream and of every other day's streams
+    """
+    if not isinstance(day_seed, np.random.SeedSequence):
+        day_seed = np.random.SeedSequence(day_seed)
+    root = disruption_root(day_seed.entropy)
+    return np.random.default_rng(np.random.SeedSequence(root.entropy, spawn_key=day_seed.spawn_key))
+
+
+def draw_disruptions(airport, day_seed):
+    """Function to return the runway changes of an airport's day (an empty list without a disruption model)"""
+    model = airport.disruptions
+    if model is None:
+        return []
+    if not model.is_random():
+        return list(model.events)
+    return model.draw_schedule(disruption_rng(day_seed), airport.data.wind, airport.closable_runways())
+
+
+def apply_event(airport, event):
+    """Function to apply a change to the airport's runways"""
+    moved = airport.reconfigure(event.wind, event.close, event.reopen)
+    logger.info("Runway change at %.2f (wind: %s, closed: %s, reopened: %s), moved %s waiting planes", event.time,
+                event.wind or airport.wind_direction, list(event.close), list(event.reopen), moved)
+
+
+def run_events(airport, events, day_start=0.0):
+    """Function (a SimPy process) to apply a day's changes as the simulation reaches their times"""
+    env = airport.env
+    for event in events:
+        yield env.timeout(max(day_start + event.time - env.now, 0.0))
+        apply_event(airport, event)
+        airport.upcoming_events.remove(event)
+
+
+def schedule_events(airport, events, day_start=0.0):
+    """Function to start applying a day's changes, keeping them with the airport's upcoming changes until applied"""
+    airport.upcoming_events.extend(events)
+    airport.env.process(run_events(airport, events, day_start))
@@ -0,0 +1,131 @@
+"""
+Fast engine to simulate a day at an airport without the SimPy event loop.
+
+Every runway is a single server serving its line first come first served, and each plane's time on the runway is
+already drawn in its day's traffic. A plane's start and end on a runway are therefore known the moment it picks the
+runway, and the whole day reduces to one pass over the planes in order of arrival:
+    - each runway keeps the time it is next free and the start times of the planes waiting in its line
+    - a plane drops the planes that started by its arrival from the line of every runway it can use, then picks the
+    runway the same way `Airport.select_runway` does (shortest line of waiting planes, last runway on ties)
+    - it starts when it arrives or when the runway frees up, whichever is later
+
+Records are then written in order of completion, and only for planes done before midnight, exactly as the SimPy
+engine (`Airport.simulate`) records them. Given the same traffic both engines produce identical records.
+
+Runway event traces and per-plane debug logging are only written by the SimPy engine.
+"""
+import numpy as np
+from collections import deque
+from Simulation.arrivals import DAY_LENGTH
+from Simulation.metrics import RunwaySeries
+from Simulation.recorder import RecordChunk
+from Simulation.traffic import generate_daily_traffic
+
+# Engines the simulator can run a day with
+ENGINES = ("simpy", "fast")
+
+
+def runway_choices(airport):
+    """
+    Function to list the runways (as indexes into the airport's runways) each kind of plane picks from, keyed by
+    (departing, jet), as precomputed by the airport's routing
+    """
+    return airport.routing.choices
+
+
+def schedule_planes(times, departing, jet, service_time, choices, num_runways):
+    """Function to assign every plane a runway and return the (runway, start, end) arrays of the day"""
+    num_planes = len(times)
+    runway_of = [0] * num_planes
+    starts = [0.0] * num_planes
+    ends = [0.0] * num_planes
+    free_at = [0.0] * num_runways
+    lines = [deque() for _ in range(num_runways)]
+
+    for i, (time, is_departing, is_jet, duration) in enumerate(zip(times.tolist(), departing.tolist(), jet.tolist(),
+                                                                     service_time.tolist())):
+        # Find the runway with the shortest line
+        best = -1
+        best_length = 0
+        for runway in choices[(is_departing, is_jet)]:
+            line = lines[runway]
+            while line and line[0] <= time:
+                line.popleft()
+            if best < 0 or len(line) <= best_length:
+                best = runway
+                best_length = len(line)
+        if best < 0:
+            raise KeyError(f"No runway available for {'departing' if is_departing else 'arriving'} plane")
+
+        # Wait for the runway to be free
+        start = free_at[best]
+        if start > time:
+            lines[best].append(start)
+        else:
+            start = time
+        end = start + duration
+        free_at[best] = end
+
+        runway_of[i] = best
+        starts[i] = start
+        ends[i] = end
+
+    return np.array(runway_of, dtype=np.int32), np.array(starts), np.array(ends)
+
+
+def records_chunk(airport, traffic, planes, runway_of, ends, runway_names):
+    """Function to build a chunk of records for a set of planes (indexes into the traffic)"""
+    sampler = airport.sampler
+    airline = traffic.airline[planes]
+    arrival_times = traffic.times[planes]
+    columns = {
+        "day": np.full(len(planes), airport.day, dtype=np.int32),
+        "time": np.array([round(time / 60, 2) for time in arrival_times.tolist()]),
+        "wait_time": np.array([round(end - time, 2) for end, time in zip(ends[planes].tolist(),
+                                                                         arrival_times.tolist())]),
+        "flight_number": traffic.flight_number[planes],
+        "airline": sampler.airline_code[airline],
+        "route": sampler.route_code[traffic.route[planes]],
+        "flight_prefix": sampler.airline_code[airline],
+        "aircraft": sampler.aircraft_code[traffic.aircraft[planes]],
+        "wind": np.zeros(len(planes), dtype=np.int32),
+        "runway": runway_of[planes],
+    }
+    strings = {
+        "airline": sampler.airline_names,
+        "route": sampler.route_names,
+        "flight_prefix": sampler.flight_prefixes,
+        "aircraft": sampler.aircraft_codes,
+        "wind": [airport.wind_direction],
+        "runway": runway_names,
+    }
+    return RecordChunk(columns, strings)
+
+
+def simulate_traffic(airport, traffic, day_length=DAY_LENGTH):
+    """Function to run a day of traffic through the airport's current runways, recording every finished plane"""
+    runway_names = list(airport.runways.keys())
+    runway_of, starts, ends = schedule_planes(traffic.times, traffic.departing, traffic.jet, traffic.service_time,
+                                              runway_choices(airport), len(runway_names))
+
+    # Record planes in the order they finish, dropping the ones still going at midnight
+    order = np.argsort(ends, kind="stable")
+    order = order[ends[order] < day_length]
+    departing = traffic.departing[order]
+    airport.wait_times.extend(records_chunk(airport, traffic, order[departing], runway_of, ends, runway_names))
+    airport.circle_times.extend(records_chunk(airport, traffic, order[~departing], runway_of, ends, runway_names))
+
+    # Runway metrics follow from the schedule
+    if airport.metrics is not None:
+        for runway, name in enumerate(runway_names):
+            planes = runway_of == runway
+            airport.metrics.series[name] = RunwaySeries.from_schedule(traffic.times[planes], starts[planes],
+                                                                      ends[planes])
+    return runway_of, starts, ends
+
+
+def simulate_fast(airport, traffic=None):
+    """Function to simulate a day at the airport with the fast engine, drawing the day's traffic if none is given"""
+    if traffic is None:
+        traffic = generate_daily_traffic(airport.sampler, settings=airport.settings, rng=airport.rng)
+    return simulate_traffic(airport, traffic)
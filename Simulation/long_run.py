@@ -0,0 +1,153 @@
+"""
+Year-scale runs of one scenario that flush completed days to disk and can resume after a crash.
+
+`run_long_horizon` simulates the days of a run in blocks of CHECKPOINT_INTERVAL days. After every block it:
+    - saves the block's departure/arrival records (and runway metrics) to their day partitions of the results
+    - folds the block's records into the run's streaming statistics (see `monte_carlo.ScenarioStatistics`)
+    - drops the records from memory, so the run needs the same memory for a week as for a decade
+    - atomically replaces the run's checkpoint with its master seed, next day and statistics
+Every day draws its wind and traffic from its own stream spawned from the master seed, so the master seed and the next
+day are all a resumed run needs to simulate the same days an uninterrupted run would have, and the saved results of
+both are identical. Long runs keep their results, checkpoints and summary in `Data/results/long_run/`, apart from the
+results of ordinary runs of the same scenario. Restarting a run that stopped (or was preempted) with the same command
+picks it up from its last checkpoint; days simulated after that checkpoint are simulated again, their partitions
+overwritten and their events cut from the run's trace, which keeps the events of the days before it.
+
+A checkpoint can also be resumed with more days than it was started with, to extend a finished run.
+"""
+import os
+import pickle
+import numpy as np
+from Simulation.config import load_config
+from Simulation.monte_carlo import ScenarioStatistics, save_summary, summarize
+from Simulation.replication import generate_day_seeds, simulate_day
+from Simulation.results import RESULTS_DIR, resolve_format
+from Simulation.trace import logger
+
+# Version of the checkpoint layout, bumped whenever it changes
+CHECKPOINT_VERSION = 2
+
+# Directory long runs save their results to
+LONG_RUN_DIR = os.path.join(RESULTS_DIR, "long_run")
+
+
+class LongRunState:
+    """Class to hold everything a long run needs to carry on from its last checkpoint"""
+
+    def __init__(self, scenario, key, entropy, results_format):
+        self.version = CHECKPOINT_VERSION
+        self.scenario = scenario
+        self.key = key
+        self.entropy = entropy
+        self.results_format = results_format
+        self.next_day = 0
+        self.statistics = ScenarioStatistics(scenario)
+
+
+def run_key(airport):
+    """Function to return what a run's results depend on besides its seed, so a checkpoint is only resumed by its run"""
+    return airport.airport_code, airport.settings, tuple(sorted(airport.ignore_runways))
+
+
+def checkpoint_path(scenario, checkpoint_dir):
+    """Function to return the path of a scenario's checkpoint"""
+    return os.path.join(checkpoint_dir, f"long_run_{scenario}.pkl")
+
+
+def save_checkpoint(state, path):
+    """Function to save a checkpoint, replacing the previous one only once the new one is completely written"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        pickle.dump(state, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """Function to load a checkpoint, or return None when there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as file:
+        state = pickle.load(file)
+    if state.version != CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint {path} has version {state.version}, expected {CHECKPOINT_VERSION}")
+    return state
+
+
+def check_checkpoint(state, airport, entropy, results_format):
+    """Function to make sure a checkpoint belongs to the run about to resume it"""
+    if state.key != run_key(airport):
+        raise ValueError(f"Checkpoint of {state.scenario} was made with a different airport, runways or settings")
+    if entropy is not None and entropy != state.entropy:
+        raise ValueError(f"Checkpoint of {state.scenario} was made with master seed {state.entropy}, not {entropy}")
+    if results_format != state.results_format:
+        raise ValueError(f"Checkpoint of {state.scenario} saves {state.results_format} results, not {results_format}")
+
+
+def flush_days(airport, state, next_day, results_format, results_dir, replace):
+    """Function to save the days recorded since the last checkpoint, add them to the statistics and drop them"""
+    airport.save_simulation_data(results_format, results_dir, replace)
+    state.statistics.update("departure", airport.wait_times.to_chunk())
+    state.statistics.update("arrival", airport.circle_times.to_chunk())
+    airport.clear_records()
+    if airport.trace is not None:
+        airport.trace.flush()
+
+    state.next_day = next_day
+
+
+def run_long_horizon(airport, num_days, master_seed=None, engine="simpy", checkpoint_interval=None,
+                     checkpoint_dir=None, results_format=None, results_dir=LONG_RUN_DIR, resume=True):
+    """
+    Function to simulate `num_days` days of an airport, saving the results and a checkpoint every
+    `checkpoint_interval` days (CHECKPOINT_INTERVAL in the .env file by default). With `resume` a run carries on from
+    the scenario's checkpoint when there is one. Returns the run's state, whose statistics cover every day simulated.
+    """
+    config = load_config()
+    if checkpoint_interval is None:
+        checkpoint_interval = config.checkpoint_interval
+    if checkpoint_interval < 1:
+        raise ValueError(f"Checkpoint interval must be at least one day, got {checkpoint_interval}")
+    if checkpoint_dir is None:
+        checkpoint_dir = config.checkpoint_dir or os.path.join(results_dir, "checkpoints")
+    results_format = resolve_format(results_format)
+    path = checkpoint_path(airport.simulation_type, checkpoint_dir)
+
+    state = load_checkpoint(path) if resume else None
+    if state is not None:
+        check_checkpoint(state, airport, master_seed, results_format)
+        logger.info("Resuming %s from the checkpoint after day %s", state.scenario, state.next_day - 1)
+    else:
+        # Keep the master seed, drawn from the OS when none is given, so the run can be resumed
+        state = LongRunState(airport.simulation_type, run_key(airport), np.random.SeedSequence(master_seed).entropy,
+                             results_format)
+
+    # Keep the traced days the checkpoint covers, and only those (none for a fresh run)
+    if airport.trace is not None:
+        airport.trace.truncate(state.next_day)
+
+    # Days spawned from the same master seed are the same however many of them are spawned
+    day_seeds = generate_day_seeds(max(num_days, state.next_day), state.entropy)
+    replace = state.next_day == 0
+    while state.next_day < num_days:
+        block_end = min(state.next_day + checkpoint_interval, num_days)
+        for day in range(state.next_day, block_end):
+            simulate_day(airport, day, day_seeds[day], engine=engine)
+
+        flush_days(airport, state, block_end, results_format, results_dir, replace)
+        save_checkpoint(state, path)
+        replace = False
+        logger.info("Checkpointed %s after %s of %s days", state.scenario, block_end, num_days)
+
+    if state.next_day > num_days:
+        logger.warning("Checkpoint of %s already covers %s days, more than the %s asked for", state.scenario,
+                       state.next_day, num_days)
+    return state
+
+
+def save_long_run_summary(state, confidence=0.95, results_dir=LONG_RUN_DIR):
+    """Function to save the summary of a long run's statistics to `long_run_summary_<scenario>.csv`"""
+    save_summary(summarize({state.scenario: state.statistics}, confidence), f"long_run_summary_{state.scenario}.csv",
+                 results_dir)
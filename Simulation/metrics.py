@@ -0,0 +1,191 @@
+"""
+Per-runway queue length, utilization and throughput time series.
+
+Every runway of a day gets a `RunwaySeries` recording its state (number of planes waiting in its line, and whether a
+plane is on it) each time that state changes, plus the time every plane clears it. The SimPy engine records these as
+it goes; the fast engine builds them from the day's schedule in one go. At the end of the day the step functions are
+integrated onto a fixed grid of METRICS_INTERVAL minutes, giving for every runway and interval:
+    - queue_mean: time-weighted mean number of planes waiting
+    - queue_max: largest number of planes waiting
+    - utilization: fraction of the interval the runway was in use
+    - throughput: number of planes that finished taking off/landing
+Each day is kept as a compact (runways x intervals) array per metric and saved to
+`Data/results/metrics/scenario=<name>/day=<day>.npz`.
+"""
+import os
+import shutil
+import numpy as np
+from Simulation.arrivals import DAY_LENGTH
+from Simulation.config import load_config
+from Simulation.results import RESULTS_DIR
+
+# Metrics kept for every runway and interval
+METRIC_NAMES = ("queue_mean", "queue_max", "utilization", "throughput")
+
+
+def resolve_interval(interval=None):
+    """Function to return the metrics interval (METRICS_INTERVAL in the .env file by default), None when disabled"""
+    if interval is None:
+        interval = load_config().metrics_interval
+    if not interval:
+        return None
+    return float(interval)
+
+
+def grid_edges(interval, day_length=DAY_LENGTH):
+    """Function to return the edges of the intervals a day is split into"""
+    return np.append(np.arange(0, day_length, interval), day_length)
+
+
+def integrate_step_function(times, values, edges):
+    """
+    Function to integrate a step function (starting at 0, taking `values[k]` from `times[k]` on) over every interval
+    between `edges`, returning its time-weighted means and maxima
+    """
+    times = np.concatenate(([edges[0]], np.asarray(times, dtype=np.float64)))
+    values = np.concatenate(([0.0], np.asarray(values, dtype=np.float64)))
+    keep = times < edges[-1]
+    times, values = times[keep], values[keep]
+
+    # Integral of the step function at every state change, then at every edge
+    integral = np.concatenate(([0.0], np.cumsum(values[:-1] * np.diff(times))))
+    last = np.searchsorted(times, edges, side="right") - 1
+    edge_integral = integral[last] + values[last] * (edges - times[last])
+    means = np.diff(edge_integral) / np.diff(edges)
+
+    # Largest value of each interval, counting the value it starts with
+    maxima = values[last[:-1]].copy()
+    interval_of = np.searchsorted(edges, times, side="right") - 1
+    np.maximum.at(maxima, interval_of, values)
+    return means, maxima
+
+
+class RunwaySeries:
+    """Class to record the state changes of one runway over a day"""
+
+    def __init__(self):
+        self.times = []
+        self.queue = []
+        self.busy = []
+        self.completions = []
+
+    def record(self, time, queue_length, busy):
+        """Function to record the runway's state after a change"""
+        self.times.append(time)
+        self.queue.append(queue_length)
+        self.busy.append(busy)
+
+    def complete(self, time):
+        """Function to record a plane clearing the runway"""
+        self.completions.append(time)
+
+    @classmethod
+    def from_schedule(cls, arrivals, starts, ends):
+        """Function to build the state changes of a runway from the (arrival, start, end) times of its planes"""
+        waited = starts > arrivals
+        times = np.concatenate((arrivals[waited], starts[waited], starts, ends))
+        queue_changes = np.concatenate((np.ones(waited.sum()), -np.ones(waited.sum()), np.zeros(2 * len(starts))))
+        busy_changes = np.concatenate((np.zeros(2 * waited.sum()), np.ones(len(starts)), -np.ones(len(ends))))
+        order = np.argsort(times, kind="stable")
+
+        series = cls()
+        series.times = times[order]
+        series.queue = np.cumsum(queue_changes[order])
+        series.busy = np.cumsum(busy_changes[order])
+        series.completions = ends
+        return series
+
+
+class DayMetrics:
+    """Class to hold the metrics of every runway of one day as (runways x intervals) arrays"""
+
+    def __init__(self, day, runways, edges, queue_mean, queue_max, utilization, throughput):
+        self.day = day
+        self.runways = runways
+        self.edges = edges
+        self.queue_mean = queue_mean
+        self.queue_max = queue_max
+        self.utilization = utilization
+        self.throughput = throughput
+
+    @classmethod
+    def from_series(cls, day, series, edges, offset=0.0):
+        """
+        Function to integrate the series of every runway onto the intervals between `edges`, counted from `offset`
+        (the simulation time the day starts at)
+        """
+        runways = list(series.keys())
+        day_edges = edges + offset
+        shape = (len(runways), len(edges) - 1)
+        queue_mean, queue_max, utilization = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        throughput = np.zeros(shape, dtype=np.int32)
+        for row, runway in enumerate(runways):
+            runway_series = series[runway]
+            queue_mean[row], queue_max[row] = integrate_step_function(runway_series.times, runway_series.queue,
+                                                                      day_edges)
+            utilization[row] = integrate_step_function(runway_series.times, runway_series.busy, day_edges)[0]
+            completions = np.asarray(runway_series.completions, dtype=np.float64)
+            completions = completions[completions < day_edges[-1]]
+            throughput[row] = np.bincount(np.searchsorted(day_edges, completions, side="right") - 1,
+                                          minlength=shape[1])[:shape[1]]
+        return cls(day, runways, edges, queue_mean, queue_max.astype(np.int32), utilization, throughput)
+
+    def save(self, path):
+        """Function to save the day's metrics to a .npz file"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, day=self.day, runways=np.array(self.runways), edges=self.edges,
+                            **{name: getattr(self, name) for name in METRIC_NAMES})
+
+    @classmethod
+    def load(cls, path):
+        """Function to load a day's metrics saved with `save`"""
+        with np.load(path) as data:
+            return cls(int(data["day"]), data["runways"].tolist(), data["edges"],
+                       **{name: data[name] for name in METRIC_NAMES})
+
+
+class MetricsRecorder:
+    """Class to collect the runway metrics of every simulated day of an airport"""
+
+    def __init__(self, interval, day_length=DAY_LENGTH):
+        self.interval = interval
+        self.edges = grid_edges(interval, day_length)
+        self.series = {}
+        self.days = {}
+
+    def start_day(self):
+        """Function to start recording a new day"""
+        self.series = {}
+
+    def runway_series(self, runway):
+        """Function to return the series a runway records its state changes in for the current day"""
+        return self.series.setdefault(runway, RunwaySeries())
+
+    def finish_day(self, day, offset=0.0):
+        """Function to integrate the current day's series (starting at simulation time `offset`) onto the grid"""
+        self.days[day] = DayMetrics.from_series(day, self.series, self.edges, offset)
+        self.series = {}
+
+    def merge(self, other):
+        """Function to add the days recorded by another recorder (e.g. in a worker process)"""
+        self.days.update(other.days)
+
+    def clear(self):
+        """Function to drop every recorded day (e.g. once they are saved)"""
+        self.days = {}
+
+    def save(self, scenario, results_dir=RESULTS_DIR, replace=True):
+        """
+        Function to save every recorded day of a scenario, replacing its previous metrics (or, without `replace`, only
+        the days recorded)
+        """
+        scenario_dir = os.path.join(results_dir, "metrics", f"scenario={scenario}")
+        if replace and os.path.isdir(scenario_dir):
+            shutil.rmtree(scenario_dir)
+        for day, day_metrics in sorted(self.days.items()):
+            day_metrics.save(os.path.join(scenario_dir, f"day={day}.npz"))
+
+
+def load_metrics(scenario, day, results_dir=RESULTS_DIR):
+    """Function to load the runway metrics of one day of a scenario"""
+    return DayMetrics.load(os.path.join(results_dir, "metrics", f"scenario={scenario}", f"day={day}.npz"))
@@ -0,0 +1,227 @@
+"""
+Monte Carlo driver that runs replications until the results are precise enough.
+
+Every replication is one simulated day. Replications are run in batches (across a pool of worker processes when
+NUM_WORKERS > 1), and after every batch the records of each scenario are folded into streaming statistics:
+    - per plane: mean, standard deviation and quantiles of the wait/circle times, overall and per runway
+    - per replication: the mean of each day's wait/circle times, which are independent across replications and give
+    the confidence interval of the mean wait/circle time
+
+With common random numbers (the default) every scenario sees the same wind, traffic and runway service draws in a
+replication, so each scenario's difference to the first (baseline) scenario is measured pairwise, replication by
+replication, with a much narrower confidence interval than two independent runs would give.
+
+The run stops as soon as the confidence interval half-width of the target ("mean": every scenario's mean wait and
+circle time, "difference": every scenario's paired difference to the baseline) is below the target half-width (after
+a minimum number of replications), or when the maximum number of replications is reached. Replication seeds are
+spawned from the master seed in order, so the first N replications are the same days a fixed run of N days with the
+same seed would simulate.
+"""
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from Simulation.config import load_config
+from Simulation.recorder import ResultRecorder, create_string_tables
+from Simulation.replication import group_scenarios, simulate_days
+from Simulation.results import DIRECTIONS, RESULTS_DIR
+from Simulation.streaming_stats import RunningStats, StreamingSummary
+from Simulation.trace import logger
+
+# Name of the group holding every runway
+ALL_RUNWAYS = "All"
+
+# Quantiles reported in the summary
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99)
+
+# What the stopping rule is applied to
+TARGETS = ("mean", "difference")
+
+
+def daily_means(days, wait_times):
+    """Function to return the days covered by a set of planes and their mean wait/circle time on each day"""
+    day_values, day_index = np.unique(days, return_inverse=True)
+    return day_values, np.bincount(day_index, weights=wait_times) / np.bincount(day_index)
+
+
+class GroupStatistics:
+    """Class to accumulate the statistics of one group of planes (a direction of a scenario, or one runway of it)"""
+
+    def __init__(self):
+        self.planes = StreamingSummary()
+        self.replications = RunningStats()
+
+    def update(self, days, wait_times):
+        """Function to add the wait/circle times of a set of planes and the mean of every day they cover"""
+        self.planes.add_many(wait_times)
+        for mean in daily_means(days, wait_times)[1].tolist():
+            self.replications.add(mean)
+
+
+class ScenarioStatistics:
+    """Class to accumulate the statistics of one scenario, overall and per runway"""
+
+    def __init__(self, name):
+        self.name = name
+        self.groups = {direction: {} for direction in DIRECTIONS}
+        self.differences = {direction: RunningStats() for direction in DIRECTIONS}
+
+    def group(self, direction, runway=ALL_RUNWAYS):
+        """Function to return the statistics of a group, creating them the first time"""
+        return self.groups[direction].setdefault(runway, GroupStatistics())
+
+    def update(self, direction, chunk):
+        """Function to fold a chunk of departure/arrival records into the statistics"""
+        if len(chunk) == 0:
+            return
+        days = chunk.columns["day"]
+        wait_times = chunk.columns["wait_time"]
+        self.group(direction).update(days, wait_times)
+
+        runways = chunk.columns["runway"]
+        for code in np.unique(runways).tolist():
+            planes = runways == code
+            self.group(direction, chunk.strings["runway"][code]).update(days[planes], wait_times[planes])
+
+    def update_differences(self, direction, chunk, baseline_chunk):
+        """Function to add the paired differences of the scenario's daily means to those of the baseline scenario"""
+        days, means = daily_means(chunk.columns["day"], chunk.columns["wait_time"])
+        baseline_days, baseline_means = daily_means(baseline_chunk.columns["day"], baseline_chunk.columns["wait_time"])
+        _, index, baseline_index = np.intersect1d(days, baseline_days, return_indices=True)
+        for difference in (means[index] - baseline_means[baseline_index]).tolist():
+            self.differences[direction].add(difference)
+
+    def half_width(self, confidence=0.95, target="mean"):
+        """Function to return the widest confidence interval half-width of the scenario's means or differences"""
+        if target == "difference":
+            return max(self.differences[direction].half_width(confidence) for direction in DIRECTIONS)
+        return max(self.group(direction).replications.half_width(confidence) for direction in DIRECTIONS)
+
+
+def split_batch(days, num_workers):
+    """Function to split the days of a batch into one contiguous block per worker"""
+    return [[int(day) for day in block] for block in np.array_split(np.array(days), num_workers) if len(block) > 0]
+
+
+def run_batch(groups, days, group_seeds, executor, num_workers, engine):
+    """
+    Function to simulate a batch of days of every group of scenarios (see `group_scenarios`), returning a dict of
+    (wait chunk, circle chunk) by scenario name
+    """
+    if executor is None:
+        return {name: (wait_times, circle_times)
+                for (scenario_kwargs, _), day_seeds in zip(groups, group_seeds)
+                for name, wait_times, circle_times, _ in simulate_days(scenario_kwargs, days, day_seeds, engine)}
+
+    seeds = [dict(zip(days, day_seeds)) for day_seeds in group_seeds]
+    futures = [executor.submit(simulate_days, scenario_kwargs, block, [day_seeds[day] for day in block], engine,
+                               load_config())
+               for (scenario_kwargs, _), day_seeds in zip(groups, seeds) for block in split_batch(days, num_workers)]
+
+    # Merge the blocks of every scenario in day order, so statistics are updated the same way as in a serial run
+    recorders = {}
+    for future in futures:
+        for name, block_wait_times, block_circle_times, _ in future.result():
+            if name not in recorders:
+                string_tables = create_string_tables()
+                recorders[name] = (ResultRecorder(string_tables), ResultRecorder(string_tables))
+            recorders[name][0].extend(block_wait_times)
+            recorders[name][1].extend(block_circle_times)
+    return {name: (wait_times.to_chunk(), circle_times.to_chunk()) for name, (wait_times, circle_times)
+            in recorders.items()}
+
+
+def run_monte_carlo(scenarios, half_width, confidence=0.95, batch_size=8, min_replications=10,
+                    max_replications=1000, num_workers=1, master_seed=None, engine="simpy",
+                    common_random_numbers=True, target="mean"):
+    """
+    Function to run replications of every scenario in batches until the confidence interval half-width (in minutes)
+    of the target (every scenario's mean wait and circle time, or every scenario's paired difference to the first
+    scenario) is below `half_width`. Returns the statistics of every scenario and the number of replications run.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target: {target}")
+    if target == "difference" and len(scenarios) < 2:
+        raise ValueError("Paired differences need at least two scenarios")
+
+    groups = group_scenarios(scenarios, common_random_numbers)
+    seed_sequences = [np.random.SeedSequence(master_seed)]
+    if not common_random_numbers:
+        seed_sequences = np.random.SeedSequence(master_seed).spawn(len(scenarios))
+    statistics = {scenario.name: ScenarioStatistics(scenario.name) for scenario in scenarios}
+    baseline = scenarios[0].name
+    executor = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+
+    num_replications = 0
+    try:
+        while num_replications < max_replications:
+            size = min(batch_size, max_replications - num_replications)
+            days = list(range(num_replications, num_replications + size))
+            group_seeds = [seed_sequence.spawn(size) for seed_sequence in seed_sequences]
+
+            results = run_batch(groups, days, group_seeds, executor, num_workers, engine)
+            for name, (wait_times, circle_times) in results.items():
+                statistics[name].update("departure", wait_times)
+                statistics[name].update("arrival", circle_times)
+                if name != baseline:
+                    statistics[name].update_differences("departure", wait_times, results[baseline][0])
+                    statistics[name].update_differences("arrival", circle_times, results[baseline][1])
+            num_replications += size
+
+            # Stop once every scenario is precise enough
+            widest = max(statistics[scenario.name].half_width(confidence, target) for scenario in scenarios
+                         if target == "mean" or scenario.name != baseline)
+            logger.info("Finished %s replications, widest %s%% confidence interval half-width of the %s: %.4f minutes",
+                        num_replications, round(confidence * 100), target, widest)
+            if num_replications >= min_replications and widest <= half_width:
+                break
+        else:
+            logger.warning("Stopped at the maximum of %s replications before reaching a half-width of %s minutes",
+                           max_replications, half_width)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return statistics, num_replications
+
+
+def summarize(statistics, confidence=0.95):
+    """Function to turn the statistics of every scenario into a summary table"""
+    rows = []
+    for name, scenario_statistics in statistics.items():
+        for direction in DIRECTIONS:
+            groups = scenario_statistics.groups[direction]
+            for runway in [ALL_RUNWAYS] + sorted(runway for runway in groups if runway != ALL_RUNWAYS):
+                group = groups.get(runway)
+                if group is None:
+                    continue
+                row = {
+                    "Scenario": name,
+                    "Direction": direction,
+                    "Runway": runway,
+                    "Replications": group.replications.count,
+                    "Planes": group.planes.stats.count,
+                    "Mean": group.planes.stats.mean,
+                    "Std": group.planes.stats.std,
+                    "Replication Mean": group.replications.mean,
+                    "CI Half Width": group.replications.half_width(confidence),
+                    "Max": group.planes.stats.maximum,
+                }
+                for q in SUMMARY_QUANTILES:
+                    row[f"P{round(q * 100)}"] = group.planes.quantile(q)
+
+                # Paired difference of the scenario's mean to the baseline scenario
+                differences = scenario_statistics.differences[direction]
+                paired = runway == ALL_RUNWAYS and differences.count > 0
+                row["Paired Difference"] = differences.mean if paired else np.nan
+                row["Paired CI Half Width"] = differences.half_width(confidence) if paired else np.nan
+                rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def save_summary(summary, file_name="monte_carlo_summary.csv", results_dir=RESULTS_DIR):
+    """Function to save a Monte Carlo summary table"""
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, file_name)
+    logger.info("Saving Monte Carlo summary to %s", path)
+    summary.to_csv(path, index=False)
@@ -1,115 +1,110 @@
-import numpy as np
-import random
-import os
-from Data.final_data import airports, probabilities, airlines
-from dotenv import load_dotenv
-
-# Replace defunct airlines with airlines that bought them
-replacement_airlines = {
-    "FL": "WN",
-    "US": "AA",
-    "CO": "UA",
-    "NW": "DL",
-    "VX": "AS",
-    "UN": "BA"
-}
-
-# Set of non-jet plane models
-non_jet = {"DH4", "CNA", "SF3", "DH1", "DH3", "DH8"}
-
-
-def choose_airline(departing):
-    """Function to randomly choose an airline for an aircraft"""
-    if departing:
-        airline_codes = [i for i in probabilities["Departures"].keys()]
-        airline_probabilities = [probabilities["Departures"][i]["Probability"] for i in probabilities["Departures"].keys()]
-    else:
-        airline_codes = [i for i in probabilities["Arrivals"].keys()]
-        airline_probabilities = [probabilities["Arrivals"][i]["Probability"] for i in probabilities["Arrivals"].keys()]
-
-    airline_code = np.random.choice(airline_codes, p=airline_probabilities)
-
-    if airline_code in replacement_airlines.keys():
-        replacement_code = replacement_airlines[airline_code]
-        flight_number = f"{replacement_code}{random.randint(10, 10000)}"
-        airline_name = airlines[replacement_code]["Name"]
-
-    else:
-        flight_number = f"{airline_code}{random.randint(10,10000)}"
-        airline_name = airlines[airline_code]["Name"]
-
-    return airline_name, flight_number, airline_code
-
-
-def choose_route(departing, airline_code):
-    """Function to choose where a plane is going to/coming from"""
-    if departing:
-        routes = [i for i in probabilities["Departures"][airline_code]["Routes"].keys()]
-        route_probabilities = [probabilities["Departures"][airline_code]['Routes'][i]["Probability"] \
-                               for i in probabilities["Departures"][airline_code]['Routes'].keys()]
-    else:
-        routes = [i for i in probabilities["Arrivals"][airline_code]["Routes"].keys()]
-        route_probabilities = [probabilities["Arrivals"][airline_code]['Routes'][i]["Probability"] \
-                               for i in probabilities["Arrivals"][airline_code]['Routes'].keys()]
-
-    route = np.random.choice(routes, p=route_probabilities)
-    route_airport = f"{airports[route]['Name']}; {airports[route]['City']}, {airports[route]['Country']}"
+from Data.data_cache import load_data
+from Simulation.config import load_config
+from Simulation.sampler import PlaneSampler
 
-    return route, route_airport
+# Sampler shared by planes built without one, made on first use
+_sampler = None
 
 
-def choose_aircraft(departing, airline_code, route):
-    """Function to choose what kind of aircraft a plane is"""
-    if departing:
-        aircrafts = [i for i in probabilities["Departures"][airline_code]["Routes"][route]['Aircrafts'].keys()]
-        aircraft_probabilities = [probabilities["Departures"][airline_code]["Routes"][route]['Aircrafts'][i]["Probability"] \
-                                  for i in probabilities["Departures"][airline_code]["Routes"][route]['Aircrafts'].keys()]
-    else:
-        aircrafts = [i for i in probabilities["Arrivals"][airline_code]["Routes"][route]['Aircrafts'].keys()]
-        aircraft_probabilities = [probabilities["Arrivals"][airline_code]["Routes"][route]['Aircrafts'][i]["Probability"] \
-                                  for i in probabilities["Arrivals"][airline_code]["Routes"][route]['Aircrafts'].keys()]
-
-    aircraft = np.random.choice(aircrafts, p=aircraft_probabilities)
-
-    if aircraft in non_jet:
-        jet = False
-    else:
-        jet = True
-
-    return aircraft, jet
+def shared_sampler():
+    """
+    Function to return the sampler shared by planes built without one, building it from the cached probability tables
+    (and seeding it with RANDOM_SEED from the .env file) the first time
+    """
+    global _sampler
+    if _sampler is None:
+        data = load_data()
+        _sampler = PlaneSampler(data.tables, data.strings, seed=load_config().random_seed)
+    return _sampler
 
 
-def determine_departing(time_of_day):
+def determine_departing(time_of_day, settings=None, rng=None):
     """Function to choose if an aircraft is departing or arriving"""
+    if settings is None:
+        settings = load_config().settings
+    if rng is None:
+        rng = shared_sampler().rng
+
     if time_of_day < 6*60:
-        return np.random.choice([True, False],
-                                p=[float(os.getenv("DEPARTURE_PROB_NIGHT")), float(os.getenv("ARRIVAL_PROB_NIGHT"))])
+        departure_prob = settings.departure_prob_night
     elif time_of_day < 12*60:
-        return np.random.choice([True, False],
-                                p=[float(os.getenv("DEPARTURE_PROB_MORNING")), float(os.getenv("ARRIVAL_PROB_MORNING"))])
+        departure_prob = settings.departure_prob_morning
     elif time_of_day < 18*60:
-        return np.random.choice([True, False],
-                                p=[float(os.getenv("DEPARTURE_PROB_AFTERNOON")), float(os.getenv("ARRIVAL_PROB_AFTERNOON"))])
+        departure_prob = settings.departure_prob_afternoon
     else:
-        return np.random.choice([True, False],
-                                p=[float(os.getenv("DEPARTURE_PROB_EVENING")), float(os.getenv("ARRIVAL_PROB_EVENING"))])
+        departure_prob = settings.departure_prob_evening
+    return bool(rng.random() < departure_prob)
 
 
 class Plane:
-
-    def __init__(self, time_of_day):
-        """Class to represent a plane for our simulation"""
-        # Load env file
-        load_dotenv()
+    """
+    Class to represent a plane for our simulation. A plane only keeps integer codes into its sampler's string tables
+    (airline, route, aircraft) next to its flags, flight number and runway time; display strings are looked up from
+    the sampler when asked for, and records store the codes directly (see `ResultRecorder.record_plane`).
+    """
+
+    __slots__ = ("sampler", "departing", "jet", "airline_code", "route_code", "aircraft_code", "number",
+                 "service_time")
+
+    def __init__(self, time_of_day, plane_sampler=None, settings=None, rng=None):
+        if plane_sampler is None:
+            plane_sampler = shared_sampler()
+        if rng is None:
+            rng = plane_sampler.rng
+        self.sampler = plane_sampler
 
         # Randomly choose if the plane is departing or arriving
-        self.departing = determine_departing(time_of_day)
-
-        # Randomly choose the plane's airline based off of its departure status
-        self.airline, self.flight_number, airline_code = choose_airline(self.departing)
-
-        # Randomly choose the route the plane is flying based off its departure status and airline
-        route_code, self.route = choose_route(self.departing, airline_code)
-
-        # Randomly choose the plane's model based off its departure status, airline, and route
-        self.aircraft_type, self.jet = choose_aircraft(self.departing, airline_code, route_code)
+        self.departing = determine_departing(time_of_day, settings, rng)
+
+        # Randomly choose the plane's airline, route and model based off of its departure status
+        airline, route, aircraft, number = plane_sampler.draw(self.departing, rng)
+        self.airline_code = int(plane_sampler.airline_code[airline])
+        self.route_code = int(plane_sampler.route_code[route])
+        self.aircraft_code = int(plane_sampler.aircraft_code[aircraft])
+        self.number = int(number)
+        self.jet = plane_sampler.is_jet(aircraft)
+
+        # Time on the runway is drawn by the runway
+        self.service_time = None
+
+    @classmethod
+    def from_traffic(cls, traffic, index, plane_sampler=None):
+        """Function to build a plane from row `index` of a day's pre-drawn traffic"""
+        if plane_sampler is None:
+            plane_sampler = shared_sampler()
+
+        plane = cls.__new__(cls)
+        plane.sampler = plane_sampler
+        plane.departing = bool(traffic.departing[index])
+        plane.airline_code = int(plane_sampler.airline_code[traffic.airline[index]])
+        plane.route_code = int(plane_sampler.route_code[traffic.route[index]])
+        plane.aircraft_code = int(plane_sampler.aircraft_code[traffic.aircraft[index]])
+        plane.number = int(traffic.flight_number[index])
+        plane.jet = bool(traffic.jet[index])
+        plane.service_time = float(traffic.service_time[index])
+        return plane
+
+    @property
+    def airline(self):
+        """Function to return the plane's airline name"""
+        return self.sampler.airline_names[self.airline_code]
+
+    @property
+    def flight_prefix(self):
+        """Function to return the plane's flight number prefix"""
+        return self.sampler.flight_prefixes[self.airline_code]
+
+    @property
+    def flight_number(self):
+        """Function to return the plane's flight number string"""
+        return f"{self.flight_prefix}{self.number}"
+
+    @property
+    def route(self):
+        """Function to return the display name of the plane's route"""
+        return self.sampler.route_names[self.route_code]
+
+    @property
+    def aircraft_type(self):
+        """Function to return the plane's aircraft type"""
+        return self.sampler.aircraft_codes[self.aircraft_code]
@@ -0,0 +1,337 @@
+"""
+Analytical estimates of runway queues, computed straight from the traffic settings and runway table without simulating.
+
+Every runway is a single server whose planes take an exponential time to take off (rate MU_TAKEOFF) or land (rate
+MU_LANDING), fed by the planes of the classes (departing/arriving, jet/non-jet) that may use it under the routing of a
+wind direction (see `routing.py`). The day is cut into periods over which the arrival rate and departure probability
+are constant (the LAMBDA_* blocks, or the hours of ARRIVAL_RATES), and for each wind direction and period:
+    - each class's planes per minute are split over its runways so their utilizations are as even as possible, the
+    load the shortest-line choice of `Airport.select_runway` tends towards
+    - each runway's expected wait in line follows the M/G/1 (Pollaczek-Khinchine) formula for its mix of take-offs and
+    landings, scaled by the Allen-Cunneen factor for the regularity of its arrivals: ARRIVAL_PROCESS=poisson arrivals
+    are Poisson, while the "fixed" process sends evenly spaced planes that only become irregular as they are split
+    over runways
+    - planes still in line at the end of a period are carried into the next one as a fluid backlog, so overloaded
+    periods (utilization of 1 or more) grow a line that later periods work off instead of having no estimate
+    - planes of a class no runway is open to (e.g. arrivals in a Northeast wind with 4L and 4R excluded) are never
+    served: they are kept in an UNSERVED row of the period with an infinite wait, which carries into the means
+A plane's expected wait (or circle time) is its expected time in line plus its own take-off (or landing), the same
+quantity the simulator records. Estimates per wind direction are weighted by the airport's wind probabilities. As the
+runways are treated as separate queues, while a plane picks whichever of its runways has the shortest line, estimates
+of busy (but not overloaded) periods err on the long side.
+
+Estimating an airport takes milliseconds, so thousands of runway configurations and rate settings can be screened
+before simulating the promising ones. `cross_check` compares an estimate with the records of a simulation of the same
+scenario. Disruptions (see `disruptions.py`) are not part of the estimates.
+"""
+import os
+import numpy as np
+import pandas as pd
+from Data.data_cache import load_data
+from Simulation.arrivals import DAY_LENGTH, TIME_BLOCKS, RateProfile
+from Simulation.results import RESULTS_DIR
+from Simulation.routing import RoutingTable
+from Simulation.sampler import PlaneSampler
+from Simulation.trace import logger
+from Simulation.traffic import departure_probabilities, load_settings
+
+# Plane classes in the order their rates are kept in, as (departing, jet)
+PLANE_CLASSES = ((True, True), (True, False), (False, True), (False, False))
+
+# Runway name of the rows holding the planes no runway is open to
+UNSERVED = "unserved"
+
+# Columns of the per runway estimates
+ESTIMATE_COLUMNS = ("wind", "wind_probability", "period_start", "period_end", "runway", "departures_per_hour",
+                    "arrivals_per_hour", "utilization", "expected_wait", "expected_circle_time", "stable")
+
+
+def arrival_periods(settings, day_length=DAY_LENGTH):
+    """
+    Function to cut the day into periods of constant arrival rate and departure probability, returning their starts,
+    ends, mean arrival rates (planes per minute) and departure probabilities
+    """
+    profile = RateProfile.from_settings(settings)
+    block_ends = [block_end for block_end, _ in TIME_BLOCKS[:-1]]
+    edges = np.unique(np.concatenate((profile.breakpoints(), block_ends)))
+    edges = edges[(edges >= 0) & (edges <= day_length)]
+    starts, ends = edges[:-1], edges[1:]
+
+    # Linear profiles are straight between the edges, so their mean is the mean of the ends
+    if profile.interpolation == "linear":
+        rates = (profile.rate(starts) + profile.rate(ends)) / 2
+    else:
+        rates = profile.rate(starts)
+    return starts, ends, rates, departure_probabilities(settings, starts)
+
+
+def balance_loads(loads, candidates, num_runways, tolerance=1e-12, max_sweeps=100):
+    """
+    Function to split each class's load (utilization it brings) over its candidate runways so that the runways'
+    utilizations are as even as possible, by filling each class's runways up to a common level in turn until nothing
+    moves. Returns the load of each class on each runway; classes without candidate runways get none (see
+    `unserved_rates`).
+    """
+    shares = np.zeros((len(loads), num_runways))
+    for _ in range(max_sweeps):
+        change = 0.0
+        for k, (load, runways) in enumerate(zip(loads, candidates)):
+            if load <= 0 or not runways:
+                continue
+            runways = list(runways)
+            others = shares.sum(axis=0)[runways] - shares[k, runways]
+
+            # Level the runways with the least load first
+            order = np.argsort(others)
+            filled = others[order]
+            level = filled[-1]
+            for i in range(1, len(filled) + 1):
+                level = (load + filled[:i].sum()) / i
+                if i == len(filled) or level <= filled[i]:
+                    break
+            new = np.maximum(level - others, 0.0)
+            change = max(change, float(np.abs(new - shares[k, runways]).max()))
+            shares[k, runways] = new
+        if change < tolerance:
+            break
+    return shares
+
+
+def unserved_rates(class_rates, candidates):
+    """Function to return the planes per minute of the classes without candidate runways, as (departures, arrivals)"""
+    unserved = np.array([rate if not runways else 0.0 for rate, runways in zip(class_rates, candidates)])
+    return float(unserved[:2].sum()), float(unserved[2:].sum())
+
+
+def mg1_wait(rate, mean_service, second_moment, arrival_variability=1.0):
+    """
+    Function to return the steady-state expected wait in line of a single server from its arrival rate and the first
+    two moments of its service time: the Pollaczek-Khinchine formula, scaled by the Allen-Cunneen factor
+    (arrival_variability + 1) / 2 when the arrivals are not Poisson (arrival_variability is their squared coefficient
+    of variation)
+    """
+    utilization = rate * mean_service
+    service_variability = second_moment / mean_service**2 - 1
+    return utilization * mean_service * (arrival_variability + service_variability) / (2 * (1 - utilization))
+
+
+def queue_wait(departures, arrivals, mu_takeoff, mu_landing, arrival_variability, backlog, length):
+    """
+    Function to estimate a runway's expected wait in line over a period from its take-offs and landings per minute,
+    returning (utilization, expected wait, backlog left at the end of the period, stable)
+    """
+    rate = departures + arrivals
+    if rate <= 0:
+        # Nothing arrives to wait, any backlog is worked off at full speed
+        return 0.0, 0.0, max(backlog - length, 0.0), True
+
+    mean_service = (departures / mu_takeoff + arrivals / mu_landing) / rate
+    second_moment = 2 * (departures / mu_takeoff**2 + arrivals / mu_landing**2) / rate
+    utilization = rate * mean_service
+
+    # Fluid backlog carried in from the previous period, drained (or grown) at 1 - utilization minutes per minute
+    drift = utilization - 1
+    if drift >= 0:
+        mean_backlog = backlog + drift * length / 2
+        return utilization, mean_backlog, backlog + drift * length, False
+
+    drain_time = backlog / -drift
+    if drain_time >= length:
+        mean_backlog = backlog + drift * length / 2
+    else:
+        mean_backlog = backlog * drain_time / (2 * length)
+    steady_wait = mg1_wait(rate, mean_service, second_moment, arrival_variability)
+    return utilization, steady_wait + mean_backlog, max(backlog + drift * length, 0.0), True
+
+
+def estimate_routing(routing, settings, jet_probabilities, periods, poisson):
+    """
+    Function to estimate every runway of a wind direction's routing over the periods of the day, as rows, with an
+    UNSERVED row for the periods with planes no runway is open to
+    """
+    starts, ends, rates, departure_probs = periods
+    runways = routing.runways
+    candidates = [routing.choices[plane_class] for plane_class in PLANE_CLASSES]
+    mu = np.array([settings.mu_takeoff, settings.mu_takeoff, settings.mu_landing, settings.mu_landing])
+
+    rows = []
+    backlogs = np.zeros(len(runways))
+    for start, end, rate, departure_prob in zip(starts.tolist(), ends.tolist(), rates.tolist(),
+                                                departure_probs.tolist()):
+        # Planes per minute of each class, and the utilization they bring wherever they go
+        class_rates = rate * np.array([departure_prob * jet_probabilities[True],
+                                       departure_prob * (1 - jet_probabilities[True]),
+                                       (1 - departure_prob) * jet_probabilities[False],
+                                       (1 - departure_prob) * (1 - jet_probabilities[False])])
+        runway_rates = balance_loads(class_rates / mu, candidates, len(runways)) * mu[:, None]
+        departures = runway_rates[:2].sum(axis=0)
+        arrivals = runway_rates[2:].sum(axis=0)
+
+        for i, runway in enumerate(runways):
+            # Evenly spaced planes split at random over the runways arrive less regularly the fewer a runway gets
+            variability = 1.0 if poisson or rate <= 0 else 1 - (departures[i] + arrivals[i]) / rate
+            utilization, wait, backlogs[i], stable = queue_wait(departures[i], arrivals[i], settings.mu_takeoff,
+                                                                settings.mu_landing, variability, backlogs[i],
+                                                                end - start)
+            rows.append((routing.wind, start, end, runway, departures[i] * 60, arrivals[i] * 60, utilization,
+                         wait + 1 / settings.mu_takeoff, wait + 1 / settings.mu_landing, stable))
+
+        # Planes without a runway wait forever
+        unserved_departures, unserved_arrivals = unserved_rates(class_rates, candidates)
+        if unserved_departures > 0 or unserved_arrivals > 0:
+            rows.append((routing.wind, start, end, UNSERVED, unserved_departures * 60, unserved_arrivals * 60, np.nan,
+                         np.inf if unserved_departures > 0 else np.nan,
+                         np.inf if unserved_arrivals > 0 else np.nan, False))
+    return rows
+
+
+def traffic_mean(frame, value, weight):
+    """Function to average a column of estimates weighted by planes per hour and the length of their periods"""
+    weights = frame[weight] * (frame["period_end"] - frame["period_start"])
+    return float((frame[value] * weights).sum() / weights.sum()) if weights.sum() > 0 else float("nan")
+
+
+class QueueingEstimate:
+    """Class to hold the analytical queue estimates of a scenario, per wind direction, period and runway"""
+
+    def __init__(self, scenario, runways):
+        self.scenario = scenario
+        self.runways = runways
+
+    def periods(self):
+        """Function to return the expected wait and circle time of every wind direction and period of the day"""
+        rows = []
+        for (wind, start, end), frame in self.runways.groupby(["wind", "period_start", "period_end"], sort=False):
+            rows.append({"wind": wind, "period_start": start, "period_end": end,
+                         "departures_per_hour": frame["departures_per_hour"].sum(),
+                         "arrivals_per_hour": frame["arrivals_per_hour"].sum(),
+                         "expected_wait": traffic_mean(frame, "expected_wait", "departures_per_hour"),
+                         "expected_circle_time": traffic_mean(frame, "expected_circle_time", "arrivals_per_hour"),
+                         "max_utilization": frame["utilization"].max()})
+        return pd.DataFrame(rows)
+
+    def summary(self):
+        """Function to return the expected daily traffic, wait and circle time of each wind direction and overall"""
+        rows = []
+        for wind, frame in self.runways.groupby("wind", sort=False):
+            length = frame["period_end"] - frame["period_start"]
+            rows.append({"scenario": self.scenario, "wind": wind,
+                         "wind_probability": frame["wind_probability"].iloc[0],
+                         "departures": float((frame["departures_per_hour"] * length).sum() / 60),
+                         "arrivals": float((frame["arrivals_per_hour"] * length).sum() / 60),
+                         "expected_wait": traffic_mean(frame, "expected_wait", "departures_per_hour"),
+                         "expected_circle_time": traffic_mean(frame, "expected_circle_time", "arrivals_per_hour"),
+                         "max_utilization": frame["utilization"].max(), "stable": bool(frame["stable"].all())})
+        summary = pd.DataFrame(rows)
+
+        # Overall, every wind direction counts by its probability and traffic
+        probability = summary["wind_probability"]
+        overall = {"scenario": self.scenario, "wind": "all", "wind_probability": float(probability.sum()),
+                   "departures": float((summary["departures"] * probability).sum()),
+                   "arrivals": float((summary["arrivals"] * probability).sum()),
+                   "expected_wait": float((summary["expected_wait"] * summary["departures"] * probability).sum() /
+                                          (summary["departures"] * probability).sum()),
+                   "expected_circle_time": float((summary["expected_circle_time"] * summary["arrivals"] *
+                                                  probability).sum() / (summary["arrivals"] * probability).sum()),
+                   "max_utilization": summary["max_utilization"].max(), "stable": bool(summary["stable"].all())}
+        return pd.concat([summary, pd.DataFrame([overall])], ignore_index=True)
+
+    def save(self, results_dir=RESULTS_DIR):
+        """Function to save the per runway estimates and summary to `queueing_estimate[_summary]_<scenario>.csv`"""
+        os.makedirs(results_dir, exist_ok=True)
+        path = os.path.join(results_dir, f"queueing_estimate_{self.scenario}.csv")
+        logger.info("Saving queueing estimate for %s to %s", self.scenario, path)
+        self.runways.to_csv(path, index=False)
+        self.summary().to_csv(os.path.join(results_dir, f"queueing_estimate_summary_{self.scenario}.csv"),
+                              index=False)
+
+
+def estimate_queues(routing_table, settings, wind_probabilities, jet_probabilities, scenario="control"):
+    """
+    Function to estimate the runway queues of every wind direction of a routing table. `jet_probabilities` holds the
+    probability that a plane is a jet, keyed by whether it is departing.
+    """
+    periods = arrival_periods(settings)
+    poisson = settings.arrival_process == "poisson"
+    rows = []
+    for wind, probability in wind_probabilities.items():
+        routing = routing_table.routing(wind)
+        unserved = [plane_class for plane_class in PLANE_CLASSES if not routing.classes[plane_class]]
+        if unserved:
+            logger.warning("%s: no runway is open to %s in a %s wind, their expected wait is infinite", scenario,
+                           ", ".join(f"{'departing' if departing else 'arriving'} {'jets' if jet else 'non-jets'}"
+                                     for departing, jet in unserved), wind)
+        for row in estimate_routing(routing, settings, jet_probabilities, periods, poisson):
+            rows.append(row[:1] + (probability,) + row[1:])
+    return QueueingEstimate(scenario, pd.DataFrame(rows, columns=list(ESTIMATE_COLUMNS)))
+
+
+def sampler_jet_probabilities(sampler):
+    """Function to return the probability that a departing (True) or arriving (False) plane is a jet"""
+    return {departing: sampler.jet_probability(departing) for departing in (True, False)}
+
+
+def estimate_airport(airport):
+    """Function to estimate the runway queues of an airport, with its runways, settings and wind probabilities"""
+    return estimate_queues(airport.routing_table, airport.settings, airport.data.wind,
+                           sampler_jet_probabilities(airport.sampler), airport.simulation_type)
+
+
+def estimate_scenario(scenario):
+    """Function to estimate the runway queues of a scenario without building its airport"""
+    data = load_data(scenario.airport)
+    return estimate_queues(RoutingTable(scenario.runway_table(), scenario.exclude_runways),
+                           load_settings(scenario.overrides), data.wind,
+                           sampler_jet_probabilities(PlaneSampler(data.tables, data.strings)), scenario.name)
+
+
+def simulated_periods(frame, value, edges):
+    """Function to average a column of simulated records per wind direction and period of the day"""
+    period = np.minimum(np.searchsorted(edges, frame["Time"].to_numpy() * 60, side="right") - 1, len(edges) - 2)
+    return frame.assign(period_start=edges[period]).groupby(["Wind", "period_start"])[value].agg(["mean", "count"])
+
+
+def cross_check(estimate, wait_times, circle_times):
+    """
+    Function to compare an estimate with the departure/arrival records of a simulation of its scenario, per wind
+    direction and period of the day (planes are counted in the period they joined a line in)
+    """
+    periods = estimate.periods()
+    edges = np.unique(np.concatenate((periods["period_start"], periods["period_end"])))
+    departures = simulated_periods(wait_times.to_frame("Wait Time"), "Wait Time", edges)
+    arrivals = simulated_periods(circle_times.to_frame("Circle Time"), "Circle Time", edges)
+
+    rows = []
+    for period in periods.itertuples(index=False):
+        key = (period.wind, period.period_start)
+        departed = departures.loc[key] if key in departures.index else None
+        arrived = arrivals.loc[key] if key in arrivals.index else None
+        rows.append({"wind": period.wind, "period_start": period.period_start, "period_end": period.period_end,
+                     "simulated_departures": int(departed["count"]) if departed is not None else 0,
+                     "simulated_wait": departed["mean"] if departed is not None else float("nan"),
+                     "expected_wait": period.expected_wait,
+                     "simulated_arrivals": int(arrived["count"]) if arrived is not None else 0,
+                     "simulated_circle_time": arrived["mean"] if arrived is not None else float("nan"),
+                     "expected_circle_time": period.expected_circle_time,
+                     "max_utilization": period.max_utilization})
+    return pd.DataFrame(rows)
+
+
+def save_cross_check(estimate, wait_times, circle_times, results_dir=RESULTS_DIR):
+    """Function to cross-check an estimate with a simulation, saving the check to `queueing_check_<scenario>.csv`"""
+    check = cross_check(estimate, wait_times, circle_times)
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"queueing_check_{estimate.scenario}.csv")
+    logger.info("Saving queueing cross-check for %s to %s", estimate.scenario, path)
+    check.to_csv(path, index=False)
+
+    # Overall means over the simulated planes
+    for planes, simulated, expected, name in (("simulated_departures", "simulated_wait", "expected_wait", "wait"),
+                                              ("simulated_arrivals", "simulated_circle_time", "expected_circle_time",
+                                               "circle time")):
+        counted = check[check[planes] > 0]
+        if len(counted) > 0:
+            logger.info("%s mean %s: simulated %.3f, estimated %.3f minutes", estimate.scenario, name,
+                        np.average(counted[simulated], weights=counted[planes]),
+                        np.average(counted[expected], weights=counted[planes]))
+    return check
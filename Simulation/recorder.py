@@ -0,0 +1,257 @@
+"""
+Columnar recorder for the results of a simulation.
+
+Every finished take-off or landing becomes one row of preallocated numpy columns. Numeric fields (day, time, wait
+time, flight number) are stored directly, and the text fields (airline, route, flight prefix, aircraft type, wind
+and runway) are stored as small integer codes into string tables shared by all recorders of an airport. Display
+strings are only rebuilt when the results are turned into a DataFrame.
+
+A recorder can spill its rows to disk in chunks of `chunk_size` rows, so long or many-scenario runs keep a flat memory
+footprint.
+"""
+import os
+import numpy as np
+import pandas as pd
+
+# Columns stored as numbers
+NUMERIC_COLUMNS = {"day": np.int32, "time": np.float64, "wait_time": np.float64, "flight_number": np.int32}
+
+# Columns stored as codes into string tables
+CODED_COLUMNS = ("airline", "route", "flight_prefix", "aircraft", "wind", "runway")
+
+
+class StringTable:
+    """Class to intern strings as small integer codes"""
+
+    def __init__(self, values=()):
+        self.values = []
+        self.codes = {}
+        for value in values:
+            self.intern(value)
+
+    @classmethod
+    def aligned(cls, values):
+        """
+        Function to create a table whose codes are the positions of `values`, so codes into another list of strings
+        can be stored as they are (a repeated string keeps the code of its first position when interned)
+        """
+        table = cls()
+        table.values = list(values)
+        for code, value in enumerate(table.values):
+            table.codes.setdefault(value, code)
+        return table
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, value):
+        """Function to return the code of a string, adding it to the table if needed"""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def create_string_tables(sampler=None):
+    """
+    Function to create the set of string tables shared by the recorders of an airport. With a `sampler`, the airline,
+    flight prefix, route and aircraft tables start out as the sampler's own, so the codes its planes carry can be
+    recorded without looking up any strings.
+    """
+    tables = {column: StringTable() for column in CODED_COLUMNS}
+    if sampler is not None:
+        tables["airline"] = StringTable.aligned(sampler.airline_names)
+        tables["flight_prefix"] = StringTable.aligned(sampler.flight_prefixes)
+        tables["route"] = StringTable.aligned(sampler.route_names)
+        tables["aircraft"] = StringTable.aligned(sampler.aircraft_codes)
+    return tables
+
+
+class RecordChunk:
+    """Class to hold a block of recorded rows together with the strings their codes refer to"""
+
+    def __init__(self, columns, strings):
+        self.columns = columns
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.columns["time"])
+
+
+class ResultRecorder:
+    """Class to record take-off/landing results in growable numpy columns"""
+
+    def __init__(self, tables=None, capacity=1024, spill_dir=None, chunk_size=1000000, sampler=None):
+        if tables is None:
+            tables = create_string_tables(sampler)
+
+        self.tables = tables
+        self.sampler = sampler
+        self.spill_dir = spill_dir
+        self.chunk_size = chunk_size
+        self.spilled_chunks = []
+        self.num_spilled = 0
+        self.day = 0
+        self.first_day = 0
+        self.size = 0
+        self.columns = {}
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Function to (re)allocate the in-memory columns, keeping the rows recorded so far"""
+        columns = {column: np.empty(capacity, dtype=dtype) for column, dtype in NUMERIC_COLUMNS.items()}
+        columns.update({column: np.empty(capacity, dtype=np.int32) for column in CODED_COLUMNS})
+        for column, values in self.columns.items():
+            columns[column][:self.size] = values[:self.size]
+        self.columns = columns
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.num_spilled + self.size
+
+    def record(self, time, airline, route, flight_prefix, flight_number, aircraft, wind, runway, wait_time, day=None):
+        """
+        Function to record a finished take-off/landing on `day` (the recorder's current day by default). Planes of days
+        before `first_day` (a warm-up period) are not recorded.
+        """
+        tables = self.tables
+        self.record_codes(time, tables["airline"].intern(airline), tables["route"].intern(route),
+                          tables["flight_prefix"].intern(flight_prefix), flight_number,
+                          tables["aircraft"].intern(aircraft), tables["wind"].intern(wind),
+                          tables["runway"].intern(runway), wait_time, day)
+
+    def record_plane(self, time, plane, wind, runway, wait_time, day=None):
+        """
+        Function to record a plane's finished take-off/landing, storing its codes as they are when the string tables
+        follow the plane's sampler
+        """
+        if plane.sampler is not self.sampler:
+            self.record(time, plane.airline, plane.route, plane.flight_prefix, plane.number, plane.aircraft_type, wind,
+                        runway, wait_time, day)
+            return
+        tables = self.tables
+        self.record_codes(time, plane.airline_code, plane.route_code, plane.airline_code, plane.number,
+                          plane.aircraft_code, tables["wind"].intern(wind), tables["runway"].intern(runway), wait_time,
+                          day)
+
+    def record_codes(self, time, airline, route, flight_prefix, flight_number, aircraft, wind, runway, wait_time,
+                     day=None):
+        """Function to record a finished take-off/landing whose text fields are already codes into the string tables"""
+        if day is None:
+            day = self.day
+        if day < self.first_day:
+            return
+        if self.size == self.capacity:
+            if self.spill_dir is not None and self.size >= self.chunk_size:
+                self.spill()
+            else:
+                self.allocate(2 * self.capacity)
+
+        row = self.size
+        columns = self.columns
+        columns["day"][row] = day
+        columns["time"][row] = time
+        columns["wait_time"][row] = wait_time
+        columns["flight_number"][row] = flight_number
+        columns["airline"][row] = airline
+        columns["route"][row] = route
+        columns["flight_prefix"][row] = flight_prefix
+        columns["aircraft"][row] = aircraft
+        columns["wind"][row] = wind
+        columns["runway"][row] = runway
+        self.size += 1
+
+    def spill(self):
+        """Function to write the in-memory rows to a chunk file and start over"""
+        if self.size == 0:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"chunk_{os.getpid()}_{id(self)}_{len(self.spilled_chunks)}.npz")
+        np.savez(path, **{column: values[:self.size] for column, values in self.columns.items()})
+        self.spilled_chunks.append(path)
+        self.num_spilled += self.size
+        self.size = 0
+
+    def clear(self):
+        """Function to drop every recorded row, deleting the spilled chunks, while keeping the string tables"""
+        for path in self.spilled_chunks:
+            if os.path.exists(path):
+                os.remove(path)
+        self.spilled_chunks = []
+        self.num_spilled = 0
+        self.size = 0
+
+    def strings(self):
+        """Function to snapshot the string tables the codes refer to"""
+        return {column: list(table.values) for column, table in self.tables.items()}
+
+    def iter_chunks(self):
+        """Function to iterate over the recorded rows in chunks, spilled chunks first"""
+        strings = self.strings()
+        for path in self.spilled_chunks:
+            with np.load(path) as data:
+                yield RecordChunk({column: data[column] for column in data.files}, strings)
+        if self.size > 0:
+            yield RecordChunk({column: values[:self.size].copy() for column, values in self.columns.items()},
+                              strings)
+
+    def to_chunk(self):
+        """Function to return every recorded row as a single chunk (e.g. to send it between processes)"""
+        chunks = list(self.iter_chunks())
+        if not chunks:
+            return RecordChunk({column: values[:0].copy() for column, values in self.columns.items()},
+                               self.strings())
+        return RecordChunk({column: np.concatenate([chunk.columns[column] for chunk in chunks])
+                            for column in chunks[0].columns}, chunks[0].strings)
+
+    def extend(self, chunk):
+        """Function to append the rows of a chunk, translating its codes into this recorder's string tables"""
+        num_rows = len(chunk)
+        while self.size + num_rows > self.capacity:
+            self.allocate(2 * self.capacity)
+
+        rows = slice(self.size, self.size + num_rows)
+        for column in NUMERIC_COLUMNS:
+            self.columns[column][rows] = chunk.columns[column]
+        for column in CODED_COLUMNS:
+            # Only intern the strings the chunk actually uses
+            codes = chunk.columns[column]
+            used = np.unique(codes)
+            translation = np.zeros(len(chunk.strings[column]), dtype=np.int32)
+            translation[used] = [self.tables[column].intern(chunk.strings[column][code]) for code in used.tolist()]
+            self.columns[column][rows] = translation[codes]
+        self.size += num_rows
+
+        if self.spill_dir is not None and self.size >= self.chunk_size:
+            self.spill()
+
+    def to_frame(self, wait_column, include_day=False):
+        """Function to turn the recorded rows into a DataFrame with display strings"""
+        return pd.concat([chunk_to_frame(chunk, wait_column, include_day) for chunk in self.iter_chunks()] or
+                         [chunk_to_frame(self.to_chunk(), wait_column, include_day)], ignore_index=True)
+
+
+def chunk_to_frame(chunk, wait_column, include_day=False):
+    """Function to turn a chunk of rows into a DataFrame, resolving codes to strings"""
+    columns = chunk.columns
+
+    def resolve(column):
+        return np.array(chunk.strings[column], dtype=object)[columns[column]] if len(chunk) > 0 else []
+
+    flight_numbers = [f"{prefix}{number}" for prefix, number in zip(resolve("flight_prefix"),
+                                                                     columns["flight_number"].tolist())]
+    frame = pd.DataFrame({
+        "Time": columns["time"],
+        "Airline": resolve("airline"),
+        "Destination": resolve("route"),
+        "Flight Number": flight_numbers,
+        "Aircraft Type": resolve("aircraft"),
+        "Wind": resolve("wind"),
+        "Runway": resolve("runway"),
+        wait_column: columns["wait_time"],
+    })
+    if include_day:
+        frame.insert(0, "Day", columns["day"])
+    return frame
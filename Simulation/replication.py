@@ -0,0 +1,147 @@
+"""
+Replications: the random streams of simulated days, and simulating days of one or more scenarios from them.
+
+Every day of a run draws its wind, traffic and runway service times from its own stream, spawned in order from the
+master seed, so any day (or block of days, e.g. in a worker process) can be simulated on its own and give the same
+records it would in a serial run. Scenarios that can share a day's draws (same airport and settings) are fed the same
+draws, so they are compared on common random numbers. The simulator's run modes (single scenario, sweep, Monte Carlo,
+long and continuous runs) are all built on these functions.
+"""
+import numpy as np
+import simpy
+from Simulation.airport import Airport, find_wind_direction
+from Simulation.config import load_config, use_config
+from Simulation.disruptions import draw_disruptions, schedule_events
+from Simulation.fast_engine import ENGINES, simulate_fast
+from Simulation.trace import logger, open_trace
+from Simulation.traffic import generate_daily_traffic
+
+
+def generate_day_seeds(num_days, master_seed=None):
+    """Function to derive one independent random stream per day from a master seed"""
+    return np.random.SeedSequence(master_seed).spawn(num_days)
+
+
+def generate_scenario_day_seeds(num_scenarios, num_days, master_seed=None):
+    """Function to derive independent random streams per day for each of a list of scenarios"""
+    return [sequence.spawn(num_days) for sequence in np.random.SeedSequence(master_seed).spawn(num_scenarios)]
+
+
+def resolve_engine(engine=None):
+    """Function to pick the engine days are simulated with (ENGINE in the .env file by default)"""
+    if engine is None:
+        engine = load_config().engine
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    return engine
+
+
+def resolve_common_random_numbers(common_random_numbers=None):
+    """Function to check if scenarios share random numbers (COMMON_RANDOM_NUMBERS in the .env file by default)"""
+    if common_random_numbers is None:
+        common_random_numbers = load_config().common_random_numbers
+    return common_random_numbers
+
+
+def draw_replication(airport, day_seed):
+    """Function to draw a replication's wind and traffic (including runway service times) from its seed"""
+    airport.seed(day_seed)
+    wind = find_wind_direction(airport.rng, airport.data.wind)
+    traffic = generate_daily_traffic(airport.sampler, settings=airport.settings, rng=airport.rng)
+    return wind, traffic
+
+
+def replication_key(airport):
+    """Function to return what a replication's draws depend on, so airports with the same key can share them"""
+    return airport.airport_code, airport.settings
+
+
+def simulate_day(airport, day, day_seed, env=None, engine="simpy", replication=None):
+    """
+    Function to simulate a single day of departures/landings at an airport. `replication` is the (wind, traffic) of
+    the day from `draw_replication`, and is drawn from `day_seed` when not given. Days with runway changes (see
+    `disruptions.py`) run on the SimPy engine.
+    """
+    logger.info("Beginning Day: %s", day)
+    if env is None:
+        env = simpy.Environment()
+
+    # Reset airport params
+    if replication is None:
+        replication = draw_replication(airport, day_seed)
+    airport.env = env
+    airport.wind_direction, traffic = replication
+    airport.runway_status = {}
+    airport.closing_runways = {}
+    airport.upcoming_events = []
+    airport.reset_runways()
+    airport.set_day(day)
+    events = draw_disruptions(airport, day_seed)
+
+    # Run simulation
+    if engine == "fast" and not events:
+        simulate_fast(airport, traffic)
+    else:
+        env.process(airport.simulate(traffic))
+        if events:
+            schedule_events(airport, events)
+        env.run(until=24*60)
+    if airport.metrics is not None:
+        airport.metrics.finish_day(day)
+    logger.info("Finished Day: %s", day)
+
+
+def run_days(scenario_kwargs, days, day_seeds, engine="simpy"):
+    """
+    Function to simulate a block of days of one or more scenarios, given as (name, airport kwargs) pairs, and return
+    their airports. Each day's wind and traffic are drawn once and fed to every scenario that can share them (same
+    airport and settings), so the scenarios are compared on common random numbers.
+    """
+    airports = [Airport(simpy.Environment(), name, trace=open_trace(suffix=f"{name}.{days[0]}"), **airport_kwargs)
+                for name, airport_kwargs in scenario_kwargs]
+
+    for day, day_seed in zip(days, day_seeds):
+        replications = {}
+        for airport in airports:
+            key = replication_key(airport)
+            if key not in replications:
+                replications[key] = (draw_replication(airport, day_seed), airport.rng.bit_generator.state)
+            else:
+                # Carry on the day's stream from where the shared draws left it, as if this airport had drawn them
+                airport.seed(day_seed)
+                airport.rng.bit_generator.state = replications[key][1]
+            simulate_day(airport, day, day_seed, engine=engine, replication=replications[key][0])
+
+    for airport in airports:
+        if airport.trace is not None:
+            airport.trace.close()
+
+    return airports
+
+
+def simulate_days(scenario_kwargs, days, day_seeds, engine="simpy", config=None):
+    """
+    Function to simulate a block of days of one or more scenarios in a worker process, returning the (name, departure
+    records, arrival records, runway metrics) of every scenario. `config` is the parent process's config.
+    """
+    if config is not None:
+        use_config(config)
+    return [(airport.simulation_type, airport.wait_times.to_chunk(), airport.circle_times.to_chunk(), airport.metrics)
+            for airport in run_days(scenario_kwargs, days, day_seeds, engine)]
+
+
+def split_days(num_days, num_workers):
+    """Function to split the days of a run into one contiguous block per worker"""
+    return [[int(day) for day in block] for block in np.array_split(np.arange(num_days), num_workers)
+            if len(block) > 0]
+
+
+def group_scenarios(scenarios, common_random_numbers):
+    """
+    Function to group the scenarios of a sweep into (scenario kwargs, seed sequence) pairs. With common random numbers
+    every scenario shares one group and the master seed's streams; otherwise each scenario gets its own streams.
+    """
+    scenario_kwargs = [(scenario.name, scenario.airport_kwargs()) for scenario in scenarios]
+    if common_random_numbers:
+        return [(scenario_kwargs, None)]
+    return [([kwargs], index) for index, kwargs in enumerate(scenario_kwargs)]
@@ -0,0 +1,150 @@
+"""
+Reading and writing of simulation results.
+
+Results are written to `Data/results/` as a dataset partitioned by scenario and replication day:
+    Data/results/<direction>/scenario=<name>/day=<day>/part-0.<format>
+where <direction> is "departure" or "arrival". Each file holds the typed columns of one day of one scenario, so the
+analysis side only reads the scenarios, days and columns it asks for. The format is set with RESULTS_FORMAT in the
+.env file: "parquet" (the default) and "feather" are compressed columnar files and need pyarrow, "csv" keeps plain
+text files. Without pyarrow the results fall back to CSV.
+
+`load_results` also reads the flat `Data/<direction>_results_<scenario>.csv` files written by earlier versions of the
+simulation when no partitioned results exist for a scenario.
+"""
+import importlib.util
+import os
+import shutil
+import pandas as pd
+from Simulation.config import load_config
+from Simulation.trace import logger
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data")
+RESULTS_DIR = os.path.join(DATA_DIR, "results")
+RESULTS_FORMATS = ("parquet", "feather", "csv")
+DIRECTIONS = {"departure": "Wait Time", "arrival": "Circle Time"}
+
+# Text columns, read as strings from CSV files even when every value looks like a number (e.g. runway "27")
+TEXT_COLUMNS = {column: str for column in
+                ("Airline", "Destination", "Flight Number", "Aircraft Type", "Wind", "Runway")}
+
+
+def resolve_format(results_format=None):
+    """Function to pick the results format, falling back to CSV when pyarrow is not installed"""
+    if results_format is None:
+        results_format = load_config().results_format
+    results_format = results_format.lower()
+    if results_format not in RESULTS_FORMATS:
+        raise ValueError(f"Unknown results format: {results_format}")
+
+    if results_format != "csv" and importlib.util.find_spec("pyarrow") is None:
+        logger.warning("pyarrow is not installed, saving results as csv instead of %s", results_format)
+        results_format = "csv"
+    return results_format
+
+
+def partition_path(direction, scenario, day, results_format, results_dir=RESULTS_DIR):
+    """Function to return the path of the file holding one day of one scenario"""
+    return os.path.join(results_dir, direction, f"scenario={scenario}", f"day={day}", f"part-0.{results_format}")
+
+
+def write_frame(frame, path, results_format):
+    """Function to write a DataFrame to a single file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if results_format == "parquet":
+        frame.to_parquet(path, index=False, compression="zstd")
+    elif results_format == "feather":
+        frame.to_feather(path, compression="zstd")
+    else:
+        frame.to_csv(path, index=False)
+
+
+def read_frame(path, columns=None):
+    """Function to read a single results file, only loading the requested columns"""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    if path.endswith(".feather"):
+        return pd.read_feather(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=TEXT_COLUMNS)
+
+
+def save_results(scenario, wait_times, circle_times, results_format=None, results_dir=RESULTS_DIR, replace=True):
+    """
+    Function to save the departure/arrival recorders of a scenario, replacing its previous results (or, without
+    `replace`, only the days the recorders hold)
+    """
+    results_format = resolve_format(results_format)
+
+    for direction, recorder in (("departure", wait_times), ("arrival", circle_times)):
+        scenario_dir = os.path.join(results_dir, direction, f"scenario={scenario}")
+        if replace and os.path.isdir(scenario_dir):
+            shutil.rmtree(scenario_dir)
+
+        logger.info("Saving %s data for %s to %s", direction, scenario, scenario_dir)
+        frame = recorder.to_frame(DIRECTIONS[direction], include_day=True)
+        for day, day_frame in frame.groupby("Day", sort=True):
+            write_frame(day_frame.drop(columns="Day").reset_index(drop=True),
+                        partition_path(direction, scenario, day, results_format, results_dir), results_format)
+
+
+def list_partitions(direction, results_dir=RESULTS_DIR):
+    """Function to list the (scenario, day, path) of every saved results file of a direction"""
+    partitions = []
+    direction_dir = os.path.join(results_dir, direction)
+    if not os.path.isdir(direction_dir):
+        return partitions
+
+    for scenario_name in sorted(os.listdir(direction_dir)):
+        if not scenario_name.startswith("scenario="):
+            continue
+        scenario_dir = os.path.join(direction_dir, scenario_name)
+        day_names = [name for name in os.listdir(scenario_dir) if name.startswith("day=")]
+        for day_name in sorted(day_names, key=lambda name: int(name.split("=", 1)[1])):
+            day_dir = os.path.join(scenario_dir, day_name)
+            for file_name in sorted(os.listdir(day_dir)):
+                partitions.append((scenario_name.split("=", 1)[1], int(day_name.split("=", 1)[1]),
+                                   os.path.join(day_dir, file_name)))
+    return partitions
+
+
+def iter_results(direction, scenarios=None, days=None, columns=None, results_dir=RESULTS_DIR, data_dir=DATA_DIR,
+                 chunk_size=100000):
+    """
+    Function to stream the results of a direction ("departure" or "arrival") one file (or, for the flat CSVs of
+    earlier versions, one chunk of `chunk_size` rows) at a time, as DataFrames with "Scenario" and "Day" columns. Only
+    the given scenarios, days and columns are read (all of them when None).
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction: {direction}")
+    if isinstance(scenarios, str):
+        scenarios = [scenarios]
+
+    found = set()
+    for scenario, day, path in list_partitions(direction, results_dir):
+        found.add(scenario)
+        if scenarios is not None and scenario not in scenarios:
+            continue
+        if days is not None and day not in days:
+            continue
+        frame = read_frame(path, columns)
+        frame.insert(0, "Day", day)
+        frame.insert(0, "Scenario", scenario)
+        yield frame
+
+    # Fall back to the flat CSVs of earlier versions
+    for scenario in scenarios or []:
+        legacy_path = os.path.join(data_dir, f"{direction}_results_{scenario}.csv")
+        if scenario not in found and os.path.exists(legacy_path):
+            for frame in pd.read_csv(legacy_path, usecols=columns, dtype=TEXT_COLUMNS, chunksize=chunk_size):
+                frame.insert(0, "Scenario", scenario)
+                yield frame
+
+
+def load_results(direction, scenarios=None, days=None, columns=None, results_dir=RESULTS_DIR, data_dir=DATA_DIR):
+    """
+    Function to load the results of a direction ("departure" or "arrival") as one DataFrame with "Scenario" and "Day"
+    columns. Only the given scenarios, days and columns are read (all of them when None).
+    """
+    frames = list(iter_results(direction, scenarios, days, columns, results_dir, data_dir))
+    if not frames:
+        raise FileNotFoundError(f"No {direction} results found for scenarios: {scenarios}")
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,88 @@
+"""
+Routing tables: which runways are open for a wind direction, what each one is used for, and which runways each class
+of plane (departing/arriving, jet/non-jet) picks from.
+
+A `RoutingTable` is built once per airport (scenario) from its runway table and ignored runways. The `Routing` of a
+wind direction (and set of closed runways, when disruptions close some) is worked out the first time it is needed and
+kept, so resetting the runways for a new day or a wind change only looks it up. Routings are read-only: their runway
+roles and candidate runways are tuples behind read-only mappings, and can be shared by every day of a run.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True)
+class RunwayRoles:
+    """Class to hold what a runway is used for under a routing"""
+    departure: bool = False
+    arrival: bool = False
+    non_jet_departure: bool = False
+    non_jet_arrival: bool = False
+
+
+@dataclass(frozen=True)
+class Routing:
+    """
+    Class to hold the runways open for a wind direction in the order they are opened, their roles, the runways each
+    class of plane picks from (keyed by (departing, jet)), and the same candidates as positions in `runways`
+    """
+    wind: str
+    runways: tuple
+    roles: MappingProxyType
+    classes: MappingProxyType
+    choices: MappingProxyType
+
+
+def build_routing(runway_table, wind, closed=frozenset()):
+    """Function to work out the routing of a wind direction with the `closed` runways out of use"""
+    roles = {}
+    departure_runways = runway_table[wind]["Departures"]
+    arrival_runways = runway_table[wind]["Arrivals"]
+
+    # Departure runways, then the arrival runways that are not already open
+    for runway, options in departure_runways.items():
+        if runway not in closed:
+            roles[runway] = RunwayRoles(departure=True, non_jet_departure=bool(options["Non Jet"]))
+    for runway, options in arrival_runways.items():
+        if runway in closed:
+            continue
+        current = roles.get(runway, RunwayRoles())
+        roles[runway] = RunwayRoles(current.departure, True, current.non_jet_departure,
+                                    current.non_jet_arrival or bool(options["Non Jet"]))
+
+    # Non-jets use the non-jet runways when there are any, jets only use the others
+    classes = {}
+    for departing in (True, False):
+        used = [runway for runway, role in roles.items() if (role.departure if departing else role.arrival)]
+        non_jet = tuple(runway for runway in used if (roles[runway].non_jet_departure if departing else
+                                                       roles[runway].non_jet_arrival))
+        regular = tuple(runway for runway in used if runway not in non_jet)
+        classes[(departing, True)] = regular
+        classes[(departing, False)] = non_jet or regular
+
+    position = {runway: i for i, runway in enumerate(roles)}
+    choices = {key: tuple(position[runway] for runway in runways) for key, runways in classes.items()}
+    return Routing(wind, tuple(roles), MappingProxyType(roles), MappingProxyType(classes),
+                   MappingProxyType(choices))
+
+
+class RoutingTable:
+    """Class to look up (and work out once) the routing of every wind direction and set of closed runways"""
+
+    def __init__(self, runway_table, ignore_runways=()):
+        self.runway_table = runway_table
+        self.ignore_runways = frozenset(ignore_runways)
+        self.routings = {}
+
+    def routing(self, wind, closed=None):
+        """Function to return the routing of a wind direction, with the ignored runways (or `closed` ones) out of use"""
+        closed = self.ignore_runways if closed is None else frozenset(closed)
+        key = (wind, closed)
+        routing = self.routings.get(key)
+        if routing is None:
+            routing = self.routings[key] = build_routing(self.runway_table, wind, closed)
+        return routing
+
+    def candidates(self, wind, departing, jet, closed=None):
+        """Function to return the runways a class of plane picks from under a wind direction"""
+        return self.routing(wind, closed).classes[(departing, jet)]
@@ -1,14 +1,58 @@
-import os
 import simpy
-import random
+import logging
+import numpy as np
+from simpy.core import BoundClass
+from simpy.resources.resource import Request
+from Simulation.trace import logger
+from Simulation.traffic import load_settings
+
+
+class LineRequest(Request):
+    """Class to request a runway, remembering when the plane started waiting (before any move to another runway)"""
+
+    def __init__(self, resource, start_time=None):
+        self.start_time = resource._env.now if start_time is None else start_time
+        super().__init__(resource)
+
+
+class LineResource(simpy.Resource):
+    """Class to represent the runway itself, telling a listener whenever the line of planes waiting for it changes"""
+
+    request = BoundClass(LineRequest)
+
+    def __init__(self, env, capacity=1):
+        super().__init__(env, capacity)
+        self.line_length = 0
+        self.on_line_change = None
+
+    def _trigger_put(self, get_event):
+        """Function to grant waiting requests, then report the new line length if it changed"""
+        # Called by SimPy after a request joins the line and after a release
+        super()._trigger_put(get_event)
+        self.update_line_length()
+
+    def update_line_length(self):
+        """Function to report the line length if it changed (also needed after a request leaves the line)"""
+        line_length = len(self.queue)
+        if line_length != self.line_length:
+            self.line_length = line_length
+            if self.on_line_change is not None:
+                self.on_line_change(line_length)
 
 
 class Runway(object):
     """Class to represent a runway"""
 
-    def __init__(self, env, name, wait_times, circle_times, departure=True, arrival=True, non_jet_departure=False,
-                 non_jet_arrival=False):
+    def __init__(self, env, name, wait_times, circle_times, rng=None, settings=None, departure=True, arrival=True,
+                 non_jet_departure=False, non_jet_arrival=False, trace=None, metrics=None):
+        if rng is None:
+            rng = np.random.default_rng()
+        if settings is None:
+            settings = load_settings()
+
         self.env = env
+        self.rng = rng
+        self.settings = settings
         self.name = name
         self.wait_times = wait_times
         self.circle_times = circle_times
@@ -16,50 +60,112 @@ class Runway(object):
         self.arrival = arrival
         self.non_jet_departure = non_jet_departure
         self.non_jet_arrival = non_jet_arrival
-        self.resource = simpy.Resource(env, capacity=1)
+        self.trace = trace
+        self.metrics = metrics
+        self.resource = LineResource(env, capacity=1)
+
+    def reset(self, env):
+        """Function to empty the runway for a new day (or a new stint in use) on the given environment"""
+        self.env = env
+        self.resource = LineResource(env, capacity=1)
+        self.metrics = None
 
-    def take_off(self, plane, wind_direction):
+    def set_roles(self, roles):
+        """Function to set what the runway is used for from its `RunwayRoles`"""
+        self.departure = roles.departure
+        self.arrival = roles.arrival
+        self.non_jet_departure = roles.non_jet_departure
+        self.non_jet_arrival = roles.non_jet_arrival
+
+    def take_off(self, plane, wind_direction, start_time=None, day=None, day_start=0.0):
         """
         Function to simulate take off. It is assumed that take off will take between 1-2 minutes (up to 90 seconds for
-        lining up and up to 30 seconds for rolling down the runway)
+        lining up and up to 30 seconds for rolling down the runway). A plane moved from another runway keeps the
+        `start_time` it started waiting at; `day` and `day_start` set the day it is recorded on (the current one by
+        default).
         """
-        with self.resource.request() as request:
+        with self.resource.request(start_time) as request:
             # Begin timing
-            start_time = self.env.now
-            print(f"{plane.airline} flight {plane.flight_number} to {plane.route} waiting to take-off at runway: {self.name}")
+            start_time = request.start_time
+            if self.trace is not None:
+                self.trace.record(start_time, plane.flight_number, self.name, "waiting")
+            if self.metrics is not None:
+                self.metrics.record(start_time, len(self.resource.queue), self.resource.count)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s flight %s to %s waiting to take-off at runway: %s", plane.airline,
+                             plane.flight_number, plane.route, self.name)
             # Wait for runway to be free
             yield request
+            if self.trace is not None:
+                self.trace.record(self.env.now, plane.flight_number, self.name, "cleared")
+            if self.metrics is not None:
+                self.metrics.record(self.env.now, len(self.resource.queue), self.resource.count)
             # Take off
-            yield self.env.timeout(random.expovariate(float(os.getenv("MU_TAKEOFF"))))
+            yield self.env.timeout(self.service_time(plane, "MU_TAKEOFF"))
             wait_time = round(self.env.now - start_time, 2)
-            print(f"{plane.airline} flight {plane.flight_number} to {plane.route} landed at runway: {self.name} after waiting {wait_time} minutes")
+            if self.trace is not None:
+                self.trace.record(self.env.now, plane.flight_number, self.name, "took_off")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s flight %s to %s took off from runway: %s after waiting %s minutes", plane.airline,
+                             plane.flight_number, plane.route, self.name, wait_time)
             self.resource.release(request)
+            if self.metrics is not None:
+                self.metrics.record(self.env.now, len(self.resource.queue), self.resource.count)
+                self.metrics.complete(self.env.now)
 
             # Record stats
-            data = (round(start_time/60, 2), plane.airline, plane.route, plane.flight_number, plane.aircraft_type, wind_direction,
-                    self.name, wait_time)
-            self.wait_times.append(data)
+            self.wait_times.record_plane(round((start_time - day_start)/60, 2), plane, wind_direction, self.name,
+                                         wait_time, day)
 
-    def land(self, plane, wind_direction):
+    def land(self, plane, wind_direction, start_time=None, day=None, day_start=0.0):
         """
-        Function to simulate take off. It is assumed that landing will take between 1-3 minutes
+        Function to simulate take off. It is assumed that landing will take between 1-3 minutes. Moved planes and
+        recorded days work as in `take_off`.
         """
-        with self.resource.request() as request:
+        with self.resource.request(start_time) as request:
             # Begin timing
-            start_time = self.env.now
-            print(f"{plane.airline} flight {plane.flight_number} from {plane.route} circling runway: {self.name}")
+            start_time = request.start_time
+            if self.trace is not None:
+                self.trace.record(start_time, plane.flight_number, self.name, "circling")
+            if self.metrics is not None:
+                self.metrics.record(start_time, len(self.resource.queue), self.resource.count)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s flight %s from %s circling runway: %s", plane.airline, plane.flight_number,
+                             plane.route, self.name)
             # Wait for runway to be free
             yield request
+            if self.trace is not None:
+                self.trace.record(self.env.now, plane.flight_number, self.name, "cleared")
+            if self.metrics is not None:
+                self.metrics.record(self.env.now, len(self.resource.queue), self.resource.count)
             # Land
-            yield self.env.timeout(random.expovariate(float(os.getenv("MU_LANDING"))))
+            yield self.env.timeout(self.service_time(plane, "MU_LANDING"))
             wait_time = round(self.env.now - start_time, 2)
-            print(f"{plane.airline} flight {plane.flight_number} from {plane.route} landed at runway: {self.name} after waiting {wait_time} minutes")
+            if self.trace is not None:
+                self.trace.record(self.env.now, plane.flight_number, self.name, "landed")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s flight %s from %s landed at runway: %s after waiting %s minutes", plane.airline,
+                             plane.flight_number, plane.route, self.name, wait_time)
             self.resource.release(request)
+            if self.metrics is not None:
+                self.metrics.record(self.env.now, len(self.resource.queue), self.resource.count)
+                self.metrics.complete(self.env.now)
 
             # Record stats
-            data = (round(start_time/60, 2), plane.airline, plane.route, plane.flight_number, plane.aircraft_type, wind_direction,
-                    self.name, wait_time)
-            self.circle_times.append(data)
+            self.circle_times.record_plane(round((start_time - day_start)/60, 2), plane, wind_direction, self.name,
+                                           wait_time, day)
+
+    def leave_line(self):
+        """Function to account for a plane that left the line without being served (e.g. moved to another runway)"""
+        self.resource.update_line_length()
+        if self.metrics is not None:
+            self.metrics.record(self.env.now, len(self.resource.queue), self.resource.count)
+
+    def service_time(self, plane, rate):
+        """Function to return how long a plane spends on the runway, drawing it if the plane has none"""
+        if plane.service_time is not None:
+            return plane.service_time
+        return float(self.rng.exponential(1 / self.settings[rate]))
 
     def check_if_non_jet(self, departure):
         """Function to determine if a runway is for non-jet only"""
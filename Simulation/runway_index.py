@@ -0,0 +1,76 @@
+"""
+Index of the runways each class of plane can pick from, ordered by the length of their lines.
+
+`Airport.select_runway` sends every plane to the runway with the shortest line among the runways its class
+(departing/arriving, jet/non-jet) may use, taking the last of them on ties. Rather than scanning those runways for every
+plane, each class keeps a heap of (line length, -position, runway) entries that is updated whenever a runway's line
+grows or shrinks (see `Runway.LineResource`). An update pushes a new entry and leaves the old one in place; entries that
+no longer match their runway's line are dropped once they reach the top of the heap, so both picking a runway and
+updating a line take O(log n) time.
+"""
+import heapq
+from functools import partial
+
+
+class RunwayIndex:
+    """Class to keep the runways one class of plane picks from ordered by the length of their lines"""
+
+    def __init__(self, runways, line_lengths):
+        self.position = {runway: i for i, runway in enumerate(runways)}
+        self.line_lengths = line_lengths
+        self.heap = []
+        self.rebuild()
+
+    def rebuild(self):
+        """Function to rebuild the heap from the current line lengths, dropping every stale entry"""
+        self.heap = [(self.line_lengths[runway], -i, runway) for runway, i in self.position.items()]
+        heapq.heapify(self.heap)
+
+    def update(self, runway):
+        """Function to add an entry for a runway whose line length changed"""
+        heapq.heappush(self.heap, (self.line_lengths[runway], -self.position[runway], runway))
+
+        # Keep stale entries from piling up
+        if len(self.heap) > 4 * len(self.position) + 8:
+            self.rebuild()
+
+    def shortest(self):
+        """Function to return the runway with the shortest line (the last one on ties), or None without runways"""
+        heap = self.heap
+        while heap:
+            line_length, _, runway = heap[0]
+            if self.line_lengths[runway] == line_length:
+                return runway
+            heapq.heappop(heap)
+        return None
+
+
+class RunwaySelector:
+    """Class to pick the runway with the shortest line for each class of plane, keyed by (departing, jet)"""
+
+    def __init__(self, runways, runway_classes):
+        self.line_lengths = {name: runway.get_runway_line_length() for name, runway in runways.items()}
+
+        # Classes picking from the same runways share an index
+        indexes = {}
+        self.classes = {}
+        for key, names in runway_classes.items():
+            names = tuple(names)
+            if names not in indexes:
+                indexes[names] = RunwayIndex(names, self.line_lengths)
+            self.classes[key] = indexes[names]
+        self.indexes_of = {name: [index for index in indexes.values() if name in index.position] for name in runways}
+
+        # Follow the line of every runway
+        for name, runway in runways.items():
+            runway.resource.on_line_change = partial(self.update, name)
+
+    def update(self, runway, line_length):
+        """Function to record the new length of a runway's line"""
+        self.line_lengths[runway] = line_length
+        for index in self.indexes_of[runway]:
+            index.update(runway)
+
+    def select(self, departing, jet):
+        """Function to return the runway with the shortest line a plane of a class can use"""
+        return self.classes[(departing, jet)].shortest()
@@ -0,0 +1,285 @@
+"""
+Sampler to draw plane attributes (airline, route, aircraft) from the probability tree built by `Data/data_extractor.py`.
+
+The nested `probabilities` dictionary is flattened once into three levels of alias tables:
+    - airline:  one table per direction (departures/arrivals)
+    - route:    one table per (direction, airline)
+    - aircraft: one table per (direction, airline, route)
+
+Every table is stored as a slice of a flat numpy array, described by an offset and a count. A draw at any level takes
+a single uniform number and costs O(1), no matter how many choices the table holds.
+"""
+import numpy as np
+
+# Index of each direction in the flattened tables
+DEPARTURES = 0
+ARRIVALS = 1
+DIRECTIONS = ("Departures", "Arrivals")
+
+# Replace defunct airlines with airlines that bought them
+replacement_airlines = {
+    "FL": "WN",
+    "US": "AA",
+    "CO": "UA",
+    "NW": "DL",
+    "VX": "AS",
+    "UN": "BA"
+}
+
+# Set of non-jet plane models
+non_jet = {"DH4", "CNA", "SF3", "DH1", "DH3", "DH8"}
+
+
+def build_alias_table(weights):
+    """Function to build a Walker/Vose alias table (thresholds, aliases) from a list of weights"""
+    count = len(weights)
+    weights = np.asarray(weights, dtype=np.float64)
+    thresholds = np.ones(count, dtype=np.float64)
+    aliases = np.arange(count, dtype=np.int64)
+
+    # Uniform tables (e.g. the aircraft of most routes) never need an alias
+    if count == 0 or np.all(weights == weights[0]):
+        return thresholds, aliases
+
+    scaled = weights * count / weights.sum()
+
+    small = [i for i in range(count) if scaled[i] < 1.0]
+    large = [i for i in range(count) if scaled[i] >= 1.0]
+
+    # Pair each under-full column with an over-full one
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        thresholds[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = (scaled[more] + scaled[less]) - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+
+    # Anything left over is full up to rounding error
+    for i in small + large:
+        thresholds[i] = 1.0
+
+    return thresholds, aliases
+
+
+def draw_from_tables(offsets, counts, thresholds, aliases, tables, uniforms):
+    """
+    Function to draw one entry from each of the requested alias tables. `tables` and `uniforms` can either be scalars
+    or numpy arrays of the same shape. Returns the global index of the chosen entry in the flat arrays.
+    """
+    offset = offsets[tables]
+    count = counts[tables]
+    scaled = uniforms * count
+    column = np.minimum(np.floor(scaled).astype(np.int64), count - 1)
+    position = offset + column
+    keep = (scaled - column) < thresholds[position]
+    return offset + np.where(keep, column, aliases[position])
+
+
+def draw_from_table(offsets, counts, thresholds, aliases, table, uniform):
+    """Function to draw one entry from a single alias table using plain scalar arithmetic"""
+    offset = offsets[table]
+    count = counts[table]
+    scaled = uniform * count
+    column = min(int(scaled), count - 1)
+    if scaled - column < thresholds[offset + column]:
+        return offset + column
+    return offset + aliases[offset + column]
+
+
+class PlaneSampler:
+    """Class to draw airline, route and aircraft for planes from precompiled alias tables"""
+
+    def __init__(self, tables, strings, seed=None):
+        """
+        `tables` holds the flat numpy arrays of the alias tables and `strings` holds the string tables they index into
+        (see `flatten_probabilities`).
+        """
+        self.tables = tables
+        self.strings = strings
+        self.rng = np.random.default_rng(seed)
+
+        self.airline_offset = tables["airline_offset"]
+        self.airline_count = tables["airline_count"]
+        self.airline_code = tables["airline_code"]
+        self.airline_threshold = tables["airline_threshold"]
+        self.airline_alias = tables["airline_alias"]
+
+        self.route_offset = tables["route_offset"]
+        self.route_count = tables["route_count"]
+        self.route_code = tables["route_code"]
+        self.route_threshold = tables["route_threshold"]
+        self.route_alias = tables["route_alias"]
+
+        self.aircraft_offset = tables["aircraft_offset"]
+        self.aircraft_count = tables["aircraft_count"]
+        self.aircraft_code = tables["aircraft_code"]
+        self.aircraft_threshold = tables["aircraft_threshold"]
+        self.aircraft_alias = tables["aircraft_alias"]
+        self.aircraft_jet = tables["aircraft_jet"]
+
+        self.airline_names = strings["airline_names"]
+        self.flight_prefixes = strings["flight_prefixes"]
+        self.route_names = strings["route_names"]
+        self.aircraft_codes = strings["aircraft_codes"]
+
+    @classmethod
+    def from_probabilities(cls, probabilities, airlines, airports, seed=None):
+        """Function to build a sampler straight from the nested dictionaries built by `DataExtractor`"""
+        tables, strings = flatten_probabilities(probabilities, airlines, airports)
+        return cls(tables, strings, seed=seed)
+
+    def seed(self, seed):
+        """Function to restart the sampler's random stream"""
+        self.rng = np.random.default_rng(seed)
+
+    def draw(self, departing, rng=None):
+        """Function to draw (airline index, route index, aircraft index, flight number) for a single plane"""
+        if rng is None:
+            rng = self.rng
+
+        direction = DEPARTURES if departing else ARRIVALS
+        u_airline, u_route, u_aircraft = rng.random(3)
+
+        airline = int(draw_from_table(self.airline_offset, self.airline_count, self.airline_threshold,
+                                      self.airline_alias, direction, u_airline))
+        route = int(draw_from_table(self.route_offset, self.route_count, self.route_threshold,
+                                    self.route_alias, airline, u_route))
+        aircraft = int(draw_from_table(self.aircraft_offset, self.aircraft_count, self.aircraft_threshold,
+                                       self.aircraft_alias, route, u_aircraft))
+        flight_number = int(rng.integers(10, 10001))
+
+        return airline, route, aircraft, flight_number
+
+    def draw_many(self, departing, rng=None):
+        """Function to draw (airline, route, aircraft, flight number) index arrays for an array of departure flags"""
+        if rng is None:
+            rng = self.rng
+
+        directions = np.where(departing, DEPARTURES, ARRIVALS)
+        uniforms = rng.random((3, len(directions)))
+
+        airlines = draw_from_tables(self.airline_offset, self.airline_count, self.airline_threshold,
+                                    self.airline_alias, directions, uniforms[0])
+        routes = draw_from_tables(self.route_offset, self.route_count, self.route_threshold,
+                                  self.route_alias, airlines, uniforms[1])
+        aircrafts = draw_from_tables(self.aircraft_offset, self.aircraft_count, self.aircraft_threshold,
+                                     self.aircraft_alias, routes, uniforms[2])
+        flight_numbers = rng.integers(10, 10001, size=len(directions))
+
+        return airlines, routes, aircrafts, flight_numbers
+
+    def airline_name(self, airline):
+        """Function to return the display name of a drawn airline"""
+        return self.airline_names[self.airline_code[airline]]
+
+    def flight_prefix(self, airline):
+        """Function to return the flight number prefix of a drawn airline"""
+        return self.flight_prefixes[self.airline_code[airline]]
+
+    def flight_number(self, airline, number):
+        """Function to return the flight number string of a drawn airline"""
+        return f"{self.flight_prefix(airline)}{number}"
+
+    def route_name(self, route):
+        """Function to return the display name of a drawn route"""
+        return self.route_names[self.route_code[route]]
+
+    def aircraft_type(self, aircraft):
+        """Function to return the aircraft type of a drawn aircraft"""
+        return self.aircraft_codes[self.aircraft_code[aircraft]]
+
+    def is_jet(self, aircraft):
+        """Function to return if a drawn aircraft is a jet"""
+        return bool(self.aircraft_jet[self.aircraft_code[aircraft]])
+
+    def jet_probability(self, departing):
+        """Function to return the probability that a departing (or arriving) plane is a jet, from the table weights"""
+        jet = self.aircraft_jet[self.aircraft_code].astype(np.float64)
+
+        # Average the jet flags up the tree: per route, then per airline, then per direction
+        for level in ("aircraft", "route", "airline"):
+            counts = self.tables[f"{level}_count"]
+            weights = self.tables[f"{level}_weight"]
+            slices = np.repeat(np.arange(len(counts)), counts)
+            totals = np.bincount(slices, weights, len(counts))
+            jet = np.bincount(slices, weights * jet, len(counts)) / np.where(totals > 0, totals, 1.0)
+        return float(jet[DEPARTURES if departing else ARRIVALS])
+
+
+def flatten_probabilities(probabilities, airlines, airports):
+    """Function to flatten the nested probability tree into flat alias tables and string tables"""
+    airline_codes, airline_index = [], {}
+    route_codes, route_index = [], {}
+    aircraft_codes, aircraft_index = [], {}
+
+    def intern(code, codes, index):
+        if code not in index:
+            index[code] = len(codes)
+            codes.append(code)
+        return index[code]
+
+    levels = {level: {"offset": [], "count": [], "code": [], "weight": []}
+              for level in ("airline", "route", "aircraft")}
+
+    def add_table(level, codes):
+        table = levels[level]
+        table["offset"].append(len(table["code"]))
+        table["count"].append(len(codes))
+
+    for direction in DIRECTIONS:
+        airline_tree = probabilities[direction]
+        add_table("airline", airline_tree)
+        for airline_code in airline_tree.keys():
+            levels["airline"]["code"].append(intern(airline_code, airline_codes, airline_index))
+            levels["airline"]["weight"].append(airline_tree[airline_code]["Probability"])
+
+            route_tree = airline_tree[airline_code]["Routes"]
+            add_table("route", route_tree)
+            for route_code in route_tree.keys():
+                levels["route"]["code"].append(intern(route_code, route_codes, route_index))
+                levels["route"]["weight"].append(route_tree[route_code]["Probability"])
+
+                aircraft_tree = route_tree[route_code]["Aircrafts"]
+                add_table("aircraft", aircraft_tree)
+                for aircraft_code in aircraft_tree.keys():
+                    levels["aircraft"]["code"].append(intern(aircraft_code, aircraft_codes, aircraft_index))
+                    levels["aircraft"]["weight"].append(aircraft_tree[aircraft_code]["Probability"])
+
+    # Build one alias table per slice of each level
+    tables = {}
+    for level, table in levels.items():
+        offsets = np.array(table["offset"], dtype=np.int64)
+        counts = np.array(table["count"], dtype=np.int64)
+        weights = np.array(table["weight"], dtype=np.float64)
+        thresholds = np.ones(len(weights), dtype=np.float64)
+        aliases = np.zeros(len(weights), dtype=np.int64)
+        for offset, count in zip(offsets, counts):
+            thresholds[offset:offset + count], aliases[offset:offset + count] = \
+                build_alias_table(weights[offset:offset + count])
+
+        tables[f"{level}_offset"] = offsets
+        tables[f"{level}_count"] = counts
+        tables[f"{level}_code"] = np.array(table["code"], dtype=np.int64)
+        tables[f"{level}_weight"] = weights
+        tables[f"{level}_threshold"] = thresholds
+        tables[f"{level}_alias"] = aliases
+
+    tables["aircraft_jet"] = np.array([code not in non_jet for code in aircraft_codes], dtype=bool)
+
+    # Resolve display strings once, applying replacement airlines (codes missing from the data are used as is)
+    flight_prefixes = [replacement_airlines.get(code, code) for code in airline_codes]
+    strings = {
+        "airline_codes": airline_codes,
+        "airline_names": [airlines[prefix]["Name"] if prefix in airlines else prefix for prefix in flight_prefixes],
+        "flight_prefixes": flight_prefixes,
+        "route_codes": route_codes,
+        "route_names": [f"{airports[code]['Name']}; {airports[code]['City']}, {airports[code]['Country']}"
+                        if code in airports else code for code in route_codes],
+        "aircraft_codes": aircraft_codes,
+    }
+
+    return tables, strings
@@ -0,0 +1,88 @@
+"""
+Scenarios (runway configurations and rate overrides) that can be swept in a single run of the simulator.
+
+A scenario file is a JSON list of objects such as:
+    {
+        "name": "extra_runway_with_two_down",
+        "exclude_runways": ["27", "32"],
+        "extra_runways": {"Northwest": {"Departures": {"33R": {"Non Jet": false}}}},
+        "overrides": {"LAMBDA_AFTERNOON": 8.5, "MU_TAKEOFF": 1.6},
+        "disruptions": {"events": [{"time": 600, "close": ["22R"]}], "closures_per_day": 1.5}
+    }
+Only "name" is required; "airport" (an IATA code) defaults to "BOS". Runways are only known for Logan Airport, so
+scenarios for other airports must list all of theirs in "extra_runways". `extra_runways` follows the layout of the runway table built by
+`DataExtractor.configure_runways` and is merged into it, and `overrides` replaces any of the LAMBDA_*, DEPARTURE_PROB_*,
+MU_* or ARRIVAL_* settings from the .env file (ARRIVAL_RATES can be given as a list of 24 hourly rates).
+`disruptions` sets the wind shifts and runway closures inside each day (see `disruptions.py`); scenarios without it
+have none, whatever DISRUPTIONS in the .env file says.
+"""
+import copy
+import json
+import simpy
+from Data.data_cache import load_data
+from Simulation.airport import Airport
+from Simulation.disruptions import DisruptionModel
+from Simulation.traffic import load_settings
+
+
+class Scenario:
+    """Class to represent a single scenario of a sweep"""
+
+    def __init__(self, name, exclude_runways=(), extra_runways=None, overrides=None, airport="BOS", disruptions=None):
+        self.name = name
+        self.airport = airport
+        self.exclude_runways = list(exclude_runways)
+        self.extra_runways = extra_runways if extra_runways is not None else {}
+        self.overrides = overrides if overrides is not None else {}
+        self.disruptions = disruptions if disruptions is not None else DisruptionModel()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Function to create a scenario from its JSON representation"""
+        return cls(data["name"], exclude_runways=data.get("exclude_runways", ()),
+                   extra_runways=data.get("extra_runways"), overrides=data.get("overrides"),
+                   airport=data.get("airport", "BOS"),
+                   disruptions=DisruptionModel.from_dict(data["disruptions"]) if "disruptions" in data else None)
+
+    def to_dict(self):
+        """Function to return the JSON representation of the scenario"""
+        return {"name": self.name, "airport": self.airport, "exclude_runways": self.exclude_runways,
+                "extra_runways": self.extra_runways, "overrides": self.overrides,
+                "disruptions": self.disruptions.to_dict()}
+
+    def runway_table(self):
+        """Function to merge the scenario's extra runways into the airport's runway table"""
+        table = copy.deepcopy(load_data(self.airport).runways)
+        for wind, directions in self.extra_runways.items():
+            for direction, new_runways in directions.items():
+                table.setdefault(wind, {"Departures": {}, "Arrivals": {}}).setdefault(direction, {})
+                table[wind][direction].update(new_runways)
+        return table
+
+    def airport_kwargs(self):
+        """Function to return the arguments needed to build the scenario's airport"""
+        return {"ignore_runways": self.exclude_runways, "runway_table": self.runway_table(),
+                "settings": load_settings(self.overrides), "airport_code": self.airport,
+                "disruptions": self.disruptions}
+
+    def create_airport(self, env=None, trace=None):
+        """Function to create the airport for the scenario"""
+        if env is None:
+            env = simpy.Environment()
+        return Airport(env, self.name, trace=trace, **self.airport_kwargs())
+
+
+def load_scenarios(path):
+    """Function to load a list of scenarios from a JSON file"""
+    with open(path, "r") as file:
+        return [Scenario.from_dict(data) for data in json.load(file)]
+
+
+# Scenarios tested in the report (runway 99 is the proposed new runway)
+DEFAULT_SCENARIOS = [
+    Scenario("control", exclude_runways=["99"]),
+    Scenario("one_runway_down", exclude_runways=["27", "99"]),
+    Scenario("two_runways_down", exclude_runways=["27", "32", "99"]),
+    Scenario("extra_runway"),
+    Scenario("extra_runway_with_two_down", exclude_runways=["27", "32"]),
+]
@@ -1,53 +1,230 @@
-import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from Simulation.airport import Airport
+from Simulation.config import load_config, use_config
+from Simulation.continuous import simulate_continuous
+from Simulation.fast_engine import ENGINES
+from Simulation.long_run import run_long_horizon, save_long_run_summary
+from Simulation.metrics import MetricsRecorder
+from Simulation.monte_carlo import run_monte_carlo, save_summary, summarize
+from Simulation.queueing import estimate_airport, estimate_scenario, save_cross_check
+from Simulation.recorder import ResultRecorder, create_string_tables
+from Simulation.replication import (generate_day_seeds, generate_scenario_day_seeds, group_scenarios,
+                                    resolve_common_random_numbers, resolve_engine, run_days, simulate_day,
+                                    simulate_days, split_days)
+from Simulation.results import RESULTS_FORMATS, save_results
+from Simulation.scenario import DEFAULT_SCENARIOS, load_scenarios
+from Simulation.trace import configure_logging, logger, open_trace
 import simpy
 import time
-from dotenv import load_dotenv
 
-load_dotenv()
 
+def simulate_airport(airport, env, master_seed=None, engine=None):
+    """Function to simulate NUM_REPLICATIONS days of departures/landings at an airport"""
+    num_days = load_config().num_replications
+    day_seeds = generate_day_seeds(num_days, master_seed)
+    engine = resolve_engine(engine)
 
-# Generate random seeds
-random_seeds = [i for i in range(30, 37)]
+    # Iterate over the days of the run
+    for i in range(0, num_days):
+        simulate_day(airport, i, day_seeds[i], env=env if i == 0 else None, engine=engine)
 
 
-def simulate_airport(airport, env):
-    """Function to simulate a week of departures/landings at an airport"""
+def simulate_airport_parallel(airport, num_workers, master_seed=None, engine=None):
+    """
+    Function to simulate the days of a run across a pool of worker processes. Each day gets its own random stream
+    derived from the master seed, so the merged records match a serial run with the same seed exactly.
+    """
+    config = load_config()
+    num_days = config.num_replications
+    day_seeds = generate_day_seeds(num_days, master_seed)
+    engine = resolve_engine(engine)
+    scenario_kwargs = [(airport.simulation_type, airport.airport_kwargs())]
 
-    # Iterate over the course of 31 days
-    for i in range(0, int(os.getenv("NUM_REPLICATIONS"))):
-        print(f"Beginning Day: {i}")
-        if i > 0:
-            # Reset airport params
-            new_env = simpy.Environment()
-            airport.env = new_env
-            airport.reset_runways()
-            airport.reset_wind()
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(simulate_days, scenario_kwargs, block, [day_seeds[day] for day in block], engine,
+                                   config)
+                   for block in split_days(num_days, num_workers)]
 
-            # Run simulation
-            new_env.process(airport.simulate())
-            new_env.run(24*60)
-        else:
-            env.process(airport.simulate())
-            env.run(until=24*60)
-        print(f"Finished Day: {i}")
+        # Merge the records of every block in day order
+        for future in futures:
+            for _, wait_times, circle_times, metrics in future.result():
+                airport.wait_times.extend(wait_times)
+                airport.circle_times.extend(circle_times)
+                if airport.metrics is not None and metrics is not None:
+                    airport.metrics.merge(metrics)
+
+
+def simulate_scenarios(scenarios, num_workers=1, master_seed=None, engine=None, common_random_numbers=None):
+    """
+    Function to simulate a sweep of scenarios in one process, or across a pool of worker processes. Returns a dict
+    mapping each scenario name to its (wait_times, circle_times, metrics) recorders (metrics is None unless
+    METRICS_INTERVAL is set). With common random numbers (the default) every scenario sees the same wind, traffic and
+    runway service draws each day.
+    """
+    config = load_config()
+    num_days = config.num_replications
+    spill_dir = config.spill_dir
+    engine = resolve_engine(engine)
+    groups = group_scenarios(scenarios, resolve_common_random_numbers(common_random_numbers))
+    scenario_seeds = generate_scenario_day_seeds(len(scenarios), num_days, master_seed)
+    shared_seeds = generate_day_seeds(num_days, master_seed)
+    results = {}
+
+    # Run every scenario in this process, sharing the static data that is already loaded
+    if num_workers <= 1:
+        for scenario_kwargs, index in groups:
+            logger.info("Simulating scenarios: %s", ", ".join(name for name, _ in scenario_kwargs))
+            day_seeds = shared_seeds if index is None else scenario_seeds[index]
+            for airport in run_days(scenario_kwargs, list(range(num_days)), day_seeds, engine):
+                results[airport.simulation_type] = (airport.wait_times, airport.circle_times, airport.metrics)
+        return {scenario.name: results[scenario.name] for scenario in scenarios}
+
+    # Send blocks of days of every group of scenarios to the worker pool
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = []
+        for scenario_kwargs, index in groups:
+            day_seeds = shared_seeds if index is None else scenario_seeds[index]
+            for block in split_days(num_days, num_workers):
+                futures.append(executor.submit(simulate_days, scenario_kwargs, block,
+                                               [day_seeds[day] for day in block], engine, config))
+
+        # Merge the records of every scenario in day order
+        for future in futures:
+            for name, block_wait_times, block_circle_times, block_metrics in future.result():
+                if name not in results:
+                    string_tables = create_string_tables()
+                    metrics = MetricsRecorder(block_metrics.interval) if block_metrics is not None else None
+                    results[name] = (ResultRecorder(string_tables, spill_dir=spill_dir),
+                                     ResultRecorder(string_tables, spill_dir=spill_dir), metrics)
+                wait_times, circle_times, metrics = results[name]
+                wait_times.extend(block_wait_times)
+                circle_times.extend(block_circle_times)
+                if metrics is not None:
+                    metrics.merge(block_metrics)
+
+    return {scenario.name: results[scenario.name] for scenario in scenarios}
+
+
+def save_sweep_results(results, results_format=None):
+    """Function to save the results of every scenario of a sweep, each to its own scenario partition"""
+    for name, (wait_times, circle_times, metrics) in results.items():
+        save_results(name, wait_times, circle_times, results_format)
+        if metrics is not None:
+            metrics.save(name)
 
 
 # Run simulation
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate departures/landings at Logan Airport")
+    parser.add_argument("--sweep", nargs="?", const="default", default=None, metavar="SCENARIO_FILE",
+                        help="run every scenario of a JSON scenario file (or the report's scenarios) in one go")
+    parser.add_argument("--monte-carlo", nargs="?", const="default", default=None, metavar="SCENARIO_FILE",
+                        help="run replications of every scenario until the MC_HALF_WIDTH precision is reached")
+    parser.add_argument("--long-run", type=int, default=None, metavar="DAYS",
+                        help="simulate DAYS days of the control scenario, checkpointing every CHECKPOINT_INTERVAL days "
+                             "and resuming from the last checkpoint")
+    parser.add_argument("--restart", action="store_true",
+                        help="start a long run from day 0 instead of resuming its checkpoint")
+    parser.add_argument("--estimate", nargs="?", const="default", default=None, metavar="SCENARIO_FILE",
+                        help="estimate the runway queues of every scenario analytically instead of simulating them")
+    parser.add_argument("--cross-check", action="store_true",
+                        help="compare the simulated waits of a single scenario or sweep with their analytical estimates")
+    parser.add_argument("--continuous", action=argparse.BooleanOptionalAction, default=None,
+                        help="run the days of a single scenario on one environment, carrying lines over midnight "
+                             "(CONTINUOUS in .env)")
+    parser.add_argument("--crn", action=argparse.BooleanOptionalAction, default=None, dest="common_random_numbers",
+                        help="share wind, traffic and service draws across scenarios (COMMON_RANDOM_NUMBERS in .env)")
+    parser.add_argument("--engine", choices=ENGINES, default=None,
+                        help="engine to simulate days with (ENGINE in .env by default)")
+    parser.add_argument("--format", choices=RESULTS_FORMATS, default=None, dest="results_format",
+                        help="format of the results files (RESULTS_FORMAT in .env by default)")
+    args = parser.parse_args()
+
+    # Load the config once, with the command line options in place of the .env ones
+    options = {name: value for name, value in (("engine", args.engine), ("results_format", args.results_format),
+                                               ("common_random_numbers", args.common_random_numbers),
+                                               ("continuous", args.continuous))
+               if value is not None}
+    config = use_config(replace(load_config(), **options))
+
+    configure_logging()
     start_time = time.time()
 
-    # Create environment
-    env = simpy.Environment()
+    num_workers = config.num_workers
+    master_seed = config.random_seed
+
+    # Estimate the scenarios without simulating them
+    if args.estimate is not None:
+        scenarios = DEFAULT_SCENARIOS if args.estimate == "default" else load_scenarios(args.estimate)
+        for scenario in scenarios:
+            estimate = estimate_scenario(scenario)
+            estimate.save()
+            overall = estimate.summary().iloc[-1]
+            logger.info("%s: expected wait %.3f, circle time %.3f minutes, highest runway utilization %.3f",
+                        scenario.name, overall["expected_wait"], overall["expected_circle_time"],
+                        overall["max_utilization"])
+
+    # Run replications until the results are precise enough
+    elif args.monte_carlo is not None:
+        scenarios = DEFAULT_SCENARIOS if args.monte_carlo == "default" else load_scenarios(args.monte_carlo)
+        mc_statistics, num_replications = run_monte_carlo(
+            scenarios, config.mc_half_width, config.mc_confidence,
+            batch_size=config.mc_batch_size,
+            min_replications=config.mc_min_replications,
+            max_replications=config.mc_max_replications,
+            num_workers=num_workers, master_seed=master_seed, engine=resolve_engine(args.engine),
+            common_random_numbers=resolve_common_random_numbers(args.common_random_numbers),
+            target=config.mc_target)
+        save_summary(summarize(mc_statistics, config.mc_confidence))
+
+    # Run a long horizon of days, flushing and checkpointing as it goes
+    elif args.long_run is not None:
+        # The trace of a resumed run carries on from the events of the days it already simulated
+        logan_airport = Airport(simpy.Environment(), "control", trace=open_trace(append=True))
+        long_run_state = run_long_horizon(logan_airport, args.long_run, master_seed, resolve_engine(args.engine),
+                                          results_format=args.results_format, resume=not args.restart)
+        save_long_run_summary(long_run_state, config.mc_confidence)
+        if logan_airport.trace is not None:
+            logan_airport.trace.close()
 
-    # Create airport object (only have one object uncommented per run)
-    logan_airport = Airport(env, "control")
-    # logan_airport = Airport(env, "one_runway_down")
-    # logan_airport = Airport(env, "two_runways_down")
-    # logan_airport = Airport(env, "extra_runway")
-    # logan_airport = Airport(env, "extra_runway_with_two_down")
+    # Run a sweep of scenarios
+    elif args.sweep is not None:
+        scenarios = DEFAULT_SCENARIOS if args.sweep == "default" else load_scenarios(args.sweep)
+        sweep_results = simulate_scenarios(scenarios, num_workers, master_seed, args.engine,
+                                           args.common_random_numbers)
+        save_sweep_results(sweep_results, args.results_format)
+        if args.cross_check:
+            for scenario in scenarios:
+                wait_times, circle_times, _ = sweep_results[scenario.name]
+                save_cross_check(estimate_scenario(scenario), wait_times, circle_times)
+
+    # Run a single scenario
+    else:
+        # Create environment
+        env = simpy.Environment()
+
+        # Create airport object (only have one object uncommented per run)
+        logan_airport = Airport(env, "control", trace=open_trace())
+        # logan_airport = Airport(env, "one_runway_down")
+        # logan_airport = Airport(env, "two_runways_down")
+        # logan_airport = Airport(env, "extra_runway")
+        # logan_airport = Airport(env, "extra_runway_with_two_down")
+
+        # Run simulation
+        if config.continuous:
+            if resolve_engine(args.engine) != "simpy" or num_workers > 1:
+                logger.warning("Continuous runs are simulated on the SimPy engine in a single process")
+            simulate_continuous(logan_airport, config.num_replications, master_seed)
+        elif num_workers > 1:
+            simulate_airport_parallel(logan_airport, num_workers, master_seed, args.engine)
+        else:
+            simulate_airport(logan_airport, env, master_seed, args.engine)
+        logan_airport.save_simulation_data(args.results_format)
+        if args.cross_check:
+            save_cross_check(estimate_airport(logan_airport), logan_airport.wait_times, logan_airport.circle_times)
+        if logan_airport.trace is not None:
+            logan_airport.trace.close()
 
-    # Run simulation
-    simulate_airport(logan_airport, env)
-    logan_airport.save_simulation_data()
-    print(f"Finished! Time to complete simultation: {time.time() - start_time} seconds")
+    logger.info("Finished! Time to complete simultation: %s seconds", time.time() - start_time)
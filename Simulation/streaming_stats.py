@@ -0,0 +1,139 @@
+"""
+Streaming statistics that can be updated one batch of values at a time and merged across processes.
+
+    - `RunningStats` keeps the count, mean, variance (Welford/Chan updates), minimum and maximum of a stream
+    - `Histogram` bins a stream of non-negative values (wait/circle times in minutes) to estimate its quantiles
+    - `StreamingSummary` combines the two
+"""
+import numpy as np
+from statistics import NormalDist
+
+
+def t_critical_value(confidence, degrees_of_freedom):
+    """
+    Function to return the two-sided critical value of Student's t distribution: exact for 1 and 2 degrees of
+    freedom, where the distribution has closed-form quantiles, and otherwise approximated with a Cornish-Fisher
+    expansion around the normal quantile (within 1% at 95% confidence from 3 degrees of freedom on, within 1% at 99%
+    from 5 on, and within 1e-3 from 10 on)
+    """
+    v = degrees_of_freedom
+    if v == 1:
+        return float(np.tan(np.pi * confidence / 2))
+    if v == 2:
+        return float(confidence * np.sqrt(2 / (1 - confidence**2)))
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return (z + (z**3 + z) / (4 * v) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2) +
+            (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3))
+
+
+class RunningStats:
+    """Class to keep the count, mean, variance, minimum and maximum of a stream of values"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def add(self, value):
+        """Function to add a single value"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def add_many(self, values):
+        """Function to add an array of values"""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.minimum = float(values.min())
+        batch.maximum = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other):
+        """Function to merge the statistics of another stream into this one"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self):
+        """Function to return the sample variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        """Function to return the sample standard deviation"""
+        return float(np.sqrt(self.variance))
+
+    def half_width(self, confidence=0.95):
+        """Function to return the half-width of the confidence interval of the mean"""
+        if self.count < 2:
+            return np.inf
+        return t_critical_value(confidence, self.count - 1) * self.std / np.sqrt(self.count)
+
+
+class Histogram:
+    """Class to bin a stream of non-negative values into fixed-width bins to estimate its quantiles"""
+
+    def __init__(self, bin_width=0.05, max_value=720.0):
+        self.bin_width = bin_width
+        self.counts = np.zeros(int(np.ceil(max_value / bin_width)) + 1, dtype=np.int64)
+
+    def add_many(self, values):
+        """Function to add an array of values (values past the last bin are counted in it)"""
+        bins = np.minimum((np.asarray(values) / self.bin_width).astype(np.int64), len(self.counts) - 1)
+        self.counts += np.bincount(np.maximum(bins, 0), minlength=len(self.counts))
+
+    def merge(self, other):
+        """Function to merge the counts of another histogram with the same bins"""
+        self.counts += other.counts
+
+    def quantile(self, q):
+        """Function to estimate a quantile by interpolating inside the bin it falls in"""
+        total = self.counts.sum()
+        if total == 0:
+            return np.nan
+        cumulative = np.cumsum(self.counts)
+        rank = q * total
+        position = int(np.searchsorted(cumulative, rank, side="left"))
+        below = cumulative[position - 1] if position > 0 else 0
+        fraction = (rank - below) / self.counts[position] if self.counts[position] > 0 else 0.0
+        return (position + fraction) * self.bin_width
+
+
+class StreamingSummary:
+    """Class to summarize a stream of values by its moments and quantiles"""
+
+    def __init__(self, bin_width=0.05, max_value=720.0):
+        self.stats = RunningStats()
+        self.histogram = Histogram(bin_width, max_value)
+
+    def add_many(self, values):
+        """Function to add an array of values"""
+        self.stats.add_many(values)
+        self.histogram.add_many(values)
+
+    def merge(self, other):
+        """Function to merge another summary into this one"""
+        self.stats.merge(other.stats)
+        self.histogram.merge(other.histogram)
+
+    def quantile(self, q):
+        """Function to estimate a quantile of the values"""
+        return min(self.histogram.quantile(q), self.stats.maximum)
@@ -0,0 +1,123 @@
+"""
+Logging and event tracing for the simulation.
+
+Progress messages go through the standard `logging` module under the "Simulation" logger. Per-plane messages are
+logged at DEBUG level and are only formatted when that level is enabled. The level is set with LOG_LEVEL in the .env
+file (INFO by default; DEBUG prints every plane like the original simulation did).
+
+For analysis, an `EventTrace` records one fixed-size event per runway state change (time, day, flight, runway, event
+kind) into an in-memory buffer and writes it to disk in large blocks, either as JSON lines or as packed binary
+records that can be read back with `read_trace`. Tracing is enabled by setting TRACE_FILE in the .env file.
+"""
+import os
+import sys
+import json
+import logging
+import numpy as np
+from Simulation.config import load_config
+
+logger = logging.getLogger("Simulation")
+
+# Kinds of events recorded in a trace
+EVENT_KINDS = ("waiting", "circling", "cleared", "took_off", "landed", "closed", "reopened")
+EVENT_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+
+# Layout of a record in a binary trace
+TRACE_DTYPE = np.dtype([("time", "<f8"), ("day", "<i4"), ("kind", "u1"), ("runway", "S4"), ("flight", "S8")])
+
+
+def configure_logging(level=None):
+    """Function to send simulation log messages to stdout at the LOG_LEVEL from the .env file"""
+    if level is None:
+        level = load_config().log_level
+    logging.basicConfig(format="%(message)s", level=logging.WARNING, stream=sys.stdout)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+class EventTrace:
+    """Class to buffer simulation events and write them to a JSONL or binary trace file"""
+
+    def __init__(self, path, trace_format=None, buffer_size=65536, append=False):
+        if trace_format is None:
+            trace_format = "binary" if path.endswith(".bin") else "jsonl"
+        if trace_format not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown trace format: {trace_format}")
+
+        self.path = path
+        self.trace_format = trace_format
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.day = 0
+
+        # Start a fresh file, unless carrying on with the events already in it
+        open(self.path, "a" if append else "w").close()
+
+    def record(self, time, flight, runway, kind):
+        """Function to record a single event"""
+        self.buffer.append((time, self.day, EVENT_CODES[kind], runway, flight))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Function to write the buffered events to the trace file"""
+        if not self.buffer:
+            return
+
+        if self.trace_format == "binary":
+            with open(self.path, "ab") as file:
+                file.write(np.array(self.buffer, dtype=TRACE_DTYPE).tobytes())
+        else:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.writelines(json.dumps({"time": time, "day": day, "kind": EVENT_KINDS[kind], "runway": runway,
+                                            "flight": flight}) + "\n"
+                                for time, day, kind, runway, flight in self.buffer)
+        self.buffer = []
+
+    def truncate(self, day):
+        """
+        Function to drop the events of day `day` and later from the trace file, e.g. the days a resumed run simulates
+        again. Days are traced in order, so everything from the first event of a later day on is cut off.
+        """
+        self.flush()
+        offset = 0
+        if self.trace_format == "binary":
+            if os.path.getsize(self.path) >= TRACE_DTYPE.itemsize:
+                days = np.memmap(self.path, dtype=TRACE_DTYPE, mode="r")["day"]
+                offset = int(np.searchsorted(days, day, side="left")) * TRACE_DTYPE.itemsize
+                del days
+        else:
+            with open(self.path, "rb") as file:
+                for line in file:
+                    if json.loads(line)["day"] >= day:
+                        break
+                    offset += len(line)
+        os.truncate(self.path, offset)
+
+    def close(self):
+        """Function to write any events left in the buffer"""
+        self.flush()
+
+
+def open_trace(path=None, suffix="", append=False):
+    """
+    Function to open the trace set by TRACE_FILE in the .env file, returning None when tracing is disabled. With
+    `append` the events already in the file are kept.
+    """
+    if path is None:
+        path = load_config().trace_file
+    if not path:
+        return None
+
+    # Separate files for separate writers (e.g. worker processes)
+    if suffix:
+        stem, extension = os.path.splitext(path)
+        path = f"{stem}.{suffix}{extension}"
+    return EventTrace(path, load_config().trace_format, append=append)
+
+
+def read_trace(path):
+    """Function to read a trace file back as a numpy record array (binary) or a list of dicts (JSONL)"""
+    if path.endswith(".bin"):
+        return np.fromfile(path, dtype=TRACE_DTYPE)
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
@@ -0,0 +1,82 @@
+"""
+Batch generation of a day's worth of air traffic.
+
+Instead of creating planes one at a time inside the SimPy loop, a whole day of traffic is drawn up front as column
+arrays (arrival times, departure flags, airline, route, aircraft, flight numbers, jet flags and runway service times)
+with a handful of vectorized numpy calls. `Airport.simulate` or the fast engine then step through the arrays. A day's
+traffic can be saved to disk and replayed later.
+"""
+import numpy as np
+from Simulation.arrivals import TIME_BLOCKS, generate_arrival_times
+from Simulation.config import load_config
+
+# Columns stored for every plane
+TRAFFIC_COLUMNS = ("delays", "times", "departing", "airline", "route", "aircraft", "flight_number", "jet",
+                   "service_time")
+
+
+def load_settings(overrides=None):
+    """
+    Function to return the arrival rates, departure probabilities and runway service rates of the config (read once
+    from the .env file). Values in `overrides` (keyed by .env name, e.g. "LAMBDA_MORNING") replace the ones from the
+    file.
+    """
+    return load_config().settings.with_overrides(overrides)
+
+
+def departure_probabilities(settings, times):
+    """Function to look up the departure probability of each arrival time"""
+    block_ends = np.array([block_end for block_end, _ in TIME_BLOCKS], dtype=np.float64)
+    block_probabilities = np.array([settings[f"DEPARTURE_PROB_{block}"] for _, block in TIME_BLOCKS])
+    blocks = np.minimum(np.searchsorted(block_ends, times, side="right"), len(TIME_BLOCKS) - 1)
+    return block_probabilities[blocks]
+
+
+class DailyTraffic:
+    """Class to hold one day of pre-drawn traffic as column arrays"""
+
+    def __init__(self, day, delays, times, departing, airline, route, aircraft, flight_number, jet, service_time):
+        self.day = day
+        self.delays = delays
+        self.times = times
+        self.departing = departing
+        self.airline = airline
+        self.route = route
+        self.aircraft = aircraft
+        self.flight_number = flight_number
+        self.jet = jet
+        self.service_time = service_time
+
+    def __len__(self):
+        return len(self.times)
+
+    def save(self, path):
+        """Function to save the day's traffic to a .npz file"""
+        np.savez(path, day=self.day, **{column: getattr(self, column) for column in TRAFFIC_COLUMNS})
+
+    @classmethod
+    def load(cls, path):
+        """Function to load a day's traffic saved with `save`"""
+        with np.load(path) as data:
+            return cls(int(data["day"]), **{column: data[column] for column in TRAFFIC_COLUMNS})
+
+
+def generate_daily_traffic(plane_sampler, day=0, settings=None, rng=None):
+    """
+    Function to draw every plane of a replication day in a few vectorized calls. Draws come from `rng` if given,
+    otherwise from the sampler's own random stream. Each plane's take-off/landing time is drawn here too, so every
+    engine serves a plane with the same draw whatever order the runways free up in.
+    """
+    if settings is None:
+        settings = load_settings()
+    if rng is None:
+        rng = plane_sampler.rng
+
+    delays, times = generate_arrival_times(settings, rng)
+    departing = rng.random(len(times)) < departure_probabilities(settings, times)
+    airline, route, aircraft, flight_number = plane_sampler.draw_many(departing, rng=rng)
+    jet = plane_sampler.aircraft_jet[plane_sampler.aircraft_code[aircraft]]
+    service_time = rng.standard_exponential(len(times)) / np.where(departing, settings["MU_TAKEOFF"],
+                                                                   settings["MU_LANDING"])
+
+    return DailyTraffic(day, delays, times, departing, airline, route, aircraft, flight_number, jet, service_time)
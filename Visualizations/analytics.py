@@ -0,0 +1,135 @@
+"""
+Streaming aggregates of simulation results for the report.
+
+A `ResultsSummary` folds departure or arrival records into fixed-size aggregates one batch at a time, so memory stays
+bounded however many days or scenarios are summarized:
+    - count, mean, maximum and quantiles of the wait/circle times
+    - mean wait/circle time per hour of the day
+    - count, mean and quantiles per runway, and the mean number of flights per runway per day
+
+Batches can be DataFrames streamed from the saved results files (`summarize_results`) or the record chunks of a
+simulator's recorders (`summarize_recorder`), so a report can be produced straight from a run without saving it first.
+"""
+import numpy as np
+import pandas as pd
+from Simulation.config import load_config
+from Simulation.results import DIRECTIONS, iter_results
+from Simulation.streaming_stats import StreamingSummary
+
+# Hours a record can be rounded to
+NUM_HOURS = 25
+
+
+class ResultsSummary:
+    """Class to aggregate the departure or arrival records of one scenario in a single streaming pass"""
+
+    def __init__(self, wait_column, num_days=None):
+        self.wait_column = wait_column
+        self.default_num_days = num_days
+        self.summary = StreamingSummary()
+        self.hour_totals = np.zeros(NUM_HOURS)
+        self.hour_counts = np.zeros(NUM_HOURS, dtype=np.int64)
+        self.runways = {}
+        self.days = set()
+
+    def update(self, times, wait_times, runways, days=None):
+        """Function to add a batch of records given as arrays of times (hours), wait/circle times, runways and days"""
+        wait_times = np.asarray(wait_times, dtype=np.float64)
+        if len(wait_times) == 0:
+            return
+        self.summary.add_many(wait_times)
+
+        # Hour of the day, rounded the same way as Python's round()
+        hours = np.clip(np.round(np.asarray(times, dtype=np.float64)), 0, NUM_HOURS - 1).astype(np.int64)
+        self.hour_totals += np.bincount(hours, weights=wait_times, minlength=NUM_HOURS)
+        self.hour_counts += np.bincount(hours, minlength=NUM_HOURS)
+
+        # Split the batch by runway in one sort instead of filtering it once per runway
+        runway_names, runway_index = np.unique(np.asarray(runways), return_inverse=True)
+        order = np.argsort(runway_index, kind="stable")
+        splits = np.cumsum(np.bincount(runway_index, minlength=len(runway_names)))[:-1]
+        for runway, runway_wait_times in zip(runway_names.tolist(), np.split(wait_times[order], splits)):
+            self.runways.setdefault(str(runway), StreamingSummary()).add_many(runway_wait_times)
+
+        if days is not None:
+            self.days.update(np.unique(days).tolist())
+
+    def update_frame(self, frame):
+        """Function to add a DataFrame of records (as saved by the simulator)"""
+        self.update(frame["Time"].to_numpy(), frame[self.wait_column].to_numpy(), frame["Runway"].to_numpy(),
+                    frame["Day"].to_numpy() if "Day" in frame.columns and frame["Day"].notna().all() else None)
+
+    def update_chunk(self, chunk):
+        """Function to add a chunk of records from a simulator's recorder"""
+        runways = np.array(chunk.strings["runway"], dtype=object)[chunk.columns["runway"]]
+        self.update(chunk.columns["time"], chunk.columns["wait_time"], runways, chunk.columns["day"])
+
+    @property
+    def count(self):
+        """Function to return the number of records"""
+        return self.summary.stats.count
+
+    @property
+    def mean(self):
+        """Function to return the mean wait/circle time"""
+        return self.summary.stats.mean
+
+    @property
+    def maximum(self):
+        """Function to return the longest wait/circle time"""
+        return self.summary.stats.maximum
+
+    def quantile(self, q):
+        """Function to estimate a quantile of the wait/circle times"""
+        return self.summary.quantile(q)
+
+    @property
+    def num_days(self):
+        """Function to return the number of days summarized (NUM_REPLICATIONS when the records have no days)"""
+        if self.days:
+            return len(self.days)
+        if self.default_num_days is not None:
+            return self.default_num_days
+        return load_config().num_replications
+
+    def hourly_means(self):
+        """Function to return a DataFrame of the mean wait/circle time of every hour with records"""
+        hours = np.flatnonzero(self.hour_counts)
+        return pd.DataFrame({"Rounded Time": hours.astype(np.float64),
+                             self.wait_column: self.hour_totals[hours] / self.hour_counts[hours]})
+
+    def runway_table(self, quantiles=(0.5, 0.9)):
+        """Function to return a DataFrame of the flights per day, mean and quantiles of every runway"""
+        rows = []
+        for runway, summary in self.runways.items():
+            row = {"Runway": runway, "Flights": summary.stats.count,
+                   "Daily Mean": summary.stats.count / self.num_days, "Mean": summary.stats.mean}
+            for q in quantiles:
+                row[f"P{round(q * 100)}"] = summary.quantile(q)
+            rows.append(row)
+        return pd.DataFrame(rows, columns=["Runway", "Flights", "Daily Mean", "Mean"] +
+                            [f"P{round(q * 100)}" for q in quantiles])
+
+
+def summarize_results(scenario, num_days=None, **kwargs):
+    """Function to summarize the saved departure/arrival results of a scenario, streaming them file by file"""
+    summaries = []
+    for direction, wait_column in DIRECTIONS.items():
+        summary = ResultsSummary(wait_column, num_days)
+        for frame in iter_results(direction, scenario, columns=["Time", "Runway", wait_column], **kwargs):
+            summary.update_frame(frame)
+        if summary.count == 0:
+            raise FileNotFoundError(f"No {direction} results found for scenario: {scenario}")
+        summaries.append(summary)
+    return tuple(summaries)
+
+
+def summarize_recorder(wait_times, circle_times, num_days=None):
+    """Function to summarize the departure/arrival recorders of a simulated scenario without saving them first"""
+    summaries = []
+    for recorder, wait_column in zip((wait_times, circle_times), DIRECTIONS.values()):
+        summary = ResultsSummary(wait_column, num_days)
+        for chunk in recorder.iter_chunks():
+            summary.update_chunk(chunk)
+        summaries.append(summary)
+    return tuple(summaries)
@@ -0,0 +1,51 @@
+"""
+Shared fixtures of the test suite. Every test runs on a copy of the .env config with the options that write files or
+change the traffic (traces, spilling, metrics, disruptions, a fixed seed) turned off, so local edits to .env do not
+change what the tests check.
+"""
+from dataclasses import replace
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from Simulation.config import load_config, use_config
+
+
+@pytest.fixture(autouse=True)
+def config():
+    """Fixture to run a test on a short, quiet copy of the config and restore the original afterwards"""
+    original = load_config()
+    logging.getLogger("Simulation").setLevel(logging.WARNING)
+    yield use_config(replace(original, num_replications=3, num_workers=1, random_seed=None, trace_file=None,
+                             spill_dir=None, metrics_interval=None, disruptions=None, warmup_days=0,
+                             continuous=False))
+    use_config(original)
+
+
+@pytest.fixture
+def configure(config):
+    """Fixture to change options of the test's config, e.g. `configure(num_replications=5)`"""
+    def configure(**options):
+        return use_config(replace(config, **options))
+    return configure
+
+
+def records(airport):
+    """Function to return the departure and arrival records of an airport as DataFrames"""
+    return airport.wait_times.to_frame("Wait Time", True), airport.circle_times.to_frame("Circle Time", True)
+
+
+def assert_same_records(airport, other):
+    """Function to check two airports recorded exactly the same departures and arrivals"""
+    for frame, other_frame in zip(records(airport), records(other)):
+        pd.testing.assert_frame_equal(frame, other_frame)
+
+
+def assert_same_metrics(metrics, other):
+    """Function to check two runway metrics recorders hold the same days"""
+    assert sorted(metrics.days) == sorted(other.days)
+    for day, day_metrics in metrics.days.items():
+        other_day = other.days[day]
+        assert day_metrics.runways == other_day.runways
+        for name in ("edges", "queue_mean", "queue_max", "utilization", "throughput"):
+            np.testing.assert_array_equal(getattr(day_metrics, name), getattr(other_day, name))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+import simpy
+from Simulation.airport import Airport
+from Simulation.simulator import simulate_airport
+from Visualizations.analytics import ResultsSummary, summarize_recorder, summarize_results
+
+
+@pytest.fixture
+def airport(config):
+    airport = Airport(simpy.Environment(), "control")
+    simulate_airport(airport, airport.env, 6, "fast")
+    return airport
+
+
+def check_summary(summary, frame, wait_column, num_days):
+    wait_times = frame[wait_column]
+    assert summary.count == len(frame)
+    assert summary.mean == pytest.approx(wait_times.mean())
+    assert summary.maximum == wait_times.max()
+    assert summary.num_days == num_days
+    for q in (0.5, 0.9):
+        assert abs(summary.quantile(q) - wait_times.quantile(q)) <= 0.05
+
+    hourly = frame.groupby(frame["Time"].round())[wait_column].mean()
+    hourly_means = summary.hourly_means()
+    np.testing.assert_array_equal(hourly_means["Rounded Time"], hourly.index)
+    np.testing.assert_allclose(hourly_means[wait_column], hourly.to_numpy())
+
+    runways = summary.runway_table().set_index("Runway")
+    counts = frame.groupby("Runway").size()
+    assert sorted(runways.index) == sorted(counts.index)
+    for runway, count in counts.items():
+        assert runways.loc[runway, "Flights"] == count
+        assert runways.loc[runway, "Daily Mean"] == pytest.approx(count / num_days)
+        assert runways.loc[runway, "Mean"] == pytest.approx(frame.loc[frame["Runway"] == runway, wait_column].mean())
+
+
+def test_recorder_summary_matches_pandas(airport, config):
+    departures, arrivals = summarize_recorder(airport.wait_times, airport.circle_times)
+    check_summary(departures, airport.wait_times.to_frame("Wait Time", True), "Wait Time", config.num_replications)
+    check_summary(arrivals, airport.circle_times.to_frame("Circle Time", True), "Circle Time", config.num_replications)
+
+
+def test_saved_results_summary_matches_pandas(airport, config, tmp_path):
+    airport.save_simulation_data("csv", str(tmp_path))
+    departures, arrivals = summarize_results("control", results_dir=str(tmp_path))
+    check_summary(departures, airport.wait_times.to_frame("Wait Time", True), "Wait Time", config.num_replications)
+    check_summary(arrivals, airport.circle_times.to_frame("Circle Time", True), "Circle Time", config.num_replications)
+
+
+def test_batches_give_the_same_summary(airport):
+    frame = airport.wait_times.to_frame("Wait Time", True)
+    whole, batched = ResultsSummary("Wait Time"), ResultsSummary("Wait Time")
+    whole.update_frame(frame)
+    for batch in np.array_split(np.arange(len(frame)), 7):
+        batched.update_frame(frame.iloc[batch])
+
+    assert batched.count == whole.count and batched.maximum == whole.maximum
+    assert batched.mean == pytest.approx(whole.mean)
+    pd.testing.assert_frame_equal(batched.hourly_means(), whole.hourly_means())
+    pd.testing.assert_frame_equal(batched.runway_table().sort_values("Runway", ignore_index=True),
+                                  whole.runway_table().sort_values("Runway", ignore_index=True))
+
+
+def test_missing_results_raise(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        summarize_results("control", results_dir=str(tmp_path), data_dir=str(tmp_path))
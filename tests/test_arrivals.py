@@ -0,0 +1,107 @@
+from dataclasses import replace
+import numpy as np
+import pytest
+from Simulation.arrivals import (DAY_LENGTH, TIME_BLOCKS, RateProfile, fixed_arrival_times, generate_arrival_times,
+                                 poisson_arrival_times)
+from Simulation.traffic import load_settings
+
+# Planes per hour over a day, with a quiet night and an empty hour
+HOURLY_RATES = [2, 1, 0, 1, 2, 6, 20, 40, 45, 35, 30, 30, 32, 30, 28, 30, 36, 44, 40, 30, 22, 14, 8, 4]
+NUM_DAYS = 400
+
+
+def hourly_counts(profile, method, seed):
+    """Function to return the number of arrivals in each hour of NUM_DAYS days, one row per day"""
+    rng = np.random.default_rng(seed)
+    return np.array([np.bincount((poisson_arrival_times(profile, rng, method) // 60).astype(int), minlength=24)
+                     for _ in range(NUM_DAYS)])
+
+
+def expected_hourly_counts(profile):
+    """Function to integrate a profile's rate over each hour with the midpoint rule on a fine grid"""
+    steps = 600
+    times = (np.arange(24 * steps) + 0.5) * 60 / steps
+    return profile.rate(times).reshape(24, steps).sum(axis=1) * 60 / steps
+
+
+def check_counts(counts, expected):
+    """Function to check the mean hourly counts of Poisson days are within 5 standard errors of the expected ones"""
+    standard_errors = np.sqrt(np.maximum(expected, 1e-9) / len(counts))
+    assert np.all(np.abs(counts.mean(axis=0) - expected) < 5 * standard_errors + 1e-12)
+
+
+def test_expected_arrivals_of_the_blocks():
+    settings = load_settings()
+    profile = RateProfile.from_blocks(settings)
+    assert profile.expected_arrivals() == pytest.approx(sum(360 / settings[f"LAMBDA_{block}"]
+                                                            for _, block in TIME_BLOCKS))
+    rates = [1 / settings[f"LAMBDA_{block}"] for block in ("NIGHT", "NIGHT", "MORNING", "EVENING")]
+    assert profile.rate([0.0, 359.9, 360.0, 1439.9]).tolist() == rates
+
+
+def test_expected_arrivals_of_hourly_profiles():
+    step = RateProfile.hourly(HOURLY_RATES)
+    assert step.expected_arrivals() == pytest.approx(sum(HOURLY_RATES))
+
+    # The linear profile is flat for the first and last half hour and a trapezoid between the middles of the hours
+    linear = RateProfile.hourly(HOURLY_RATES, "linear")
+    trapezoids = sum((a + b) / 2 for a, b in zip(HOURLY_RATES[:-1], HOURLY_RATES[1:]))
+    assert linear.expected_arrivals() == pytest.approx((HOURLY_RATES[0] + HOURLY_RATES[-1]) / 2 + trapezoids)
+    assert linear.expected_arrivals() == pytest.approx(expected_hourly_counts(linear).sum())
+
+
+@pytest.mark.parametrize("method", ["inversion", "thinning"])
+def test_step_rates_give_the_hourly_counts(method):
+    profile = RateProfile.hourly(HOURLY_RATES)
+    counts = hourly_counts(profile, method, seed=19)
+    check_counts(counts, np.array(HOURLY_RATES, dtype=float))
+    assert counts[:, 2].sum() == 0
+
+    # Daily totals are Poisson: their variance matches their mean
+    totals = counts.sum(axis=1)
+    assert totals.var(ddof=1) / sum(HOURLY_RATES) == pytest.approx(1.0, abs=0.2)
+
+
+def test_linear_rates_give_the_integrated_counts():
+    profile = RateProfile.hourly(HOURLY_RATES, "linear")
+    check_counts(hourly_counts(profile, None, seed=23), expected_hourly_counts(profile))
+
+
+def test_arrival_times_are_sorted_and_inside_the_day():
+    rng = np.random.default_rng(5)
+    for profile in (RateProfile.hourly(HOURLY_RATES), RateProfile.hourly(HOURLY_RATES, "linear")):
+        times = poisson_arrival_times(profile, rng)
+        assert np.all(np.diff(times) >= 0)
+        assert times.min() >= 0 and times.max() < DAY_LENGTH
+
+
+def test_inversion_needs_a_step_profile():
+    with pytest.raises(ValueError):
+        poisson_arrival_times(RateProfile.hourly(HOURLY_RATES, "linear"), np.random.default_rng(), "inversion")
+    with pytest.raises(ValueError):
+        RateProfile([0.0], [-1.0])
+
+
+def test_fixed_times_match_a_simpy_clock():
+    # The original process: wait the LAMBDA of the block the previous plane showed up in, stop at midnight
+    settings = load_settings({"LAMBDA_NIGHT": 7, "LAMBDA_MORNING": 1.3, "LAMBDA_AFTERNOON": 0.7, "LAMBDA_EVENING": 2.9})
+    expected = []
+    now = 0.0
+    while True:
+        block = next(block for block_end, block in TIME_BLOCKS if now < block_end)
+        now += settings[f"LAMBDA_{block}"]
+        if now >= DAY_LENGTH:
+            break
+        expected.append(now)
+
+    delays, times = fixed_arrival_times(settings)
+    assert times.tolist() == expected
+    assert np.cumsum(delays).tolist() == expected
+
+
+def test_poisson_delays_add_up_to_the_times():
+    settings = replace(load_settings(), arrival_process="poisson", arrival_rates=tuple(HOURLY_RATES))
+    delays, times = generate_arrival_times(settings, np.random.default_rng(11))
+    assert np.all(delays >= 0) and times.max() < DAY_LENGTH
+    assert np.cumsum(delays).tolist() == times.tolist()
+    assert generate_arrival_times(settings, np.random.default_rng(11))[1].tolist() == times.tolist()
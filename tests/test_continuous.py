@@ -0,0 +1,41 @@
+import pandas as pd
+import simpy
+from Simulation.airport import Airport
+from Simulation.continuous import simulate_continuous
+from Simulation.simulator import simulate_airport
+from tests.conftest import assert_same_records, records
+
+
+def daily_loop(master_seed, engine="simpy", **airport_kwargs):
+    airport = Airport(simpy.Environment(), "control", **airport_kwargs)
+    simulate_airport(airport, airport.env, master_seed, engine)
+    return airport
+
+
+def continuous_run(num_days, master_seed, **airport_kwargs):
+    airport = Airport(simpy.Environment(), "control", **airport_kwargs)
+    simulate_continuous(airport, num_days, master_seed, warmup_days=0)
+    return airport
+
+
+def test_continuous_day_extends_daily_loop(configure, config):
+    # A single day only differs by the planes still in line at midnight, which a continuous run serves afterwards
+    configure(num_replications=1)
+    settings = config.settings.with_overrides({"LAMBDA_MORNING": 0.5, "LAMBDA_AFTERNOON": 0.5,
+                                               "LAMBDA_EVENING": 0.5, "LAMBDA_NIGHT": 0.5})
+    daily = daily_loop(4, settings=settings)
+    continuous = continuous_run(1, 4, settings=settings)
+
+    assert len(continuous.wait_times) + len(continuous.circle_times) > len(daily.wait_times) + len(daily.circle_times)
+    for frame, continuous_frame in zip(records(daily), records(continuous)):
+        pd.testing.assert_frame_equal(continuous_frame.iloc[:len(frame)], frame)
+
+
+def test_continuous_run_matches_daily_loop_without_overnight_lines(configure, config):
+    # With a plane every 20 minutes no line is left at midnight, so every day starts from empty runways either way
+    configure(num_replications=4)
+    settings = config.settings.with_overrides({"LAMBDA_MORNING": 20.0, "LAMBDA_AFTERNOON": 20.0,
+                                               "LAMBDA_EVENING": 20.0, "LAMBDA_NIGHT": 20.0})
+    daily = daily_loop(8, settings=settings)
+    assert sorted(records(daily)[0]["Day"].unique()) == [0, 1, 2, 3]
+    assert_same_records(continuous_run(4, 8, settings=settings), daily)
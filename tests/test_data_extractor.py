@@ -0,0 +1,114 @@
+"""
+Checks the vectorized DataExtractor against a row-by-row port of the extractor it replaced, which walked the route
+data one row at a time.
+"""
+import os
+import pandas as pd
+import pytest
+from Data.data_cache import DATA_DIR
+from Data.data_extractor import WIND_PROBABILITIES, DataExtractor
+
+AIRPORT_CODES = ("BOS", "JFK", "ACK")
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return DataExtractor(quiet=True, airport_codes=AIRPORT_CODES)
+
+
+@pytest.fixture(scope="module")
+def route_data():
+    return pd.read_csv(os.path.join(DATA_DIR, "routes.csv")).fillna("None")
+
+
+def ordered(tree):
+    """Function to turn nested dictionaries into nested lists of items, so comparisons also check their order"""
+    if isinstance(tree, dict):
+        return [(key, ordered(value)) for key, value in tree.items()]
+    return tree
+
+
+def reference_routes(rows, airport_column):
+    """Function to extract the route -> airline -> aircraft data of one direction row by row"""
+    routes = {}
+    for i in range(len(rows)):
+        airport = rows[airport_column][i]
+        if airport not in routes:
+            routes[airport] = {}
+        routes[airport][rows["Airline"][i]] = rows["Equipment"][i].split(" ")
+    return routes
+
+
+def reference_probabilities(rows, airport_column):
+    """Function to build the airline -> route -> aircraft probability tree of one direction row by row"""
+    tree = {}
+    for i in range(len(rows)):
+        aircrafts = rows["Equipment"][i].split(" ")
+        airline = rows["Airline"][i]
+        airport = rows[airport_column][i]
+
+        if airline not in tree:
+            tree[airline] = {"Count": 0, "Routes": {}}
+        tree[airline]["Count"] += 1
+        if airport not in tree[airline]["Routes"]:
+            tree[airline]["Routes"][airport] = {"Count": 0}
+        tree[airline]["Routes"][airport]["Count"] += 1
+        if "Aircrafts" not in tree[airline]["Routes"][airport]:
+            tree[airline]["Routes"][airport]["Aircrafts"] = {aircraft: {"Probability": 1/len(aircrafts)}
+                                                            for aircraft in aircrafts}
+
+    # The original divided the arrival counts by the number of departures, which is the same at Logan
+    for airline in tree:
+        tree[airline]["Probability"] = tree[airline]["Count"] / len(rows)
+        for route in tree[airline]["Routes"].values():
+            route["Probability"] = route["Count"] / len(tree[airline]["Routes"])
+    return tree
+
+
+def direction_rows(route_data, code):
+    departures = route_data[route_data["Source Airport"] == code].reset_index(drop=True)
+    arrivals = route_data[route_data["Destination Airport"] == code].reset_index(drop=True)
+    return departures, arrivals
+
+
+@pytest.mark.parametrize("code", AIRPORT_CODES)
+def test_routes_match_row_by_row_extraction(extractor, route_data, code):
+    departures, arrivals = direction_rows(route_data, code)
+    expected = {"Departures": reference_routes(departures, "Destination Airport"),
+                "Arrivals": reference_routes(arrivals, "Source Airport")}
+    assert ordered(extractor.routes[code]) == ordered(expected)
+
+
+@pytest.mark.parametrize("code", AIRPORT_CODES)
+def test_probabilities_match_row_by_row_extraction(extractor, route_data, code):
+    departures, arrivals = direction_rows(route_data, code)
+    expected = {
+        "Departures": reference_probabilities(departures, "Destination Airport"),
+        "Arrivals": reference_probabilities(arrivals, "Source Airport"),
+        "Num Departures": len(departures),
+        "Departure Rate": round(len(departures)/24, 0),
+        "Num Arrivals": len(arrivals),
+        "Arrival Rate": round(len(arrivals)/24, 0),
+        "Wind": WIND_PROBABILITIES,
+    }
+    assert ordered(extractor.probabilities[code]) == ordered(expected)
+
+
+def test_airports_and_airlines_match_row_by_row_extraction(extractor):
+    airports = {}
+    airport_data = extractor.airport_data
+    for i in range(len(airport_data)):
+        airports[airport_data["IATA"][i]] = {"Name": airport_data["Name"][i], "City": airport_data["City"][i],
+                                             "Country": airport_data["Country"][i]}
+    assert ordered(extractor.airports) == ordered(airports)
+
+    airlines = {}
+    airline_data = extractor.airline_data
+    for i in range(len(airline_data)):
+        airlines[airline_data["IATA"][i]] = {"Name": airline_data["Name"][i], "ICAO": airline_data["ICAO"][i]}
+    assert ordered(extractor.airlines) == ordered(airlines)
+
+
+def test_runways_only_known_for_logan(extractor):
+    assert list(extractor.runways) == ["BOS"]
+    assert set(extractor.runways["BOS"]) == set(WIND_PROBABILITIES)
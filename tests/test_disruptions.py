@@ -0,0 +1,83 @@
+import pytest
+import simpy
+from Simulation.airport import Airport
+from Simulation.continuous import simulate_continuous
+from Simulation.disruptions import DisruptionModel, RunwayEvent
+from Simulation.replication import draw_replication, generate_day_seeds, simulate_day
+from Simulation.simulator import simulate_airport
+from tests.conftest import assert_same_records
+
+# Excluding both of Logan's Northeast arrival runways leaves arrivals nowhere to land in a Northeast wind
+NO_ARRIVAL_RUNWAYS = ("4L", "4R")
+
+
+def northeast_day(engine, disruptions=None):
+    airport = Airport(simpy.Environment(), "control", ignore_runways=NO_ARRIVAL_RUNWAYS, disruptions=disruptions)
+    day_seed = generate_day_seeds(1, 3)[0]
+    _, traffic = draw_replication(airport, day_seed)
+    simulate_day(airport, 0, day_seed, engine=engine, replication=("Northeast", traffic))
+    return airport
+
+
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+def test_plane_without_runway_fails(engine):
+    with pytest.raises(KeyError):
+        northeast_day(engine)
+
+
+@pytest.mark.parametrize("disruptions", [DisruptionModel(), DisruptionModel([RunwayEvent(600.0, close=("9",))])])
+def test_plane_without_runway_fails_when_no_change_opens_one(disruptions):
+    with pytest.raises(KeyError):
+        northeast_day("simpy", disruptions)
+
+
+@pytest.mark.parametrize("event", [RunwayEvent(600.0, reopen=("4L",)), RunwayEvent(600.0, wind="Southwest")])
+def test_plane_without_runway_holds_until_one_opens(event):
+    airport = northeast_day("fast", DisruptionModel([event]))
+    arrivals = airport.circle_times.to_frame("Circle Time")
+
+    # Arrivals from before the change all waited for it
+    early = arrivals[arrivals["Time"] * 60 < 600.0]
+    assert len(early) > 0
+    assert (early["Time"] * 60 + early["Circle Time"] >= 600.0 - 1.0).all()
+    assert airport.holding == 0
+
+
+def test_runway_closing_at_midnight_is_gone_the_next_day(config):
+    # A busy runway closed just before midnight is still serving its last plane when the day ends
+    settings = config.settings.with_overrides({f"LAMBDA_{block}": 0.5
+                                               for block in ("NIGHT", "MORNING", "AFTERNOON", "EVENING")})
+    airport = Airport(simpy.Environment(), "control", settings=settings, metrics_interval=60.0)
+    day_seeds = generate_day_seeds(2, 3)
+
+    airport.disruptions = DisruptionModel([RunwayEvent(1439.9, close=("4R",))])
+    simulate_day(airport, 0, day_seeds[0], replication=("Northeast", draw_replication(airport, day_seeds[0])[1]))
+    assert list(airport.closing_runways) == ["4R"]
+
+    # The next day's runway change only knows of that day's runways
+    airport.disruptions = DisruptionModel([RunwayEvent(600.0, close=("14",))])
+    simulate_day(airport, 1, day_seeds[1], replication=("Southeast", draw_replication(airport, day_seeds[1])[1]))
+    assert "4R" not in airport.closing_runways
+    assert "4R" not in airport.metrics.days[1].runways
+    assert "4R" not in airport.wait_times.to_frame("Wait Time", True).query("Day == 1")["Runway"].values
+
+
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+def test_empty_disruption_model_changes_nothing(engine):
+    def daily_loop(disruptions):
+        airport = Airport(simpy.Environment(), "control", disruptions=disruptions)
+        simulate_airport(airport, airport.env, 2, engine)
+        return airport
+
+    assert_same_records(daily_loop(DisruptionModel()), daily_loop(None))
+
+
+def test_continuous_run_with_empty_disruption_model_matches_none(configure):
+    configure(num_replications=1)
+
+    def continuous_run(disruptions):
+        airport = Airport(simpy.Environment(), "control", disruptions=disruptions)
+        simulate_continuous(airport, 2, 6, warmup_days=0)
+        return airport
+
+    assert_same_records(continuous_run(DisruptionModel()), continuous_run(None))
@@ -0,0 +1,40 @@
+from dataclasses import replace
+import pytest
+import simpy
+from Simulation.airport import Airport
+from Simulation.simulator import simulate_airport
+from tests.conftest import assert_same_metrics, assert_same_records
+
+EXCLUSION_SETS = [(), ("27", "32"), ("27", "32", "99"), ("9", "4L", "15R", "22L")]
+
+
+def run_engine(settings, exclude_runways, engine, master_seed=7):
+    airport = Airport(simpy.Environment(), "control", ignore_runways=exclude_runways, settings=settings)
+    simulate_airport(airport, airport.env, master_seed, engine)
+    return airport
+
+
+@pytest.mark.parametrize("arrival_process", ["fixed", "poisson"])
+@pytest.mark.parametrize("exclude_runways", EXCLUSION_SETS)
+def test_fast_engine_matches_simpy(config, arrival_process, exclude_runways):
+    settings = replace(config.settings, arrival_process=arrival_process)
+    simpy_airport = run_engine(settings, exclude_runways, "simpy")
+    fast_airport = run_engine(settings, exclude_runways, "fast")
+
+    assert len(simpy_airport.wait_times) > 0 and len(simpy_airport.circle_times) > 0
+    assert_same_records(simpy_airport, fast_airport)
+
+
+def test_fast_engine_matches_simpy_on_busy_days(config):
+    # Planes every half minute keep every runway's line long all day
+    settings = config.settings.with_overrides({"LAMBDA_MORNING": 0.5, "LAMBDA_AFTERNOON": 0.5,
+                                               "LAMBDA_EVENING": 0.5, "LAMBDA_NIGHT": 0.5})
+    assert_same_records(run_engine(settings, ("27", "32"), "simpy"), run_engine(settings, ("27", "32"), "fast"))
+
+
+def test_fast_engine_matches_simpy_metrics(configure):
+    config = configure(metrics_interval=60.0)
+    simpy_airport = run_engine(config.settings, ("27", "32"), "simpy")
+    fast_airport = run_engine(config.settings, ("27", "32"), "fast")
+    assert len(simpy_airport.metrics.days) == config.num_replications
+    assert_same_metrics(simpy_airport.metrics, fast_airport.metrics)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+import simpy
+import Simulation.long_run as long_run
+from Simulation.airport import Airport
+from Simulation.monte_carlo import summarize
+from Simulation.results import load_results
+from Simulation.trace import EventTrace, read_trace
+
+
+class Preempted(Exception):
+    pass
+
+
+def run(results_dir, num_days=8, master_seed=5, trace_path=None):
+    # Small trace buffers write events to disk partway through a block, as a long day would
+    trace = EventTrace(str(trace_path), buffer_size=100, append=True) if trace_path is not None else None
+    airport = Airport(simpy.Environment(), "control", trace=trace)
+    state = long_run.run_long_horizon(airport, num_days, master_seed, "simpy", checkpoint_interval=3,
+                                      results_format="csv", results_dir=str(results_dir))
+    if trace is not None:
+        trace.close()
+    return state
+
+
+def preempt_at(monkeypatch, stop_day):
+    """Function to make long runs stop with a Preempted error when they get to a day"""
+    simulate_day = long_run.simulate_day
+
+    def preempted(airport, day, *args, **kwargs):
+        if day == stop_day:
+            raise Preempted()
+        return simulate_day(airport, day, *args, **kwargs)
+
+    monkeypatch.setattr(long_run, "simulate_day", preempted)
+    return simulate_day
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path, monkeypatch):
+    uninterrupted = run(tmp_path / "uninterrupted")
+
+    # Stop the second run partway through its third block, after two checkpoints
+    simulate_day = preempt_at(monkeypatch, 7)
+    with pytest.raises(Preempted):
+        run(tmp_path / "resumed")
+    checkpoint = long_run.load_checkpoint(long_run.checkpoint_path("control", tmp_path / "resumed" / "checkpoints"))
+    assert checkpoint.next_day == 6
+
+    monkeypatch.setattr(long_run, "simulate_day", simulate_day)
+    resumed = run(tmp_path / "resumed")
+
+    assert resumed.next_day == uninterrupted.next_day == 8
+    for direction in ("departure", "arrival"):
+        expected = load_results(direction, results_dir=str(tmp_path / "uninterrupted"))
+        assert sorted(expected["Day"].unique()) == list(range(8))
+        pd.testing.assert_frame_equal(load_results(direction, results_dir=str(tmp_path / "resumed")), expected)
+    pd.testing.assert_frame_equal(summarize({"control": resumed.statistics}),
+                                  summarize({"control": uninterrupted.statistics}))
+
+
+def test_checkpoint_of_another_seed_is_not_resumed(tmp_path):
+    run(tmp_path, num_days=3, master_seed=5)
+    with pytest.raises(ValueError):
+        run(tmp_path, num_days=6, master_seed=6)
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "bin"])
+def test_resumed_run_keeps_the_trace(tmp_path, monkeypatch, extension):
+    run(tmp_path / "uninterrupted", trace_path=tmp_path / f"uninterrupted.{extension}")
+
+    # The trace of the stopped run holds events of day 6, which comes after its last checkpoint
+    simulate_day = preempt_at(monkeypatch, 7)
+    with pytest.raises(Preempted):
+        run(tmp_path / "resumed", trace_path=tmp_path / f"resumed.{extension}")
+    stopped = read_trace(str(tmp_path / f"resumed.{extension}"))
+    assert max(event["day"] for event in stopped) == 6
+
+    monkeypatch.setattr(long_run, "simulate_day", simulate_day)
+    run(tmp_path / "resumed", trace_path=tmp_path / f"resumed.{extension}")
+
+    expected = read_trace(str(tmp_path / f"uninterrupted.{extension}"))
+    resumed = read_trace(str(tmp_path / f"resumed.{extension}"))
+    assert sorted({event["day"] for event in expected}) == list(range(8))
+    if extension == "bin":
+        np.testing.assert_array_equal(resumed, expected)
+    else:
+        assert resumed == expected
+
+
+def test_fresh_run_starts_a_fresh_trace(tmp_path):
+    trace_path = tmp_path / "trace.jsonl"
+    trace_path.write_text('{"time": 1.0, "day": 0, "kind": "waiting", "runway": "27", "flight": "XX1"}\n')
+    run(tmp_path, num_days=2, trace_path=trace_path)
+    assert all(event["flight"] != "XX1" for event in read_trace(str(trace_path)))
@@ -0,0 +1,58 @@
+import numpy as np
+from Simulation.metrics import (DayMetrics, MetricsRecorder, RunwaySeries, grid_edges, integrate_step_function,
+                                load_metrics)
+
+
+def test_integrate_step_function_by_hand():
+    # 0 until 2, 1 until 5, 3 until 12 and 0 from then on (the change at 25 is past the last edge)
+    means, maxima = integrate_step_function([2.0, 5.0, 12.0, 25.0], [1.0, 3.0, 0.0, 2.0], np.array([0.0, 10.0, 20.0]))
+    np.testing.assert_allclose(means, [(1 * 3 + 3 * 5) / 10, (3 * 2) / 10])
+    np.testing.assert_array_equal(maxima, [3.0, 3.0])
+
+
+def test_integrate_step_function_change_on_an_edge():
+    means, maxima = integrate_step_function([10.0], [4.0], np.array([0.0, 10.0, 20.0, 30.0]))
+    np.testing.assert_allclose(means, [0.0, 4.0, 4.0])
+    np.testing.assert_array_equal(maxima, [0.0, 4.0, 4.0])
+
+
+def test_day_metrics_from_schedule_by_hand():
+    # The second plane arrives at 1 while the first is on the runway until 2, and waits until 3
+    series = RunwaySeries.from_schedule(np.array([0.0, 1.0]), np.array([0.0, 3.0]), np.array([2.0, 5.0]))
+    metrics = DayMetrics.from_series(0, {"27": series}, np.array([0.0, 5.0, 10.0]))
+
+    assert metrics.runways == ["27"]
+    np.testing.assert_allclose(metrics.queue_mean, [[2 / 5, 0.0]])
+    np.testing.assert_array_equal(metrics.queue_max, [[1, 0]])
+    np.testing.assert_allclose(metrics.utilization, [[(2 + 2) / 5, 0.0]])
+    np.testing.assert_array_equal(metrics.throughput, [[1, 1]])
+
+
+def test_day_metrics_from_recorded_series_with_offset():
+    # The same day recorded as it happens, starting at minute 1440 of a continuous run
+    recorder = MetricsRecorder(5.0, day_length=10.0)
+    series = recorder.runway_series("27")
+    for time, queue_length, busy in ((0, 0, 1), (1, 1, 1), (2, 1, 0), (3, 0, 1), (5, 0, 0)):
+        series.record(1440.0 + time, queue_length, busy)
+    series.complete(1442.0)
+    series.complete(1445.0)
+    recorder.finish_day(1, 1440.0)
+
+    metrics = recorder.days[1]
+    np.testing.assert_array_equal(metrics.edges, grid_edges(5.0, 10.0))
+    np.testing.assert_allclose(metrics.queue_mean, [[2 / 5, 0.0]])
+    np.testing.assert_allclose(metrics.utilization, [[(2 + 2) / 5, 0.0]])
+    np.testing.assert_array_equal(metrics.throughput, [[1, 1]])
+
+
+def test_metrics_save_and_load(tmp_path):
+    recorder = MetricsRecorder(5.0, day_length=10.0)
+    recorder.runway_series("4R").record(1.0, 2, 1)
+    recorder.finish_day(3)
+    recorder.save("control", str(tmp_path))
+
+    loaded = load_metrics("control", 3, str(tmp_path))
+    saved = recorder.days[3]
+    assert loaded.day == 3 and loaded.runways == ["4R"]
+    for name in ("edges", "queue_mean", "queue_max", "utilization", "throughput"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(saved, name))
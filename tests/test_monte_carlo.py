@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from Simulation.monte_carlo import ALL_RUNWAYS, ScenarioStatistics, run_monte_carlo
+from Simulation.scenario import DEFAULT_SCENARIOS, Scenario
+from Simulation.simulator import simulate_scenarios
+from Simulation.streaming_stats import RunningStats, StreamingSummary, t_critical_value
+
+# Two-sided critical values of Student's t distribution from statistical tables
+T_TABLE = {(0.95, 1): 12.7062, (0.95, 2): 4.3027, (0.95, 3): 3.1824, (0.95, 5): 2.5706, (0.95, 10): 2.2281,
+           (0.95, 30): 2.0423, (0.99, 1): 63.6567, (0.99, 2): 9.9248, (0.99, 5): 4.0321, (0.9, 1): 6.3138,
+           (0.9, 2): 2.9200, (0.9, 10): 1.8125}
+
+
+@pytest.mark.parametrize("confidence, degrees_of_freedom", list(T_TABLE))
+def test_t_critical_value_matches_tables(confidence, degrees_of_freedom):
+    expected = T_TABLE[(confidence, degrees_of_freedom)]
+    tolerance = 1e-4 if degrees_of_freedom < 3 else 1e-2
+    assert t_critical_value(confidence, degrees_of_freedom) == pytest.approx(expected, rel=tolerance)
+
+
+def test_running_stats_merge_matches_whole_stream():
+    values = np.random.default_rng(3).exponential(2.0, 1001)
+    whole, merged = RunningStats(), RunningStats()
+    whole.add_many(values)
+    for batch in np.array_split(values, 7):
+        part = RunningStats()
+        for value in batch.tolist():
+            part.add(value)
+        merged.merge(part)
+
+    assert merged.count == whole.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(values.var(ddof=1))
+    assert (merged.minimum, merged.maximum) == (values.min(), values.max())
+    assert merged.half_width(0.95) == pytest.approx(t_critical_value(0.95, 1000) * values.std(ddof=1) / np.sqrt(1001))
+
+
+def test_streaming_quantiles_within_a_bin():
+    values = np.random.default_rng(4).exponential(3.0, 20000)
+    summary = StreamingSummary(bin_width=0.05)
+    summary.add_many(values)
+    for q in (0.5, 0.9, 0.99):
+        assert abs(summary.quantile(q) - np.quantile(values, q)) <= 0.05
+
+
+def run(half_width, **options):
+    options = {"batch_size": 4, "min_replications": 6, "max_replications": 10, "master_seed": 3, "engine": "fast",
+               **options}
+    return run_monte_carlo(DEFAULT_SCENARIOS[:2], half_width, **options)
+
+
+def test_stops_after_minimum_replications_once_precise():
+    # Stops at the end of the batch that reaches the minimum
+    _, num_replications = run(half_width=1e6)
+    assert num_replications == 8
+
+
+def test_stops_at_maximum_replications():
+    statistics, num_replications = run(half_width=0.0)
+    assert num_replications == 10
+    assert statistics["control"].group("departure").replications.count == 10
+
+
+def test_stops_once_half_width_is_reached():
+    statistics, num_replications = run(half_width=0.0, max_replications=12)
+    target = max(statistics[name].half_width(0.95) for name in statistics)
+
+    # A target between the half-widths after 8 and 12 replications stops after 12
+    _, num_replications = run(half_width=target, max_replications=40)
+    assert num_replications == 12
+
+
+def test_replications_are_the_days_of_a_fixed_run(configure):
+    configure(num_replications=8)
+    statistics, _ = run(half_width=1e6)
+    fixed = simulate_scenarios(DEFAULT_SCENARIOS[:2], 1, 3, "fast")
+
+    for name, (wait_times, circle_times, _) in fixed.items():
+        expected = ScenarioStatistics(name)
+        expected.update("departure", wait_times.to_chunk())
+        expected.update("arrival", circle_times.to_chunk())
+        for direction in ("departure", "arrival"):
+            for runway, group in expected.groups[direction].items():
+                other = statistics[name].group(direction, runway)
+                assert other.planes.stats.mean == pytest.approx(group.planes.stats.mean)
+                assert other.replications.mean == pytest.approx(group.replications.mean)
+                assert other.replications.count == group.replications.count
+            assert statistics[name].group(direction, ALL_RUNWAYS).replications.count == 8
+
+
+def test_process_pool_matches_serial_run():
+    serial, _ = run(half_width=0.0)
+    parallel, _ = run(half_width=0.0, num_workers=2)
+    for name, statistics in serial.items():
+        for direction in ("departure", "arrival"):
+            group, other = statistics.group(direction), parallel[name].group(direction)
+            assert other.planes.stats.mean == group.planes.stats.mean
+            assert other.replications.half_width() == group.replications.half_width()
+
+
+def test_common_random_numbers_pair_identical_scenarios_exactly():
+    # Two copies of a scenario see the same draws, so every paired difference is zero and even a zero half-width is
+    # reached as soon as the minimum number of replications is
+    scenarios = [DEFAULT_SCENARIOS[0], Scenario("control_copy", exclude_runways=DEFAULT_SCENARIOS[0].exclude_runways)]
+    statistics, num_replications = run_monte_carlo(scenarios, 0.0, batch_size=4, min_replications=4,
+                                                   max_replications=8, master_seed=3, engine="fast",
+                                                   target="difference")
+    assert num_replications == 4
+    for direction in ("departure", "arrival"):
+        differences = statistics["control_copy"].differences[direction]
+        assert differences.count == 4
+        assert differences.mean == 0.0 and differences.half_width() == 0.0
+
+    independent, _ = run_monte_carlo(scenarios, 0.0, batch_size=4, min_replications=4, max_replications=8,
+                                     master_seed=3, engine="fast", common_random_numbers=False)
+    assert independent["control_copy"].differences["departure"].half_width() > 0.0
+
+
+def test_paired_differences_are_differences_of_daily_means():
+    statistics, _ = run(half_width=0.0, max_replications=8)
+    baseline, other = (statistics[scenario.name] for scenario in DEFAULT_SCENARIOS[:2])
+    for direction in ("departure", "arrival"):
+        differences = other.differences[direction]
+        assert differences.count == 8
+        assert differences.mean == pytest.approx(other.group(direction).replications.mean -
+                                                 baseline.group(direction).replications.mean)
+
+
+def test_common_random_numbers_narrow_the_paired_interval():
+    paired, _ = run(half_width=0.0, max_replications=16, target="difference")
+    independent, _ = run(half_width=0.0, max_replications=16, target="difference", common_random_numbers=False)
+    name = DEFAULT_SCENARIOS[1].name
+    assert paired[name].half_width(target="difference") < independent[name].half_width(target="difference")
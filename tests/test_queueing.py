@@ -0,0 +1,85 @@
+import logging
+import numpy as np
+import pytest
+from Simulation.queueing import UNSERVED, balance_loads, estimate_scenario, mg1_wait, queue_wait
+from Simulation.scenario import Scenario
+
+
+def lindley_wait(rate, service_times, seed, num_planes=200000):
+    """Function to simulate the mean wait in line of a single server with Poisson arrivals (Lindley's recursion)"""
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(1 / rate, num_planes)
+    services = service_times(rng, num_planes)
+    wait, total = 0.0, 0.0
+    for service, gap in zip(services.tolist(), gaps.tolist()):
+        total += wait
+        wait = max(0.0, wait + service - gap)
+    return total / num_planes
+
+
+def test_deterministic_service_matches_md1():
+    # M/D/1: Wq = rho * s / (2 * (1 - rho))
+    for rate, service in ((0.1, 2.0), (0.4, 2.0), (0.9, 1.0)):
+        utilization = rate * service
+        assert mg1_wait(rate, service, service**2) == pytest.approx(utilization * service / (2 * (1 - utilization)))
+
+
+def test_exponential_service_matches_mm1():
+    # M/M/1: Wq = lambda / (mu * (mu - lambda))
+    rate, mu = 0.3, 0.5
+    assert mg1_wait(rate, 1 / mu, 2 / mu**2) == pytest.approx(rate / (mu * (mu - rate)))
+    utilization, wait, backlog, stable = queue_wait(rate, 0.0, mu, 2.0, 1.0, 0.0, 60.0)
+    assert (utilization, backlog, stable) == (pytest.approx(0.6), 0.0, True)
+    assert wait == pytest.approx(rate / (mu * (mu - rate)))
+
+
+def test_mixed_service_matches_pollaczek_khinchine_and_a_simulation():
+    # Take-offs and landings make a hyperexponential service: Wq = lambda * E[S^2] / (2 * (1 - rho))
+    departures, arrivals, mu_takeoff, mu_landing = 0.2, 0.3, 0.8, 1.5
+    rate = departures + arrivals
+    second_moment = 2 * (departures / mu_takeoff**2 + arrivals / mu_landing**2) / rate
+    utilization = departures / mu_takeoff + arrivals / mu_landing
+    expected = rate * second_moment / (2 * (1 - utilization))
+    assert queue_wait(departures, arrivals, mu_takeoff, mu_landing, 1.0, 0.0, 60.0)[1] == pytest.approx(expected)
+
+    def service_times(rng, num_planes):
+        means = np.where(rng.random(num_planes) < departures / rate, 1 / mu_takeoff, 1 / mu_landing)
+        return rng.exponential(means)
+
+    assert lindley_wait(rate, service_times, seed=25) == pytest.approx(expected, rel=0.05)
+
+
+def test_overloaded_period_grows_a_backlog():
+    utilization, wait, backlog, stable = queue_wait(1.5, 0.0, 1.0, 1.0, 1.0, 10.0, 60.0)
+    assert not stable and utilization == pytest.approx(1.5)
+    assert backlog == pytest.approx(10.0 + 0.5 * 60.0)
+    assert wait == pytest.approx(10.0 + 0.5 * 60.0 / 2)
+
+    # A quiet period drains it
+    utilization, wait, backlog, stable = queue_wait(0.0, 0.0, 1.0, 1.0, 1.0, 40.0, 60.0)
+    assert stable and backlog == 0.0
+
+
+def test_balance_loads_levels_the_runways():
+    shares = balance_loads(np.array([0.6, 0.2, 0.3]), [(0, 1), (1,), ()], 3)
+    np.testing.assert_allclose(shares.sum(axis=1), [0.6, 0.2, 0.0])
+    np.testing.assert_allclose(shares.sum(axis=0), [0.4, 0.4, 0.0])
+
+
+def test_classes_without_a_runway_are_unserved(caplog):
+    # Excluding 4L and 4R leaves arrivals nowhere to land in a Northeast wind
+    with caplog.at_level(logging.WARNING, logger="Simulation"):
+        estimate = estimate_scenario(Scenario("northeast_closed", exclude_runways=["4L", "4R"]))
+    assert "arriving jets" in caplog.text and "Northeast" in caplog.text
+
+    unserved = estimate.runways[estimate.runways["runway"] == UNSERVED]
+    assert set(unserved["wind"]) == {"Northeast"}
+    assert (unserved["arrivals_per_hour"] > 0).all() and (unserved["departures_per_hour"] == 0).all()
+    assert np.isinf(unserved["expected_circle_time"]).all() and not unserved["stable"].any()
+
+    summary = estimate.summary().set_index("wind")
+    control = estimate_scenario(Scenario("control")).summary().set_index("wind")
+    assert np.isinf(summary.loc[["Northeast", "all"], "expected_circle_time"]).all()
+    assert np.isfinite(summary.loc["Northeast", "expected_wait"]) and not summary.loc["all", "stable"]
+    assert summary.loc["Northeast", "arrivals"] == pytest.approx(control.loc["Northeast", "arrivals"])
+    assert np.isfinite(summary.loc["Northeast", "max_utilization"])
@@ -0,0 +1,73 @@
+import os
+import pandas as pd
+from Simulation.recorder import ResultRecorder, create_string_tables
+
+ROWS = [(0.5 + i, ["Delta", "JetBlue", "United"][i % 3], ["Atlanta", "Newark"][i % 2], ["DL", "B6", "UA"][i % 3],
+         100 + i, ["A320", "CNA"][i % 2], "Northwest", ["27", "33L", "4R"][i % 3], 0.25 * i, i // 4)
+        for i in range(11)]
+
+
+def fill(recorder):
+    for row in ROWS:
+        recorder.record(*row)
+    return recorder
+
+
+def expected_frame():
+    return pd.DataFrame({
+        "Day": [row[9] for row in ROWS],
+        "Time": [row[0] for row in ROWS],
+        "Airline": [row[1] for row in ROWS],
+        "Destination": [row[2] for row in ROWS],
+        "Flight Number": [f"{row[3]}{row[4]}" for row in ROWS],
+        "Aircraft Type": [row[5] for row in ROWS],
+        "Wind": [row[6] for row in ROWS],
+        "Runway": [row[7] for row in ROWS],
+        "Wait Time": [row[8] for row in ROWS],
+    })
+
+
+def test_records_round_trip_through_frame():
+    # Starting with room for two rows makes the columns grow several times
+    recorder = fill(ResultRecorder(capacity=2))
+    assert len(recorder) == len(ROWS)
+    pd.testing.assert_frame_equal(recorder.to_frame("Wait Time", include_day=True), expected_frame(),
+                                  check_dtype=False)
+
+
+def test_spilled_records_round_trip(tmp_path):
+    recorder = fill(ResultRecorder(capacity=4, chunk_size=4, spill_dir=str(tmp_path)))
+    assert len(recorder.spilled_chunks) == 2 and recorder.size == 3
+    assert all(os.path.exists(path) for path in recorder.spilled_chunks)
+    assert len(recorder) == len(ROWS)
+    pd.testing.assert_frame_equal(recorder.to_frame("Wait Time", include_day=True), expected_frame(),
+                                  check_dtype=False)
+    assert len(recorder.to_chunk()) == len(ROWS)
+
+    spilled_chunks = list(recorder.spilled_chunks)
+    recorder.clear()
+    assert len(recorder) == 0
+    assert not any(os.path.exists(path) for path in spilled_chunks)
+
+
+def test_extend_translates_codes_between_string_tables():
+    source = fill(ResultRecorder())
+
+    # A recorder whose tables already hold other strings gives the same strings different codes
+    tables = create_string_tables()
+    tables["airline"].intern("Lufthansa")
+    tables["runway"].intern("22L")
+    target = ResultRecorder(tables)
+    target.extend(source.to_chunk())
+    assert tables["airline"].codes["Delta"] == 1
+    pd.testing.assert_frame_equal(target.to_frame("Wait Time", include_day=True), expected_frame(),
+                                  check_dtype=False)
+
+
+def test_days_before_first_day_are_not_recorded():
+    recorder = ResultRecorder()
+    recorder.first_day = 2
+    fill(recorder)
+    frame = recorder.to_frame("Wait Time", include_day=True)
+    assert frame["Day"].min() == 2
+    assert len(frame) == sum(row[9] >= 2 for row in ROWS)
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+import simpy
+from Simulation.airport import Airport
+from Simulation.scenario import DEFAULT_SCENARIOS
+from Simulation.simulator import simulate_airport, simulate_airport_parallel, simulate_scenarios
+from tests.conftest import assert_same_metrics, assert_same_records, records
+
+
+def run_serial(master_seed, engine="simpy"):
+    airport = Airport(simpy.Environment(), "control")
+    simulate_airport(airport, airport.env, master_seed, engine)
+    return airport
+
+
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+def test_equal_seeds_give_equal_results(engine):
+    assert_same_records(run_serial(11, engine), run_serial(11, engine))
+
+    departures, _ = records(run_serial(11, engine))
+    other_departures, _ = records(run_serial(12, engine))
+    assert not departures.equals(other_departures)
+
+
+@pytest.mark.parametrize("engine", ["simpy", "fast"])
+def test_process_pool_matches_serial_run(configure, engine):
+    configure(num_replications=4, metrics_interval=60.0)
+    serial = run_serial(5, engine)
+    parallel = Airport(simpy.Environment(), "control")
+    simulate_airport_parallel(parallel, 2, 5, engine)
+
+    assert_same_records(serial, parallel)
+    assert_same_metrics(serial.metrics, parallel.metrics)
+
+
+@pytest.mark.parametrize("common_random_numbers", [True, False])
+def test_process_pool_matches_serial_sweep(configure, common_random_numbers):
+    configure(num_replications=4, metrics_interval=60.0)
+    scenarios = DEFAULT_SCENARIOS[:3]
+    serial = simulate_scenarios(scenarios, 1, 9, "fast", common_random_numbers)
+    parallel = simulate_scenarios(scenarios, 2, 9, "fast", common_random_numbers)
+
+    assert list(serial) == list(parallel) == [scenario.name for scenario in scenarios]
+    for name, (wait_times, circle_times, metrics) in serial.items():
+        parallel_wait_times, parallel_circle_times, parallel_metrics = parallel[name]
+        pd.testing.assert_frame_equal(wait_times.to_frame("Wait Time", True),
+                                      parallel_wait_times.to_frame("Wait Time", True))
+        pd.testing.assert_frame_equal(circle_times.to_frame("Circle Time", True),
+                                      parallel_circle_times.to_frame("Circle Time", True))
+        assert_same_metrics(metrics, parallel_metrics)
+
+
+def test_sweep_matches_single_scenario_runs():
+    # A scenario's records do not depend on which other scenarios share its days
+    scenarios = DEFAULT_SCENARIOS[:2]
+    sweep = simulate_scenarios(scenarios, 1, 3, "simpy", True)
+    for scenario in scenarios:
+        alone = simulate_scenarios([scenario], 1, 3, "simpy", True)
+        wait_times, circle_times, _ = sweep[scenario.name]
+        alone_wait_times, alone_circle_times, _ = alone[scenario.name]
+        pd.testing.assert_frame_equal(wait_times.to_frame("Wait Time", True),
+                                      alone_wait_times.to_frame("Wait Time", True))
+        pd.testing.assert_frame_equal(circle_times.to_frame("Circle Time", True),
+                                      alone_circle_times.to_frame("Circle Time", True))
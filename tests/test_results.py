@@ -0,0 +1,79 @@
+import importlib.util
+import os
+import pandas as pd
+import pytest
+from Simulation.recorder import ResultRecorder, create_string_tables
+from Simulation.results import list_partitions, load_results, partition_path, save_results
+
+FORMATS = ["csv"] + [pytest.param(results_format, marks=pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="needs pyarrow")) for results_format in ("parquet", "feather")]
+
+
+def recorders(days, offset=0.0):
+    """Function to record two planes per day and direction"""
+    tables = create_string_tables()
+    wait_times, circle_times = ResultRecorder(tables), ResultRecorder(tables)
+    for day in days:
+        for i in range(2):
+            wait_times.record(day + i / 10, "Delta", "Atlanta", "DL", 100 + i, "A320", "Northwest", "27",
+                              offset + day + i, day)
+            circle_times.record(day + i / 10, "JetBlue", "Newark", "B6", 200 + i, "CNA", "Northwest", "4L",
+                                offset + 2 * day + i, day)
+    return wait_times, circle_times
+
+
+def expected(recorder, scenario, wait_column):
+    frame = recorder.to_frame(wait_column, include_day=True)
+    frame.insert(0, "Scenario", scenario)
+    return frame
+
+
+@pytest.mark.parametrize("results_format", FORMATS)
+def test_results_round_trip(tmp_path, results_format):
+    wait_times, circle_times = recorders([0, 1, 2])
+    save_results("control", wait_times, circle_times, results_format, str(tmp_path))
+
+    assert os.path.exists(partition_path("departure", "control", 2, results_format, str(tmp_path)))
+    pd.testing.assert_frame_equal(load_results("departure", results_dir=str(tmp_path)),
+                                  expected(wait_times, "control", "Wait Time"), check_dtype=False)
+    pd.testing.assert_frame_equal(load_results("arrival", results_dir=str(tmp_path)),
+                                  expected(circle_times, "control", "Circle Time"), check_dtype=False)
+
+
+@pytest.mark.parametrize("results_format", FORMATS)
+def test_results_filtered_by_partition(tmp_path, results_format):
+    save_results("control", *recorders([0, 1, 2]), results_format, str(tmp_path))
+    save_results("one_runway_down", *recorders([0, 1], offset=5.0), results_format, str(tmp_path))
+
+    assert [(scenario, day) for scenario, day, _ in list_partitions("departure", str(tmp_path))] == \
+        [("control", 0), ("control", 1), ("control", 2), ("one_runway_down", 0), ("one_runway_down", 1)]
+
+    frame = load_results("departure", scenarios="one_runway_down", days=[1], columns=["Wait Time"],
+                         results_dir=str(tmp_path))
+    assert list(frame.columns) == ["Scenario", "Day", "Wait Time"]
+    assert frame["Wait Time"].tolist() == [6.0, 7.0]
+    assert set(frame["Scenario"]) == {"one_runway_down"} and set(frame["Day"]) == {1}
+
+
+def test_results_replace_or_add_days(tmp_path):
+    save_results("control", *recorders([0, 1, 2]), "csv", str(tmp_path))
+
+    # Without replace only the saved days are overwritten
+    save_results("control", *recorders([2, 3], offset=10.0), "csv", str(tmp_path), replace=False)
+    frame = load_results("departure", results_dir=str(tmp_path))
+    assert sorted(frame["Day"].unique()) == [0, 1, 2, 3]
+    assert frame.loc[frame["Day"] == 2, "Wait Time"].tolist() == [12.0, 13.0]
+
+    save_results("control", *recorders([5]), "csv", str(tmp_path))
+    assert load_results("departure", results_dir=str(tmp_path))["Day"].unique().tolist() == [5]
+
+
+def test_results_fall_back_to_legacy_csv(tmp_path):
+    legacy = pd.DataFrame({"Time": [0.5], "Wait Time": [1.5]})
+    legacy.to_csv(tmp_path / "departure_results_control.csv", index=False)
+
+    frame = load_results("departure", scenarios=["control"], results_dir=str(tmp_path / "results"),
+                         data_dir=str(tmp_path))
+    assert frame["Wait Time"].tolist() == [1.5]
+    with pytest.raises(FileNotFoundError):
+        load_results("arrival", scenarios=["control"], results_dir=str(tmp_path / "results"), data_dir=str(tmp_path))
@@ -0,0 +1,60 @@
+import pytest
+from Simulation.routing import RoutingTable, RunwayRoles
+
+# Two wind directions: "A" has a non-jet runway for each direction, "B" has none
+RUNWAY_TABLE = {
+    "A": {"Departures": {"1": {"Non Jet": 0}, "2": {"Non Jet": 1}},
+          "Arrivals": {"2": {"Non Jet": 0}, "3": {"Non Jet": 0}, "4": {"Non Jet": 1}}},
+    "B": {"Departures": {"5": {"Non Jet": 0}}, "Arrivals": {"5": {"Non Jet": 0}, "6": {"Non Jet": 0}}},
+}
+
+
+def test_routing_roles_and_classes():
+    routing = RoutingTable(RUNWAY_TABLE).routing("A")
+
+    # Departure runways open first, then the arrival runways not already open
+    assert routing.runways == ("1", "2", "3", "4")
+    assert routing.roles["1"] == RunwayRoles(departure=True)
+    assert routing.roles["2"] == RunwayRoles(departure=True, arrival=True, non_jet_departure=True)
+    assert routing.roles["4"] == RunwayRoles(arrival=True, non_jet_arrival=True)
+
+    # Non-jets keep to the non-jet runways, jets to the others
+    assert routing.classes[(True, True)] == ("1",)
+    assert routing.classes[(True, False)] == ("2",)
+    assert routing.classes[(False, True)] == ("2", "3")
+    assert routing.classes[(False, False)] == ("4",)
+    assert routing.choices[(False, True)] == (1, 2)
+
+
+def test_non_jets_use_every_runway_without_non_jet_runways():
+    routing = RoutingTable(RUNWAY_TABLE).routing("B")
+    assert routing.runways == ("5", "6")
+    assert routing.classes[(True, False)] == routing.classes[(True, True)] == ("5",)
+    assert routing.classes[(False, False)] == routing.classes[(False, True)] == ("5", "6")
+
+
+def test_closed_runways_are_out_of_use():
+    table = RoutingTable(RUNWAY_TABLE, ignore_runways=("4",))
+    routing = table.routing("A")
+    assert "4" not in routing.runways
+    assert routing.classes[(False, False)] == ("2", "3")
+
+    # Closed runways replace the ignored ones
+    routing = table.routing("A", closed={"2"})
+    assert routing.runways == ("1", "3", "4")
+    assert routing.classes[(True, False)] == routing.classes[(True, True)] == ("1",)
+    assert table.candidates("A", False, True, closed={"2"}) == ("3",)
+    assert table.candidates("A", True, True, closed={"1", "2"}) == ()
+
+
+def test_routings_are_worked_out_once_and_read_only():
+    table = RoutingTable(RUNWAY_TABLE)
+    routing = table.routing("A")
+    assert table.routing("A", closed=()) is routing
+    assert table.routing("A", closed={"4"}) is not routing
+    assert len(table.routings) == 2
+
+    with pytest.raises(TypeError):
+        routing.classes[(True, True)] = ("2",)
+    with pytest.raises(AttributeError):
+        routing.runways = ()
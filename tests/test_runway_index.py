@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+import numpy as np
+from Simulation.runway_index import RunwaySelector
+
+
+def fake_runways(*names):
+    """Function to make stand-ins for runways with empty lines, which is all the selector reads from a runway"""
+    return {name: SimpleNamespace(get_runway_line_length=lambda: 0, resource=SimpleNamespace(on_line_change=None))
+            for name in names}
+
+
+def reference_select(classes, line_lengths, departing, jet):
+    """Function to scan a class's runways for the shortest line, keeping the last of them on ties"""
+    best = None
+    for name in classes[(departing, jet)]:
+        if best is None or line_lengths[name] <= line_lengths[best]:
+            best = name
+    return best
+
+
+def test_ties_go_to_the_last_runway():
+    runways = fake_runways("A", "B", "C")
+    selector = RunwaySelector(runways, {(True, True): ["A", "B", "C"], (False, True): ["C", "A"]})
+    assert selector.select(True, True) == "C"
+    assert selector.select(False, True) == "A"
+
+    # Lines report through the runways' resources
+    runways["C"].resource.on_line_change(2)
+    runways["A"].resource.on_line_change(1)
+    assert selector.select(True, True) == "B"
+    assert selector.select(False, True) == "A"
+
+    runways["B"].resource.on_line_change(1)
+    assert selector.select(True, True) == "B"
+    runways["A"].resource.on_line_change(0)
+    assert selector.select(True, True) == "A"
+    runways["A"].resource.on_line_change(2)
+    assert selector.select(True, True) == "B"
+    assert selector.select(False, True) == "A"
+    runways["C"].resource.on_line_change(1)
+    assert selector.select(False, True) == "C"
+
+
+def test_class_without_runways_gets_none():
+    selector = RunwaySelector(fake_runways("A"), {(True, True): ["A"], (True, False): []})
+    assert selector.select(True, False) is None
+    assert selector.select(True, True) == "A"
+
+
+def test_classes_with_the_same_runways_share_an_index():
+    selector = RunwaySelector(fake_runways("A", "B"), {(True, True): ["A", "B"], (True, False): ("A", "B"),
+                                                       (False, True): ["B", "A"]})
+    assert selector.classes[(True, True)] is selector.classes[(True, False)]
+    assert selector.classes[(True, True)] is not selector.classes[(False, True)]
+    assert len(selector.indexes_of["A"]) == 2
+
+
+def test_selection_matches_a_scan_of_the_lines():
+    # Enough updates to rebuild the heaps several times over
+    names = ["4L", "4R", "9", "15R", "22L", "27", "33L"]
+    classes = {(True, True): ["4R", "9", "15R", "22L", "33L"], (True, False): ["9", "15R"],
+               (False, True): ["4L", "4R", "15R", "22L", "27", "33L"], (False, False): ["4L", "15R", "27"]}
+    runways = fake_runways(*names)
+    selector = RunwaySelector(runways, classes)
+    line_lengths = dict.fromkeys(names, 0)
+
+    rng = np.random.default_rng(17)
+    for _ in range(2000):
+        name = names[rng.integers(len(names))]
+        line_lengths[name] = max(0, line_lengths[name] + int(rng.choice([-1, 1])))
+        runways[name].resource.on_line_change(line_lengths[name])
+        for departing, jet in classes:
+            assert selector.select(departing, jet) == reference_select(classes, line_lengths, departing, jet)
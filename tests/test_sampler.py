@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from Data.data_cache import load_data
+from Simulation.sampler import ARRIVALS, DEPARTURES, PlaneSampler, build_alias_table
+
+NUM_DRAWS = 200000
+
+
+@pytest.fixture(scope="module")
+def sampler():
+    data = load_data("BOS")
+    return PlaneSampler(data.tables, data.strings)
+
+
+def alias_probabilities(thresholds, aliases):
+    """Function to return the probability of each entry of an alias table"""
+    count = len(thresholds)
+    probabilities = thresholds / count
+    np.add.at(probabilities, aliases, (1.0 - thresholds) / count)
+    return probabilities
+
+
+def table_probabilities(sampler, level, table):
+    """Function to return the normalized weights of one table of a level"""
+    offset = sampler.tables[f"{level}_offset"][table]
+    weights = sampler.tables[f"{level}_weight"][offset:offset + sampler.tables[f"{level}_count"][table]]
+    return weights / weights.sum()
+
+
+def assert_frequencies(counts, probabilities, num_draws):
+    # Within five standard errors of every entry's probability
+    tolerance = 5 * np.sqrt(probabilities * (1 - probabilities) / num_draws) + 1e-9
+    assert np.all(np.abs(counts / num_draws - probabilities) <= tolerance)
+
+
+@pytest.mark.parametrize("weights", [[1.0], [1.0, 1.0, 1.0], [0.5, 0.25, 0.25], [9.0, 1.0, 0.0, 3.0, 7.0]])
+def test_alias_table_matches_weights(weights):
+    thresholds, aliases = build_alias_table(weights)
+    np.testing.assert_allclose(alias_probabilities(thresholds, aliases), np.array(weights) / sum(weights))
+
+
+@pytest.mark.parametrize("level", ["airline", "route", "aircraft"])
+def test_sampler_tables_match_probabilities(sampler, level):
+    offsets, counts = sampler.tables[f"{level}_offset"], sampler.tables[f"{level}_count"]
+    for table, (offset, count) in enumerate(zip(offsets, counts)):
+        rows = slice(offset, offset + count)
+        # Aliases are positions within their own table
+        np.testing.assert_allclose(alias_probabilities(sampler.tables[f"{level}_threshold"][rows],
+                                                       sampler.tables[f"{level}_alias"][rows]),
+                                   table_probabilities(sampler, level, table))
+
+
+@pytest.mark.parametrize("departing", [True, False])
+def test_draw_many_frequencies(sampler, departing):
+    direction = DEPARTURES if departing else ARRIVALS
+    airlines, routes, _, flight_numbers = sampler.draw_many(np.full(NUM_DRAWS, departing),
+                                                            rng=np.random.default_rng(1))
+
+    offset = sampler.airline_offset[direction]
+    probabilities = table_probabilities(sampler, "airline", direction)
+    assert_frequencies(np.bincount(airlines - offset, minlength=len(probabilities)), probabilities, NUM_DRAWS)
+
+    # Routes of the most common airline follow its route table
+    airline = offset + int(np.argmax(probabilities))
+    airline_routes = routes[airlines == airline] - sampler.route_offset[airline]
+    route_probabilities = table_probabilities(sampler, "route", airline)
+    assert_frequencies(np.bincount(airline_routes, minlength=len(route_probabilities)), route_probabilities,
+                       len(airline_routes))
+
+    assert flight_numbers.min() >= 10 and flight_numbers.max() <= 10000
+
+
+@pytest.mark.parametrize("departing", [True, False])
+def test_draw_frequencies(sampler, departing):
+    num_draws = NUM_DRAWS // 10
+    rng = np.random.default_rng(2)
+    draws = [sampler.draw(departing, rng) for _ in range(num_draws)]
+    direction = DEPARTURES if departing else ARRIVALS
+
+    probabilities = table_probabilities(sampler, "airline", direction)
+    airlines = np.array([airline for airline, _, _, _ in draws]) - sampler.airline_offset[direction]
+    assert_frequencies(np.bincount(airlines, minlength=len(probabilities)), probabilities, num_draws)
+
+    jets = np.mean([sampler.is_jet(aircraft) for _, _, aircraft, _ in draws])
+    jet_probability = sampler.jet_probability(departing)
+    assert abs(jets - jet_probability) <= 5 * np.sqrt(jet_probability * (1 - jet_probability) / num_draws) + 1e-9